@@ -0,0 +1,1930 @@
+"""
+Núcleo Partilhado da App do Treinador
+Dados (carregar/salvar, caches e backups), serviço de PDFs, email e estatísticas usados pela app e pelas páginas
+em app_pages; importável como módulo normal (também pelos workers de PDFs), sem configurar a página
+"""
+
+import streamlit as st
+import json
+import os
+import time
+from datetime import datetime, date
+
+# Imports necessários para funcionamento básico
+import glob as glob_module
+import calendar
+
+from lazy_imports import modulo_lazy, modulo_disponivel
+
+# Bibliotecas pesadas: importadas apenas quando uma página as usa (arranque a frio mais rápido)
+pd = modulo_lazy('pandas')
+go = modulo_lazy('plotly.graph_objects')
+bcrypt = modulo_lazy('bcrypt')
+requests = modulo_lazy('requests')
+
+from backup_restore import ErroRestauro, resumir_backup, restaurar_backup_streaming
+from data_cache import CacheFicheiroJSON
+from persistence_pipeline import (
+    PersistencePipeline, SinkFicheiroDados, SinkMetadados, SinkSnapshotLocal, SinkEmergencia, SinkNuvem,
+    serializar_dados, ler_metadados
+)
+from render_cache import RenderCache
+from perf_metrics import medir
+from photo_cache import cache_fotos, variante_para_largura
+from pdf_stream import PDFEmFicheiro
+from pdf_jobs import ServicoPDF, EM_FILA, A_GERAR, CONCLUIDO, ERRO
+from matchday_pack import extrair_dados_pacote, documentos_pacote, nome_ficheiro_pacote
+from attendance_matrix import MatrizPresencas
+from season_aggregates import COLECOES_FONTE, SinkAgregados, caminho_agregados, calcular_agregados, estatisticas_jogador
+
+# Web scraping removido - manter apenas gestão manual
+
+# Diretório da app (logos e fotos), igual para as páginas em app_pages
+DIRETORIO_APP = os.path.dirname(os.path.abspath(__file__))
+
+# === CONFIGURAÇÃO GLOBAL DO CALENDÁRIO ===
+# Garantir que todas as semanas comecem na segunda-feira (0 = segunda-feira)
+calendar.setfirstweekday(0)
+
+# === OTIMIZAÇÃO STREAMLIT CLOUD ===
+def is_streamlit_cloud():
+    """Detecta se estamos rodando no Streamlit Cloud"""
+    return bool(os.environ.get('STREAMLIT_SHARING_MODE') or os.environ.get('STREAMLIT_CLOUD'))
+
+def get_cached_data():
+    """Obtém dados do cache do session_state"""
+    if 'cached_data' not in st.session_state:
+        st.session_state.cached_data = None
+        st.session_state.cache_timestamp = None
+    return st.session_state.cached_data, st.session_state.cache_timestamp
+
+def set_cached_data(dados):
+    """Define dados no cache do session_state"""
+    st.session_state.cached_data = dados
+    st.session_state.cache_timestamp = datetime.now()
+
+# === IMPORTS LAZY (carregados apenas quando necessário) ===
+def get_image_modules():
+    """Lazy loading para módulos de imagem"""
+    import base64
+    from PIL import Image, ImageDraw, ImageFont
+    import io
+    from io import BytesIO
+    return base64, Image, ImageDraw, ImageFont, io, BytesIO
+
+def get_email_modules():
+    """Lazy loading para módulos de email"""
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    return smtplib, MIMEText, MIMEMultipart
+
+def get_pdf_modules():
+    """Lazy loading para módulos PDF"""
+    try:
+        from reportlab.lib.pagesizes import A4, letter, landscape
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+        from reportlab.lib.units import inch, mm, cm
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        return True, (A4, letter, landscape, SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, getSampleStyleSheet, ParagraphStyle, colors, inch, mm, cm, TA_CENTER, TA_LEFT, TA_RIGHT, pdfmetrics, TTFont)
+    except ImportError:
+        return False, None
+
+# === SISTEMA DE BACKUP EM NUVEM PARA STREAMLIT CLOUD ===
+import hashlib
+
+def get_secret_value(chave, padrao=None):
+    """Obtém valor de st.secrets sem quebrar quando secrets não existe."""
+    try:
+        return st.secrets.get(chave, padrao)
+    except Exception:
+        return padrao
+
+def has_secret_keys(*chaves):
+    """Verifica se todas as chaves existem em st.secrets de forma segura."""
+    try:
+        return all(chave in st.secrets for chave in chaves)
+    except Exception:
+        return False
+
+def get_github_token():
+    """Obtém token do GitHub dos secrets do Streamlit"""
+    return get_secret_value("GITHUB_TOKEN", None)
+
+def get_backup_gist_id():
+    """Obtém ID do Gist de backup dos secrets do Streamlit"""
+    return get_secret_value("BACKUP_GIST_ID", None)
+
+def criar_hash_dados(dados):
+    """Cria hash dos dados para verificar mudanças"""
+    dados_str = json.dumps(dados, sort_keys=True)
+    return hashlib.md5(dados_str.encode()).hexdigest()
+
+def enviar_conteudo_para_gist(conteudo):
+    """Envia um documento de backup já serializado para o GitHub Gist"""
+    try:
+        token = get_github_token()
+        gist_id = get_backup_gist_id()
+        
+        if not token or not gist_id:
+            return False, "Token ou Gist ID não configurado"
+        
+        # Criar payload para GitHub API
+        files = {
+            "app_treinador_backup.json": {
+                "content": conteudo
+            }
+        }
+        
+        headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        
+        # Atualizar Gist
+        response = requests.patch(
+            f"https://api.github.com/gists/{gist_id}",
+            headers=headers,
+            json={"files": files}
+        )
+        
+        if response.status_code == 200:
+            return True, "Backup realizado com sucesso"
+        else:
+            return False, f"Erro na API: {response.status_code}"
+            
+    except Exception as e:
+        return False, f"Erro no backup: {str(e)}"
+
+def backup_para_gist(dados):
+    """Faz backup dos dados para GitHub Gist (serialização única via pipeline)"""
+    serializados = serializar_dados(dados)
+    sucesso, mensagem = enviar_conteudo_para_gist(serializados.envolver({
+        "timestamp": datetime.now().isoformat(),
+        "hash": serializados.versao
+    }))
+    if sucesso:
+        # Armazenar hash na sessão para evitar backups desnecessários
+        st.session_state['ultimo_hash_backup'] = serializados.versao
+        st.session_state['ultimo_backup_time'] = datetime.now()
+    return sucesso, mensagem
+
+def carregar_backup_do_gist():
+    """Carrega backup dos dados do GitHub Gist"""
+    try:
+        token = get_github_token()
+        gist_id = get_backup_gist_id()
+        
+        if not token or not gist_id:
+            return None, "Token ou Gist ID não configurado"
+        
+        headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        
+        # Obter Gist
+        response = requests.get(
+            f"https://api.github.com/gists/{gist_id}",
+            headers=headers
+        )
+        
+        if response.status_code == 200:
+            gist_data = response.json()
+            file_content = gist_data["files"]["app_treinador_backup.json"]["content"]
+            backup_data = json.loads(file_content)
+            
+            return backup_data["dados"], backup_data["timestamp"]
+        else:
+            return None, f"Erro na API: {response.status_code}"
+            
+    except Exception as e:
+        return None, f"Erro ao carregar backup: {str(e)}"
+
+def verificar_necessidade_backup(dados):
+    """Verifica se é necessário fazer backup (dados mudaram)"""
+    if not dados:
+        return False
+    
+    hash_atual = criar_hash_dados(dados)
+    ultimo_hash = st.session_state.get('ultimo_hash_backup', '')
+    
+    return hash_atual != ultimo_hash
+
+# Verificar se PDF está disponível (sem importar o reportlab)
+PDF_DISPONIVEL = modulo_disponivel('reportlab')
+
+class EmailNotifications:
+    """Sistema de notificações por email integrado"""
+    
+    def __init__(self):
+        self.smtp_server = "smtp.gmail.com"
+        self.smtp_port = 587
+        self.email_configurado = False
+        
+        # Verificar se está configurado (de forma segura)
+        try:
+            if hasattr(st, 'secrets') and 'EMAIL_USER' in st.secrets and 'EMAIL_PASSWORD' in st.secrets:
+                self.email_user = st.secrets["EMAIL_USER"]
+                self.email_password = st.secrets["EMAIL_PASSWORD"]
+                self.email_configurado = True
+        except Exception:
+            self.email_configurado = False
+    
+    def enviar_email(self, destinatario, assunto, corpo_html, nome_destinatario=""):
+        """Envia um email"""
+        if not self.email_configurado:
+            return False, "Email não configurado nos secrets"
+        
+        try:
+            # Fazer lazy loading dos módulos de email
+            smtplib, MIMEText, MIMEMultipart = get_email_modules()
+            
+            # Configurar mensagem
+            msg = MIMEMultipart('alternative')
+            msg['From'] = self.email_user
+            msg['To'] = destinatario
+            msg['Subject'] = assunto
+            
+            # Corpo do email em HTML
+            html_part = MIMEText(corpo_html, 'html', 'utf-8')
+            msg.attach(html_part)
+            
+            # Conectar e enviar
+            with medir('smtp', 'enviar_email') as medicao:
+                medicao['bytes'] = len(corpo_html.encode('utf-8'))
+                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+                server.starttls()
+                server.login(self.email_user, self.email_password)
+                server.send_message(msg)
+                server.quit()
+            
+            return True, "Email enviado com sucesso"
+            
+        except Exception as e:
+            return False, f"Erro ao enviar email: {str(e)}"
+    
+    def gerar_email_convocatoria(self, jogo, jogadores_convocados):
+        """Gera HTML para convocatória de jogo"""
+        data_formatada = datetime.strptime(jogo['data'], '%Y-%m-%d').strftime('%d/%m/%Y')
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .header {{ background-color: #1e88e5; color: white; padding: 20px; text-align: center; }}
+                .content {{ padding: 20px; }}
+                .info-box {{ background-color: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                .footer {{ background-color: #666; color: white; padding: 10px; text-align: center; font-size: 12px; }}
+                .destaque {{ color: #1e88e5; font-weight: bold; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>⚽ CONVOCATÓRIA OFICIAL</h1>
+                <h2>F.C. PINHEIRENSE</h2>
+            
+            
+            <div class="content">
+                <h2>🎯 Detalhes do Jogo</h2>
+                
+                <div class="info-box">
+                    <p><strong>🆚 Adversário:</strong> <span class="destaque">{jogo.get('adversario', 'TBD')}</span>
+                    <p><strong>📅 Data:</strong> <span class="destaque">{data_formatada}</span>
+                    <p><strong>🕐 Hora:</strong> <span class="destaque">{jogo.get('hora', 'TBD')}</span>
+                    <p><strong>📍 Local:</strong> <span class="destaque">{jogo.get('local', 'TBD')}</span>
+                    <p><strong>🏆 Tipo:</strong> <span class="destaque">{jogo.get('tipo', 'Jogo')}</span>
+                
+                
+                <h2>👥 Jogadores Convocados</h2>
+                <div class="info-box">
+        """
+        
+        for i, jogador in enumerate(jogadores_convocados, 1):
+            html += f"<p>{i}. {jogador}"
+        
+        html += f"""
+                
+                
+                <div class="info-box" style="background-color: #fff3cd; border: 1px solid #ffeaa7;">
+                    <h3>⚠️ IMPORTANTE</h3>
+                    <ul>
+                        <li>Comparecer 30 minutos antes do jogo</li>
+                        <li>Trazer equipamento completo</li>
+                        <li>Confirmar presença ao treinador</li>
+                        <li>Em caso de impedimento, avisar com antecedência</li>
+                    </ul>
+                
+            
+            
+            <div class="footer">
+                <p>F.C. PINHEIRENSE - Enviado automaticamente pelo App Treinador
+                <p>Data de envio: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
+            
+        </body>
+        </html>
+        """
+        
+        return html
+    
+    def gerar_email_treino(self, treino, data_treino):
+        """Gera HTML para notificação de treino"""
+        data_formatada = datetime.strptime(data_treino, '%Y-%m-%d').strftime('%d/%m/%Y')
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .header {{ background-color: #4caf50; color: white; padding: 20px; text-align: center; }}
+                .content {{ padding: 20px; }}
+                .info-box {{ background-color: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                .footer {{ background-color: #666; color: white; padding: 10px; text-align: center; font-size: 12px; }}
+                .destaque {{ color: #4caf50; font-weight: bold; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>🏃 CONVOCAÇÃO PARA TREINO</h1>
+                <h2>F.C. PINHEIRENSE</h2>
+            
+            
+            <div class="content">
+                <h2>📋 Detalhes do Treino</h2>
+                
+                <div class="info-box">
+                    <p><strong>📝 Nome:</strong> <span class="destaque">{treino.get('nome', 'Treino')}</span>
+                    <p><strong>🎯 Tipo:</strong> <span class="destaque">{treino.get('tipo', 'Técnico')}</span>
+                    <p><strong>📅 Data:</strong> <span class="destaque">{data_formatada}</span>
+                    <p><strong>🕐 Hora:</strong> <span class="destaque">{treino.get('hora', 'TBD')}</span>
+                    <p><strong>📍 Local:</strong> <span class="destaque">{treino.get('local', 'TBD')}</span>
+                    <p><strong>⏱️ Duração:</strong> <span class="destaque">{treino.get('duracao', 90)} minutos</span>
+                
+                
+                {f'<h2>🎯 Objetivos do Treino</h2><div class="info-box">' + '<br>'.join([f"• {obj}" for obj in treino.get('objetivos', [])]) + '' if treino.get('objetivos') else ''}
+                
+                {f'<h2>📝 Observações</h2><div class="info-box"><p>{treino.get("observacoes", "")}' if treino.get('observacoes') else ''}
+                
+                <div class="info-box" style="background-color: #e8f5e8; border: 1px solid #4caf50;">
+                    <h3>💡 LEMBRETE</h3>
+                    <ul>
+                        <li>Chegar 15 minutos antes do treino</li>
+                        <li>Trazer equipamento de treino adequado</li>
+                        <li>Garrafa de água obrigatória</li>
+                        <li>Avisar em caso de falta</li>
+                    </ul>
+                
+            
+            
+            <div class="footer">
+                <p>F.C. PINHEIRENSE - Enviado automaticamente pelo App Treinador
+                <p>Data de envio: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
+            
+        </body>
+        </html>
+        """
+        
+        return html
+
+# Instância global do sistema de email
+try:
+    email_system = EmailNotifications()
+    EMAIL_DISPONIVEL = True
+    print("✅ Sistema de email integrado carregado com sucesso")
+except Exception as e:
+    print(f"⚠️ Erro ao carregar sistema de email - {e}")
+    EMAIL_DISPONIVEL = False
+    email_system = None
+
+def verificar_sistema_email():
+    """Verifica se o sistema de email está disponível"""
+    if not EMAIL_DISPONIVEL or email_system is None:
+        st.error("❌ Sistema de email não disponível")
+        st.info("💡 Sistema de email integrado com problemas - verifique as configurações")
+        return False
+    
+    if not email_system.email_configurado:
+        st.error("❌ Email não configurado")
+        st.info("💡 Configure as credenciais de email em Configurações > Sistema de Email")
+        return False
+    
+    return True
+
+# === GESTÃO DE DADOS SIMPLES ===
+DATA_FILE = "APP_FINAL.json"
+
+@st.cache_resource(show_spinner=False)
+def obter_pipeline_persistencia():
+    """Pipeline único de persistência (partilhado pelo processo): ficheiro, metadados, agregados, snapshot, emergência e nuvem"""
+    pasta = os.path.dirname(DATA_FILE) or "."
+    pipeline = PersistencePipeline([
+        SinkFicheiroDados(DATA_FILE),
+        SinkMetadados(DATA_FILE),
+        SinkAgregados(DATA_FILE),
+        SinkSnapshotLocal(pasta=pasta, prefixo="backup_automatico_", tipo="automatico", intervalo=600),
+        SinkEmergencia(os.path.join(pasta, "emergency_backup.json"), intervalo=300),
+    ])
+    
+    # Backup em nuvem apenas quando configurado
+    if get_github_token() and get_backup_gist_id():
+        pipeline.registar(SinkNuvem(enviar_conteudo_para_gist, intervalo=1800))
+    
+    return pipeline
+
+def registar_estado_nuvem(resultados):
+    """Atualiza o estado do backup em nuvem na sessão a partir dos resultados do pipeline"""
+    if 'nuvem' not in resultados:
+        return
+    sucesso, info = resultados['nuvem']
+    if sucesso:
+        st.session_state['ultimo_backup_nuvem'] = datetime.now().isoformat()
+        st.session_state.pop('erro_backup_nuvem', None)
+    else:
+        st.session_state['erro_backup_nuvem'] = info
+
+def criar_backup_emergencia_periodico(dados=None):
+    """Cria backup de emergência periódico para prevenir hibernação"""
+    try:
+        # Usar dados fornecidos ou da sessão
+        if dados:
+            dados_emergencia = dados
+        elif 'dados_backup' in st.session_state and st.session_state['dados_backup']:
+            dados_emergencia = st.session_state['dados_backup']
+        else:
+            return  # Não há dados para backup
+            
+        # Criar arquivo de emergência (não visível mas presente)
+        obter_pipeline_persistencia().publicar(dados_emergencia, apenas=['emergencia'], forcar=True)
+    except:
+        pass  # Falha silenciosa para não interferir
+
+def verificar_integridade_dados_completa(dados):
+    """Verificação rigorosa da integridade dos dados"""
+    try:
+        if not dados or not isinstance(dados, dict):
+            return False
+        
+        # Estrutura mínima esperada
+        estrutura_esperada = ['jogadores', 'jogos', 'treinos', 'taticas', 'exercicios']
+        for campo in estrutura_esperada:
+            if campo not in dados:
+                return False
+        
+        # Verificar se há pelo menos alguns dados (não está completamente vazio)
+        total_items = (
+            len(dados.get('jogadores', [])) + 
+            len(dados.get('jogos', [])) + 
+            len(dados.get('treinos', {})) + 
+            len(dados.get('taticas', [])) + 
+            len(dados.get('exercicios', {}))
+        )
+        
+        # Se tem menos de 1 item total, pode ser problema
+        return total_items >= 0  # Permitir dados vazios mas com estrutura correta
+        
+    except:
+        return False
+
+def tentar_recuperar_dados_backup_automatico():
+    """Tenta recuperar dados do backup automático mais recente"""
+    try:
+        # Procurar backups automáticos
+        backup_files = glob_module.glob('backup_automatico_*.json')
+        if not backup_files:
+            return None
+        
+        # Ordenar por data (mais recente primeiro)
+        backup_files.sort(reverse=True)
+        
+        # Tentar carregar o mais recente
+        with open(backup_files[0], 'r', encoding='utf-8') as f:
+            backup_data = json.load(f)
+        
+        # Backups do pipeline guardam os dados dentro de 'dados'
+        if 'dados' in backup_data:
+            backup_data = backup_data['dados']
+            
+        if verificar_integridade_dados_completa(backup_data):
+            st.success(f"✅ Dados recuperados do backup: {backup_files[0]}")
+            return backup_data
+        
+        return None
+    except:
+        return None
+
+def limpar_cache_e_forcar_reload():
+    """Limpa todo o cache e força reload completo dos dados - uso após restaurações"""
+    # Limpar caches de dados específicos
+    keys_to_remove = []
+    for key in st.session_state.keys():
+        if any(term in key.lower() for term in ['cache', 'timestamp', 'dados_backup']):
+            keys_to_remove.append(key)
+    
+    for key in keys_to_remove:
+        del st.session_state[key]
+    
+    invalidar_contexto_rerun()
+    
+    # Marcar para force reload
+    st.session_state['force_reload'] = True
+    
+    # Log para debug
+    st.success("🔄 Cache limpo - dados serão recarregados na próxima operação")
+
+
+def mostrar_foto(foto_data, width=150):
+    """Mostra foto do jogador (variante já descodificada e redimensionada da cache de fotos)"""
+    try:
+        imagem = cache_fotos.obter(foto_data, variante_para_largura(width)) if foto_data else None
+        if imagem:
+            st.image(imagem, width=width)
+        else:
+            st.write("📷 Sem foto")
+    except Exception as e:
+        st.write("📷 Erro ao carregar foto")
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_dados():
+    """Cache do ficheiro de dados partilhado pelo processo (chave: caminho, mtime, tamanho e versão)"""
+    return CacheFicheiroJSON()
+
+def invalidar_cache_dados():
+    """Invalida o cache do ficheiro de dados (após restauros ou limpezas manuais)"""
+    obter_cache_dados().invalidar()
+
+@st.cache_resource(show_spinner=False)
+def obter_render_cache():
+    """Cache de blocos renderizados partilhado pelo processo (chaves incluem as versões das coleções)"""
+    return RenderCache()
+
+def fragmento(func=None, *, run_every=None):
+    """st.fragment (Streamlit >= 1.37) com fallback para execução normal em versões antigas"""
+    decorador = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if decorador is None:
+        return func if func is not None else (lambda f: f)
+    if func is None:
+        return decorador(run_every=run_every)
+    return decorador(func, run_every=run_every)
+
+# === TEMPO REAL: ALTERAÇÕES PENDENTES ===
+PREFIXO_TEMPO_REAL = 'tempo_real_'  # estado da sessão por jogo: {'pendentes', 'ultima_gravacao'}
+
+def gravar_pendentes_tempo_real():
+    """Grava as alterações do registo em tempo real ainda em memória. Corre em cada rerun completo
+    (mudar de página, salvar a ficha): só os fragmentos do jogo acumulam alterações entre gravações"""
+    estados = [
+        estado for chave, estado in st.session_state.items()
+        if chave.startswith(PREFIXO_TEMPO_REAL) and isinstance(estado, dict) and estado.get('pendentes')
+    ]
+    dados = st.session_state.get('dados_cache')
+    if not estados or not dados:
+        return False
+    if not salvar_dados(dados):
+        return False
+    for estado in estados:
+        estado['pendentes'] = 0
+        estado['ultima_gravacao'] = time.time()
+    return True
+
+# === PDFs EM SEGUNDO PLANO ===
+INTERVALO_PAINEL_PDFS = 2  # segundos entre atualizações do painel enquanto há PDFs por gerar
+
+ICONES_ESTADO_PDF = {EM_FILA: "⏳", A_GERAR: "🔄", CONCLUIDO: "✅", ERRO: "❌"}
+
+MIME_FICHEIROS = {'.pdf': "application/pdf", '.html': "text/html", '.png': "image/png", '.zip': "application/zip"}
+
+try:
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    DOWNLOAD_DIFERIDO = hasattr(MediaFileManager, 'add_deferred')  # download_button aceita uma função
+except ImportError:
+    DOWNLOAD_DIFERIDO = False
+
+def dados_download(conteudo):
+    """Dados para st.download_button: um PDF em disco só é lido quando o botão é clicado (se o Streamlit o permitir)"""
+    if isinstance(conteudo, PDFEmFicheiro):
+        return conteudo.ler if DOWNLOAD_DIFERIDO else conteudo.ler()
+    return conteudo
+
+@st.cache_resource(show_spinner=False)
+def obter_servico_pdf():
+    """Serviço de geração de PDFs num pool de processos, partilhado por todas as sessões"""
+    return ServicoPDF()
+
+def pedir_pdf(rotulo, nome_funcao, *args, nome_ficheiro=None, **kwargs):
+    """Envia um gerador de PDF para o pool; o painel de PDFs da barra lateral mostra o estado e o download"""
+    obter_servico_pdf().submeter(
+        nome_funcao, args, kwargs,
+        rotulo=rotulo, nome_ficheiro=nome_ficheiro, dono=st.session_state.get('usuario_logado')
+    )
+    # Rerun para o painel (já desenhado neste rerun) passar a acompanhar o novo job
+    st.session_state['pdfs_pendentes'] = True
+    st.rerun()
+
+def pedir_pacote_jogo(dados, jogo, chaves):
+    """Envia os documentos escolhidos do jogo para o pool (em paralelo); o painel entrega um único zip"""
+    dados_pacote = extrair_dados_pacote(dados, jogo)
+    obter_servico_pdf().submeter_pacote(
+        documentos_pacote(chaves, dados_pacote),
+        rotulo=f"Pacote vs {jogo.get('adversario', '')}",
+        nome_ficheiro=nome_ficheiro_pacote(jogo),
+        dono=st.session_state.get('usuario_logado')
+    )
+    st.session_state['pdfs_pendentes'] = True
+    st.rerun()
+
+def _painel_pdfs():
+    """Jobs de PDF do utilizador, com download dos concluídos"""
+    servico = obter_servico_pdf()
+    jobs = servico.jobs(dono=st.session_state.get('usuario_logado'))
+    if not jobs:
+        return
+    
+    st.markdown("**🖨️ PDFs em Preparação**")
+    for job in jobs[:8]:
+        icone = ICONES_ESTADO_PDF.get(job['estado'], "•")
+        if job['estado'] == CONCLUIDO:
+            col1, col2 = st.columns([5, 1])
+            with col1:
+                st.download_button(
+                    f"{icone} {job['rotulo']}",
+                    data=dados_download(job['pdf']),
+                    file_name=job['nome_ficheiro'],
+                    mime=MIME_FICHEIROS.get(os.path.splitext(job['nome_ficheiro'])[1].lower(), "application/pdf"),
+                    key=f"pdf_job_{job['id']}",
+                    on_click="ignore",
+                    use_container_width=True,
+                    help=f"Gerado em {job['ms'] / 1000:.1f}s" + (f" (em falta: {job['erro']})" if job['erro'] else "")
+                )
+            with col2:
+                if st.button("✖", key=f"pdf_job_remover_{job['id']}"):
+                    servico.remover(job['id'])
+                    st.rerun(scope="fragment")
+        elif job['estado'] == ERRO:
+            st.caption(f"{icone} {job['rotulo']}: {job['erro']}")
+            if st.button("✖ Limpar", key=f"pdf_job_remover_{job['id']}"):
+                servico.remover(job['id'])
+                st.rerun(scope="fragment")
+        else:
+            segundos = (datetime.now() - job['submetido_em']).total_seconds()
+            progresso = f"{job['progresso'][0]}/{job['progresso'][1]}, " if job['progresso'] else ""
+            st.caption(f"{icone} {job['rotulo']}: {job['estado']} ({progresso}{segundos:.0f}s)")
+    
+    pendentes = any(job['estado'] in (EM_FILA, A_GERAR) for job in jobs)
+    if st.session_state.get('pdfs_pendentes') and not pendentes:
+        # Tudo pronto: um rerun completo volta a desenhar o painel sem atualização periódica
+        st.session_state['pdfs_pendentes'] = False
+        st.rerun()
+
+def mostrar_pdfs_em_segundo_plano():
+    """Painel de PDFs (atualizado como fragmento apenas enquanto há jobs por terminar)"""
+    intervalo = INTERVALO_PAINEL_PDFS if st.session_state.get('pdfs_pendentes') else None
+    fragmento(_painel_pdfs, run_every=intervalo)()
+
+def versoes_colecoes(*nomes):
+    """Versões (checksums) das coleções indicadas, para a versão dos dados da sessão"""
+    chave = st.session_state.get('dados_cache_chave')
+    registo = st.session_state.get('versoes_colecoes')
+    if chave is None or not registo or registo.get('chave') != chave:
+        # Preferir o sidecar escrito pelo pipeline; calcular só se não existir
+        versoes = (ler_metadados(DATA_FILE) or {}).get('checksums')
+        if not versoes:
+            versoes = serializar_dados(carregar_dados()).checksums
+        registo = {'chave': chave, 'versoes': versoes}
+        st.session_state['versoes_colecoes'] = registo
+    return tuple(registo['versoes'].get(nome) for nome in nomes)
+
+def obter_agregados():
+    """Vistas materializadas da época (contagens, próximos jogos, totais por jogador, assiduidade, registo)"""
+    versoes = dict(zip(COLECOES_FONTE, versoes_colecoes(*COLECOES_FONTE)))
+    
+    # Sidecar mantido pelo pipeline a cada gravação (lido uma vez por versão do ficheiro)
+    try:
+        agregados, _ = obter_cache_dados().obter(caminho_agregados(DATA_FILE))
+    except (OSError, ValueError):
+        agregados = None
+    if agregados and agregados.get('versoes') == versoes:
+        return agregados
+    
+    # Sidecar ausente ou obsoleto: calcular uma vez por versão das coleções
+    return obter_render_cache().obter(
+        'agregados_epoca',
+        lambda: calcular_agregados(carregar_dados()),
+        versoes=tuple(versoes.values())
+    )
+
+def obter_matriz_presencas():
+    """Matriz de presenças jogadores × treinos, construída uma vez por versão das coleções"""
+    return obter_render_cache().obter(
+        'matriz_presencas',
+        lambda: MatrizPresencas.from_dados(carregar_dados()),
+        versoes=versoes_colecoes('jogadores', 'treinos')
+    )
+
+
+def carregar_dados_cached(chave=None, copia=False):
+    """Dados do ficheiro revalidados por stat, sem TTL; sem `copia` o objeto é partilhado e só de leitura"""
+    dados_padrao = {"treinos": {}, "jogos": [], "jogadores": [], "taticas": [], "exercicios": {}, "esquemas_taticos": []}
+    try:
+        cache = obter_cache_dados()
+        if copia:
+            dados_carregados, _ = cache.obter_copia(DATA_FILE, chave)
+        else:
+            dados_carregados, _ = cache.obter(DATA_FILE, chave)
+        
+        if dados_carregados is None:
+            # Estrutura padrão se arquivo não existir
+            return dados_padrao
+        
+        # Verificar se é um arquivo de backup (com metadados) ou dados diretos
+        if 'dados' in dados_carregados:
+            return dados_carregados['dados']
+        return dados_carregados
+                
+    except Exception as e:
+        return dados_padrao
+
+def iniciar_contexto_rerun():
+    """Inicia o contexto de dados do rerun atual: os dados são resolvidos uma única vez por execução"""
+    st.session_state['contexto_rerun'] = {'dados': None, 'chamadas': 0, 'resolucoes': 0}
+
+def obter_contexto_rerun():
+    """Contexto de dados do rerun atual (None fora de main())"""
+    return st.session_state.get('contexto_rerun')
+
+def invalidar_contexto_rerun():
+    """Obriga a próxima chamada a carregar_dados() neste rerun a resolver os dados novamente"""
+    contexto = obter_contexto_rerun()
+    if contexto is not None:
+        contexto['dados'] = None
+
+def carregar_dados():
+    """Carrega os dados, resolvidos uma única vez por rerun e partilhados por todos os consumidores"""
+    contexto = obter_contexto_rerun()
+    if contexto is None:
+        return _resolver_dados()
+    
+    contexto['chamadas'] += 1
+    if contexto['dados'] is None:
+        with medir('dados', 'carregar_dados') as medicao:
+            contexto['dados'] = _resolver_dados()
+            chave = st.session_state.get('dados_cache_chave')
+            medicao['bytes'] = chave[2] if chave else None  # tamanho do ficheiro na versão carregada
+        contexto['resolucoes'] += 1
+    return contexto['dados']
+
+def _resolver_dados():
+    """Carrega dados do arquivo JSON com cache otimizado"""
+    try:
+        # Versão atual do ficheiro: um único stat por rerun
+        chave_atual = obter_cache_dados().chave(DATA_FILE)
+        
+        # ✅ PRIMEIRO: Cache da sessão, se corresponde à versão atual do ficheiro
+        if 'dados_cache' in st.session_state and st.session_state['dados_cache']:
+            dados_cache = st.session_state['dados_cache']
+            if st.session_state.get('dados_cache_chave') == chave_atual and verificar_integridade_dados_completa(dados_cache):
+                return dados_cache
+        
+        # ✅ SEGUNDO: Cópia privada a partir do cache do processo (o ficheiro só é lido quando muda)
+        dados_arquivo = carregar_dados_cached(chave_atual, copia=True)
+        
+        # ✅ TERCEIRO: Verificar integridade e usar se válido
+        if verificar_integridade_dados_completa(dados_arquivo):
+            # Atualizar cache para próximas operações
+            st.session_state['dados_cache'] = dados_arquivo
+            st.session_state['dados_cache_chave'] = chave_atual
+            st.session_state['dados_backup'] = dados_arquivo.copy()
+            return dados_arquivo
+        
+        # ✅ QUARTO: Se arquivo inválido, tentar backup da sessão
+        if 'dados_backup' in st.session_state and st.session_state['dados_backup']:
+            dados_backup = st.session_state['dados_backup']
+            if verificar_integridade_dados_completa(dados_backup):
+                st.warning("🔄 Usando backup da sessão - dados do arquivo podem estar corrompidos")
+                return dados_backup
+        
+        # ✅ QUINTO: Auto-recovery apenas se necessário
+        if is_streamlit_cloud():
+            st.warning("🔄 Tentando recuperação automática...")
+            dados_gist, timestamp_gist = carregar_backup_do_gist()
+            if dados_gist and verificar_integridade_dados_completa(dados_gist):
+                st.success(f"✅ Dados recuperados do backup em nuvem!")
+                
+                # Salvar dados recuperados
+                try:
+                    obter_pipeline_persistencia().publicar(dados_gist, apenas=['ficheiro', 'metadados'], forcar=True)
+                    
+                    # Atualizar caches
+                    st.session_state['dados_cache'] = dados_gist.copy()
+                    st.session_state['dados_backup'] = dados_gist.copy()
+                    return dados_gist
+                except Exception as e:
+                    st.warning(f"⚠️ Erro ao salvar dados recuperados: {e}")
+                    return dados_gist
+        
+        # ✅ ÚLTIMO RECURSO: Dados padrão
+        st.error("❌ Não foi possível carregar dados válidos")
+        dados_padrao = {"treinos": {}, "jogos": [], "jogadores": [], "taticas": [], "exercicios": {}, "esquemas_taticos": []}
+        st.session_state['dados_cache'] = dados_padrao
+        st.session_state['dados_backup'] = dados_padrao
+        return dados_padrao
+        
+    except Exception as e:
+        st.error(f"Erro ao carregar dados: {e}")
+        dados_erro = {"treinos": {}, "jogos": [], "jogadores": [], "taticas": [], "exercicios": {}, "esquemas_taticos": []}
+        st.session_state['dados_cache'] = dados_erro
+        st.session_state['dados_backup'] = dados_erro
+        st.session_state['cache_timestamp'] = datetime.now().isoformat()
+        return dados_erro
+
+
+def salvar_dados(dados):
+    """Salva dados no arquivo JSON com backup automático otimizado"""
+    try:
+        # ✅ PROTEÇÃO CONTRA LOOPS DE SALVAMENTO
+        if 'operacao_salvamento_ativa' in st.session_state:
+            # Já existe uma operação de salvamento ativa, evitar loop
+            return True
+        
+        # Marcar operação como ativa
+        st.session_state['operacao_salvamento_ativa'] = True
+        
+        # Validar dados antes de salvar
+        if not dados:
+            st.error("❌ Dados vazios - não é possível salvar")
+            if 'operacao_salvamento_ativa' in st.session_state:
+                del st.session_state['operacao_salvamento_ativa']
+            return False
+        
+        with medir('dados', 'salvar_dados') as medicao:
+            # ✅ CACHE IMEDIATO PARA RESPONSIVIDADE
+            import copy
+            dados_copia = copy.deepcopy(dados)
+            st.session_state['dados_cache'] = dados_copia
+            st.session_state['ultimo_salvamento'] = datetime.now().isoformat()
+            
+            # Consumidores seguintes neste rerun veem a versão acabada de gravar
+            contexto = obter_contexto_rerun()
+            if contexto is not None:
+                contexto['dados'] = dados_copia
+            
+            # ✅ PIPELINE ÚNICO: uma serialização alimenta ficheiro, snapshot (10 min),
+            # emergência (5 min) e nuvem (30 min)
+            serializados, resultados = obter_pipeline_persistencia().publicar(dados)
+            medicao['bytes'] = serializados.tamanho
+        registar_estado_nuvem(resultados)
+        
+        # A cópia da sessão corresponde agora à versão gravada no ficheiro
+        st.session_state['dados_cache_chave'] = obter_cache_dados().chave(DATA_FILE)
+        st.session_state['versoes_colecoes'] = {
+            'chave': st.session_state['dados_cache_chave'],
+            'versoes': serializados.checksums,
+        }
+        
+        # Verificar se o arquivo foi salvo corretamente
+        if not os.path.exists(DATA_FILE) or os.path.getsize(DATA_FILE) == 0:
+            raise Exception("Arquivo não foi criado ou está vazio")
+        
+        # Sucesso
+        st.session_state['status_salvamento'] = 'sucesso'
+        
+        # ✅ LIMPAR FLAG DE OPERAÇÃO
+        if 'operacao_salvamento_ativa' in st.session_state:
+            del st.session_state['operacao_salvamento_ativa']
+        
+        return True
+        
+    except Exception as e:
+        st.error(f"Erro ao salvar dados: {e}")
+        
+        # ✅ SEMPRE LIMPAR FLAG, MESMO COM ERRO
+        if 'operacao_salvamento_ativa' in st.session_state:
+            del st.session_state['operacao_salvamento_ativa']
+        
+        # Mesmo com erro no arquivo, manter na sessão
+        st.session_state['dados_backup'] = dados
+        return False
+
+
+def backup_automatico(dados_atuais=None):
+    """Cria backup automático dos dados atuais através do pipeline de persistência"""
+    try:
+        # Se não foram fornecidos dados, carrega os atuais
+        if dados_atuais is None:
+            dados_atuais = carregar_dados()
+        
+        # Snapshot forçado (inclui checksums e aplica a política de retenção)
+        _, resultados = obter_pipeline_persistencia().publicar(dados_atuais, apenas=['snapshot'], forcar=True)
+        sucesso, info = resultados.get('snapshot', (False, None))
+        if not sucesso:
+            raise Exception(info)
+        
+        # Registar tempo do último backup
+        st.session_state.ultimo_backup = datetime.now()
+        
+        return info
+    except Exception as e:
+        # Não mostrar erro de backup para não interromper fluxo principal
+        print(f"Aviso: Erro ao criar backup automático: {e}")
+        return None
+
+
+def verificar_integridade_dados(dados):
+    """Verifica a integridade dos dados restaurados"""
+    try:
+        relatorio = {
+            "jogadores": len(dados.get('jogadores', [])),
+            "jogos": len(dados.get('jogos', [])),
+            "treinos": len(dados.get('treinos', {})),
+            "taticas": len(dados.get('taticas', [])),
+            "exercicios": len(dados.get('exercicios', {}))
+        }
+        
+        # Mostrar relatório
+        st.write("**📊 Resumo dos dados restaurados:**")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("👥 Jogadores", relatorio["jogadores"])
+            st.metric("⚽ Jogos", relatorio["jogos"])
+        
+        with col2:
+            st.metric("🏃 Treinos", relatorio["treinos"])
+            st.metric("📋 Táticas", relatorio["taticas"])
+        
+        with col3:
+            st.metric("🎯 Exercícios", relatorio["exercicios"])
+        
+        return sum(relatorio.values()) > 0
+        
+    except Exception as e:
+        st.error(f"Erro na verificação: {e}")
+        return False
+
+
+def criar_backup_manual():
+    """Cria backup manual com timestamp específico"""
+    try:
+        dados = carregar_dados()
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        backup_json = serializar_dados(dados).envolver({
+            "data_backup": datetime.now().isoformat(),
+            "tipo_backup": "manual",
+            "versao_app": "1.0",
+            "usuario": st.session_state.get('usuario_logado', 'admin')
+        })
+        return backup_json, f"backup_manual_{timestamp}.json"
+    except Exception as e:
+        st.error(f"❌ Erro ao criar backup: {e}")
+        return None, None
+
+def mostrar_restauro_backup(backup_file, key_prefix):
+    """Pré-visualiza e restaura um backup carregado, em streaming e com progresso"""
+    # Pré-visualização leve: lida coleção a coleção, sem manter o ficheiro em memória
+    try:
+        resumo = resumir_backup(backup_file)
+    except ErroRestauro as e:
+        st.error(f"❌ Arquivo de backup inválido: {e}")
+        return
+    except Exception as e:
+        st.error(f"❌ Erro ao ler arquivo: {e}")
+        return
+    
+    tamanho_kb = (getattr(backup_file, 'size', 0) or 0) / 1024
+    st.info(f"📄 Arquivo carregado: {backup_file.name} ({tamanho_kb:.1f} KB)")
+    st.success("✅ Arquivo JSON válido detectado")
+    
+    metadata = resumo['metadados']
+    contagens = resumo['contagens']
+    amostras = resumo['amostras']
+    
+    # Mostrar metadados se existirem
+    if metadata:
+        st.write("**📋 Informações do Backup:**")
+        col_meta1, col_meta2 = st.columns(2)
+        with col_meta1:
+            if 'data_backup' in metadata:
+                st.write(f"📅 **Data:** {str(metadata['data_backup'])[:16].replace('T', ' ')}")
+            if 'usuario' in metadata:
+                st.write(f"👤 **Usuário:** {metadata['usuario']}")
+        with col_meta2:
+            if 'tipo_backup' in metadata:
+                st.write(f"🔧 **Tipo:** {metadata['tipo_backup']}")
+            if 'versao_app' in metadata:
+                st.write(f"📱 **Versão:** {metadata['versao_app']}")
+    
+    # Mostrar conteúdo detalhado
+    st.write("**📊 Conteúdo Detalhado do Backup:**")
+    
+    jogadores_count = contagens.get('jogadores', 0)
+    jogos_count = contagens.get('jogos', 0)
+    treinos_count = contagens.get('treinos', 0)
+    taticas_count = contagens.get('taticas', 0)
+    exercicios_count = contagens.get('exercicios', 0)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("👥 Jogadores", jogadores_count)
+        if amostras.get('jogadores'):
+            st.write("**Primeiros jogadores:**")
+            for nome in amostras['jogadores']:
+                st.write(f"• {nome}")
+            if jogadores_count > len(amostras['jogadores']):
+                st.write(f"... e mais {jogadores_count - len(amostras['jogadores'])}")
+    
+    with col2:
+        st.metric("⚽ Jogos", jogos_count)
+        st.metric("🏃 Treinos", treinos_count)
+        if amostras.get('treinos'):
+            st.write("**Treinos:**")
+            for nome in amostras['treinos'][:2]:
+                st.write(f"• {nome}")
+            if treinos_count > 2:
+                st.write(f"... e mais {treinos_count - 2}")
+    
+    with col3:
+        st.metric("📋 Táticas", taticas_count)
+        st.metric("🎯 Exercícios", exercicios_count)
+    
+    # Avisos importantes
+    total_items = jogadores_count + jogos_count + treinos_count + taticas_count + exercicios_count
+    
+    if total_items == 0:
+        st.error("⚠️ **ATENÇÃO**: O backup está VAZIO!")
+        st.warning("Este backup não contém dados. Não recomendado restaurar.")
+    elif total_items < 5:
+        st.warning(f"⚠️ **ATENÇÃO**: Backup com poucos dados ({total_items} itens total)")
+    else:
+        st.success(f"✅ **Backup válido** com {total_items} itens total")
+    
+    # Mostrar data atual vs data do backup
+    st.write("---")
+    col_data1, col_data2 = st.columns(2)
+    with col_data1:
+        st.write(f"📅 **Data atual dos dados:** {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+    with col_data2:
+        if 'data_backup' in metadata:
+            backup_date = str(metadata['data_backup'])[:16].replace('T', ' ')
+            st.write(f"📅 **Data do backup:** {backup_date}")
+        else:
+            st.write("📅 **Data do backup:** Não informada")
+    
+    # Botão de restauro com confirmação visual
+    st.write("---")
+    st.write("**⚠️ IMPORTANTE**: O restauro irá substituir TODOS os dados atuais!")
+    
+    col_warn1, col_warn2 = st.columns(2)
+    with col_warn1:
+        st.warning("📋 Dados atuais serão salvos em backup automático")
+    with col_warn2:
+        st.info("🔄 Aplicação será reiniciada após restauro")
+    
+    if st.button("🔄 **CONFIRMAR RESTAURO**", type="primary", key=f"confirmar_restauro_{key_prefix}"):
+        # Fazer backup dos dados atuais antes de restaurar
+        st.write("**1️⃣ Criando backup dos dados atuais...**")
+        dados_atuais = carregar_dados()
+        if dados_atuais:
+            backup_nome = backup_automatico(dados_atuais)
+            if backup_nome:
+                st.success(f"✅ Backup atual salvo como: {backup_nome}")
+            else:
+                st.warning("⚠️ Não foi possível criar backup dos dados atuais")
+        
+        # Validar e gravar coleção a coleção num ficheiro de staging
+        st.write("**2️⃣ Validando e restaurando coleções...**")
+        barra = st.progress(0.0, text="A iniciar restauro...")
+        sucesso, resultado = restaurar_backup_streaming(
+            backup_file,
+            DATA_FILE,
+            progresso=lambda fracao, mensagem: barra.progress(fracao, text=mensagem)
+        )
+        
+        if not sucesso:
+            st.error(f"❌ Restauro cancelado: {resultado}")
+            st.error("💡 Os dados atuais não foram alterados")
+            return
+        
+        # O ficheiro foi trocado atomicamente - invalidar caches
+        st.write("**3️⃣ Limpando cache do sistema...**")
+        invalidar_cache_dados()
+        limpar_cache_e_forcar_reload()
+        
+        colecoes = resultado['colecoes']
+        st.success(f"✅ Verificação: {colecoes.get('jogadores', 0)} jogadores e "
+                   f"{colecoes.get('treinos', 0)} treinos restaurados "
+                   f"({resultado['checksums_verificados']} checksums verificados)")
+        st.balloons()
+        st.success("🎉 **RESTAURO CONCLUÍDO COM SUCESSO!**")
+        
+        # Limpar flag de processo para evitar loops
+        if 'processo_restauro_ativo' in st.session_state:
+            del st.session_state['processo_restauro_ativo']
+        
+        st.rerun()
+
+
+# === SISTEMA DE NOTIFICAÇÕES POR EMAIL ===
+def mostrar_configuracao_email():
+    """Mostra configuração do sistema de email"""
+    st.subheader("⚙️ Configuração de Email")
+    
+    # Verificar se email está configurado (de forma segura)
+    email_configurado = False
+    email_user = ""
+    
+    try:
+        if hasattr(st, 'secrets'):
+            email_configurado = has_secret_keys('EMAIL_USER', 'EMAIL_PASSWORD')
+            if email_configurado:
+                email_user = get_secret_value("EMAIL_USER", "")
+    except Exception:
+        email_configurado = False
+    
+    if email_configurado:
+        st.success("✅ Email configurado e pronto para usar!")
+        st.info(f"📧 Enviando de: {email_user}")
+        
+        # Teste de email
+        with st.expander("🧪 Testar Configuração"):
+            email_teste = st.text_input("Email para teste:")
+            if st.button("📧 Enviar Email de Teste"):
+                if email_teste:
+                    try:
+                        if not verificar_sistema_email():
+                            return
+                        
+                        corpo_teste = """
+                        <h2>✅ Teste de Configuração</h2>
+                        <p>Este é um email de teste do sistema de notificações do App Treinador.
+                        <p>Se você recebeu este email, a configuração está funcionando corretamente!
+                        <p><strong>F.C. PINHEIRENSE</strong>
+                        """
+                        
+                        sucesso, mensagem = email_system.enviar_email(
+                            email_teste, 
+                            "🧪 Teste - App Treinador", 
+                            corpo_teste
+                        )
+                        
+                        if sucesso:
+                            st.success("✅ Email de teste enviado com sucesso!")
+                        else:
+                            st.error(f"❌ Erro: {mensagem}")
+                    except Exception as e:
+                        st.error(f"❌ Erro ao enviar teste: {e}")
+    else:
+        st.warning("⚠️ Email não configurado")
+        
+        # Instruções para configuração local (desenvolvimento)
+        st.info("""
+        **Para usar localmente (desenvolvimento):**
+        
+        1. Crie um arquivo `.streamlit/secrets.toml` nesta pasta
+        2. Adicione suas credenciais:
+        ```toml
+        EMAIL_USER = "seu_email@gmail.com"
+        EMAIL_PASSWORD = "sua_senha_de_app"
+        ```
+        
+        **Para Streamlit Cloud (produção):**
+        1. No Streamlit Cloud, vá em Settings → Secrets
+        2. Adicione:
+        ```
+        EMAIL_USER = "seu_email@gmail.com"
+        EMAIL_PASSWORD = "sua_senha_de_app"
+        ```
+        
+        **⚠️ Importante:**
+        - Use senha de app do Gmail (não a senha normal)
+        - Ative autenticação de 2 fatores no Gmail
+        - Gere uma senha de app específica para esta aplicação
+        """)
+        
+        # Opção para criar arquivo de configuração local
+        if st.button("📁 Criar Arquivo de Configuração Local"):
+            try:
+                import os
+                secrets_dir = ".streamlit"
+                secrets_file = os.path.join(secrets_dir, "secrets.toml")
+                
+                # Criar diretório se não existir
+                if not os.path.exists(secrets_dir):
+                    os.makedirs(secrets_dir)
+                
+                # Criar arquivo de exemplo
+                exemplo_config = '''# Configuração de Email para App Treinador
+# Substitua pelos seus dados reais
+
+EMAIL_USER = "seu_email@gmail.com"
+EMAIL_PASSWORD = "sua_senha_de_app_do_gmail"
+
+# IMPORTANTE:
+# 1. Use uma senha de APP do Gmail, não sua senha normal
+# 2. Ative autenticação de 2 fatores no Gmail primeiro
+# 3. Vá em: Conta Google > Segurança > Senhas de app
+# 4. Gere uma nova senha de app para "App Treinador"
+'''
+                
+                with open(secrets_file, 'w', encoding='utf-8') as f:
+                    f.write(exemplo_config)
+                
+                st.success(f"✅ Arquivo criado: `{secrets_file}`")
+                st.info("📝 Edite o arquivo e adicione suas credenciais reais, depois reinicie a aplicação.")
+                
+            except Exception as e:
+                st.error(f"❌ Erro ao criar arquivo: {e}")
+    
+    if st.button("❌ Fechar Configuração"):
+        st.session_state['mostrar_config_email'] = False
+        st.rerun()
+
+def mostrar_formulario_convocatorias(dados):
+    """Formulário para envio de convocatórias de jogos - INCLUINDO CAMPEONATO"""
+    st.subheader("📧 Enviar Convocatórias de Jogos")
+    
+    # Combinar jogos da lista principal e jogos do campeonato
+    jogos_todos = dados.get('jogos', []).copy()
+    hoje = str(date.today())
+    
+    # Adicionar jogos do campeonato
+    campeonato = dados.get('campeonato', {})
+    jornadas = campeonato.get('jornadas', [])
+    
+    for jornada in jornadas:
+        jogos_jornada = jornada.get('jogos', [])
+        for jogo in jogos_jornada:
+            # Verificar se FC Pinheirense está neste jogo
+            casa = jogo.get('casa', '')
+            fora = jogo.get('fora', '')
+            
+            if 'Fc Pinheirense' in casa or 'Fc Pinheirense' in fora:
+                # Determinar adversário e local
+                if 'Fc Pinheirense' in casa:
+                    adversario = fora
+                    local = "Pinheiro"  # Casa
+                else:
+                    adversario = casa
+                    local = casa  # Fora
+                
+                # Criar jogo formatado
+                jogo_formatado = {
+                    'data': jogo.get('data', ''),
+                    'adversario': adversario,
+                    'local': local,
+                    'tipo': 'Campeonato',
+                    'competicao': 'CAMPEONATO DISTRITAL - 2ª DIVISÃO ZONA CENTRO',
+                    'jornada': jornada.get('numero', ''),
+                    'convocados': [],
+                    'hora': '16:00:00'  # Hora padrão para jogos de campeonato
+                }
+                jogos_todos.append(jogo_formatado)
+    
+    # Filtrar jogos futuros
+    jogos_futuros = [j for j in jogos_todos if j.get('data', '') >= hoje]
+    
+    if not jogos_futuros:
+        st.warning("⚠️ Nenhum jogo futuro agendado")
+        if st.button("❌ Fechar"):
+            st.session_state['mostrar_convocatorias'] = False
+            st.rerun()
+        return
+    
+    # Seleção do jogo com tipo de competição
+    opcoes_jogos = {}
+    for jogo in sorted(jogos_futuros, key=lambda x: x.get('data', '')):
+        data_formatada = datetime.strptime(jogo['data'], '%Y-%m-%d').strftime('%d/%m/%Y')
+        tipo = jogo.get('tipo', 'Jogo')
+        
+        # Adicionar jornada se for campeonato
+        if jogo.get('jornada'):
+            label = f"{data_formatada} - vs {jogo.get('adversario', 'TBD')} (Jornada {jogo.get('jornada')} - {tipo})"
+        else:
+            label = f"{data_formatada} - vs {jogo.get('adversario', 'TBD')} ({tipo})"
+        
+        opcoes_jogos[label] = jogo
+    
+    jogo_selecionado_label = st.selectbox(
+        "Selecione o jogo:",
+        options=list(opcoes_jogos.keys())
+    )
+    
+    jogo_selecionado = opcoes_jogos[jogo_selecionado_label]
+    
+    # Mostrar detalhes do jogo
+    with st.expander("📋 Detalhes do Jogo Selecionado"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**📅 Data:** {jogo_selecionado.get('data')}")
+            st.write(f"**🕐 Hora:** {jogo_selecionado.get('hora', 'TBD')}")
+            if jogo_selecionado.get('jornada'):
+                st.write(f"**📊 Jornada:** {jogo_selecionado.get('jornada')}")
+        with col2:
+            st.write(f"**🆚 Adversário:** {jogo_selecionado.get('adversario')}")
+            st.write(f"**📍 Local:** {jogo_selecionado.get('local')}")
+            if jogo_selecionado.get('tipo'):
+                st.write(f"**🎯 Tipo:** {jogo_selecionado.get('tipo')}")
+            if jogo_selecionado.get('competicao'):
+                st.write(f"**🏆 Competição:** {jogo_selecionado.get('competicao')}")
+    
+    # Tabs para gerenciar convocatórias
+    tab1, tab2, tab3 = st.tabs(["📋 Editar Convocatória", "📧 Enviar Emails", "📊 Histórico"])
+    
+    with tab1:
+        st.write("**✏️ Editar Jogadores Convocados**")
+        
+        # Obter lista de todos os jogadores
+        jogadores_disponiveis = [j.get('nome', '') for j in dados.get('jogadores', [])]
+        jogadores_disponiveis.sort()
+        
+        # Convocados atuais
+        convocados_atuais = jogo_selecionado.get('convocados', [])
+        
+        # Permitir selecionar múltiplos jogadores
+        convocados_selecionados = st.multiselect(
+            "Selecione os jogadores convocados:",
+            options=jogadores_disponiveis,
+            default=convocados_atuais,
+            key="convocados_multiselect"
+        )
+        
+        # Botão para salvar convocatória
+        if st.button("💾 Salvar Convocatória", type="primary", use_container_width=True):
+            # Carregar dados atuais
+            dados_atuais = carregar_dados()
+            
+            try:
+                # Se for jogo do campeonato, não está em jogos normais
+                if jogo_selecionado.get('tipo') == 'Campeonato':
+                    # Precisamos atualizar o jogo no campeonato
+                    campeonato = dados_atuais.get('campeonato', {})
+                    jornadas = campeonato.get('jornadas', [])
+                    
+                    jogo_encontrado = False
+                    data_jogo = jogo_selecionado.get('data', '')
+                    adversario_jogo = jogo_selecionado.get('adversario', '')
+                    
+                    for jornada in jornadas:
+                        if jogo_encontrado:
+                            break
+                        jogos_jornada = jornada.get('jogos', [])
+                        for jogo in jogos_jornada:
+                            # Procurar por data e presença de Fc Pinheirense
+                            if jogo.get('data') == data_jogo:
+                                casa = jogo.get('casa', '').strip()
+                                fora = jogo.get('fora', '').strip()
+                                
+                                # Verificar se é o jogo certo
+                                if ('Fc Pinheirense' in [casa, fora]):
+                                    # Guardar a convocatória diretamente no jogo
+                                    jogo['convocados'] = convocados_selecionados
+                                    jogo_encontrado = True
+                                    break
+                    
+                    if jogo_encontrado:
+                        salvar_dados(dados_atuais)
+                        st.success(f"✅ Convocatória do campeonato salva com sucesso! {len(convocados_selecionados)} jogadores")
+                    else:
+                        st.error("❌ Erro ao encontrar o jogo do campeonato - tenta atualizar")
+                        st.write(f"Debug: Procurava data={data_jogo}, adversário={adversario_jogo}")
+                
+                else:
+                    # Jogo normal - está em jogos
+                    jogos = dados_atuais.get('jogos', [])
+                    jogo_encontrado = False
+                    
+                    for jogo in jogos:
+                        if (jogo.get('data') == jogo_selecionado.get('data') and 
+                            jogo.get('adversario') == jogo_selecionado.get('adversario')):
+                            jogo['convocados'] = convocados_selecionados
+                            jogo_encontrado = True
+                            break
+                    
+                    if jogo_encontrado:
+                        salvar_dados(dados_atuais)
+                        st.success(f"✅ Convocatória salva com sucesso! {len(convocados_selecionados)} jogadores")
+                    else:
+                        st.error("❌ Erro ao encontrar o jogo normal")
+                        
+            except Exception as e:
+                st.error(f"❌ Erro ao salvar: {str(e)}")
+
+        
+        # Mostrar resumo
+        if convocados_selecionados:
+            st.info(f"👥 **Total de convocados:** {len(convocados_selecionados)}")
+        else:
+            st.warning("⚠️ Nenhum jogador selecionado")
+    
+    with tab2:
+        # Carregar dados atualizados
+        convocados = jogo_selecionado.get('convocados', [])
+        
+        if convocados:
+            st.write(f"**👥 Jogadores Convocados ({len(convocados)}):**")
+            for i, jogador in enumerate(convocados, 1):
+                st.write(f"{i}. {jogador}")
+            
+            # Verificar emails dos jogadores
+            jogadores_dados = dados.get('jogadores', [])
+            emails_convocados = []
+            jogadores_sem_email = []
+            
+            for nome_convocado in convocados:
+                email_encontrado = False
+                for jogador in jogadores_dados:
+                    if jogador.get('nome') == nome_convocado and jogador.get('email'):
+                        emails_convocados.append({
+                            'nome': nome_convocado,
+                            'email': jogador.get('email')
+                        })
+                        email_encontrado = True
+                        break
+                if not email_encontrado:
+                    jogadores_sem_email.append(nome_convocado)
+            
+            # Mostrar status dos emails
+            col1, col2 = st.columns(2)
+            with col1:
+                st.success(f"✅ {len(emails_convocados)} jogadores com email")
+                for jogador in emails_convocados:
+                    st.write(f"• {jogador['nome']}")
+            
+            with col2:
+                if jogadores_sem_email:
+                    st.warning(f"⚠️ {len(jogadores_sem_email)} sem email")
+                    for nome in jogadores_sem_email:
+                        st.write(f"• {nome}")
+            
+            # Botão de envio
+            if emails_convocados:
+                if st.button("📧 Enviar Convocatórias", type="primary"):
+                    try:
+                        if not verificar_sistema_email():
+                            return
+                        
+                        html_convocatoria = email_system.gerar_email_convocatoria(jogo_selecionado, convocados)
+                        assunto = f"⚽ CONVOCATÓRIA - {jogo_selecionado.get('adversario')} ({jogo_selecionado.get('data')})"
+                        
+                        sucessos = 0
+                        erros = 0
+                        
+                        progress_bar = st.progress(0)
+                        status_text = st.empty()
+                        
+                        for i, jogador in enumerate(emails_convocados):
+                            status_text.text(f"Enviando para {jogador['nome']}...")
+                            
+                            sucesso, mensagem = email_system.enviar_email(
+                                jogador['email'],
+                                assunto,
+                                html_convocatoria,
+                                jogador['nome']
+                            )
+                            
+                            if sucesso:
+                                sucessos += 1
+                            else:
+                                erros += 1
+                            
+                            progress_bar.progress((i + 1) / len(emails_convocados))
+                        
+                        status_text.empty()
+                        progress_bar.empty()
+                        
+                        if sucessos > 0:
+                            st.success(f"✅ {sucessos} convocatórias enviadas com sucesso!")
+                        if erros > 0:
+                            st.error(f"❌ {erros} emails falharam")
+                            
+                    except Exception as e:
+                        st.error(f"❌ Erro ao enviar emails: {e}")
+            else:
+                st.error("❌ Nenhum jogador convocado tem email cadastrado")
+        else:
+            st.warning("⚠️ Nenhum jogador convocado para este jogo. Edite a convocatória na aba anterior!")
+    
+    with tab3:
+        st.write("**📊 Histórico de Convocatórias**")
+        
+        # Reconstruir lista completa de jogos (incluindo campeonato) para histórico
+        dados_historico = carregar_dados()
+        jogos_historico_todos = dados_historico.get('jogos', []).copy()
+        
+        # Adicionar jogos do campeonato ao histórico
+        campeonato_historico = dados_historico.get('campeonato', {})
+        jornadas_historico = campeonato_historico.get('jornadas', [])
+        
+        for jornada in jornadas_historico:
+            jogos_jornada = jornada.get('jogos', [])
+            for jogo in jogos_jornada:
+                # Verificar se FC Pinheirense está neste jogo
+                casa = jogo.get('casa', '').strip()
+                fora = jogo.get('fora', '').strip()
+                
+                if 'Fc Pinheirense' in [casa, fora]:
+                    # Determinar adversário e local
+                    if casa == 'Fc Pinheirense':
+                        adversario = fora
+                        local = "Pinheiro"
+                    else:
+                        adversario = casa
+                        local = casa
+                    
+                    # Criar jogo formatado
+                    jogo_formatado = {
+                        'data': jogo.get('data', ''),
+                        'adversario': adversario,
+                        'local': local,
+                        'tipo': 'Campeonato',
+                        'competicao': 'CAMPEONATO DISTRITAL - 2ª DIVISÃO ZONA CENTRO',
+                        'jornada': jornada.get('numero', ''),
+                        'convocados': jogo.get('convocados', []),  # Procurar em convocados diretamente
+                        'hora': jogo.get('hora', '16:00:00')
+                    }
+                    jogos_historico_todos.append(jogo_formatado)
+        
+        # Mostrar jogos do passado com convocatórias
+        jogos_passados = [j for j in jogos_historico_todos if j.get('data', '') < hoje]
+        jogos_com_convocados = [j for j in jogos_passados if j.get('convocados', [])]
+        
+        if jogos_com_convocados:
+            # Ordenar por data (mais recentes primeiro)
+            jogos_com_convocados.sort(key=lambda x: x.get('data', ''), reverse=True)
+            
+            st.info(f"📋 Total de {len(jogos_com_convocados)} jogos com convocatórias no passado")
+            
+            for jogo_historico in jogos_com_convocados[:20]:  # Mostrar últimos 20
+                with st.expander(f"📅 {jogo_historico.get('data')} - vs {jogo_historico.get('adversario')} ({jogo_historico.get('tipo', 'Jogo')})"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**🆚 Adversário:** {jogo_historico.get('adversario')}")
+                        st.write(f"**📍 Local:** {jogo_historico.get('local')}")
+                    with col2:
+                        st.write(f"**🕐 Hora:** {jogo_historico.get('hora', 'TBD')}")
+                        st.write(f"**🎯 Tipo:** {jogo_historico.get('tipo')}")
+                        if jogo_historico.get('jornada'):
+                            st.write(f"**📊 Jornada:** {jogo_historico.get('jornada')}")
+                    
+                    st.divider()
+                    
+                    # Mostrar convocados
+                    convocados_historico = jogo_historico.get('convocados', [])
+                    if convocados_historico:
+                        st.write(f"**👥 Convocados ({len(convocados_historico)}):**")
+                        cols = st.columns(2)
+                        for i, jogador in enumerate(convocados_historico):
+                            col_idx = i % 2
+                            with cols[col_idx]:
+                                st.write(f"• {jogador}")
+                    else:
+                        st.write("*Sem informação sobre convocados*")
+        else:
+            st.info("ℹ️ Nenhum jogo anterior com convocatórias registadas")
+    
+    if st.button("❌ Fechar Convocatórias"):
+        st.session_state['mostrar_convocatorias'] = False
+        st.rerun()
+
+def mostrar_formulario_treinos_email(dados):
+    """Formulário para envio de notificações de treinos"""
+    st.subheader("🏃 Notificar Treinos por Email")
+    
+    treinos = dados.get('treinos', {})
+    hoje = str(date.today())
+    
+    # Filtrar treinos futuros
+    treinos_futuros = {}
+    for data, treino in treinos.items():
+        try:
+            if data >= hoje:
+                treinos_futuros[data] = treino
+        except:
+            continue
+    
+    if not treinos_futuros:
+        st.warning("⚠️ Nenhum treino futuro agendado")
+        if st.button("❌ Fechar"):
+            st.session_state['mostrar_treinos_email'] = False
+            st.rerun()
+        return
+    
+    # Seleção do treino
+    opcoes_treinos = []
+    datas_treinos = []
+    for data in sorted(treinos_futuros.keys()):
+        treino = treinos_futuros[data]
+        data_formatada = datetime.strptime(data, '%Y-%m-%d').strftime('%d/%m/%Y')
+        nome_treino = treino.get('nome', treino.get('tipo', 'Treino'))
+        opcoes_treinos.append(f"{data_formatada} - {nome_treino} ({treino.get('hora', 'TBD')})")
+        datas_treinos.append(data)
+    
+    treino_idx = st.selectbox("Selecione o treino:", range(len(opcoes_treinos)), format_func=lambda x: opcoes_treinos[x])
+    data_selecionada = datas_treinos[treino_idx]
+    treino_selecionado = treinos_futuros[data_selecionada]
+    
+    # Mostrar detalhes do treino
+    with st.expander("📋 Detalhes do Treino Selecionado"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**📅 Data:** {data_selecionada}")
+            st.write(f"**🕐 Hora:** {treino_selecionado.get('hora')}")
+            st.write(f"**🎯 Tipo:** {treino_selecionado.get('tipo')}")
+        with col2:
+            st.write(f"**📍 Local:** {treino_selecionado.get('local')}")
+            st.write(f"**⏱️ Duração:** {treino_selecionado.get('duracao')} min")
+    
+    # Opções de destinatários
+    jogadores_dados = dados.get('jogadores', [])
+    opcoes_destinatarios = ["🎯 Todos os jogadores", "👥 Jogadores específicos", "⚽ Jogadores com email"]
+    
+    opcao_envio = st.radio("Para quem enviar:", opcoes_destinatarios)
+    
+    emails_destinatarios = []
+    
+    if opcao_envio == "🎯 Todos os jogadores":
+        for jogador in jogadores_dados:
+            if jogador.get('email'):
+                emails_destinatarios.append({
+                    'nome': jogador.get('nome'),
+                    'email': jogador.get('email')
+                })
+    
+    elif opcao_envio == "👥 Jogadores específicos":
+        nomes_jogadores = [j.get('nome') for j in jogadores_dados if j.get('email')]
+        if nomes_jogadores:
+            jogadores_selecionados = st.multiselect("Selecione os jogadores:", nomes_jogadores)
+            for nome in jogadores_selecionados:
+                for jogador in jogadores_dados:
+                    if jogador.get('nome') == nome and jogador.get('email'):
+                        emails_destinatarios.append({
+                            'nome': jogador.get('nome'),
+                            'email': jogador.get('email')
+                        })
+        else:
+            st.warning("⚠️ Nenhum jogador tem email cadastrado")
+    
+    elif opcao_envio == "⚽ Jogadores com email":
+        for jogador in jogadores_dados:
+            if jogador.get('email'):
+                emails_destinatarios.append({
+                    'nome': jogador.get('nome'),
+                    'email': jogador.get('email')
+                })
+    
+    # Mostrar destinatários
+    if emails_destinatarios:
+        st.write(f"**📧 Destinatários ({len(emails_destinatarios)}):**")
+        for jogador in emails_destinatarios:
+            st.write(f"• {jogador['nome']} ({jogador['email']})")
+        
+        # Botão de envio
+        if st.button("📧 Enviar Notificações de Treino", type="primary"):
+            try:
+                if not verificar_sistema_email():
+                    return
+                
+                html_treino = email_system.gerar_email_treino(treino_selecionado, data_selecionada)
+                data_formatada = datetime.strptime(data_selecionada, '%Y-%m-%d').strftime('%d/%m/%Y')
+                assunto = f"🏃 TREINO - {data_formatada} ({treino_selecionado.get('tipo', 'Treino')})"
+                
+                sucessos = 0
+                erros = 0
+                
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                for i, jogador in enumerate(emails_destinatarios):
+                    status_text.text(f"Enviando para {jogador['nome']}...")
+                    
+                    sucesso, mensagem = email_system.enviar_email(
+                        jogador['email'],
+                        assunto,
+                        html_treino,
+                        jogador['nome']
+                    )
+                    
+                    if sucesso:
+                        sucessos += 1
+                    else:
+                        erros += 1
+                    
+                    progress_bar.progress((i + 1) / len(emails_destinatarios))
+                
+                status_text.empty()
+                progress_bar.empty()
+                
+                if sucessos > 0:
+                    st.success(f"✅ {sucessos} notificações enviadas com sucesso!")
+                if erros > 0:
+                    st.error(f"❌ {erros} emails falharam")
+                    
+            except Exception as e:
+                st.error(f"❌ Erro ao enviar emails: {e}")
+    else:
+        st.error("❌ Nenhum destinatário com email válido")
+    
+    if st.button("❌ Fechar Notificações"):
+        st.session_state['mostrar_treinos_email'] = False
+        st.rerun()
+
+
+def converter_hora_jogo(hora_str):
+    """Converte string de hora para objeto time"""
+    try:
+        return datetime.strptime(hora_str, '%H:%M:%S').time()
+    except:
+        try:
+            return datetime.strptime(hora_str, '%H:%M').time()
+        except:
+            return datetime.strptime("18:00", "%H:%M").time()
+
+def calcular_estatisticas_jogador(jogador, dados):
+    """Calcula estatísticas detalhadas do jogador baseado nas estatísticas sincronizadas"""
+    # Primeiro, tentar usar as estatísticas já sincronizadas
+    if 'estatisticas' in jogador and jogador['estatisticas']:
+        stats_base = jogador['estatisticas']
+        
+        # Preparar estrutura completa de estatísticas
+        stats = {
+            'jogos_convocados': 0,
+            'jogos_realizados': stats_base.get('jogos_jogados', 0),
+            'tempo_total_minutos': stats_base.get('tempo_total_minutos', 0),
+            'golos': stats_base.get('golos', 0),
+            'assistencias': stats_base.get('assistencias', 0),
+            'passes_certos': stats_base.get('passes_certos', 0),
+            'passes_errados': stats_base.get('passes_errados', 0),
+            'taxa_passes': 0,
+            'remates': stats_base.get('remates', 0),
+            'remates_baliza': stats_base.get('remates_baliza', 0),
+            'faltas_cometidas': stats_base.get('faltas_cometidas', 0),
+            'faltas_sofridas': stats_base.get('faltas_sofridas', 0),
+            'cartao_amarelo': stats_base.get('cartao_amarelo', 0),
+            'cartao_vermelho': stats_base.get('cartao_vermelho', 0),
+            'defesas': stats_base.get('defesas', 0),
+            'nota_media': stats_base.get('notas_medias', 0),
+            'jogos_como_titular': 0,
+            'jogos_como_suplente': 0
+        }
+        
+        # Calcular taxa de passes
+        total_passes = stats['passes_certos'] + stats['passes_errados']
+        if total_passes > 0:
+            stats['taxa_passes'] = (stats['passes_certos'] / total_passes) * 100
+    else:
+        # Fallback: calcular a partir das fichas se não houver estatísticas sincronizadas
+        stats = {
+            'jogos_convocados': 0,
+            'jogos_realizados': 0,
+            'tempo_total_minutos': 0,
+            'golos': 0,
+            'assistencias': 0,
+            'passes_certos': 0,
+            'passes_errados': 0,
+            'taxa_passes': 0,
+            'remates': 0,
+            'remates_baliza': 0,
+            'faltas_cometidas': 0,
+            'faltas_sofridas': 0,
+            'cartao_amarelo': 0,
+            'cartao_vermelho': 0,
+            'defesas': 0,
+            'nota_media': 0,
+            'jogos_como_titular': 0,
+            'jogos_como_suplente': 0
+        }
+    
+    # Convocações e titularidades a partir das vistas materializadas
+    jogador_nome = jogador.get('nome', '')
+    if jogador_nome:
+        totais = estatisticas_jogador(obter_agregados(), jogador_nome)
+        stats['jogos_convocados'] = totais['convocados']
+        stats['jogos_como_titular'] = totais['titular']
+        stats['jogos_como_suplente'] = totais['suplente']
+        
+        # Sem estatísticas sincronizadas: usar os totais das fichas
+        if not jogador.get('estatisticas'):
+            stats.update({
+                'jogos_realizados': totais['jogos'],
+                'tempo_total_minutos': totais['minutos'],
+                'golos': totais['golos'],
+                'assistencias': totais['assistencias'],
+                'cartao_amarelo': totais['amarelos'],
+                'cartao_vermelho': totais['vermelhos'],
+            })
+    
+    return stats
+
+def mostrar_secao_estatisticas_jogador(jogador, dados):
+    """Mostra seção de estatísticas detalhadas do jogador"""
+    stats = calcular_estatisticas_jogador(jogador, dados)
+    
+    st.subheader("📊 Estatísticas Detalhadas")
+    
+    # Resumo em métricas
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("🎯 Convocações", stats['jogos_convocados'])
+    with col2:
+        st.metric("⚽ Jogos Realizados", stats['jogos_realizados'])
+    with col3:
+        st.metric("⭐ Titularidades", stats['jogos_como_titular'])
+    with col4:
+        st.metric("🔄 Suplências", stats['jogos_como_suplente'])
+    
+    st.divider()
+    
+    # Estatísticas ofensivas
+    st.write("### ⚽ Estatísticas Ofensivas")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("⚽ Golos", stats['golos'])
+    with col2:
+        st.metric("🎯 Assistências", stats['assistencias'])
+    with col3:
+        st.metric("🎯 Remates", stats['remates'])
+    with col4:
+        st.metric("🥅 Remates à Baliza", stats['remates_baliza'])
+    with col5:
+        if stats['remates'] > 0:
+            taxa_remates = (stats['remates_baliza'] / stats['remates']) * 100
+            st.metric("📊 % Remates à Baliza", f"{taxa_remates:.1f}%")
+        else:
+            st.metric("📊 % Remates à Baliza", "-")
+    
+    st.divider()
+    
+    # Estatísticas técnicas
+    st.write("### ⚡ Estatísticas Técnicas")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("✅ Passes Certos", stats['passes_certos'])
+    with col2:
+        st.metric("❌ Passes Errados", stats['passes_errados'])
+    with col3:
+        st.metric("📊 Total Passes", stats['passes_certos'] + stats['passes_errados'])
+    with col4:
+        if stats['taxa_passes'] > 0:
+            st.metric("📊 % Passes Certos", f"{stats['taxa_passes']:.1f}%")
+        else:
+            st.metric("📊 % Passes Certos", "-")
+    
+    st.divider()
+    
+    # Estatísticas defensivas
+    st.write("### 🛡️ Estatísticas Defensivas")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("🚫 Faltas Cometidas", stats['faltas_cometidas'])
+    with col2:
+        st.metric("😣 Faltas Sofridas", stats['faltas_sofridas'])
+    with col3:
+        st.metric("🧤 Defesas", stats['defesas'])
+    with col4:
+        if jogador.get('posicao') == 'GR':
+            st.metric("📊 Defesas por Jogo", f"{stats['defesas'] / max(stats['jogos_realizados'], 1):.1f}" if stats['jogos_realizados'] > 0 else "-")
+        else:
+            st.write("")
+    
+    st.divider()
+    
+    # Disciplina
+    st.write("### ⚠️ Disciplina")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("🟨 Cartões Amarelos", stats['cartao_amarelo'])
+    with col2:
+        st.metric("🟥 Cartões Vermelhos", stats['cartao_vermelho'])
+    with col3:
+        st.metric("⭐ Nota Média", f"{stats['nota_media']:.1f}" if stats['nota_media'] > 0 else "-")
+    
+    st.divider()
+    
+    # Tempo de jogo
+    st.write("### ⏱️ Tempo de Jogo")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("⏱️ Total Minutos", f"{stats['tempo_total_minutos']} min")
+    with col2:
+        media_minutos = stats['tempo_total_minutos'] / max(stats['jogos_realizados'], 1)
+        st.metric("📊 Minutos por Jogo", f"{media_minutos:.0f}" if stats['jogos_realizados'] > 0 else "-")
+    with col3:
+        st.metric("📊 Minutos Totais Convocado", f"{stats['tempo_total_minutos']} min")
@@ -0,0 +1,95 @@
+"""
+Registo de Páginas e Router
+Cada página vive num módulo deste pacote, importado só na primeira visita; os módulos importam o que usam
+(streamlit, app_core, módulos auxiliares) como qualquer outro módulo
+"""
+
+import sys
+import importlib
+
+# pagina_atual -> (módulo do pacote, função); módulo None = função da própria app
+PAGINAS = {
+    'dashboard': (None, 'dashboard_treinador'),
+    'jogadores': ('players', 'gestao_jogadores'),
+
+    # Submenus organizados
+    'jogos_competicoes': ('matches', 'mostrar_submenu_jogos_competicoes'),
+    'treinos_planos': ('trainings', 'mostrar_submenu_treinos_planos'),
+    'relatorios_pdfs': ('reports', 'mostrar_submenu_relatorios_pdfs'),
+    'gestao': ('management', 'mostrar_submenu_gestao'),
+
+    # Páginas individuais
+    'jogos': ('matches', 'gestao_jogos'),
+    'campeonato': ('matches', 'gestao_campeonato'),
+    'taca': ('matches', 'gestao_taca'),
+    'treinos': ('trainings', 'gestao_treinos'),
+    'presencas': ('trainings', 'lista_presencas'),
+    'esquemas_taticos': ('tactics', 'gestao_esquemas_taticos'),
+    'planos_treinos': ('trainings', 'planos_treinos_treinador'),
+    'estatisticas': ('reports', 'mostrar_estatisticas'),
+    'mensagens': ('messages', 'sistema_mensagens_treinador'),
+    'treinadores': ('management', 'gestao_treinadores'),
+    'email': ('email_center', 'mostrar_central_email'),
+    'mensagens_treinador': ('messages', 'sistema_mensagens_treinador'),
+    'config': ('management', 'mostrar_configuracoes'),
+    'desempenho': ('performance', 'mostrar_desempenho'),  # apenas admin, aberta a partir das configurações
+
+    # Área do jogador
+    'perfil': ('player_portal', 'perfil_jogador'),
+    'treinos_jogador': ('player_portal', 'treinos_jogador'),
+    'jogos_jogador': ('player_portal', 'jogos_jogador'),
+    'equipa': ('player_portal', 'ver_equipa'),
+    'plano_mensal': ('player_portal', 'plano_treinos_mensal_jogador'),
+    'plano_semanal': ('player_portal', 'plano_treinos_semanal_jogador'),
+    'mensagens_jogador': ('messages', 'mensagens_jogador'),
+}
+
+# Geradores executados pelo serviço de PDFs em segundo plano (procurados pelo nome, no processo do worker)
+FUNCOES_PARTILHADAS = {
+    'gerar_pdf_lista_jogadores': 'pdfs',
+    'gerar_pdf_convocatoria': 'pdfs',
+    'gerar_pdf_convocatoria_completa': 'pdfs',
+    'gerar_pdf_folha_presenca_profissional': 'pdfs',
+    'gerar_pdf_tabela_classificativa': 'pdfs',
+    'gerar_relatorio_minutos_campeonato_pdf': 'reports',
+    'gerar_relatorio_golos_campeonato_pdf': 'reports',
+    'gerar_relatorio_cartoes_campeonato_pdf': 'reports',
+    'criar_pdf_plano_treino': 'trainings',
+    'criar_pdf_plano_visual': 'trainings',
+    'criar_calendario_pdf': 'trainings',
+    'gerar_pdf_calendario_mensal': 'trainings',
+    'gerar_pdf_calendario_semanal': 'trainings',
+    'gerar_pdf_calendario_anual': 'trainings',
+    'gerar_png_campo_a4': 'tactics',
+    'gerar_pdf_campo_a4': 'tactics',
+}
+
+
+def carregar_modulo(nome):
+    """Módulo da página (importado uma vez por processo, na primeira visita)"""
+    return importlib.import_module(f"{__name__}.{nome}")
+
+
+def funcao_partilhada(nome_funcao):
+    """Gerador registado em FUNCOES_PARTILHADAS, importando o seu módulo se ainda não estiver carregado"""
+    return getattr(carregar_modulo(FUNCOES_PARTILHADAS[nome_funcao]), nome_funcao)
+
+
+def despachar(pagina, contexto):
+    """Executa a página registada para `pagina_atual`; False se não existir.
+    As páginas da própria app (módulo None) são procuradas em `contexto`"""
+    registo = PAGINAS.get(pagina)
+    if registo is None:
+        return False
+    nome_modulo, nome_funcao = registo
+    if nome_modulo is None:
+        contexto[nome_funcao]()
+    else:
+        getattr(carregar_modulo(nome_modulo), nome_funcao)()
+    return True
+
+
+def modulos_carregados():
+    """Módulos de páginas já importados neste processo"""
+    prefixo = f"{__name__}."
+    return sorted(nome[len(prefixo):] for nome in list(sys.modules) if nome.startswith(prefixo))
@@ -0,0 +1,101 @@
+"""
+Central de Email
+Envio de convocatórias e planos de treino por email
+"""
+
+import streamlit as st
+
+from app_core import (
+    get_secret_value, has_secret_keys, carregar_dados, mostrar_configuracao_email, mostrar_formulario_convocatorias,
+    mostrar_formulario_treinos_email
+)
+
+
+def mostrar_central_email():
+    """Central de notificações por email"""
+    dados = carregar_dados()
+    
+    st.title("📧 Central de Notificações por Email")
+    st.write("Gerencie todas as comunicações por email da equipe")
+    
+    # Status do email
+    email_configurado = False
+    try:
+        if hasattr(st, 'secrets'):
+            email_configurado = has_secret_keys('EMAIL_USER', 'EMAIL_PASSWORD')
+    except Exception:
+        email_configurado = False
+    
+    if email_configurado:
+        st.success("✅ Sistema de email configurado e ativo")
+        try:
+            email_user = get_secret_value("EMAIL_USER", "")
+            st.info(f"📧 Enviando de: {email_user}")
+        except:
+            pass
+    else:
+        st.error("❌ Sistema de email não configurado")
+        st.warning("Configure o email para usar as notificações")
+    
+    st.divider()
+    
+    # Seção de Notificações por Email
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.subheader("⚽ Convocatórias")
+        st.write("Envie convocatórias para jogos")
+        if st.button("📧 Convocatórias de Jogos", use_container_width=True, type="primary"):
+            st.session_state['mostrar_convocatorias'] = True
+            st.rerun()
+    
+    with col2:
+        st.subheader("🏃 Treinos")
+        st.write("Notifique sobre treinos")
+        if st.button("🏃 Notificar Treinos", use_container_width=True, type="primary"):
+            st.session_state['mostrar_treinos_email'] = True
+            st.rerun()
+    
+    with col3:
+        st.subheader("⚙️ Configuração")
+        st.write("Configure o sistema de email")
+        if st.button("⚙️ Configurar Email", use_container_width=True, type="primary"):
+            st.session_state['mostrar_config_email'] = True
+            st.rerun()
+    
+    # Formulários de email
+    if st.session_state.get('mostrar_convocatorias', False):
+        st.divider()
+        mostrar_formulario_convocatorias(dados)
+    
+    if st.session_state.get('mostrar_treinos_email', False):
+        st.divider()
+        mostrar_formulario_treinos_email(dados)
+    
+    if st.session_state.get('mostrar_config_email', False):
+        st.divider()
+        mostrar_configuracao_email()
+    
+    # Estatísticas de email
+    st.divider()
+    st.subheader("📊 Estatísticas")
+    
+    jogadores_com_email = [j for j in dados.get('jogadores', []) if j.get('email')]
+    jogadores_sem_email = [j for j in dados.get('jogadores', []) if not j.get('email')]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("📧 Jogadores com Email", len(jogadores_com_email))
+    with col2:
+        st.metric("❌ Jogadores sem Email", len(jogadores_sem_email))
+    with col3:
+        if len(dados.get('jogadores', [])) > 0:
+            percentual = round((len(jogadores_com_email) / len(dados.get('jogadores', []))) * 100, 1)
+            st.metric("📈 Cobertura de Email", f"{percentual}%")
+    
+    # Lista de jogadores sem email
+    if jogadores_sem_email:
+        with st.expander(f"⚠️ Jogadores sem Email ({len(jogadores_sem_email)})"):
+            for jogador in jogadores_sem_email:
+                st.write(f"• {jogador.get('nome', 'N/A')}")
+            st.info("💡 Adicione emails na seção 'Jogadores' para melhorar a comunicação")
@@ -0,0 +1,877 @@
+"""
+Páginas de Gestão
+Treinadores, configurações do sistema e limpeza de backups
+"""
+
+import streamlit as st
+import json
+import os
+import uuid
+import glob as glob_module
+from datetime import datetime
+
+from backup_retention import aplicar_retencao
+from backup_restore import restaurar_backup_streaming
+from app_core import (
+    bcrypt, DATA_FILE, limpar_cache_e_forcar_reload, invalidar_cache_dados, carregar_dados, salvar_dados,
+    criar_backup_manual, mostrar_restauro_backup, mostrar_configuracao_email
+)
+
+
+def limpar_backups_antigos(dados=None):
+    """Aplica a política de retenção GFS (horários, diários, semanais e jornadas) aos backups"""
+    try:
+        # Determinar pasta dos backups
+        pasta = os.path.dirname(DATA_FILE)
+        if not pasta:  # Se DATA_FILE não tem caminho, usar diretório atual
+            pasta = "."
+        
+        # Datas dos jogos para preservar snapshots de dias de jornada
+        if dados is None:
+            dados = st.session_state.get('dados_cache')
+        
+        relatorio = aplicar_retencao(pastas=[pasta], dados=dados)
+        if relatorio and relatorio['removidos']:
+            print(f"Retenção de backups: {relatorio['removidos']} removidos, "
+                  f"{relatorio['bytes_libertados']} bytes libertados")
+        return relatorio
+    except Exception as e:
+        print(f"Aviso: Erro ao limpar backups antigos: {e}")
+        return None
+
+def mostrar_configuracoes():
+    """Página de configurações gerais"""
+    st.title("⚙️ Configurações do Sistema")
+    
+    # Configurações de Email
+    st.subheader("📧 Sistema de Email")
+    mostrar_configuracao_email()
+    
+    st.divider()
+    
+    # Configurações de Backup - Sistema Completo
+    st.subheader("💾 Sistema de Backup")
+    
+    # Criar sub-tabs para organizar melhor
+    backup_tab1, backup_tab2, backup_tab3, backup_tab4 = st.tabs(["ℹ️ Informações", "📥 Criar Backup", "📤 Restaurar Backup", "🗂️ Gestão de Backups"])
+    
+    with backup_tab1:
+        # Informação sobre backup automático
+        st.write("### ℹ️ Informações do Sistema de Backup")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**💾 Backup Automático:**")
+            st.write("• ✅ Backup a cada alteração")
+            st.write("• 📁 Backups na pasta do projeto")
+            st.write("• 🔄 Retenção horária, diária, semanal e por jornada")
+            st.write("• 🛡️ Backup na sessão (anti-hibernação)")
+            st.write("• 📥 Download manual disponível")
+                
+        with col2:
+            dados = carregar_dados()
+            st.write("**📊 Estado dos Dados:**")
+            st.write(f"• 👥 {len(dados.get('jogadores', []))} jogadores")
+            st.write(f"• 🏃 {len(dados.get('treinos', {}))} treinos")
+            st.write(f"• ⚽ {len(dados.get('jogos', []))} jogos")
+            if os.path.exists(DATA_FILE):
+                tamanho = round(os.path.getsize(DATA_FILE) / 1024, 1)
+                st.write(f"• 💽 Arquivo: {tamanho} KB")
+            
+            # Status da sessão
+            if 'dados_backup' in st.session_state:
+                st.write("• 🛡️ Backup em sessão: **ATIVO**")
+            else:
+                st.write("• ⚠️ Backup em sessão: **INATIVO**")
+        
+        # Diagnósticos do sistema
+        st.divider()
+        st.write("### 🔍 Diagnósticos do Sistema")
+        
+        # Verificar se APP_FINAL.json existe
+        st.write("**📁 Estado dos Arquivos:**")
+        if os.path.exists(DATA_FILE):
+            tamanho = os.path.getsize(DATA_FILE)
+            mod_time = datetime.fromtimestamp(os.path.getmtime(DATA_FILE))
+            st.success(f"✅ {DATA_FILE} existe ({tamanho} bytes)")
+            st.info(f"📅 Última modificação: {mod_time.strftime('%d/%m/%Y %H:%M:%S')}")
+            
+            # Verificar se consegue carregar
+            try:
+                dados_teste = carregar_dados()
+                if dados_teste:
+                    st.success("✅ Arquivo carregado com sucesso")
+                else:
+                    st.warning("⚠️ Arquivo existe mas está vazio")
+            except Exception as e:
+                st.error(f"❌ Erro ao carregar: {e}")
+        else:
+            st.error(f"❌ {DATA_FILE} não encontrado")
+        
+        # Verificar últimos salvamentos
+        if 'ultimo_salvamento' in st.session_state:
+            ultimo_save = st.session_state['ultimo_salvamento']
+            st.write(f"**💾 Último salvamento:** {ultimo_save}")
+        else:
+            st.warning("⚠️ Nenhum registro de salvamento")
+        
+        # Verificar permissões de escrita
+        st.write("**🔐 Permissões:**")
+        try:
+            test_file = DATA_FILE + '.test'
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+            st.success("✅ Permissões de escrita OK")
+        except Exception as e:
+            st.error(f"❌ Problema de permissões: {e}")
+        
+        # Verificar backups automáticos
+        st.write("**📂 Backups Automáticos:**")
+        backup_files = glob_module.glob('backup_automatico_*.json')
+        if backup_files:
+            backup_files.sort(reverse=True)
+            st.success(f"✅ {len(backup_files)} backups automáticos encontrados")
+            st.write("Backups mais recentes:")
+            for bf in backup_files[:3]:
+                size = os.path.getsize(bf)
+                st.write(f"  • {bf} ({size} bytes)")
+        else:
+            st.warning("⚠️ Nenhum backup automático encontrado")
+    
+    with backup_tab2:
+        st.write("### 📥 Criar Backup Manual")
+        st.info("💡 Crie um backup manual dos seus dados para ter uma cópia de segurança")
+        
+        if st.button("💾 Criar Backup Manual", type="primary"):
+            backup_json, filename = criar_backup_manual()
+            if backup_json and filename:
+                st.success(f"✅ Backup criado: {filename}")
+                st.balloons()
+                
+                st.download_button(
+                    label="⬇️ Baixar Backup",
+                    data=backup_json,
+                    file_name=filename,
+                    mime="application/json"
+                )
+            else:
+                st.error("❌ Erro ao criar backup")
+        
+        # Recuperação de emergência
+        st.divider()
+        st.subheader("🚨 Recuperação de Emergência")
+        
+        # Recuperar da sessão
+        if 'dados_backup' in st.session_state and st.session_state['dados_backup']:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**💾 Dados na Sessão Disponíveis:**")
+                dados_sessao = st.session_state['dados_backup']
+                jogadores_count = len(dados_sessao.get('jogadores', []))
+                jogos_count = len(dados_sessao.get('jogos', []))
+                treinos_count = len(dados_sessao.get('treinos', {}))
+                st.info(f"🔍 {jogadores_count} jogadores, {jogos_count} jogos, {treinos_count} treinos")
+                
+                if st.button("🔄 Restaurar da Sessão", type="primary"):
+                    if salvar_dados(dados_sessao):
+                        st.success("✅ Dados da sessão restaurados com sucesso!")
+                        st.balloons()
+                        
+                        # Limpar cache e forçar reload completo
+                        limpar_cache_e_forcar_reload()
+                        
+                        # Forçar recarregamento imediato
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao restaurar dados da sessão")
+            
+            with col2:
+                st.write("**📥 Download dos Dados da Sessão:**")
+                if st.button("💾 Criar Backup da Sessão"):
+                    backup_data = {
+                        'metadata': {
+                            'criado_em': datetime.now().isoformat(),
+                            'tipo': 'recuperacao_sessao',
+                            'versao': '1.0'
+                        },
+                        'dados': dados_sessao
+                    }
+                    
+                    backup_json = json.dumps(backup_data, ensure_ascii=False, indent=2)
+                    filename = f"recuperacao_sessao_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                    
+                    st.download_button(
+                        label="📥 Download Backup da Sessão",
+                        data=backup_json,
+                        file_name=filename,
+                        mime="application/json"
+                    )
+                    st.success("✅ Backup da sessão preparado!")
+        else:
+            st.warning("⚠️ Nenhum dado disponível na sessão para recuperação")
+        
+        # Recuperar de backups automáticos
+        backup_files = glob_module.glob('backup_automatico_*.json')
+        if backup_files:
+            backup_files.sort(reverse=True)  # Mais recente primeiro
+            
+            st.write("**📂 Restaurar de Backup Automático:**")
+            backup_selecionado = st.selectbox(
+                "Escolha um backup automático:",
+                options=backup_files,
+                format_func=lambda x: f"{x} ({os.path.getsize(x)} bytes)"
+            )
+            
+            if st.button("🔄 Restaurar Backup Automático"):
+                try:
+                    barra = st.progress(0.0, text="A iniciar restauro...")
+                    with open(backup_selecionado, 'rb') as f:
+                        sucesso, resultado = restaurar_backup_streaming(
+                            f,
+                            DATA_FILE,
+                            progresso=lambda fracao, mensagem: barra.progress(fracao, text=mensagem)
+                        )
+                    
+                    if sucesso:
+                        st.success(f"✅ Backup {backup_selecionado} restaurado com sucesso!")
+                        st.balloons()
+                        
+                        # Limpar cache e forçar reload completo
+                        invalidar_cache_dados()
+                        limpar_cache_e_forcar_reload()
+                        
+                        # Forçar recarregamento imediato
+                        st.rerun()
+                    else:
+                        st.error(f"❌ Erro ao restaurar backup automático: {resultado}")
+                        
+                except Exception as e:
+                    st.error(f"❌ Erro ao processar backup automático: {e}")
+
+    with backup_tab3:
+        st.write("### 📤 Restaurar Backup")
+        st.warning("⚠️ **ATENÇÃO**: Restaurar um backup irá substituir TODOS os dados atuais!")
+        
+        backup_file = st.file_uploader(
+            "📤 Selecione o arquivo de backup",
+            type=['json'],
+            help="Selecione um arquivo de backup (.json) para restaurar",
+            key="restore_backup_config"
+        )
+        
+        if backup_file is not None:
+            mostrar_restauro_backup(backup_file, "config")
+        else:
+            st.info("📤 Selecione um arquivo de backup (.json) para restaurar")
+
+    with backup_tab4:
+        st.write("### 🗂️ Gestão de Backups")
+        
+        # Listar backups automáticos
+        try:
+            backup_files = glob_module.glob("backup_automatico_*.json")
+            backup_files.sort(reverse=True)  # Mais recentes primeiro
+            
+            if backup_files:
+                st.write(f"**📁 Backups Automáticos Encontrados ({len(backup_files)}):**")
+                
+                for backup_file in backup_files[:10]:  # Mostrar apenas os 10 mais recentes
+                    try:
+                        # Extrair data do nome do arquivo
+                        timestamp = backup_file.replace('backup_automatico_', '').replace('.json', '')
+                        data_backup = datetime.strptime(timestamp, '%Y%m%d_%H%M%S').strftime('%d/%m/%Y %H:%M:%S')
+                        
+                        # Obter tamanho do arquivo
+                        tamanho = os.path.getsize(backup_file) / 1024  # KB
+                        
+                        col1, col2, col3 = st.columns([3, 2, 1])
+                        with col1:
+                            st.write(f"📄 {backup_file}")
+                        with col2:
+                            st.write(f"📅 {data_backup}")
+                        with col3:
+                            st.write(f"📦 {tamanho:.1f} KB")
+                            
+                    except Exception as e:
+                        st.write(f"📄 {backup_file} (erro ao ler detalhes)")
+                
+                if len(backup_files) > 10:
+                    st.info(f"... e mais {len(backup_files) - 10} backups antigos")
+                
+                # Botão para limpar backups antigos
+                if st.button("🗑️ Limpar Backups Antigos", help="Aplica a política de retenção (horários, diários, semanais e jornadas)"):
+                    try:
+                        relatorio = limpar_backups_antigos(carregar_dados())
+                        if relatorio:
+                            st.success(f"✅ {relatorio['removidos']} backups antigos removidos "
+                                       f"({relatorio['bytes_libertados'] / 1024:.1f} KB libertados)")
+                        else:
+                            st.success("✅ Backups antigos removidos")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Erro ao limpar backups: {e}")
+            else:
+                st.info("📁 Nenhum backup automático encontrado")
+                
+        except Exception as e:
+            st.error(f"❌ Erro ao listar backups: {e}")
+    
+    st.divider()
+    
+    # Configurações de Interface
+    st.subheader("🎨 Interface")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**📱 Tema Atual:** Claro/Escuro automático")
+        st.write("**🌐 Idioma:** Português")
+        st.write("**📊 Layout:** Responsivo")
+    
+    with col2:
+        st.write("**⚽ Clube:** F.C. PINHEIRENSE")
+        st.write("**📅 Temporada:** 2024/2025")
+        st.write("**👨‍💼 Versão:** App Treinador v2.0")
+    
+    # Página de desempenho (apenas admin, fora do menu)
+    if st.session_state.get('usuario_logado') == 'admin':
+        if st.button("⏱️ Desempenho da App", key="config_desempenho"):
+            st.session_state.pagina_atual = "desempenho"
+            st.rerun()
+
+# === GESTÃO DE TREINADORES ===
+def gestao_treinadores():
+    """Gestão completa de treinadores com sistema de permissões"""
+    dados = carregar_dados()
+    
+    st.title("👨‍🏫 Gestão de Treinadores")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Lista de Treinadores", "➕ Adicionar Treinador", "🔐 Gerir Credenciais", "🔧 Gerir Permissões"])
+    
+    with tab1:
+        treinadores = dados.get('treinadores', [])
+        
+        if treinadores:
+            st.subheader(f"📊 {len(treinadores)} treinador(es) registado(s)")
+            
+            for treinador in treinadores:
+                with st.expander(f"👨‍🏫 {treinador.get('nome', 'Sem nome')} - {treinador.get('funcao', 'N/A')}"):
+                    col1, col2, col3 = st.columns([2, 2, 1])
+                    
+                    with col1:
+                        st.write(f"**👤 Nome:** {treinador.get('nome', 'N/A')}")
+                        st.write(f"**📋 Função:** {treinador.get('funcao', 'N/A')}")
+                        st.write(f"**📞 Telefone:** {treinador.get('telefone', 'N/A')}")
+                        st.write(f"**📧 Email:** {treinador.get('email', 'N/A')}")
+                    
+                    with col2:
+                        st.write(f"**🎂 Idade:** {treinador.get('idade', 'N/A')} anos")
+                        st.write(f"**⚽ Experiência:** {treinador.get('experiencia', 0)} anos")
+                        st.write(f"**🏆 Último Clube:** {treinador.get('clube_anterior', 'N/A')}")
+                        # Mostrar nível de acesso
+                        nivel = treinador.get('nivel_acesso', '🔓 Acesso Total')
+                        if nivel.startswith('🔓'):
+                            st.success(f"**🔐 Permissões:** {nivel}")
+                        else:
+                            st.warning(f"**🔐 Permissões:** {nivel}")
+                    
+                    with col3:
+                        # Botões de ação (apenas admin pode editar treinadores)
+                        if st.session_state.get('usuario_logado') == 'admin':
+                            if st.button("✏️", key=f"edit_treinador_{treinador.get('id')}", help="Editar treinador"):
+                                st.session_state[f"editing_treinador_{treinador.get('id')}"] = True
+                                st.rerun()
+                            
+                            if st.button("🗑️", key=f"delete_treinador_{treinador.get('id')}", help="Remover treinador"):
+                                dados['treinadores'] = [t for t in dados['treinadores'] if t.get('id') != treinador.get('id')]
+                                if salvar_dados(dados):
+                                    st.success(f"✅ Treinador {treinador.get('nome')} removido!")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao remover treinador")
+                        else:
+                            st.info("🔒 Apenas admin pode editar")
+                    
+                    # Mostrar certificações e especialidades se existirem
+                    if treinador.get('certificacoes'):
+                        st.write("**🏅 Certificações:**")
+                        for cert in treinador['certificacoes']:
+                            st.write(f"• {cert}")
+                    
+                    if treinador.get('especialidades'):
+                        st.write("**🎯 Especialidades:**")
+                        for esp in treinador['especialidades']:
+                            st.write(f"• {esp}")
+                    
+                    if treinador.get('observacoes'):
+                        st.write("**📝 Observações:**")
+                        st.write(treinador['observacoes'])
+                    
+                    # Formulário de edição (se ativado)
+                    if st.session_state.get(f"editing_treinador_{treinador.get('id')}", False):
+                        st.write("---")
+                        with st.form(f"edit_treinador_{treinador.get('id')}"):
+                            st.subheader(f"✏️ Editar: {treinador.get('nome')}")
+                            
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                edit_nome = st.text_input("Nome Completo", value=treinador.get('nome', ''))
+                                edit_funcao = st.selectbox("Função", [
+                                    "Treinador Principal", "Treinador Adjunto", "Preparador Físico",
+                                    "Treinador de Guarda-Redes", "Fisioterapeuta", "Massagista", "Outro"
+                                ], index=0 if not treinador.get('funcao') else [
+                                    "Treinador Principal", "Treinador Adjunto", "Preparador Físico",
+                                    "Treinador de Guarda-Redes", "Fisioterapeuta", "Massagista", "Outro"
+                                ].index(treinador.get('funcao', 'Outro')) if treinador.get('funcao') in [
+                                    "Treinador Principal", "Treinador Adjunto", "Preparador Físico",
+                                    "Treinador de Guarda-Redes", "Fisioterapeuta", "Massagista", "Outro"
+                                ] else 0)
+                                edit_telefone = st.text_input("Telefone", value=treinador.get('telefone', ''))
+                                edit_email = st.text_input("Email", value=treinador.get('email', ''))
+                            
+                            with col2:
+                                idade_atual = treinador.get('idade', 35)
+                                if idade_atual < 18:
+                                    idade_atual = 18
+                                edit_idade = st.number_input("Idade", min_value=18, max_value=80, value=idade_atual)
+                                edit_experiencia = st.number_input("Anos de Experiência", min_value=0, max_value=50, value=treinador.get('experiencia', 0))
+                                edit_clube_anterior = st.text_input("Último Clube", value=treinador.get('clube_anterior', ''))
+                                edit_salario = st.number_input("Salário (€)", min_value=0, value=treinador.get('salario', 0))
+                            
+                            edit_certificacoes = st.multiselect("Certificações", [
+                                "UEFA A", "UEFA B", "UEFA C", "Curso de Treinadores", "Preparação Física",
+                                "Psicologia do Desporto", "Nutrição Desportiva", "Primeiros Socorros"
+                            ], default=treinador.get('certificacoes', []))
+                            
+                            edit_especialidades = st.multiselect("Especialidades", [
+                                "Táticas", "Técnica Individual", "Preparação Física", "Guarda-Redes",
+                                "Jovens", "Seniores", "Reabilitação", "Psicologia", "Nutrição"
+                            ], default=treinador.get('especialidades', []))
+                            
+                            # Campo de Permissões (NOVIDADE!)
+                            nivel_atual = treinador.get('nivel_acesso', '🔓 Acesso Total')
+                            edit_nivel_acesso = st.selectbox("🔐 Nível de Acesso", [
+                                "🔓 Acesso Total",
+                                "👁️ Apenas Visualização"
+                            ], index=0 if nivel_atual == '🔓 Acesso Total' else 1,
+                            help="Define se o treinador pode editar dados ou apenas visualizar")
+                            
+                            edit_observacoes = st.text_area("Observações", value=treinador.get('observacoes', ''))
+                            
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                save_edit = st.form_submit_button("💾 Salvar Alterações", type="primary")
+                            with col2:
+                                cancel_edit = st.form_submit_button("❌ Cancelar")
+                            
+                            if save_edit:
+                                # Atualizar dados do treinador
+                                for i, t in enumerate(dados['treinadores']):
+                                    if t.get('id') == treinador.get('id'):
+                                        dados['treinadores'][i].update({
+                                            'nome': edit_nome,
+                                            'funcao': edit_funcao,
+                                            'telefone': edit_telefone,
+                                            'email': edit_email,
+                                            'idade': edit_idade,
+                                            'experiencia': edit_experiencia,
+                                            'clube_anterior': edit_clube_anterior,
+                                            'salario': edit_salario,
+                                            'certificacoes': edit_certificacoes,
+                                            'especialidades': edit_especialidades,
+                                            'observacoes': edit_observacoes,
+                                            'nivel_acesso': edit_nivel_acesso,
+                                            'pode_editar': edit_nivel_acesso == '🔓 Acesso Total'
+                                        })
+                                        break
+                                
+                                if salvar_dados(dados):
+                                    st.success(f"✅ Treinador {edit_nome} atualizado!")
+                                    del st.session_state[f"editing_treinador_{treinador.get('id')}"]
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao salvar alterações")
+                            
+                            if cancel_edit:
+                                del st.session_state[f"editing_treinador_{treinador.get('id')}"]
+                                st.rerun()
+        else:
+            st.info("📝 Nenhum treinador cadastrado ainda")
+    
+    with tab2:
+        # Verificar se é admin para permitir adicionar treinadores
+        if st.session_state.get('usuario_logado') != 'admin':
+            st.warning("🔒 **Apenas Admin** - Você não tem permissão para adicionar treinadores.")
+            st.info("Entre em contato com o administrador do sistema.")
+            return
+        
+        st.subheader("➕ Adicionar Novo Treinador")
+        
+        with st.form("novo_treinador"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                nome = st.text_input("Nome Completo*", placeholder="Nome do treinador")
+                funcao = st.selectbox("Função*", [
+                    "Treinador Principal", "Treinador Adjunto", "Preparador Físico",
+                    "Treinador de Guarda-Redes", "Fisioterapeuta", "Massagista", "Outro"
+                ])
+                telefone = st.text_input("Telefone", placeholder="910123456")
+                email = st.text_input("Email", placeholder="treinador@email.com")
+            
+            with col2:
+                idade = st.number_input("Idade", min_value=18, max_value=80, value=35)
+                experiencia = st.number_input("Anos de Experiência", min_value=0, max_value=50, value=0)
+                clube_anterior = st.text_input("Último Clube", placeholder="Nome do clube anterior")
+                salario = st.number_input("Salário (€)", min_value=0, value=0)
+            
+            certificacoes = st.multiselect("Certificações", [
+                "UEFA A", "UEFA B", "UEFA C", "Curso de Treinadores", "Preparação Física",
+                "Psicologia do Desporto", "Nutrição Desportiva", "Primeiros Socorros"
+            ])
+            
+            especialidades = st.multiselect("Especialidades", [
+                "Táticas", "Técnica Individual", "Preparação Física", "Guarda-Redes",
+                "Jovens", "Seniores", "Reabilitação", "Psicologia", "Nutrição"
+            ])
+            
+            # Campo de Permissões (NOVIDADE!)
+            nivel_acesso = st.selectbox("🔐 Nível de Acesso", [
+                "🔓 Acesso Total (Pode editar tudo)",
+                "👁️ Apenas Visualização (Só consulta)"
+            ], help="Define se o treinador pode editar dados ou apenas visualizar")
+            
+            observacoes = st.text_area("Observações", placeholder="Informações adicionais sobre o treinador")
+            
+            # Campos de login
+            st.subheader("🔐 Credenciais de Acesso")
+            login = st.text_input("Login/Usuário*", placeholder="usuario_treinador")
+            senha = st.text_input("Senha*", type="password", placeholder="Senha para acesso")
+            
+            submitted = st.form_submit_button("💾 Adicionar Treinador", type="primary")
+            
+            if submitted:
+                if nome and funcao and login and senha:
+                    # Verificar se login já existe
+                    login_existe = False
+                    for treinador in dados.get('treinadores', []):
+                        if treinador.get('login') == login:
+                            login_existe = True
+                            break
+                    
+                    if login_existe:
+                        st.error("❌ Login já existe! Escolha outro.")
+                    else:
+                        # Gerar hash da senha
+                        senha_hash = bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                        pode_editar = nivel_acesso.startswith("🔓")
+                        
+                        novo_treinador = {
+                            'id': str(uuid.uuid4()),
+                            'nome': nome,
+                            'funcao': funcao,
+                            'telefone': telefone,
+                            'email': email,
+                            'idade': idade,
+                            'experiencia': experiencia,
+                            'clube_anterior': clube_anterior,
+                            'salario': salario,
+                            'certificacoes': certificacoes,
+                            'especialidades': especialidades,
+                            'observacoes': observacoes,
+                            'login': login,
+                            'senha_hash': senha_hash,
+                            'tipo': 'treinador',
+                            'nivel_acesso': nivel_acesso,
+                            'pode_editar': pode_editar,
+                            'data_criacao': datetime.now().isoformat()
+                        }
+                        
+                        if 'treinadores' not in dados:
+                            dados['treinadores'] = []
+                        
+                        dados['treinadores'].append(novo_treinador)
+                        
+                        if salvar_dados(dados):
+                            st.success(f"✅ Treinador {nome} adicionado com sucesso!")
+                            st.info(f"🔐 Login: {login}")
+                            if pode_editar:
+                                st.success("🔓 Permissões: Acesso total para edição")
+                            else:
+                                st.warning("👁️ Permissões: Apenas visualização")
+                            st.balloons()
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao salvar treinador")
+                else:
+                    st.error("❌ Preencha todos os campos obrigatórios (*)")
+    
+    with tab3:
+        # Verificar se é admin para permitir gerir credenciais
+        if st.session_state.get('usuario_logado') != 'admin':
+            st.warning("🔒 **Apenas Admin** - Você não tem permissão para gerir credenciais.")
+            st.info("Entre em contato com o administrador do sistema.")
+            return
+        
+        st.subheader("🔐 Gestão de Credenciais")
+        st.write("Altere as credenciais de acesso de treinadores e jogadores.")
+        
+        # Divisão em colunas para treinadores e jogadores
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("### 👨‍🏫 Credenciais de Treinadores")
+            treinadores = dados.get('treinadores', [])
+            if treinadores:
+                treinador_nomes = {f"{t.get('nome', 'Sem nome')} - {t.get('funcao', 'N/A')}": t for t in treinadores}
+                treinador_selecionado_nome = st.selectbox("Selecione o treinador:", list(treinador_nomes.keys()), key="sel_treinador_cred")
+                treinador_selecionado = treinador_nomes[treinador_selecionado_nome]
+                
+                if treinador_selecionado:
+                    st.write(f"**Alterando credenciais de:** {treinador_selecionado.get('nome')}")
+                    
+                    with st.form("alterar_credenciais_treinador"):
+                        novo_login_treinador = st.text_input("Novo Login/Usuário:", 
+                                                           value=treinador_selecionado.get('login', ''),
+                                                           placeholder="novo_usuario")
+                        nova_senha_treinador = st.text_input("Nova Senha:", 
+                                                           type="password", 
+                                                           placeholder="Nova senha segura")
+                        confirmar_senha_treinador = st.text_input("Confirmar Nova Senha:", 
+                                                                 type="password", 
+                                                                 placeholder="Repita a nova senha")
+                        
+                        if st.form_submit_button("🔄 Alterar Credenciais do Treinador", type="primary"):
+                            if novo_login_treinador and nova_senha_treinador:
+                                if nova_senha_treinador == confirmar_senha_treinador:
+                                    # Atualizar credenciais do treinador
+                                    dados_atualizados = False
+                                    for i, t in enumerate(dados['treinadores']):
+                                        if t.get('id') == treinador_selecionado.get('id'):
+                                            dados['treinadores'][i]['login'] = novo_login_treinador
+                                            dados['treinadores'][i]['senha'] = bcrypt.hashpw(nova_senha_treinador.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                                            # Remover senha_hash antigo se existir para evitar conflitos
+                                            if 'senha_hash' in dados['treinadores'][i]:
+                                                del dados['treinadores'][i]['senha_hash']
+                                            dados_atualizados = True
+                                            break
+                                    
+                                    if dados_atualizados:
+                                        if salvar_dados(dados):
+                                            st.success(f"✅ Credenciais de {treinador_selecionado.get('nome')} alteradas com sucesso!")
+                                            st.info(f"🔑 **Novo Login:** {novo_login_treinador}")
+                                            st.info("✅ Nova senha definida e criptografada")
+                                            st.balloons()
+                                            st.rerun()
+                                        else:
+                                            st.error("❌ Erro ao salvar alterações no sistema")
+                                    else:
+                                        st.error("❌ Treinador não encontrado para atualização")
+                                else:
+                                    st.error("❌ As senhas não coincidem!")
+                            else:
+                                st.error("❌ Preencha todos os campos!")
+            else:
+                st.info("📝 Nenhum treinador cadastrado")
+        
+        with col2:
+            st.write("### ⚽ Credenciais de Jogadores")
+            jogadores = dados.get('jogadores', [])
+            if jogadores:
+                jogador_nomes = {f"{j.get('nome', 'Sem nome')} - Nº{j.get('numero', 'S/N')}": j for j in jogadores}
+                jogador_selecionado_nome = st.selectbox("Selecione o jogador:", list(jogador_nomes.keys()), key="sel_jogador_cred")
+                jogador_selecionado = jogador_nomes[jogador_selecionado_nome]
+                
+                if jogador_selecionado:
+                    st.write(f"**Alterando credenciais de:** {jogador_selecionado.get('nome')}")
+                    
+                    with st.form("alterar_credenciais_jogador"):
+                        novo_login_jogador = st.text_input("Novo Login/Usuário:", 
+                                                         value=jogador_selecionado.get('login', ''),
+                                                         placeholder="novo_usuario")
+                        nova_senha_jogador = st.text_input("Nova Senha:", 
+                                                         type="password", 
+                                                         placeholder="Nova senha segura")
+                        confirmar_senha_jogador = st.text_input("Confirmar Nova Senha:", 
+                                                               type="password", 
+                                                               placeholder="Repita a nova senha")
+                        
+                        if st.form_submit_button("🔄 Alterar Credenciais do Jogador", type="primary"):
+                            if novo_login_jogador and nova_senha_jogador:
+                                if nova_senha_jogador == confirmar_senha_jogador:
+                                    # Atualizar credenciais do jogador
+                                    dados_atualizados = False
+                                    for i, j in enumerate(dados['jogadores']):
+                                        if j.get('id') == jogador_selecionado.get('id'):
+                                            dados['jogadores'][i]['login'] = novo_login_jogador
+                                            dados['jogadores'][i]['senha'] = bcrypt.hashpw(nova_senha_jogador.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                                            # Remover senha_hash antigo se existir para evitar conflitos
+                                            if 'senha_hash' in dados['jogadores'][i]:
+                                                del dados['jogadores'][i]['senha_hash']
+                                            dados_atualizados = True
+                                            break
+                                    
+                                    if dados_atualizados:
+                                        if salvar_dados(dados):
+                                            st.success(f"✅ Credenciais de {jogador_selecionado.get('nome')} alteradas com sucesso!")
+                                            st.info(f"🔑 **Novo Login:** {novo_login_jogador}")
+                                            st.info("✅ Nova senha definida e criptografada")
+                                            st.balloons()
+                                            st.rerun()
+                                        else:
+                                            st.error("❌ Erro ao salvar alterações no sistema")
+                                    else:
+                                        st.error("❌ Jogador não encontrado para atualização")
+                                else:
+                                    st.error("❌ As senhas não coincidem!")
+                            else:
+                                st.error("❌ Preencha todos os campos!")
+            else:
+                st.info("📝 Nenhum jogador cadastrado")
+    
+    with tab4:
+        # Verificar se é admin para permitir gerir permissões
+        if st.session_state.get('usuario_logado') != 'admin':
+            st.warning("🔒 **Apenas Admin** - Você não tem permissão para gerir permissões.")
+            st.info("Entre em contato com o administrador do sistema.")
+            return
+        
+        st.subheader("🔧 Gestão de Permissões")
+        st.write("Configure permissões detalhadas para treinadores.")
+        
+        treinadores = dados.get('treinadores', [])
+        if treinadores:
+            treinador_nomes = {f"{t.get('nome', 'Sem nome')} - {t.get('funcao', 'N/A')}": t for t in treinadores}
+            treinador_selecionado_nome = st.selectbox("Selecione o treinador:", list(treinador_nomes.keys()), key="sel_treinador_perm")
+            treinador_selecionado = treinador_nomes[treinador_selecionado_nome]
+            
+            if treinador_selecionado:
+                st.write(f"**Configurando permissões de:** {treinador_selecionado.get('nome')}")
+                
+                with st.form("alterar_permissoes"):
+                    # Permissões atuais
+                    permissoes_atuais = treinador_selecionado.get('permissoes', {})
+                    
+                    st.write("#### 🎯 Permissões Específicas:")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        pode_editar_jogadores = st.checkbox(
+                            "✏️ Editar Jogadores", 
+                            value=permissoes_atuais.get('editar_jogadores', True),
+                            help="Permite adicionar, editar e remover jogadores"
+                        )
+                        
+                        pode_editar_jogos = st.checkbox(
+                            "⚽ Editar Jogos", 
+                            value=permissoes_atuais.get('editar_jogos', True),
+                            help="Permite criar, editar e remover jogos"
+                        )
+                        
+                        pode_editar_treinos = st.checkbox(
+                            "🏃 Editar Treinos", 
+                            value=permissoes_atuais.get('editar_treinos', True),
+                            help="Permite criar, editar e remover treinos"
+                        )
+                        
+                    with col2:
+                        pode_gestao_financeira = st.checkbox(
+                            "💰 Gestão Financeira", 
+                            value=permissoes_atuais.get('gestao_financeira', False),
+                            help="Permite ver informações financeiras"
+                        )
+                        
+                        pode_gestao_treinadores = st.checkbox(
+                            "👨‍🏫 Gestão de Treinadores", 
+                            value=permissoes_atuais.get('gestao_treinadores', False),
+                            help="Permite gerir outros treinadores"
+                        )
+                        
+                        pode_backup_restore = st.checkbox(
+                            "💾 Backup e Restore", 
+                            value=permissoes_atuais.get('backup_restore', False),
+                            help="Permite criar e restaurar backups"
+                        )
+                    
+                    # Nível de acesso geral
+                    nivel_acesso_atual = treinador_selecionado.get('nivel_acesso', '🔓 Acesso Total')
+                    novo_nivel_acesso = st.selectbox("🔐 Nível de Acesso Geral:", [
+                        "🔓 Acesso Total",
+                        "👁️ Apenas Visualização"
+                    ], index=0 if nivel_acesso_atual == '🔓 Acesso Total' else 1,
+                    help="Define o nível geral de acesso - sobrepõe permissões específicas se for 'Apenas Visualização'")
+                    
+                    if st.form_submit_button("💾 Salvar Permissões", type="primary"):
+                        # Criar objeto de permissões
+                        novas_permissoes = {
+                            'editar_jogadores': pode_editar_jogadores and novo_nivel_acesso == '🔓 Acesso Total',
+                            'editar_jogos': pode_editar_jogos and novo_nivel_acesso == '🔓 Acesso Total',
+                            'editar_treinos': pode_editar_treinos and novo_nivel_acesso == '🔓 Acesso Total',
+                            'gestao_financeira': pode_gestao_financeira and novo_nivel_acesso == '🔓 Acesso Total',
+                            'gestao_treinadores': pode_gestao_treinadores and novo_nivel_acesso == '🔓 Acesso Total',
+                            'backup_restore': pode_backup_restore and novo_nivel_acesso == '🔓 Acesso Total'
+                        }
+                        
+                        # Atualizar permissões do treinador
+                        for i, t in enumerate(dados['treinadores']):
+                            if t.get('id') == treinador_selecionado.get('id'):
+                                dados['treinadores'][i]['permissoes'] = novas_permissoes
+                                dados['treinadores'][i]['nivel_acesso'] = novo_nivel_acesso
+                                dados['treinadores'][i]['pode_editar'] = novo_nivel_acesso == '🔓 Acesso Total'
+                                break
+                        
+                        if salvar_dados(dados):
+                            st.success(f"✅ Permissões de {treinador_selecionado.get('nome')} atualizadas!")
+                            
+                            # Mostrar resumo das permissões
+                            permissoes_ativas = [nome for nome, ativo in novas_permissoes.items() if ativo]
+                            if permissoes_ativas:
+                                st.info("🎯 **Permissões Ativas:** " + ", ".join([
+                                    "✏️ Jogadores" if "editar_jogadores" in permissoes_ativas else "",
+                                    "⚽ Jogos" if "editar_jogos" in permissoes_ativas else "",
+                                    "🏃 Treinos" if "editar_treinos" in permissoes_ativas else "",
+                                    "💰 Financeiro" if "gestao_financeira" in permissoes_ativas else "",
+                                    "👨‍🏫 Treinadores" if "gestao_treinadores" in permissoes_ativas else "",
+                                    "💾 Backup" if "backup_restore" in permissoes_ativas else ""
+                                ]).replace(", ,", ",").strip(", "))
+                            else:
+                                if novo_nivel_acesso == '👁️ Apenas Visualização':
+                                    st.warning("👁️ **Apenas Visualização** - Sem permissões de edição")
+                                else:
+                                    st.warning("⚠️ **Nenhuma permissão específica ativa**")
+                            
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao salvar permissões")
+        else:
+            st.info("📝 Nenhum treinador cadastrado")
+
+def mostrar_submenu_gestao():
+    """Submenu reorganizado para Gestão"""
+    st.markdown("### ⚙️ Gestão")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("👨‍🏫 Treinadores", use_container_width=True, help="Gerir equipa de treinadores"):
+            st.session_state.pagina_atual = "treinadores"
+            st.rerun()
+        
+        if st.button("📧 Email/Notificações", use_container_width=True, help="Sistema de emails"):
+            st.session_state.pagina_atual = "email"
+            st.rerun()
+    
+    with col2:
+        if st.button("💬 Mensagens", use_container_width=True, help="Mensagens privadas"):
+            st.session_state.pagina_atual = "mensagens_treinador"
+            st.rerun()
+        
+        if st.button("⚙️ Configurações", use_container_width=True, help="Configurações do sistema"):
+            st.session_state.pagina_atual = "config"
+            st.rerun()
+        
+        if st.button("🌐 Web Scraping", use_container_width=True, help="Configurar dados externos"):
+            st.session_state.pagina_atual = "web_scraping"
+            st.rerun()
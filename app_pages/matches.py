@@ -0,0 +1,3874 @@
+"""
+Páginas de Jogos e Competições
+Jogos, fichas de jogo, registo em tempo real, importação de fichas, campeonato e taça
+"""
+
+import streamlit as st
+import time
+from datetime import datetime, date
+from typing import Dict
+
+from app_core import (
+    pd, go, obter_render_cache, fragmento, versoes_colecoes, carregar_dados, salvar_dados, converter_hora_jogo,
+    PREFIXO_TEMPO_REAL
+)
+
+
+# === ESQUEMAS TÁTICOS ===
+def carregar_esquemas_taticos():
+    """Carrega os esquemas táticos dos dados"""
+    dados = carregar_dados()
+    return dados.get('esquemas_taticos', [])
+
+def gestao_taca():
+    """Gestão da Taça - Mini-campeonato com 3 equipas (todos vs todos, uma volta)"""
+    # Versão corrigida - Mini-campeonato formato
+    import datetime as dt
+    dados = carregar_dados()
+    
+    st.title("🏅 Gestão da Taça")
+    
+    # Verificar se é formato antigo e converter PRIMEIRO
+    if 'taca' in dados and 'eliminatorias' in dados['taca']:
+        st.info("🔄 Convertendo Taça para novo formato (mini-campeonato)...")
+        taca_antiga = dados['taca']
+        # Converter para novo formato
+        dados['taca'] = {
+            'info_taca': {
+                'nome': taca_antiga.get('info_taca', {}).get('nome', 'Taça Regional 2025/2026'),
+                'temporada': taca_antiga.get('info_taca', {}).get('temporada', '2025/2026'),
+                'criado_em': taca_antiga.get('info_taca', {}).get('criado_em', dt.datetime.now().strftime('%Y-%m-%d')),
+                'tipo': 'grupo_unica_volta'
+            },
+            'equipas': [
+                {
+                    'id': 1,
+                    'nome': 'Águas Boas',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                },
+                {
+                    'id': 2,
+                    'nome': 'Pinheirense',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                },
+                {
+                    'id': 3,
+                    'nome': 'F.I.D.E.C.',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                }
+            ],
+            'jogos': [
+                # 3 jogos total (todos vs todos, uma volta)
+                {
+                    'id': 1,
+                    'casa': 'Águas Boas',
+                    'fora': 'Pinheirense',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                },
+                {
+                    'id': 2,
+                    'casa': 'Águas Boas', 
+                    'fora': 'F.I.D.E.C.',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                },
+                {
+                    'id': 3,
+                    'casa': 'Pinheirense',
+                    'fora': 'F.I.D.E.C.',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                }
+            ],
+            'vencedor': None
+        }
+        salvar_dados(dados)
+        st.success("✅ Taça convertida para formato de mini-campeonato!")
+        st.rerun()
+    
+    # Inicializar estrutura se não existir
+    if 'taca' not in dados:
+        dados['taca'] = {
+            'info_taca': {
+                'nome': 'Taça Regional 2025/2026',
+                'temporada': '2025/2026',
+                'criado_em': dt.datetime.now().strftime('%Y-%m-%d'),
+                'tipo': 'grupo_unica_volta'  # Todos vs todos, uma volta
+            },
+            'equipas': [
+                {
+                    'id': 1,
+                    'nome': 'Águas Boas',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                },
+                {
+                    'id': 2,
+                    'nome': 'Pinheirense',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                },
+                {
+                    'id': 3,
+                    'nome': 'F.I.D.E.C.',
+                    'jogos': 0,
+                    'vitorias': 0,
+                    'empates': 0,
+                    'derrotas': 0,
+                    'golos_marcados': 0,
+                    'golos_sofridos': 0,
+                    'diferenca_golos': 0,
+                    'pontos': 0
+                }
+            ],
+            'jogos': [
+                # 3 jogos total (todos vs todos, uma volta)
+                {
+                    'id': 1,
+                    'casa': 'Águas Boas',
+                    'fora': 'Pinheirense',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                },
+                {
+                    'id': 2,
+                    'casa': 'Águas Boas', 
+                    'fora': 'F.I.D.E.C.',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                },
+                {
+                    'id': 3,
+                    'casa': 'Pinheirense',
+                    'fora': 'F.I.D.E.C.',
+                    'data': None,
+                    'resultado_casa': None,
+                    'resultado_fora': None,
+                    'finalizado': False
+                }
+            ],
+            'vencedor': None
+        }
+        salvar_dados(dados)
+    
+    # Obter estrutura atual da taça
+    taca = dados['taca']
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["🏆 Classificação", "📅 Jogos da Taça", "⚽ Adicionar Resultado", "⚙️ Configurações"])
+    
+    with tab1:
+        st.subheader("🏆 Classificação da Taça")
+        st.info("🎯 Mini-campeonato: 3 equipas jogam entre si (uma volta)")
+        
+        # Calcular e mostrar tabela classificativa
+        equipas = taca.get('equipas', [])
+        
+        # Ordenar por pontos, diferença de golos, golos marcados
+        equipas_ordenadas = sorted(equipas, key=lambda x: (
+            -x['pontos'],  # Mais pontos primeiro
+            -x['diferenca_golos'],  # Melhor diferença de golos
+            -x['golos_marcados']  # Mais golos marcados
+        ))
+        
+        # Criar tabela de classificação
+        st.markdown("### 📊 Tabela Classificativa")
+        
+        for i, equipa in enumerate(equipas_ordenadas):
+            posicao = i + 1
+            if posicao == 1:
+                cor = "#FFD700"  # Ouro
+                icone = "🥇"
+            elif posicao == 2:
+                cor = "#C0C0C0"  # Prata
+                icone = "🥈"
+            else:
+                cor = "#CD7F32"  # Bronze
+                icone = "🥉"
+            
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(90deg, {cor}20, transparent);
+                padding: 15px;
+                border-radius: 10px;
+                margin: 5px 0;
+                border-left: 4px solid {cor};
+            ">
+                <h4>{icone} {posicao}º - {equipa['nome']}</h4>
+                <div style="display: flex; justify-content: space-between;">
+                    <span><strong>Pts:</strong> {equipa['pontos']}</span>
+                    <span><strong>J:</strong> {equipa['jogos']}</span>
+                    <span><strong>V:</strong> {equipa['vitorias']}</span>
+                    <span><strong>E:</strong> {equipa['empates']}</span>
+                    <span><strong>D:</strong> {equipa['derrotas']}</span>
+                    <span><strong>GM:</strong> {equipa['golos_marcados']}</span>
+                    <span><strong>GS:</strong> {equipa['golos_sofridos']}</span>
+                    <span><strong>DG:</strong> {equipa['diferenca_golos']:+d}</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Mostrar vencedor se todos os jogos estiverem completos
+        jogos = taca.get('jogos', [])
+        jogos_finalizados = sum(1 for jogo in jogos if jogo.get('finalizado', False))
+        total_jogos = len(jogos)
+        
+        if jogos_finalizados == total_jogos and total_jogos > 0:
+            vencedor = equipas_ordenadas[0]['nome']
+            st.markdown("---")
+            st.success(f"🏆 **VENCEDOR DA TAÇA: {vencedor}** 🏆")
+            if taca.get('vencedor') != vencedor:
+                taca['vencedor'] = vencedor
+                salvar_dados(dados)
+    
+    with tab2:
+        st.subheader("📅 Jogos da Taça")
+        
+        jogos = taca.get('jogos', [])
+        
+        if not jogos:
+            st.info("🎯 Nenhum jogo configurado ainda")
+        else:
+            st.markdown("### ⚽ Fixture da Taça")
+            st.info("💡 Para editar um resultado, vai à tab **⚽ Adicionar Resultado**")
+            
+            for i, jogo in enumerate(jogos):
+                # Container para cada jogo
+                with st.container():
+                    col1, col2, col3, col4, col5 = st.columns([3, 2, 3, 2, 1])
+                    
+                    with col1:
+                        st.write(f"**{jogo['casa']}**")
+                    with col2:
+                        if jogo.get('finalizado', False):
+                            resultado = f"**{jogo['resultado_casa']} - {jogo['resultado_fora']}**"
+                            # Destacar o vencedor
+                            if jogo['resultado_casa'] > jogo['resultado_fora']:
+                                st.markdown(f"🟢 {resultado}")
+                            elif jogo['resultado_casa'] < jogo['resultado_fora']:
+                                st.markdown(f"🔴 {resultado}")
+                            else:
+                                st.markdown(f"🟡 {resultado}")
+                        else:
+                            st.write("**vs**")
+                    with col3:
+                        st.write(f"**{jogo['fora']}**")
+                    with col4:
+                        if jogo.get('finalizado', False):
+                            st.write("✅ Finalizado")
+                        else:
+                            st.write("⏳ Pendente")
+                    with col5:
+                        if jogo.get('finalizado', False):
+                            st.caption("✏️ Editável")
+                    
+                    if jogo.get('data'):
+                        st.caption(f"📅 {jogo['data']}")
+                    
+                    st.markdown("---")
+    
+    with tab3:
+        st.subheader("⚽ Adicionar/Editar Resultados")
+        
+        jogos = taca.get('jogos', [])
+        if not jogos:
+            st.info("🎯 Nenhum jogo disponível")
+        else:
+            # Informação sobre edição
+            st.info("💡 **Dica**: Podes adicionar novos resultados ou editar resultados já existentes!")
+            
+            # Seleção de jogo
+            jogo_opcoes = []
+            for i, jogo in enumerate(jogos):
+                if jogo.get('finalizado', False):
+                    resultado = f"{jogo.get('resultado_casa', 0)} - {jogo.get('resultado_fora', 0)}"
+                    status = f"✅ Finalizado ({resultado})"
+                else:
+                    status = "⏳ Pendente"
+                jogo_opcoes.append(f"{jogo['casa']} vs {jogo['fora']} - {status}")
+            
+            jogo_selecionado_idx = st.selectbox(
+                "Selecione o jogo para adicionar/editar resultado:",
+                range(len(jogo_opcoes)),
+                format_func=lambda x: jogo_opcoes[x]
+            )
+            
+            jogo_sel = jogos[jogo_selecionado_idx]
+            
+            # Mostrar se é edição ou novo resultado
+            if jogo_sel.get('finalizado', False):
+                st.warning(f"🔄 **Modo Edição**: A editar resultado existente ({jogo_sel.get('resultado_casa', 0)} - {jogo_sel.get('resultado_fora', 0)})")
+            else:
+                st.info("➕ **Modo Adição**: A adicionar novo resultado")
+            
+            col1, col2, col3 = st.columns([2, 1, 2])
+            
+            with col1:
+                st.write(f"**{jogo_sel['casa']}**")
+                golos_casa = st.number_input(
+                    "Golos casa:", 
+                    min_value=0, 
+                    max_value=20, 
+                    value=jogo_sel.get('resultado_casa', 0) if jogo_sel.get('resultado_casa') is not None else 0,
+                    help="Introduz o número de golos marcados pela equipa da casa"
+                )
+            
+            with col2:
+                st.write("**VS**")
+            
+            with col3:
+                st.write(f"**{jogo_sel['fora']}**")
+                golos_fora = st.number_input(
+                    "Golos fora:", 
+                    min_value=0, 
+                    max_value=20, 
+                    value=jogo_sel.get('resultado_fora', 0) if jogo_sel.get('resultado_fora') is not None else 0,
+                    help="Introduz o número de golos marcados pela equipa visitante"
+                )
+            
+            # Data do jogo
+            data_jogo = st.date_input(
+                "Data do jogo:",
+                value=datetime.strptime(jogo_sel['data'], '%Y-%m-%d').date() if jogo_sel.get('data') else date.today(),
+                help="Seleciona a data em que o jogo foi realizado"
+            )
+            
+            # Botão com texto dinâmico
+            botao_texto = "🔄 Atualizar Resultado" if jogo_sel.get('finalizado', False) else "💾 Salvar Resultado"
+            
+            if st.button(botao_texto, type="primary"):
+                # Verificar se houve mudança nos valores
+                resultado_mudou = (
+                    jogo_sel.get('resultado_casa') != golos_casa or 
+                    jogo_sel.get('resultado_fora') != golos_fora or
+                    jogo_sel.get('data') != data_jogo.strftime('%Y-%m-%d')
+                )
+                
+                if jogo_sel.get('finalizado', False) and not resultado_mudou:
+                    st.warning("⚠️ Nenhuma alteração detectada!")
+                else:
+                    # Guardar valores antigos para referência
+                    if jogo_sel.get('finalizado', False):
+                        jogo_sel['old_resultado_casa'] = jogo_sel.get('resultado_casa', 0)
+                        jogo_sel['old_resultado_fora'] = jogo_sel.get('resultado_fora', 0)
+                    
+                    # Atualizar resultado
+                    jogo_sel['resultado_casa'] = golos_casa
+                    jogo_sel['resultado_fora'] = golos_fora
+                    jogo_sel['data'] = data_jogo.strftime('%Y-%m-%d')
+                    jogo_sel['finalizado'] = True
+                    
+                    # Atualizar estatísticas das equipas
+                    for equipa in taca['equipas']:
+                        if equipa['nome'] == jogo_sel['casa']:
+                            # Remover estatísticas antigas se jogo já estava finalizado
+                            if 'old_resultado_casa' in jogo_sel:
+                                equipa['jogos'] -= 1
+                                equipa['golos_marcados'] -= jogo_sel['old_resultado_casa']
+                                equipa['golos_sofridos'] -= jogo_sel['old_resultado_fora']
+                                old_casa = jogo_sel['old_resultado_casa']
+                                old_fora = jogo_sel['old_resultado_fora']
+                                if old_casa > old_fora:
+                                    equipa['vitorias'] -= 1
+                                    equipa['pontos'] -= 3
+                                elif old_casa < old_fora:
+                                    equipa['derrotas'] -= 1
+                                else:
+                                    equipa['empates'] -= 1
+                                    equipa['pontos'] -= 1
+                            
+                            # Adicionar novas estatísticas
+                            equipa['jogos'] += 1
+                            equipa['golos_marcados'] += golos_casa
+                            equipa['golos_sofridos'] += golos_fora
+                            if golos_casa > golos_fora:
+                                equipa['vitorias'] += 1
+                                equipa['pontos'] += 3
+                            elif golos_casa < golos_fora:
+                                equipa['derrotas'] += 1
+                            else:
+                                equipa['empates'] += 1
+                                equipa['pontos'] += 1
+                            equipa['diferenca_golos'] = equipa['golos_marcados'] - equipa['golos_sofridos']
+                        
+                        elif equipa['nome'] == jogo_sel['fora']:
+                            # Remover estatísticas antigas se jogo já estava finalizado
+                            if 'old_resultado_casa' in jogo_sel:
+                                equipa['jogos'] -= 1
+                                equipa['golos_marcados'] -= jogo_sel['old_resultado_fora']
+                                equipa['golos_sofridos'] -= jogo_sel['old_resultado_casa']
+                                old_casa = jogo_sel['old_resultado_casa']
+                                old_fora = jogo_sel['old_resultado_fora']
+                                if old_fora > old_casa:
+                                    equipa['vitorias'] -= 1
+                                    equipa['pontos'] -= 3
+                                elif old_fora < old_casa:
+                                    equipa['derrotas'] -= 1
+                                else:
+                                    equipa['empates'] -= 1
+                                    equipa['pontos'] -= 1
+                            
+                            # Adicionar novas estatísticas
+                            equipa['jogos'] += 1
+                            equipa['golos_marcados'] += golos_fora
+                            equipa['golos_sofridos'] += golos_casa
+                            if golos_fora > golos_casa:
+                                equipa['vitorias'] += 1
+                                equipa['pontos'] += 3
+                            elif golos_fora < golos_casa:
+                                equipa['derrotas'] += 1
+                            else:
+                                equipa['empates'] += 1
+                                equipa['pontos'] += 1
+                            equipa['diferenca_golos'] = equipa['golos_marcados'] - equipa['golos_sofridos']
+                    
+                    # Mensagem de sucesso personalizada
+                    if 'old_resultado_casa' in jogo_sel and jogo_sel['old_resultado_casa'] is not None:
+                        old_resultado = f"{jogo_sel['old_resultado_casa']} - {jogo_sel['old_resultado_fora']}"
+                        novo_resultado = f"{golos_casa} - {golos_fora}"
+                        st.success(f"✅ Resultado atualizado! {old_resultado} → {novo_resultado}")
+                    else:
+                        st.success(f"✅ Resultado adicionado: {golos_casa} - {golos_fora}")
+                    
+                    salvar_dados(dados)
+                    st.rerun()
+    
+    with tab4:
+        st.subheader("⚙️ Configurações da Taça")
+        
+        # Informações da taça
+        info_taca = taca.get('info_taca', {})
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            nome_taca = st.text_input("Nome da Taça:", value=info_taca.get('nome', 'Taça Regional 2025/2026'))
+            temporada = st.text_input("Temporada:", value=info_taca.get('temporada', '2025/2026'))
+        
+        with col2:
+            st.markdown("### 📊 Estatísticas")
+            jogos_total = len(taca.get('jogos', []))
+            jogos_finalizados = sum(1 for jogo in taca.get('jogos', []) if jogo.get('finalizado', False))
+            st.metric("Total de Jogos", jogos_total)
+            st.metric("Jogos Finalizados", f"{jogos_finalizados}/{jogos_total}")
+        
+        if st.button("💾 Guardar Configurações"):
+            info_taca['nome'] = nome_taca
+            info_taca['temporada'] = temporada
+            taca['info_taca'] = info_taca
+            salvar_dados(dados)
+            st.success("✅ Configurações guardadas!")
+        
+        st.markdown("---")
+        
+        # Reset da taça
+        st.markdown("### 🔄 Reset da Taça")
+        st.warning("⚠️ Esta ação irá apagar todos os resultados e reiniciar a taça!")
+        
+        if st.button("🗑️ Reset Completo", type="secondary"):
+            if st.session_state.get('confirmar_reset_taca', False):
+                # Reset completo
+                dados['taca'] = {
+                    'info_taca': {
+                        'nome': nome_taca,
+                        'temporada': temporada,
+                        'criado_em': dt.datetime.now().strftime('%Y-%m-%d'),
+                        'tipo': 'grupo_unica_volta'
+                    },
+                    'equipas': [
+                        {
+                            'id': 1,
+                            'nome': 'Águas Boas',
+                            'jogos': 0,
+                            'vitorias': 0,
+                            'empates': 0,
+                            'derrotas': 0,
+                            'golos_marcados': 0,
+                            'golos_sofridos': 0,
+                            'diferenca_golos': 0,
+                            'pontos': 0
+                        },
+                        {
+                            'id': 2,
+                            'nome': 'Pinheirense',
+                            'jogos': 0,
+                            'vitorias': 0,
+                            'empates': 0,
+                            'derrotas': 0,
+                            'golos_marcados': 0,
+                            'golos_sofridos': 0,
+                            'diferenca_golos': 0,
+                            'pontos': 0
+                        },
+                        {
+                            'id': 3,
+                            'nome': 'F.I.D.E.C.',
+                            'jogos': 0,
+                            'vitorias': 0,
+                            'empates': 0,
+                            'derrotas': 0,
+                            'golos_marcados': 0,
+                            'golos_sofridos': 0,
+                            'diferenca_golos': 0,
+                            'pontos': 0
+                        }
+                    ],
+                    'jogos': [
+                        {
+                            'id': 1,
+                            'casa': 'Águas Boas',
+                            'fora': 'Pinheirense',
+                            'data': None,
+                            'resultado_casa': None,
+                            'resultado_fora': None,
+                            'finalizado': False
+                        },
+                        {
+                            'id': 2,
+                            'casa': 'Águas Boas', 
+                            'fora': 'F.I.D.E.C.',
+                            'data': None,
+                            'resultado_casa': None,
+                            'resultado_fora': None,
+                            'finalizado': False
+                        },
+                        {
+                            'id': 3,
+                            'casa': 'Pinheirense',
+                            'fora': 'F.I.D.E.C.',
+                            'data': None,
+                            'resultado_casa': None,
+                            'resultado_fora': None,
+                            'finalizado': False
+                        }
+                    ],
+                    'vencedor': None
+                }
+                salvar_dados(dados)
+                st.success("✅ Taça reiniciada com sucesso!")
+                del st.session_state['confirmar_reset_taca']
+                st.rerun()
+            else:
+                st.session_state['confirmar_reset_taca'] = True
+                st.info("👆 Clique novamente para confirmar o reset")
+
+def _tabela_classificativa_campeonato(equipas):
+    """Equipas ordenadas e dataframe da tabela classificativa"""
+    # Ordenar por pontos, depois por diferença de golos, depois por golos marcados
+    equipas_ordenadas = sorted(equipas, key=lambda x: (-x['pontos'], -x['diferenca_golos'], -x['golos_marcados']))
+    
+    # Criar dataframe para exibir
+    df_data = []
+    for pos, equipa in enumerate(equipas_ordenadas, 1):
+        df_data.append({
+            'Pos': pos,
+            'Equipa': equipa['nome'],
+            'J': equipa['jogos'],
+            'V': equipa['vitorias'],
+            'E': equipa['empates'],
+            'D': equipa['derrotas'],
+            'GM': equipa['golos_marcados'],
+            'GS': equipa['golos_sofridos'],
+            'DG': f"{equipa['diferenca_golos']:+d}",
+            'Pts': equipa['pontos']
+        })
+    return equipas_ordenadas, pd.DataFrame(df_data)
+
+def gestao_campeonato():
+    """Gestão completa do campeonato com 12 equipas"""
+    import datetime as dt
+    dados = carregar_dados()
+    
+    st.title("🏆 Gestão de Campeonato")
+    
+    # Inicializar estrutura se não existir
+    if 'campeonato' not in dados:
+        dados['campeonato'] = {
+            'info_campeonato': {
+                'nome': 'Campeonato Local 2025/2026',
+                'temporada': '2025/2026',
+                'criado_em': '2025-09-16'
+            },
+            'equipas': [],
+            'jornadas': [],
+            'classificacao': {},
+            'jogos': []
+        }
+    
+    campeonato = dados['campeonato']
+    
+    # Se não há equipas, inicializar com as 12 equipas fornecidas
+    if not campeonato.get('equipas'):
+        equipas_iniciais = [
+            'A.C. Cucujães "Sub/23"', 'Ad Requeixo', 'Ad Santiais',
+            'Arc S. Vicente Pereira "Sub/23"', 'Ccr Válega', 'Crc Rocas Vouga',
+            'F. I. D. E. C.', 'Fc Bom Sucesso "Sub/23"', 'Fc Pinheirense',
+            'Gd Beira-Vouga', 'Gd Gafanha', 'N.E.G.E'
+        ]
+        
+        campeonato['equipas'] = []
+        for i, nome in enumerate(equipas_iniciais, 1):
+            campeonato['equipas'].append({
+                'id': i,
+                'nome': nome,
+                'jogos': 0,
+                'vitorias': 0,
+                'empates': 0,
+                'derrotas': 0,
+                'golos_marcados': 0,
+                'golos_sofridos': 0,
+                'diferenca_golos': 0,
+                'pontos': 0
+            })
+        salvar_dados(dados)
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Classificação", "📅 Calendário/Resultados", "✏️ Editar Jornadas", "⚽ Adicionar Resultado", "🏆 Configurações"])
+    
+    with tab1:
+        st.subheader("📊 Tabela Classificativa")
+        
+        equipas = campeonato.get('equipas', [])
+        if equipas:
+            # Tabela reutilizada enquanto o campeonato não mudar
+            equipas_ordenadas, df = obter_render_cache().obter(
+                'tabela_campeonato',
+                lambda: _tabela_classificativa_campeonato(equipas),
+                versoes=versoes_colecoes('campeonato')
+            )
+            
+            if not df.empty:
+                st.dataframe(df, use_container_width=True, hide_index=True)
+                
+                # Destacar posições especiais
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.success(f"🥇 **Líder:** {equipas_ordenadas[0]['nome']}")
+                with col2:
+                    if len(equipas_ordenadas) >= 3:
+                        st.info(f"🥉 **3º Lugar:** {equipas_ordenadas[2]['nome']}")
+                with col3:
+                    if len(equipas_ordenadas) >= 12:
+                        st.error(f"🔻 **Último:** {equipas_ordenadas[-1]['nome']}")
+        else:
+            st.warning("⚠️ Nenhuma equipa encontrada no campeonato.")
+    
+    with tab2:
+        st.subheader("📅 Calendário e Resultados")
+        
+        # Gerar calendário automático se não existir
+        if not campeonato.get('jornadas'):
+            if st.button("🔄 Gerar Calendário Completo (22 Jornadas)"):
+                jornadas = gerar_calendario_campeonato(equipas)
+                campeonato['jornadas'] = jornadas
+                salvar_dados(dados)
+                st.success("✅ Calendário gerado com sucesso!")
+                st.rerun()
+        else:
+            # Exibir jornadas existentes
+            jornadas = campeonato.get('jornadas', [])
+            
+            # Seletor de jornada
+            if jornadas:
+                # Criar lista de jornadas com seus números reais
+                opcoes_jornadas = [(i, j.get('numero', i+1)) for i, j in enumerate(jornadas)]
+                
+                indice_selecionado = st.selectbox(
+                    "Selecione a Jornada:",
+                    range(len(jornadas)),
+                    format_func=lambda x: f"Jornada {opcoes_jornadas[x][1]}"
+                )
+                
+                if indice_selecionado is not None:
+                    jornada = jornadas[indice_selecionado]
+                    numero_jornada = jornada.get('numero', indice_selecionado + 1)
+                    st.subheader(f"🏆 Jornada {numero_jornada}")
+                    
+                    for i, jogo in enumerate(jornada.get('jogos', [])):
+                        # Criar ID único para cada jogo do campeonato
+                        jogo_id = f"campeonato_j{numero_jornada}_g{i}"
+                        
+                        col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+                        
+                        with col1:
+                            st.write(f"**{jogo['casa']}**")
+                        with col2:
+                            if jogo.get('resultado_casa') is not None:
+                                st.write(f"**{jogo['resultado_casa']} - {jogo['resultado_fora']}**")
+                            else:
+                                st.write("**vs**")
+                        with col3:
+                            st.write(f"**{jogo['fora']}**")
+                        with col4:
+                            # Botão de ficha disponível sempre (com ou sem resultado)
+                            if st.button(f"📋", key=f"ficha_campeonato_{jogo_id}", help="Ver/Preencher Ficha de Jogo"):
+                                st.session_state[f"mostrar_ficha_campeonato_{jogo_id}"] = True
+                                st.rerun()
+                        
+                        if jogo.get('data'):
+                            st.caption(f"📅 {jogo['data']}")
+                        
+                        # Mostrar ficha de jogo se solicitada
+                        if st.session_state.get(f"mostrar_ficha_campeonato_{jogo_id}", False):
+                            st.write("---")
+                            with st.expander("📋 Ficha de Jogo", expanded=True):
+                                # Calcular um índice único para o jogo no contexto global
+                                jogo_index = (numero_jornada - 1) * 6 + i  # Assumindo 6 jogos por jornada
+                                mostrar_ficha_jogo(jogo, jogo_index, dados)
+                                
+                                if st.button(f"❌ Fechar Ficha", key=f"close_ficha_campeonato_{jogo_id}"):
+                                    del st.session_state[f"mostrar_ficha_campeonato_{jogo_id}"]
+                                    st.rerun()
+                        
+                        st.divider()
+    
+    with tab3:
+        st.subheader("✏️ Editar Jornadas")
+        st.info("🎯 Aqui pode editar os confrontos para corresponder ao sorteio real do campeonato.")
+        
+        jornadas = campeonato.get('jornadas', [])
+        if jornadas:
+            # Seletor de jornada para editar
+            opcoes_jornadas_editar = [(i, j.get('numero', i+1)) for i, j in enumerate(jornadas)]
+            
+            indice_jornada_editar = st.selectbox(
+                "Selecione a Jornada para Editar:",
+                range(len(jornadas)),
+                format_func=lambda x: f"Jornada {opcoes_jornadas_editar[x][1]}",
+                key="jornada_editar"
+            )
+            
+            if indice_jornada_editar is not None:
+                jornada = jornadas[indice_jornada_editar]
+                numero_jornada_editar = jornada.get('numero', indice_jornada_editar + 1)
+                st.subheader(f"✏️ Editando Jornada {numero_jornada_editar}")
+                jogos = jornada.get('jogos', [])
+                
+                # Data da jornada
+                col_data1, col_data2 = st.columns([1, 2])
+                with col_data1:
+                    nova_data = st.date_input(
+                        "📅 Data da Jornada:",
+                        value=dt.datetime.strptime(jornada.get('data', '2025-09-21'), '%Y-%m-%d').date(),
+                        key=f"data_jornada_{numero_jornada_editar}"
+                    )
+                
+                st.divider()
+                
+                # Lista de equipas disponíveis
+                equipas_nomes = [eq['nome'] for eq in campeonato.get('equipas', [])]
+                
+                # Formulário para editar cada jogo
+                with st.form(f"editar_jornada_{numero_jornada_editar}"):
+                    st.markdown("**⚽ Editar Confrontos:**")
+                    
+                    novos_jogos = []
+                    for i, jogo in enumerate(jogos):
+                        st.markdown(f"**Jogo {i+1}:**")
+                        col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+                        
+                        with col1:
+                            casa = st.selectbox(
+                                "Equipa da Casa:",
+                                equipas_nomes,
+                                index=equipas_nomes.index(jogo['casa']) if jogo['casa'] in equipas_nomes else 0,
+                                key=f"casa_{numero_jornada_editar}_{i}"
+                            )
+                        
+                        with col2:
+                            st.markdown("<br>", unsafe_allow_html=True)
+                            st.markdown("**vs**", unsafe_allow_html=True)
+                        
+                        with col3:
+                            # Filtrar equipas para não permitir jogo consigo própria
+                            # Mas sempre incluir todas as equipas exceto a da casa
+                            equipas_fora = [eq for eq in equipas_nomes if eq != casa]
+                            
+                            # Garantir que a equipa fora original está na lista (se diferente da casa)
+                            if jogo['fora'] not in equipas_fora and jogo['fora'] != casa:
+                                equipas_fora.append(jogo['fora'])
+                            
+                            fora_index = equipas_fora.index(jogo['fora']) if jogo['fora'] in equipas_fora else 0
+                            
+                            fora = st.selectbox(
+                                "Equipa Visitante:",
+                                equipas_fora,
+                                index=fora_index,
+                                key=f"fora_{numero_jornada_editar}_{i}"
+                            )
+                        
+                        with col4:
+                            # Mostrar se já tem resultado
+                            if jogo.get('resultado_casa') is not None:
+                                st.markdown("<br>", unsafe_allow_html=True)
+                                st.caption(f"📊 {jogo['resultado_casa']}-{jogo['resultado_fora']}")
+                            else:
+                                st.markdown("<br>", unsafe_allow_html=True)
+                                st.caption("⏳ Sem resultado")
+                        
+                        # Preservar resultado se existir
+                        novo_jogo = {
+                            'casa': casa,
+                            'fora': fora,
+                            'data': nova_data.strftime('%Y-%m-%d'),
+                            'resultado_casa': jogo.get('resultado_casa'),
+                            'resultado_fora': jogo.get('resultado_fora')
+                        }
+                        novos_jogos.append(novo_jogo)
+                        
+                        st.divider()
+                    
+                    # Validação e botões
+                    col_btn1, col_btn2 = st.columns([1, 1])
+                    
+                    with col_btn1:
+                        if st.form_submit_button("💾 Salvar Alterações", type="primary"):
+                            # Validar se há confrontos duplicados
+                            confrontos = set()
+                            erro_validacao = False
+                            
+                            for jogo in novos_jogos:
+                                confronto = tuple(sorted([jogo['casa'], jogo['fora']]))
+                                if confronto in confrontos:
+                                    st.error(f"❌ Erro: Confronto duplicado entre {jogo['casa']} e {jogo['fora']}")
+                                    erro_validacao = True
+                                confrontos.add(confronto)
+                            
+                            # Verificar se todas as equipas jogam exatamente uma vez
+                            equipas_jogos = {}
+                            for jogo in novos_jogos:
+                                equipas_jogos[jogo['casa']] = equipas_jogos.get(jogo['casa'], 0) + 1
+                                equipas_jogos[jogo['fora']] = equipas_jogos.get(jogo['fora'], 0) + 1
+                            
+                            for equipa, count in equipas_jogos.items():
+                                if count > 1:
+                                    st.error(f"❌ Erro: {equipa} joga mais de uma vez nesta jornada")
+                                    erro_validacao = True
+                            
+                            if not erro_validacao:
+                                # Salvar alterações
+                                jornadas[indice_jornada_editar]['jogos'] = novos_jogos
+                                jornadas[indice_jornada_editar]['data'] = nova_data.strftime('%Y-%m-%d')
+                                
+                                salvar_dados(dados)
+                                st.success("✅ Jornada editada com sucesso!")
+                                st.rerun()
+                    
+                    with col_btn2:
+                        if st.form_submit_button("🔄 Restaurar Original", type="secondary"):
+                            st.warning("⚠️ Tem certeza? Isto irá restaurar os confrontos originais desta jornada.")
+                            if st.button("⚠️ CONFIRMAR RESTAURAÇÃO"):
+                                # Aqui poderia restaurar os confrontos originais
+                                # Por agora, apenas mostra aviso
+                                st.info("💡 Funcionalidade de restauração em desenvolvimento.")
+                
+                # Mostrar resumo da jornada
+                st.divider()
+                st.subheader("📋 Resumo da Jornada:")
+                
+                # Verificar se Fc Pinheirense joga nesta jornada
+                fc_pinheirense_jogo = None
+                for jogo in jogos:
+                    if 'Fc Pinheirense' in [jogo['casa'], jogo['fora']]:
+                        fc_pinheirense_jogo = jogo
+                        break
+                
+                if fc_pinheirense_jogo:
+                    if fc_pinheirense_jogo['casa'] == 'Fc Pinheirense':
+                        st.success(f"🏠 **Fc Pinheirense vs {fc_pinheirense_jogo['fora']}** (Em casa)")
+                    else:
+                        st.info(f"🚌 **{fc_pinheirense_jogo['casa']} vs Fc Pinheirense** (Fora)")
+                
+        else:
+            st.warning("⚠️ Primeiro gere o calendário do campeonato.")
+            if st.button("🔄 Gerar Calendário Automático"):
+                equipas = campeonato.get('equipas', [])
+                if equipas:
+                    jornadas = gerar_calendario_campeonato(equipas)
+                    campeonato['jornadas'] = jornadas
+                    salvar_dados(dados)
+                    st.success("✅ Calendário gerado!")
+                    st.rerun()
+    
+    with tab4:
+        st.subheader("⚽ Adicionar/Editar Resultado")
+        
+        jornadas = campeonato.get('jornadas', [])
+        if jornadas:
+            # Escolhe entre Adicionar ou Editar
+            modo_operacao = st.radio("Escolha a operação:", ["➕ Adicionar Resultado", "✏️ Editar Resultado"], horizontal=True)
+            
+            # Seletor de jornada
+            opcoes_jornadas_resultado = [(i, j.get('numero', i+1)) for i, j in enumerate(jornadas)]
+            
+            indice_jornada_resultado = st.selectbox(
+                "Jornada:",
+                range(len(jornadas)),
+                format_func=lambda x: f"Jornada {opcoes_jornadas_resultado[x][1]}",
+                key="jornada_resultado"
+            )
+            
+            if indice_jornada_resultado is not None:
+                jornada = jornadas[indice_jornada_resultado]
+                
+                if modo_operacao == "➕ Adicionar Resultado":
+                    # Mostrar apenas jogos SEM resultado
+                    jogos_sem_resultado = [j for j in jornada.get('jogos', []) if j.get('resultado_casa') is None]
+                    
+                    if jogos_sem_resultado:
+                        jogo_selecionado = st.selectbox(
+                            "Selecione o Jogo:",
+                            jogos_sem_resultado,
+                            format_func=lambda x: f"{x['casa']} vs {x['fora']}"
+                        )
+                        
+                        if jogo_selecionado:
+                            col1, col2 = st.columns(2)
+                            
+                            with col1:
+                                st.write(f"**{jogo_selecionado['casa']}**")
+                                golos_casa = st.number_input("Golos", min_value=0, key="golos_casa_add")
+                            
+                            with col2:
+                                st.write(f"**{jogo_selecionado['fora']}**")
+                                golos_fora = st.number_input("Golos", min_value=0, key="golos_fora_add")
+                            
+                            if st.button("💾 Salvar Resultado", key="btn_add_resultado"):
+                                # Atualizar resultado
+                                for i, jogo in enumerate(jornada['jogos']):
+                                    if jogo['casa'] == jogo_selecionado['casa'] and jogo['fora'] == jogo_selecionado['fora']:
+                                        jornada['jogos'][i]['resultado_casa'] = golos_casa
+                                        jornada['jogos'][i]['resultado_fora'] = golos_fora
+                                        break
+                                
+                                # Atualizar estatísticas das equipas
+                                atualizar_estatisticas_campeonato(campeonato, jogo_selecionado['casa'], jogo_selecionado['fora'], golos_casa, golos_fora)
+                                
+                                salvar_dados(dados)
+                                st.success("✅ Resultado adicionado com sucesso!")
+                                st.info("💡 **Dica:** Vá ao separador 'Calendário/Resultados' para preencher a ficha de jogo detalhada.")
+                                st.rerun()
+                    else:
+                        st.info("ℹ️ Todos os jogos desta jornada já têm resultado.")
+                
+                else:  # Editar Resultado
+                    # Mostrar apenas jogos COM resultado
+                    jogos_com_resultado = [j for j in jornada.get('jogos', []) if j.get('resultado_casa') is not None]
+                    
+                    if jogos_com_resultado:
+                        jogo_selecionado = st.selectbox(
+                            "Selecione o Jogo para Editar:",
+                            jogos_com_resultado,
+                            format_func=lambda x: f"{x['casa']} {x['resultado_casa']}-{x['resultado_fora']} {x['fora']}"
+                        )
+                        
+                        if jogo_selecionado:
+                            st.warning("⚠️ Você está corrigindo um resultado já existente. As estatísticas serão recalculadas automaticamente.")
+                            
+                            col1, col2 = st.columns(2)
+                            
+                            with col1:
+                                st.write(f"**{jogo_selecionado['casa']}**")
+                                golos_casa_novo = st.number_input(
+                                    "Golos (novo)",
+                                    min_value=0,
+                                    value=jogo_selecionado.get('resultado_casa', 0),
+                                    key="golos_casa_edit"
+                                )
+                            
+                            with col2:
+                                st.write(f"**{jogo_selecionado['fora']}**")
+                                golos_fora_novo = st.number_input(
+                                    "Golos (novo)",
+                                    min_value=0,
+                                    value=jogo_selecionado.get('resultado_fora', 0),
+                                    key="golos_fora_edit"
+                                )
+                            
+                            # Mostrar resultado anterior
+                            st.info(f"📊 Resultado anterior: {jogo_selecionado['casa']} {jogo_selecionado['resultado_casa']}-{jogo_selecionado['resultado_fora']} {jogo_selecionado['fora']}")
+                            
+                            if st.button("💾 Guardar Correção", key="btn_edit_resultado"):
+                                # Reverter estatísticas antigas
+                                reverter_estatisticas_campeonato(
+                                    campeonato,
+                                    jogo_selecionado['casa'],
+                                    jogo_selecionado['fora'],
+                                    jogo_selecionado['resultado_casa'],
+                                    jogo_selecionado['resultado_fora']
+                                )
+                                
+                                # Atualizar resultado no jogo
+                                for i, jogo in enumerate(jornada['jogos']):
+                                    if jogo['casa'] == jogo_selecionado['casa'] and jogo['fora'] == jogo_selecionado['fora']:
+                                        jornada['jogos'][i]['resultado_casa'] = golos_casa_novo
+                                        jornada['jogos'][i]['resultado_fora'] = golos_fora_novo
+                                        break
+                                
+                                # Aplicar novas estatísticas
+                                atualizar_estatisticas_campeonato(
+                                    campeonato,
+                                    jogo_selecionado['casa'],
+                                    jogo_selecionado['fora'],
+                                    golos_casa_novo,
+                                    golos_fora_novo
+                                )
+                                
+                                salvar_dados(dados)
+                                st.success("✅ Resultado corrigido com sucesso! Tabela de classificação atualizada.")
+                                st.rerun()
+                    else:
+                        st.info("ℹ️ Nenhum jogo com resultado nesta jornada para editar.")
+        else:
+            st.warning("⚠️ Primeiro gere o calendário do campeonato.")
+
+    
+    with tab5:
+        st.subheader("🏆 Configurações do Campeonato")
+        
+        info = campeonato.get('info_campeonato', {})
+        
+        with st.form("config_campeonato"):
+            nome_campeonato = st.text_input("Nome do Campeonato:", value=info.get('nome', ''))
+            temporada = st.text_input("Temporada:", value=info.get('temporada', ''))
+            
+            if st.form_submit_button("💾 Salvar Configurações"):
+                campeonato['info_campeonato'] = {
+                    'nome': nome_campeonato,
+                    'temporada': temporada,
+                    'criado_em': info.get('criado_em', '2025-09-16')
+                }
+                salvar_dados(dados)
+                st.success("✅ Configurações salvas!")
+                st.rerun()
+        
+        st.divider()
+        
+        # Reset do campeonato
+        if st.button("🔄 Reset Completo do Campeonato", type="secondary"):
+            if st.button("⚠️ CONFIRMAR RESET", type="secondary"):
+                # Resetar todas as estatísticas
+                for equipa in campeonato.get('equipas', []):
+                    equipa.update({
+                        'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0,
+                        'golos_marcados': 0, 'golos_sofridos': 0, 'diferenca_golos': 0, 'pontos': 0
+                    })
+                
+                # Limpar resultados
+                for jornada in campeonato.get('jornadas', []):
+                    for jogo in jornada.get('jogos', []):
+                        jogo.pop('resultado_casa', None)
+                        jogo.pop('resultado_fora', None)
+                
+                salvar_dados(dados)
+                st.success("✅ Campeonato resetado com sucesso!")
+                st.rerun()
+
+def gerar_calendario_campeonato(equipas):
+    """Gera calendário completo de ida e volta para 12 equipas"""
+    import itertools
+    from datetime import datetime, timedelta
+    
+    # Lista de nomes das equipas
+    nomes_equipas = [equipa['nome'] for equipa in equipas]
+    
+    # Gerar todos os confrontos possíveis (ida)
+    confrontos_ida = list(itertools.combinations(nomes_equipas, 2))
+    
+    # Gerar confrontos de volta (inverter casa/fora)
+    confrontos_volta = [(fora, casa) for casa, fora in confrontos_ida]
+    
+    # Combinar ida + volta
+    todos_confrontos = confrontos_ida + confrontos_volta
+    
+    # Dividir em jornadas (11 jogos por jornada para 12 equipas)
+    jornadas = []
+    jogos_por_jornada = len(equipas) // 2  # 6 jogos por jornada
+    
+    # Organizar jogos para que cada equipa jogue uma vez por jornada
+    confrontos_organizados = organizar_jogos_por_jornada(todos_confrontos, nomes_equipas)
+    
+    data_inicio = datetime(2025, 9, 21)  # Começar em 21 de setembro
+    
+    for i in range(0, len(confrontos_organizados), jogos_por_jornada):
+        jornada_jogos = confrontos_organizados[i:i+jogos_por_jornada]
+        
+        # Data da jornada (sábados)
+        data_jornada = data_inicio + timedelta(weeks=len(jornadas))
+        
+        jogos_jornada = []
+        for casa, fora in jornada_jogos:
+            jogos_jornada.append({
+                'casa': casa,
+                'fora': fora,
+                'data': data_jornada.strftime('%Y-%m-%d'),
+                'resultado_casa': None,
+                'resultado_fora': None
+            })
+        
+        jornadas.append({
+            'numero': len(jornadas) + 1,
+            'data': data_jornada.strftime('%Y-%m-%d'),
+            'jogos': jogos_jornada
+        })
+    
+    return jornadas
+
+def organizar_jogos_por_jornada(todos_confrontos, equipas):
+    """Organiza jogos para que cada equipa jogue apenas uma vez por jornada"""
+    import random
+    
+    # Versão simples: embaralhar e tentar organizar
+    random.shuffle(todos_confrontos)
+    
+    jornadas_organizadas = []
+    jogos_restantes = todos_confrontos.copy()
+    
+    while jogos_restantes:
+        jornada_atual = []
+        equipas_usadas = set()
+        
+        for jogo in jogos_restantes[:]:
+            casa, fora = jogo
+            if casa not in equipas_usadas and fora not in equipas_usadas:
+                jornada_atual.append(jogo)
+                equipas_usadas.add(casa)
+                equipas_usadas.add(fora)
+                jogos_restantes.remove(jogo)
+        
+        jornadas_organizadas.extend(jornada_atual)
+    
+    return jornadas_organizadas
+
+def reverter_estatisticas_campeonato(campeonato, equipa_casa, equipa_fora, golos_casa, golos_fora):
+    """Reverte/desfaz estatísticas das equipas após um jogo (para edições)"""
+    equipas = campeonato.get('equipas', [])
+    
+    # Encontrar as equipas
+    equipa_casa_obj = next((e for e in equipas if e['nome'] == equipa_casa), None)
+    equipa_fora_obj = next((e for e in equipas if e['nome'] == equipa_fora), None)
+    
+    if not equipa_casa_obj or not equipa_fora_obj:
+        return
+    
+    # Reverter jogos
+    equipa_casa_obj['jogos'] -= 1
+    equipa_fora_obj['jogos'] -= 1
+    
+    # Reverter golos
+    equipa_casa_obj['golos_marcados'] -= golos_casa
+    equipa_casa_obj['golos_sofridos'] -= golos_fora
+    equipa_fora_obj['golos_marcados'] -= golos_fora
+    equipa_fora_obj['golos_sofridos'] -= golos_casa
+    
+    # Reverter diferença de golos
+    equipa_casa_obj['diferenca_golos'] = equipa_casa_obj['golos_marcados'] - equipa_casa_obj['golos_sofridos']
+    equipa_fora_obj['diferenca_golos'] = equipa_fora_obj['golos_marcados'] - equipa_fora_obj['golos_sofridos']
+    
+    # Reverter resultado
+    if golos_casa > golos_fora:
+        # Reverter vitória da casa
+        equipa_casa_obj['vitorias'] -= 1
+        equipa_casa_obj['pontos'] -= 3
+        equipa_fora_obj['derrotas'] -= 1
+    elif golos_fora > golos_casa:
+        # Reverter vitória fora
+        equipa_fora_obj['vitorias'] -= 1
+        equipa_fora_obj['pontos'] -= 3
+        equipa_casa_obj['derrotas'] -= 1
+    else:
+        # Reverter empate
+        equipa_casa_obj['empates'] -= 1
+        equipa_casa_obj['pontos'] -= 1
+        equipa_fora_obj['empates'] -= 1
+        equipa_fora_obj['pontos'] -= 1
+
+def atualizar_estatisticas_campeonato(campeonato, equipa_casa, equipa_fora, golos_casa, golos_fora):
+    """Atualiza estatísticas das equipas após um jogo"""
+    equipas = campeonato.get('equipas', [])
+    
+    # Encontrar as equipas
+    equipa_casa_obj = next((e for e in equipas if e['nome'] == equipa_casa), None)
+    equipa_fora_obj = next((e for e in equipas if e['nome'] == equipa_fora), None)
+    
+    if not equipa_casa_obj or not equipa_fora_obj:
+        return
+    
+    # Atualizar jogos
+    equipa_casa_obj['jogos'] += 1
+    equipa_fora_obj['jogos'] += 1
+    
+    # Atualizar golos
+    equipa_casa_obj['golos_marcados'] += golos_casa
+    equipa_casa_obj['golos_sofridos'] += golos_fora
+    equipa_fora_obj['golos_marcados'] += golos_fora
+    equipa_fora_obj['golos_sofridos'] += golos_casa
+    
+    # Atualizar diferença de golos
+    equipa_casa_obj['diferenca_golos'] = equipa_casa_obj['golos_marcados'] - equipa_casa_obj['golos_sofridos']
+    equipa_fora_obj['diferenca_golos'] = equipa_fora_obj['golos_marcados'] - equipa_fora_obj['golos_sofridos']
+    
+    # Determinar resultado
+    if golos_casa > golos_fora:
+        # Vitória da casa
+        equipa_casa_obj['vitorias'] += 1
+        equipa_casa_obj['pontos'] += 3
+        equipa_fora_obj['derrotas'] += 1
+    elif golos_fora > golos_casa:
+        # Vitória fora
+        equipa_fora_obj['vitorias'] += 1
+        equipa_fora_obj['pontos'] += 3
+        equipa_casa_obj['derrotas'] += 1
+    else:
+        # Empate
+        equipa_casa_obj['empates'] += 1
+        equipa_casa_obj['pontos'] += 1
+        equipa_fora_obj['empates'] += 1
+        equipa_fora_obj['pontos'] += 1
+
+# === GESTÃO DE JOGOS ===
+def converter_data_jogo(data_str):
+    """Converte string de data para objeto date"""
+    try:
+        return datetime.strptime(data_str, '%Y-%m-%d').date()
+    except:
+        return date.today()
+
+def sincronizar_estatisticas_jogadores(dados, jogo, ficha):
+    """Sincroniza as estatísticas da ficha de jogo para os jogadores no array principal"""
+    try:
+        if not dados or 'jogadores' not in dados:
+            return False
+        
+        # Iterar sobre cada jogador na ficha e atualizar no array principal
+        for nome_jogador, stats_ficha in ficha.get('jogadores_estatisticas', {}).items():
+            # Encontrar o jogador no array principal
+            jogador_encontrado = False
+            for i, jogador in enumerate(dados['jogadores']):
+                if jogador.get('nome') == nome_jogador:
+                    jogador_encontrado = True
+                    
+                    # Criar estrutura de estatísticas se não existir
+                    if 'estatisticas' not in jogador:
+                        jogador['estatisticas'] = {
+                            'golos': 0,
+                            'assistencias': 0,
+                            'passes_certos': 0,
+                            'passes_errados': 0,
+                            'remates': 0,
+                            'remates_baliza': 0,
+                            'faltas_cometidas': 0,
+                            'faltas_sofridas': 0,
+                            'cartao_amarelo': 0,
+                            'cartao_vermelho': 0,
+                            'defesas': 0,
+                            'tempo_total_minutos': 0,
+                            'tempo_jogo_details': [],  # Array com detalhes de tempo por jogo
+                            'jogos_jogados': 0,
+                            'notas_medias': 0
+                        }
+                    
+                    # Adicionar estatísticas da ficha às estatísticas acumuladas
+                    jogador['estatisticas']['golos'] += stats_ficha.get('golos', 0)
+                    jogador['estatisticas']['assistencias'] += stats_ficha.get('assistencias', 0)
+                    jogador['estatisticas']['passes_certos'] += stats_ficha.get('passes_certos', 0)
+                    jogador['estatisticas']['passes_errados'] += stats_ficha.get('passes_errados', 0)
+                    jogador['estatisticas']['remates'] += stats_ficha.get('remates', 0)
+                    jogador['estatisticas']['remates_baliza'] += stats_ficha.get('remates_baliza', 0)
+                    jogador['estatisticas']['faltas_cometidas'] += stats_ficha.get('faltas_cometidas', 0)
+                    jogador['estatisticas']['faltas_sofridas'] += stats_ficha.get('faltas_sofridas', 0)
+                    jogador['estatisticas']['cartao_amarelo'] += stats_ficha.get('cartao_amarelo', 0)
+                    jogador['estatisticas']['cartao_vermelho'] += stats_ficha.get('cartao_vermelho', 0)
+                    jogador['estatisticas']['tempo_total_minutos'] += stats_ficha.get('tempo_jogo', 0)
+                    
+                    # Guardar detalhes de tempo de jogo
+                    tempo_detail = {
+                        'data': ficha.get('jogo_info', {}).get('data', ''),
+                        'adversario': ficha.get('jogo_info', {}).get('adversario', ''),
+                        'status': stats_ficha.get('tempo_jogo_status', 'Banco'),
+                        'minutos': stats_ficha.get('tempo_jogo', 0),
+                        'minuto_entrada': stats_ficha.get('minuto_entrada'),
+                        'minuto_saida': stats_ficha.get('minuto_saida')
+                    }
+                    if 'tempo_jogo_details' not in jogador['estatisticas']:
+                        jogador['estatisticas']['tempo_jogo_details'] = []
+                    jogador['estatisticas']['tempo_jogo_details'].append(tempo_detail)
+                    
+                    # Para guarda-redes
+                    if stats_ficha.get('posicao') == 'GR':
+                        jogador['estatisticas']['defesas'] += stats_ficha.get('defesas', 0)
+                    
+                    # Atualizar jogos jogados e nota média
+                    if stats_ficha.get('tempo_jogo', 0) > 0:
+                        jogador['estatisticas']['jogos_jogados'] = jogador['estatisticas'].get('jogos_jogados', 0) + 1
+                        
+                        # Calcular nota média
+                        jogos_atuais = jogador['estatisticas'].get('jogos_jogados', 0)
+                        nota_atual = jogador['estatisticas'].get('notas_medias', 0)
+                        nota_nova = stats_ficha.get('nota', 0)
+                        
+                        if jogos_atuais > 0:
+                            jogador['estatisticas']['notas_medias'] = (nota_atual * (jogos_atuais - 1) + nota_nova) / jogos_atuais
+                    
+                    break
+        
+        return True
+    except Exception as e:
+        return False
+
+def migrar_ficha_para_novo_formato(ficha):
+    """Migra fichas antigas para o novo formato com tempo_jogo_status, minuto_entrada, minuto_saida"""
+    try:
+        if not ficha or 'jogadores_estatisticas' not in ficha:
+            return ficha
+        
+        # Verificar se já está no novo formato
+        primeiro_jogador = next(iter(ficha.get('jogadores_estatisticas', {}).values()), None)
+        if primeiro_jogador and 'tempo_jogo_status' in primeiro_jogador:
+            return ficha  # Já está migrado
+        
+        # Migrar cada jogador
+        for jogador_nome, stats in ficha.get('jogadores_estatisticas', {}).items():
+            # Se os campos novos não existem, adicionar com valores baseados nos dados antigos
+            if 'tempo_jogo_status' not in stats:
+                minutos = stats.get('tempo_jogo', stats.get('minutos_jogados', 0))
+                
+                # Determinar status baseado em minutos
+                if minutos == 0:
+                    stats['tempo_jogo_status'] = 'Banco'
+                    stats['minuto_entrada'] = None
+                    stats['minuto_saida'] = None
+                elif minutos >= 90:
+                    stats['tempo_jogo_status'] = '90 min'
+                    stats['minuto_entrada'] = None
+                    stats['minuto_saida'] = None
+                elif stats.get('titular', False):
+                    # Era titular mas tem menos de 90 min = foi substituído
+                    stats['tempo_jogo_status'] = 'Substituído'
+                    stats['minuto_entrada'] = None
+                    stats['minuto_saida'] = minutos  # Assumir que saiu no minuto igual aos minutos jogados
+                else:
+                    # Era suplente e jogou = entrou no jogo
+                    stats['tempo_jogo_status'] = 'Entrou no jogo'
+                    stats['minuto_entrada'] = 45  # Padrão (pode ser ajustado depois)
+                    stats['minuto_saida'] = None
+                
+                # Garantir que tempo_jogo está preenchido
+                if 'tempo_jogo' not in stats:
+                    stats['tempo_jogo'] = stats.get('minutos_jogados', 0)
+        
+        return ficha
+    except Exception as e:
+        return ficha  # Retornar ficha original se houver erro
+
+def criar_ficha_jogo_vazia(jogo):
+    """Cria estrutura vazia para ficha de jogo"""
+    ficha = {
+        'jogo_info': {
+            'data': jogo.get('data'),
+            'hora': jogo.get('hora'),
+            'adversario': jogo.get('adversario'),
+            'local': jogo.get('local'),
+            'tipo': jogo.get('tipo'),
+            'resultado_final': jogo.get('resultado', ''),
+            'arbitro': '',
+            'clima': '',
+            'publico': 0
+        },
+        'equipa_tecnica': {
+            'treinador': '',
+            'adjunto': '',
+            'preparador_fisico': '',
+            'massagista': ''
+        },
+        'jogadores_estatisticas': {},
+        'substituicoes': [],
+        'golos': [],
+        'cartoes': [],
+        'eventos_importantes': [],
+        'resumo_estatisticas': {
+            'posse_bola': {'nossa': 0, 'adversario': 0},
+            'remates': {'nossa': 0, 'adversario': 0},
+            'remates_baliza': {'nossa': 0, 'adversario': 0},
+            'cantos': {'nossa': 0, 'adversario': 0},
+            'faltas': {'nossa': 0, 'adversario': 0},
+            'foras_jogo': {'nossa': 0, 'adversario': 0}
+        },
+        'observacoes': ''
+    }
+    
+    # Inicializar estatísticas para jogadores convocados
+    for jogador_nome in jogo.get('convocados', []):
+        ficha['jogadores_estatisticas'][jogador_nome] = {
+            'titular': False,
+            'tempo_jogo': 0,
+            'tempo_jogo_status': 'Banco',  # 'Banco', '90 min', 'Substituído aos X min', 'Entrou aos X min'
+            'foi_substituido': False,  # Campo booleano para indicar se foi substituído (apenas para titulares)
+            'minuto_entrada': None,  # Minuto em que entrou como suplente
+            'minuto_saida': None,    # Minuto em que foi substituído
+            'posicao': '',
+            'golos': 0,
+            'assistencias': 0,
+            'passes_certos': 0,
+            'passes_errados': 0,
+            'remates': 0,
+            'remates_baliza': 0,
+            'faltas_cometidas': 0,
+            'faltas_sofridas': 0,
+            'cartao_amarelo': 0,
+            'cartao_vermelho': 0,
+            'defesas': 0,  # Para guarda-redes
+            'nota': 0,
+            'observacoes': ''
+        }
+    
+    return ficha
+
+def importar_ficha_fpf(url_fpf: str, jogo: Dict, ficha: Dict, dados: Dict) -> bool:
+    """
+    Importa ficha de jogo do site FPF (resultados.fpf.pt) com múltiplas estratégias de matching
+    
+    Args:
+        url_fpf: URL da ficha do FPF
+        jogo: Dicionário do jogo
+        ficha: Dicionário da ficha de jogo
+        dados: Dados da aplicação
+    
+    Returns:
+        True se importou com sucesso, False caso contrário
+    """
+    try:
+        import requests
+        from bs4 import BeautifulSoup
+        import re
+        import unicodedata
+        from difflib import SequenceMatcher
+        
+        def similitude(a, b):
+            return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        
+        def remover_acentos(texto):
+            return ''.join(c for c in unicodedata.normalize('NFD', texto) if unicodedata.category(c) != 'Mn')
+        
+        def extrair_sobrenome(nome):
+            partes = nome.strip().split()
+            return partes[-1] if partes else ""
+        
+        def extrair_primeira_palavra(nome):
+            partes = nome.strip().split()
+            return partes[0] if partes else ""
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        
+        st.info("🔄 Buscando ficha no site FPF...")
+        
+        response = requests.get(url_fpf, headers=headers, timeout=15)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        
+        soup = BeautifulSoup(response.content, 'html.parser')
+        
+        # ===== EXTRAIR NOMES (MÚLTIPLAS ESTRATÉGIAS) =====
+        nomes_pagina = set()
+        
+        # Estratégia 1: Procurar em elementos com class específicas
+        elementos = soup.find_all(['div', 'span', 'a', 'p', 'td', 'li'], class_=lambda x: x and any(
+            termo in str(x).lower() for termo in ['player', 'name', 'jogador', 'atleta', 'team', 'squad', 'lineup']
+        ))
+        
+        for elem in elementos:
+            texto = elem.get_text(strip=True)
+            if texto and 3 < len(texto) < 50:
+                if texto[0].isupper() and not any(char.isdigit() for char in texto):
+                    if texto.count(' ') <= 3:
+                        nomes_pagina.add(texto)
+        
+        # Estratégia 2: Regex agressivo
+        padrao = r'\b([A-Z][a-záàâãäèéêëìíîïòóôõöùúûüýÿçñ]+(?:\s+[A-Z][a-záàâãäèéêëìíîïòóôõöùúûüýÿçñ]+)*)\b'
+        for match in re.finditer(padrao, str(soup)):
+            nome = match.group(1)
+            if 3 < len(nome) < 50:
+                nomes_pagina.add(nome)
+        
+        # Estratégia 3: Procurar em atributos data-*
+        for tag in soup.find_all(True):
+            for attr, value in tag.attrs.items():
+                if attr.startswith('data-') and isinstance(value, str):
+                    if 3 < len(value) < 50 and value[0].isupper() and not any(c.isdigit() for c in value):
+                        nomes_pagina.add(value)
+        
+        # Estratégia 4: Alt text de imagens
+        for img in soup.find_all('img'):
+            alt = img.get('alt', '')
+            if alt and 3 < len(alt) < 50 and alt[0].isupper() and not any(c.isdigit() for c in alt):
+                nomes_pagina.add(alt)
+        
+        nomes_pagina = sorted(list(set(nomes_pagina)))
+        st.info(f"📊 Encontrados {len(nomes_pagina)} nomes únicos no FPF")
+        
+        # ===== COMPARAR COM 6 ESTRATÉGIAS =====
+        jogadores_app = [j['nome'] for j in dados.get('jogadores', [])]
+        
+        jogadores_exatos = []
+        jogadores_parciais = []
+        jogadores_fuzzy = []
+        jogadores_acentos = []
+        jogadores_sobrenome = []
+        jogadores_iniciais = []
+        sem_correspondencia = []
+        
+        st.write("### 🔍 Analisando correspondências...")
+        
+        for nome_app in jogadores_app:
+            encontrado = False
+            
+            # ESTRATÉGIA 1: Exato
+            for nome_pag in nomes_pagina:
+                if nome_app.lower() == nome_pag.lower():
+                    jogadores_exatos.append(nome_app)
+                    st.success(f"✓ **Exato:** {nome_app}")
+                    encontrado = True
+                    break
+            
+            if not encontrado:
+                # ESTRATÉGIA 2: Parcial
+                for nome_pag in nomes_pagina:
+                    if nome_app.lower() in nome_pag.lower() or nome_pag.lower() in nome_app.lower():
+                        jogadores_parciais.append(nome_app)
+                        st.warning(f"⚠️ **Parcial:** {nome_app} → {nome_pag}")
+                        encontrado = True
+                        break
+            
+            if not encontrado:
+                # ESTRATÉGIA 3: Fuzzy (>80%)
+                melhor_sim = 0
+                melhor_nome = None
+                for nome_pag in nomes_pagina:
+                    sim = similitude(nome_app, nome_pag)
+                    if sim > melhor_sim:
+                        melhor_sim = sim
+                        melhor_nome = nome_pag
+                
+                if melhor_sim > 0.80:
+                    jogadores_fuzzy.append(nome_app)
+                    st.warning(f"🔍 **Fuzzy ({melhor_sim:.0%}):** {nome_app} → {melhor_nome}")
+                    encontrado = True
+            
+            if not encontrado:
+                # ESTRATÉGIA 4: Sem acentos
+                app_sem = remover_acentos(nome_app).lower()
+                for nome_pag in nomes_pagina:
+                    pag_sem = remover_acentos(nome_pag).lower()
+                    if app_sem == pag_sem:
+                        jogadores_acentos.append(nome_app)
+                        st.warning(f"🔤 **Sem acentos:** {nome_app} ≈ {nome_pag}")
+                        encontrado = True
+                        break
+                    
+                    if not encontrado:
+                        sim_acentos = similitude(app_sem, pag_sem)
+                        if sim_acentos > 0.85:
+                            jogadores_acentos.append(nome_app)
+                            st.warning(f"🔤 **Fuzzy sem acentos ({sim_acentos:.0%}):** {nome_app} → {nome_pag}")
+                            encontrado = True
+                            break
+            
+            if not encontrado:
+                # ESTRATÉGIA 5: Sobrenome + primeira palavra
+                sobrenome_app = extrair_sobrenome(nome_app).lower()
+                primeira_app = extrair_primeira_palavra(nome_app).lower()
+                
+                for nome_pag in nomes_pagina:
+                    sobrenome_pag = extrair_sobrenome(nome_pag).lower()
+                    primeira_pag = extrair_primeira_palavra(nome_pag).lower()
+                    
+                    if sobrenome_app == sobrenome_pag and len(sobrenome_app) > 3:
+                        sim_primeira = similitude(primeira_app, primeira_pag)
+                        if sim_primeira > 0.70:
+                            jogadores_sobrenome.append(nome_app)
+                            st.warning(f"👤 **Sobrenome:** {nome_app} ≈ {nome_pag}")
+                            encontrado = True
+                            break
+            
+            if not encontrado:
+                # ESTRATÉGIA 6: Iniciais
+                for nome_pag in nomes_pagina:
+                    partes_app = nome_app.split()
+                    partes_pag = nome_pag.split()
+                    
+                    if len(partes_app) >= 2 and len(partes_pag) >= 2:
+                        # Primeira letra + sobrenome
+                        if (partes_app[0][0].lower() == partes_pag[0][0].lower() and 
+                            partes_app[-1].lower() == partes_pag[-1].lower()):
+                            jogadores_iniciais.append(nome_app)
+                            st.warning(f"✍️ **Inicial:** {nome_app} = {nome_pag}")
+                            encontrado = True
+                            break
+                        
+                        # Sobrenome em qualquer posição
+                        if partes_app[-1].lower() in [p.lower() for p in partes_pag]:
+                            sim = similitude(nome_app, nome_pag)
+                            if sim > 0.75:
+                                jogadores_iniciais.append(nome_app)
+                                st.warning(f"✍️ **Inicial (~{sim:.0%}):** {nome_app} ≈ {nome_pag}")
+                                encontrado = True
+                                break
+            
+            if not encontrado:
+                sem_correspondencia.append(nome_app)
+        
+        st.divider()
+        
+        # Combinar resultados
+        encontrados = (jogadores_exatos + jogadores_parciais + jogadores_fuzzy + 
+                      jogadores_acentos + jogadores_sobrenome + jogadores_iniciais)
+        encontrados = list(dict.fromkeys(encontrados))  # Remove duplicatas
+        
+        if encontrados:
+            st.success(f"**Sucesso! {len(encontrados)}/{len(jogadores_app)} encontrados**")
+            
+            # Adicionar à ficha
+            for j in encontrados:
+                if j not in jogo.get('convocados', []):
+                    if 'convocados' not in jogo:
+                        jogo['convocados'] = []
+                    jogo['convocados'].append(j)
+                
+                if j not in ficha['jogadores_estatisticas']:
+                    ficha['jogadores_estatisticas'][j] = {
+                        'titular': True, 'tempo_jogo': 90, 'posicao': '',
+                        'golos': 0, 'assistencias': 0, 'passes_certos': 0,
+                        'passes_errados': 0, 'remates': 0, 'remates_baliza': 0,
+                        'faltas_cometidas': 0, 'faltas_sofridas': 0,
+                        'cartao_amarelo': 0, 'cartao_vermelho': 0,
+                        'defesas': 0, 'nota': 0, 'observacoes': ''
+                    }
+            
+            with st.expander("📋 Detalhes"):
+                if jogadores_exatos:
+                    st.success(f"✓ Exatos: {', '.join(jogadores_exatos)}")
+                if jogadores_parciais:
+                    st.warning(f"⚠️ Parciais: {', '.join(jogadores_parciais)}")
+                if jogadores_fuzzy:
+                    st.info(f"🔍 Fuzzy: {', '.join(jogadores_fuzzy)}")
+                if jogadores_acentos:
+                    st.info(f"🔤 Acentos: {', '.join(jogadores_acentos)}")
+                if jogadores_sobrenome:
+                    st.info(f"👤 Sobrenome: {', '.join(jogadores_sobrenome)}")
+                if jogadores_iniciais:
+                    st.info(f"✍️ Iniciais: {', '.join(jogadores_iniciais)}")
+                if sem_correspondencia:
+                    st.error(f"❌ Não encontrados: {', '.join(sem_correspondencia)}")
+            
+            st.info("Ficha salvar quando clicar 'Salvar Ficha de Jogo'")
+            return True
+        else:
+            st.error("Nenhuma correspondência encontrada")
+            return False
+    
+    except Exception as e:
+        st.error(f"Erro ao processar ficha FPF: {str(e)}")
+        return False
+
+def importar_ficha_jogo(url: str, jogo: Dict, ficha: Dict, dados: Dict) -> bool:
+    """
+    Importa ficha de jogo detectando automaticamente o site
+    
+    Suporta:
+    - zerozero.pt
+    - resultados.fpf.pt (site oficial FPF)
+    """
+    if not url:
+        st.error("Cole o URL da ficha de jogo")
+        return False
+    
+    url_lower = url.lower()
+    
+    # Detectar site e chamar função apropriada
+    if 'zerozero' in url_lower:
+        st.write("Usando importador **ZeroZero.pt**")
+        return importar_ficha_zerozero(url, jogo, ficha, dados)
+    
+    elif 'fpf.pt' in url_lower or 'resultados.fpf.pt' in url_lower:
+        st.write("Usando importador **FPF**")
+        return importar_ficha_fpf(url, jogo, ficha, dados)
+    
+    else:
+        st.error("Site não reconhecido. Use zerozero.pt ou resultados.fpf.pt")
+        return False
+
+def importar_ficha_zerozero(url_zerozero: str, jogo: Dict, ficha: Dict, dados: Dict) -> bool:
+    """
+    Importa ficha de jogo do zerozero.pt e preenche automaticamente
+    
+    Extrai nomes dos jogadores da página e compara com jogadores cadastrados.
+    Usa múltiplas estratégias: exato, parcial, fuzzy, acentos, sobrenomes, iniciais.
+    
+    Args:
+        url_zerozero: URL da ficha do zerozero.pt
+        jogo: Dicionário do jogo
+        ficha: Dicionário da ficha de jogo
+        dados: Dados da aplicação
+    
+    Returns:
+        True se importou com sucesso, False caso contrário
+    """
+    try:
+        import requests
+        from bs4 import BeautifulSoup
+        import re
+        import unicodedata
+        from difflib import SequenceMatcher
+        
+        def similitude(a, b):
+            """Calcula similitude entre dois strings (0 a 1)"""
+            return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        
+        def remover_acentos(texto):
+            """Remove acentos e diacríticos"""
+            return ''.join(
+                c for c in unicodedata.normalize('NFD', texto)
+                if unicodedata.category(c) != 'Mn'
+            )
+        
+        def extrair_sobrenome(nome):
+            """Extrai o sobrenome (última palavra)"""
+            partes = nome.strip().split()
+            return partes[-1] if partes else ""
+        
+        def extrair_primeira_palavra(nome):
+            """Extrai primeira palavra"""
+            partes = nome.strip().split()
+            return partes[0] if partes else ""
+        
+        # Headers para simular browser
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+        
+        st.info("🔄 Buscando ficha no zerozero.pt...")
+        
+        # Fazer request e parse HTML
+        response = requests.get(url_zerozero, headers=headers, timeout=15)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        
+        soup = BeautifulSoup(response.content, 'html.parser')
+        
+        # ===== PASSO 1: EXTRAIR NOMES DA PÁGINA (MUITO AGRESSIVO) =====
+        nomes_pagina = set()
+        
+        # Estratégia 1: Procurar em elementos com class específicas
+        elementos = soup.find_all(['div', 'span', 'td', 'a', 'p', 'li', 'button'], class_=lambda x: x and any(
+            termo in str(x).lower() for termo in ['player', 'name', 'jogador', 'escalacao', 'lineup', 'equipa', 'team', 'squad', 'atleta']
+        ))
+        
+        for elem in elementos:
+            texto = elem.get_text(strip=True)
+            if texto and 3 < len(texto) < 50:
+                if texto[0].isupper() and not any(char.isdigit() for char in texto):
+                    nomes_pagina.add(texto)
+        
+        # Estratégia 2: Regex agressivo em TODA a página
+        padrao_nome = r'\b([A-Z][a-záàâãäèéêëìíîïòóôõöùúûüýÿçñ]+(?:\s+[A-Z][a-záàâãäèéêëìíîïòóôõöùúûüýÿçñ]+)*)\b'
+        matches = re.findall(padrao_nome, str(soup))
+        for nome in matches:
+            if 3 < len(nome) < 50:
+                nomes_pagina.add(nome)
+        
+        # Estratégia 3: Procurar em todas as tags sem restrição de class
+        for tag in soup.find_all(['div', 'span', 'a', 'p', 'li']):
+            texto = tag.get_text(strip=True)
+            if 3 < len(texto) < 50 and texto[0].isupper():
+                if not any(char.isdigit() for char in texto) and texto.count(' ') <= 3:
+                    nomes_pagina.add(texto)
+        
+        # Estratégia 4: Procurar em atributos data-*
+        for tag in soup.find_all(True):
+            for attr, value in tag.attrs.items():
+                if attr.startswith('data-') and isinstance(value, str):
+                    if 3 < len(value) < 50 and value[0].isupper() and not any(c.isdigit() for c in value):
+                        nomes_pagina.add(value)
+        
+        # Estratégia 5: Procurar em alt text de imagens
+        for img in soup.find_all('img'):
+            alt = img.get('alt', '')
+            if alt and 3 < len(alt) < 50 and alt[0].isupper() and not any(c.isdigit() for c in alt):
+                nomes_pagina.add(alt)
+        
+        # Estratégia 6: Procurar em atributos title
+        for tag in soup.find_all(True):
+            title = tag.get('title', '')
+            if title and 3 < len(title) < 50 and title[0].isupper() and not any(c.isdigit() for c in title):
+                nomes_pagina.add(title)
+        
+        nomes_pagina = sorted(list(set(nomes_pagina)))  # Remove duplicatas
+        
+        # Debug: Mostrar quantos nomes encontrou
+        st.info(f"📊 Encontrados {len(nomes_pagina)} nomes únicos na página")
+        
+        # ===== PASSO 2: OBTER NOMES DOS JOGADORES CADASTRADOS =====
+        jogadores_app = [j['nome'] for j in dados.get('jogadores', [])]
+        
+        # ===== PASSO 3: COMPARAR COM MÚLTIPLAS ESTRATÉGIAS =====
+        jogadores_exatos = []
+        jogadores_parciais = []
+        jogadores_fuzzy = []
+        jogadores_acentos = []  # Sem acentos
+        jogadores_sobrenome = []  # Comparando sobrenomes
+        jogadores_iniciais = []  # "J. Cardoso" vs "João Cardoso"
+        sem_correspondencia = []
+        
+        st.write("### 🔍 Analisando correspondências...")
+        
+        for nome_app in jogadores_app:
+            encontrado = False
+            
+            # ESTRATÉGIA 1: Correspondência EXATA
+            for nome_pag in nomes_pagina:
+                if nome_app.lower() == nome_pag.lower():
+                    jogadores_exatos.append(nome_app)
+                    st.success(f"✓ **Exato:** {nome_app}")
+                    encontrado = True
+                    break
+            
+            if not encontrado:
+                # ESTRATÉGIA 2: Correspondência PARCIAL
+                for nome_pag in nomes_pagina:
+                    if nome_app.lower() in nome_pag.lower() or nome_pag.lower() in nome_app.lower():
+                        jogadores_parciais.append(nome_app)
+                        st.warning(f"⚠️ **Parcial:** {nome_app} (página: {nome_pag})")
+                        encontrado = True
+                        break
+            
+            if not encontrado:
+                # ESTRATÉGIA 3: FUZZY MATCHING (>80%)
+                melhor_similitude = 0
+                melhor_nome = None
+                for nome_pag in nomes_pagina:
+                    sim = similitude(nome_app, nome_pag)
+                    if sim > melhor_similitude:
+                        melhor_similitude = sim
+                        melhor_nome = nome_pag
+                
+                if melhor_similitude > 0.80:
+                    jogadores_fuzzy.append(nome_app)
+                    st.warning(f"🔍 **Fuzzy ({melhor_similitude:.0%}):** {nome_app} → {melhor_nome}")
+                    encontrado = True
+            
+            if not encontrado:
+                # ESTRATÉGIA 4: Remover ACENTOS e comparar
+                app_sem_acentos = remover_acentos(nome_app).lower()
+                for nome_pag in nomes_pagina:
+                    pag_sem_acentos = remover_acentos(nome_pag).lower()
+                    if app_sem_acentos == pag_sem_acentos:
+                        jogadores_acentos.append(nome_app)
+                        st.warning(f"🔤 **Sem acentos:** {nome_app} ≈ {nome_pag}")
+                        encontrado = True
+                        break
+                    # Também testar fuzzy no texto sem acentos
+                    if not encontrado:
+                        sim = similitude(app_sem_acentos, pag_sem_acentos)
+                        if sim > 0.85:
+                            sim_acentos = similitude(app_sem_acentos, pag_sem_acentos)
+                            if sim_acentos > 0.85:
+                                jogadores_acentos.append(nome_app)
+                                st.warning(f"🔤 **Fuzzy (sem acentos {sim_acentos:.0%}):** {nome_app} → {nome_pag}")
+                                encontrado = True
+                                break
+            
+            if not encontrado:
+                # ESTRATÉGIA 5: Comparar SOBRENOMES
+                sobrenome_app = extrair_sobrenome(nome_app).lower()
+                primeira_app = extrair_primeira_palavra(nome_app).lower()
+                
+                for nome_pag in nomes_pagina:
+                    sobrenome_pag = extrair_sobrenome(nome_pag).lower()
+                    primeira_pag = extrair_primeira_palavra(nome_pag).lower()
+                    
+                    # Se sobrenome é igual E primeira palavra similar/igual
+                    if sobrenome_app == sobrenome_pag and len(sobrenome_app) > 3:
+                        sim_primeira = similitude(primeira_app, primeira_pag)
+                        if sim_primeira > 0.70:  # Primeira palavra parecida
+                            jogadores_sobrenome.append(nome_app)
+                            st.warning(f"👤 **Sobrenome:** {nome_app} ≈ {nome_pag}")
+                            encontrado = True
+                            break
+            
+            if not encontrado:
+                # ESTRATÉGIA 6: Lidar com INICIAIS ("J. Cardoso" vs "João Cardoso")
+                for nome_pag in nomes_pagina:
+                    # Se nome_app é "João Cardoso" e nome_pag é "J. Cardoso" ou similar
+                    partes_app = nome_app.split()
+                    partes_pag = nome_pag.split()
+                    
+                    if len(partes_app) >= 2 and len(partes_pag) >= 2:
+                        # Comparar primeira letra + sobrenome
+                        if (partes_app[0][0].lower() == partes_pag[0][0].lower() and 
+                            partes_app[-1].lower() == partes_pag[-1].lower()):
+                            jogadores_iniciais.append(nome_app)
+                            st.warning(f"✍️ **Inicial:** {nome_app} = {nome_pag}")
+                            encontrado = True
+                            break
+                        # Ou sobrenome aparece em qualquer posição
+                        if partes_app[-1].lower() in [p.lower() for p in partes_pag]:
+                            sim = similitude(nome_app, nome_pag)
+                            if sim > 0.75:
+                                jogadores_iniciais.append(nome_app)
+                                st.warning(f"✍️ **Inicial (~{sim:.0%}):** {nome_app} ≈ {nome_pag}")
+                                encontrado = True
+                                break
+            
+            if not encontrado:
+                sem_correspondencia.append(nome_app)
+        
+        # ===== PASSO 4: PROCESSAR RESULTADOS =====
+        st.divider()
+        
+        # Combinar todos os encontrados
+        jogadores_importados = (jogadores_exatos + jogadores_parciais + jogadores_fuzzy + 
+                               jogadores_acentos + jogadores_sobrenome + jogadores_iniciais)
+        
+        # Remover duplicatas preservando ordem
+        jogadores_importados = list(dict.fromkeys(jogadores_importados))
+        
+        if jogadores_importados:
+            st.success(f"### ✅ Sucesso! {len(jogadores_importados)} jogador(es) encontrado(s) de {len(jogadores_app)}")
+            
+            # Adicionar à ficha de jogo
+            for j in jogadores_importados:
+                if j not in jogo.get('convocados', []):
+                    if 'convocados' not in jogo:
+                        jogo['convocados'] = []
+                    jogo['convocados'].append(j)
+                
+                # Criar entrada nas estatísticas se não existir
+                if j not in ficha['jogadores_estatisticas']:
+                    ficha['jogadores_estatisticas'][j] = {
+                        'titular': True,
+                        'tempo_jogo': 90,
+                        'tempo_jogo_status': '90 min',
+                        'minuto_entrada': None,
+                        'minuto_saida': None,
+                        'posicao': '',
+                        'golos': 0,
+                        'assistencias': 0,
+                        'passes_certos': 0,
+                        'passes_errados': 0,
+                        'remates': 0,
+                        'remates_baliza': 0,
+                        'faltas_cometidas': 0,
+                        'faltas_sofridas': 0,
+                        'cartao_amarelo': 0,
+                        'cartao_vermelho': 0,
+                        'defesas': 0,
+                        'nota': 0,
+                        'observacoes': ''
+                    }
+            
+            # Mostrar resumo detalhado
+            with st.expander("📋 Resumo da importação"):
+                if jogadores_exatos:
+                    st.success(f"**✓ Exatos ({len(jogadores_exatos)}):** {', '.join(jogadores_exatos)}")
+                
+                if jogadores_parciais:
+                    st.warning(f"**⚠️ Parciais ({len(jogadores_parciais)}):** {', '.join(jogadores_parciais)}")
+                
+                if jogadores_fuzzy:
+                    st.info(f"**🔍 Fuzzy 80%+ ({len(jogadores_fuzzy)}):** {', '.join(jogadores_fuzzy)}")
+                
+                if jogadores_acentos:
+                    st.info(f"**🔤 Sem acentos ({len(jogadores_acentos)}):** {', '.join(jogadores_acentos)}")
+                
+                if jogadores_sobrenome:
+                    st.info(f"**👤 Por sobrenome ({len(jogadores_sobrenome)}):** {', '.join(jogadores_sobrenome)}")
+                
+                if jogadores_iniciais:
+                    st.info(f"**✍️ Por iniciais ({len(jogadores_iniciais)}):** {', '.join(jogadores_iniciais)}")
+                
+                if sem_correspondencia:
+                    st.error(f"**❌ Não encontrados ({len(sem_correspondencia)}):**")
+                    for j in sem_correspondencia:
+                        st.write(f"  • {j}")
+            
+            st.info("⏸️ A ficha será salva quando clicar 'Salvar Ficha de Jogo'")
+            return True
+        
+        else:
+            # Sem correspondências - mostrar para comparação manual
+            st.error("### ❌ Nenhuma correspondência encontrada")
+            
+            st.error("**Nomes encontrados na página ZeroZero (primeiros 30):**")
+            if nomes_pagina:
+                for nome in nomes_pagina[:30]:
+                    st.write(f"  • {nome}")
+                if len(nomes_pagina) > 30:
+                    st.write(f"  ... e mais {len(nomes_pagina) - 30}")
+            else:
+                st.write("  (Nenhum nome extraído)")
+            
+            st.info("**Nomes cadastrados na app:**")
+            for nome in jogadores_app:
+                st.write(f"  • {nome}")
+            
+            st.warning("**Sugestão:** Compare manualmente e verifique os nomes")
+            
+            return False
+        
+    except requests.exceptions.ConnectionError:
+        st.error("❌ Erro de conexão. Verifique a sua ligação à internet.")
+        return False
+    except requests.exceptions.Timeout:
+        st.error("❌ O site demorou muito tempo a responder. Tente novamente.")
+        return False
+    except Exception as e:
+        st.error(f"❌ Erro ao processar ficha: {str(e)}")
+        import traceback
+        with st.expander("🔧 Detalhes do erro"):
+            st.code(traceback.format_exc())
+        return False
+
+def mostrar_ficha_jogo(jogo, jogo_index, dados):
+    """Mostra ficha completa de um jogo"""
+    st.title(f"📋 Ficha de Jogo - vs {jogo.get('adversario', 'TBD')}")
+    
+    # === IMPORTAR FICHA DE MÚLTIPLOS SITES ===
+    with st.expander("🌐 Importar Ficha de Jogo", expanded=False):
+        st.info("Cole o URL da ficha de jogo para importar automaticamente o onze. Suporta zerozero.pt e resultados.fpf.pt")
+        
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            url_zerozero = st.text_input(
+                "🔗 URL da Ficha",
+                placeholder="Ex: zerozero.pt/jogo/... ou resultados.fpf.pt/Match/...",
+                help="Cole URL do zerozero.pt ou resultados.fpf.pt"
+            )
+        with col2:
+            if st.button("📥 Importar", key=f"importar_zerozero_{jogo_index}", type="primary"):
+                if url_zerozero:
+                    # Verificar se já existe ficha
+                    ficha_key = f"ficha_jogo_{jogo_index}"
+                    if ficha_key not in jogo:
+                        jogo[ficha_key] = criar_ficha_jogo_vazia(jogo)
+                    
+                    ficha = jogo[ficha_key]
+                    
+                    # Importar usando função wrapper (detecta o site automaticamente)
+                    if importar_ficha_jogo(url_zerozero, jogo, ficha, dados):
+                        # ⭐ MIGRAR PARA NOVO FORMATO APÓS IMPORTAR
+                        ficha = migrar_ficha_para_novo_formato(ficha)
+                        jogo[ficha_key] = ficha
+                        
+                        st.success("✅ Ficha importada! Clique em 'Confirmar' para atualizar os dados.")
+                    else:
+                        st.error("❌ Não foi possível importar a ficha.")
+                else:
+                    st.error("❌ Cole o URL da ficha (zerozero.pt ou resultados.fpf.pt)")
+    
+    # Verificar se já existe ficha
+    ficha_key = f"ficha_jogo_{jogo_index}"
+    if ficha_key not in jogo:
+        jogo[ficha_key] = criar_ficha_jogo_vazia(jogo)
+    
+    ficha = jogo[ficha_key]
+    
+    # ⭐ MIGRAR PARA NOVO FORMATO (se necessário)
+    ficha = migrar_ficha_para_novo_formato(ficha)
+    jogo[ficha_key] = ficha
+    
+    # Salvar dados no arquivo após migração
+    salvar_dados(dados)
+    
+    # Tabs da ficha
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "📋 Info do Jogo", 
+        "👥 Jogadores", 
+        "⏱️ Tempo Real",
+        "📊 Estatísticas", 
+        "⚽ Eventos", 
+        "📝 Relatório"
+    ])
+    
+    with tab1:
+        mostrar_info_jogo(ficha, jogo)
+    
+    with tab2:
+        mostrar_jogadores_ficha(ficha, jogo, dados, tab_id="jogadores", ficha_key=ficha_key)
+    
+    with tab3:
+        # Interface de tempo real com cards compactos para cada jogador
+        registar_estatisticas_tempo_real(ficha, jogo, dados)
+        st.info("💾 **Dica:** Clique em 'Salvar Ficha de Jogo' ao final para guardar todas as alterações de forma permanente!")
+    
+    with tab4:
+        mostrar_estatisticas_jogo(ficha)
+    
+    with tab5:
+        mostrar_eventos_jogo(ficha)
+    
+    with tab6:
+        mostrar_relatorio_jogo(ficha, jogo)
+    
+    # Salvar alterações
+    if st.button("💾 Salvar Ficha de Jogo", type="primary"):
+        jogo[ficha_key] = ficha
+        # Sincronizar estatísticas dos jogadores ANTES de salvar
+        sincronizar_estatisticas_jogadores(dados, jogo, ficha)
+        if salvar_dados(dados):
+            # Fim do jogo: as alterações do tempo real ficam gravadas com a ficha
+            obter_estado_tempo_real(jogo).update(pendentes=0, ultima_gravacao=time.time())
+            st.success("✅ Ficha de jogo salva com sucesso!")
+            st.rerun()
+        else:
+            st.error("❌ Erro ao salvar ficha")
+
+def mostrar_info_jogo(ficha, jogo):
+    """Tab 1: Informações básicas do jogo"""
+    st.subheader("📋 Informações do Jogo")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.write("**📅 Data:**", ficha['jogo_info']['data'])
+        st.write("**🕐 Hora:**", ficha['jogo_info']['hora'])
+        st.write("**🆚 Adversário:**", ficha['jogo_info']['adversario'])
+        st.write("**📍 Local:**", ficha['jogo_info']['local'])
+    
+    with col2:
+        st.write("**🎯 Tipo:**", ficha['jogo_info']['tipo'])
+        ficha['jogo_info']['arbitro'] = st.text_input("🏃‍♂️ Árbitro", value=ficha['jogo_info']['arbitro'])
+        ficha['jogo_info']['clima'] = st.selectbox("🌤️ Clima", 
+            ["Ensolarado", "Nublado", "Chuva", "Vento", "Frio"], 
+            index=0 if not ficha['jogo_info']['clima'] else 
+            ["Ensolarado", "Nublado", "Chuva", "Vento", "Frio"].index(ficha['jogo_info']['clima']) 
+            if ficha['jogo_info']['clima'] in ["Ensolarado", "Nublado", "Chuva", "Vento", "Frio"] else 0)
+    
+    with col3:
+        ficha['jogo_info']['publico'] = st.number_input("👥 Público", min_value=0, value=ficha['jogo_info']['publico'])
+        ficha['jogo_info']['resultado_final'] = st.text_input("📊 Resultado Final", 
+            value=ficha['jogo_info']['resultado_final'], placeholder="Ex: 2-1")
+    
+    st.divider()
+    
+    # Equipa técnica
+    st.subheader("👨‍💼 Equipa Técnica")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        ficha['equipa_tecnica']['treinador'] = st.text_input("🎯 Treinador", 
+            value=ficha['equipa_tecnica']['treinador'])
+    
+    with col2:
+        ficha['equipa_tecnica']['adjunto'] = st.text_input("🤝 Treinador Adjunto", 
+            value=ficha['equipa_tecnica']['adjunto'])
+    
+    with col3:
+        ficha['equipa_tecnica']['preparador_fisico'] = st.text_input("💪 Preparador Físico", 
+            value=ficha['equipa_tecnica']['preparador_fisico'])
+    
+    with col4:
+        ficha['equipa_tecnica']['massagista'] = st.text_input("💆‍♂️ Massagista", 
+            value=ficha['equipa_tecnica']['massagista'])
+
+def mostrar_jogadores_ficha(ficha, jogo, dados, tab_id="default", ficha_key=None):
+    """Tab 2: Estatísticas individuais dos jogadores"""
+    st.subheader("👥 Desempenho Individual dos Jogadores")
+    
+    # === PASSO 1: SELEÇÃO DE CONVOCADOS ===
+    st.write("### 📋 1. Selecione os Jogadores Convocados")
+    
+    # Obter lista de todos os jogadores disponíveis
+    todos_jogadores = [j['nome'] for j in dados.get('jogadores', [])]
+    
+    if not todos_jogadores:
+        st.error("❌ Não há jogadores cadastrados no sistema!")
+        st.info("💡 Vá para 'Gestão de Jogadores' para adicionar jogadores primeiro.")
+        return
+    
+    # Convocados atuais (do jogo ou da ficha)
+    convocados_atuais = jogo.get('convocados', [])
+    
+    # Usar um formulário para evitar reruns constantes
+    with st.form(f"form_convocados_{tab_id}", clear_on_submit=False):
+        # Multiselect para escolher convocados
+        convocados_selecionados = st.multiselect(
+            "🎯 Selecione os jogadores convocados para este jogo:",
+            todos_jogadores,
+            default=convocados_atuais,
+            help="Escolha todos os jogadores que foram convocados (titulares + suplentes)"
+        )
+        
+        # Botão de confirmação
+        confirmar_convocados = st.form_submit_button("✅ Confirmar Convocados", type="primary")
+        
+        if confirmar_convocados:
+            # Atualizar lista de convocados no jogo
+            jogo['convocados'] = convocados_selecionados
+            
+            # Adicionar jogadores novos à ficha
+            for jogador_nome in convocados_selecionados:
+                if jogador_nome not in ficha['jogadores_estatisticas']:
+                    ficha['jogadores_estatisticas'][jogador_nome] = {
+                        'titular': False,
+                        'tempo_jogo': 0,
+                        'tempo_jogo_status': 'Banco',
+                        'minuto_entrada': None,
+                        'minuto_saida': None,
+                        'posicao': '',
+                        'golos': 0,
+                        'assistencias': 0,
+                        'passes_certos': 0,
+                        'passes_errados': 0,
+                        'remates': 0,
+                        'remates_baliza': 0,
+                        'faltas_cometidas': 0,
+                        'faltas_sofridas': 0,
+                        'cartao_amarelo': 0,
+                        'cartao_vermelho': 0,
+                        'defesas': 0,
+                        'nota': 0,
+                        'observacoes': ''
+                    }
+            
+            # Remover jogadores que foram desconvocados
+            jogadores_a_remover = [nome for nome in ficha['jogadores_estatisticas'].keys() 
+                                   if nome not in convocados_selecionados]
+            for nome in jogadores_a_remover:
+                del ficha['jogadores_estatisticas'][nome]
+            
+            # ⭐ SALVAR DADOS IMEDIATAMENTE
+            if ficha_key:
+                jogo[ficha_key] = ficha  # Sincronizar ficha atualizada
+            if salvar_dados(dados):
+                st.success(f"✅ Convocatória atualizada: {len(convocados_selecionados)} jogadores!")
+            else:
+                st.error("❌ Erro ao salvar convocatória!")
+            st.rerun()
+    
+    # Usar os convocados atuais para o resto da página
+    convocados_selecionados = jogo.get('convocados', [])
+    
+    if not convocados_selecionados:
+        st.warning("⚠️ Selecione pelo menos um jogador convocado para continuar.")
+        return
+    
+    st.success(f"✅ {len(convocados_selecionados)} jogador{'es' if len(convocados_selecionados) > 1 else ''} convocado{'s' if len(convocados_selecionados) > 1 else ''}")
+    
+    st.divider()
+    
+    # === PASSO 2: DEFINIR TITULARES ===
+    st.write("### ⭐ 2. Defina os 11 Titulares")
+    
+    if not convocados_selecionados:
+        st.warning("⚠️ Primeiro confirme os jogadores convocados acima.")
+        return
+    
+    # Separar titulares e suplentes
+    titulares = [nome for nome in convocados_selecionados if ficha['jogadores_estatisticas'].get(nome, {}).get('titular', False)]
+    
+    # Usar formulário para definir titulares
+    with st.form(f"form_titulares_{tab_id}", clear_on_submit=False):
+        # Seleção de titulares (allow up to total number of convocados)
+        titulares_selecionados = st.multiselect(
+            "Selecione exatamente 11 jogadores titulares:", 
+            convocados_selecionados, 
+            default=titulares,
+            max_selections=len(convocados_selecionados),  # Permitir selecionar até todos
+            help="Os jogadores não selecionados aqui serão considerados suplentes"
+        )
+        
+        # Botão de confirmação
+        confirmar_titulares = st.form_submit_button("✅ Confirmar Titulares", type="primary")
+        
+        if confirmar_titulares:
+            # Atualizar status de titular e tempo de jogo
+            for nome in convocados_selecionados:
+                if nome in ficha['jogadores_estatisticas']:
+                    ficha['jogadores_estatisticas'][nome]['titular'] = nome in titulares_selecionados
+                    # Se é titular, marcar como 90 min
+                    if nome in titulares_selecionados:
+                        ficha['jogadores_estatisticas'][nome]['tempo_jogo_status'] = '90 min'
+                        ficha['jogadores_estatisticas'][nome]['tempo_jogo'] = 90
+                    # Se é suplente, marcar como Banco
+                    else:
+                        ficha['jogadores_estatisticas'][nome]['tempo_jogo_status'] = 'Banco'
+                        ficha['jogadores_estatisticas'][nome]['tempo_jogo'] = 0
+            
+            # ⭐ SALVAR DADOS IMEDIATAMENTE
+            if ficha_key:
+                jogo[ficha_key] = ficha  # Sincronizar ficha atualizada
+            if salvar_dados(dados):
+                st.success(f"✅ Titulares definidos: {len(titulares_selecionados)} jogadores!")
+            else:
+                st.error("❌ Erro ao salvar titulares!")
+            st.rerun()
+    
+    # Usar os titulares atuais
+    titulares_selecionados = [nome for nome in convocados_selecionados 
+                              if ficha['jogadores_estatisticas'].get(nome, {}).get('titular', False)]
+    
+    # Mostrar resumo
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("⭐ Titulares", len(titulares_selecionados))
+    with col2:
+        st.metric("🔄 Suplentes", len(convocados_selecionados) - len(titulares_selecionados))
+    
+    st.divider()
+    
+    # Resumo de tempo de jogo por jogador
+    st.write("### ⏱️ Resumo de Tempo de Jogo")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    # Titulares completo
+    completos = [nome for nome in convocados_selecionados 
+                 if ficha['jogadores_estatisticas'].get(nome, {}).get('tempo_jogo_status') == '90 min']
+    with col1:
+        st.metric("✅ 90 min Completos", len(completos))
+    
+    # Substituídos
+    substituidos = [nome for nome in convocados_selecionados 
+                   if ficha['jogadores_estatisticas'].get(nome, {}).get('tempo_jogo_status') == 'Substituído']
+    with col2:
+        st.metric("🔄 Substituídos", len(substituidos))
+    
+    # Entraram no jogo
+    entraram = [nome for nome in convocados_selecionados 
+               if ficha['jogadores_estatisticas'].get(nome, {}).get('tempo_jogo_status') == 'Entrou no jogo']
+    with col3:
+        st.metric("➡️ Entraram", len(entraram))
+    
+    st.divider()
+    
+    # === PASSO 3: ESTATÍSTICAS DETALHADAS ===
+    st.write("### 📊 3. Estatísticas Detalhadas por Jogador")
+    
+    # Mostrar estatísticas por jogador
+    for i, nome in enumerate(convocados_selecionados):
+        with st.expander(f"{'⭐' if nome in titulares_selecionados else '🔄'} {nome} - {'TITULAR' if nome in titulares_selecionados else 'SUPLENTE'}"):
+            
+            if nome not in ficha['jogadores_estatisticas']:
+                continue
+                
+            stats = ficha['jogadores_estatisticas'][nome]
+            
+            # Mostrar status de tempo de jogo de forma visual
+            status = stats.get('tempo_jogo_status', 'Banco')
+            if status == '90 min':
+                st.success(f"✅ **Jogou 90 minutos completos**")
+            elif status == 'Substituído':
+                min_saida = stats.get('minuto_saida', 60)
+                st.info(f"🔄 **Substituído aos {min_saida} minutos**")
+            elif status == 'Entrou no jogo':
+                min_entrada = stats.get('minuto_entrada', 45)
+                min_jogados = stats.get('tempo_jogo', 45)
+                st.info(f"➡️ **Entrou aos {min_entrada} minutos - {min_jogados} min jogados**")
+            else:  # Banco
+                st.warning(f"⏸️ **Ficou no banco**")
+            
+            st.divider()
+            
+            # Layout em colunas
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.write("**🎯 Posição & Tempo:**")
+                stats['posicao'] = st.selectbox(f"Posição", 
+                    ["GR", "DD", "DC", "DE", "MDC", "MC", "MOC", "ED", "EE", "PL", "SA"], 
+                    key=f"pos_{tab_id}_{i}", 
+                    index=["GR", "DD", "DC", "DE", "MDC", "MC", "MOC", "ED", "EE", "PL", "SA"].index(stats['posicao']) 
+                    if stats['posicao'] in ["GR", "DD", "DC", "DE", "MDC", "MC", "MOC", "ED", "EE", "PL", "SA"] else 0)
+                
+                # Status do tempo de jogo
+                status_opcoes = ["Banco", "90 min", "Substituído", "Entrou no jogo"]
+                status_atual = stats.get('tempo_jogo_status', 'Banco')
+                status_idx = status_opcoes.index(status_atual) if status_atual in status_opcoes else 0
+                stats['tempo_jogo_status'] = st.selectbox(f"⏱️ Status do Tempo de Jogo",
+                    status_opcoes, index=status_idx, key=f"status_tempo_{tab_id}_{i}")
+                
+                # Campos dinâmicos baseado no status selecionado
+                if stats['tempo_jogo_status'] == '90 min':
+                    st.success("✅ **Jogou os 90 minutos completos**")
+                    stats['tempo_jogo'] = 90
+                    stats['minuto_entrada'] = None
+                    stats['minuto_saida'] = None
+                
+                elif stats['tempo_jogo_status'] == 'Substituído':
+                    st.warning(f"🔄 **Jogador Substituído** - Definir minuto:")
+                    col1, col2 = st.columns([2, 1])
+                    with col1:
+                        stats['minuto_saida'] = st.number_input(
+                            "⏰ Em que minuto foi substituído?",
+                            min_value=1, 
+                            max_value=120, 
+                            value=stats.get('minuto_saida') or 60,
+                            key=f"min_saida_{tab_id}_{i}",
+                            help="Minuto exato em que saiu do campo"
+                        )
+                    with col2:
+                        st.metric("Minutos", stats['minuto_saida'])
+                    
+                    # Atualizar tempo automaticamente
+                    stats['tempo_jogo'] = stats['minuto_saida']
+                    stats['minuto_entrada'] = None
+                
+                elif stats['tempo_jogo_status'] == 'Entrou no jogo':
+                    st.info(f"➡️ **Suplente que entrou** - Definir minuto e tempo jogado:")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        stats['minuto_entrada'] = st.number_input(
+                            "⏰ Minuto em que entrou?",
+                            min_value=1, 
+                            max_value=119, 
+                            value=stats.get('minuto_entrada') or 45,
+                            key=f"min_entrada_{tab_id}_{i}"
+                        )
+                    with col2:
+                        stats['tempo_jogo'] = st.number_input(
+                            "⏱️ Total de minutos jogados",
+                            min_value=1,
+                            max_value=120,
+                            value=stats.get('tempo_jogo') or 45,
+                            key=f"tempo_entrada_{tab_id}_{i}"
+                        )
+                    stats['minuto_saida'] = None
+                
+                else:  # Banco
+                    st.error("⏸️ **Ficou no banco** - 0 minutos")
+                    stats['tempo_jogo'] = 0
+                    stats['minuto_entrada'] = None
+                    stats['minuto_saida'] = None
+                
+                stats['nota'] = st.slider(f"⭐ Nota (1-10)", 
+                    min_value=1, max_value=10, value=stats['nota'], key=f"nota_{tab_id}_{i}")
+            
+            with col2:
+                st.write("**⚽ Ações Ofensivas:**")
+                stats['golos'] = st.number_input(f"⚽ Golos", 
+                    min_value=0, value=stats['golos'], key=f"golos_{tab_id}_{i}")
+                
+                stats['assistencias'] = st.number_input(f"🎯 Assistências", 
+                    min_value=0, value=stats['assistencias'], key=f"assist_{tab_id}_{i}")
+                
+                stats['remates'] = st.number_input(f"🎯 Remates", 
+                    min_value=0, value=stats['remates'], key=f"remates_{tab_id}_{i}")
+                
+                stats['remates_baliza'] = st.number_input(f"🥅 Remates à Baliza", 
+                    min_value=0, value=stats['remates_baliza'], key=f"remates_baliza_{tab_id}_{i}")
+            
+            with col3:
+                st.write("**⚡ Ações Técnicas:**")
+                stats['passes_certos'] = st.number_input(f"✅ Passes Certos", 
+                    min_value=0, value=stats['passes_certos'], key=f"passes_ok_{tab_id}_{i}")
+                
+                stats['passes_errados'] = st.number_input(f"❌ Passes Errados", 
+                    min_value=0, value=stats['passes_errados'], key=f"passes_erro_{tab_id}_{i}")
+                
+                # Calcular percentagem de passes
+                total_passes = stats['passes_certos'] + stats['passes_errados']
+                if total_passes > 0:
+                    perc_passes = (stats['passes_certos'] / total_passes) * 100
+                    st.metric("📊 % Passes Certos", f"{perc_passes:.1f}%")
+            
+            # Segunda linha de estatísticas
+            col4, col5, col6 = st.columns(3)
+            
+            with col4:
+                st.write("**🛡️ Ações Defensivas:**")
+                if stats['posicao'] == 'GR':
+                    stats['defesas'] = st.number_input(f"🧤 Defesas", 
+                        min_value=0, value=stats['defesas'], key=f"defesas_{tab_id}_{i}")
+                
+                stats['faltas_sofridas'] = st.number_input(f"😣 Faltas Sofridas", 
+                    min_value=0, value=stats['faltas_sofridas'], key=f"faltas_sofridas_{tab_id}_{i}")
+            
+            with col5:
+                st.write("**⚠️ Disciplina:**")
+                stats['faltas_cometidas'] = st.number_input(f"🚫 Faltas Cometidas", 
+                    min_value=0, value=stats['faltas_cometidas'], key=f"faltas_comet_{tab_id}_{i}")
+                
+                stats['cartao_amarelo'] = st.number_input(f"🟨 Cartões Amarelos", 
+                    min_value=0, max_value=2, value=stats['cartao_amarelo'], key=f"amarelo_{tab_id}_{i}")
+                
+                stats['cartao_vermelho'] = st.number_input(f"🟥 Cartão Vermelho", 
+                    min_value=0, max_value=1, value=stats['cartao_vermelho'], key=f"vermelho_{tab_id}_{i}")
+            
+            with col6:
+                st.write("**📝 Observações:**")
+                stats['observacoes'] = st.text_area(f"Notas sobre {nome}", 
+                    value=stats['observacoes'], key=f"obs_{tab_id}_{i}", height=100)
+
+# === TEMPO REAL: FRAGMENTOS ===
+INTERVALO_GRAVACAO_TEMPO_REAL = 30  # segundos entre gravações automáticas durante o jogo
+
+INTERVALO_RESUMO_TEMPO_REAL = 10    # segundos entre atualizações do resumo/cronologia
+
+INTERVALO_RELOGIO_TEMPO_REAL = 15   # segundos entre atualizações do relógio
+
+def estatisticas_jogador_vazias(status='Banco', minuto_entrada=None):
+    """Estatísticas iniciais de um jogador na ficha de jogo"""
+    return {
+        'titular': False, 'tempo_jogo': 0, 'tempo_jogo_status': status,
+        'minuto_entrada': minuto_entrada, 'minuto_saida': None, 'posicao': '',
+        'golos': 0, 'assistencias': 0, 'passes_certos': 0,
+        'passes_errados': 0, 'remates': 0, 'remates_baliza': 0,
+        'faltas_cometidas': 0, 'faltas_sofridas': 0,
+        'cartao_amarelo': 0, 'cartao_vermelho': 0, 'defesas': 0,
+        'nota': 0, 'observacoes': ''
+    }
+
+def obter_estado_tempo_real(jogo):
+    """Estado da sessão do registo em tempo real (alterações pendentes e última gravação)"""
+    chave = f"{PREFIXO_TEMPO_REAL}{jogo.get('data')}_{jogo.get('adversario')}"
+    if chave not in st.session_state:
+        st.session_state[chave] = {'pendentes': 0, 'ultima_gravacao': time.time()}
+    return st.session_state[chave]
+
+def minuto_relogio(ficha):
+    """Minuto de jogo atual segundo o relógio da ficha (0 se ainda não começou)"""
+    relogio = ficha.get('relogio') or {}
+    segundos = relogio.get('acumulado', 0)
+    if relogio.get('inicio'):
+        segundos += (datetime.now() - datetime.fromisoformat(relogio['inicio'])).total_seconds()
+    elif not segundos:
+        return 0
+    base = 45 if relogio.get('parte') == 2 else 0
+    return min(base + int(segundos // 60) + 1, 120)
+
+def registar_evento_tempo_real(ficha, tipo, jogador):
+    """Acrescenta um evento à cronologia com o minuto do relógio"""
+    ficha.setdefault('eventos_importantes', []).append({
+        'minuto': minuto_relogio(ficha) or 1,
+        'tipo': tipo,
+        'jogador': jogador,
+        'descricao': 'Registado em tempo real',
+        'timestamp': datetime.now().isoformat()
+    })
+
+def gravar_tempo_real(dados, estado, forcar=False):
+    """Grava as alterações acumuladas em memória (no máximo uma vez por intervalo)"""
+    if dados is None or not estado['pendentes']:
+        return False
+    if not forcar and time.time() - estado['ultima_gravacao'] < INTERVALO_GRAVACAO_TEMPO_REAL:
+        return False
+
+    if salvar_dados(dados):
+        # salvar_dados guarda uma cópia; os fragmentos continuam a editar estes objetos
+        st.session_state['dados_cache'] = dados
+        estado['pendentes'] = 0
+        estado['ultima_gravacao'] = time.time()
+        return True
+    return False
+
+@fragmento(run_every=INTERVALO_RELOGIO_TEMPO_REAL)
+def _relogio_tempo_real(ficha, estado):
+    """Relógio do jogo: iniciar/pausar e mudar de parte sem rerun da página"""
+    relogio = ficha.setdefault('relogio', {'inicio': None, 'acumulado': 0, 'parte': 1})
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    # Botões primeiro: o estado muda antes de desenhar o minuto
+    with col2:
+        if relogio.get('inicio'):
+            if st.button("⏸️ Pausar", key="relogio_pausar", use_container_width=True):
+                relogio['acumulado'] = relogio.get('acumulado', 0) + (
+                    datetime.now() - datetime.fromisoformat(relogio['inicio'])
+                ).total_seconds()
+                relogio['inicio'] = None
+                estado['pendentes'] += 1
+        else:
+            if st.button("▶️ Iniciar", key="relogio_iniciar", use_container_width=True, type="primary"):
+                relogio['inicio'] = datetime.now().isoformat()
+                estado['pendentes'] += 1
+    
+    with col3:
+        if relogio.get('parte', 1) == 1:
+            if st.button("🔁 2ª Parte", key="relogio_segunda_parte", use_container_width=True):
+                relogio.update({'inicio': None, 'acumulado': 0, 'parte': 2})
+                estado['pendentes'] += 1
+    
+    with col1:
+        minuto = minuto_relogio(ficha)
+        estado_relogio = "▶️ a decorrer" if relogio.get('inicio') else "⏸️ parado"
+        st.metric(f"⏱️ {relogio.get('parte', 1)}ª Parte ({estado_relogio})", f"{minuto}'" if minuto else "—")
+
+@fragmento
+def _card_jogador_tempo_real(ficha, nome_jogador, eh_titular, estado):
+    """Card de um jogador: cada toque volta a correr apenas este card"""
+    with st.container(border=True):
+        # Indicador se é titular
+        if eh_titular:
+            st.write(f"### ⭐ {nome_jogador}")
+        else:
+            st.write(f"### 🔄 {nome_jogador}")
+        
+        # Referência aos dados na ficha
+        stats = ficha['jogadores_estatisticas'][nome_jogador]
+        antes = dict(stats)
+        
+        # Status de tempo de jogo (rápido)
+        status_opcoes = ["90 min", "Banco", "Substituído", "Entrou no jogo"]
+        status_atual = stats.get('tempo_jogo_status', 'Banco')
+        status_idx = status_opcoes.index(status_atual) if status_atual in status_opcoes else 0
+        novo_status = st.selectbox(
+            "⏱️ Tempo de Jogo",
+            status_opcoes,
+            index=status_idx,
+            key=f"status_{nome_jogador}",
+            help="Status de tempo de jogo"
+        )
+        stats['tempo_jogo_status'] = novo_status
+        
+        # Campos dinâmicos baseado no status
+        if novo_status == 'Substituído':
+            minuto_saida = st.number_input(
+                "🔄 Minuto saída:",
+                min_value=1,
+                max_value=120,
+                value=stats.get('minuto_saida') or minuto_relogio(ficha) or 60,
+                key=f"min_saida_{nome_jogador}",
+                step=1
+            )
+            stats['minuto_saida'] = minuto_saida
+            stats['tempo_jogo'] = minuto_saida
+            st.caption(f"⏱️ {minuto_saida} min", unsafe_allow_html=False)
+        
+        elif novo_status == 'Entrou no jogo':
+            minuto_entrada = st.number_input(
+                "➡️ Minuto entrada:",
+                min_value=1,
+                max_value=119,
+                value=stats.get('minuto_entrada') or 45,
+                key=f"min_entrada_{nome_jogador}",
+                step=1
+            )
+            stats['minuto_entrada'] = minuto_entrada
+            st.caption(f"Entrou aos {minuto_entrada}'", unsafe_allow_html=False)
+        
+        elif novo_status == '90 min':
+            stats['tempo_jogo'] = 90
+            st.caption("✅ 90 min", unsafe_allow_html=False)
+        
+        else:  # Banco
+            stats['tempo_jogo'] = 0
+            st.caption("⏸️ Banco", unsafe_allow_html=False)
+        
+        st.divider()
+        
+        # Passes (cor azul - informative)
+        col_p1, col_p2 = st.columns(2)
+        with col_p1:
+            novo_valor = st.number_input(
+                "✓ Passes C", 
+                value=stats.get('passes_certos', 0),
+                min_value=0,
+                key=f"pass_c_{nome_jogador}",
+                help="Passes acertados"
+            )
+            stats['passes_certos'] = novo_valor
+        
+        with col_p2:
+            novo_valor = st.number_input(
+                "✗ Passes E", 
+                value=stats.get('passes_errados', 0),
+                min_value=0,
+                key=f"pass_e_{nome_jogador}",
+                help="Passes falhados"
+            )
+            stats['passes_errados'] = novo_valor
+        
+        st.divider()
+        
+        # Faltas (cor laranja - warning)
+        col_f1, col_f2 = st.columns(2)
+        with col_f1:
+            novo_valor = st.number_input(
+                "🚫 Faltas C", 
+                value=stats.get('faltas_cometidas', 0),
+                min_value=0,
+                key=f"falta_comet_{nome_jogador}",
+                help="Faltas cometidas"
+            )
+            stats['faltas_cometidas'] = novo_valor
+        
+        with col_f2:
+            novo_valor = st.number_input(
+                "😣 Faltas S", 
+                value=stats.get('faltas_sofridas', 0),
+                min_value=0,
+                key=f"falta_sofrida_{nome_jogador}",
+                help="Faltas sofridas"
+            )
+            stats['faltas_sofridas'] = novo_valor
+        
+        st.divider()
+        
+        # Golos (cor verde - success)
+        col_g1, col_g2 = st.columns(2)
+        with col_g1:
+            novo_valor = st.number_input(
+                "⚽ Golos", 
+                value=stats.get('golos', 0),
+                min_value=0,
+                key=f"golos_{nome_jogador}"
+            )
+            stats['golos'] = novo_valor
+        
+        with col_g2:
+            novo_valor = st.number_input(
+                "🤝 Assistências", 
+                value=stats.get('assistencias', 0),
+                min_value=0,
+                key=f"assist_{nome_jogador}"
+            )
+            stats['assistencias'] = novo_valor
+        
+        st.divider()
+        
+        # Cartões (cor vermelha - warning)
+        col_c1, col_c2 = st.columns(2)
+        with col_c1:
+            novo_valor = st.number_input(
+                "🟨 Amarelo", 
+                value=stats.get('cartao_amarelo', 0),
+                min_value=0,
+                max_value=2,
+                key=f"amar_{nome_jogador}",
+                help="Máximo 2 amarelos"
+            )
+            stats['cartao_amarelo'] = novo_valor
+        
+        with col_c2:
+            novo_valor = st.checkbox(
+                "🟥 Vermelho", 
+                value=bool(stats.get('cartao_vermelho', 0)),
+                key=f"verm_{nome_jogador}",
+                help="Expulsão"
+            )
+            stats['cartao_vermelho'] = 1 if novo_valor else 0
+        
+        # Acumular a alteração em memória; incrementos viram eventos na cronologia
+        if stats != antes:
+            estado['pendentes'] += 1
+            for campo, tipo in (('golos', 'Golo'), ('assistencias', 'Assistência'),
+                                ('cartao_amarelo', 'Cartão Amarelo'), ('cartao_vermelho', 'Cartão Vermelho')):
+                if stats.get(campo, 0) > (antes.get(campo) or 0):
+                    registar_evento_tempo_real(ficha, tipo, nome_jogador)
+            if novo_status != antes.get('tempo_jogo_status') and novo_status in ('Substituído', 'Entrou no jogo'):
+                registar_evento_tempo_real(ficha, 'Substituição', nome_jogador)
+
+@fragmento(run_every=INTERVALO_RESUMO_TEMPO_REAL)
+def _resumo_tempo_real(ficha, em_campo, estado, dados):
+    """Resumo, destaques e cronologia; também grava periodicamente as alterações pendentes"""
+    if st.button("💾 Gravar agora", key="gravar_tempo_real"):
+        gravar_tempo_real(dados, estado, forcar=True)
+    else:
+        gravar_tempo_real(dados, estado)
+    
+    if estado['pendentes']:
+        st.caption(f"📝 {estado['pendentes']} alteração(ões) em memória - gravação automática a cada {INTERVALO_GRAVACAO_TEMPO_REAL}s")
+    else:
+        st.caption(f"✅ Tudo gravado às {datetime.fromtimestamp(estado['ultima_gravacao']).strftime('%H:%M:%S')}")
+    
+    # Resumo rápido em tempo real
+    st.write("### 📊 Resumo (Em Tempo Real)")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_golos = sum(ficha['jogadores_estatisticas'].get(j, {}).get('golos', 0) for j in em_campo)
+    total_passes_c = sum(ficha['jogadores_estatisticas'].get(j, {}).get('passes_certos', 0) for j in em_campo)
+    total_passes_e = sum(ficha['jogadores_estatisticas'].get(j, {}).get('passes_errados', 0) for j in em_campo)
+    total_assist = sum(ficha['jogadores_estatisticas'].get(j, {}).get('assistencias', 0) for j in em_campo)
+    
+    with col1:
+        st.metric("⚽ Golos", total_golos)
+    
+    with col2:
+        if (total_passes_c + total_passes_e) > 0:
+            taxa_acerto = (total_passes_c / (total_passes_c + total_passes_e)) * 100
+            st.metric("✓ Taxa de Passe", f"{taxa_acerto:.0f}%")
+        else:
+            st.metric("✓ Taxa de Passe", "0%")
+    
+    with col3:
+        st.metric("🤝 Assistências", total_assist)
+    
+    with col4:
+        amarelos = sum(1 for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('cartao_amarelo', 0) > 0)
+        vermelhos = sum(1 for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('cartao_vermelho', 0) > 0)
+        st.metric("⚠️ Cartões", f"{amarelos}🟨 {vermelhos}🟥")
+    
+    st.divider()
+    
+    # Jogadores destaque (com golos ou assistências)
+    st.write("### ⭐ Destaques")
+    
+    com_golos = [nome for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('golos', 0) > 0]
+    com_assist = [nome for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('assistencias', 0) > 0]
+    
+    if com_golos:
+        golos_detail = [f"{nome} ({ficha['jogadores_estatisticas'][nome].get('golos', 0)})" for nome in com_golos]
+        st.success(f"⚽ **Marcadores:** {', '.join(golos_detail)}")
+    else:
+        st.info("⚽ Sem golos registados ainda")
+    
+    if com_assist:
+        assist_detail = [f"{nome} ({ficha['jogadores_estatisticas'][nome].get('assistencias', 0)})" for nome in com_assist]
+        st.info(f"🤝 **Assistências:** {', '.join(assist_detail)}")
+    
+    # Avisos de cartões
+    amarelos_lista = [(nome, ficha['jogadores_estatisticas'][nome].get('cartao_amarelo', 0)) 
+                      for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('cartao_amarelo', 0) > 0]
+    vermelhos_lista = [nome for nome in em_campo if ficha['jogadores_estatisticas'][nome].get('cartao_vermelho', 0) > 0]
+    
+    if amarelos_lista or vermelhos_lista:
+        st.write("**⚠️ Disciplina:**")
+        if amarelos_lista:
+            amarelos_detail = [f"{nome} ({num}🟨)" for nome, num in amarelos_lista]
+            st.warning(f"🟨 Amarelos: {', '.join(amarelos_detail)}")
+        if vermelhos_lista:
+            st.error(f"🟥 Vermelhos: {', '.join(vermelhos_lista)}")
+    
+    # Cronologia: últimos eventos registados
+    eventos = ficha.get('eventos_importantes', [])
+    if eventos:
+        st.write("### 📋 Últimos Eventos")
+        for evento in sorted(eventos, key=lambda x: x.get('minuto', 0), reverse=True)[:5]:
+            st.write(f"**{evento.get('minuto', '?')}'** {evento.get('tipo', '')} - {evento.get('jogador', '')}")
+
+def registar_estatisticas_tempo_real(ficha, jogo, dados=None):
+    """
+    Interface para o adjunto registar estatísticas em tempo real durante o jogo
+    As alterações são gravadas em lote: a cada INTERVALO_GRAVACAO_TEMPO_REAL, em qualquer rerun completo
+    (mudar de página) e ao clicar 'Salvar' no fim do jogo
+    
+    Permite definir titulares rapidamente NESTA aba, sem ir para outra.
+    Relógio, cards de jogadores e resumo são fragmentos: cada toque volta a correr
+    apenas o seu fragmento e as alterações acumulam em memória até à gravação periódica.
+    """
+    st.subheader("⏱️ Registro em Tempo Real - Gravação Automática em Lote")
+    st.info(f"💾 As mudanças ficam em memória e são gravadas a cada {INTERVALO_GRAVACAO_TEMPO_REAL}s e ao mudar de página. "
+            "Use '💾 Gravar agora' antes de fechar a aplicação e 'Salvar Ficha de Jogo' no fim do jogo.")
+    
+    estado = obter_estado_tempo_real(jogo)
+    if dados is not None:
+        # Os fragmentos editam estes objetos: a sessão deve vê-los no próximo rerun completo
+        st.session_state['dados_cache'] = dados
+    
+    # Obter convocados
+    convocados = jogo.get('convocados', [])
+    
+    if not convocados:
+        st.warning("⚠️ Nenhum jogador convocado. Configure na aba 'Importar Ficha' ou 'Jogadores'")
+        return
+    
+    # Obter titulares atuais
+    titulares = [nome for nome in ficha['jogadores_estatisticas'].keys() 
+                 if ficha['jogadores_estatisticas'][nome].get('titular', False)]
+    
+    # SEÇÃO RÁPIDA: Definir titulares
+    st.write("### ⚡ Defina os 11 Titulares (Rápido)")
+    
+    with st.form("form_titulares_rapido"):
+        titulares_selecionados = st.multiselect(
+            "Selecione os 11 titulares:",
+            convocados,
+            default=titulares,
+            max_selections=len(convocados),
+            help="Escolha exatamente 11 para começar o registo"
+        )
+        
+        if st.form_submit_button("✅ Confirmar Titulares", type="primary"):
+            # Atualizar status de titular
+            for nome in convocados:
+                if nome not in ficha['jogadores_estatisticas']:
+                    ficha['jogadores_estatisticas'][nome] = estatisticas_jogador_vazias()
+                ficha['jogadores_estatisticas'][nome]['titular'] = nome in titulares_selecionados
+                # Se é titular, marcar como 90 min
+                if nome in titulares_selecionados:
+                    ficha['jogadores_estatisticas'][nome]['tempo_jogo_status'] = '90 min'
+                    ficha['jogadores_estatisticas'][nome]['tempo_jogo'] = 90
+            
+            st.success(f"✅ {len(titulares_selecionados)} titulares confirmados!")
+            st.rerun()
+    
+    st.divider()
+    
+    # Verificar se há titulares confirmados
+    titulares = [nome for nome in ficha['jogadores_estatisticas'].keys() 
+                 if ficha['jogadores_estatisticas'][nome].get('titular', False)]
+    
+    if not titulares:
+        st.info("💡 Confirme os titulares acima para começar o registo em tempo real")
+        return
+    
+    st.success(f"✅ **{len(titulares)} Titulares** - Pronto para registar!")
+    
+    # Relógio do jogo (fragmento)
+    _relogio_tempo_real(ficha, estado)
+    st.divider()
+    
+    # SEÇÃO: Substituições (mudam a lista de cards, por isso fazem rerun completo)
+    st.write("### 🔄 Substituições (Durante o Jogo)")
+    
+    suplentes = [nome for nome in convocados if nome not in titulares]
+    
+    if suplentes:
+        with st.expander("➕ Registar Entrada de Suplentes", expanded=False):
+            for suplente in suplentes:
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    st.write(f"**{suplente}**")
+                
+                with col2:
+                    # Checkbox para marcar que entrou
+                    if f"suplente_entrou_{suplente}" not in st.session_state:
+                        st.session_state[f"suplente_entrou_{suplente}"] = False
+                    
+                    entrou = st.checkbox(
+                        "Entrou",
+                        value=st.session_state[f"suplente_entrou_{suplente}"],
+                        key=f"entrou_{suplente}",
+                        help=f"Marque se {suplente} entrou em campo"
+                    )
+                    
+                    if entrou and not st.session_state[f"suplente_entrou_{suplente}"]:
+                        # Acabou de entrar - adicionar à ficha
+                        minuto_entrada = minuto_relogio(ficha) or 45
+                        if suplente not in ficha['jogadores_estatisticas']:
+                            ficha['jogadores_estatisticas'][suplente] = estatisticas_jogador_vazias(
+                                status='Entrou no jogo', minuto_entrada=minuto_entrada
+                            )
+                        else:
+                            ficha['jogadores_estatisticas'][suplente]['tempo_jogo_status'] = 'Entrou no jogo'
+                            if not ficha['jogadores_estatisticas'][suplente].get('minuto_entrada'):
+                                ficha['jogadores_estatisticas'][suplente]['minuto_entrada'] = minuto_entrada
+                        registar_evento_tempo_real(ficha, 'Substituição', suplente)
+                        estado['pendentes'] += 1
+                        st.session_state[f"suplente_entrou_{suplente}"] = True
+                        st.success(f"✅ {suplente} entrou em campo!")
+                        st.rerun()
+    
+    st.divider()
+    
+    # Obter jogadores em campo (titulares + substitutos que entraram)
+    # ORGANIZAR: Titulares primeiro, depois suplentes
+    titulares_em_campo = [nome for nome in titulares if nome in ficha['jogadores_estatisticas'].keys()]
+    suplentes_em_campo = [nome for nome in ficha['jogadores_estatisticas'].keys() if nome not in titulares]
+    em_campo = titulares_em_campo + suplentes_em_campo
+    
+    st.write(f"### 👥 Jogadores em Campo ({len(em_campo)})")
+    
+    # Layout em colunas: 3 colunas para cards de jogadores (um fragmento por card)
+    num_colunas = 3
+    colunas = st.columns(num_colunas)
+    
+    for idx, nome_jogador in enumerate(em_campo):
+        with colunas[idx % num_colunas]:
+            _card_jogador_tempo_real(ficha, nome_jogador, nome_jogador in titulares, estado)
+    
+    st.divider()
+    
+    # Resumo, cronologia e gravação periódica (fragmento com atualização automática)
+    _resumo_tempo_real(ficha, em_campo, estado, dados)
+
+def mostrar_estatisticas_jogo(ficha):
+    """Tab 3: Estatísticas gerais do jogo"""
+    st.subheader("📊 Estatísticas Gerais do Jogo")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("### 🔵 Nossa Equipa")
+        
+        stats_nossa = ficha['resumo_estatisticas']
+        
+        stats_nossa['posse_bola']['nossa'] = st.slider("⚽ Posse de Bola (%)", 
+            0, 100, stats_nossa['posse_bola']['nossa'], key="posse_nossa")
+        
+        stats_nossa['remates']['nossa'] = st.number_input("🎯 Total de Remates", 
+            min_value=0, value=stats_nossa['remates']['nossa'], key="remates_nossa")
+        
+        stats_nossa['remates_baliza']['nossa'] = st.number_input("🥅 Remates à Baliza", 
+            min_value=0, value=stats_nossa['remates_baliza']['nossa'], key="remates_baliza_nossa")
+        
+        stats_nossa['cantos']['nossa'] = st.number_input("🚩 Cantos", 
+            min_value=0, value=stats_nossa['cantos']['nossa'], key="cantos_nossa")
+        
+        stats_nossa['faltas']['nossa'] = st.number_input("🚫 Faltas Cometidas", 
+            min_value=0, value=stats_nossa['faltas']['nossa'], key="faltas_nossa")
+        
+        stats_nossa['foras_jogo']['nossa'] = st.number_input("🏃‍♂️ Foras de Jogo", 
+            min_value=0, value=stats_nossa['foras_jogo']['nossa'], key="foras_nossa")
+    
+    with col2:
+        st.write("### 🔴 Adversário")
+        
+        # Calcular automaticamente posse do adversário
+        stats_nossa['posse_bola']['adversario'] = 100 - stats_nossa['posse_bola']['nossa']
+        st.metric("⚽ Posse de Bola (%)", f"{stats_nossa['posse_bola']['adversario']}%")
+        
+        stats_nossa['remates']['adversario'] = st.number_input("🎯 Total de Remates", 
+            min_value=0, value=stats_nossa['remates']['adversario'], key="remates_adv")
+        
+        stats_nossa['remates_baliza']['adversario'] = st.number_input("🥅 Remates à Baliza", 
+            min_value=0, value=stats_nossa['remates_baliza']['adversario'], key="remates_baliza_adv")
+        
+        stats_nossa['cantos']['adversario'] = st.number_input("🚩 Cantos", 
+            min_value=0, value=stats_nossa['cantos']['adversario'], key="cantos_adv")
+        
+        stats_nossa['faltas']['adversario'] = st.number_input("🚫 Faltas Cometidas", 
+            min_value=0, value=stats_nossa['faltas']['adversario'], key="faltas_adv")
+        
+        stats_nossa['foras_jogo']['adversario'] = st.number_input("🏃‍♂️ Foras de Jogo", 
+            min_value=0, value=stats_nossa['foras_jogo']['adversario'], key="foras_adv")
+    
+    # Gráfico comparativo
+    st.divider()
+    st.write("### 📈 Comparação Visual")
+    
+    # Dados para gráfico
+    categorias = ['Remates', 'Remates à Baliza', 'Cantos', 'Faltas', 'Foras de Jogo']
+    nossa_valores = [
+        stats_nossa['remates']['nossa'],
+        stats_nossa['remates_baliza']['nossa'], 
+        stats_nossa['cantos']['nossa'],
+        stats_nossa['faltas']['nossa'],
+        stats_nossa['foras_jogo']['nossa']
+    ]
+    adv_valores = [
+        stats_nossa['remates']['adversario'],
+        stats_nossa['remates_baliza']['adversario'],
+        stats_nossa['cantos']['adversario'], 
+        stats_nossa['faltas']['adversario'],
+        stats_nossa['foras_jogo']['adversario']
+    ]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Nossa Equipa', x=categorias, y=nossa_valores, marker_color='blue'))
+    fig.add_trace(go.Bar(name='Adversário', x=categorias, y=adv_valores, marker_color='red'))
+    
+    fig.update_layout(
+        title='Comparação de Estatísticas',
+        xaxis_title='Estatísticas',
+        yaxis_title='Quantidade',
+        barmode='group'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+def mostrar_eventos_jogo(ficha):
+    """Tab 4: Eventos importantes do jogo"""
+    st.subheader("⚽ Eventos Importantes do Jogo")
+    
+    # Adicionar novo evento
+    with st.expander("➕ Adicionar Novo Evento"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            tipo_evento = st.selectbox("Tipo de Evento", [
+                "Golo", "Assistência", "Cartão Amarelo", "Cartão Vermelho", 
+                "Substituição", "Penalti", "Lesão", "Outro"
+            ])
+        
+        with col2:
+            minuto = st.number_input("Minuto", min_value=1, max_value=120, value=1)
+            jogador = st.selectbox("Jogador", list(ficha['jogadores_estatisticas'].keys()))
+        
+        with col3:
+            descricao = st.text_input("Descrição", placeholder="Ex: Golo de cabeça após canto")
+        
+        if st.button("➕ Adicionar Evento"):
+            evento = {
+                'minuto': minuto,
+                'tipo': tipo_evento,
+                'jogador': jogador,
+                'descricao': descricao,
+                'timestamp': datetime.now().isoformat()
+            }
+            ficha['eventos_importantes'].append(evento)
+            st.success(f"✅ Evento adicionado: {tipo_evento} - {jogador} ({minuto}')")
+            st.rerun()
+    
+    # Mostrar eventos existentes
+    eventos = ficha['eventos_importantes']
+    if eventos:
+        st.write("### 📋 Cronologia de Eventos")
+        
+        # Ordenar por minuto
+        eventos_ordenados = sorted(eventos, key=lambda x: x['minuto'])
+        
+        for i, evento in enumerate(eventos_ordenados):
+            with st.container():
+                col1, col2, col3, col4 = st.columns([1, 2, 3, 1])
+                
+                with col1:
+                    st.write(f"**{evento['minuto']}'**")
+                
+                with col2:
+                    emoji_map = {
+                        'Golo': '⚽',
+                        'Assistência': '🎯', 
+                        'Cartão Amarelo': '🟨',
+                        'Cartão Vermelho': '🟥',
+                        'Substituição': '🔄',
+                        'Penalti': '🥅',
+                        'Lesão': '🚑',
+                        'Outro': '📌'
+                    }
+                    emoji = emoji_map.get(evento['tipo'], '📌')
+                    st.write(f"{emoji} **{evento['tipo']}**")
+                
+                with col3:
+                    st.write(f"**{evento['jogador']}** - {evento['descricao']}")
+                
+                with col4:
+                    if st.button("🗑️", key=f"del_evento_{i}"):
+                        ficha['eventos_importantes'].remove(evento)
+                        st.rerun()
+                
+                st.divider()
+    else:
+        st.info("📝 Nenhum evento registrado ainda")
+    
+    # Seção específica para substituições
+    st.divider()
+    st.write("### 🔄 Substituições")
+    
+    with st.expander("➕ Registrar Substituição"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            minuto_sub = st.number_input("Minuto da Substituição", min_value=1, max_value=120, value=45)
+        
+        with col2:
+            sai = st.selectbox("Jogador que Sai", list(ficha['jogadores_estatisticas'].keys()), key="sai")
+            
+        with col3:
+            entra = st.selectbox("Jogador que Entra", list(ficha['jogadores_estatisticas'].keys()), key="entra")
+        
+        if st.button("🔄 Registrar Substituição"):
+            substituicao = {
+                'minuto': minuto_sub,
+                'sai': sai,
+                'entra': entra,
+                'timestamp': datetime.now().isoformat()
+            }
+            ficha['substituicoes'].append(substituicao)
+            
+            # Adicionar aos eventos também
+            evento_sub = {
+                'minuto': minuto_sub,
+                'tipo': 'Substituição',
+                'jogador': f"{entra} ← {sai}",
+                'descricao': f"Entra {entra}, sai {sai}",
+                'timestamp': datetime.now().isoformat()
+            }
+            ficha['eventos_importantes'].append(evento_sub)
+            
+            st.success(f"✅ Substituição registrada: {entra} ← {sai} ({minuto_sub}')")
+            st.rerun()
+    
+    # Mostrar substituições
+    if ficha['substituicoes']:
+        for i, sub in enumerate(sorted(ficha['substituicoes'], key=lambda x: x['minuto'])):
+            col1, col2, col3 = st.columns([1, 4, 1])
+            
+            with col1:
+                st.write(f"**{sub['minuto']}'**")
+            
+            with col2:
+                st.write(f"🔄 **{sub['entra']}** ← {sub['sai']}")
+            
+            with col3:
+                if st.button("🗑️", key=f"del_sub_{i}"):
+                    ficha['substituicoes'].remove(sub)
+                    st.rerun()
+
+def mostrar_relatorio_jogo(ficha, jogo):
+    """Tab 5: Relatório final do jogo"""
+    st.subheader("📝 Relatório Final do Jogo")
+    
+    # Observações gerais
+    ficha['observacoes'] = st.text_area(
+        "📝 Observações Gerais do Jogo",
+        value=ficha['observacoes'],
+        height=150,
+        placeholder="Análise geral da performance da equipa, pontos positivos, pontos a melhorar, etc."
+    )
+    
+    st.divider()
+    
+    # Resumo automático
+    st.write("### 📊 Resumo Automático")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**👥 Jogadores Utilizados:**")
+        
+        titulares = [nome for nome, stats in ficha['jogadores_estatisticas'].items() if stats.get('titular', False)]
+        suplentes_usados = [nome for nome, stats in ficha['jogadores_estatisticas'].items() 
+                           if not stats.get('titular', False) and stats.get('tempo_jogo', 0) > 0]
+        
+        st.write(f"• **Titulares:** {len(titulares)}")
+        for titular in titulares:
+            tempo = ficha['jogadores_estatisticas'][titular].get('tempo_jogo', 0)
+            st.write(f"  - {titular} ({tempo} min)")
+        
+        if suplentes_usados:
+            st.write(f"• **Suplentes Utilizados:** {len(suplentes_usados)}")
+            for suplente in suplentes_usados:
+                tempo = ficha['jogadores_estatisticas'][suplente].get('tempo_jogo', 0)
+                st.write(f"  - {suplente} ({tempo} min)")
+    
+    with col2:
+        st.write("**⚽ Estatísticas Principais:**")
+        
+        # Calcular totais da equipa
+        total_golos = sum(ficha['jogadores_estatisticas'].get(j, {}).get('golos', 0) for j in ficha['jogadores_estatisticas'].keys())
+        total_assistencias = sum(ficha['jogadores_estatisticas'].get(j, {}).get('assistencias', 0) for j in ficha['jogadores_estatisticas'].keys())
+        total_cartoes_amarelos = sum(ficha['jogadores_estatisticas'].get(j, {}).get('cartao_amarelo', 0) for j in ficha['jogadores_estatisticas'].keys())
+        total_cartoes_vermelhos = sum(ficha['jogadores_estatisticas'].get(j, {}).get('cartao_vermelho', 0) for j in ficha['jogadores_estatisticas'].keys())
+        
+        st.metric("⚽ Golos Marcados", total_golos)
+        st.metric("🎯 Assistências", total_assistencias)
+        st.metric("🟨 Cartões Amarelos", total_cartoes_amarelos)
+        st.metric("🟥 Cartões Vermelhos", total_cartoes_vermelhos)
+        st.metric("🔄 Substituições", len(ficha['substituicoes']))
+    
+    st.divider()
+    
+    # Melhores jogadores
+    st.write("### ⭐ Destaques do Jogo")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    # Verificar se há jogadores com estatísticas
+    if ficha['jogadores_estatisticas']:
+        with col1:
+            # Melhor jogador (maior nota)
+            melhor_jogador = max(ficha['jogadores_estatisticas'].items(), 
+                               key=lambda x: x[1].get('nota', 0))
+            st.write("🏆 **Melhor Jogador:**")
+            st.write(f"**{melhor_jogador[0]}** (Nota: {melhor_jogador[1].get('nota', 0)})")
+        
+        with col2:
+            # Artilheiro
+            artilheiros = [(nome, stats.get('golos', 0)) for nome, stats in ficha['jogadores_estatisticas'].items()]
+            artilheiro = max(artilheiros, key=lambda x: x[1])
+            if artilheiro[1] > 0:
+                st.write("⚽ **Artilheiro:**")
+                st.write(f"**{artilheiro[0]}** ({artilheiro[1]} golo{'s' if artilheiro[1] > 1 else ''})")
+            else:
+                st.write("⚽ **Artilheiro:** Nenhum golo marcado")
+        
+        with col3:
+            # Maior assistente
+            assistentes = [(nome, stats.get('assistencias', 0)) for nome, stats in ficha['jogadores_estatisticas'].items()]
+            assistente = max(assistentes, key=lambda x: x[1])
+            if assistente[1] > 0:
+                st.write("🎯 **Maior Assistente:**")
+                st.write(f"**{assistente[0]}** ({assistente[1]} assistência{'s' if assistente[1] > 1 else ''})")
+            else:
+                st.write("🎯 **Assistências:** Nenhuma assistência")
+    else:
+        st.info("ℹ️ **Preencha as estatísticas dos jogadores para ver os destaques do jogo.**")
+    
+    # Botão para gerar relatório PDF (futuro)
+    st.divider()
+    if st.button("📄 Gerar Relatório em PDF", disabled=True):
+        st.info("🔄 Funcionalidade em desenvolvimento - Em breve!")
+
+def gestao_jogos():
+    """Gestão simples de jogos"""
+    dados = carregar_dados()
+    
+    st.title("⚽ Gestão de Jogos")
+    
+    tab1, tab2, tab3 = st.tabs(["📋 Jogos Agendados", "➕ Novo Jogo", "📊 Fichas de Jogo"])
+    
+    with tab1:
+        jogos = dados.get('jogos', [])
+        
+        if jogos:
+            # Separar jogos passados e futuros
+            hoje = str(date.today())
+            jogos_futuros = [j for j in jogos if j.get('data', '') >= hoje]
+            jogos_passados = [j for j in jogos if j.get('data', '') < hoje]
+            
+            if jogos_futuros:
+                st.subheader("📅 Próximos Jogos")
+                for i, jogo in enumerate(sorted(jogos_futuros, key=lambda x: x.get('data', ''))):
+                    jogo_id = f"jogo_futuro_{i}"
+                    with st.expander(f"⚽ vs {jogo.get('adversario', 'TBD')} - {jogo.get('data')}"):
+                        col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+                        with col1:
+                            st.write(f"**📅 Data:** {jogo.get('data')}")
+                            st.write(f"**🕐 Hora:** {jogo.get('hora')}")
+                        with col2:
+                            st.write(f"**🆚 Adversário:** {jogo.get('adversario', 'TBD')}")
+                            st.write(f"**🎯 Tipo:** {jogo.get('tipo', 'Jogo')}")
+                        with col3:
+                            st.write(f"**📍 Local:** {jogo.get('local', 'TBD')}")
+                            
+                            # Mostrar esquema tático se definido
+                            esquema_id = jogo.get('esquema_tatico_id')
+                            if esquema_id:
+                                esquemas = carregar_esquemas_taticos()
+                                esquema = next((e for e in esquemas if e.get('id') == esquema_id), None)
+                                if esquema:
+                                    st.write(f"**🎯 Esquema:** {esquema.get('formacao', 'N/A')}")
+                                else:
+                                    st.write("**🎯 Esquema:** Não encontrado")
+                            else:
+                                st.write("**🎯 Esquema:** Não definido")
+                        with col4:
+                            st.write("**🔧 Ações:**")
+                        
+                        if jogo.get('convocados'):
+                            st.write(f"**👥 Convocados ({len(jogo['convocados'])}):**")
+                            cols = st.columns(3)
+                            for idx, convocado in enumerate(jogo['convocados']):
+                                cols[idx % 3].write(f"• {convocado}")
+                        
+                        # Botões de ação
+                        col_edit_jogo, col_delete_jogo, col_ficha_jogo = st.columns(3)
+                        
+                        with col_edit_jogo:
+                            if st.button(f"✏️ Editar", key=f"edit_{jogo_id}"):
+                                st.session_state[f"editing_{jogo_id}"] = True
+                                st.session_state[f"jogo_index_{jogo_id}"] = jogos.index(jogo)
+                                st.rerun()
+                        
+                        with col_delete_jogo:
+                            if st.button(f"🗑️ Remover", key=f"delete_{jogo_id}"):
+                                dados['jogos'].remove(jogo)
+                                if salvar_dados(dados):
+                                    st.success(f"✅ Jogo removido!")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao remover jogo")
+                        
+                        with col_ficha_jogo:
+                            if st.button(f"📋 Ficha", key=f"ficha_{jogo_id}"):
+                                st.session_state[f"mostrar_ficha_{jogo_id}"] = True
+                                st.session_state[f"jogo_ficha_index_{jogo_id}"] = jogos.index(jogo)
+                                st.rerun()
+                        
+                        # Mostrar ficha de jogo (se ativada)
+                        if st.session_state.get(f"mostrar_ficha_{jogo_id}", False):
+                            st.write("---")
+                            jogo_index = st.session_state.get(f"jogo_ficha_index_{jogo_id}", 0)
+                            mostrar_ficha_jogo(jogo, jogo_index, dados)
+                            
+                            if st.button(f"❌ Fechar Ficha", key=f"close_ficha_{jogo_id}"):
+                                del st.session_state[f"mostrar_ficha_{jogo_id}"]
+                                del st.session_state[f"jogo_ficha_index_{jogo_id}"]
+                                st.rerun()
+                        
+                        # Formulário de edição (se ativado)
+                        if st.session_state.get(f"editing_{jogo_id}", False):
+                            st.write("---")
+                            st.write("**✏️ Editando Jogo:**")
+                            
+                            with st.form(f"edit_jogo_{jogo_id}"):
+                                edit_col1, edit_col2 = st.columns(2)
+                                
+                                with edit_col1:
+                                    nova_data = st.date_input("Data do Jogo", value=converter_data_jogo(jogo.get('data')))
+                                    nova_hora = st.time_input("Hora do Jogo", value=converter_hora_jogo(jogo.get('hora')))
+                                    novo_adversario = st.text_input("Adversário", value=jogo.get('adversario', ''))
+                                
+                                with edit_col2:
+                                    novo_local = st.text_input("Local", value=jogo.get('local', ''))
+                                    novo_tipo = st.selectbox("Tipo", ["Jogo", "Treino", "Amigável", "Taça"], 
+                                        index=["Jogo", "Treino", "Amigável", "Taça"].index(jogo.get('tipo', 'Jogo')) if jogo.get('tipo') in ["Jogo", "Treino", "Amigável", "Taça"] else 0)
+                                    novo_resultado = st.text_input("Resultado (opcional)", value=jogo.get('resultado', '') or '')
+                                
+                                # Seleção de convocados
+                                jogadores_disponiveis = dados.get('jogadores', [])
+                                if jogadores_disponiveis:
+                                    nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores_disponiveis]
+                                    # Filtrar convocados existentes para evitar erro
+                                    convocados_atuais = jogo.get('convocados', [])
+                                    convocados_validos = [nome for nome in convocados_atuais if nome in nomes_jogadores]
+                                    novos_convocados = st.multiselect("Jogadores Convocados", nomes_jogadores, default=convocados_validos)
+                                else:
+                                    novos_convocados = []
+                                
+                                # Seleção de esquema tático
+                                esquemas_disponiveis = carregar_esquemas_taticos()
+                                esquemas_ativos = [e for e in esquemas_disponiveis if e.get('ativo', True)]
+                                
+                                esquema_atual_id = jogo.get('esquema_tatico_id')
+                                esquema_atual_index = 0
+                                opcoes_esquemas = [None] + esquemas_ativos
+                                
+                                # Encontrar índice do esquema atual
+                                if esquema_atual_id:
+                                    for idx, esquema in enumerate(esquemas_ativos):
+                                        if esquema.get('id') == esquema_atual_id:
+                                            esquema_atual_index = idx + 1  # +1 por causa do None
+                                            break
+                                
+                                novo_esquema = st.selectbox(
+                                    "🎯 Esquema Tático:",
+                                    options=opcoes_esquemas,
+                                    index=esquema_atual_index,
+                                    format_func=lambda x: "-- Nenhum esquema --" if x is None else f"{x.get('nome', 'Sem nome')} ({x.get('formacao', 'N/A')})"
+                                )
+                                
+                                col_save_jogo, col_cancel_jogo = st.columns(2)
+                                
+                                with col_save_jogo:
+                                    save_jogo = st.form_submit_button("💾 Salvar Alterações")
+                                
+                                with col_cancel_jogo:
+                                    cancel_jogo = st.form_submit_button("❌ Cancelar")
+                                
+                                if save_jogo:
+                                    jogo_index = st.session_state.get(f"jogo_index_{jogo_id}", 0)
+                                    
+                                    # Atualizar dados do jogo
+                                    dados['jogos'][jogo_index].update({
+                                        'data': str(nova_data),
+                                        'hora': str(nova_hora),
+                                        'adversario': novo_adversario,
+                                        'local': novo_local,
+                                        'tipo': novo_tipo,
+                                        'convocados': novos_convocados,
+                                        'resultado': novo_resultado if novo_resultado else None,
+                                        'esquema_tatico_id': novo_esquema.get('id') if novo_esquema else None
+                                    })
+                                    
+                                    if salvar_dados(dados):
+                                        st.success("✅ Jogo atualizado com sucesso!")
+                                        del st.session_state[f"editing_{jogo_id}"]
+                                        del st.session_state[f"jogo_index_{jogo_id}"]
+                                        st.rerun()
+                                    else:
+                                        st.error("❌ Erro ao salvar alterações")
+                                
+                                if cancel_jogo:
+                                    del st.session_state[f"editing_{jogo_id}"]
+                                    if f"jogo_index_{jogo_id}" in st.session_state:
+                                        del st.session_state[f"jogo_index_{jogo_id}"]
+                                    st.rerun()
+            
+            if jogos_passados:
+                st.subheader("📚 Jogos Anteriores")
+                for i, jogo in enumerate(sorted(jogos_passados, key=lambda x: x.get('data', ''), reverse=True)[:10]):
+                    jogo_id = f"jogo_passado_{i}"
+                    with st.expander(f"⚽ vs {jogo.get('adversario', 'TBD')} - {jogo.get('data')}"):
+                        col1, col2, col3 = st.columns([2, 2, 2])
+                        with col1:
+                            st.write(f"**📅 Data:** {jogo.get('data')}")
+                            st.write(f"**🕐 Hora:** {jogo.get('hora')}")
+                        with col2:
+                            st.write(f"**🆚 Adversário:** {jogo.get('adversario', 'TBD')}")
+                            st.write(f"**📍 Local:** {jogo.get('local', 'TBD')}")
+                        with col3:
+                            resultado = jogo.get('resultado', 'Sem resultado')
+                            st.write(f"**📊 Resultado:** {resultado}")
+                            st.write(f"**🎯 Tipo:** {jogo.get('tipo', 'Jogo')}")
+                        
+                        if jogo.get('convocados'):
+                            st.write(f"**👥 Convocados ({len(jogo['convocados'])}):**")
+                            cols = st.columns(3)
+                            for idx, convocado in enumerate(jogo['convocados']):
+                                cols[idx % 3].write(f"• {convocado}")
+                        
+                        # Botões de ação
+                        col_edit_jogo_p, col_delete_jogo_p, col_ficha_jogo_p = st.columns(3)
+                        
+                        with col_edit_jogo_p:
+                            if st.button(f"✏️ Editar", key=f"edit_{jogo_id}"):
+                                st.session_state[f"editing_{jogo_id}"] = True
+                                st.session_state[f"jogo_index_{jogo_id}"] = jogos.index(jogo)
+                                st.rerun()
+                        
+                        with col_delete_jogo_p:
+                            if st.button(f"🗑️ Remover", key=f"delete_{jogo_id}"):
+                                dados['jogos'].remove(jogo)
+                                if salvar_dados(dados):
+                                    st.success(f"✅ Jogo removido!")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao remover jogo")
+                        
+                        with col_ficha_jogo_p:
+                            if st.button(f"📋 Ficha", key=f"ficha_{jogo_id}"):
+                                st.session_state[f"mostrar_ficha_{jogo_id}"] = True
+                                st.session_state[f"jogo_ficha_index_{jogo_id}"] = jogos.index(jogo)
+                                st.rerun()
+                        
+                        # Mostrar ficha de jogo (se ativada)
+                        if st.session_state.get(f"mostrar_ficha_{jogo_id}", False):
+                            st.write("---")
+                            jogo_index = st.session_state.get(f"jogo_ficha_index_{jogo_id}", 0)
+                            mostrar_ficha_jogo(jogo, jogo_index, dados)
+                            
+                            if st.button(f"❌ Fechar Ficha", key=f"close_ficha_{jogo_id}"):
+                                del st.session_state[f"mostrar_ficha_{jogo_id}"]
+                                del st.session_state[f"jogo_ficha_index_{jogo_id}"]
+                                st.rerun()
+                        
+                        # Formulário de edição (se ativado)
+                        if st.session_state.get(f"editing_{jogo_id}", False):
+                            st.write("---")
+                            st.write("**✏️ Editando Jogo:**")
+                            
+                            with st.form(f"edit_jogo_{jogo_id}"):
+                                edit_col1, edit_col2 = st.columns(2)
+                                
+                                with edit_col1:
+                                    nova_data = st.date_input("Data do Jogo", value=converter_data_jogo(jogo.get('data')))
+                                    nova_hora = st.time_input("Hora do Jogo", value=converter_hora_jogo(jogo.get('hora')))
+                                    novo_adversario = st.text_input("Adversário", value=jogo.get('adversario', ''))
+                                
+                                with edit_col2:
+                                    novo_local = st.text_input("Local", value=jogo.get('local', ''))
+                                    novo_tipo = st.selectbox("Tipo", ["Jogo", "Treino", "Amigável", "Taça"], 
+                                        index=["Jogo", "Treino", "Amigável", "Taça"].index(jogo.get('tipo', 'Jogo')) if jogo.get('tipo') in ["Jogo", "Treino", "Amigável", "Taça"] else 0)
+                                    novo_resultado = st.text_input("Resultado", value=jogo.get('resultado', '') or '')
+                                
+                                # Seleção de convocados
+                                jogadores_disponiveis = dados.get('jogadores', [])
+                                if jogadores_disponiveis:
+                                    nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores_disponiveis]
+                                    # Filtrar convocados existentes para evitar erro
+                                    convocados_atuais = jogo.get('convocados', [])
+                                    convocados_validos = [nome for nome in convocados_atuais if nome in nomes_jogadores]
+                                    novos_convocados = st.multiselect("Jogadores Convocados", nomes_jogadores, default=convocados_validos)
+                                else:
+                                    novos_convocados = []
+                                
+                                col_save_jogo_p, col_cancel_jogo_p = st.columns(2)
+                                
+                                with col_save_jogo_p:
+                                    save_jogo_p = st.form_submit_button("💾 Salvar Alterações")
+                                
+                                with col_cancel_jogo_p:
+                                    cancel_jogo_p = st.form_submit_button("❌ Cancelar")
+                                
+                                if save_jogo_p:
+                                    jogo_index = st.session_state.get(f"jogo_index_{jogo_id}", 0)
+                                    
+                                    # Atualizar dados do jogo
+                                    dados['jogos'][jogo_index].update({
+                                        'data': str(nova_data),
+                                        'hora': str(nova_hora),
+                                        'adversario': novo_adversario,
+                                        'local': novo_local,
+                                        'tipo': novo_tipo,
+                                        'convocados': novos_convocados,
+                                        'resultado': novo_resultado if novo_resultado else None
+                                        # Nota: esquema tático será adicionado na próxima versão para jogos passados
+                                    })
+                                    
+                                    if salvar_dados(dados):
+                                        st.success("✅ Jogo atualizado com sucesso!")
+                                        del st.session_state[f"editing_{jogo_id}"]
+                                        del st.session_state[f"jogo_index_{jogo_id}"]
+                                        st.rerun()
+                                    else:
+                                        st.error("❌ Erro ao salvar alterações")
+                                
+                                if cancel_jogo_p:
+                                    del st.session_state[f"editing_{jogo_id}"]
+                                    if f"jogo_index_{jogo_id}" in st.session_state:
+                                        del st.session_state[f"jogo_index_{jogo_id}"]
+                                    st.rerun()
+        else:
+            st.info("📝 Nenhum jogo agendado ainda")
+    
+    with tab2:
+        st.subheader("➕ Agendar Novo Jogo")
+        
+        with st.form("novo_jogo"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                data_jogo = st.date_input("Data do Jogo*", value=date.today())
+                hora_jogo = st.time_input("Hora do Jogo*")
+                adversario = st.text_input("Adversário*", placeholder="Ex: FC Porto")
+            
+            with col2:
+                local_jogo = st.text_input("Local*", placeholder="Ex: Estádio Municipal")
+                tipo_jogo = st.selectbox("Tipo", ["Jogo", "Treino", "Amigável", "Taça"])
+            
+            # Seleção de convocados
+            jogadores = dados.get('jogadores', [])
+            if jogadores:
+                st.subheader("👥 Selecionar Convocados")
+                nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores]
+                convocados = st.multiselect("Jogadores Convocados", nomes_jogadores)
+            else:
+                convocados = []
+                st.info("ℹ️ Cadastre jogadores primeiro para poder convocá-los")
+            
+            # Seleção de esquema tático
+            esquemas_disponiveis = carregar_esquemas_taticos()
+            esquemas_ativos = [e for e in esquemas_disponiveis if e.get('ativo', True)]
+            
+            if esquemas_ativos:
+                st.subheader("🎯 Esquema Tático")
+                opcoes_esquemas = [None] + esquemas_ativos
+                esquema_selecionado = st.selectbox(
+                    "Escolher Esquema Tático (opcional):",
+                    options=opcoes_esquemas,
+                    format_func=lambda x: "-- Nenhum esquema --" if x is None else f"{x.get('nome', 'Sem nome')} ({x.get('formacao', 'N/A')})",
+                    help="Selecione um esquema tático para este jogo"
+                )
+            else:
+                esquema_selecionado = None
+                st.info("💡 **Dica**: Crie esquemas táticos na seção 'Esquemas Táticos' para usar nos jogos!")
+            
+            submitted = st.form_submit_button("💾 Agendar Jogo")
+            
+            if submitted:
+                if data_jogo and hora_jogo and adversario and local_jogo:
+                    novo_jogo = {
+                        "data": str(data_jogo),
+                        "hora": str(hora_jogo),
+                        "adversario": adversario,
+                        "local": local_jogo,
+                        "tipo": tipo_jogo,
+                        "convocados": convocados,
+                        "resultado": None,
+                        "esquema_tatico_id": esquema_selecionado.get('id') if esquema_selecionado else None
+                    }
+                    
+                    dados['jogos'].append(novo_jogo)
+                    
+                    if salvar_dados(dados):
+                        st.success("✅ Jogo agendado com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao salvar jogo")
+                else:
+                    st.error("❌ Preencha todos os campos obrigatórios (*)")
+    
+    with tab3:
+        st.subheader("📊 Fichas de Jogo - Resumo")
+        
+        jogos = dados.get('jogos', [])
+        if not jogos:
+            st.info("📝 Nenhum jogo cadastrado ainda")
+            return
+        
+        # Separar jogos com e sem ficha
+        jogos_com_fichas = []
+        jogos_sem_fichas = []
+        
+        for i, jogo in enumerate(jogos):
+            ficha_key = f"ficha_jogo_{i}"
+            if ficha_key in jogo:
+                jogos_com_fichas.append((i, jogo))
+            else:
+                jogos_sem_fichas.append((i, jogo))
+        
+        # SEÇÃO 1: Mostrar jogos que FALTAM fichas (principalmente passados)
+        if jogos_sem_fichas:
+            st.warning("⚠️ Fichas de Jogo Pendentes")
+            
+            # Separar jogos passados de futuros
+            hoje = str(date.today())
+            jogos_passados_sem_ficha = [(i, j) for i, j in jogos_sem_fichas if j.get('data', '') < hoje]
+            jogos_futuros_sem_ficha = [(i, j) for i, j in jogos_sem_fichas if j.get('data', '') >= hoje]
+            
+            # Mostrar jogos PASSADOS sem ficha (prioritários para preencher retroativamente)
+            if jogos_passados_sem_ficha:
+                st.subheader("🔴 Jogos Anteriores SEM Ficha (Retroativos)")
+                
+                for jogo_index, jogo in sorted(jogos_passados_sem_ficha, key=lambda x: x[1].get('data', ''), reverse=True):
+                    col1, col2, col3 = st.columns([3, 1, 1])
+                    
+                    with col1:
+                        st.write(f"⚽ **vs {jogo.get('adversario')}** - {jogo.get('data')} ({jogo.get('hora')})")
+                        st.caption(f"📍 {jogo.get('local')} | 🎯 {jogo.get('tipo')}")
+                    
+                    with col2:
+                        resultado = jogo.get('resultado', 'Sem resultado')
+                        st.write(f"**Resultado:** {resultado}")
+                    
+                    with col3:
+                        if st.button(f"📋 Preencher", key=f"preencher_retroativo_{jogo_index}"):
+                            st.session_state[f"preenchendo_retroativo_{jogo_index}"] = True
+                            st.rerun()
+                    
+                    # Mostrar ficha para preenchimento retroativo
+                    if st.session_state.get(f"preenchendo_retroativo_{jogo_index}", False):
+                        st.write("---")
+                        st.info("📝 Preencha a ficha com as estatísticas do jogo passado. Ao salvar, as estatísticas dos jogadores serão atualizadas retroativamente.")
+                        
+                        mostrar_ficha_jogo(jogo, jogo_index, dados)
+                        
+                        if st.button(f"❌ Cancelar", key=f"cancel_retroativo_{jogo_index}"):
+                            if f"preenchendo_retroativo_{jogo_index}" in st.session_state:
+                                del st.session_state[f"preenchendo_retroativo_{jogo_index}"]
+                            st.rerun()
+                    
+                    st.divider()
+            
+            # Mostrar jogos FUTUROS sem ficha (normalmente)
+            if jogos_futuros_sem_ficha:
+                st.subheader("🟡 Próximos Jogos (SEM Ficha Preenchida Ainda)")
+                st.info("💡 Clique em '📋 Ficha' para preencher estatísticas em tempo real durante o jogo.")
+                
+                for jogo_index, jogo in sorted(jogos_futuros_sem_ficha, key=lambda x: x[1].get('data', '')):
+                    col1, col2, col3 = st.columns([3, 1, 1])
+                    
+                    with col1:
+                        st.write(f"⚽ **vs {jogo.get('adversario')}** - {jogo.get('data')} ({jogo.get('hora')})")
+                        st.caption(f"📍 {jogo.get('local')} | 🎯 {jogo.get('tipo')}")
+                    
+                    with col2:
+                        resultado = jogo.get('resultado', 'TBD')
+                        st.write(f"**Resultado:** {resultado}")
+                    
+                    with col3:
+                        if st.button(f"📋 Ficha", key=f"ficha_futuro_{jogo_index}"):
+                            st.session_state[f"mostrar_ficha_futuro_{jogo_index}"] = True
+                            st.rerun()
+                    
+                    # Mostrar ficha para jogo futuro
+                    if st.session_state.get(f"mostrar_ficha_futuro_{jogo_index}", False):
+                        st.write("---")
+                        st.info("📝 Preencha a ficha com **as estatísticas em TEMPO REAL** durante o jogo. Os dados serão salvos automaticamente.")
+                        
+                        mostrar_ficha_jogo(jogo, jogo_index, dados)
+                        
+                        if st.button(f"❌ Fechar Ficha", key=f"close_ficha_futuro_{jogo_index}"):
+                            if f"mostrar_ficha_futuro_{jogo_index}" in st.session_state:
+                                del st.session_state[f"mostrar_ficha_futuro_{jogo_index}"]
+                            st.rerun()
+                    
+                    st.divider()
+        
+        st.divider()
+        
+        # SEÇÃO 2: Mostrar fichas já preenchidas
+        
+        if jogos_com_fichas:
+            st.write(f"**✅ {len(jogos_com_fichas)} jogo(s) com ficha completa:**")
+            
+            for jogo_index, jogo in jogos_com_fichas:
+                ficha_key = f"ficha_jogo_{jogo_index}"
+                ficha = jogo[ficha_key]
+                
+                with st.expander(f"📋 vs {jogo.get('adversario')} - {jogo.get('data')} ({ficha['jogo_info'].get('resultado_final', 'Sem resultado')})"):
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.write("**📊 Estatísticas da Equipa:**")
+                        total_golos = sum(stats.get('golos', 0) for stats in ficha['jogadores_estatisticas'].values())
+                        total_assistencias = sum(stats.get('assistencias', 0) for stats in ficha['jogadores_estatisticas'].values())
+                        st.metric("⚽ Golos", total_golos)
+                        st.metric("🎯 Assistências", total_assistencias)
+                    
+                    with col2:
+                        st.write("**⚡ Disciplina:**")
+                        total_amarelos = sum(stats.get('cartao_amarelo', 0) for stats in ficha['jogadores_estatisticas'].values())
+                        total_vermelhos = sum(stats.get('cartao_vermelho', 0) for stats in ficha['jogadores_estatisticas'].values())
+                        st.metric("🟨 Cartões Amarelos", total_amarelos)
+                        st.metric("🟥 Cartões Vermelhos", total_vermelhos)
+                    
+                    with col3:
+                        st.write("**👥 Utilização:**")
+                        titulares = len([s for s in ficha['jogadores_estatisticas'].values() if s.get('titular', False)])
+                        substituicoes = len(ficha['substituicoes'])
+                        st.metric("⭐ Titulares", titulares)
+                        st.metric("🔄 Substituições", substituicoes)
+                    
+                    # Melhor jogador
+                    if ficha['jogadores_estatisticas']:
+                        melhor = max(ficha['jogadores_estatisticas'].items(), key=lambda x: x[1].get('nota', 0))
+                        st.write(f"🏆 **Melhor Jogador:** {melhor[0]} (Nota: {melhor[1].get('nota', 0)})")
+                    
+                    # Botão para ver ficha completa
+                    if st.button(f"📋 Ver Ficha Completa", key=f"ver_ficha_{jogo_index}"):
+                        st.session_state[f"mostrar_ficha_jogo_passado_{jogo_index}"] = True
+                        st.rerun()
+                    
+                    # Mostrar ficha completa se solicitado
+                    if st.session_state.get(f"mostrar_ficha_jogo_passado_{jogo_index}", False):
+                        st.write("---")
+                        mostrar_ficha_jogo(jogo, jogo_index, dados)
+                        
+                        if st.button(f"❌ Fechar", key=f"close_ficha_passado_{jogo_index}"):
+                            del st.session_state[f"mostrar_ficha_jogo_passado_{jogo_index}"]
+                            st.rerun()
+        else:
+            st.info("📝 Nenhuma ficha de jogo preenchida ainda")
+            st.write("💡 **Dica:** Acesse um jogo na aba 'Jogos Agendados' e clique em '📋 Ficha' para começar a preencher estatísticas.")
+
+# === FUNÇÕES DE SUBMENU REORGANIZADO ===
+def mostrar_submenu_jogos_competicoes():
+    """Submenu reorganizado para Jogos & Competições"""
+    st.markdown("### ⚽ Jogos & Competições")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("⚽ Jogos Regulares", use_container_width=True, help="Criar e gerir jogos regulares"):
+            st.session_state.pagina_atual = "jogos"
+            st.rerun()
+    
+    with col2:
+        if st.button("🏆 Campeonato", use_container_width=True, help="Ver campeonato distrital"):
+            st.session_state.pagina_atual = "campeonato"
+            st.rerun()
+    
+    with col3:
+        if st.button("🏅 Taça", use_container_width=True, help="Competições de taça"):
+            st.session_state.pagina_atual = "taca"
+            st.rerun()
@@ -0,0 +1,625 @@
+"""
+Mensagens
+Mensagens entre treinadores e jogadores
+"""
+
+import streamlit as st
+from datetime import datetime
+
+from app_core import carregar_dados
+
+
+def sistema_mensagens_treinador():
+    """Sistema de mensagens privadas para treinador"""
+    dados = carregar_dados()
+    
+    st.title("💬 Sistema de Mensagens Privadas")
+    
+    tab1, tab2, tab3 = st.tabs(["📤 Enviar Mensagem", "📨 Mensagens Enviadas", "⚙️ Configurações"])
+    
+    with tab1:
+        st.subheader("📤 Nova Mensagem")
+        
+        # Opções de destinatários
+        jogadores = dados.get('jogadores', [])
+        
+        if not jogadores:
+            st.warning("⚠️ Nenhum jogador cadastrado")
+            return
+        
+        # Tipo de envio
+        tipo_envio = st.radio("Para quem enviar:", 
+                             ["📢 Todos os jogadores", "🎯 Jogador específico", "👥 Grupo selecionado"])
+        
+        destinatarios = []
+        
+        if tipo_envio == "📢 Todos os jogadores":
+            destinatarios = [j for j in jogadores if j.get('email')]
+            st.info(f"✉️ Mensagem será enviada para {len(destinatarios)} jogadores com email")
+        
+        elif tipo_envio == "🎯 Jogador específico":
+            jogadores_com_email = [j for j in jogadores if j.get('email')]
+            if jogadores_com_email:
+                opcoes_jogadores = [f"{j.get('nome')} ({j.get('email')})" for j in jogadores_com_email]
+                jogador_idx = st.selectbox("Selecione o jogador:", range(len(opcoes_jogadores)),
+                                         format_func=lambda x: opcoes_jogadores[x])
+                destinatarios = [jogadores_com_email[jogador_idx]]
+            else:
+                st.warning("⚠️ Nenhum jogador tem email cadastrado")
+                return
+        
+        elif tipo_envio == "👥 Grupo selecionado":
+            jogadores_com_email = [j for j in jogadores if j.get('email')]
+            if jogadores_com_email:
+                st.write("Selecione os jogadores:")
+                selecionados = []
+                for j in jogadores_com_email:
+                    if st.checkbox(f"{j.get('nome')} ({j.get('email')})", key=f"sel_{j.get('login')}"):
+                        selecionados.append(j)
+                destinatarios = selecionados
+                
+                if destinatarios:
+                    st.success(f"✅ {len(destinatarios)} jogadores selecionados")
+                else:
+                    st.info("ℹ️ Nenhum jogador selecionado")
+            else:
+                st.warning("⚠️ Nenhum jogador tem email cadastrado")
+                return
+        
+        if destinatarios:
+            st.divider()
+            
+            # Formulário da mensagem
+            with st.form("form_mensagem"):
+                assunto = st.text_input("📌 Assunto:", placeholder="Digite o assunto da mensagem...")
+                
+                tipo_mensagem = st.selectbox("🎯 Tipo de mensagem:", 
+                                           ["💬 Mensagem Geral", "🏃 Informação de Treino", 
+                                            "⚽ Informação de Jogo", "📢 Comunicado Importante"])
+                
+                prioridade = st.selectbox("⚡ Prioridade:", ["📨 Normal", "⚠️ Importante", "🚨 Urgente"])
+                
+                mensagem = st.text_area("✍️ Mensagem:", height=200, 
+                                      placeholder="Digite sua mensagem aqui...")
+                
+                anexar_info = st.checkbox("📎 Anexar informações do clube")
+                
+                enviar = st.form_submit_button("📤 Enviar Mensagem", type="primary")
+                
+                if enviar:
+                    if not assunto or not mensagem:
+                        st.error("❌ Assunto e mensagem são obrigatórios!")
+                    else:
+                        enviar_mensagem_privada(destinatarios, assunto, mensagem, tipo_mensagem, 
+                                               prioridade, anexar_info)
+    
+    with tab2:
+        st.subheader("📨 Histórico de Mensagens Enviadas")
+        
+        # Carregar histórico de mensagens (simulado)
+        if 'historico_mensagens' not in st.session_state:
+            st.session_state['historico_mensagens'] = []
+        
+        if st.session_state['historico_mensagens']:
+            for i, msg in enumerate(st.session_state['historico_mensagens'][-10:]):  # Últimas 10
+                with st.expander(f"📨 {msg['assunto']} - {msg['data']}"):
+                    st.write(f"**Para:** {', '.join(msg['destinatarios'])}")
+                    st.write(f"**Tipo:** {msg['tipo']}")
+                    st.write(f"**Prioridade:** {msg['prioridade']}")
+                    st.write(f"**Mensagem:** {msg['mensagem']}")
+        else:
+            st.info("📭 Nenhuma mensagem enviada ainda")
+    
+    with tab3:
+        st.subheader("⚙️ Configurações de Mensagens")
+        
+        st.write("**📧 Configurações de Email**")
+        
+        # Opções de configuração
+        assinatura_auto = st.checkbox("✍️ Incluir assinatura automática", value=True)
+        
+        if assinatura_auto:
+            assinatura = st.text_area("📝 Assinatura:", value="""
+---
+FC Pinheirense - Equipa Técnica
+📧 Email: treinador@fcpinheirense.pt
+📱 Telefone: +351 XXX XXX XXX
+⚽ Juntos somos mais fortes!
+            """.strip())
+        
+        confirmacao_leitura = st.checkbox("📬 Solicitar confirmação de leitura", value=False)
+        
+        if st.button("💾 Salvar Configurações"):
+            # Salvar configurações (implementar depois)
+            st.success("✅ Configurações salvas!")
+
+def mensagens_jogador():
+    """Visualizar mensagens para jogador"""
+    dados = carregar_dados()
+    usuario_login = st.session_state.get('usuario_logado')
+    
+    # Encontrar dados do jogador
+    jogador = None
+    for j in dados.get('jogadores', []):
+        if j.get('login') == usuario_login:
+            jogador = j
+            break
+    
+    if not jogador:
+        st.error("❌ Dados do jogador não encontrados!")
+        return
+    
+    st.title("📩 Minhas Mensagens")
+    
+    # Simular mensagens (em uma implementação real, viria do banco de dados)
+    if 'mensagens_jogador' not in st.session_state:
+        st.session_state['mensagens_jogador'] = []
+    
+    # Filtrar mensagens para este jogador (simulado)
+    minhas_mensagens = []
+    for msg in st.session_state.get('historico_mensagens', []):
+        if jogador.get('email') in msg.get('emails_destinatarios', []):
+            minhas_mensagens.append(msg)
+    
+    if minhas_mensagens:
+        st.success(f"📬 Você tem {len(minhas_mensagens)} mensagens")
+        
+        for i, msg in enumerate(reversed(minhas_mensagens)):  # Mais recentes primeiro
+            # Ícone de prioridade
+            icone_prioridade = {"📨 Normal": "📨", "⚠️ Importante": "⚠️", "🚨 Urgente": "🚨"}
+            prioridade_icone = icone_prioridade.get(msg['prioridade'], "📨")
+            
+            with st.expander(f"{prioridade_icone} {msg['assunto']} - {msg['data']}"):
+                st.write(f"**📤 De:** Equipa Técnica")
+                st.write(f"**📅 Data:** {msg['data']}")
+                st.write(f"**🎯 Tipo:** {msg['tipo']}")
+                st.write(f"**⚡ Prioridade:** {msg['prioridade']}")
+                
+                st.divider()
+                st.write(msg['mensagem'])
+                
+                # Botão para marcar como lida
+                if st.button(f"✅ Marcar como lida", key=f"lida_{i}"):
+                    st.success("✅ Mensagem marcada como lida!")
+    else:
+        st.info("📭 Você ainda não tem mensagens")
+        
+        # Mensagem de exemplo
+        with st.expander("📨 Mensagem de Boas-vindas"):
+            st.write("**📤 De:** Equipa Técnica")
+            st.write("**📅 Data:** Sistema")
+            st.write("**🎯 Tipo:** 💬 Mensagem Geral")
+            
+            st.divider()
+            st.write("""
+            Bem-vindo ao sistema de mensagens do FC Pinheirense! 
+            
+            Aqui você receberá:
+            🏃 Informações sobre treinos
+            ⚽ Convocações e detalhes de jogos
+            📢 Comunicados importantes da equipa
+            💬 Mensagens personalizadas do treinador
+            
+            Mantenha-se sempre atualizado!
+            
+            ---
+            FC Pinheirense - Equipa Técnica
+            """)
+
+def enviar_mensagem_privada(destinatarios, assunto, mensagem, tipo_mensagem, prioridade, anexar_info):
+    """Enviar mensagem privada para jogadores"""
+    try:
+        # Verificar se há email system disponível
+        try:
+            from nova_funcao_email import EmailSystem
+            email_system = EmailSystem()
+        except ImportError:
+            st.error("❌ Sistema de email não disponível")
+            return
+        
+        # Preparar lista de emails
+        emails_destinatarios = [j.get('email') for j in destinatarios if j.get('email')]
+        nomes_destinatarios = [j.get('nome') for j in destinatarios if j.get('nome')]
+        
+        if not emails_destinatarios:
+            st.error("❌ Nenhum email válido encontrado")
+            return
+        
+        # Criar corpo da mensagem HTML
+        html_mensagem = criar_html_mensagem(assunto, mensagem, tipo_mensagem, prioridade, anexar_info)
+        
+        # Enviar emails
+        sucessos = 0
+        erros = 0
+        
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        
+        for i, (email, nome) in enumerate(zip(emails_destinatarios, nomes_destinatarios)):
+            status_text.text(f"Enviando mensagem para {nome}...")
+            
+            sucesso, msg_erro = email_system.enviar_email(
+                email,
+                f"💬 {assunto}",
+                html_mensagem,
+                nome
+            )
+            
+            if sucesso:
+                sucessos += 1
+            else:
+                erros += 1
+            
+            progress_bar.progress((i + 1) / len(emails_destinatarios))
+        
+        status_text.empty()
+        progress_bar.empty()
+        
+        # Salvar no histórico
+        if 'historico_mensagens' not in st.session_state:
+            st.session_state['historico_mensagens'] = []
+        
+        nova_mensagem = {
+            'assunto': assunto,
+            'mensagem': mensagem,
+            'tipo': tipo_mensagem,
+            'prioridade': prioridade,
+            'destinatarios': nomes_destinatarios,
+            'emails_destinatarios': emails_destinatarios,
+            'data': datetime.now().strftime('%d/%m/%Y %H:%M'),
+            'sucessos': sucessos,
+            'erros': erros
+        }
+        
+        st.session_state['historico_mensagens'].append(nova_mensagem)
+        
+        # Mostrar resultado
+        if sucessos > 0:
+            st.success(f"✅ Mensagem enviada com sucesso para {sucessos} jogadores!")
+        if erros > 0:
+            st.error(f"❌ {erros} emails falharam")
+            
+    except Exception as e:
+        st.error(f"❌ Erro ao enviar mensagem: {e}")
+
+def criar_html_mensagem(assunto, mensagem, tipo_mensagem, prioridade, anexar_info):
+    """Criar HTML da mensagem - OTIMIZADO PARA MOBILE"""
+    
+    # Cores baseadas na prioridade
+    cores_prioridade = {
+        "📨 Normal": "#2196F3",
+        "⚠️ Importante": "#FF9800", 
+        "🚨 Urgente": "#F44336"
+    }
+    
+    cor_prioridade = cores_prioridade.get(prioridade, "#2196F3")
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <style>
+            * {{
+                box-sizing: border-box;
+                margin: 0;
+                padding: 0;
+            }}
+            
+            body {{
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                line-height: 1.6;
+                color: #333;
+                background-color: #f5f5f5;
+                padding: 10px;
+            }}
+            
+            .container {{
+                max-width: 100%;
+                margin: 0 auto;
+                background: white;
+                border-radius: 12px;
+                box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, {cor_prioridade}, #1976D2);
+                color: white;
+                padding: 20px 15px;
+                text-align: center;
+            }}
+            
+            .header h1 {{
+                font-size: 1.6em;
+                margin-bottom: 5px;
+                font-weight: 600;
+            }}
+            
+            .header h2 {{
+                font-size: 1.1em;
+                opacity: 0.95;
+                font-weight: 400;
+            }}
+            
+            .content {{
+                padding: 20px 15px;
+            }}
+            
+            .assunto {{
+                font-size: 1.3em;
+                font-weight: 600;
+                color: #2c3e50;
+                margin-bottom: 15px;
+                text-align: center;
+            }}
+            
+            .badges {{
+                text-align: center;
+                margin-bottom: 20px;
+            }}
+            
+            .prioridade {{
+                background: {cor_prioridade};
+                color: white;
+                padding: 8px 16px;
+                border-radius: 20px;
+                display: inline-block;
+                font-size: 0.9em;
+                font-weight: 600;
+                margin: 5px;
+            }}
+            
+            .tipo {{
+                background: #e3f2fd;
+                color: #1976d2;
+                padding: 8px 16px;
+                border-radius: 15px;
+                display: inline-block;
+                font-size: 0.9em;
+                font-weight: 500;
+                margin: 5px;
+            }}
+            
+            .mensagem {{
+                background: #f8f9fa;
+                padding: 20px 15px;
+                border-radius: 10px;
+                border-left: 4px solid {cor_prioridade};
+                margin: 20px 0;
+                white-space: pre-line;
+                line-height: 1.7;
+                font-size: 1.05em;
+            }}
+            
+            .info-clube {{
+                background: #e8f5e8;
+                padding: 15px;
+                border-radius: 8px;
+                margin-top: 20px;
+                border-left: 4px solid #4CAF50;
+            }}
+            
+            .info-clube h3 {{
+                color: #2e7d32;
+                margin-bottom: 10px;
+                font-size: 1.1em;
+            }}
+            
+            .info-item {{
+                margin: 8px 0;
+                display: flex;
+                align-items: center;
+                font-size: 0.95em;
+            }}
+            
+            .info-item strong {{
+                min-width: 80px;
+                color: #2e7d32;
+            }}
+            
+            .footer {{
+                background: #f8f9fa;
+                padding: 20px 15px;
+                text-align: center;
+                color: #666;
+                font-size: 0.9em;
+                border-top: 1px solid #e0e0e0;
+            }}
+            
+            .footer p {{
+                margin: 5px 0;
+            }}
+            
+            .logo-text {{
+                font-weight: bold;
+                color: #2196F3;
+            }}
+            
+            /* Media Queries para diferentes tamanhos */
+            
+            /* Smartphones pequenos */
+            @media (max-width: 360px) {{
+                body {{
+                    padding: 5px;
+                }}
+                
+                .header {{
+                    padding: 15px 10px;
+                }}
+                
+                .header h1 {{
+                    font-size: 1.4em;
+                }}
+                
+                .header h2 {{
+                    font-size: 1em;
+                }}
+                
+                .content {{
+                    padding: 15px 10px;
+                }}
+                
+                .assunto {{
+                    font-size: 1.2em;
+                }}
+                
+                .mensagem {{
+                    padding: 15px 10px;
+                    font-size: 1em;
+                }}
+                
+                .prioridade, .tipo {{
+                    padding: 6px 12px;
+                    font-size: 0.85em;
+                }}
+                
+                .info-clube {{
+                    padding: 12px;
+                }}
+            }}
+            
+            /* Smartphones médios */
+            @media (min-width: 361px) and (max-width: 480px) {{
+                .header h1 {{
+                    font-size: 1.5em;
+                }}
+                
+                .mensagem {{
+                    font-size: 1.02em;
+                }}
+            }}
+            
+            /* Tablets */
+            @media (min-width: 481px) and (max-width: 768px) {{
+                body {{
+                    padding: 15px;
+                }}
+                
+                .container {{
+                    border-radius: 15px;
+                }}
+                
+                .header {{
+                    padding: 25px 20px;
+                }}
+                
+                .header h1 {{
+                    font-size: 1.8em;
+                }}
+                
+                .header h2 {{
+                    font-size: 1.2em;
+                }}
+                
+                .content {{
+                    padding: 25px 20px;
+                }}
+                
+                .assunto {{
+                    font-size: 1.4em;
+                }}
+                
+                .mensagem {{
+                    padding: 20px;
+                    font-size: 1.1em;
+                }}
+            }}
+            
+            /* Desktop */
+            @media (min-width: 769px) {{
+                body {{
+                    padding: 20px;
+                }}
+                
+                .container {{
+                    max-width: 600px;
+                    border-radius: 15px;
+                }}
+                
+                .header {{
+                    padding: 30px;
+                }}
+                
+                .header h1 {{
+                    font-size: 2em;
+                }}
+                
+                .header h2 {{
+                    font-size: 1.3em;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                .assunto {{
+                    font-size: 1.5em;
+                }}
+                
+                .mensagem {{
+                    padding: 25px;
+                    font-size: 1.1em;
+                }}
+                
+                .info-clube {{
+                    padding: 20px;
+                }}
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>⚽ FC Pinheirense</h1>
+                <h2>💬 Mensagem da Equipa Técnica</h2>
+            
+            
+            <div class="content">
+                <div class="assunto">{assunto}
+                
+                <div class="badges">
+                    <span class="prioridade">{prioridade}</span>
+                    <span class="tipo">{tipo_mensagem}</span>
+                
+                
+                <div class="mensagem">
+                    {mensagem}
+                
+    """
+    
+    if anexar_info:
+        html += """
+                <div class="info-clube">
+                    <h3>📋 Informações do Clube</h3>
+                    <div class="info-item">
+                        <strong>📧 Email:</strong> geral@fcpinheirense.pt
+                    
+                    <div class="info-item">
+                        <strong>📱 Telefone:</strong> +351 XXX XXX XXX
+                    
+                    <div class="info-item">
+                    <div class="info-item">
+                        <strong>📍 Morada:</strong> Campo Municipal do Pinheiro
+                    </div>
+                    <div class="info-item">
+                        <strong>⚽ Treinos:</strong> Terças e Quintas às 19h30
+                    </div>
+                </div>
+        """
+    
+    html += """
+            </div>
+            </div>
+            
+            <div class="footer">
+                <p>🌟 <strong class="logo-text">FC Pinheirense</strong> - Juntos somos mais fortes! 🌟</p>
+                <p>Esta é uma mensagem automática. Não responda a este email.</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return html
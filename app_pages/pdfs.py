@@ -0,0 +1,1193 @@
+"""
+Documentos PDF da Equipa
+Lista de jogadores, convocatórias, folha de presença e tabela classificativa
+"""
+
+import streamlit as st
+from datetime import datetime
+from io import BytesIO
+
+from perf_metrics import medido
+from pdf_cache import pdf_em_cache
+from pdf_resources import recursos_pdf
+from attendance_matrix import MatrizPresencas
+from app_core import DIRETORIO_APP, PDF_DISPONIVEL, carregar_dados
+
+
+@medido('pdf')
+@pdf_em_cache(lambda dados: (dados.get('jogadores', []),), diario=True)
+def gerar_pdf_lista_jogadores(dados):
+    """Gera PDF profissional com lista completa de jogadores - Cabeçalho igual à convocatória"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível para geração de PDF")
+        st.info("💡 Para instalar: pip install reportlab")
+        return None, None
+    
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
+        from reportlab.lib.units import cm, mm, inch
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from io import BytesIO
+        from datetime import datetime
+        import os
+        
+        jogadores = dados.get('jogadores', [])
+        if not jogadores:
+            st.warning("⚠️ Nenhum jogador cadastrado para gerar PDF")
+            return None, None
+        
+        # Criar buffer em memória para o PDF
+        buffer = BytesIO()
+        
+        # Configurar documento PDF
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=15*mm,
+            bottomMargin=15*mm
+        )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas do clube - azul e branco
+        azul_clube = recursos.cores['azul_clube']
+        azul_claro = recursos.cores['azul_claro']
+        cinza_escuro = recursos.cores['cinza_escuro']
+        
+        # Estilos compactos
+        styles = recursos.estilos
+        
+        style_club_header = styles['ClubHeader']
+        
+        style_document_title = styles['DocumentTitle']
+        
+        style_competition = styles['Competition']
+        
+        # Criar conteúdo do PDF
+        story = []
+        
+        # === CABEÇALHO IGUAL À CONVOCATÓRIA ===
+        story.extend(recursos.cabecalho_clube())
+        
+        # Título principal
+        story.append(Paragraph("LISTA OFICIAL DE ATLETAS", style_document_title))
+        story.append(Spacer(1, 2))
+        
+        # Época
+        story.append(Paragraph(f"• ÉPOCA 25/26 •", style_competition))
+        
+        # Linha de separação
+        story.append(Spacer(1, 15))
+        
+        # Informações do documento (só a data: o PDF fica em cache durante o dia)
+        data_geracao = datetime.now().strftime('%d/%m/%Y')
+        info_style = ParagraphStyle(
+            'InfoStyle',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=1,
+            textColor=colors.HexColor('#566573')
+        )
+        
+        info_text = f"Documento gerado em {data_geracao} | Total de atletas: {len(jogadores)}"
+        story.append(Paragraph(info_text, info_style))
+        story.append(Spacer(1, 30))
+        
+        # Preparar dados para tabela principal com colunas organizadas
+        dados_tabela = [['#', 'NOME', 'POS.', 'Nº', 'IDADE', 'TELEMÓVEL', 'EMAIL']]
+        
+        # Ordenar jogadores por número da camisola
+        jogadores_ordenados = sorted(jogadores, key=lambda x: int(x.get('nr_camisola', 999)))
+        
+        for i, jogador in enumerate(jogadores_ordenados, 1):
+            nome = jogador.get('nome', 'N/A')
+            posicao = jogador.get('posicao', 'N/A')
+            numero = str(jogador.get('nr_camisola', 'N/A'))
+            idade = str(jogador.get('idade', 'N/A'))
+            telefone = jogador.get('telefone', 'N/A')
+            email = jogador.get('email', 'N/A')
+            
+            # Abreviar posição para caber melhor
+            pos_abrev = {
+                'Guarda-Redes': 'GR',
+                'Defesa': 'DEF',
+                'Meio-Campo': 'MC',
+                'Avançado': 'AV',
+                'Adjunto': 'ADJ'
+            }.get(posicao, posicao[:3])
+            
+            # Truncar dados longos de forma inteligente
+            if len(nome) > 20:
+                nome = nome[:17] + "..."
+            if len(email) > 25:
+                email = email[:22] + "..."
+                
+            dados_tabela.append([str(i), nome, pos_abrev, numero, idade, telefone, email])
+        
+        # Criar tabela com larguras proporcionais profissionais
+        larguras_col = [0.4*inch, 2.2*inch, 0.7*inch, 0.5*inch, 0.7*inch, 1.3*inch, 2.0*inch]
+        tabela_principal = Table(dados_tabela, colWidths=larguras_col)
+        
+        # Estilizar tabela com design profissional
+        tabela_principal.setStyle(TableStyle([
+            # Cabeçalho - estilo corporativo
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1B4F72')),  # Azul escuro
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            
+            # Corpo da tabela
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            
+            # Bordas profissionais
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#34495E')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            
+            # Alternância de cores profissional
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#F8F9FA'), colors.HexColor('#E8F4FD')]),
+            
+            # Alinhar coluna de nomes à esquerda
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),  # Nomes alinhados à esquerda
+            ('ALIGN', (6, 1), (6, -1), 'LEFT'),  # Emails alinhados à esquerda
+        ]))
+        
+        story.append(tabela_principal)
+        story.append(Spacer(1, 40))
+        
+        # Seção de dados físicos em tabela separada (mais compacta)
+        jogadores_com_dados_fisicos = [j for j in jogadores_ordenados if j.get('altura') or j.get('peso') or j.get('ultimo_clube')]
+        
+        if jogadores_com_dados_fisicos:
+            # Subtítulo para dados físicos
+            physical_title_style = ParagraphStyle(
+                'PhysicalTitle',
+                parent=styles['Heading3'],
+                fontSize=14,
+                spaceAfter=15,
+                textColor=colors.HexColor('#1B4F72'),
+                fontName='Helvetica-Bold'
+            )
+            
+            physical_title = Paragraph("DADOS FÍSICOS E HISTÓRICO", physical_title_style)
+            story.append(physical_title)
+            
+            dados_tabela_fisica = [['#', 'NOME', 'ALTURA', 'PESO', 'ÚLTIMO CLUBE']]
+            
+            for i, jogador in enumerate(jogadores_com_dados_fisicos, 1):
+                nome = jogador.get('nome', 'N/A')
+                altura = f"{jogador.get('altura', 'N/A')}m" if jogador.get('altura') else 'N/A'
+                peso = f"{jogador.get('peso', 'N/A')}kg" if jogador.get('peso') else 'N/A'
+                ultimo_clube = jogador.get('ultimo_clube', 'N/A')
+                
+                if len(nome) > 22:
+                    nome = nome[:19] + "..."
+                if len(ultimo_clube) > 18:
+                    ultimo_clube = ultimo_clube[:15] + "..."
+                    
+                dados_tabela_fisica.append([str(i), nome, altura, peso, ultimo_clube])
+            
+            larguras_fisica = [0.4*inch, 2.5*inch, 0.8*inch, 0.8*inch, 2.3*inch]
+            tabela_fisica = Table(dados_tabela_fisica, colWidths=larguras_fisica)
+            
+            tabela_fisica.setStyle(TableStyle([
+                # Cabeçalho verde profissional
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0E6B41')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('TOPPADDING', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+                
+                # Corpo
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 9),
+                ('TOPPADDING', (0, 1), (-1, -1), 6),
+                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+                
+                # Bordas e cores
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#34495E')),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#E8F6F3'), colors.HexColor('#D5F4E6')]),
+                
+                # Alinhar nomes à esquerda
+                ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+                ('ALIGN', (4, 1), (4, -1), 'LEFT'),
+            ]))
+            
+            story.append(tabela_fisica)
+            story.append(Spacer(1, 30))
+        
+        # Estatísticas em formato profissional
+        stats_title_style = ParagraphStyle(
+            'StatsTitle',
+            parent=styles['Heading3'],
+            fontSize=14,
+            spaceAfter=15,
+            textColor=colors.HexColor('#1B4F72'),
+            fontName='Helvetica-Bold'
+        )
+        
+        stats_title = Paragraph("ESTATÍSTICAS DA EQUIPA", stats_title_style)
+        story.append(stats_title)
+        
+        # Dados estatísticos
+        total_jogadores = len(jogadores)
+        jogadores_com_email = len([j for j in jogadores if j.get('email')])
+        jogadores_com_telefone = len([j for j in jogadores if j.get('telefone')])
+        
+        # Distribuição por posições
+        posicoes = {}
+        for jogador in jogadores:
+            pos = jogador.get('posicao', 'N/A')
+            posicoes[pos] = posicoes.get(pos, 0) + 1
+        
+        # Tabela de estatísticas
+        stats_data = [['CATEGORIA', 'QUANTIDADE', 'PERCENTAGEM']]
+        
+        stats_data.append(['Total de Atletas', str(total_jogadores), '100%'])
+        stats_data.append(['Com Email', str(jogadores_com_email), f'{round((jogadores_com_email/total_jogadores)*100, 1) if total_jogadores > 0 else 0}%'])
+        stats_data.append(['Com Telemóvel', str(jogadores_com_telefone), f'{round((jogadores_com_telefone/total_jogadores)*100, 1) if total_jogadores > 0 else 0}%'])
+        
+        # Adicionar distribuição por posições
+        for posicao, quantidade in sorted(posicoes.items()):
+            percentagem = f'{round((quantidade/total_jogadores)*100, 1) if total_jogadores > 0 else 0}%'
+            stats_data.append([posicao, str(quantidade), percentagem])
+        
+        stats_table = Table(stats_data, colWidths=[2.5*inch, 1*inch, 1*inch])
+        
+        stats_table.setStyle(TableStyle([
+            # Cabeçalho cinza profissional
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#566573')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            
+            # Corpo
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#34495E')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#F8F9FA'), colors.HexColor('#EAEDED')]),
+            
+            # Alinhar primeira coluna à esquerda
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+        ]))
+        
+        story.append(stats_table)
+        
+        # Footer profissional
+        story.append(Spacer(1, 40))
+        
+        footer_style = ParagraphStyle(
+            'FooterStyle',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=1,
+            textColor=colors.HexColor('#566573'),
+            fontName='Helvetica-Oblique'
+        )
+        
+        footer_text = f"""
+        <br/>
+        ─────────────────────────────────────────────────────────────────────────────────────<br/>
+        <b>F.C. PINHEIRENSE</b> | Temporada 2024/2025<br/>
+        Documento gerado automaticamente pelo App Treinador | {data_geracao}<br/>
+        © {datetime.now().year} - Todos os direitos reservados
+        """
+        
+        footer_paragraph = Paragraph(footer_text, footer_style)
+        story.append(footer_paragraph)
+        
+        # Construir PDF
+        doc.build(story)
+        
+        # Preparar para download
+        buffer.seek(0)
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        
+        timestamp = datetime.now().strftime('%Y%m%d')
+        filename = f"Lista_Oficial_FCPinheirense_{timestamp}.pdf"
+        
+        return pdf_bytes, filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF: {e}")
+        return None, None
+
+@medido('pdf')
+@pdf_em_cache(lambda dados, jogo_selecionado: (jogo_selecionado, dados.get('jogadores', [])), diario=True)
+def gerar_pdf_convocatoria(dados, jogo_selecionado):
+    """Gera PDF profissional da convocatória - Formato compacto e vertical"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível para geração de PDF")
+        return None, None
+    
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
+        from reportlab.lib.units import mm
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        import os
+        
+        # Dados do jogo
+        jogo_data = jogo_selecionado.get('data', 'Data não definida')
+        jogo_hora = jogo_selecionado.get('hora', 'Hora não definida')
+        jogo_adversario = jogo_selecionado.get('adversario', 'Adversário não definido')
+        jogo_local = jogo_selecionado.get('local', 'Local não definido')
+        jogo_competicao = jogo_selecionado.get('competicao', 'CAMPEONATO DISTRITAL - 2ª DIVISÃO ZONA CENTRO')
+        convocados_ids = jogo_selecionado.get('convocados', [])
+        
+        if not convocados_ids:
+            st.warning("⚠️ Nenhum jogador convocado para este jogo")
+            return None, None
+        
+        # Buscar dados dos jogadores convocados
+        jogadores = dados.get('jogadores', [])
+        convocados = []
+        for nome_convocado in convocados_ids:
+            for jogador in jogadores:
+                if jogador.get('nome', '').strip().lower() == nome_convocado.strip().lower():
+                    convocados.append(jogador)
+                    break
+        
+        if not convocados:
+            st.warning("⚠️ Nenhum jogador encontrado na lista de convocados")
+            return None, None
+        
+        # Criar buffer em memória para o PDF
+        buffer = BytesIO()
+        
+        # Configurar documento PDF - Formato vertical A4 compacto
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,  # Vertical por padrão
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=15*mm,
+            bottomMargin=15*mm
+        )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas do clube - azul e branco
+        azul_clube = recursos.cores['azul_clube']
+        azul_claro = recursos.cores['azul_claro']
+        cinza_escuro = recursos.cores['cinza_escuro']
+        
+        # Estilos compactos
+        styles = recursos.estilos
+        
+        style_club_header = styles['ClubHeader']
+        
+        style_document_title = styles['DocumentTitle']
+        
+        style_competition = styles['Competition']
+        
+        # Criar conteúdo do PDF
+        story = []
+        
+        # === CABEÇALHO COMPACTO ===
+        story.extend(recursos.cabecalho_clube())
+        
+        # Título principal compacto
+        story.append(Paragraph("CONVOCATÓRIA OFICIAL", style_document_title))
+        story.append(Spacer(1, 2))
+        
+        # Competição compacta
+        story.append(Paragraph(f"• {jogo_competicao.upper()} •", style_competition))
+        
+        # === INFORMAÇÕES DO JOGO COMPACTAS ===
+        data_jogo = datetime.strptime(jogo_data, '%Y-%m-%d').strftime('%d/%m/%Y') if jogo_data != 'Data não definida' else jogo_data
+        
+        # Caixa de informações compacta
+        game_info_data = [
+            ['ADVERSÁRIO', 'DATA', 'HORA', 'LOCAL'],
+            [jogo_adversario.upper(), data_jogo, jogo_hora, jogo_local]
+        ]
+        
+        game_info_table = Table(game_info_data, colWidths=[42.5*mm, 42.5*mm, 42.5*mm, 42.5*mm])
+        game_info_table.setStyle(TableStyle([
+            # Cabeçalho
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 0), (-1, 0), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 4),
+            
+            # Dados
+            ('BACKGROUND', (0, 1), (-1, 1), colors.Color(0.95, 0.95, 0.98)),
+            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 1), (-1, 1), 8),
+            ('TOPPADDING', (0, 1), (-1, 1), 5),
+            ('BOTTOMPADDING', (0, 1), (-1, 1), 5),
+            ('TEXTCOLOR', (0, 1), (-1, 1), cinza_escuro),
+            
+            # Bordas
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+        ]))
+        
+        story.append(game_info_table)
+        story.append(Spacer(1, 8))
+        
+        # === LISTA COMPACTA DE CONVOCADOS ===
+        # Cabeçalho "Jogadores Convocados" compacto
+        convocados_header = ParagraphStyle(
+            'ConvocadosHeader',
+            parent=styles['Heading2'],
+            fontSize=10,
+            spaceAfter=5,
+            alignment=TA_CENTER,
+            textColor=azul_clube,
+            fontName='Helvetica-Bold'
+        )
+        story.append(Paragraph("JOGADORES CONVOCADOS", convocados_header))
+        
+        # Preparar dados - tabela única simples
+        convocados_ordenados = sorted(convocados, key=lambda x: int(x.get('nr_camisola', 999)) if str(x.get('nr_camisola', '')).isdigit() else 999)
+        
+        # Criar dados da tabela única
+        data_convocados = [['Nº', 'NOME DO ATLETA', 'ASSINATURA']]
+        
+        for jogador in convocados_ordenados:
+            numero = str(jogador.get('nr_camisola', 'S/N'))
+            nome = jogador.get('nome', 'Nome não definido')
+            data_convocados.append([numero, nome, ''])
+        
+        # Criar tabela única de convocados
+        table_convocados = Table(data_convocados, colWidths=[15*mm, 115*mm, 40*mm])
+        table_convocados.setStyle(TableStyle([
+            # Cabeçalho
+            ('BACKGROUND', (0, 0), (-1, 0), azul_claro),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),  # Nomes à esquerda
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 0), (-1, 0), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 4),
+            
+            # Corpo da tabela
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('TOPPADDING', (0, 1), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 5),
+            ('LEFTPADDING', (0, 0), (-1, -1), 3),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+            ('TEXTCOLOR', (0, 1), (-1, -1), azul_clube),
+            
+            # Bordas e linhas
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+            ('LINEBELOW', (0, 0), (-1, 0), 1, azul_claro),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        
+        story.append(table_convocados)
+        story.append(Spacer(1, 10))
+        
+        # === RODAPÉ COMPACTO ===
+        # Linha para assinatura do treinador compacta
+        signature_data = [
+            ['Data: ___/___/______', 'O Treinador: ________________________________']
+        ]
+        
+        signature_table = Table(signature_data, colWidths=[85*mm, 85*mm])
+        signature_table.setStyle(TableStyle([
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]))
+        
+        story.append(signature_table)
+        story.append(Spacer(1, 5))
+        
+        # Nota final compacta
+        footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=6,
+            alignment=TA_CENTER,
+            textColor=colors.grey,
+            fontName='Helvetica-Oblique'
+        )
+        
+        data_geracao = datetime.now().strftime('%d/%m/%Y')  # só a data: o PDF fica em cache durante o dia
+        nota_final = f"Os atletas convocados devem apresentar-se pontualmente • Documento gerado em {data_geracao}"
+        story.append(Paragraph(nota_final, footer_style))
+        
+        # Construir PDF
+        doc.build(story)
+        
+        # Obter bytes do PDF
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        
+        # Nome do arquivo
+        data_clean = jogo_data.replace('-', '') if jogo_data != 'Data não definida' else 'SemData'
+        adversario_clean = jogo_adversario.replace(' ', '_').replace('/', '_')
+        filename = f"Convocatoria_FCP_vs_{adversario_clean}_{data_clean}.pdf"
+        
+        return pdf_bytes, filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF da convocatória: {e}")
+        return None, None
+
+@medido('pdf')
+@pdf_em_cache(lambda dados: (dados.get('jogadores', []), dados.get('treinos', {})), diario=True)
+def gerar_pdf_folha_presenca_profissional(dados):
+    """Gera PDF profissional da folha de presença - Layout igual à convocatória completa"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível para geração de PDF")
+        return None, None
+    
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        from reportlab.lib.units import cm, mm
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.platypus import Image as RLImage
+        import os
+        
+        # Buscar TODOS os jogadores
+        jogadores = dados.get('jogadores', [])
+        if not jogadores:
+            st.warning("⚠️ Nenhum jogador encontrado no sistema")
+            return None, None
+        
+        # Ordenar jogadores por número (do menor para o maior)
+        def get_numero_ordenacao(jogador):
+            numero = jogador.get('numero') or jogador.get('nr_camisola')
+            if numero is None or numero == '' or numero == '-':
+                return 999
+            try:
+                return int(numero)
+            except (ValueError, TypeError):
+                return 999
+        
+        jogadores_ordenados = sorted(jogadores, key=get_numero_ordenacao)
+        
+        # Criar buffer em memória para o PDF
+        buffer = BytesIO()
+        
+        # Configurar documento PDF - Formato vertical A4
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=15*mm,
+            leftMargin=15*mm,
+            topMargin=15*mm,
+            bottomMargin=15*mm
+        )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas
+        azul_clube = recursos.cores['azul_clube']
+        azul_claro = recursos.cores['azul_claro']
+        cinza_escuro = recursos.cores['cinza_escuro']
+        
+        # Estilos
+        styles = recursos.estilos
+        
+        style_club_header = styles['ClubHeaderCompact']
+        
+        style_document_title = styles['DocumentTitleCompact']
+        
+        style_competition = styles['CompetitionCompact']
+        
+        # Criar conteúdo do PDF
+        story = []
+        
+        # === CABEÇALHO ===
+        story.extend(recursos.cabecalho_clube(estilo_alternativo='ClubHeaderCompact'))
+        
+        # Título
+        story.append(Paragraph("FOLHA DE PRESENÇA", style_document_title))
+        story.append(Spacer(1, 4))
+        
+        # === INFORMAÇÕES ===
+        info_data = [
+            ['Data', 'Local', 'Hora', 'Treino Nº'],
+            ['_______________', '_______________', '_______________', '_______________'],
+        ]
+        
+        info_table = Table(info_data, colWidths=[40*mm, 40*mm, 40*mm, 48*mm])
+        info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 6),
+            ('TOPPADDING', (0, 0), (-1, 0), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 2),
+            ('BACKGROUND', (0, 1), (-1, 1), colors.Color(0.95, 0.95, 0.98)),
+            ('FONTSIZE', (0, 1), (-1, 1), 6),
+            ('TOPPADDING', (0, 1), (-1, 1), 2),
+            ('BOTTOMPADDING', (0, 1), (-1, 1), 2),
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+        ]))
+        
+        story.append(info_table)
+        story.append(Spacer(1, 4))
+        
+        # === TABELA DE PRESENÇAS ===
+        players_data = [
+            ['Nº', 'NOME DO JOGADOR', 'ASSID.', 'ASSINATURA']
+        ]
+        
+        # Taxa de assiduidade nos treinos (matriz de presenças)
+        matriz_presencas = MatrizPresencas.from_dados(dados)
+        
+        # Adicionar todos os jogadores
+        for jogador in jogadores_ordenados:
+            nome = jogador.get('nome', 'Nome não definido')
+            numero = jogador.get('numero') or jogador.get('nr_camisola')
+            
+            # Garantir que o número seja exibido corretamente
+            if numero is None or numero == '' or numero == '-':
+                numero_display = '-'
+            else:
+                try:
+                    numero_display = str(int(numero))
+                except (ValueError, TypeError):
+                    numero_display = str(numero) if numero else '-'
+            
+            taxa = matriz_presencas.taxa(nome)
+            
+            # Campos em branco para preenchimento no documento impresso
+            players_data.append([
+                numero_display, 
+                nome.upper(), 
+                f"{taxa:.0f}%" if taxa is not None else '-',
+                ''    # Campo assinatura em branco
+            ])
+        
+        # Criar tabela
+        players_table = Table(players_data, colWidths=[12*mm, 70*mm, 18*mm, 50*mm])
+        
+        # Estilo da tabela
+        table_style = [
+            # Cabeçalho
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 6),
+            ('TOPPADDING', (0, 0), (-1, 0), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 2),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+            
+            # Dados
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            ('ALIGN', (2, 1), (4, -1), 'CENTER'),
+            ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+            
+            # Zebra (linhas alternadas)
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.97, 0.97, 0.99)]),
+            
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+        ]
+        
+        players_table.setStyle(TableStyle(table_style))
+        story.append(players_table)
+        
+        story.append(Spacer(1, 3))
+        
+        # === ASSINATURA DO TREINADOR ===
+        signature_data = [
+            ['Assinatura do Treinador', '', 'Assinatura do Responsável']
+        ]
+        
+        signature_table = Table(signature_data, colWidths=[50*mm, 20*mm, 80*mm])
+        signature_table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, 0), 6),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, 0), 15),
+        ]))
+        
+        story.append(signature_table)
+        
+        story.append(Spacer(1, 2))
+        
+        # Construir PDF
+        doc.build(story)
+        
+        # Obter bytes do PDF
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        
+        # Nome do arquivo
+        filename = f"Folha_Presenca_{datetime.now().strftime('%Y%m%d')}.pdf"
+        
+        return pdf_bytes, filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF da folha de presença: {e}")
+        import traceback
+        traceback.print_exc()
+        return None, None
+
+@medido('pdf')
+@pdf_em_cache(lambda dados, jogo_selecionado: (jogo_selecionado, dados.get('jogadores', [])))
+def gerar_pdf_convocatoria_completa(dados, jogo_selecionado):
+    """Gera PDF de convocatória com TODOS os jogadores para assinatura"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível para geração de PDF")
+        return None, None
+    
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        from reportlab.lib.units import cm, mm
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.platypus import Image as RLImage
+        import os
+        
+        # Dados do jogo
+        jogo_data = jogo_selecionado.get('data', 'Data não definida')
+        jogo_hora = jogo_selecionado.get('hora', 'Hora não definida')
+        jogo_adversario = jogo_selecionado.get('adversario', 'Adversário não definido')
+        jogo_local = jogo_selecionado.get('local', 'Local não definido')
+        jogo_competicao = jogo_selecionado.get('competicao', 'CAMPEONATO DISTRITAL - 2ª DIVISÃO ZONA CENTRO')
+        convocados_ids = jogo_selecionado.get('convocados', [])
+        
+        # Buscar TODOS os jogadores (não apenas convocados)
+        jogadores = dados.get('jogadores', [])
+        if not jogadores:
+            st.warning("⚠️ Nenhum jogador encontrado no sistema")
+            return None, None
+        
+        # Ordenar jogadores por número (do menor para o maior)
+        def get_numero_ordenacao(jogador):
+            numero = jogador.get('numero') or jogador.get('nr_camisola')
+            if numero is None or numero == '' or numero == '-':
+                return 999  # Números em branco vão para o final
+            try:
+                return int(numero)
+            except (ValueError, TypeError):
+                return 999  # Números inválidos vão para o final
+        
+        jogadores_ordenados = sorted(jogadores, key=get_numero_ordenacao)
+        
+        # Criar buffer em memória para o PDF
+        buffer = BytesIO()
+        
+        # Configurar documento PDF - Formato vertical A4
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=15*mm,
+            leftMargin=15*mm,
+            topMargin=15*mm,
+            bottomMargin=15*mm
+        )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas
+        azul_clube = recursos.cores['azul_clube']
+        azul_claro = recursos.cores['azul_claro']
+        cinza_escuro = recursos.cores['cinza_escuro']
+        verde_sim = colors.Color(0.0, 0.6, 0.0)
+        vermelho_nao = colors.Color(0.8, 0.0, 0.0)
+        
+        # Estilos com fontes menores
+        styles = recursos.estilos
+        
+        style_club_header = styles['ClubHeaderCompact']
+        
+        style_document_title = styles['DocumentTitleCompact']
+        
+        style_competition = styles['CompetitionCompact']
+        
+        # Criar conteúdo do PDF
+        story = []
+        
+        # === CABEÇALHO ===
+        story.extend(recursos.cabecalho_clube(estilo_alternativo='ClubHeaderCompact'))
+        
+        # Título
+        story.append(Paragraph("CONVOCATÓRIA", style_document_title))
+        story.append(Spacer(1, 2))
+        story.append(Paragraph(f"• {jogo_competicao.upper()} •", style_competition))
+        
+        # === INFORMAÇÕES DO JOGO ===
+        data_jogo = datetime.strptime(jogo_data, '%Y-%m-%d').strftime('%d/%m/%Y') if jogo_data != 'Data não definida' else jogo_data
+        
+        game_info_data = [
+            ['ADVERSÁRIO', 'DATA', 'HORA JOGO', 'LOCAL JOGO'],
+            [jogo_adversario.upper(), data_jogo, jogo_hora, jogo_local],
+            ['HORA CONCENTRAÇÃO', 'LOCAL CONCENTRAÇÃO', '', ''],
+            ['_______________', '_______________', '', '']
+        ]
+        
+        game_info_table = Table(game_info_data, colWidths=[42.5*mm, 42.5*mm, 42.5*mm, 42.5*mm])
+        game_info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 7),
+            ('TOPPADDING', (0, 0), (-1, 0), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 3),
+            ('BACKGROUND', (0, 1), (-1, 1), colors.Color(0.95, 0.95, 0.98)),
+            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 1), (-1, 1), 7),
+            ('TOPPADDING', (0, 1), (-1, 1), 4),
+            ('BOTTOMPADDING', (0, 1), (-1, 1), 4),
+            ('TEXTCOLOR', (0, 1), (-1, 1), cinza_escuro),
+            ('BACKGROUND', (0, 2), (1, 2), azul_claro),
+            ('TEXTCOLOR', (0, 2), (1, 2), colors.white),
+            ('FONTNAME', (0, 2), (1, 2), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 2), (1, 2), 7),
+            ('TOPPADDING', (0, 2), (1, 2), 3),
+            ('BOTTOMPADDING', (0, 2), (1, 2), 3),
+            ('SPAN', (2, 2), (3, 2)),
+            ('BACKGROUND', (0, 3), (1, 3), colors.Color(0.95, 0.95, 0.98)),
+            ('FONTSIZE', (0, 3), (1, 3), 7),
+            ('TOPPADDING', (0, 3), (1, 3), 4),
+            ('BOTTOMPADDING', (0, 3), (1, 3), 4),
+            ('SPAN', (2, 3), (3, 3)),
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+        ]))
+        
+        story.append(game_info_table)
+        story.append(Spacer(1, 8))
+        
+        # === TABELA DE TODOS OS JOGADORES ===
+        # Cabeçalho da tabela
+        players_data = [
+            ['Nº', 'NOME DO JOGADOR', 'CONVOCADO', '', 'ASSINATURA']
+        ]
+        
+        # Sub-cabeçalho para convocação
+        players_data.append(['', '', 'SIM', 'NÃO', ''])
+        
+        # Adicionar todos os jogadores (SEM marcar automaticamente)
+        for jogador in jogadores_ordenados:
+            nome = jogador.get('nome', 'Nome não definido')
+            numero = jogador.get('numero') or jogador.get('nr_camisola')
+            
+            # Garantir que o número seja exibido corretamente
+            if numero is None or numero == '' or numero == '-':
+                numero_display = '-'
+            else:
+                try:
+                    numero_display = str(int(numero))  # Converter para int e depois string para limpar
+                except (ValueError, TypeError):
+                    numero_display = str(numero) if numero else '-'
+            
+            # TODOS os campos ficam em branco para preenchimento manual
+            players_data.append([
+                numero_display, 
+                nome.upper(), 
+                '',  # Campo SIM em branco
+                '',  # Campo NÃO em branco
+                ''   # Campo assinatura em branco
+            ])
+        
+        # Criar tabela com colunas otimizadas para A4
+        players_table = Table(players_data, colWidths=[12*mm, 70*mm, 18*mm, 18*mm, 50*mm])
+        
+        # Estilo da tabela com fontes menores
+        table_style = [
+            # Cabeçalho principal
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 7),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, 0), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 3),
+            
+            # Sub-cabeçalho SIM/NÃO
+            ('BACKGROUND', (2, 1), (3, 1), azul_claro),
+            ('TEXTCOLOR', (2, 1), (3, 1), colors.white),
+            ('FONTNAME', (2, 1), (3, 1), 'Helvetica-Bold'),
+            ('FONTSIZE', (2, 1), (3, 1), 6),
+            ('ALIGN', (2, 1), (3, 1), 'CENTER'),
+            ('TOPPADDING', (2, 1), (3, 1), 2),
+            ('BOTTOMPADDING', (2, 1), (3, 1), 2),
+            
+            # Linhas dos jogadores
+            ('FONTNAME', (0, 2), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 2), (-1, -1), 6),
+            ('ALIGN', (0, 2), (0, -1), 'CENTER'),  # Número centralizado
+            ('ALIGN', (1, 2), (1, -1), 'LEFT'),    # Nome à esquerda
+            ('ALIGN', (2, 2), (3, -1), 'CENTER'),  # SIM/NÃO centralizado
+            ('ALIGN', (4, 2), (4, -1), 'LEFT'),    # Assinatura à esquerda
+            ('TOPPADDING', (0, 2), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 2), (-1, -1), 3),
+            ('LEFTPADDING', (1, 2), (1, -1), 3),
+            ('RIGHTPADDING', (1, 2), (1, -1), 3),
+            
+            # Bordas
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+            ('LINEBELOW', (0, 1), (-1, 1), 1, azul_clube),
+        ]
+        
+        # Adicionar cores alternadas nas linhas
+        for i in range(2, len(players_data)):
+            if i % 2 == 0:
+                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.Color(0.98, 0.98, 1.0)))
+        
+        players_table.setStyle(TableStyle(table_style))
+        story.append(players_table)
+        story.append(Spacer(1, 5))
+        
+        # === RODAPÉ ===
+        footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=6,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Oblique',
+            textColor=cinza_escuro
+        )
+        
+        story.append(Spacer(1, 10))
+        story.append(Paragraph("FC Pinheirense - Época 2025/2026 - Lista de Convocatória", footer_style))
+        
+        # Gerar PDF
+        doc.build(story)
+        buffer.seek(0)
+        
+        # Nome do arquivo
+        filename = f"Lista_Completa_Convocatoria_{jogo_adversario.replace(' ', '_')}_{jogo_data}.pdf"
+        
+        return buffer.getvalue(), filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF da lista completa: {str(e)}")
+        return None, None
+
+@medido('pdf')
+@pdf_em_cache(lambda campeonato=None: (carregar_dados().get('campeonato', {}) if campeonato is None else campeonato,), diario=True)
+def gerar_pdf_tabela_classificativa(campeonato=None):
+    """Gera PDF da tabela classificativa do campeonato (por omissão, o dos dados atuais)"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível para geração de PDF")
+        return None, None
+    
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        from reportlab.lib.units import cm, mm
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.platypus import Image as RLImage
+        import os
+        
+        # Carregar dados reais do campeonato (se não vierem já extraídos)
+        if campeonato is None:
+            campeonato = carregar_dados().get('campeonato', {})
+        equipas = campeonato.get('equipas', [])
+        
+        if not equipas:
+            st.error("❌ Não há dados de campeonato disponíveis")
+            return None, None
+        
+        # Ordenar equipas por pontos, diferença de golos e golos marcados
+        equipas_ordenadas = sorted(equipas, key=lambda x: (-x['pontos'], -x['diferenca_golos'], -x['golos_marcados']))
+        
+        # Criar buffer em memória para o PDF
+        buffer = BytesIO()
+        
+        # Configurar documento PDF - Formato vertical A4
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas
+        azul_clube = recursos.cores['azul_clube']
+        azul_claro = recursos.cores['azul_claro']
+        cinza_escuro = colors.Color(0.3, 0.3, 0.3)
+        verde_vitoria = colors.Color(0.0, 0.6, 0.0)
+        amarelo_empate = colors.Color(0.9, 0.7, 0.0)
+        vermelho_derrota = colors.Color(0.8, 0.0, 0.0)
+        
+        # Estilos com fontes menores
+        styles = recursos.estilos
+        
+        style_club_header = styles['ClubHeaderLarge']
+        
+        style_document_title = styles['DocumentTitleLarge']
+        
+        style_competition = styles['CompetitionLarge']
+        
+        # Criar conteúdo do PDF
+        story = []
+        
+        # === CABEÇALHO ===
+        story.extend(recursos.cabecalho_clube(
+            tamanho_logo=25*mm, largura_texto=110*mm, tamanho_fonte=14, espaco=8,
+            estilo_alternativo='ClubHeaderLarge', espaco_alternativo=5
+        ))
+        
+        # Título
+        story.append(Paragraph("TABELA CLASSIFICATIVA", style_document_title))
+        story.append(Spacer(1, 3))
+        story.append(Paragraph("• CAMPEONATO DISTRITAL AVEIRO - 2ª DIVISÃO ZONA CENTRO •", style_competition))
+        
+        # === TABELA CLASSIFICATIVA ===
+        # Dados reais do campeonato
+        classificacao_data = [['POS', 'EQUIPA', 'J', 'V', 'E', 'D', 'GM', 'GS', 'DG', 'PTS']]
+        
+        for pos, equipa in enumerate(equipas_ordenadas, 1):
+            # Formatear nome da equipa (remover aspas se existirem)
+            nome_equipa = equipa['nome'].replace('"', '')
+            
+            # Formatear diferença de golos
+            dg = equipa['diferenca_golos']
+            dg_str = f"+{dg}" if dg > 0 else str(dg)
+            
+            classificacao_data.append([
+                f"{pos}º",
+                nome_equipa,
+                str(equipa['jogos']),
+                str(equipa['vitorias']),
+                str(equipa['empates']),
+                str(equipa['derrotas']),
+                str(equipa['golos_marcados']),
+                str(equipa['golos_sofridos']),
+                dg_str,
+                str(equipa['pontos'])
+            ])
+        
+        # Criar tabela
+        classificacao_table = Table(classificacao_data, colWidths=[15*mm, 45*mm, 10*mm, 10*mm, 10*mm, 10*mm, 12*mm, 12*mm, 12*mm, 15*mm])
+        
+        # Estilo da tabela
+        table_style = [
+            # Cabeçalho
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, 0), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 4),
+            
+            # Dados das equipas
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 7),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # Posição centralizada
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),    # Nome da equipa à esquerda
+            ('ALIGN', (2, 1), (-1, -1), 'CENTER'), # Números centralizados
+            ('TOPPADDING', (0, 1), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
+            
+            # Bordas
+            ('GRID', (0, 0), (-1, -1), 0.5, azul_clube),
+            ('LINEBELOW', (0, 0), (-1, 0), 1, azul_clube),
+        ]
+        
+        # Destacar FC Pinheirense dinamicamente
+        for i, linha in enumerate(classificacao_data[1:], 1):
+            nome_equipa = linha[1].upper()
+            if 'FC PINHEIRENSE' in nome_equipa or 'PINHEIRENSE' in nome_equipa:
+                table_style.extend([
+                    ('BACKGROUND', (0, i), (-1, i), colors.Color(0.9, 0.95, 1.0)),
+                    ('FONTNAME', (0, i), (-1, i), 'Helvetica-Bold'),
+                    ('TEXTCOLOR', (0, i), (-1, i), azul_clube),
+                ])
+                break
+        
+        # Cores alternadas nas outras linhas
+        for i in range(1, len(classificacao_data)):
+            linha_equipa = classificacao_data[i][1].upper()
+            if i % 2 == 0 and 'PINHEIRENSE' not in linha_equipa:
+                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.Color(0.98, 0.98, 1.0)))
+        
+        classificacao_table.setStyle(TableStyle(table_style))
+        story.append(classificacao_table)
+        story.append(Spacer(1, 10))
+        
+        # === LEGENDA ===
+        legenda_style = ParagraphStyle(
+            'Legenda',
+            parent=styles['Normal'],
+            fontSize=7,
+            spaceAfter=3,
+            alignment=TA_LEFT,
+            fontName='Helvetica',
+            textColor=cinza_escuro
+        )
+        
+        story.append(Paragraph("LEGENDA:", legenda_style))
+        story.append(Paragraph("POS - Posição | J - Jogos | V - Vitórias | E - Empates | D - Derrotas", legenda_style))
+        story.append(Paragraph("GM - Golos Marcados | GS - Golos Sofridos | DG - Diferença de Golos | PTS - Pontos", legenda_style))
+        story.append(Spacer(1, 10))
+        
+        # === RODAPÉ ===
+        footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=7,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Oblique',
+            textColor=cinza_escuro
+        )
+        
+        from datetime import datetime
+        data_atual = datetime.now().strftime('%d/%m/%Y')
+        story.append(Paragraph(f"FC Pinheirense - Época 2025/2026 - Tabela Classificativa atualizada em {data_atual}", footer_style))
+        
+        # Gerar PDF
+        doc.build(story)
+        buffer.seek(0)
+        
+        # Nome do arquivo
+        filename = f"Tabela_Classificativa_FC_Pinheirense_{data_atual.replace('/', '_')}.pdf"
+        
+        return buffer.getvalue(), filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF da tabela classificativa: {str(e)}")
+        return None, None
@@ -0,0 +1,153 @@
+"""
+Página de Desempenho (admin)
+Percentis por rerun, página e operação, taxas de acerto dos caches e captura cProfile de um rerun
+"""
+
+import streamlit as st
+import os
+
+from lazy_imports import tempos_carregamento
+from perf_metrics import metricas
+from pdf_cache import cache_pdf
+from photo_cache import cache_fotos
+from app_pages import PAGINAS, modulos_carregados
+from app_core import pd, obter_cache_dados, obter_render_cache, obter_contexto_rerun
+
+
+CATEGORIAS_OPERACOES = {
+    'dados': '💾 Dados',
+    'json': '🧾 JSON',
+    'pdf': '📄 PDF',
+    'pdf_job': '🖨️ PDF (pool)',
+    'smtp': '📧 SMTP',
+}
+
+
+def _taxa_acerto(hits, misses):
+    total = hits + misses
+    return f"{hits * 100 / total:.0f}%" if total else "—"
+
+
+def _tabela_resumo(linhas, top=15):
+    """DataFrame com as operações mais lentas (ordenadas por p95)"""
+    if not linhas:
+        st.info("📭 Sem amostras registadas neste processo")
+        return
+    tabela = pd.DataFrame(linhas[:top]).rename(columns={
+        'nome': 'Nome', 'n': 'N', 'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)',
+        'p99_ms': 'p99 (ms)', 'max_ms': 'Máx. (ms)', 'total_ms': 'Total (ms)', 'bytes_medio': 'Bytes (média)'
+    })
+    st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+
+def mostrar_desempenho():
+    """Página de instrumentação: mais lentos, operações, caches e perfil cProfile"""
+    if st.session_state.get('usuario_logado') != 'admin':
+        st.error("🔒 Apenas o admin pode ver o desempenho da app")
+        return
+
+    st.title("⏱️ Desempenho da App")
+    st.caption(f"Amostras em memória neste processo; exportadas para `{metricas.ficheiro}`")
+
+    tab1, tab2, tab3, tab4 = st.tabs(["🐢 Páginas", "⚙️ Operações", "🗃️ Caches", "🔬 Perfil"])
+
+    with tab1:
+        st.write("### 🔁 Reruns completos")
+        _tabela_resumo([{k: v for k, v in linha.items() if k != 'categoria'} for linha in metricas.resumo('rerun')])
+        st.write("### 📑 Funções de página")
+        _tabela_resumo([{k: v for k, v in linha.items() if k != 'categoria'} for linha in metricas.resumo('pagina')])
+
+    with tab2:
+        linhas = [linha for linha in metricas.resumo() if linha['categoria'] in CATEGORIAS_OPERACOES]
+        for linha in linhas:
+            linha['categoria'] = CATEGORIAS_OPERACOES[linha['categoria']]
+        _tabela_resumo(linhas, top=30)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📤 Exportar amostras pendentes", use_container_width=True):
+                st.success(f"✅ {metricas.exportar()} amostra(s) exportada(s)")
+        with col2:
+            if st.button("🗑️ Limpar amostras em memória", use_container_width=True):
+                metricas.limpar()
+                st.rerun()
+
+        if os.path.exists(metricas.ficheiro):
+            with open(metricas.ficheiro, 'rb') as f:
+                st.download_button(
+                    "⬇️ Download métricas (JSONL)", data=f.read(),
+                    file_name=os.path.basename(metricas.ficheiro), mime="application/jsonl"
+                )
+
+    with tab3:
+        cache_dados = obter_cache_dados().estatisticas()
+        cache_render = obter_render_cache().estatisticas()
+
+        cache_documentos = cache_pdf.estatisticas()
+        cache_imagens = cache_fotos.estatisticas()
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("💽 Cache do ficheiro", _taxa_acerto(cache_dados['hits'], cache_dados['misses']),
+                      help=f"{cache_dados['hits']} hits / {cache_dados['misses']} misses")
+        with col2:
+            st.metric("🧩 Cache de renderização", _taxa_acerto(cache_render['hits'], cache_render['misses']),
+                      help=f"{cache_render['entradas']} entradas, {cache_render['remocoes']} remoções")
+        with col3:
+            st.metric("📄 Cache de PDFs", _taxa_acerto(cache_documentos['hits'], cache_documentos['misses']),
+                      help=f"{cache_documentos['entradas']} PDFs, {cache_documentos['bytes'] / 1024:.0f} KB em disco")
+        with col4:
+            st.metric("📷 Cache de fotos",
+                      _taxa_acerto(cache_imagens['hits'] + cache_imagens['hits_disco'], cache_imagens['misses']),
+                      help=f"{cache_imagens['entradas']} variantes, {cache_imagens['bytes_memoria'] / 1024:.0f} KB em "
+                           f"memória, {cache_imagens['bytes_disco'] / 1024:.0f} KB em disco")
+        with col5:
+            contexto = obter_contexto_rerun() or {}
+            st.metric("🔁 carregar_dados() neste rerun", contexto.get('chamadas', 0),
+                      help=f"{contexto.get('resolucoes', 0)} resolução(ões)")
+
+        if cache_render['por_secao']:
+            st.write("### 🧩 Render cache por secção")
+            st.dataframe(pd.DataFrame([
+                {'Secção': secao, 'Hits': valores['hits'], 'Misses': valores['misses'],
+                 'Acerto': _taxa_acerto(valores['hits'], valores['misses'])}
+                for secao, valores in sorted(cache_render['por_secao'].items())
+            ]), use_container_width=True, hide_index=True)
+
+        col_pdf, col_fotos = st.columns(2)
+        with col_pdf:
+            if st.button("🗑️ Limpar cache de PDFs"):
+                cache_pdf.limpar()
+                st.success("✅ Cache de PDFs limpo")
+        with col_fotos:
+            if st.button("🗑️ Limpar cache de fotos"):
+                cache_fotos.limpar()
+                st.success("✅ Cache de fotos limpo")
+
+        st.write("### 📦 Módulos carregados")
+        st.write(f"**Páginas:** {', '.join(modulos_carregados()) or '—'}")
+        for nome, ms in sorted(tempos_carregamento().items(), key=lambda item: -item[1]):
+            st.write(f"• `{nome}`: {ms:.0f} ms")
+
+    with tab4:
+        st.write("Perfila com cProfile o próximo rerun completo da página escolhida; "
+                 "o resultado fica disponível aqui ao voltar a esta página.")
+        paginas = sorted(PAGINAS)
+        pagina_alvo = st.selectbox(
+            "Página a perfilar", paginas,
+            index=paginas.index('dashboard') if 'dashboard' in paginas else 0
+        )
+        if st.button("🔬 Perfilar próximo rerun", type="primary"):
+            st.session_state['perfilar_proximo_rerun'] = True
+            st.session_state.pagina_atual = pagina_alvo
+            st.rerun()
+
+        captura = st.session_state.get('perfil_rerun')
+        if captura and captura.get('prof'):
+            st.success(f"✅ Perfil de `{captura['pagina']}` ({captura['ts']})")
+            st.download_button(
+                "⬇️ Download .prof", data=captura['prof'],
+                file_name=f"rerun_{captura['pagina']}_{captura['ts']}.prof",
+                mime="application/octet-stream"
+            )
+            st.code(captura['texto'][:20000])
@@ -0,0 +1,1398 @@
+"""
+Área do Jogador
+Perfil, treinos, jogos, equipa e planos de treino vistos pelo jogador
+"""
+
+import streamlit as st
+from datetime import datetime, date, timedelta
+
+from app_core import (
+    mostrar_foto, obter_render_cache, versoes_colecoes, carregar_dados, salvar_dados, mostrar_secao_estatisticas_jogador
+)
+
+
+# === ÁREA DOS JOGADORES ===
+def perfil_jogador():
+    """Perfil do jogador logado"""
+    dados = carregar_dados()
+    usuario_login = st.session_state.get('usuario_logado')
+    
+    # Encontrar dados do jogador
+    jogador = None
+    for j in dados.get('jogadores', []):
+        if j.get('login') == usuario_login:
+            jogador = j
+            break
+    
+    if not jogador:
+        st.error("❌ Dados do jogador não encontrados!")
+        return
+    
+    st.title(f"👤 Meu Perfil - {jogador.get('nome', 'Jogador')}")
+    
+    # Informações principais
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Foto do jogador
+        foto = jogador.get('foto')
+        if foto:
+            mostrar_foto(foto, width=200)
+        else:
+            st.info("📷 Sem foto cadastrada")
+    
+    with col2:
+        st.subheader("📋 Informações Pessoais")
+        
+        info_col1, info_col2 = st.columns(2)
+        
+        with info_col1:
+            st.write(f"**👤 Nome:** {jogador.get('nome', 'N/A')}")
+            st.write(f"**⚽ Posição:** {jogador.get('posicao', 'N/A')}")
+            st.write(f"**👕 Camisola:** #{jogador.get('nr_camisola', 'N/A')}")
+            st.write(f"**🎂 Idade:** {jogador.get('idade', 'N/A')} anos")
+        
+        with info_col2:
+            st.write(f"**📏 Altura:** {jogador.get('altura', 'N/A')}m")
+            st.write(f"**⚖️ Peso:** {jogador.get('peso', 'N/A')}kg")
+            st.write(f"**🏆 Último Clube:** {jogador.get('ultimo_clube', 'N/A')}")
+            st.write(f"**🏟️ Clube Anterior:** {jogador.get('clube_anterior', 'N/A')}")
+            st.write(f"**📱 Telefone:** {jogador.get('telefone', 'N/A')}")
+        
+        st.write(f"**📧 Email:** {jogador.get('email', 'N/A')}")
+        
+        if jogador.get('pontos_fortes'):
+            st.write("**💪 Pontos Fortes:**")
+            for ponto in jogador['pontos_fortes']:
+                st.write(f"• {ponto}")
+    
+    # Mostrar estatísticas detalhadas
+    st.divider()
+    mostrar_secao_estatisticas_jogador(jogador, dados)
+
+def jogos_jogador():
+    """Jogos do jogador - convocações e histórico"""
+    dados = carregar_dados()
+    usuario_login = st.session_state.get('usuario_logado')
+    
+    # Encontrar nome do jogador
+    jogador_nome = None
+    for j in dados.get('jogadores', []):
+        if j.get('login') == usuario_login:
+            jogador_nome = j.get('nome')
+            break
+    
+    if not jogador_nome:
+        st.error("❌ Jogador não encontrado!")
+        return
+    
+    st.title("📅 Meus Jogos")
+    
+    jogos = dados.get('jogos', [])
+    hoje = str(date.today())
+    
+    # Filtrar jogos onde está convocado
+    meus_jogos = [j for j in jogos if jogador_nome in j.get('convocados', [])]
+    
+    if not meus_jogos:
+        st.info("📝 Você ainda não foi convocado para nenhum jogo")
+        return
+    
+    # Separar jogos futuros e passados
+    jogos_futuros = [j for j in meus_jogos if j.get('data', '') >= hoje]
+    jogos_passados = [j for j in meus_jogos if j.get('data', '') < hoje]
+    
+    # Próximos jogos
+    if jogos_futuros:
+        st.subheader("🔥 Próximas Convocações")
+        for jogo in sorted(jogos_futuros, key=lambda x: x.get('data', '')):
+            with st.expander(f"⚽ vs {jogo.get('adversario', 'TBD')} - {jogo.get('data')}"):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.write(f"**📅 Data:** {jogo.get('data')}")
+                    st.write(f"**🕐 Hora:** {jogo.get('hora')}")
+                    st.write(f"**📍 Local:** {jogo.get('local')}")
+                    st.write(f"**🎯 Tipo:** {jogo.get('tipo')}")
+                
+                with col2:
+                    st.write("**👥 Outros Convocados:**")
+                    outros_convocados = [c for c in jogo.get('convocados', []) if c != jogador_nome]
+                    if outros_convocados:
+                        for convocado in outros_convocados:
+                            st.write(f"• {convocado}")
+                    else:
+                        st.write("Só você por enquanto")
+    
+    # Histórico de jogos
+    if jogos_passados:
+        st.subheader("📚 Histórico de Jogos")
+        for jogo in sorted(jogos_passados, key=lambda x: x.get('data', ''), reverse=True)[:10]:
+            with st.container():
+                col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+                
+                with col1:
+                    st.write(f"**{jogo.get('data')}**")
+                
+                with col2:
+                    st.write(f"vs **{jogo.get('adversario', 'TBD')}**")
+                
+                with col3:
+                    st.write(f"📍 {jogo.get('local', 'TBD')}")
+                
+                with col4:
+                    resultado = jogo.get('resultado', 'N/A')
+                    if resultado and resultado != 'N/A':
+                        st.write(f"📊 {resultado}")
+                    else:
+                        st.write("📊 -")
+    
+    # Estatísticas
+    st.subheader("📊 Minhas Estatísticas")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("🎯 Total Convocações", len(meus_jogos))
+    
+    with col2:
+        st.metric("⚽ Jogos Realizados", len(jogos_passados))
+    
+    with col3:
+        st.metric("📅 Próximos Jogos", len(jogos_futuros))
+
+def ver_equipa():
+    """Ver todos os jogadores da equipa"""
+    dados = carregar_dados()
+    
+    st.title("👥 Nossa Equipa")
+    
+    jogadores = dados.get('jogadores', [])
+    
+    if not jogadores:
+        st.info("📝 Nenhum jogador cadastrado")
+        return
+    
+    # Filtros
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        posicoes = list(set([j.get('posicao', 'N/A') for j in jogadores]))
+        filtro_posicao = st.selectbox("🔍 Filtrar por Posição", ["Todas"] + posicoes)
+    
+    with col2:
+        ordenar = st.selectbox("📊 Ordenar por", [
+            "Nome", "Posição", "Idade", "Número da Camisola"
+        ])
+    
+    # Lista filtrada/ordenada e fichas reutilizadas enquanto os jogadores não mudarem
+    fichas = obter_render_cache().obter(
+        'equipa_plantel',
+        lambda: _fichas_plantel(jogadores, filtro_posicao, ordenar),
+        parametros=(filtro_posicao, ordenar),
+        versoes=versoes_colecoes('jogadores')
+    )
+    
+    st.subheader(f"👥 {len(fichas)} jogador(es)")
+    
+    # Mostrar jogadores em cards (2 por linha)
+    for i in range(0, len(fichas), 2):
+        colunas = st.columns(2)
+        
+        for col, ficha in zip(colunas, fichas[i:i + 2]):
+            with col:
+                with st.container():
+                    st.markdown(f"### 👤 {ficha['nome']}")
+                    
+                    info_col1, info_col2 = st.columns([1, 2])
+                    
+                    with info_col1:
+                        if ficha['foto']:
+                            mostrar_foto(ficha['foto'], width=100)
+                        else:
+                            st.write("📷")
+                    
+                    with info_col2:
+                        st.markdown(ficha['info'])
+
+def _fichas_plantel(jogadores, filtro_posicao, ordenar):
+    """Filtra, ordena e prepara o markdown de cada jogador do plantel"""
+    # Aplicar filtros
+    jogadores_filtrados = jogadores
+    
+    if filtro_posicao != "Todas":
+        jogadores_filtrados = [j for j in jogadores_filtrados if j.get('posicao') == filtro_posicao]
+    
+    # Ordenar (sem alterar a lista original)
+    if ordenar == "Nome":
+        jogadores_filtrados = sorted(jogadores_filtrados, key=lambda x: x.get('nome', ''))
+    elif ordenar == "Posição":
+        jogadores_filtrados = sorted(jogadores_filtrados, key=lambda x: x.get('posicao', ''))
+    elif ordenar == "Idade":
+        jogadores_filtrados = sorted(jogadores_filtrados, key=lambda x: x.get('idade', 0))
+    elif ordenar == "Número da Camisola":
+        jogadores_filtrados = sorted(jogadores_filtrados, key=lambda x: x.get('nr_camisola', 0))
+    
+    fichas = []
+    for jogador in jogadores_filtrados:
+        linhas = [
+            f"**⚽ Posição:** {jogador.get('posicao', 'N/A')}",
+            f"**👕 Número:** #{jogador.get('nr_camisola', 'N/A')}",
+            f"**🎂 Idade:** {jogador.get('idade', 'N/A')} anos",
+            f"**📏 Altura:** {jogador.get('altura', 'N/A')}m",
+            f"**⚖️ Peso:** {jogador.get('peso', 'N/A')}kg",
+            f"**🏆 Último Clube:** {jogador.get('ultimo_clube', 'N/A')}",
+        ]
+        if jogador.get('pontos_fortes'):
+            linhas.append(f"**💪 Pontos Fortes:** {', '.join(jogador['pontos_fortes'][:2])}")
+        
+        fichas.append({
+            'nome': jogador.get('nome', 'Sem nome'),
+            'foto': jogador.get('foto'),
+            'info': "\n\n".join(linhas),
+        })
+    return fichas
+
+def treinos_jogador():
+    """Ver treinos da equipa"""
+    dados = carregar_dados()
+    
+    st.title("🏃 Treinos da Equipa")
+    
+    treinos = dados.get('treinos', {})
+    
+    if not treinos:
+        st.info("📝 Nenhum treino cadastrado ainda")
+        return
+    
+    # Filtros
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        tipos = list(set([t.get('tipo', 'N/A') for t in treinos.values()]))
+        filtro_tipo = st.selectbox("🔍 Filtrar por Tipo", ["Todos"] + tipos)
+    
+    with col2:
+        niveis = list(set([t.get('nivel', 'N/A') for t in treinos.values()]))
+        filtro_nivel = st.selectbox("📊 Filtrar por Nível", ["Todos"] + niveis)
+    
+    # Aplicar filtros
+    treinos_filtrados = {}
+    for tid, treino in treinos.items():
+        incluir = True
+        
+        if filtro_tipo != "Todos" and treino.get('tipo') != filtro_tipo:
+            incluir = False
+        
+        if filtro_nivel != "Todos" and treino.get('nivel') != filtro_nivel:
+            incluir = False
+        
+        if incluir:
+            treinos_filtrados[tid] = treino
+    
+    st.subheader(f"🏃 {len(treinos_filtrados)} treino(s) disponível(eis)")
+    
+    # Mostrar treinos
+    for treino_id, treino in treinos_filtrados.items():
+        with st.expander(f"🏃 {treino.get('nome', 'Treino')} - {treino.get('tipo', 'N/A')} ({treino.get('duracao', 0)} min)"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write(f"**⏱️ Duração:** {treino.get('duracao', 'N/A')} minutos")
+                st.write(f"**🎯 Categoria:** {treino.get('categoria', 'N/A')}")
+                st.write(f"**📊 Nível:** {treino.get('nivel', 'N/A')}")
+                if treino.get('data_criacao'):
+                    st.write(f"**📅 Criado:** {treino['data_criacao'][:10]}")
+            
+            with col2:
+                if treino.get('objetivos'):
+                    st.write("**🎯 Objetivos:**")
+                    for obj in treino['objetivos']:
+                        st.write(f"• {obj}")
+            
+            if treino.get('exercicios'):
+                st.write("**🏃 Exercícios:**")
+                for i, exercicio in enumerate(treino['exercicios'], 1):
+                    st.write(f"{i}. **{exercicio.get('nome', 'Exercício')}** ({exercicio.get('duracao', 0)} min)")
+                    if exercicio.get('descricao'):
+                        st.write(f"   _{exercicio['descricao']}_")
+            
+            if treino.get('observacoes'):
+                st.write("**📝 Observações:**")
+                st.write(treino['observacoes'])
+
+def plano_treinos_mensal_jogador():
+    """Plano de treinos mensal para jogador ou administrador"""
+    dados = carregar_dados()
+    usuario_login = st.session_state.get('usuario_logado')
+    
+    # Verificar se é admin ou treinador
+    if usuario_login == 'admin' or st.session_state.get('tipo_usuario') == 'treinador':
+        # Para admin/treinador, mostrar calendário geral
+        jogador_nome = "Administrador"
+    else:
+        # Encontrar nome do jogador
+        jogador_nome = None
+        for j in dados.get('jogadores', []):
+            if j.get('login') == usuario_login:
+                jogador_nome = j.get('nome')
+                break
+        
+        if not jogador_nome:
+            st.error("❌ Jogador não encontrado!")
+            return
+    
+    st.title("📅 Meu Plano de Treinos Mensal")
+    
+    # Seletor de mês/ano
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        ano = st.selectbox("Ano:", range(2024, 2027), index=1)
+    
+    with col2:
+        meses = [
+            "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+            "Juli", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+        ]
+        mes_idx = st.selectbox("Mês:", range(12), format_func=lambda x: meses[x], index=date.today().month - 1)
+        mes = mes_idx + 1
+    
+    # Gerar calendário HTML para o jogador
+    from calendar import monthrange
+    import calendar
+    
+    # Criar data de início e fim do mês
+    primeiro_dia = date(ano, mes, 1)
+    ultimo_dia = date(ano, mes, monthrange(ano, mes)[1])
+    
+    treinos = dados.get('treinos', {})
+    jogos = dados.get('jogos', [])
+    
+    # Filtrar treinos do mês
+    treinos_mes = {}
+    for data_str, treino in treinos.items():
+        try:
+            data_treino = datetime.strptime(data_str, '%Y-%m-%d').date()
+            if primeiro_dia <= data_treino <= ultimo_dia:
+                treinos_mes[data_str] = treino
+        except:
+            continue
+    
+    # Filtrar jogos do mês e adicionar ao calendário
+    for jogo in jogos:
+        try:
+            data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+            if primeiro_dia <= data_jogo <= ultimo_dia:
+                data_str = jogo['data']
+                # Adicionar jogo como um evento especial
+                treinos_mes[data_str] = {
+                    'tipo': f"⚽ JOGO vs {jogo.get('adversario', 'TBD')}",
+                    'hora': jogo.get('hora', 'TBD'),
+                    'local': jogo.get('local', 'TBD'),
+                    'is_jogo': True,
+                    'adversario': jogo.get('adversario', 'TBD')
+                }
+        except:
+            continue
+    
+    # Adicionar jogos do campeonato (jornadas) - ORDENADAS por número
+    campeonato = dados.get('campeonato', {})
+    jornadas = campeonato.get('jornadas', [])
+    
+    # Ordenar jornadas por número (pegar sempre a primeira de cada data)
+    jornadas_ordenadas = sorted(jornadas, key=lambda j: j.get('numero', 999))
+    
+    jogos_adicionados = {}  # Para controlar que datas já foram adicionadas
+    
+    for jornada in jornadas_ordenadas:
+        jornada_num = jornada.get('numero', 'N/A')
+        for jogo in jornada.get('jogos', []):
+            # Verificar se o FC Pinheirense está a jogar
+            if (jogo.get('casa') == 'Fc Pinheirense' or jogo.get('fora') == 'Fc Pinheirense'):
+                try:
+                    data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+                    if primeiro_dia <= data_jogo <= ultimo_dia:
+                        data_str = jogo['data']
+                        
+                        # Só adicionar se esta data ainda não foi adicionada
+                        if data_str not in jogos_adicionados:
+                            adversario = jogo.get('fora') if jogo.get('casa') == 'Fc Pinheirense' else jogo.get('casa')
+                            local_jogo = "Casa" if jogo.get('casa') == 'Fc Pinheirense' else "Fora"
+                            
+                            treinos_mes[data_str] = {
+                                'tipo': f"🏆 CAMPEONATO vs {adversario}",
+                                'hora': '16:00',
+                                'local': f"{local_jogo} - Jornada {jornada_num}",
+                                'is_jogo': True,
+                                'adversario': adversario,
+                                'jornada': jornada_num
+                            }
+                            jogos_adicionados[data_str] = jornada_num
+                except:
+                    continue
+    
+    if treinos_mes:
+        total_treinos = len([t for t in treinos_mes.values() if not t.get('is_jogo', False)])
+        total_jogos = len([t for t in treinos_mes.values() if t.get('is_jogo', False)])
+        st.success(f"📅 Encontrados {total_treinos} treinos e {total_jogos} jogos em {meses[mes_idx]} de {ano}")
+        
+        # Gerar calendário visual
+        html_calendario = gerar_calendario_visual_jogador(ano, mes, treinos_mes, jogador_nome)
+        
+        # Detectar se é mobile e ajustar altura do calendário
+        st.markdown("""
+        <script>
+        const isMobile = window.innerWidth <= 768;
+        if (isMobile) {
+            document.documentElement.style.setProperty('--calendar-height', '450px');
+        } else {
+            document.documentElement.style.setProperty('--calendar-height', '600px');
+        }
+        </script>
+        """, unsafe_allow_html=True)
+        
+        # Mostrar calendário com altura otimizada para mobile
+        altura_calendario = 450  # Altura menor para melhor visualização mobile
+        st.components.v1.html(html_calendario, height=altura_calendario, scrolling=True)
+        
+        # Botão para download
+        if st.button("📥 Download Calendário (HTML)"):
+            st.download_button(
+                label="⬇️ Baixar Calendário",
+                data=html_calendario,
+                file_name=f"plano_treinos_{jogador_nome}_{meses[mes_idx]}_{ano}.html",
+                mime="text/html"
+            )
+        
+        # Seção detalhada de treinos para gestão de escalações
+        st.markdown("---")
+        st.markdown("### 📋 Detalhes dos Treinos e Escalações")
+        
+        # Ordenar treinos por data
+        treinos_ordenados = sorted(treinos_mes.items(), key=lambda x: x[0])
+        
+        for data_str, treino in treinos_ordenados:
+            if not treino.get('is_jogo', False):  # Apenas treinos, não jogos
+                data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+                dia_semana = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo'][data_obj.weekday()]
+                
+                with st.expander(f"🏃 {treino.get('nome', 'Treino')} - {dia_semana} {data_obj.strftime('%d/%m')}"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**🏃 Tipo:** {treino.get('tipo', 'N/A')}")
+                        st.write(f"**🕐 Hora:** {treino.get('hora', 'N/A')}")
+                        st.write(f"**📍 Local:** {treino.get('local', 'N/A')}")
+                    
+                    with col2:
+                        st.write(f"**⏱️ Duração:** {treino.get('duracao', 'N/A')} min")
+                        st.write(f"**🎯 Objetivo:** {treino.get('objetivo', 'N/A')}")
+                    
+                    if treino.get('observacoes'):
+                        st.write(f"**📝 Observações:** {treino['observacoes']}")
+                    
+                    # Nova seção: Escalação/Posições dos Jogadores
+                    st.markdown("#### ⚽ Escalação dos Jogadores")
+                    
+                    # Verificar se o treinador está logado para permitir edição
+                    if st.session_state.get('tipo_usuario') == 'treinador' or st.session_state.get('usuario_logado') == 'admin':
+                        # Botão para definir/editar escalação
+                        if st.button(f"⚙️ Definir Escalação", key=f"escalacao_mensal_{data_str}", type="secondary"):
+                            st.session_state[f'editando_escalacao_mensal_{data_str}'] = True
+                            st.rerun()
+                        
+                        # Interface de edição de escalação (se ativada)
+                        if st.session_state.get(f'editando_escalacao_mensal_{data_str}', False):
+                            st.markdown("**🎯 Definir Escalação para o Treino:**")
+                            
+                            # Carregar jogadores disponíveis
+                            jogadores_disponiveis = dados.get('jogadores', [])
+                            nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores_disponiveis]
+                            
+                            if not jogadores_disponiveis:
+                                st.warning("⚠️ Nenhum jogador cadastrado")
+                            else:
+                                # Formulário de escalação
+                                with st.form(f"form_escalacao_mensal_{data_str}"):
+                                    st.write("**Posições:**")
+                                    
+                                    col1, col2, col3 = st.columns(3)
+                                    
+                                    # Obter escalação atual do treino (se existir)
+                                    escalacao_atual = treino.get('escalacao', {})
+                                    
+                                    with col1:
+                                        st.markdown("**🥅 Defesa:**")
+                                        gr = st.selectbox("Guarda-Redes:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"gr_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('GR', '')) + 1 if escalacao_atual.get('GR') in nomes_jogadores else 0)
+                                        
+                                        dd = st.selectbox("Defesa Direito:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"dd_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('DD', '')) + 1 if escalacao_atual.get('DD') in nomes_jogadores else 0)
+                                        
+                                        dc1 = st.selectbox("Defesa Central 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                         key=f"dc1_mensal_{data_str}",
+                                                         index=nomes_jogadores.index(escalacao_atual.get('DC1', '')) + 1 if escalacao_atual.get('DC1') in nomes_jogadores else 0)
+                                        
+                                        dc2 = st.selectbox("Defesa Central 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                         key=f"dc2_mensal_{data_str}",
+                                                         index=nomes_jogadores.index(escalacao_atual.get('DC2', '')) + 1 if escalacao_atual.get('DC2') in nomes_jogadores else 0)
+                                        
+                                        de = st.selectbox("Defesa Esquerdo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"de_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('DE', '')) + 1 if escalacao_atual.get('DE') in nomes_jogadores else 0)
+                                    
+                                    with col2:
+                                        st.markdown("**⚽ Meio-Campo:**")
+                                        mdc = st.selectbox("Médio Defensivo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                         key=f"mdc_mensal_{data_str}",
+                                                         index=nomes_jogadores.index(escalacao_atual.get('MDC', '')) + 1 if escalacao_atual.get('MDC') in nomes_jogadores else 0)
+                                        
+                                        mc1 = st.selectbox("Médio Centro 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                         key=f"mc1_mensal_{data_str}",
+                                                         index=nomes_jogadores.index(escalacao_atual.get('MC1', '')) + 1 if escalacao_atual.get('MC1') in nomes_jogadores else 0)
+                                        
+                                        mc2 = st.selectbox("Médio Centro 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                         key=f"mc2_mensal_{data_str}",
+                                                         index=nomes_jogadores.index(escalacao_atual.get('MC2', '')) + 1 if escalacao_atual.get('MC2') in nomes_jogadores else 0)
+                                        
+                                        ed = st.selectbox("Extremo Direito:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"ed_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('ED', '')) + 1 if escalacao_atual.get('ED') in nomes_jogadores else 0)
+                                        
+                                        ee = st.selectbox("Extremo Esquerdo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"ee_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('EE', '')) + 1 if escalacao_atual.get('EE') in nomes_jogadores else 0)
+                                    
+                                    with col3:
+                                        st.markdown("**🎯 Ataque:**")
+                                        pl = st.selectbox("Ponta de Lança:", ["-- Não definido --"] + nomes_jogadores, 
+                                                        key=f"pl_mensal_{data_str}",
+                                                        index=nomes_jogadores.index(escalacao_atual.get('PL', '')) + 1 if escalacao_atual.get('PL') in nomes_jogadores else 0)
+                                        
+                                        st.markdown("**🔄 Suplentes:**")
+                                        sup1 = st.selectbox("Suplente 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                          key=f"sup1_mensal_{data_str}",
+                                                          index=nomes_jogadores.index(escalacao_atual.get('SUP1', '')) + 1 if escalacao_atual.get('SUP1') in nomes_jogadores else 0)
+                                        
+                                        sup2 = st.selectbox("Suplente 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                          key=f"sup2_mensal_{data_str}",
+                                                          index=nomes_jogadores.index(escalacao_atual.get('SUP2', '')) + 1 if escalacao_atual.get('SUP2') in nomes_jogadores else 0)
+                                        
+                                        sup3 = st.selectbox("Suplente 3:", ["-- Não definido --"] + nomes_jogadores, 
+                                                          key=f"sup3_mensal_{data_str}",
+                                                          index=nomes_jogadores.index(escalacao_atual.get('SUP3', '')) + 1 if escalacao_atual.get('SUP3') in nomes_jogadores else 0)
+                                    
+                                    col_salvar, col_cancelar = st.columns(2)
+                                    
+                                    with col_salvar:
+                                        salvar_escalacao = st.form_submit_button("💾 Salvar Escalação", type="primary")
+                                    
+                                    with col_cancelar:
+                                        cancelar_escalacao = st.form_submit_button("❌ Cancelar")
+                                    
+                                    if salvar_escalacao:
+                                        # Criar escalação
+                                        nova_escalacao = {}
+                                        
+                                        # Adicionar apenas jogadores selecionados
+                                        posicoes_mapping = {
+                                            'GR': gr, 'DD': dd, 'DC1': dc1, 'DC2': dc2, 'DE': de,
+                                            'MDC': mdc, 'MC1': mc1, 'MC2': mc2, 'ED': ed, 'EE': ee,
+                                            'PL': pl, 'SUP1': sup1, 'SUP2': sup2, 'SUP3': sup3
+                                        }
+                                        
+                                        for pos, jogador in posicoes_mapping.items():
+                                            if jogador != "-- Não definido --":
+                                                nova_escalacao[pos] = jogador
+                                        
+                                        # Salvar escalação no treino
+                                        dados['treinos'][data_str]['escalacao'] = nova_escalacao
+                                        
+                                        if salvar_dados(dados):
+                                            st.success("✅ Escalação salva com sucesso!")
+                                            del st.session_state[f'editando_escalacao_mensal_{data_str}']
+                                            st.rerun()
+                                        else:
+                                            st.error("❌ Erro ao salvar escalação")
+                                    
+                                    if cancelar_escalacao:
+                                        del st.session_state[f'editando_escalacao_mensal_{data_str}']
+                                        st.rerun()
+                    
+                    # Mostrar escalação atual (se existir)
+                    escalacao = treino.get('escalacao', {})
+                    if escalacao:
+                        st.markdown("**⚽ Escalação Definida:**")
+                        
+                        # Organizar por setores
+                        setores = {
+                            "🥅 Defesa": ["GR", "DD", "DC1", "DC2", "DE"],
+                            "⚽ Meio-Campo": ["MDC", "MC1", "MC2", "ED", "EE"], 
+                            "🎯 Ataque": ["PL"],
+                            "🔄 Suplentes": ["SUP1", "SUP2", "SUP3"]
+                        }
+                        
+                        cols = st.columns(len(setores))
+                        
+                        for idx, (setor, posicoes) in enumerate(setores.items()):
+                            with cols[idx]:
+                                st.markdown(f"**{setor}**")
+                                for pos in posicoes:
+                                    if pos in escalacao:
+                                        pos_nome = {
+                                            'GR': 'Guarda-Redes', 'DD': 'Def. Direito', 'DC1': 'Def. Central 1',
+                                            'DC2': 'Def. Central 2', 'DE': 'Def. Esquerdo', 'MDC': 'Médio Def.',
+                                            'MC1': 'Médio 1', 'MC2': 'Médio 2', 'ED': 'Extremo Dir.',
+                                            'EE': 'Extremo Esq.', 'PL': 'Ponta de Lança',
+                                            'SUP1': 'Suplente 1', 'SUP2': 'Suplente 2', 'SUP3': 'Suplente 3'
+                                        }.get(pos, pos)
+                                        st.write(f"• **{pos_nome}:** {escalacao[pos]}")
+                    else:
+                        if st.session_state.get('tipo_usuario') == 'treinador' or st.session_state.get('usuario_logado') == 'admin':
+                            st.info("ℹ️ Escalação não definida para este treino")
+                        else:
+                            st.info("ℹ️ Escalação será definida pelo treinador")
+        
+    else:
+        st.info(f"📝 Nenhum treino agendado para {meses[mes_idx]} de {ano}")
+
+def plano_treinos_semanal_jogador():
+    """Plano de treinos semanal para jogador ou administrador"""
+    dados = carregar_dados()
+    usuario_login = st.session_state.get('usuario_logado')
+    
+    # Verificar se é admin ou treinador
+    if usuario_login == 'admin' or st.session_state.get('tipo_usuario') == 'treinador':
+        # Para admin/treinador, mostrar calendário geral
+        jogador_nome = "Administrador"
+    else:
+        # Encontrar nome do jogador
+        jogador_nome = None
+        for j in dados.get('jogadores', []):
+            if j.get('login') == usuario_login:
+                jogador_nome = j.get('nome')
+                break
+        
+        if not jogador_nome:
+            st.error("❌ Jogador não encontrado!")
+            return
+    
+    # Remover título para interface mais limpa
+    # st.title("📊 Meu Plano de Treinos Semanal")
+    
+    # Seletor de semana
+    hoje = date.today()
+    
+    # Calcular início da semana (segunda-feira)
+    dias_desde_segunda = hoje.weekday()
+    inicio_semana = hoje - timedelta(days=dias_desde_segunda)
+    
+    # Opções de semanas (2 semanas anteriores, atual, 4 semanas futuras)
+    semanas = []
+    for i in range(-2, 5):
+        semana_inicio = inicio_semana + timedelta(weeks=i)
+        semana_fim = semana_inicio + timedelta(days=6)
+        semanas.append((semana_inicio, semana_fim))
+    
+    opcoes_semanas = []
+    for inicio, fim in semanas:
+        opcoes_semanas.append(f"{inicio.strftime('%d/%m')} - {fim.strftime('%d/%m/%Y')}")
+    
+    semana_idx = st.selectbox("Selecione a semana:", range(len(opcoes_semanas)), 
+                             format_func=lambda x: opcoes_semanas[x], index=2)
+    
+    semana_selecionada = semanas[semana_idx]
+    inicio_semana_sel, fim_semana_sel = semana_selecionada
+    
+    treinos = dados.get('treinos', {})
+    jogos = dados.get('jogos', [])
+    
+    # Filtrar treinos da semana
+    treinos_semana = {}
+    for data_str, treino in treinos.items():
+        try:
+            data_treino = datetime.strptime(data_str, '%Y-%m-%d').date()
+            if inicio_semana_sel <= data_treino <= fim_semana_sel:
+                treinos_semana[data_str] = treino
+        except:
+            continue
+    
+    # Filtrar jogos da semana e adicionar
+    for jogo in jogos:
+        try:
+            data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+            if inicio_semana_sel <= data_jogo <= fim_semana_sel:
+                data_str = jogo['data']
+                # Adicionar jogo como evento especial
+                treinos_semana[data_str] = {
+                    'tipo': f"⚽ JOGO vs {jogo.get('adversario', 'TBD')}",
+                    'hora': jogo.get('hora', 'TBD'),
+                    'local': jogo.get('local', 'TBD'),
+                    'is_jogo': True,
+                    'adversario': jogo.get('adversario', 'TBD')
+                }
+        except:
+            continue
+    
+    # Adicionar jogos do campeonato (jornadas)
+    campeonato = dados.get('campeonato', {})
+    jornadas = campeonato.get('jornadas', [])
+    
+    for jornada in jornadas:
+        for jogo in jornada.get('jogos', []):
+            # Verificar se o FC Pinheirense está a jogar
+            if (jogo.get('casa') == 'Fc Pinheirense' or jogo.get('fora') == 'Fc Pinheirense'):
+                try:
+                    data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+                    if inicio_semana_sel <= data_jogo <= fim_semana_sel:
+                        data_str = jogo['data']
+                        adversario = jogo.get('fora') if jogo.get('casa') == 'Fc Pinheirense' else jogo.get('casa')
+                        local_jogo = "Casa" if jogo.get('casa') == 'Fc Pinheirense' else "Fora"
+                        
+                        # Adicionar jogo do campeonato
+                        treinos_semana[data_str] = {
+                            'tipo': f"🏆 CAMPEONATO vs {adversario}",
+                            'hora': '16:00',
+                            'local': f"{local_jogo} - Jornada {jornada.get('numero', 'N/A')}",
+                            'is_jogo': True,
+                            'adversario': adversario,
+                            'jornada': jornada.get('numero')
+                        }
+                except:
+                    continue
+    
+    # Interface mais limpa - remover subtítulo
+    # st.subheader(f"📅 Semana de {inicio_semana_sel.strftime('%d/%m')} a {fim_semana_sel.strftime('%d/%m/%Y')}")
+    
+    # Mostrar treinos da semana
+    dias_semana = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo']
+    
+    # Mostrar treinos da semana de forma simples
+    
+    for i in range(7):
+        dia_atual = inicio_semana_sel + timedelta(days=i)
+        data_str = dia_atual.strftime('%Y-%m-%d')
+        
+        # Verificar se é hoje
+        eh_hoje = dia_atual == date.today()
+        
+        if data_str in treinos_semana:
+            treino = treinos_semana[data_str]
+            
+            # Header do dia
+            if eh_hoje:
+                st.markdown(f"**🔥 {dias_semana[i]} - {dia_atual.strftime('%d/%m')} (HOJE)**")
+            elif dia_atual < date.today():
+                st.markdown(f"**✅ {dias_semana[i]} - {dia_atual.strftime('%d/%m')}**")
+            else:
+                st.markdown(f"**📅 {dias_semana[i]} - {dia_atual.strftime('%d/%m')}**")
+            
+            # Informações básicas do treino
+            st.write(f"🏃 **Tipo:** {treino.get('tipo', 'N/A')}")
+            st.write(f"🕐 **Hora:** {treino.get('hora', 'N/A')}")
+            st.write(f"📍 **Local:** {treino.get('local', 'N/A')}")
+            st.write(f"⏱️ **Duração:** {treino.get('duracao', 'N/A')} min")
+            
+            if treino.get('objetivo') and treino.get('objetivo') != 'N/A':
+                st.write(f"🎯 **Objetivo:** {treino.get('objetivo')}")
+            
+            # Exercícios (apenas nomes)
+            if treino.get('exercicios'):
+                st.write("📋 **Exercícios:**")
+                for exercicio in treino['exercicios']:
+                    if isinstance(exercicio, dict):
+                        nome_exercicio = exercicio.get('nome', 'Exercício sem nome')
+                        st.write(f"• {nome_exercicio}")
+                    else:
+                        st.write(f"• {exercicio}")
+            
+            # Observações (se existirem)
+            if treino.get('observacoes'):
+                st.write(f"📝 **Observações:** {treino['observacoes']}")
+            
+            # Nova seção: Escalação/Posições dos Jogadores
+            st.markdown("#### ⚽ Escalação dos Jogadores")
+            
+            # Verificar se o treinador está logado para permitir edição
+            if st.session_state.get('tipo_usuario') == 'treinador' or st.session_state.get('usuario_logado') == 'admin':
+                # Botão para definir/editar escalação
+                if st.button(f"⚙️ Definir Escalação", key=f"escalacao_{data_str}", type="secondary"):
+                    st.session_state[f'editando_escalacao_{data_str}'] = True
+                    st.rerun()
+                
+                # Interface de edição de escalação (se ativada)
+                if st.session_state.get(f'editando_escalacao_{data_str}', False):
+                    st.markdown("**🎯 Definir Escalação para o Treino:**")
+                    
+                    # Carregar jogadores disponíveis
+                    jogadores_disponiveis = dados.get('jogadores', [])
+                    nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores_disponiveis]
+                    
+                    if not jogadores_disponiveis:
+                        st.warning("⚠️ Nenhum jogador cadastrado")
+                    else:
+                        # Formulário de escalação
+                        with st.form(f"form_escalacao_{data_str}"):
+                            st.write("**Posições:**")
+                            
+                            col1, col2, col3 = st.columns(3)
+                            
+                            # Obter escalação atual do treino (se existir)
+                            escalacao_atual = treino.get('escalacao', {})
+                            
+                            with col1:
+                                st.markdown("**🥅 Defesa:**")
+                                gr = st.selectbox("Guarda-Redes:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"gr_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('GR', '')) + 1 if escalacao_atual.get('GR') in nomes_jogadores else 0)
+                                
+                                dd = st.selectbox("Defesa Direito:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"dd_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('DD', '')) + 1 if escalacao_atual.get('DD') in nomes_jogadores else 0)
+                                
+                                dc1 = st.selectbox("Defesa Central 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                 key=f"dc1_{data_str}",
+                                                 index=nomes_jogadores.index(escalacao_atual.get('DC1', '')) + 1 if escalacao_atual.get('DC1') in nomes_jogadores else 0)
+                                
+                                dc2 = st.selectbox("Defesa Central 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                 key=f"dc2_{data_str}",
+                                                 index=nomes_jogadores.index(escalacao_atual.get('DC2', '')) + 1 if escalacao_atual.get('DC2') in nomes_jogadores else 0)
+                                
+                                de = st.selectbox("Defesa Esquerdo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"de_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('DE', '')) + 1 if escalacao_atual.get('DE') in nomes_jogadores else 0)
+                            
+                            with col2:
+                                st.markdown("**⚽ Meio-Campo:**")
+                                mdc = st.selectbox("Médio Defensivo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                 key=f"mdc_{data_str}",
+                                                 index=nomes_jogadores.index(escalacao_atual.get('MDC', '')) + 1 if escalacao_atual.get('MDC') in nomes_jogadores else 0)
+                                
+                                mc1 = st.selectbox("Médio Centro 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                 key=f"mc1_{data_str}",
+                                                 index=nomes_jogadores.index(escalacao_atual.get('MC1', '')) + 1 if escalacao_atual.get('MC1') in nomes_jogadores else 0)
+                                
+                                mc2 = st.selectbox("Médio Centro 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                 key=f"mc2_{data_str}",
+                                                 index=nomes_jogadores.index(escalacao_atual.get('MC2', '')) + 1 if escalacao_atual.get('MC2') in nomes_jogadores else 0)
+                                
+                                ed = st.selectbox("Extremo Direito:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"ed_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('ED', '')) + 1 if escalacao_atual.get('ED') in nomes_jogadores else 0)
+                                
+                                ee = st.selectbox("Extremo Esquerdo:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"ee_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('EE', '')) + 1 if escalacao_atual.get('EE') in nomes_jogadores else 0)
+                            
+                            with col3:
+                                st.markdown("**🎯 Ataque:**")
+                                pl = st.selectbox("Ponta de Lança:", ["-- Não definido --"] + nomes_jogadores, 
+                                                key=f"pl_{data_str}",
+                                                index=nomes_jogadores.index(escalacao_atual.get('PL', '')) + 1 if escalacao_atual.get('PL') in nomes_jogadores else 0)
+                                
+                                st.markdown("**🔄 Suplentes:**")
+                                sup1 = st.selectbox("Suplente 1:", ["-- Não definido --"] + nomes_jogadores, 
+                                                  key=f"sup1_{data_str}",
+                                                  index=nomes_jogadores.index(escalacao_atual.get('SUP1', '')) + 1 if escalacao_atual.get('SUP1') in nomes_jogadores else 0)
+                                
+                                sup2 = st.selectbox("Suplente 2:", ["-- Não definido --"] + nomes_jogadores, 
+                                                  key=f"sup2_{data_str}",
+                                                  index=nomes_jogadores.index(escalacao_atual.get('SUP2', '')) + 1 if escalacao_atual.get('SUP2') in nomes_jogadores else 0)
+                                
+                                sup3 = st.selectbox("Suplente 3:", ["-- Não definido --"] + nomes_jogadores, 
+                                                  key=f"sup3_{data_str}",
+                                                  index=nomes_jogadores.index(escalacao_atual.get('SUP3', '')) + 1 if escalacao_atual.get('SUP3') in nomes_jogadores else 0)
+                            
+                            col_salvar, col_cancelar = st.columns(2)
+                            
+                            with col_salvar:
+                                salvar_escalacao = st.form_submit_button("💾 Salvar Escalação", type="primary")
+                            
+                            with col_cancelar:
+                                cancelar_escalacao = st.form_submit_button("❌ Cancelar")
+                            
+                            if salvar_escalacao:
+                                # Criar escalação
+                                nova_escalacao = {}
+                                
+                                # Adicionar apenas jogadores selecionados
+                                posicoes_mapping = {
+                                    'GR': gr, 'DD': dd, 'DC1': dc1, 'DC2': dc2, 'DE': de,
+                                    'MDC': mdc, 'MC1': mc1, 'MC2': mc2, 'ED': ed, 'EE': ee,
+                                    'PL': pl, 'SUP1': sup1, 'SUP2': sup2, 'SUP3': sup3
+                                }
+                                
+                                for pos, jogador in posicoes_mapping.items():
+                                    if jogador != "-- Não definido --":
+                                        nova_escalacao[pos] = jogador
+                                
+                                # Salvar escalação no treino
+                                dados['treinos'][data_str]['escalacao'] = nova_escalacao
+                                
+                                if salvar_dados(dados):
+                                    st.success("✅ Escalação salva com sucesso!")
+                                    del st.session_state[f'editando_escalacao_{data_str}']
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao salvar escalação")
+                            
+                            if cancelar_escalacao:
+                                del st.session_state[f'editando_escalacao_{data_str}']
+                                st.rerun()
+            
+            # Mostrar escalação atual (se existir)
+            escalacao = treino.get('escalacao', {})
+            if escalacao:
+                st.markdown("**⚽ Escalação Definida:**")
+                
+                # Organizar por setores
+                setores = {
+                    "🥅 Defesa": ["GR", "DD", "DC1", "DC2", "DE"],
+                    "⚽ Meio-Campo": ["MDC", "MC1", "MC2", "ED", "EE"], 
+                    "🎯 Ataque": ["PL"],
+                    "🔄 Suplentes": ["SUP1", "SUP2", "SUP3"]
+                }
+                
+                cols = st.columns(len(setores))
+                
+                for idx, (setor, posicoes) in enumerate(setores.items()):
+                    with cols[idx]:
+                        st.markdown(f"**{setor}**")
+                        for pos in posicoes:
+                            if pos in escalacao:
+                                pos_nome = {
+                                    'GR': 'Guarda-Redes', 'DD': 'Def. Direito', 'DC1': 'Def. Central 1',
+                                    'DC2': 'Def. Central 2', 'DE': 'Def. Esquerdo', 'MDC': 'Médio Def.',
+                                    'MC1': 'Médio 1', 'MC2': 'Médio 2', 'ED': 'Extremo Dir.',
+                                    'EE': 'Extremo Esq.', 'PL': 'Ponta de Lança',
+                                    'SUP1': 'Suplente 1', 'SUP2': 'Suplente 2', 'SUP3': 'Suplente 3'
+                                }.get(pos, pos)
+                                st.write(f"• **{pos_nome}:** {escalacao[pos]}")
+            else:
+                if st.session_state.get('tipo_usuario') == 'treinador' or st.session_state.get('usuario_logado') == 'admin':
+                    st.info("ℹ️ Escalação não definida para este treino")
+                else:
+                    st.info("ℹ️ Escalação será definida pelo treinador")
+            
+            st.write("---")
+            
+        else:
+            # Dia de descanso
+            emoji_dia = "😴" if eh_hoje else "💤"
+            st.markdown(f"""
+            
+                
+                    {emoji_dia} {dias_semana[i]} - {dia_atual.strftime('%d/%m')}
+                    {' (HOJE)' if eh_hoje else ''}
+                
+                
+                    <strong>  Dia de Descanso</strong>
+                
+                
+                    Aproveite para recuperar as energias! 💪
+                
+            
+            """, unsafe_allow_html=True)
+
+def gerar_calendario_visual_jogador(ano, mes, treinos_mes, jogador_nome):
+    """Gerar calendário visual HTML específico para jogador - OTIMIZADO PARA MOBILE"""
+    import calendar
+    
+    # Garantir que a semana comece na segunda-feira (0 = segunda-feira)
+    calendar.setfirstweekday(0)
+    
+    # Nome do mês em português
+    meses_pt = [
+        "", "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+        "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+    ]
+    
+    # Gerar calendário
+    cal = calendar.monthcalendar(ano, mes)
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Plano de Treinos - {jogador_nome} - {meses_pt[mes]} {ano}</title>
+        <style>
+            @page {{
+                size: A4 landscape;
+                margin: 15mm;
+            }}
+            body {{
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                margin: 0;
+                padding: 10px;
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                font-size: 12px;
+            }}
+            .container {{
+                max-width: 100%;
+                margin: 0 auto;
+                background: white;
+                border-radius: 12px;
+                box-shadow: 0 15px 30px rgba(0,0,0,0.15);
+                overflow: hidden;
+            }}
+            .header {{
+                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+                color: white;
+                padding: 20px;
+                text-align: center;
+            }}
+            .header h1 {{
+                font-size: 1.8em;
+                font-weight: bold;
+                margin-bottom: 8px;
+            }}
+            .header h2 {{
+                font-size: 1.2em;
+                opacity: 0.9;
+                margin: 3px 0;
+            }}
+            .legenda {{
+                display: flex;
+                justify-content: center;
+                gap: 30px;
+                margin: 15px 0;
+                padding: 15px;
+                background: #f8f9fa;
+                border-radius: 8px;
+            }}
+            .legenda h3 {{
+                font-size: 1.1em;
+                color: #2c3e50;
+                margin-bottom: 10px;
+                text-align: center;
+                width: 100%;
+            }}
+            .legenda-item {{
+                display: flex;
+                align-items: center;
+                gap: 8px;
+                font-weight: bold;
+                font-size: 0.9em;
+            }}
+            .cor-treino {{
+                width: 16px;
+                height: 16px;
+                background: #28a745;
+                border-radius: 3px;
+            }}
+            .cor-jogo {{
+                width: 16px;
+                height: 16px;
+                background: #dc3545;
+                border-radius: 3px;
+            }}
+            .calendar {{
+                display: grid;
+                grid-template-columns: repeat(7, 1fr);
+                gap: 3px;
+                background: #f8f9fa;
+                padding: 8px;
+                border-radius: 8px;
+                margin: 20px;
+            }}
+            .day-header {{
+                background: #343a40;
+                color: white;
+                padding: 10px 8px;
+                text-align: center;
+                font-weight: bold;
+                border-radius: 4px;
+                font-size: 0.9em;
+            }}
+            .day {{
+                background: white;
+                min-height: 70px;
+                padding: 6px;
+                border-radius: 4px;
+                border: 1px solid #dee2e6;
+                position: relative;
+            }}
+            .day-empty {{
+                background: #f8f9fa;
+                color: #bdc3c7;
+            }}
+            .day-number {{
+                font-weight: bold;
+                font-size: 0.95em;
+                color: #495057;
+                margin-bottom: 4px;
+                text-align: center;
+            }}
+            .treino {{
+                background: #28a745;
+                color: white;
+                padding: 1px 4px;
+                margin: 1px 0;
+                border-radius: 2px;
+                font-size: 0.9em;
+                line-height: 1.2;
+                text-align: center;
+            }}
+            .jogo {{
+                background: #dc3545;
+                color: white;
+                padding: 1px 4px;
+                margin: 1px 0;
+                border-radius: 2px;
+                font-size: 0.9em;
+                line-height: 1.2;
+                text-align: center;
+                border: 1px solid #fff;
+            }}
+            .hoje {{
+                background: linear-gradient(45deg, #FF9800, #F57C00) !important;
+                color: white;
+            }}
+            .hoje .day-number {{
+                color: white;
+                text-shadow: 0 1px 2px rgba(0,0,0,0.3);
+            }}
+            .footer {{
+                background: #343a40;
+                color: white;
+                padding: 15px;
+                text-align: center;
+                font-size: 0.9em;
+            }}
+            @media print {{
+                body {{ 
+                    background: white !important;
+                    padding: 0 !important;
+                    font-size: 11px !important;
+                }}
+                .container {{ 
+                    box-shadow: none !important;
+                    border-radius: 0 !important;
+                    max-width: 100% !important;
+                }}
+                .header {{
+                    padding: 15px !important;
+                }}
+                .header h1 {{
+                    font-size: 1.6em !important;
+                }}
+                .calendar {{
+                    padding: 15px !important;
+                }}
+                .day {{
+                    min-height: 65px !important;
+                }}
+                .calendar {{
+                    gap: 2px !important;
+                }}
+            }}
+            
+            /* === CSS RESPONSIVO PARA MOBILE === */
+            @media (max-width: 768px) {{
+                body {{
+                    padding: 5px;
+                    font-size: 10px;
+                }}
+                .container {{
+                    border-radius: 8px;
+                    margin: 0;
+                }}
+                .header {{
+                    padding: 10px;
+                }}
+                .header h1 {{
+                    font-size: 1.2em;
+                    margin-bottom: 5px;
+                }}
+                .header h2 {{
+                    font-size: 0.9em;
+                    margin: 2px 0;
+                }}
+                .legenda {{
+                    gap: 15px;
+                    margin: 8px 0;
+                    padding: 8px;
+                    flex-wrap: wrap;
+                }}
+                .legenda h3 {{
+                    font-size: 0.9em;
+                    margin-bottom: 5px;
+                }}
+                .legenda-item {{
+                    font-size: 0.7em;
+                    gap: 5px;
+                }}
+                .cor-treino, .cor-jogo {{
+                    width: 12px;
+                    height: 12px;
+                }}
+                .calendar {{
+                    gap: 1px;
+                    padding: 5px;
+                    margin: 10px 5px;
+                }}
+                .day-header {{
+                    padding: 5px 2px;
+                    font-size: 0.7em;
+                }}
+                .day {{
+                    min-height: 45px;
+                    padding: 2px;
+                }}
+                .day-number {{
+                    font-size: 0.8em;
+                    margin-bottom: 2px;
+                }}
+                .treino, .jogo {{
+                    padding: 1px 2px;
+                    margin: 1px 0;
+                    font-size: 0.6em;
+                    line-height: 1.1;
+                }}
+                .footer {{
+                    padding: 8px;
+                    font-size: 0.7em;
+                }}
+            }}
+            
+            /* === CSS ULTRA COMPACTO PARA SMARTPHONES PEQUENOS === */
+            @media (max-width: 480px) {{
+                body {{
+                    padding: 2px;
+                    font-size: 9px;
+                }}
+                .header {{
+                    padding: 8px;
+                }}
+                .header h1 {{
+                    font-size: 1em;
+                }}
+                .header h2 {{
+                    font-size: 0.8em;
+                }}
+                .legenda {{
+                    gap: 10px;
+                    margin: 5px 0;
+                    padding: 5px;
+                }}
+                .legenda h3 {{
+                    font-size: 0.8em;
+                }}
+                .legenda-item {{
+                    font-size: 0.6em;
+                }}
+                .calendar {{
+                    gap: 1px;
+                    padding: 3px;
+                    margin: 5px 2px;
+                }}
+                .day-header {{
+                    padding: 3px 1px;
+                    font-size: 0.6em;
+                }}
+                .day {{
+                    min-height: 35px;
+                    padding: 1px;
+                }}
+                .day-number {{
+                    font-size: 0.7em;
+                    margin-bottom: 1px;
+                }}
+                .treino, .jogo {{
+                    padding: 0px 1px;
+                    margin: 0px;
+                    font-size: 0.5em;
+                    line-height: 1;
+                }}
+                .footer {{
+                    padding: 5px;
+                    font-size: 0.6em;
+                }}
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>⚽ FC Pinheirense</h1>
+                <h2>📅 Plano de Treinos - {jogador_nome}</h2>
+                <h2>{meses_pt[mes]} {ano}</h2>
+            </div>
+            
+            <div class="legenda">
+                <h3>📋 Legenda:</h3>
+                <div class="legenda-item">
+                    <div class="cor-treino"></div>
+                    <span>🏃 Treino Agendado</span>
+                </div>
+                <div class="legenda-item">
+                    <div class="cor-jogo"></div>
+                    <span>⚽ Jogo</span>
+                </div>
+            </div>
+            
+            <div class="calendar">
+                <div class="day-header">Segunda</div>
+                <div class="day-header">Terça</div>
+                <div class="day-header">Quarta</div>
+                <div class="day-header">Quinta</div>
+                <div class="day-header">Sexta</div>
+                <div class="day-header">Sábado</div>
+                <div class="day-header">Domingo</div>
+    """
+    
+    hoje = date.today()
+    
+    for semana in cal:
+        for dia in semana:
+            if dia == 0:
+                html += '<div class="day day-empty"></div>'
+            else:
+                data_atual = date(ano, mes, dia)
+                data_str = data_atual.strftime('%Y-%m-%d')
+                
+                # Verificar se é hoje
+                classe_hoje = "hoje" if data_atual == hoje else ""
+                
+                html += f'<div class="day {classe_hoje}">'
+                html += f'<div class="day-number">{dia}</div>'
+                
+                # Verificar se há treino ou jogo neste dia
+                if data_str in treinos_mes:
+                    evento = treinos_mes[data_str]
+                    if evento.get('is_jogo', False):
+                        # É um jogo  
+                        html += f'''
+                        <div class="jogo">
+                            ⚽ JOGO vs {evento.get('adversario', 'TBD')} - {evento.get('hora', 'TBD')}
+                        </div>
+                        '''
+                    else:
+                        # É um treino
+                        html += f'''
+                        <div class="treino">
+                            🏃 {evento.get('tipo', 'Treino')} - {evento.get('hora', 'TBD')}
+                        </div>
+                        '''
+                
+                html += '</div>'  # Fechar div do dia
+    
+    # Fechar o calendário
+    html += """
+            </div>  <!-- Fechar calendar -->
+            
+            <div class="footer">
+                <strong>⚽ F.C. PINHEIRENSE</strong><br>
+                Plano de Treinos gerado para {jogador_nome}<br>
+                Sistema de Gestão de Treinos
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return html
@@ -0,0 +1,1286 @@
+"""
+Página de Gestão de Jogadores
+Plantel, fichas individuais, fotos e exportação da lista de jogadores
+"""
+
+import streamlit as st
+import json
+import os
+import uuid
+import glob as glob_module
+from datetime import datetime
+
+from backup_restore import restaurar_backup_streaming
+from app_core import (
+    bcrypt, EmailNotifications, DATA_FILE, obter_pipeline_persistencia, limpar_cache_e_forcar_reload, mostrar_foto,
+    obter_cache_dados, invalidar_cache_dados, obter_contexto_rerun, invalidar_contexto_rerun, carregar_dados,
+    salvar_dados, backup_automatico, criar_backup_manual, mostrar_restauro_backup, mostrar_secao_estatisticas_jogador
+)
+from app_pages.pdfs import gerar_pdf_lista_jogadores
+
+
+def processar_imagem(uploaded_file):
+    """Processa e converte imagem para base64"""
+    try:
+        from io import BytesIO
+        import base64
+        from PIL import Image
+        
+        # Abrir imagem
+        image = Image.open(uploaded_file)
+        
+        # Redimensionar para 300x300 mantendo proporção
+        image.thumbnail((300, 300), Image.Resampling.LANCZOS)
+        
+        # Converter para RGB se necessário
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # Converter para base64
+        buffer = BytesIO()
+        image.save(buffer, format='JPEG', quality=85)
+        img_base64 = base64.b64encode(buffer.getvalue()).decode()
+        
+        return f"data:image/jpeg;base64,{img_base64}"
+    except Exception as e:
+        st.error(f"Erro ao processar imagem: {e}")
+        return None
+
+def carregar_dados_arquivo_apenas():
+    """Carrega dados apenas do arquivo, sem cache ou sessão - para verificação"""
+    try:
+        if not os.path.exists(DATA_FILE):
+            return {"treinos": {}, "jogos": [], "jogadores": [], "taticas": [], "exercicios": {}}
+            
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
+            dados_arquivo = json.load(f)
+            
+        # Verificar se é formato backup
+        if 'dados' in dados_arquivo and 'timestamp' in dados_arquivo:
+            return dados_arquivo['dados']
+        else:
+            return dados_arquivo
+            
+    except Exception as e:
+        st.warning(f"⚠️ Erro ao verificar arquivo: {e}")
+        return {"treinos": {}, "jogos": [], "jogadores": [], "taticas": [], "exercicios": {}}
+
+def forcar_atualizacao_cache():
+    """Força a atualização do cache para garantir dados atualizados"""
+    try:
+        # Limpar cache do ficheiro de dados
+        invalidar_cache_dados()
+        
+        # Limpar cache da sessão para forçar reload
+        if 'dados_cache' in st.session_state:
+            del st.session_state['dados_cache']
+        invalidar_contexto_rerun()
+        
+        # Forçar recarregamento
+        dados_atuais = carregar_dados_arquivo_apenas()
+        st.session_state['dados_cache'] = dados_atuais.copy()
+        st.session_state['dados_cache_chave'] = obter_cache_dados().chave(DATA_FILE)
+        st.session_state['dados_backup'] = dados_atuais.copy()
+        contexto = obter_contexto_rerun()
+        if contexto is not None:
+            contexto['dados'] = st.session_state['dados_cache']
+        
+        return dados_atuais
+    except Exception as e:
+        st.warning(f"⚠️ Erro ao atualizar cache: {e}")
+        return None
+
+def salvar_dados_com_cache_update(dados):
+    """Salva dados e força atualização do cache"""
+    sucesso = salvar_dados(dados)
+    if sucesso:
+        # Forçar atualização do cache
+        forcar_atualizacao_cache()
+    return sucesso
+
+# === GESTÃO DE JOGADORES ===
+def gestao_jogadores():
+    """Gestão completa de jogadores"""
+    dados = carregar_dados()
+    
+    st.title("👥 Gestão de Jogadores")
+    
+    # Controle de tabs baseado no estado da sessão
+    if 'active_tab_jogadores' not in st.session_state:
+        st.session_state['active_tab_jogadores'] = 0
+    
+    tab_names = ["📋 Lista de Jogadores", "➕ Adicionar Jogador", "📄 Gerar Lista de Atletas em PDF"]
+    tab1, tab2, tab3 = st.tabs(tab_names)
+    
+    with tab1:
+        jogadores = dados.get('jogadores', [])
+        
+        if jogadores:
+            # Botão para enviar link para todos
+            st.write("### 📧 Envio em Massa")
+            if st.button("📨 Enviar Link de Acesso para TODOS os Jogadores", type="primary", use_container_width=True):
+                st.session_state['enviar_todos_convites'] = True
+                st.rerun()
+            
+            # Modal para envio em massa
+            if st.session_state.get('enviar_todos_convites', False):
+                with st.container():
+                    st.write("---")
+                    st.write("### 📧 Envio em Massa de Links de Acesso")
+                    
+                    app_url = "https://app-treinador-final-production.up.railway.app/"
+                    
+                    st.info(f"""
+                    **ℹ️ Esta ação irá:**
+                    - Enviar email para todos os jogadores que têm email cadastrado
+                    - Mostrar links do WhatsApp para os que têm telefone
+                    - Informar sobre o novo link: {app_url}
+                    """)
+                    
+                    # Contar jogadores com email e telefone
+                    jogadores_com_email = [j for j in jogadores if j.get('email')]
+                    jogadores_com_telefone = [j for j in jogadores if j.get('telefone')]
+                    
+                    col_info1, col_info2, col_info3 = st.columns(3)
+                    with col_info1:
+                        st.metric("👥 Total Jogadores", len(jogadores))
+                    with col_info2:
+                        st.metric("📧 Com Email", len(jogadores_com_email))
+                    with col_info3:
+                        st.metric("💬 Com Telefone", len(jogadores_com_telefone))
+                    
+                    col_confirma, col_cancela = st.columns(2)
+                    
+                    with col_confirma:
+                        if st.button("✅ CONFIRMAR ENVIO", type="primary", use_container_width=True):
+                            email_system = EmailNotifications()
+                            
+                            enviados = 0
+                            erros = 0
+                            
+                            progress_bar = st.progress(0)
+                            status_text = st.empty()
+                            
+                            for idx, jogador in enumerate(jogadores_com_email):
+                                username_jogador = jogador.get('nome', '').lower().replace(' ', '.')
+                                
+                                corpo_email = f"""
+                                <!DOCTYPE html>
+                                <html>
+                                <head>
+                                    <style>
+                                        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                                        .header {{ background-color: #1e88e5; color: white; padding: 20px; text-align: center; }}
+                                        .content {{ padding: 20px; }}
+                                        .info-box {{ background-color: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                                        .button {{ background-color: #1e88e5; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; display: inline-block; }}
+                                        .alert {{ background-color: #fff3cd; padding: 15px; margin: 10px 0; border-left: 4px solid #ffc107; }}
+                                    </style>
+                                </head>
+                                <body>
+                                    <div class="header">
+                                        <h1>⚽ FC PINHEIRENSE</h1>
+                                        <h2>🔄 Novo Link da Plataforma</h2>
+                                    </div>
+                                    
+                                    <div class="content">
+                                        <p>Olá <strong>{jogador.get('nome')}</strong>,</p>
+                                        
+                                        <div class="alert">
+                                            <h3>⚠️ ATENÇÃO: Link Atualizado!</h3>
+                                            <p>O link de acesso à plataforma foi alterado. Usa o novo link abaixo:</p>
+                                        </div>
+                                        
+                                        <div class="info-box">
+                                            <h3>🔐 Novos Dados de Acesso:</h3>
+                                            <p><strong>🆕 Novo Link:</strong> <a href="{app_url}">{app_url}</a></p>
+                                            <p><strong>👤 Username:</strong> {username_jogador}</p>
+                                            <p><strong>🔑 Senha:</strong> A mesma que usavas antes</p>
+                                        </div>
+                                        
+                                        <p style="text-align: center; margin: 30px 0;">
+                                            <a href="{app_url}" class="button">🚀 Aceder à Plataforma</a>
+                                        </p>
+                                        
+                                        <p><strong>📱 Guarda este novo link nos teus favoritos!</strong></p>
+                                        
+                                        <p>Na plataforma podes:</p>
+                                        <ul>
+                                            <li>✅ Ver os teus dados e estatísticas</li>
+                                            <li>📅 Consultar jogos e treinos</li>
+                                            <li>📊 Acompanhar o teu desempenho</li>
+                                            <li>🏆 Ver a classificação do campeonato</li>
+                                        </ul>
+                                        
+                                        <p>Qualquer dúvida, contacta a equipa técnica.</p>
+                                        
+                                        <p><strong>Bom treino! ⚽</strong></p>
+                                    </div>
+                                </body>
+                                </html>
+                                """
+                                
+                                status_text.text(f"Enviando para {jogador.get('nome')}...")
+                                
+                                sucesso, _ = email_system.enviar_email(
+                                    jogador.get('email'),
+                                    "🔄 NOVO Link - Plataforma FC Pinheirense",
+                                    corpo_email,
+                                    jogador.get('nome')
+                                )
+                                
+                                if sucesso:
+                                    enviados += 1
+                                else:
+                                    erros += 1
+                                
+                                progress_bar.progress((idx + 1) / len(jogadores_com_email))
+                            
+                            status_text.empty()
+                            progress_bar.empty()
+                            
+                            st.success(f"✅ Envio concluído! {enviados} emails enviados com sucesso, {erros} erros.")
+                            
+                            # Links WhatsApp para jogadores com telefone
+                            if jogadores_com_telefone:
+                                st.write("---")
+                                st.write("### 💬 Links do WhatsApp")
+                                st.info("Clica nos botões abaixo para enviar mensagem via WhatsApp para cada jogador:")
+                                
+                                for jogador in jogadores_com_telefone:
+                                    username_jogador = jogador.get('nome', '').lower().replace(' ', '.')
+                                    mensagem_whats = f"""Olá {jogador.get('nome')}! 👋
+
+⚠️ *ATENÇÃO: NOVO LINK!*
+
+⚽ *FC PINHEIRENSE - Plataforma Digital*
+
+O link de acesso foi atualizado. Usa o novo link:
+
+🌐 *Novo Link:* {app_url}
+👤 *Username:* {username_jogador}
+🔑 *Senha:* A mesma que usavas antes
+
+📱 Guarda este novo link nos favoritos!
+
+Bom treino! ⚽"""
+                                    
+                                    telefone_limpo = jogador.get('telefone', '').replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+                                    if telefone_limpo:
+                                        whatsapp_url = f"https://wa.me/{telefone_limpo}?text={mensagem_whats}"
+                                        st.link_button(f"💬 {jogador.get('nome')}", whatsapp_url, use_container_width=True)
+                            
+                            del st.session_state['enviar_todos_convites']
+                    
+                    with col_cancela:
+                        if st.button("❌ CANCELAR", use_container_width=True):
+                            del st.session_state['enviar_todos_convites']
+                            st.rerun()
+                    
+                    st.write("---")
+            
+            st.divider()
+            
+            # Filtros
+            col1, col2 = st.columns(2)
+            with col1:
+                posicoes = list(set([j.get('posicao', 'N/A') for j in jogadores]))
+                filtro_posicao = st.selectbox("Filtrar por Posição", ["Todas"] + posicoes)
+            
+            with col2:
+                filtro_nome = st.text_input("Buscar por Nome")
+            
+            # Aplicar filtros
+            jogadores_filtrados = jogadores
+            
+            if filtro_posicao != "Todas":
+                jogadores_filtrados = [j for j in jogadores_filtrados if j.get('posicao') == filtro_posicao]
+            
+            if filtro_nome:
+                jogadores_filtrados = [j for j in jogadores_filtrados if filtro_nome.lower() in j.get('nome', '').lower()]
+            
+            # Mostrar jogadores
+            st.subheader(f"📊 {len(jogadores_filtrados)} jogador(es) encontrado(s)")
+            
+            for jogador in jogadores_filtrados:
+                with st.expander(f"👤 {jogador.get('nome', 'Sem nome')} - {jogador.get('posicao', 'N/A')}"):
+                    col1, col2, col3 = st.columns([1, 2, 2])
+                    
+                    with col1:
+                        # Foto do jogador
+                        foto = jogador.get('foto')
+                        if foto:
+                            mostrar_foto(foto, width=120)
+                        else:
+                            st.write("📷 Sem foto")
+                        
+                        # Botão para atualizar foto
+                        foto_key = f"foto_upload_{jogador.get('id', '')}"
+                        if st.button(f"📷 Atualizar Foto", key=f"btn_foto_{jogador.get('id')}"):
+                            st.session_state[f"upload_foto_{jogador.get('id')}"] = True
+                            st.rerun()
+                    
+                    with col2:
+                        st.write(f"**Posição:** {jogador.get('posicao', 'N/A')}")
+                        st.write(f"**Camisola:** #{jogador.get('nr_camisola', 'N/A')}")
+                        st.write(f"**Idade:** {jogador.get('idade', 'N/A')} anos")
+                        st.write(f"**Altura:** {jogador.get('altura', 'N/A')}m")
+                        st.write(f"**Peso:** {jogador.get('peso', 'N/A')}kg")
+                    
+                    with col3:
+                        st.write(f"**Último Clube:** {jogador.get('ultimo_clube', 'N/A')}")
+                        st.write(f"**Clube Anterior:** {jogador.get('clube_anterior', 'N/A')}")
+                        st.write(f"**Telefone:** {jogador.get('telefone', 'N/A')}")
+                        st.write(f"**Email:** {jogador.get('email', 'N/A')}")
+                        if jogador.get('pontos_fortes'):
+                            st.write(f"**Pontos Fortes:** {', '.join(jogador['pontos_fortes'])}")
+                    
+                    # Mostrar estatísticas detalhadas
+                    st.write("---")
+                    mostrar_secao_estatisticas_jogador(jogador, dados)
+                    
+                    st.write("---")
+                    
+                    # Upload de foto (se ativado)
+                    if st.session_state.get(f"upload_foto_{jogador.get('id')}", False):
+                        st.write("---")
+                        st.write("**📷 Carregar Nova Foto:**")
+                        
+                        uploaded_file = st.file_uploader(
+                            "Escolha uma foto", 
+                            type=['png', 'jpg', 'jpeg'],
+                            key=f"uploader_{jogador.get('id')}"
+                        )
+                        
+                        col_save_foto, col_cancel_foto = st.columns(2)
+                        
+                        with col_save_foto:
+                            if uploaded_file is not None and st.button(f"💾 Salvar Foto", key=f"save_foto_{jogador.get('id')}"):
+                                foto_processada = processar_imagem(uploaded_file)
+                                if foto_processada:
+                                    # Atualizar foto do jogador
+                                    for j in dados['jogadores']:
+                                        if j.get('id') == jogador.get('id'):
+                                            j['foto'] = foto_processada
+                                            break
+                                    
+                                    if salvar_dados_com_cache_update(dados):
+                                        st.success("✅ Foto atualizada com sucesso!")
+                                        del st.session_state[f"upload_foto_{jogador.get('id')}"]
+                                        st.rerun()
+                                    else:
+                                        st.error("❌ Erro ao salvar foto")
+                        
+                        with col_cancel_foto:
+                            if st.button(f"❌ Cancelar", key=f"cancel_foto_{jogador.get('id')}"):
+                                del st.session_state[f"upload_foto_{jogador.get('id')}"]
+                                st.rerun()
+                    
+                    # Botões de ação
+                    col_edit, col_delete, col_convite = st.columns(3)
+                    
+                    with col_edit:
+                        if st.button(f"✏️ Editar", key=f"edit_{jogador.get('id')}"):
+                            st.session_state[f"editing_{jogador.get('id')}"] = True
+                            st.rerun()
+                    
+                    with col_delete:
+                        if st.button(f"🗑️ Remover", key=f"delete_{jogador.get('id')}"):
+                            dados['jogadores'] = [j for j in dados['jogadores'] if j.get('id') != jogador.get('id')]
+                            if salvar_dados_com_cache_update(dados):
+                                st.success(f"✅ Jogador {jogador.get('nome')} removido!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Erro ao remover jogador")
+                    
+                    with col_convite:
+                        if st.button(f"📧 Enviar Acesso", key=f"convite_{jogador.get('id')}"):
+                            st.session_state[f"enviar_convite_{jogador.get('id')}"] = True
+                            st.rerun()
+                    
+                    # Formulário de envio de convite (se ativado)
+                    if st.session_state.get(f"enviar_convite_{jogador.get('id')}", False):
+                        st.write("---")
+                        st.write("📧 **Enviar Link de Acesso ao Jogador**")
+                        
+                        email_jogador = jogador.get('email', '')
+                        telefone_jogador = jogador.get('telefone', '')
+                        
+                        if not email_jogador and not telefone_jogador:
+                            st.warning("⚠️ Jogador não tem email ou telefone cadastrado. Por favor, edite os dados primeiro.")
+                            if st.button("❌ Fechar", key=f"fechar_convite_{jogador.get('id')}"):
+                                del st.session_state[f"enviar_convite_{jogador.get('id')}"]
+                                st.rerun()
+                        else:
+                            # Link da aplicação
+                            app_url = "https://app-treinador-final-production.up.railway.app/"
+                            
+                            # Informações de login do jogador
+                            username_jogador = jogador.get('nome', '').lower().replace(' ', '.')
+                            
+                            st.info(f"""
+                            **📱 Informações de Acesso:**
+                            
+                            🌐 **Link da App:** {app_url}
+                            
+                            👤 **Username:** `{username_jogador}`
+                            
+                            🔑 **Senha:** *(usar a senha cadastrada ou resetar)*
+                            """)
+                            
+                            col_email, col_whats = st.columns(2)
+                            
+                            with col_email:
+                                if email_jogador:
+                                    if st.button(f"📧 Enviar por Email", key=f"btn_email_{jogador.get('id')}"):
+                                        email_system = EmailNotifications()
+                                        
+                                        corpo_email = f"""
+                                        <!DOCTYPE html>
+                                        <html>
+                                        <head>
+                                            <style>
+                                                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                                                .header {{ background-color: #1e88e5; color: white; padding: 20px; text-align: center; }}
+                                                .content {{ padding: 20px; }}
+                                                .info-box {{ background-color: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                                                .button {{ background-color: #1e88e5; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; display: inline-block; }}
+                                            </style>
+                                        </head>
+                                        <body>
+                                            <div class="header">
+                                                <h1>⚽ FC PINHEIRENSE</h1>
+                                                <h2>Bem-vindo à Plataforma Digital</h2>
+                                            </div>
+                                            
+                                            <div class="content">
+                                                <p>Olá <strong>{jogador.get('nome')}</strong>,</p>
+                                                
+                                                <p>Já podes aceder à plataforma digital do FC Pinheirense!</p>
+                                                
+                                                <div class="info-box">
+                                                    <h3>🔐 Dados de Acesso:</h3>
+                                                    <p><strong>Link:</strong> <a href="{app_url}">{app_url}</a></p>
+                                                    <p><strong>Username:</strong> {username_jogador}</p>
+                                                    <p><strong>Senha:</strong> A que foi definida no cadastro</p>
+                                                </div>
+                                                
+                                                <p style="text-align: center; margin: 30px 0;">
+                                                    <a href="{app_url}" class="button">🚀 Aceder à Plataforma</a>
+                                                </p>
+                                                
+                                                <p><strong>Na plataforma podes:</strong></p>
+                                                <ul>
+                                                    <li>✅ Ver os teus dados e estatísticas</li>
+                                                    <li>📅 Consultar jogos e treinos</li>
+                                                    <li>📊 Acompanhar o teu desempenho</li>
+                                                    <li>🏆 Ver a classificação do campeonato</li>
+                                                </ul>
+                                                
+                                                <p>Qualquer dúvida, contacta a equipa técnica.</p>
+                                                
+                                                <p><strong>Bom treino! ⚽</strong></p>
+                                            </div>
+                                        </body>
+                                        </html>
+                                        """
+                                        
+                                        sucesso, mensagem = email_system.enviar_email(
+                                            email_jogador,
+                                            "🔐 Acesso à Plataforma FC Pinheirense",
+                                            corpo_email,
+                                            jogador.get('nome')
+                                        )
+                                        
+                                        if sucesso:
+                                            st.success(f"✅ Email enviado para {email_jogador}")
+                                        else:
+                                            st.error(f"❌ {mensagem}")
+                                else:
+                                    st.caption("📧 Email não cadastrado")
+                            
+                            with col_whats:
+                                if telefone_jogador:
+                                    # Gerar link do WhatsApp
+                                    mensagem_whats = f"""Olá {jogador.get('nome')}! 👋
+
+⚽ *FC PINHEIRENSE - Acesso à Plataforma*
+
+Já podes aceder à nossa plataforma digital:
+
+🌐 *Link:* {app_url}
+👤 *Username:* {username_jogador}
+🔑 *Senha:* A que foi definida no cadastro
+
+Na plataforma podes ver os teus dados, estatísticas, jogos, treinos e muito mais!
+
+Bom treino! ⚽"""
+                                    
+                                    # Limpar telefone e criar link WhatsApp
+                                    telefone_limpo = telefone_jogador.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+                                    whatsapp_url = f"https://wa.me/{telefone_limpo}?text={mensagem_whats}"
+                                    
+                                    st.link_button(f"💬 Enviar por WhatsApp", whatsapp_url, use_container_width=True)
+                                else:
+                                    st.caption("💬 Telefone não cadastrado")
+                            
+                            # Copiar informações
+                            st.write("---")
+                            st.write("📋 **Copiar Informações:**")
+                            info_texto = f"""Link: {app_url}
+Username: {username_jogador}
+Senha: (a definida no cadastro)"""
+                            
+                            st.code(info_texto, language=None)
+                            
+                            if st.button("❌ Fechar", key=f"fechar_convite2_{jogador.get('id')}"):
+                                del st.session_state[f"enviar_convite_{jogador.get('id')}"]
+                                st.rerun()
+                    
+                    # Formulário de edição (se ativado)
+                    if st.session_state.get(f"editing_{jogador.get('id')}", False):
+                        st.write("---")
+                        st.write("**✏️ Editando Jogador:**")
+                        
+                        with st.form(f"edit_jogador_{jogador.get('id')}"):
+                            edit_col1, edit_col2 = st.columns(2)
+                            
+                            with edit_col1:
+                                novo_nome = st.text_input("Nome", value=jogador.get('nome', ''))
+                                nova_posicao = st.selectbox("Posição", [
+                                    "Guarda-Redes", "Defesa", "Meio-Campo", "Avançado", "Adjunto"
+                                ], index=["Guarda-Redes", "Defesa", "Meio-Campo", "Avançado", "Adjunto"].index(jogador.get('posicao', 'Meio-Campo')) if jogador.get('posicao') in ["Guarda-Redes", "Defesa", "Meio-Campo", "Avançado", "Adjunto"] else 0)
+                                novo_nr = st.number_input("Número", value=jogador.get('nr_camisola', 1), min_value=1, max_value=99)
+                                nova_idade = st.number_input("Idade", value=jogador.get('idade', 20), min_value=15, max_value=50)
+                            
+                            with edit_col2:
+                                nova_altura = st.number_input("Altura", value=jogador.get('altura', 1.75), min_value=1.50, max_value=2.20, step=0.01)
+                                novo_peso = st.number_input("Peso", value=jogador.get('peso', 70), min_value=50, max_value=120)
+                                novo_ultimo_clube = st.text_input("Último Clube", value=jogador.get('ultimo_clube', ''))
+                                novo_clube_anterior = st.text_input("Clube Anterior", value=jogador.get('clube_anterior', ''))
+                                novo_telefone = st.text_input("Telefone", value=jogador.get('telefone', ''))
+                                novo_email = st.text_input("Email", value=jogador.get('email', ''))
+                            
+                            novos_pontos = st.multiselect("Pontos Fortes", [
+                                "Velocidade", "Força", "Visão de Jogo", "Finalização", 
+                                "Cabeceamento", "Passe", "Drible", "Marcação"
+                            ], default=jogador.get('pontos_fortes', []))
+                            
+                            col_save, col_cancel = st.columns(2)
+                            
+                            with col_save:
+                                save_edit = st.form_submit_button("💾 Salvar Alterações")
+                            
+                            with col_cancel:
+                                cancel_edit = st.form_submit_button("❌ Cancelar")
+                            
+                            if save_edit:
+                                # Atualizar dados do jogador
+                                for j in dados['jogadores']:
+                                    if j.get('id') == jogador.get('id'):
+                                        j['nome'] = novo_nome
+                                        j['posicao'] = nova_posicao
+                                        j['nr_camisola'] = novo_nr
+                                        j['idade'] = nova_idade
+                                        j['altura'] = nova_altura
+                                        j['peso'] = novo_peso
+                                        j['ultimo_clube'] = novo_ultimo_clube
+                                        j['clube_anterior'] = novo_clube_anterior
+                                        j['telefone'] = novo_telefone
+                                        j['email'] = novo_email
+                                        j['pontos_fortes'] = novos_pontos
+                                        break
+                                
+                                if salvar_dados_com_cache_update(dados):
+                                    st.success("✅ Jogador atualizado com sucesso!")
+                                    del st.session_state[f"editing_{jogador.get('id')}"]
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao salvar alterações")
+                            
+                            if cancel_edit:
+                                del st.session_state[f"editing_{jogador.get('id')}"]
+                                st.rerun()
+        else:
+            st.info("📝 Nenhum jogador cadastrado ainda")
+    
+    with tab2:
+        # Sub-tabs para adicionar individual ou em massa
+        sub_tab1, sub_tab2 = st.tabs(["➕ Adicionar Individual", "📋 Importar Lista"])
+        
+        with sub_tab1:
+            st.subheader("➕ Adicionar Novo Jogador")
+            
+        with sub_tab1:
+            st.subheader("➕ Adicionar Novo Jogador")
+            
+            with st.form("novo_jogador"):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    nome = st.text_input("Nome Completo*", placeholder="Ex: João Silva")
+                    login = st.text_input("Login*", placeholder="Ex: joao")
+                    posicao = st.selectbox("Posição*", [
+                        "Guarda-Redes", "Defesa", "Meio-Campo", "Avançado", "Adjunto"
+                    ])
+                    nr_camisola = st.number_input("Número da Camisola", min_value=1, max_value=99, value=1)
+                    idade = st.number_input("Idade", min_value=15, max_value=50, value=20)
+                
+                with col2:
+                    altura = st.number_input("Altura (m)", min_value=1.50, max_value=2.20, value=1.75, step=0.01)
+                    peso = st.number_input("Peso (kg)", min_value=50, max_value=120, value=70)
+                    ultimo_clube = st.text_input("Último Clube", placeholder="Ex: FC Porto")
+                    clube_anterior = st.text_input("Clube Anterior", placeholder="Ex: SL Benfica")
+                    telefone = st.text_input("Telefone", placeholder="Ex: 912345678")
+                    email = st.text_input("Email", placeholder="Ex: jogador@email.com")
+                
+                pontos_fortes = st.multiselect("Pontos Fortes", [
+                    "Velocidade", "Força", "Visão de Jogo", "Finalização", 
+                    "Cabeceamento", "Passe", "Drible", "Marcação"
+                ])
+                
+                senha = st.text_input("Senha para Login", type="password", placeholder="Senha do jogador")
+                
+                # Upload de foto
+                st.write("**📷 Foto do Jogador (opcional):**")
+                uploaded_foto = st.file_uploader(
+                    "Carregar foto", 
+                    type=['png', 'jpg', 'jpeg'],
+                    key="foto_novo_jogador"
+                )
+                
+                submitted = st.form_submit_button("💾 Adicionar Jogador")
+                
+                if submitted:
+                    if nome and login and posicao and senha:
+                        # Verificar se login já existe
+                        logins_existentes = [j.get('login') for j in dados.get('jogadores', [])]
+                        if login in logins_existentes:
+                            st.error("❌ Este login já existe!")
+                        else:
+                            # Processar foto se fornecida
+                            foto_processada = None
+                            if uploaded_foto is not None:
+                                foto_processada = processar_imagem(uploaded_foto)
+                            
+                            # Criar hash da senha
+                            senha_hash = bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                            
+                            novo_jogador = {
+                                "id": str(uuid.uuid4()),
+                                "tipo": "jogador",
+                                "nome": nome,
+                                "login": login,
+                                "posicao": posicao,
+                                "nr_camisola": nr_camisola,
+                                "idade": idade,
+                                "altura": altura,
+                                "peso": peso,
+                                "ultimo_clube": ultimo_clube,
+                                "clube_anterior": clube_anterior,
+                                "telefone": telefone,
+                                "email": email,
+                                "pontos_fortes": pontos_fortes,
+                                "senha_hash": senha_hash,
+                                "foto": foto_processada
+                            }
+                            
+                            dados['jogadores'].append(novo_jogador)
+                            
+                            if salvar_dados_com_cache_update(dados):
+                                st.success("✅ Jogador adicionado com sucesso!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Erro ao salvar jogador")
+                    else:
+                        st.error("❌ Preencha todos os campos obrigatórios (*)")
+        
+        with sub_tab2:
+            st.subheader("📋 Importar Lista de Jogadores")
+            st.info("🔄 Cole aqui a lista dos seus jogadores reais para substituir os dados de teste")
+            
+            # Botão para limpar dados de teste
+            if st.button("🗑️ Primeiro: Limpar Jogadores de Teste"):
+                dados['jogadores'] = []
+                if salvar_dados_com_cache_update(dados):
+                    st.success("✅ Jogadores de teste removidos!")
+                    st.rerun()
+                else:
+                    st.error("❌ Erro ao limpar dados")
+            
+            st.write("**Formato esperado (um jogador por linha):**")
+            st.code("""Nome Completo | Login | Posição | Número | Idade | Altura | Peso | Telefone | Email
+Exemplo:
+Cristiano Ronaldo | cristiano | Avançado | 7 | 39 | 1.87 | 84 | 912345678 | cr7@email.com
+Pepe Silva | pepe | Defesa | 3 | 41 | 1.88 | 81 | 913456789 | pepe@email.com""")
+            
+            with st.form("importar_jogadores"):
+                lista_jogadores = st.text_area(
+                    "Cole a lista dos seus jogadores:", 
+                    height=300,
+                    placeholder="Nome | Login | Posição | Número | Idade | Altura | Peso | Telefone | Email\nJogador 1 | login1 | Posição | 10 | 25 | 1.80 | 75 | 123456789 | email@domain.com"
+                )
+                
+                senha_padrao = st.text_input("Senha padrão para todos os jogadores", type="password", value="123456")
+                
+                importar_btn = st.form_submit_button("📥 Importar Jogadores")
+                
+                if importar_btn and lista_jogadores:
+                    linhas = [linha.strip() for linha in lista_jogadores.split('\n') if linha.strip()]
+                    jogadores_importados = 0
+                    erros = []
+                    
+                    for i, linha in enumerate(linhas, 1):
+                        try:
+                            partes = [p.strip() for p in linha.split('|')]
+                            
+                            if len(partes) >= 3:  # Mínimo: nome, login, posição
+                                nome = partes[0]
+                                login = partes[1]
+                                posicao = partes[2]
+                                
+                                # Valores opcionais com defaults
+                                nr_camisola = int(partes[3]) if len(partes) > 3 and partes[3].isdigit() else i
+                                idade = int(partes[4]) if len(partes) > 4 and partes[4].isdigit() else 25
+                                altura = float(partes[5]) if len(partes) > 5 and partes[5].replace('.', '').isdigit() else 1.75
+                                peso = int(partes[6]) if len(partes) > 6 and partes[6].isdigit() else 70
+                                telefone = partes[7] if len(partes) > 7 else ""
+                                email = partes[8] if len(partes) > 8 else ""
+                                
+                                # Verificar se login já existe
+                                logins_existentes = [j.get('login') for j in dados.get('jogadores', [])]
+                                if login in logins_existentes:
+                                    erros.append(f"Linha {i}: Login '{login}' já existe")
+                                    continue
+                                
+                                # Criar hash da senha
+                                senha_hash = bcrypt.hashpw(senha_padrao.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                                
+                                novo_jogador = {
+                                    "id": str(uuid.uuid4()),
+                                    "tipo": "jogador",
+                                    "nome": nome,
+                                    "login": login,
+                                    "posicao": posicao,
+                                    "nr_camisola": nr_camisola,
+                                    "idade": idade,
+                                    "altura": altura,
+                                    "peso": peso,
+                                    "ultimo_clube": "",
+                                    "clube_anterior": "",
+                                    "telefone": telefone,
+                                    "email": email,
+                                    "pontos_fortes": [],
+                                    "senha_hash": senha_hash,
+                                    "foto": None
+                                }
+                                
+                                dados['jogadores'].append(novo_jogador)
+                                jogadores_importados += 1
+                            
+                            else:
+                                erros.append(f"Linha {i}: Formato inválido (mínimo: Nome|Login|Posição)")
+                        
+                        except Exception as e:
+                            erros.append(f"Linha {i}: Erro - {str(e)}")
+                    
+                    if jogadores_importados > 0:
+                        if salvar_dados(dados):
+                            st.success(f"✅ {jogadores_importados} jogador(es) importado(s) com sucesso!")
+                            if erros:
+                                st.warning("⚠️ Alguns erros encontrados:")
+                                for erro in erros:
+                                    st.write(f"• {erro}")
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao salvar dados")
+                    else:
+                        st.error("❌ Nenhum jogador foi importado")
+                        if erros:
+                            for erro in erros:
+                                st.error(erro)
+    
+    with tab3:
+        st.subheader("📋 Gerar Lista de Atletas em PDF")
+        
+        if st.button("📤 Exportar/Backup", use_container_width=True, type="primary"):
+            # Mostrar opções de backup abaixo
+            st.session_state['mostrar_opcoes_backup'] = True
+            st.rerun()
+        
+        st.divider()
+        
+        if st.button("📋 Mostrar Lista Atual (para cópia)"):
+            jogadores = dados.get('jogadores', [])
+            if jogadores:
+                st.write("**Lista atual de jogadores:**")
+                lista_texto = "Nome | Login | Posição | Número | Idade | Altura | Peso | Telefone | Email\n"
+                for j in jogadores:
+                    lista_texto += f"{j.get('nome', '')} | {j.get('login', '')} | {j.get('posicao', '')} | {j.get('nr_camisola', '')} | {j.get('idade', '')} | {j.get('altura', '')} | {j.get('peso', '')} | {j.get('telefone', '')} | {j.get('email', '')}\n"
+                
+                st.text_area("Lista para copiar:", value=lista_texto, height=300)
+            else:
+                st.info("📝 Nenhum jogador cadastrado")
+        
+        # Mostrar opções de backup se solicitado
+        if st.session_state.get('mostrar_opcoes_backup', False):
+            st.divider()
+            st.subheader("💾 Opções de Backup")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**📥 Backup Manual:**")
+                if st.button("💾 Criar Backup Completo"):
+                    backup_json, filename = criar_backup_manual()
+                    if backup_json and filename:
+                        st.download_button(
+                            label="📥 Download Backup",
+                            data=backup_json,
+                            file_name=filename,
+                            mime="application/json"
+                        )
+                        st.success("✅ Backup preparado! Clique para download.")
+            
+            with col2:
+                st.write("**🔄 Backup Automático:**")
+                if st.button("🔄 Criar Backup Agora"):
+                    filename = backup_automatico()
+                    if filename:
+                        st.success(f"✅ Backup automático criado: {filename}")
+                    else:
+                        st.error("❌ Erro ao criar backup automático")
+                
+                # Botão de emergência para recuperar da sessão
+                if 'dados_backup' in st.session_state:
+                    if st.button("🚨 Recuperar da Sessão"):
+                        dados_sessao = st.session_state['dados_backup']
+                        try:
+                            obter_pipeline_persistencia().publicar(dados_sessao, apenas=['ficheiro', 'metadados'], forcar=True)
+                            st.success("✅ Dados recuperados da sessão!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erro ao recuperar: {e}")
+                else:
+                    st.info("💡 Nenhum backup na sessão disponível")
+            
+            if st.button("❌ Fechar Opções"):
+                st.session_state['mostrar_opcoes_backup'] = False
+                st.rerun()
+        
+        st.divider()
+        
+        # Listagem de backups existentes
+        st.subheader("📂 Backups Disponíveis")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**📥 Backup Manual:**")
+            if st.button("💾 Criar Backup Completo"):
+                backup_json, filename = criar_backup_manual()
+                if backup_json and filename:
+                    st.download_button(
+                        label="📥 Download Backup",
+                        data=backup_json,
+                        file_name=filename,
+                        mime="application/json"
+                    )
+                    st.success("✅ Backup preparado! Clique para download.")
+        
+        with col2:
+            st.write("**🔄 Backup Automático:**")
+            if st.button("🔄 Criar Backup Agora"):
+                filename = backup_automatico()
+                if filename:
+                    st.success(f"✅ Backup automático criado: {filename}")
+                else:
+                    st.error("❌ Erro ao criar backup automático")
+            
+            # Botão de emergência para recuperar da sessão
+            if 'dados_backup' in st.session_state:
+                if st.button("🚨 Recuperar da Sessão"):
+                    dados_sessao = st.session_state['dados_backup']
+                    try:
+                        obter_pipeline_persistencia().publicar(dados_sessao, apenas=['ficheiro', 'metadados'], forcar=True)
+                        st.success("✅ Dados recuperados da sessão!")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Erro ao recuperar: {e}")
+            else:
+                st.info("💡 Nenhum backup na sessão disponível")
+        
+        # Mostrar backups existentes
+        st.write("**📂 Backups Disponíveis:**")
+        try:
+            pasta = os.path.dirname(DATA_FILE)
+            backups = []
+            
+            if os.path.exists(pasta):
+                for arquivo in os.listdir(pasta):
+                    if 'backup' in arquivo and arquivo.endswith('.json'):
+                        caminho = os.path.join(pasta, arquivo)
+                        if os.path.exists(caminho):
+                            timestamp = os.path.getctime(caminho)
+                            tamanho = os.path.getsize(caminho)
+                            backups.append((timestamp, arquivo, tamanho))
+        except Exception as e:
+            st.warning(f"⚠️ Erro ao listar backups: {str(e)}")
+            backups = []
+        
+        if backups:
+            backups.sort(reverse=True)  # Mais recente primeiro
+            
+            for timestamp, arquivo, tamanho in backups[:5]:  # Mostrar apenas os 5 mais recentes
+                data_formatada = datetime.fromtimestamp(timestamp).strftime('%d/%m/%Y %H:%M')
+                tamanho_kb = round(tamanho / 1024, 1)
+                
+                col_info, col_action = st.columns([3, 1])
+                with col_info:
+                    tipo = "🔄 Auto" if "automatico" in arquivo else "💾 Manual"
+                    st.write(f"{tipo} - {arquivo} ({tamanho_kb} KB) - {data_formatada}")
+                with col_action:
+                    if st.button("📥", key=f"download_{arquivo}"):
+                        try:
+                            with open(os.path.join(pasta, arquivo), 'r', encoding='utf-8') as f:
+                                backup_content = f.read()
+                            st.download_button(
+                                label="Download",
+                                data=backup_content,
+                                file_name=arquivo,
+                                mime="application/json",
+                                key=f"dl_{arquivo}"
+                            )
+                        except Exception as e:
+                            st.error(f"Erro: {e}")
+        else:
+            st.info("📝 Nenhum backup encontrado")
+        
+        st.divider()
+        
+        # Teste de Salvamento
+        st.subheader("🔧 Teste de Salvamento")
+        if st.button("🧪 Testar Sistema de Salvamento"):
+            st.info("🔄 Testando sistema de salvamento...")
+            
+            # Criar dados de teste
+            dados_teste = {
+                "treinos": {},
+                "jogos": [],
+                "jogadores": [{"nome": "Teste", "id": "teste123"}],
+                "taticas": [],
+                "exercicios": {}
+            }
+            
+            # Tentar salvar
+            resultado = salvar_dados(dados_teste)
+            
+            if resultado:
+                st.success("✅ Sistema de salvamento funcionando corretamente!")
+                
+                # Verificar se foi realmente salvo
+                if os.path.exists(DATA_FILE):
+                    size = os.path.getsize(DATA_FILE)
+                    st.info(f"📁 Arquivo criado: {DATA_FILE} ({size} bytes)")
+                    
+                    # Tentar ler de volta
+                    try:
+                        dados_lidos = carregar_dados()
+                        if dados_lidos and 'jogadores' in dados_lidos:
+                            jogadores_count = len(dados_lidos['jogadores'])
+                            st.success(f"✅ Dados lidos corretamente: {jogadores_count} jogador(es)")
+                        else:
+                            st.warning("⚠️ Dados lidos mas estrutura incorreta")
+                    except Exception as e:
+                        st.error(f"❌ Erro ao ler dados: {e}")
+                else:
+                    st.error("❌ Arquivo não foi criado")
+            else:
+                st.error("❌ Falha no sistema de salvamento")
+        
+        st.divider()
+        
+        # Teste rápido de dados
+        st.subheader("🧪 Teste Rápido dos Dados")
+        if st.button("🔍 Verificar Estado Atual dos Dados"):
+            dados_atuais = carregar_dados()
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                jogadores_count = len(dados_atuais.get('jogadores', []))
+                st.metric("👥 Jogadores", jogadores_count)
+                
+            with col2:
+                jogos_count = len(dados_atuais.get('jogos', []))
+                st.metric("⚽ Jogos", jogos_count)
+                
+            with col3:
+                treinos_count = len(dados_atuais.get('treinos', {}))
+                st.metric("🏃 Treinos", treinos_count)
+            
+            # Mostrar alguns nomes de jogadores para verificação visual
+            if jogadores_count > 0:
+                st.write("**👥 Jogadores encontrados:**")
+                for i, jogador in enumerate(dados_atuais.get('jogadores', [])[:5]):
+                    st.write(f"{i+1}. {jogador.get('nome', 'Nome não definido')}")
+                if jogadores_count > 5:
+                    st.write(f"... e mais {jogadores_count - 5} jogadores")
+            else:
+                st.warning("⚠️ Nenhum jogador encontrado nos dados atuais")
+            
+            # Informações de debug
+            with st.expander("🔧 Informações de Debug"):
+                st.write("**Cache na sessão:**")
+                st.write(f"- dados_backup: {'✅' if 'dados_backup' in st.session_state else '❌'}")
+                st.write(f"- dados_cache: {'✅' if 'dados_cache' in st.session_state else '❌'}")
+                st.write(f"- cache_timestamp: {'✅' if 'cache_timestamp' in st.session_state else '❌'}")
+                
+                if os.path.exists(DATA_FILE):
+                    file_size = os.path.getsize(DATA_FILE)
+                    st.write(f"**Arquivo principal:** {file_size} bytes")
+                else:
+                    st.write("**Arquivo principal:** ❌ Não existe")
+        
+        st.divider()
+        
+        # Diagnóstico do sistema
+        st.subheader("🔍 Diagnóstico do Sistema")
+        if st.button("🩺 Executar Diagnóstico"):
+            with st.expander("📊 Relatório de Diagnóstico", expanded=True):
+                # Verificar arquivo principal
+                st.write("**📁 Arquivo Principal:**")
+                if os.path.exists(DATA_FILE):
+                    size = os.path.getsize(DATA_FILE)
+                    st.success(f"✅ {DATA_FILE} existe ({size} bytes)")
+                    if size == 0:
+                        st.error("⚠️ PROBLEMA: Arquivo principal está vazio!")
+                else:
+                    st.error(f"❌ {DATA_FILE} não existe")
+                
+                # Verificar dados na sessão
+                st.write("**💾 Dados na Sessão:**")
+                if 'dados_backup' in st.session_state:
+                    dados_sessao = st.session_state['dados_backup']
+                    if dados_sessao:
+                        jogadores_count = len(dados_sessao.get('jogadores', []))
+                        jogos_count = len(dados_sessao.get('jogos', []))
+                        treinos_count = len(dados_sessao.get('treinos', {}))
+                        st.success(f"✅ Backup na sessão: {jogadores_count} jogadores, {jogos_count} jogos, {treinos_count} treinos")
+                    else:
+                        st.warning("⚠️ Backup na sessão está vazio")
+                else:
+                    st.warning("⚠️ Nenhum backup na sessão")
+                
+                # Verificar último salvamento
+                if 'ultimo_salvamento' in st.session_state:
+                    ultimo = st.session_state['ultimo_salvamento']
+                    st.info(f"🕐 Último salvamento: {ultimo}")
+                else:
+                    st.warning("⚠️ Nenhum registro de salvamento")
+                
+                # Verificar permissões de escrita
+                st.write("**🔐 Permissões:**")
+                try:
+                    test_file = DATA_FILE + '.test'
+                    with open(test_file, 'w') as f:
+                        f.write('test')
+                    os.remove(test_file)
+                    st.success("✅ Permissões de escrita OK")
+                except Exception as e:
+                    st.error(f"❌ Problema de permissões: {e}")
+                
+                # Verificar backups automáticos
+                st.write("**📂 Backups Automáticos:**")
+                backup_files = glob_module.glob('backup_automatico_*.json')
+                if backup_files:
+                    backup_files.sort(reverse=True)
+                    st.success(f"✅ {len(backup_files)} backups automáticos encontrados")
+                    st.write("Backups mais recentes:")
+                    for bf in backup_files[:3]:
+                        size = os.path.getsize(bf)
+                        st.write(f"  • {bf} ({size} bytes)")
+                else:
+                    st.warning("⚠️ Nenhum backup automático encontrado")
+        
+        st.divider()
+        
+        # Recuperação de emergência
+        st.subheader("🚨 Recuperação de Emergência")
+        
+        # Recuperar da sessão
+        if 'dados_backup' in st.session_state and st.session_state['dados_backup']:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**💾 Dados na Sessão Disponíveis:**")
+                dados_sessao = st.session_state['dados_backup']
+                jogadores_count = len(dados_sessao.get('jogadores', []))
+                jogos_count = len(dados_sessao.get('jogos', []))
+                treinos_count = len(dados_sessao.get('treinos', {}))
+                st.info(f"🔍 {jogadores_count} jogadores, {jogos_count} jogos, {treinos_count} treinos")
+                
+                if st.button("🔄 Restaurar da Sessão", type="primary"):
+                    if salvar_dados(dados_sessao):
+                        st.success("✅ Dados da sessão restaurados com sucesso!")
+                        st.balloons()
+                        
+                        # Limpar cache e forçar reload completo
+                        limpar_cache_e_forcar_reload()
+                        
+                        # Forçar recarregamento imediato
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao restaurar dados da sessão")
+            
+            with col2:
+                st.write("**📥 Download dos Dados da Sessão:**")
+                if st.button("💾 Criar Backup da Sessão"):
+                    backup_data = {
+                        'metadata': {
+                            'criado_em': datetime.now().isoformat(),
+                            'tipo': 'recuperacao_sessao',
+                            'versao': '1.0'
+                        },
+                        'dados': dados_sessao
+                    }
+                    
+                    backup_json = json.dumps(backup_data, ensure_ascii=False, indent=2)
+                    filename = f"recuperacao_sessao_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                    
+                    st.download_button(
+                        label="📥 Download Backup da Sessão",
+                        data=backup_json,
+                        file_name=filename,
+                        mime="application/json"
+                    )
+                    st.success("✅ Backup da sessão preparado!")
+        else:
+            st.warning("⚠️ Nenhum dado disponível na sessão para recuperação")
+        
+        # Recuperar de backups automáticos
+        backup_files = glob_module.glob('backup_automatico_*.json')
+        if backup_files:
+            backup_files.sort(reverse=True)  # Mais recente primeiro
+            
+            st.write("**📂 Restaurar de Backup Automático:**")
+            backup_selecionado = st.selectbox(
+                "Escolha um backup automático:",
+                options=backup_files,
+                format_func=lambda x: f"{x} ({os.path.getsize(x)} bytes)"
+            )
+            
+            if st.button("🔄 Restaurar Backup Automático"):
+                try:
+                    barra = st.progress(0.0, text="A iniciar restauro...")
+                    with open(backup_selecionado, 'rb') as f:
+                        sucesso, resultado = restaurar_backup_streaming(
+                            f,
+                            DATA_FILE,
+                            progresso=lambda fracao, mensagem: barra.progress(fracao, text=mensagem)
+                        )
+                    
+                    if sucesso:
+                        st.success(f"✅ Backup {backup_selecionado} restaurado com sucesso!")
+                        st.balloons()
+                        
+                        # Limpar cache e forçar reload completo
+                        invalidar_cache_dados()
+                        limpar_cache_e_forcar_reload()
+                        
+                        # Forçar recarregamento imediato
+                        st.rerun()
+                    else:
+                        st.error(f"❌ Erro ao restaurar backup automático: {resultado}")
+                        
+                except Exception as e:
+                    st.error(f"❌ Erro ao processar backup automático: {e}")
+        
+        st.divider()
+        
+        # Restaurar backup
+        st.subheader("📥 Restaurar Backup")
+        backup_file = st.file_uploader("Escolha o arquivo de backup", type=['json'])
+        
+        if backup_file is not None:
+            mostrar_restauro_backup(backup_file, "jogadores")
+        else:
+            st.info("📤 Selecione um arquivo de backup (.json) para restaurar")
+        
+        # === FIM DO BLOCO COMPLEXO DESABILITADO ===
+        
+        # === VERSÃO SIMPLIFICADA DO PDF ===
+        st.subheader("📄 PDF - Lista de Atletas (Simplificado)")
+        
+        jogadores = dados.get('jogadores', [])
+        
+        if not jogadores:
+            st.warning("⚠️ Nenhum jogador cadastrado para gerar PDF")
+            st.info("💡 Adicione jogadores primeiro na aba 'Adicionar Jogador'")
+        else:
+            st.info(f"📊 **{len(jogadores)} atletas** serão incluídos no PDF")
+            
+            # Prévia dos dados que serão incluídos
+            with st.expander("👁️ Prévia dos Dados no PDF"):
+                st.write("**Informações incluídas no PDF:**")
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.write("• Nome completo")
+                    st.write("• Posição")
+                    st.write("• Número da camisola")
+                    st.write("• Idade")
+                
+                with col2:
+                    st.write("• Telemóvel")
+                    st.write("• Email")
+                    st.write("• Dados físicos (altura, peso)")
+                    st.write("• Estatísticas da equipa")
+                
+                # Mostrar alguns exemplos
+                st.write("**Primeiros atletas que aparecerão:**")
+                for i, jogador in enumerate(jogadores[:3], 1):
+                    nome = jogador.get('nome', 'N/A')
+                    posicao = jogador.get('posicao', 'N/A')
+                    numero = jogador.get('nr_camisola', 'N/A')
+                    st.write(f"{i}. {nome} - {posicao} (#{numero})")
+                
+                if len(jogadores) > 3:
+                    st.write(f"... e mais {len(jogadores) - 3} atletas")
+            
+            # Botão principal para gerar PDF
+            st.divider()
+            
+            if st.button("📄 Gerar PDF Lista de Atletas", use_container_width=True, type="primary"):
+                with st.spinner("🔄 Gerando PDF profissional com todos os dados..."):
+                    pdf_bytes, filename = gerar_pdf_lista_jogadores(dados)
+                    
+                    if pdf_bytes and filename:
+                        st.success("✅ PDF gerado com sucesso!")
+                        
+                        # Botão de download destacado
+                        st.download_button(
+                            label="📥 Download PDF Lista de Atletas",
+                            data=pdf_bytes,
+                            file_name=filename,
+                            mime="application/pdf",
+                            use_container_width=True,
+                            type="primary"
+                        )
+                        
+                        # Informações do arquivo gerado
+                        tamanho_pdf = len(pdf_bytes) / 1024  # KB
+                        st.info(f"📁 **Arquivo gerado:** {filename} ({tamanho_pdf:.1f} KB)")
+                        
+                        # Mostrar conteúdo do PDF
+                        with st.expander("ℹ️ Conteúdo do PDF Gerado"):
+                            st.write("**📋 O PDF contém:**")
+                            st.write("• **Cabeçalho oficial** do F.C. Pinheirense")
+                            st.write("• **Tabela principal** com todos os dados dos atletas")
+                            st.write("• **Tabela de dados físicos** (altura, peso, último clube)")
+                            st.write("• **Estatísticas da equipa** (distribuição por posições)")
+                            st.write("• **Design profissional** com cores corporativas")
+                            st.write("• **Informações de geração** e data/hora")
+                            
+                    else:
+                        st.error("❌ Erro ao gerar PDF")
+                        st.info("💡 Verifique se a biblioteca ReportLab está instalada")
@@ -0,0 +1,385 @@
+"""
+Página de Estatísticas e Relatórios
+Estatísticas da equipa e relatórios PDF de minutos, golos e cartões do campeonato
+"""
+
+import streamlit as st
+from datetime import datetime
+from io import BytesIO
+
+from persistence_pipeline import checksum_colecao
+from perf_metrics import medido
+from pdf_resources import recursos_pdf
+from pdf_stream import altura_flowables, dividir_tabela, pdf_em_ficheiro
+from championship_table import TabelaCampeonato
+from app_core import (
+    pd, PDF_DISPONIVEL, obter_render_cache, pedir_pdf, versoes_colecoes, carregar_dados, criar_backup_manual
+)
+
+
+def obter_tabela_campeonato(dados=None):
+    """Tabela colunar jogadores × jogos do campeonato, extraída uma vez por versão do campeonato"""
+    if dados is None:
+        dados = carregar_dados()
+        versao = versoes_colecoes('campeonato')[0]
+    else:
+        # Dados recebidos (ex.: cópia num worker de PDFs, backup): versão pelo próprio conteúdo
+        versao = checksum_colecao(dados.get('campeonato', {}))
+    return obter_render_cache().obter(
+        'tabela_colunar_campeonato',
+        lambda: TabelaCampeonato.from_dados(dados),
+        versoes=(versao,)
+    )
+
+def mostrar_submenu_relatorios_pdfs():
+    """Submenu reorganizado para Relatórios & PDFs"""
+    st.markdown("### 📊 Relatórios & PDFs")
+    
+    # Primeira linha - Estatísticas
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("📊 Estatísticas", use_container_width=True, help="Ver estatísticas da equipa"):
+            st.session_state.pagina_atual = "estatisticas"
+            st.rerun()
+    
+    with col2:
+        if st.button("💾 Backup Dados", use_container_width=True, help="Fazer backup dos dados"):
+            dados_sidebar = carregar_dados()
+            backup_json, filename = criar_backup_manual()
+            if backup_json and filename:
+                st.download_button(
+                    label="⬇️ Baixar Backup",
+                    data=backup_json,
+                    file_name=filename,
+                    mime="application/json",
+                    key="backup_relatorios",
+                    use_container_width=True
+                )
+    
+    # Segunda linha - PDFs principais
+    st.markdown("**📄 Documentos PDF**")
+    col3, col4, col5 = st.columns(3)
+    
+    dados_sidebar = carregar_dados()
+    jogadores_count = len(dados_sidebar.get('jogadores', []))
+    
+    with col3:
+        if st.button(f"📋 Lista Atletas ({jogadores_count})", use_container_width=True, help="PDF da lista completa de atletas"):
+            if jogadores_count > 0:
+                pedir_pdf("Lista de Atletas", 'gerar_pdf_lista_jogadores', dados_sidebar)
+            else:
+                st.warning("⚠️ Nenhum atleta cadastrado")
+    
+    with col4:
+        jogos_proximos = [j for j in dados_sidebar.get('jogos', []) if j.get('convocados')]
+        if st.button(f"📋 Convocatórias ({len(jogos_proximos)})", use_container_width=True, help="PDFs de convocatórias"):
+            if len(jogos_proximos) > 0:
+                st.session_state['mostrar_convocatorias'] = True
+                st.rerun()
+            else:
+                st.info("ℹ️ Nenhum jogo com convocados")
+    
+    with col5:
+        # Contar jogos totais (regulares + campeonato)
+        jogos_todos = dados_sidebar.get('jogos', [])
+        campeonato_sidebar = dados_sidebar.get('campeonato', {})
+        jornadas_sidebar = campeonato_sidebar.get('jornadas', [])
+        jogos_campeonato_count = 0
+        
+        for jornada in jornadas_sidebar:
+            jogos_jornada = jornada.get('jogos', [])
+            for jogo in jogos_jornada:
+                casa = jogo.get('casa', '')
+                fora = jogo.get('fora', '')
+                if 'Fc Pinheirense' in casa or 'Fc Pinheirense' in fora:
+                    jogos_campeonato_count += 1
+        
+        total_jogos = len(jogos_todos) + jogos_campeonato_count
+        
+        if st.button(f"📋 Lista Completa ({total_jogos})", use_container_width=True, help="Lista completa para assinatura"):
+            if total_jogos > 0:
+                st.session_state['mostrar_lista_completa'] = True
+                st.rerun()
+            else:
+                st.info("ℹ️ Nenhum jogo cadastrado")
+    
+    # Terceira linha - PDF especiais
+    col6, col7 = st.columns(2)
+    
+    with col6:
+        if st.button("🏆 Tabela Classificativa", use_container_width=True, help="PDF da tabela do campeonato"):
+            st.session_state['mostrar_tabela_classificativa'] = True
+            st.rerun()
+
+JOGOS_POR_PAGINA_RELATORIO = 20  # colunas de jogos por página; os jogos seguintes continuam em páginas próprias
+
+def _gerar_relatorio_campeonato_pdf(titulo, linhas, num_jogos, cabecalho, legenda, prefixo_ficheiro, em_ficheiro=False):
+    """Gera o PDF (landscape) de um relatório do campeonato a partir das linhas da tabela colunar.
+    Tabelas já divididas em blocos de uma página; com `em_ficheiro` o documento é escrito num ficheiro
+    temporário com a story consumida por lotes (devolve PDFEmFicheiro em vez de bytes)"""
+    try:
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, TableStyle, PageBreak
+        from reportlab.lib.units import mm
+        from reportlab.lib.enums import TA_LEFT
+        
+        # Criar PDF em landscape para acomodar mais colunas
+        def criar_documento(saida):
+            return SimpleDocTemplate(
+                saida,
+                pagesize=landscape(A4),
+                rightMargin=10*mm,
+                leftMargin=10*mm,
+                topMargin=10*mm,
+                bottomMargin=10*mm
+            )
+        
+        recursos = recursos_pdf()
+        
+        # Cores corporativas
+        azul_clube = recursos.cores['azul_clube']
+        cinza_escuro = colors.Color(0.3, 0.3, 0.3)
+        
+        # Estilos
+        styles = recursos.estilos
+        
+        legenda_style = ParagraphStyle(
+            'Legenda',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_LEFT,
+            textColor=cinza_escuro
+        )
+        
+        # Estilo da tabela
+        tabela_style = TableStyle([
+            # Cabeçalho
+            ('BACKGROUND', (0, 0), (-1, 0), azul_clube),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 7),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, 0), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 3),
+            
+            # Dados
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 6),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+            ('TOPPADDING', (0, 1), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 2),
+            
+            # Bordas
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            
+            # Zebra
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.98, 0.98, 1.0)]),
+            
+            # Coluna de TOTAL em destaque
+            ('BACKGROUND', (1, 1), (1, -1), colors.Color(0.9, 0.95, 1.0)),
+            ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+        ])
+        
+        # Calcular larguras das colunas - atleta reduzido para aumentar as equipas
+        # Espaço restante para os nomes das equipas (landscape A4 = 277mm - 30mm margens = 247mm)
+        espaco_equipas = 247 * mm - 30*mm - 22*mm
+        largura_equipa = espaco_equipas / min(num_jogos, JOGOS_POR_PAGINA_RELATORIO) if num_jogos else 0
+        
+        # Moldura útil da página (margens de 10mm e padding de 6pt da moldura em cada lado)
+        largura_pagina, altura_pagina = landscape(A4)
+        largura_moldura = largura_pagina - 20*mm - 12
+        altura_moldura = altura_pagina - 20*mm - 12
+        
+        def story():
+            # Cabeçalho com logos e título
+            cabecalho_clube = recursos.cabecalho_clube(
+                titulo, tamanho_logo=18*mm, largura_logo=20*mm, largura_texto=130*mm, espaco=3*mm,
+                texto_alternativo=titulo, estilo_alternativo='ReportTitle', espaco_alternativo=5*mm
+            )
+            yield from cabecalho_clube
+            ocupado = altura_flowables(cabecalho_clube, largura_moldura, altura_moldura)
+            
+            # Jogos em blocos de colunas; cada bloco: Atleta, Total, Jogo1, Jogo2, ... em tabelas de uma página
+            for inicio in range(0, max(num_jogos, 1), JOGOS_POR_PAGINA_RELATORIO):
+                fim = min(inicio + JOGOS_POR_PAGINA_RELATORIO, num_jogos)
+                if inicio > 0:
+                    subtitulo = Paragraph(f"<b>{titulo}</b> (jogos {inicio + 1} a {fim})", legenda_style)
+                    yield PageBreak()
+                    yield subtitulo
+                    ocupado = altura_flowables([subtitulo], largura_moldura, altura_moldura)
+                
+                colunas = [0, 1] + list(range(2 + inicio, 2 + fim))
+                yield from dividir_tabela(
+                    [cabecalho[c] for c in colunas],
+                    [[linha[c] for c in colunas] for linha in linhas],
+                    [30*mm, 22*mm] + [largura_equipa] * (fim - inicio),
+                    tabela_style,
+                    altura_moldura,
+                    altura_moldura - ocupado
+                )
+            
+            yield Spacer(1, 3*mm)
+            
+            # Legenda
+            yield Paragraph(f"{legenda} {datetime.now().strftime('%d/%m/%Y às %H:%M')} | Total de jogos: {num_jogos}", legenda_style)
+        
+        filename = f"{prefixo_ficheiro}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        if em_ficheiro:
+            return pdf_em_ficheiro(criar_documento, story()), filename
+        
+        # Gerar PDF
+        buffer = BytesIO()
+        criar_documento(buffer).build(list(story()))
+        
+        buffer.seek(0)
+        
+        return buffer.getvalue(), filename
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return None, None
+
+def _tabela_campeonato_para_relatorio(dados, aviso):
+    """Tabela colunar do campeonato, ou None (com aviso) se não houver jogos com ficha"""
+    if not PDF_DISPONIVEL:
+        st.error("❌ Biblioteca ReportLab não disponível")
+        return None
+    
+    if not dados.get('campeonato', {}).get('jornadas', []):
+        st.warning("❌ Nenhum dado de campeonato disponível")
+        return None
+    
+    tabela = obter_tabela_campeonato(dados)
+    if not tabela.jogos or not tabela.atletas:
+        st.warning(aviso)
+        return None
+    return tabela
+
+@medido('pdf')
+def gerar_relatorio_minutos_campeonato_pdf(dados, em_ficheiro=False):
+    """Gera PDF com relatório detalhado de minutos no campeonato"""
+    tabela = _tabela_campeonato_para_relatorio(dados, "⚠️ Nenhum dado de minutos encontrado no campeonato")
+    if tabela is None:
+        return None, None
+    
+    return _gerar_relatorio_campeonato_pdf(
+        'RELATÓRIO TOTAL MINUTOS NO CAMPEONATO',
+        tabela.linhas_minutos(),
+        len(tabela.jogos),
+        tabela.cabecalho(),
+        "<b>Nota:</b> Relatório gerado em",
+        "Minutos_Campeonato",
+        em_ficheiro=em_ficheiro
+    )
+
+@medido('pdf')
+def gerar_relatorio_golos_campeonato_pdf(dados, em_ficheiro=False):
+    """Gera PDF com relatório detalhado de golos no campeonato"""
+    tabela = _tabela_campeonato_para_relatorio(dados, "⚠️ Nenhum dado de golos encontrado no campeonato")
+    if tabela is None:
+        return None, None
+    
+    return _gerar_relatorio_campeonato_pdf(
+        'RELATÓRIO TOTAL GOLOS NO CAMPEONATO',
+        tabela.linhas_golos(),
+        len(tabela.jogos),
+        tabela.cabecalho(),
+        "<b>Nota:</b> Relatório gerado em",
+        "Golos_Campeonato",
+        em_ficheiro=em_ficheiro
+    )
+
+@medido('pdf')
+def gerar_relatorio_cartoes_campeonato_pdf(dados, em_ficheiro=False):
+    """Gera PDF com relatório detalhado de cartões no campeonato"""
+    tabela = _tabela_campeonato_para_relatorio(dados, "⚠️ Nenhum dado de cartões encontrado no campeonato")
+    if tabela is None:
+        return None, None
+    
+    return _gerar_relatorio_campeonato_pdf(
+        'RELATÓRIO CARTÕES NO CAMPEONATO',
+        tabela.linhas_cartoes(),
+        len(tabela.jogos),
+        tabela.cabecalho(),
+        "<b>Legenda:</b> A = Amarelo | V = Vermelho | Relatório gerado em",
+        "Cartoes_Campeonato",
+        em_ficheiro=em_ficheiro
+    )
+
+def mostrar_estatisticas():
+    """Função para mostrar estatísticas gerais - MOBILE OPTIMIZED"""
+    st.title("📊 Estatísticas Gerais")
+    
+    dados = carregar_dados()
+    if not dados:
+        st.error("❌ Erro ao carregar dados!")
+        return
+    
+    # Layout responsivo para estatísticas
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric("👥 Total Jogadores", len(dados.get('jogadores', [])))
+        st.metric("⚽ Total Jogos", len(dados.get('jogos', [])))
+    
+    with col2:
+        st.metric("🏃 Total Treinos", len(dados.get('treinos', [])))
+        st.metric("🎯 Táticas", len(dados.get('taticas', [])))
+    
+    # ===== NOVO: Relatório de Minutos em Campeonato =====
+    st.divider()
+    
+    st.subheader("⏱️ Minutos em Campeonato")
+    
+    if st.button("📊 Gerar Relatório de Minutos", use_container_width=True):
+        pedir_pdf("Relatório de Minutos", 'gerar_relatorio_minutos_campeonato_pdf', dados, em_ficheiro=True)
+    
+    st.divider()
+    
+    # ===== Relatório de Golos em Campeonato =====
+    st.subheader("⚽ Golos em Campeonato")
+    
+    if st.button("📊 Gerar Relatório de Golos", use_container_width=True):
+        pedir_pdf("Relatório de Golos", 'gerar_relatorio_golos_campeonato_pdf', dados, em_ficheiro=True)
+    
+    st.divider()
+    
+    # ===== Relatório de Cartões em Campeonato =====
+    st.subheader("🟨🟥 Cartões em Campeonato")
+    
+    if st.button("📊 Gerar Relatório de Cartões", use_container_width=True):
+        pedir_pdf("Relatório de Cartões", 'gerar_relatorio_cartoes_campeonato_pdf', dados, em_ficheiro=True)
+    
+    st.divider()
+    
+    if dados.get('jogadores'):
+        st.subheader("📈 Estatísticas por Jogador")
+        
+        # Tabela única reutilizada enquanto os jogadores não mudarem
+        df_estatisticas = obter_render_cache().obter(
+            'estatisticas_jogadores',
+            lambda: _tabela_estatisticas_jogadores(dados['jogadores']),
+            versoes=versoes_colecoes('jogadores')
+        )
+        st.dataframe(df_estatisticas, use_container_width=True, hide_index=True)
+
+def _tabela_estatisticas_jogadores(jogadores):
+    """Dataframe com golos, assistências e cartões de cada jogador"""
+    linhas = []
+    for jogador in jogadores:
+        stats = jogador.get('estatisticas', {})
+        linhas.append({
+            '📊 Jogador': jogador.get('nome', 'N/A'),
+            '⚽ Golos': stats.get('golos', 0),
+            '🅰️ Assistências': stats.get('assistencias', 0),
+            '🟨 Amarelos': stats.get('cartoes_amarelos', 0),
+            '🟥 Vermelhos': stats.get('cartoes_vermelhos', 0),
+        })
+    return pd.DataFrame(linhas)
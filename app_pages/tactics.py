@@ -0,0 +1,1392 @@
+"""
+Página de Esquemas Táticos
+Formações, campo tático interativo e impressão em A4
+"""
+
+import streamlit as st
+import uuid
+from datetime import datetime
+from io import BytesIO
+
+from pitch_render import POSICOES_FORMACOES, campo_pdf, campo_raster, campo_svg
+from app_core import obter_render_cache, pedir_pdf, versoes_colecoes, carregar_dados, salvar_dados
+
+
+def salvar_esquemas_taticos(esquemas):
+    """Salva os esquemas táticos nos dados"""
+    dados = carregar_dados()
+    dados['esquemas_taticos'] = esquemas
+    return salvar_dados(dados)
+
+def obter_formacoes_disponiveis():
+    """Retorna as formações táticas disponíveis"""
+    return [
+        {"nome": "4-4-2", "descricao": "Formação equilibrada com 4 defesas, 4 médios e 2 atacantes"},
+        {"nome": "4-3-3", "descricao": "Formação ofensiva com 4 defesas, 3 médios e 3 atacantes"},
+        {"nome": "3-5-2", "descricao": "Formação com 3 defesas, 5 médios e 2 atacantes"},
+        {"nome": "4-2-3-1", "descricao": "Formação moderna com 4 defesas, 2 médios defensivos, 3 médios ofensivos e 1 atacante"},
+        {"nome": "3-4-3", "descricao": "Formação atacante com 3 defesas, 4 médios e 3 atacantes"},
+        {"nome": "5-3-2", "descricao": "Formação defensiva com 5 defesas, 3 médios e 2 atacantes"}
+    ]
+
+def criar_esquema_padrao(formacao, nome_esquema=""):
+    """Cria um esquema tático padrão baseado na formação escolhida"""
+    esquema_id = str(uuid.uuid4())
+    
+    # Posições padrão por formação (coordenadas x,y de 0-100)
+    posicoes_padrao = {
+        "4-4-2": [
+            # Guarda-redes
+            {"posicao": "GR", "x": 10, "y": 50, "jogador_id": None},
+            # Defesas
+            {"posicao": "DD", "x": 25, "y": 20, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 35, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 65, "jogador_id": None},
+            {"posicao": "DE", "x": 25, "y": 80, "jogador_id": None},
+            # Médios
+            {"posicao": "MD", "x": 50, "y": 25, "jogador_id": None},
+            {"posicao": "MC", "x": 50, "y": 40, "jogador_id": None},
+            {"posicao": "MC", "x": 50, "y": 60, "jogador_id": None},
+            {"posicao": "ME", "x": 50, "y": 75, "jogador_id": None},
+            # Atacantes
+            {"posicao": "PL", "x": 75, "y": 35, "jogador_id": None},
+            {"posicao": "PL", "x": 75, "y": 65, "jogador_id": None}
+        ],
+        "4-3-3": [
+            # Guarda-redes
+            {"posicao": "GR", "x": 10, "y": 50, "jogador_id": None},
+            # Defesas
+            {"posicao": "DD", "x": 25, "y": 20, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 35, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 65, "jogador_id": None},
+            {"posicao": "DE", "x": 25, "y": 80, "jogador_id": None},
+            # Médios
+            {"posicao": "MDM", "x": 45, "y": 35, "jogador_id": None},
+            {"posicao": "MC", "x": 45, "y": 50, "jogador_id": None},
+            {"posicao": "MCO", "x": 45, "y": 65, "jogador_id": None},
+            # Atacantes
+            {"posicao": "ED", "x": 75, "y": 25, "jogador_id": None},
+            {"posicao": "PL", "x": 75, "y": 50, "jogador_id": None},
+            {"posicao": "EE", "x": 75, "y": 75, "jogador_id": None}
+        ],
+        "3-5-2": [
+            # Guarda-redes
+            {"posicao": "GR", "x": 10, "y": 50, "jogador_id": None},
+            # Defesas
+            {"posicao": "DC", "x": 25, "y": 30, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 50, "jogador_id": None},
+            {"posicao": "DC", "x": 25, "y": 70, "jogador_id": None},
+            # Médios
+            {"posicao": "DD", "x": 45, "y": 15, "jogador_id": None},
+            {"posicao": "MDM", "x": 45, "y": 35, "jogador_id": None},
+            {"posicao": "MC", "x": 45, "y": 50, "jogador_id": None},
+            {"posicao": "MCO", "x": 45, "y": 65, "jogador_id": None},
+            {"posicao": "DE", "x": 45, "y": 85, "jogador_id": None},
+            # Atacantes
+            {"posicao": "PL", "x": 75, "y": 40, "jogador_id": None},
+            {"posicao": "PL", "x": 75, "y": 60, "jogador_id": None}
+        ]
+    }
+    
+    formacao_nome = formacao.replace("-", "")
+    posicoes = posicoes_padrao.get(formacao, posicoes_padrao["4-4-2"])
+    
+    return {
+        "id": esquema_id,
+        "nome": nome_esquema or f"Esquema {formacao}",
+        "formacao": formacao,
+        "posicoes": posicoes,
+        "observacoes": "",
+        "criado_em": datetime.now().isoformat(),
+        "ativo": True
+    }
+
+def _jogadores_json(jogadores):
+    """Lista de jogadores (id, nome, número, posição) em JSON para o JavaScript do campo"""
+    return str([{
+        'id': jogador.get('id', ''),
+        'nome': jogador.get('nome', 'Sem nome'),
+        'nr_camisola': jogador.get('nr_camisola', ''),
+        'posicao': jogador.get('posicao', '')
+    } for jogador in jogadores]).replace("'", '"')
+
+def _html_base_campo(altura, interativo):
+    """CSS, linhas do campo, botão de guardar e modal de seleção (sem jogadores)"""
+    return f"""
+    <style>
+    .campo-container {{
+        background: linear-gradient(180deg, #228B22 0%, #32CD32 50%, #228B22 100%);
+        border: 3px solid white;
+        border-radius: 15px;
+        padding: 0;
+        margin: 20px 0;
+        position: relative;
+        height: {altura}px;
+        max-width: 700px;
+        margin-left: auto;
+        margin-right: auto;
+        user-select: none;
+    }}
+    
+    .linha-meio {{
+        position: absolute;
+        top: 50%;
+        left: 0;
+        right: 0;
+        height: 2px;
+        background: white;
+        opacity: 0.8;
+    }}
+    
+    .circulo-meio {{
+        position: absolute;
+        top: 42%;
+        left: 47%;
+        width: 6%;
+        height: 16%;
+        border: 2px solid white;
+        border-radius: 50%;
+        opacity: 0.8;
+    }}
+    
+    .area-grande-top, .area-grande-bottom {{
+        position: absolute;
+        left: 25%;
+        width: 50%;
+        height: 15%;
+        border: 2px solid white;
+        opacity: 0.8;
+    }}
+    .area-grande-top {{ top: 5%; }}
+    .area-grande-bottom {{ bottom: 5%; }}
+    
+    .area-pequena-top, .area-pequena-bottom {{
+        position: absolute;
+        left: 37.5%;
+        width: 25%;
+        height: 7%;
+        border: 2px solid white;
+        opacity: 0.8;
+    }}
+    .area-pequena-top {{ top: 5%; }}
+    .area-pequena-bottom {{ bottom: 5%; }}
+    
+    .baliza-superior, .baliza-inferior {{
+        position: absolute;
+        left: 47%;
+        width: 6%;
+        height: 6px;
+        background: white;
+    }}
+    .baliza-superior {{ top: 2px; }}
+    .baliza-inferior {{ bottom: 2px; }}
+    
+    .jogador-posicao {{
+        position: absolute;
+        width: 50px;
+        height: 50px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: white;
+        font-weight: bold;
+        font-size: 11px;
+        text-align: center;
+        cursor: grab;
+        transition: all 0.3s ease;
+        border: 3px solid white;
+        box-shadow: 0 2px 6px rgba(0,0,0,0.3);
+        transform: translate(-50%, -50%);
+        z-index: 10;
+        user-select: none;
+    }}
+    
+    .jogador-posicao:hover {{
+        transform: translate(-50%, -50%) scale(1.15);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.5);
+    }}
+    
+    .jogador-posicao:active {{
+        cursor: grabbing;
+        transform: translate(-50%, -50%) scale(1.1);
+    }}
+    
+    .posicao-ocupada {{
+        background: linear-gradient(135deg, #1f77b4, #4dabf7);
+    }}
+    
+    .posicao-vazia {{
+        background: rgba(255,255,255,0.3);
+        border: 3px dashed white;
+        opacity: 0.7;
+    }}
+    
+    .posicao-vazia:hover {{
+        background: rgba(255,255,255,0.5);
+        opacity: 1;
+    }}
+    
+    .label-baliza {{
+        position: absolute;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+        text-align: center;
+        width: 100%;
+        text-shadow: 1px 1px 2px rgba(0,0,0,0.8);
+        pointer-events: none;
+    }}
+    .label-top {{ top: 10px; }}
+    .label-bottom {{ bottom: 10px; }}
+    
+    .salvar-posicoes {{
+        position: absolute;
+        bottom: 10px;
+        right: 10px;
+        background: #28a745;
+        color: white;
+        border: none;
+        padding: 8px 12px;
+        border-radius: 5px;
+        cursor: pointer;
+        font-size: 12px;
+        display: none;
+        z-index: 20;
+    }}
+    
+    .salvar-posicoes:hover {{
+        background: #218838;
+    }}
+    
+    /* Modal para seleção de jogador */
+    .modal-jogador {{
+        display: none;
+        position: fixed;
+        z-index: 1000;
+        left: 0;
+        top: 0;
+        width: 100%;
+        height: 100%;
+        background-color: rgba(0,0,0,0.7);
+    }}
+    
+    .modal-content {{
+        background-color: white;
+        margin: 10% auto;
+        padding: 20px;
+        border-radius: 10px;
+        width: 400px;
+        max-width: 90%;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.3);
+    }}
+    
+    .modal-header {{
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 20px;
+        border-bottom: 1px solid #ddd;
+        padding-bottom: 10px;
+    }}
+    
+    .modal-title {{
+        color: #333;
+        font-size: 18px;
+        font-weight: bold;
+    }}
+    
+    .close-btn {{
+        background: none;
+        border: none;
+        font-size: 24px;
+        cursor: pointer;
+        color: #999;
+    }}
+    
+    .close-btn:hover {{
+        color: #333;
+    }}
+    
+    .jogador-option {{
+        padding: 10px;
+        margin: 5px 0;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        cursor: pointer;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        background: white;
+        transition: all 0.3s ease;
+    }}
+    
+    .jogador-option:hover {{
+        background: #f8f9fa;
+        border-color: #007bff;
+    }}
+    
+    .jogador-option.selected {{
+        background: #007bff;
+        color: white;
+        border-color: #007bff;
+    }}
+    
+    .jogador-info {{
+        display: flex;
+        flex-direction: column;
+    }}
+    
+    .jogador-nome {{
+        font-weight: bold;
+    }}
+    
+    .jogador-detalhes {{
+        font-size: 12px;
+        color: #666;
+    }}
+    
+    .jogador-option.selected .jogador-detalhes {{
+        color: #cce7ff;
+    }}
+    
+    .remover-jogador {{
+        background: #dc3545;
+        color: white;
+        border: none;
+        padding: 5px 10px;
+        border-radius: 3px;
+        cursor: pointer;
+        font-size: 12px;
+    }}
+    
+    .remover-jogador:hover {{
+        background: #c82333;
+    }}
+    
+    .modal-buttons {{
+        display: flex;
+        justify-content: space-between;
+        margin-top: 20px;
+    }}
+    
+    .btn-modal {{
+        padding: 8px 16px;
+        border: none;
+        border-radius: 5px;
+        cursor: pointer;
+        font-size: 14px;
+    }}
+    
+    .btn-primary {{
+        background: #007bff;
+        color: white;
+    }}
+    
+    .btn-primary:hover {{
+        background: #0056b3;
+    }}
+    
+    .btn-secondary {{
+        background: #6c757d;
+        color: white;
+    }}
+    
+    .btn-secondary:hover {{
+        background: #545b62;
+    }}
+    </style>
+    
+    <div class="campo-container" id="campo-futebol">
+        <!-- Linhas do campo -->
+        <div class="linha-meio"></div>
+        <div class="circulo-meio"></div>
+        <div class="area-grande-top"></div>
+        <div class="area-pequena-top"></div>
+        <div class="area-grande-bottom"></div>
+        <div class="area-pequena-bottom"></div>
+        <div class="baliza-superior"></div>
+        <div class="baliza-inferior"></div>
+        
+        <!-- Labels das balizas -->
+        <div class="label-baliza label-top">🥅 BALIZA ADVERSÁRIA</div>
+        <div class="label-baliza label-bottom">🥅 NOSSA BALIZA</div>
+        
+        {"<button class='salvar-posicoes' id='salvar-btn' onclick='salvarPosicoes()'>💾 Salvar</button>" if interativo else ""}
+    </div>
+    
+    <!-- Modal para seleção de jogador -->
+    <div id="modal-jogador" class="modal-jogador">
+        <div class="modal-content">
+            <div class="modal-header">
+                <div class="modal-title" id="modal-title">Selecionar Jogador</div>
+                <button class="close-btn" onclick="fecharModal()">&times;</button>
+            </div>
+            <div id="lista-jogadores">
+                <!-- Jogadores serão inseridos aqui via JavaScript -->
+            </div>
+            <div class="modal-buttons">
+                <button class="btn-modal btn-secondary" onclick="fecharModal()">Cancelar</button>
+                <button class="btn-modal btn-primary" onclick="confirmarSelecao()">Confirmar</button>
+            </div>
+        </div>
+    </div>
+    """
+
+def visualizar_campo_tatico(esquema, altura=500, interativo=True, salvar_callback=None, jogadores_disponiveis=None):
+    """Cria visualização interativa do campo tático com drag-and-drop e seleção de jogadores"""
+    
+    formacao = esquema.get('formacao', '4-4-2')
+    
+    # Verificar se o esquema tem posições customizadas salvas
+    if 'posicoes_customizadas' in esquema and esquema['posicoes_customizadas']:
+        # Usar posições customizadas se existirem
+        posicoes_atuais = esquema['posicoes_customizadas']
+    else:
+        # Usar posições padrão da formação
+        posicoes_atuais = POSICOES_FORMACOES.get(formacao, POSICOES_FORMACOES['4-4-2'])
+    
+    jogadores = esquema.get('jogadores', {})
+    esquema_id = esquema.get('id', 'default')
+    
+    # Lista de jogadores para o JavaScript (por versão dos jogadores; sem carregar os dados em cada desenho)
+    if jogadores_disponiveis is None:
+        jogadores_json = obter_render_cache().obter(
+            'campo_tatico_jogadores',
+            lambda: _jogadores_json(carregar_dados().get('jogadores', [])),
+            versoes=versoes_colecoes('jogadores')
+        )
+    else:
+        jogadores_json = _jogadores_json(jogadores_disponiveis)
+    
+    # Campo visual (CSS, linhas e modal) igual para todos os esquemas do mesmo tamanho
+    campo_html = obter_render_cache().obter(
+        'campo_tatico_base', lambda: _html_base_campo(altura, interativo), parametros=(altura, interativo)
+    )
+    
+    # Adicionar jogadores às suas posições no campo
+    for i, pos in enumerate(posicoes_atuais):
+        jogador_na_posicao = jogadores.get(str(i))
+        
+        if jogador_na_posicao:
+            # Jogador atribuído - mostrar nome ou número
+            nome_jogador = jogador_na_posicao.get('nome', 'Sem Nome')
+            nr_camisola = jogador_na_posicao.get('nr_camisola', '')
+            
+            if nr_camisola:
+                texto_display = str(nr_camisola)
+                tooltip = f"{nome_jogador} (#{nr_camisola})"
+            else:
+                # Mostrar iniciais se não houver número
+                palavras = nome_jogador.split()
+                if len(palavras) >= 2:
+                    texto_display = f"{palavras[0][0]}{palavras[1][0]}"
+                else:
+                    texto_display = nome_jogador[:2].upper()
+                tooltip = nome_jogador
+            
+            classe = "posicao-ocupada"
+        else:
+            # Posição vazia
+            texto_display = pos['nome']
+            tooltip = f"Posição {pos['nome']} - Clique para selecionar jogador"
+            classe = "posicao-vazia"
+        
+        # Posicionar jogador no campo - INTERATIVO SE HABILITADO
+        campo_html += f"""
+        <div class="jogador-posicao {classe}" 
+             style="left: {pos['x']}%; top: {pos['y']}%;"
+             title="{tooltip}"
+             id="jogador-{i}"
+             data-posicao="{i}"
+             data-nome-posicao="{pos['nome']}"
+             {"draggable='true'" if interativo else ""}
+             {"onclick='abrirModalJogador(" + str(i) + ")'" if interativo else ""}>
+            {texto_display}
+        </div>
+        """
+    
+    if interativo:
+        campo_html += f"""
+        <script>
+        // Lista de jogadores disponíveis
+        const jogadoresDisponiveis = {jogadores_json};
+        
+        // Variáveis globais para o modal
+        let posicaoSelecionada = null;
+        let jogadorSelecionado = null;
+        let jogadorSendoArrastado = null;
+        let offsetX, offsetY;
+        let posicoesMudaram = false;
+        
+        // Função para abrir modal de seleção de jogador
+        function abrirModalJogador(posicao) {{
+            posicaoSelecionada = posicao;
+            const posicaoElement = document.getElementById('jogador-' + posicao);
+            const nomePosicao = posicaoElement.getAttribute('data-nome-posicao');
+            
+            document.getElementById('modal-title').textContent = `Selecionar Jogador - Posição ${{nomePosicao}}`;
+            
+            // Carregar lista de jogadores
+            const listaJogadores = document.getElementById('lista-jogadores');
+            listaJogadores.innerHTML = '';
+            
+            // Opção para remover jogador
+            const removerOption = document.createElement('div');
+            removerOption.className = 'jogador-option';
+            removerOption.style.borderColor = '#dc3545';
+            removerOption.innerHTML = `
+                <div class="jogador-info">
+                    <div class="jogador-nome" style="color: #dc3545;">🚫 Remover Jogador</div>
+                    <div class="jogador-detalhes">Deixar posição vazia</div>
+                </div>
+            `;
+            removerOption.onclick = function() {{
+                document.querySelectorAll('.jogador-option').forEach(opt => opt.classList.remove('selected'));
+                this.classList.add('selected');
+                jogadorSelecionado = null;
+            }};
+            listaJogadores.appendChild(removerOption);
+            
+            // Adicionar jogadores
+            jogadoresDisponiveis.forEach(jogador => {{
+                const jogadorDiv = document.createElement('div');
+                jogadorDiv.className = 'jogador-option';
+                jogadorDiv.innerHTML = `
+                    <div class="jogador-info">
+                        <div class="jogador-nome">${{jogador.nome}}</div>
+                        <div class="jogador-detalhes">
+                            ${{jogador.nr_camisola ? '#' + jogador.nr_camisola : 'Sem número'}} - 
+                            ${{jogador.posicao || 'Posição não definida'}}
+                        </div>
+                    </div>
+                `;
+                
+                jogadorDiv.onclick = function() {{
+                    document.querySelectorAll('.jogador-option').forEach(opt => opt.classList.remove('selected'));
+                    this.classList.add('selected');
+                    jogadorSelecionado = jogador;
+                }};
+                
+                listaJogadores.appendChild(jogadorDiv);
+            }});
+            
+            document.getElementById('modal-jogador').style.display = 'block';
+        }}
+        
+        // Função para fechar modal
+        function fecharModal() {{
+            document.getElementById('modal-jogador').style.display = 'none';
+            posicaoSelecionada = null;
+            jogadorSelecionado = null;
+        }}
+        
+        // Função para confirmar seleção
+        function confirmarSelecao() {{
+            if (posicaoSelecionada === null) {{
+                fecharModal();
+                return;
+            }}
+            
+            const posicaoElement = document.getElementById('jogador-' + posicaoSelecionada);
+            
+            if (jogadorSelecionado === null) {{
+                // Remover jogador
+                posicaoElement.className = 'jogador-posicao posicao-vazia';
+                posicaoElement.innerHTML = posicaoElement.getAttribute('data-nome-posicao');
+                posicaoElement.title = `Posição ${{posicaoElement.getAttribute('data-nome-posicao')}} - Clique para selecionar jogador`;
+            }} else {{
+                // Adicionar jogador
+                const nrCamisola = jogadorSelecionado.nr_camisola;
+                let textoDisplay;
+                
+                if (nrCamisola) {{
+                    textoDisplay = nrCamisola;
+                }} else {{
+                    const palavras = jogadorSelecionado.nome.split(' ');
+                    if (palavras.length >= 2) {{
+                        textoDisplay = palavras[0][0] + palavras[1][0];
+                    }} else {{
+                        textoDisplay = jogadorSelecionado.nome.substring(0, 2).toUpperCase();
+                    }}
+                }}
+                
+                posicaoElement.className = 'jogador-posicao posicao-ocupada';
+                posicaoElement.innerHTML = textoDisplay;
+                posicaoElement.title = `${{jogadorSelecionado.nome}} ${{nrCamisola ? '(#' + nrCamisola + ')' : ''}}`;
+            }}
+            
+            // Marcar que houve mudanças
+            posicoesMudaram = true;
+            document.getElementById('salvar-btn').style.display = 'block';
+            
+            fecharModal();
+        }}
+        
+        // Prevenir drag padrão do browser
+        document.addEventListener('dragstart', function(e) {{
+            e.preventDefault();
+        }});
+        
+        // Sistema de drag-and-drop para jogadores
+        document.querySelectorAll('.jogador-posicao').forEach(jogador => {{
+            jogador.addEventListener('mousedown', function(e) {{
+                // Se foi clique simples (não drag), não iniciar drag
+                if (e.detail === 1) {{
+                    setTimeout(() => {{
+                        if (!jogadorSendoArrastado) {{
+                            // Foi um clique simples, não um drag
+                            return;
+                        }}
+                    }}, 10);
+                }}
+                
+                jogadorSendoArrastado = this;
+                const rect = document.getElementById('campo-futebol').getBoundingClientRect();
+                const jogadorRect = this.getBoundingClientRect();
+                
+                offsetX = e.clientX - jogadorRect.left - (jogadorRect.width / 2);
+                offsetY = e.clientY - jogadorRect.top - (jogadorRect.height / 2);
+                
+                this.style.zIndex = '100';
+                this.style.cursor = 'grabbing';
+                
+                e.preventDefault();
+            }});
+        }});
+        
+        document.addEventListener('mousemove', function(e) {{
+            if (!jogadorSendoArrastado) return;
+            
+            const campo = document.getElementById('campo-futebol');
+            const campoRect = campo.getBoundingClientRect();
+            
+            // Calcular posição relativa ao campo
+            let x = ((e.clientX - campoRect.left - offsetX) / campoRect.width) * 100;
+            let y = ((e.clientY - campoRect.top - offsetY) / campoRect.height) * 100;
+            
+            // Limitar aos limites do campo (com margem para o círculo)
+            x = Math.max(5, Math.min(95, x));
+            y = Math.max(5, Math.min(95, y));
+            
+            jogadorSendoArrastado.style.left = x + '%';
+            jogadorSendoArrastado.style.top = y + '%';
+            
+            e.preventDefault();
+        }});
+        
+        document.addEventListener('mouseup', function(e) {{
+            if (jogadorSendoArrastado) {{
+                jogadorSendoArrastado.style.zIndex = '10';
+                jogadorSendoArrastado.style.cursor = 'grab';
+                
+                // Marcar que posições mudaram
+                posicoesMudaram = true;
+                document.getElementById('salvar-btn').style.display = 'block';
+                
+                // Obter nova posição
+                const posicao = jogadorSendoArrastado.getAttribute('data-posicao');
+                const x = parseFloat(jogadorSendoArrastado.style.left);
+                const y = parseFloat(jogadorSendoArrastado.style.top);
+                
+                console.log(`Jogador na posição ${{posicao}} movido para: ${{x}}%, ${{y}}%`);
+                
+                jogadorSendoArrastado = null;
+            }}
+        }});
+        
+        // Função para salvar posições e jogadores
+        function salvarPosicoes() {{
+            const posicoes = [];
+            const jogadoresPosicoes = {{}};
+            
+            document.querySelectorAll('.jogador-posicao').forEach((jogador, index) => {{
+                const x = parseFloat(jogador.style.left);
+                const y = parseFloat(jogador.style.top);
+                const posicaoId = jogador.getAttribute('data-posicao');
+                const nomePosicao = jogador.getAttribute('data-nome-posicao');
+                
+                posicoes.push({{
+                    x: x,
+                    y: y,
+                    nome: nomePosicao,
+                    posicao: index
+                }});
+                
+                // Verificar se há jogador na posição
+                if (jogador.classList.contains('posicao-ocupada')) {{
+                    const titulo = jogador.title;
+                    // Extrair informações do jogador do título
+                    jogadoresDisponiveis.forEach(jog => {{
+                        if (titulo.includes(jog.nome)) {{
+                            jogadoresPosicoes[posicaoId] = jog;
+                        }}
+                    }});
+                }}
+            }});
+            
+            // Criar evento customizado para comunicar com Streamlit
+            const event = new CustomEvent('tacticalPositionsChanged', {{
+                detail: {{
+                    esquema_id: '{esquema_id}',
+                    posicoes: posicoes,
+                    jogadores: jogadoresPosicoes
+                }}
+            }});
+            
+            window.dispatchEvent(event);
+            
+            // Esconder botão
+            document.getElementById('salvar-btn').style.display = 'none';
+            posicoesMudaram = false;
+            
+            alert('✅ Posições e jogadores salvos com sucesso!');
+        }}
+        
+        // Fechar modal clicando fora dele
+        document.getElementById('modal-jogador').onclick = function(e) {{
+            if (e.target === this) {{
+                fecharModal();
+            }}
+        }};
+        </script>"""
+    
+    campo_html += "</div>"
+    
+    return campo_html
+
+def inicializar_esquemas_taticos():
+    """Inicializa esquemas táticos se não existirem"""
+    dados = carregar_dados()
+    
+    # Adicionar chave esquemas_taticos se não existir
+    if 'esquemas_taticos' not in dados:
+        dados['esquemas_taticos'] = []
+    
+    # Se não há esquemas, criar padrões
+    if not dados['esquemas_taticos']:
+        # Obter jogadores para criar esquema com jogadores reais
+        jogadores = dados.get('jogadores', [])
+        jogadores_dict = {j['id']: j for j in jogadores}
+        
+        # Criar esquema 4-3-3 com jogadores reais se existirem
+        esquema_433_jogadores = {}
+        if jogadores:
+            # Tentar mapear jogadores por posição
+            for i, jogador in enumerate(jogadores[:11]):  # Máximo 11 jogadores
+                esquema_433_jogadores[str(i)] = jogador
+        
+        esquemas_padrao = [
+            {
+                "id": 1,
+                "nome": "Esquema 4-3-3 Principal" if jogadores else "Esquema 4-3-3 Básico",
+                "formacao": "4-3-3",
+                "jogadores": esquema_433_jogadores,
+                "data_criacao": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "observacoes": "Formação ofensiva com três atacantes e meio-campo criativo."
+            },
+            {
+                "id": 2, 
+                "nome": "Esquema 4-4-2 Equilibrado",
+                "formacao": "4-4-2",
+                "jogadores": {},
+                "data_criacao": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "observacoes": "Formação equilibrada com dois médios centrais e dois atacantes."
+            },
+            {
+                "id": 3,
+                "nome": "Esquema 3-5-2 Defensivo", 
+                "formacao": "3-5-2",
+                "jogadores": {},
+                "data_criacao": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "observacoes": "Formação defensiva com cinco no meio-campo."
+            }
+        ]
+        
+        dados['esquemas_taticos'] = esquemas_padrao
+        salvar_dados(dados)
+        return True
+    
+    return False
+
+def gerar_campo_para_impressao_a4(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """Gera uma imagem A4 do campo tático para impressão (camada do campo em cache + jogadores do esquema)"""
+    return campo_raster(esquema, nome_esquema, tema=tema)
+
+def _nome_ficheiro_campo(esquema, extensao):
+    return f"esquema_{esquema.get('formacao', '').replace('-', '')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extensao}"
+
+def gerar_png_campo_a4(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """PNG A4 (300 DPI) do campo tático e nome do ficheiro, como os geradores de PDF"""
+    try:
+        img_buffer = BytesIO()
+        gerar_campo_para_impressao_a4(esquema, nome_esquema, tema).save(img_buffer, format='PNG', dpi=(300, 300))
+        return img_buffer.getvalue(), _nome_ficheiro_campo(esquema, 'png')
+    except Exception as e:
+        print(f"Aviso: erro ao gerar campo tático A4: {e}")
+        return None, None
+
+def gerar_pdf_campo_a4(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """PDF vetorial A4 do campo tático (sem a imagem raster de 300 DPI) e nome do ficheiro"""
+    try:
+        return campo_pdf(esquema, nome_esquema, tema=tema), _nome_ficheiro_campo(esquema, 'pdf')
+    except Exception as e:
+        print(f"Aviso: erro ao gerar PDF do campo tático: {e}")
+        return None, None
+
+def gerar_svg_campo_a4(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """SVG vetorial A4 do campo tático (texto de poucos KB, editável) e nome do ficheiro"""
+    try:
+        return campo_svg(esquema, nome_esquema, tema=tema).encode('utf-8'), _nome_ficheiro_campo(esquema, 'svg')
+    except Exception as e:
+        print(f"Aviso: erro ao gerar SVG do campo tático: {e}")
+        return None, None
+
+def gestao_esquemas_taticos():
+    """Função para gestão dos esquemas táticos"""
+    
+    # Inicializar esquemas táticos se necessário
+    inicializar_esquemas_taticos()
+    
+    st.title("🎯 Esquemas Táticos")
+    
+    # Carregar dados
+    dados = carregar_dados()
+    esquemas = dados.get('esquemas_taticos', [])
+    
+    # Abas principais
+    tab1, tab2, tab3 = st.tabs(["📋 Ver Esquemas", "➕ Criar Esquema", "⚙️ Gerir Esquemas"])
+    
+    with tab1:
+        st.subheader("📋 Esquemas Existentes")
+        
+        if not esquemas:
+            st.info("ℹ️ Nenhum esquema tático criado ainda.")
+            st.markdown("💡 **Dica**: Use a aba 'Criar Esquema' para começar!")
+        else:
+            # Filtros
+            col1, col2 = st.columns(2)
+            with col1:
+                formacoes_existentes = list(set([e.get('formacao', '') for e in esquemas]))
+                filtro_formacao = st.selectbox(
+                    "🔍 Filtrar por Formação:",
+                    ["Todas"] + formacoes_existentes,
+                    key="filtro_formacao_esquemas"
+                )
+            
+            with col2:
+                filtro_ativo = st.selectbox(
+                    "📊 Status:",
+                    ["Todos", "Ativos", "Inativos"],
+                    key="filtro_status_esquemas"
+                )
+            
+            # Aplicar filtros
+            esquemas_filtrados = esquemas
+            if filtro_formacao != "Todas":
+                esquemas_filtrados = [e for e in esquemas_filtrados if e.get('formacao') == filtro_formacao]
+            
+            if filtro_ativo == "Ativos":
+                esquemas_filtrados = [e for e in esquemas_filtrados if e.get('ativo', True)]
+            elif filtro_ativo == "Inativos":
+                esquemas_filtrados = [e for e in esquemas_filtrados if not e.get('ativo', True)]
+            
+            # Exibir esquemas
+            for esquema in esquemas_filtrados:
+                with st.expander(f"🎯 {esquema.get('nome', 'Esquema sem nome')} - {esquema.get('formacao', 'Formação não definida')}", expanded=False):
+                    col_info, col_visual = st.columns([1, 2])
+                    
+                    with col_info:
+                        st.markdown(f"""
+                        **📊 Informações:**
+                        - **Formação:** {esquema.get('formacao', 'N/A')}
+                        - **Status:** {'✅ Ativo' if esquema.get('ativo', True) else '❌ Inativo'}
+                        - **Criado:** {datetime.fromisoformat(esquema.get('criado_em', datetime.now().isoformat())).strftime('%d/%m/%Y') if esquema.get('criado_em') else 'N/A'}
+                        """)
+                        
+                        if esquema.get('observacoes'):
+                            st.markdown(f"**📝 Observações:**\n{esquema.get('observacoes')}")
+                    
+                    with col_visual:
+                        st.markdown("**🏟️ Campo Interativo (TacticalPad):**")
+                        st.markdown("💡 *Pode arrastar os jogadores para reposicionar*")
+                        # Campo interativo com drag-and-drop
+                        campo_visual = visualizar_campo_tatico(esquema, altura=350, interativo=True)
+                        st.components.v1.html(campo_visual, height=370)
+                        
+                        # Tema de impressão: fundo branco e linhas escuras em vez do relvado
+                        tema_campo = 'impressao' if st.checkbox(
+                            "🖨️ Poupar tinta (fundo branco)", key=f"tema_print_{esquema.get('id', 0)}"
+                        ) else 'relvado'
+                        
+                        # Botão de impressão A4
+                        col_print, col_spacer = st.columns([1, 1])
+                        with col_print:
+                            if st.button("🖨️ Gerar A4 para Impressão", key=f"print_{esquema.get('id', 0)}", use_container_width=True, type="secondary"):
+                                with st.spinner("Gerando imagem A4..."):
+                                    try:
+                                        # Gerar imagem A4 (PNG)
+                                        nome_arquivo = f"{esquema.get('nome', 'Esquema')} - {esquema.get('formacao', '')}"
+                                        img_bytes, filename = gerar_png_campo_a4(esquema, nome_arquivo, tema_campo)
+                                        if not img_bytes:
+                                            raise ValueError("imagem não gerada")
+                                        
+                                        # Preview da imagem
+                                        st.success("✅ Imagem A4 gerada com sucesso!")
+                                        st.image(img_bytes, caption=f"Preview: {nome_arquivo}", use_container_width=True)
+                                        
+                                        # Botão de download
+                                        st.download_button(
+                                            label="⬇️ Download PNG A4",
+                                            data=img_bytes,
+                                            file_name=filename,
+                                            mime="image/png",
+                                            type="primary",
+                                            use_container_width=True
+                                        )
+                                        
+                                    except Exception as e:
+                                        st.error(f"❌ Erro ao gerar imagem: {e}")
+                        with col_spacer:
+                            # PDF vetorial: poucos KB, sem a imagem de 300 DPI (download no painel de PDFs)
+                            if st.button("📄 PDF Vetorial A4", key=f"print_pdf_{esquema.get('id', 0)}", use_container_width=True):
+                                pedir_pdf(
+                                    f"Campo {esquema.get('nome', 'Esquema')}", 'gerar_pdf_campo_a4',
+                                    esquema, f"{esquema.get('nome', 'Esquema')} - {esquema.get('formacao', '')}",
+                                    tema=tema_campo
+                                )
+                            
+                            # SVG vetorial: gerado na hora (sem passar pelo pool) e escalável sem perdas
+                            svg_bytes, svg_nome = gerar_svg_campo_a4(
+                                esquema, f"{esquema.get('nome', 'Esquema')} - {esquema.get('formacao', '')}", tema_campo
+                            )
+                            if svg_bytes:
+                                st.download_button(
+                                    label="⬇️ SVG Vetorial A4",
+                                    data=svg_bytes,
+                                    file_name=svg_nome,
+                                    mime="image/svg+xml",
+                                    key=f"print_svg_{esquema.get('id', 0)}",
+                                    use_container_width=True
+                                )
+                        
+                        # Listar posições ocupadas
+                        jogadores_dict = {j['id']: j for j in dados.get('jogadores', [])}
+                        posicoes_ocupadas = []
+                        
+                        for pos in esquema.get('posicoes', []):
+                            jogador_id = pos.get('jogador_id')
+                            if jogador_id and jogador_id in jogadores_dict:
+                                jogador = jogadores_dict[jogador_id]
+                                posicoes_ocupadas.append(f"{pos.get('posicao', 'N/A')}: {jogador.get('nome', 'N/A')}")
+                        
+                        if posicoes_ocupadas:
+                            st.markdown("**👥 Jogadores Definidos:**")
+                            for pos_jog in posicoes_ocupadas:
+                                st.markdown(f"• {pos_jog}")
+    
+    with tab2:
+        st.subheader("➕ Criar Novo Esquema")
+        
+        with st.form("form_criar_esquema"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                nome_esquema = st.text_input("📝 Nome do Esquema:", placeholder="Ex: Esquema Principal 4-4-2")
+                
+                formacoes = obter_formacoes_disponiveis()
+                formacao_selecionada = st.selectbox(
+                    "⚽ Formação:",
+                    options=formacoes,
+                    format_func=lambda x: f"{x['nome']} - {x['descricao']}"
+                )
+            
+            with col2:
+                observacoes = st.text_area("📝 Observações (opcional):", placeholder="Instruções específicas, pontos fortes, etc.")
+                ativo = st.checkbox("✅ Esquema ativo", value=True, help="Esquemas ativos aparecem nas opções de jogos")
+            
+            submit_criar = st.form_submit_button("🎯 Criar Esquema", use_container_width=True, type="primary")
+            
+            if submit_criar:
+                if not nome_esquema:
+                    st.error("❌ Por favor, insira um nome para o esquema!")
+                else:
+                    # Verificar se já existe esquema com mesmo nome
+                    nomes_existentes = [e.get('nome', '').lower() for e in esquemas]
+                    if nome_esquema.lower() in nomes_existentes:
+                        st.error("❌ Já existe um esquema com esse nome!")
+                    else:
+                        # Criar novo esquema
+                        novo_esquema = criar_esquema_padrao(formacao_selecionada['nome'], nome_esquema)
+                        novo_esquema['observacoes'] = observacoes
+                        novo_esquema['ativo'] = ativo
+                        
+                        esquemas.append(novo_esquema)
+                        dados['esquemas_taticos'] = esquemas
+                        
+                        if salvar_dados(dados):
+                            st.success(f"✅ Esquema '{nome_esquema}' criado com sucesso!")
+                            st.balloons()
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao salvar o esquema!")
+    
+    with tab3:
+        st.subheader("⚙️ Gerir Esquemas")
+        
+        if not esquemas:
+            st.info("ℹ️ Nenhum esquema para gerir.")
+        else:
+            esquema_para_editar = st.selectbox(
+                "🎯 Escolher Esquema para Editar:",
+                options=esquemas,
+                format_func=lambda x: f"{x.get('nome', 'Sem nome')} ({x.get('formacao', 'N/A')})",
+                key="esquema_selector"
+            )
+            
+            if esquema_para_editar:
+                st.divider()
+                
+                # Editar informações básicas
+                with st.expander("📝 Editar Informações Básicas", expanded=True):
+                    with st.form("form_editar_basico"):
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            novo_nome = st.text_input("📝 Nome:", value=esquema_para_editar.get('nome', ''))
+                            nova_observacao = st.text_area("📝 Observações:", value=esquema_para_editar.get('observacoes', ''))
+                        
+                        with col2:
+                            novo_ativo = st.checkbox("✅ Ativo", value=esquema_para_editar.get('ativo', True))
+                            
+                            # Mostrar formação atual (não editável por enquanto)
+                            st.info(f"🏟️ **Formação atual:** {esquema_para_editar.get('formacao', 'N/A')}")
+                        
+                        if st.form_submit_button("💾 Salvar Alterações", type="primary"):
+                            # Atualizar esquema
+                            esquema_index = esquemas.index(esquema_para_editar)
+                            esquemas[esquema_index]['nome'] = novo_nome
+                            esquemas[esquema_index]['observacoes'] = nova_observacao
+                            esquemas[esquema_index]['ativo'] = novo_ativo
+                            
+                            dados['esquemas_taticos'] = esquemas
+                            
+                            if salvar_dados(dados):
+                                st.success("✅ Esquema atualizado!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Erro ao salvar alterações!")
+                
+                # Definir jogadores por posição
+                with st.expander("👥 Definir Jogadores nas Posições", expanded=False):
+                    st.info("💡 **Como usar:** Clique numa posição para atribuir/alterar o jogador ou use o campo interativo acima.")
+                    
+                    jogadores_ativos = [j for j in dados.get('jogadores', []) if j.get('tipo', 'jogador') == 'jogador']
+                    
+                    if not jogadores_ativos:
+                        st.warning("⚠️ Nenhum jogador ativo cadastrado para definir posições.")
+                        return
+                    
+                    # Inicializar session state para esquemas táticos
+                    if 'esquema_edicao' not in st.session_state:
+                        st.session_state.esquema_edicao = {}
+                    
+                    if 'posicao_selecionada' not in st.session_state:
+                        st.session_state.posicao_selecionada = None
+                    
+                    # Carregar jogadores do esquema atual
+                    esquema_jogadores = esquema_para_editar.get('jogadores', {})
+                    
+                    # Interface de seleção por formação
+                    formacao = esquema_para_editar.get('formacao', '4-4-2')
+                    
+                    # Definir posições por formação
+                    formacoes_posicoes = {
+                        "4-4-2": [
+                            "Guarda-Redes",
+                            "Defesa Esquerdo", "Defesa Central", "Defesa Central", "Defesa Direito",
+                            "Médio Esquerdo", "Médio Central", "Médio Central", "Médio Direito", 
+                            "Avançado", "Avançado"
+                        ],
+                        "4-3-3": [
+                            "Guarda-Redes",
+                            "Defesa Esquerdo", "Defesa Central", "Defesa Central", "Defesa Direito",
+                            "Médio Central", "Médio Central", "Médio Central",
+                            "Extremo Esquerdo", "Ponta de Lança", "Extremo Direito"
+                        ],
+                        "3-5-2": [
+                            "Guarda-Redes",
+                            "Defesa Central", "Defesa Central", "Defesa Central",
+                            "Ala Esquerdo", "Médio Central", "Médio Central", "Médio Central", "Ala Direito",
+                            "Ponta de Lança", "Ponta de Lança"
+                        ]
+                    }
+                    
+                    posicoes = formacoes_posicoes.get(formacao, formacoes_posicoes["4-4-2"])
+                    
+                    # Organizar botões por linha de jogo
+                    st.markdown("### 🎯 Clique numa posição para definir o jogador:")
+                    
+                    if formacao == "4-4-2":
+                        st.markdown("**⚽ Ataque:**")
+                        col1, col2 = st.columns(2)
+                        for i, pos_idx in enumerate([9, 10]):
+                            with [col1, col2][i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '')}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🏃 Meio-Campo:**")
+                        cols = st.columns(4)
+                        for i, pos_idx in enumerate([5, 6, 7, 8]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🛡️ Defesa:**")
+                        cols = st.columns(4)
+                        for i, pos_idx in enumerate([1, 2, 3, 4]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                    
+                    elif formacao == "4-3-3":
+                        st.markdown("**⚽ Ataque:**")
+                        cols = st.columns(3)
+                        for i, pos_idx in enumerate([8, 9, 10]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🏃 Meio-Campo:**")
+                        cols = st.columns(3)
+                        for i, pos_idx in enumerate([5, 6, 7]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🛡️ Defesa:**")
+                        cols = st.columns(4)
+                        for i, pos_idx in enumerate([1, 2, 3, 4]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                    
+                    elif formacao == "3-5-2":
+                        st.markdown("**⚽ Ataque:**")
+                        cols = st.columns(2)
+                        for i, pos_idx in enumerate([9, 10]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🏃 Meio-Campo:**")
+                        cols = st.columns(5)
+                        for i, pos_idx in enumerate([4, 5, 6, 7, 8]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                        
+                        st.markdown("**🛡️ Defesa:**")
+                        cols = st.columns(3)
+                        for i, pos_idx in enumerate([1, 2, 3]):
+                            with cols[i]:
+                                jogador_atual = esquema_jogadores.get(str(pos_idx))
+                                jogador_nome = f" - {jogador_atual.get('nome', '').split()[0]}" if jogador_atual else ""
+                                if st.button(f"📝 {posicoes[pos_idx]}{jogador_nome}", key=f"tact_pos_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = pos_idx
+                                    st.rerun()
+                    
+                    # Guarda-Redes (sempre presente)
+                    st.markdown("**🥅 Guarda-Redes:**")
+                    jogador_atual = esquema_jogadores.get("0")
+                    jogador_nome = f" - {jogador_atual.get('nome', '')}" if jogador_atual else ""
+                    if st.button(f"📝 {posicoes[0]}{jogador_nome}", key="tactic_pos_0"):
+                        st.session_state.posicao_selecionada = 0
+                        st.rerun()
+                    
+                    # Interface de atribuição quando uma posição é selecionada
+                    if st.session_state.posicao_selecionada is not None:
+                        pos_idx = st.session_state.posicao_selecionada
+                        st.markdown("---")
+                        st.markdown(f"### 🎯 Configurar: **{posicoes[pos_idx]}**")
+                        
+                        # Jogadores já atribuídos (para evitar duplicação)
+                        jogadores_atribuidos = set()
+                        for jog in esquema_jogadores.values():
+                            if jog:
+                                jogadores_atribuidos.add(jog.get('id'))
+                        
+                        # Jogador atual na posição
+                        jogador_atual_pos = esquema_jogadores.get(str(pos_idx))
+                        if jogador_atual_pos:
+                            jogadores_atribuidos.discard(jogador_atual_pos.get('id'))  # Permitir reselecionar o mesmo jogador
+                        
+                        # Jogadores disponíveis
+                        jogadores_disponiveis = [j for j in jogadores_ativos if j.get('id') not in jogadores_atribuidos]
+                        
+                        if jogadores_disponiveis or jogador_atual_pos:
+                            # Adicionar opção para remover
+                            opcoes = ["(Remover jogador)"]
+                            opcoes.extend([f"{j['nome']} (#{j.get('nr_camisola', 'S/N')})" for j in jogadores_disponiveis])
+                            
+                            # Índice selecionado
+                            indice_selecionado = 0
+                            if jogador_atual_pos:
+                                for i, jogador in enumerate(jogadores_disponiveis):
+                                    if jogador.get('id') == jogador_atual_pos.get('id'):
+                                        indice_selecionado = i + 1
+                                        break
+                            
+                            jogador_selecionado = st.selectbox(
+                                "Escolher jogador:",
+                                opcoes,
+                                index=indice_selecionado,
+                                key=f"sel_jogador_{pos_idx}"
+                            )
+                            
+                            col_confirm, col_cancel = st.columns(2)
+                            
+                            with col_confirm:
+                                if st.button("✅ Confirmar", key=f"confirm_{pos_idx}"):
+                                    esquema_index = esquemas.index(esquema_para_editar)
+                                    if 'jogadores' not in esquemas[esquema_index]:
+                                        esquemas[esquema_index]['jogadores'] = {}
+                                    
+                                    if jogador_selecionado == "(Remover jogador)":
+                                        # Remover jogador da posição
+                                        if str(pos_idx) in esquemas[esquema_index]['jogadores']:
+                                            del esquemas[esquema_index]['jogadores'][str(pos_idx)]
+                                    else:
+                                        # Adicionar jogador à posição
+                                        nome_selecionado = jogador_selecionado.split(" (#")[0]
+                                        jogador_obj = next(j for j in jogadores_disponiveis if j['nome'] == nome_selecionado)
+                                        esquemas[esquema_index]['jogadores'][str(pos_idx)] = jogador_obj
+                                    
+                                    dados['esquemas_taticos'] = esquemas
+                                    
+                                    if salvar_dados(dados):
+                                        st.success("✅ Jogador definido com sucesso!")
+                                        st.session_state.posicao_selecionada = None
+                                        st.rerun()
+                                    else:
+                                        st.error("❌ Erro ao salvar alterações!")
+                            
+                            with col_cancel:
+                                if st.button("❌ Cancelar", key=f"cancel_{pos_idx}"):
+                                    st.session_state.posicao_selecionada = None
+                                    st.rerun()
+                        else:
+                            st.warning("⚠️ Todos os jogadores já foram atribuídos!")
+                            if st.button("❌ Fechar", key=f"close_{pos_idx}"):
+                                st.session_state.posicao_selecionada = None
+                                st.rerun()
+                    
+                    # Resumo do esquema
+                    total_jogadores = len(esquema_jogadores)
+                    if total_jogadores > 0:
+                        st.markdown("---")
+                        st.markdown("### 📋 Resumo do Esquema")
+                        
+                        col1, col2 = st.columns([3, 1])
+                        with col1:
+                            st.markdown("**👥 Jogadores Posicionados:**")
+                            for pos_str, jogador in esquema_jogadores.items():
+                                pos_idx = int(pos_str)
+                                posicao_nome = posicoes[pos_idx]
+                                nr_camisola = jogador.get('nr_camisola', 'S/N')
+                                st.markdown(f"• **{posicao_nome}:** {jogador['nome']} (#{nr_camisola})")
+                        
+                        with col2:
+                            st.metric("Jogadores", f"{total_jogadores}/11")
+                            if total_jogadores == 11:
+                                st.success("✅ Completo!")
+                            
+                            if st.button("🗑️ Limpar Tudo", type="secondary"):
+                                esquema_index = esquemas.index(esquema_para_editar)
+                                esquemas[esquema_index]['jogadores'] = {}
+                                dados['esquemas_taticos'] = esquemas
+                                if salvar_dados(dados):
+                                    st.success("✅ Esquema limpo!")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao limpar esquema!")
+                
+                # Ações do esquema
+                st.divider()
+                col_delete, col_duplicate = st.columns(2)
+                
+                with col_delete:
+                    if st.button(f"🗑️ Eliminar Esquema", type="secondary", use_container_width=True):
+                        st.session_state[f'confirmar_delete_esquema_{esquema_para_editar.get("id")}'] = True
+                        st.rerun()
+                    
+                    # Confirmação de eliminação
+                    if st.session_state.get(f'confirmar_delete_esquema_{esquema_para_editar.get("id")}', False):
+                        st.error("⚠️ **Tem certeza que deseja eliminar este esquema?**")
+                        col_confirm, col_cancel = st.columns(2)
+                        
+                        with col_confirm:
+                            if st.button("✅ Sim, eliminar", type="primary"):
+                                esquemas.remove(esquema_para_editar)
+                                dados['esquemas_taticos'] = esquemas
+                                
+                                if salvar_dados(dados):
+                                    st.success("✅ Esquema eliminado!")
+                                    del st.session_state[f'confirmar_delete_esquema_{esquema_para_editar.get("id")}']
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao eliminar esquema!")
+                        
+                        with col_cancel:
+                            if st.button("❌ Cancelar"):
+                                del st.session_state[f'confirmar_delete_esquema_{esquema_para_editar.get("id")}']
+                                st.rerun()
+                
+                with col_duplicate:
+                    if st.button(f"📋 Duplicar Esquema", use_container_width=True):
+                        # Criar cópia do esquema
+                        esquema_copia = esquema_para_editar.copy()
+                        esquema_copia['id'] = str(uuid.uuid4())
+                        esquema_copia['nome'] = f"{esquema_para_editar.get('nome', 'Esquema')} - Cópia"
+                        esquema_copia['criado_em'] = datetime.now().isoformat()
+                        
+                        # Copiar posições sem jogadores definidos
+                        posicoes_copia = []
+                        for pos in esquema_para_editar.get('posicoes', []):
+                            pos_nova = pos.copy()
+                            pos_nova['jogador_id'] = None  # Limpar jogadores na cópia
+                            posicoes_copia.append(pos_nova)
+                        esquema_copia['posicoes'] = posicoes_copia
+                        
+                        esquemas.append(esquema_copia)
+                        dados['esquemas_taticos'] = esquemas
+                        
+                        if salvar_dados(dados):
+                            st.success(f"✅ Esquema duplicado como '{esquema_copia['nome']}'!")
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao duplicar esquema!")
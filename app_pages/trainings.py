@@ -0,0 +1,4647 @@
+"""
+Páginas de Treinos e Planos
+Treinos, exercícios, presenças, calendários mensais/semanais e planos de treino (PDF e email)
+"""
+
+import streamlit as st
+import os
+import uuid
+import calendar
+import glob as glob_module
+from datetime import datetime, date, timedelta
+from io import BytesIO
+
+from perf_metrics import medido
+from calendar_pdf import (
+    IndiceDatas, NOMES_MESES, TEMAS_PLANO, documento_calendario, flowables_ano, flowables_calendario, grelha_do_plano,
+    grelha_mensal, grelha_semanal, mes_do_plano, pdf_calendario
+)
+from pdf_stream import pdf_em_ficheiro
+from pdf_sections import SecaoPDF, compor_pdf
+from attendance_matrix import copiar_sessao_anterior, marcar_todos, normalizar_presencas
+from app_core import (
+    pd, email_system, verificar_sistema_email, obter_render_cache, pedir_pdf, versoes_colecoes, obter_matriz_presencas,
+    carregar_dados, salvar_dados, converter_hora_jogo
+)
+from app_pages.player_portal import plano_treinos_mensal_jogador, plano_treinos_semanal_jogador
+
+
+# === GESTÃO DE TREINOS ===
+def mostrar_calendario_mensal_treinos(dados):
+    """Mostra calendário mensal de treinos"""
+    st.error("🔧 DEBUG: Função mostrar_calendario_mensal_treinos foi chamada!")
+    st.error(f"🔧 DEBUG: Dados recebidos - tipo: {type(dados)}")
+    st.error(f"🔧 DEBUG: Chaves nos dados: {list(dados.keys()) if isinstance(dados, dict) else 'Não é dict'}")
+    st.subheader("📅 Calendário Mensal de Treinos")
+    
+    # Seleção do mês e ano
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        ano = st.selectbox("Ano", range(2024, 2027), index=1)  # Default 2025
+    with col2:
+        mes = st.selectbox("Mês", range(1, 13), index=date.today().month - 1, 
+                          format_func=lambda x: [
+                              "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                              "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+                          ][x-1])
+    with col3:
+        if st.button("📄 Gerar PDF", type="primary", use_container_width=True):
+            pedir_pdf(f"Calendário {mes:02d}/{ano}", 'gerar_pdf_calendario_mensal', ano, mes, dados)
+        if st.button("📄 PDF do ano", use_container_width=True):
+            pedir_pdf(f"Calendário {ano}", 'gerar_pdf_calendario_anual', ano, dados, em_ficheiro=True)
+    
+    # Obter treinos do mês
+    treinos = dados.get('treinos', {})
+    treinos_do_mes = {}
+    
+    for data, treino in treinos.items():
+        try:
+            data_obj = datetime.strptime(data, '%Y-%m-%d').date()
+            if data_obj.year == ano and data_obj.month == mes:
+                treinos_do_mes[data] = treino
+        except:
+            continue
+    
+    # Obter jogos do campeonato do mês (FC Pinheirense)
+    # Primeiro verificar na seção 'jogos' principal
+    jogos_principais = dados.get('jogos', [])
+    st.info(f"🔍 DEBUG: Encontrados {len(jogos_principais)} jogos na seção principal")
+    
+    for idx, jogo in enumerate(jogos_principais):
+        data_jogo = jogo.get('data')
+        adversario = jogo.get('adversario', 'N/A')
+        tipo = jogo.get('tipo', 'N/A')
+        st.info(f"🔍 Jogo {idx+1}: {data_jogo} vs {adversario} ({tipo})")
+        
+        if data_jogo:
+            try:
+                data_obj = datetime.strptime(data_jogo, '%Y-%m-%d').date()
+                st.info(f"🔍 Data processada: {data_obj} (Ano: {data_obj.year}, Mês: {data_obj.month})")
+                
+                if data_obj.year == ano and data_obj.month == mes:
+                    st.success(f"✅ JOGO ADICIONADO: {data_jogo} vs {adversario}")
+                    # Adicionar jogo como atividade
+                    local_jogo = jogo.get('local', 'Local TBD')
+                    tipo_jogo = jogo.get('tipo', 'Jogo')
+                    
+                    treinos_do_mes[data_jogo] = {
+                        'nome': f"🏆 JOGO - Fc Pinheirense vs {adversario}",
+                        'tipo': tipo_jogo,
+                        'hora': jogo.get('hora', '16:00'),
+                        'local': local_jogo,
+                        'duracao': 90,
+                        'nivel': 'Competição',
+                        'objetivos': [f"Jogo {tipo_jogo.lower()} contra {adversario}"],
+                        'adversario': adversario,
+                        'eh_jogo': True
+                    }
+                else:
+                    st.warning(f"❌ Jogo fora do período: {data_jogo} (selecionado: {ano}-{mes})")
+            except Exception as e:
+                st.error(f"❌ Erro ao processar data {data_jogo}: {e}")
+                continue
+    
+    # Também verificar nas jornadas do campeonato
+    campeonato = dados.get('campeonato', {})
+    jornadas = campeonato.get('jornadas', [])
+    
+    for jornada in jornadas:
+        for jogo in jornada.get('jogos', []):
+            # Verificar se o FC Pinheirense está a jogar
+            if (jogo.get('casa') == 'Fc Pinheirense' or jogo.get('fora') == 'Fc Pinheirense'):
+                try:
+                    data_jogo = jogo.get('data')
+                    if data_jogo:
+                        data_obj = datetime.strptime(data_jogo, '%Y-%m-%d').date()
+                        if data_obj.year == ano and data_obj.month == mes:
+                            # Adicionar jogo como um "treino especial"
+                            adversario = jogo.get('fora') if jogo.get('casa') == 'Fc Pinheirense' else jogo.get('casa')
+                            local_jogo = "Casa" if jogo.get('casa') == 'Fc Pinheirense' else "Fora"
+                            
+                            treinos_do_mes[data_jogo] = {
+                                'nome': f"🏆 JOGO CAMPEONATO - Fc Pinheirense vs {adversario}",
+                                'tipo': 'Campeonato',
+                                'hora': '16:00',  # Hora padrão, pode ser ajustada
+                                'local': f"{local_jogo} - Jornada {jornada.get('numero', 'N/A')}",
+                                'duracao': 90,
+                                'nivel': 'Competição',
+                                'objetivos': [f"Jogo do campeonato contra {adversario}"],
+                                'adversario': adversario,
+                                'jornada': jornada.get('numero'),
+                                'eh_jogo': True
+                            }
+                except:
+                    continue
+    
+    # Detectar se é mobile (baseado na largura estimada)
+    # Usar checkbox para permitir alternar entre vistas
+    view_mobile = st.checkbox("📱 Vista Mobile (recomendada para smartphones)", value=False)
+    
+    if view_mobile:
+        # Vista mobile: Lista com cards
+        mostrar_calendario_mobile(ano, mes, treinos_do_mes)
+    else:
+        # Vista desktop: Calendário tradicional
+        mostrar_calendario_desktop(ano, mes, treinos_do_mes)
+    
+    # Lista de treinos e jogos do mês (comum a ambas as vistas)
+    if treinos_do_mes:
+        # Contar treinos e jogos separadamente
+        jogos = sum(1 for t in treinos_do_mes.values() if t.get('eh_jogo', False))
+        treinos_reais = len(treinos_do_mes) - jogos
+        
+        titulo = f"📋 Atividades de {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][mes-1]}"
+        if treinos_reais > 0 and jogos > 0:
+            titulo += f" ({treinos_reais} treinos, {jogos} jogos)"
+        elif treinos_reais > 0:
+            titulo += f" ({treinos_reais} treinos)"
+        elif jogos > 0:
+            titulo += f" ({jogos} jogos)"
+        
+        st.subheader(titulo)
+        
+        for data in sorted(treinos_do_mes.keys()):
+            treino = treinos_do_mes[data]
+            data_formatada = datetime.strptime(data, '%Y-%m-%d').strftime('%d/%m/%Y')
+            
+            # Ícone diferente para jogos vs treinos
+            icone = "🏆" if treino.get('eh_jogo', False) else "🏃"
+            
+            with st.expander(f"{icone} {data_formatada} - {treino.get('nome', treino.get('tipo', 'Treino'))}"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**🕐 Hora:** {treino.get('hora', 'TBD')}")
+                    st.write(f"**📍 Local:** {treino.get('local', 'TBD')}")
+                    st.write(f"**⏱️ Duração:** {treino.get('duracao', 'TBD')} min")
+                with col2:
+                    st.write(f"**🎯 Tipo:** {treino.get('tipo', 'TBD')}")
+                    st.write(f"**📊 Nível:** {treino.get('nivel', 'TBD')}")
+                    if treino.get('eh_jogo', False):
+                        st.write(f"**⚽ Adversário:** {treino.get('adversario', 'TBD')}")
+                        st.write(f"**📊 Jornada:** {treino.get('jornada', 'TBD')}")
+                    if treino.get('objetivos'):
+                        st.write("**🎯 Objetivos:**")
+                        for obj in treino['objetivos']:
+                            st.write(f"• {obj}")
+    else:
+        st.info(f"📝 Nenhuma atividade programada para {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][mes-1]} {ano}")
+
+def _html_calendario_desktop(ano, mes, treinos_do_mes, hoje):
+    """Grelha HTML do calendário mensal num único bloco (em vez de 7 colunas por semana)"""
+    cal = calendar.monthcalendar(ano, mes)
+    
+    partes = ['<div style="display: grid; grid-template-columns: repeat(7, 1fr); gap: 6px;">']
+    
+    # Cabeçalho dos dias da semana
+    for dia in ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]:
+        partes.append(f'<div style="text-align: center;"><strong>{dia}</strong></div>')
+    
+    # Linhas do calendário
+    for semana in cal:
+        for dia in semana:
+            if dia == 0:
+                partes.append('<div></div>')  # Dias vazios
+                continue
+            
+            data_str = f"{ano}-{mes:02d}-{dia:02d}"
+            if data_str in treinos_do_mes:
+                # Dia com treino ou jogo
+                treino = treinos_do_mes[data_str]
+                eh_jogo = treino.get('eh_jogo', False)
+                
+                # Cores diferentes para treinos vs jogos
+                cor_fundo = "#FFD700" if eh_jogo else "#90EE90"  # Dourado para jogos, verde para treinos
+                icone = "🏆" if eh_jogo else "🏃"
+                
+                partes.append(
+                    f'<div style="background-color: {cor_fundo}; padding: 5px; border-radius: 5px; text-align: center;">'
+                    f'<strong>{dia}</strong><br>{icone} {treino.get("hora", "TBD")}<br>'
+                    f'<small>{treino.get("nome", treino.get("tipo", "Treino"))[:15]}</small></div>'
+                )
+            else:
+                # Dia normal
+                data_atual = date(ano, mes, dia)
+                if data_atual == hoje:
+                    partes.append(
+                        '<div style="background-color: #FFE4B5; padding: 5px; border-radius: 5px; text-align: center;">'
+                        f'<strong>{dia}</strong><br><small>Hoje</small></div>'
+                    )
+                elif data_atual < hoje:
+                    partes.append(
+                        '<div style="background-color: #F0F0F0; padding: 5px; border-radius: 5px; text-align: center; color: #888;">'
+                        f'{dia}</div>'
+                    )
+                else:
+                    partes.append(
+                        '<div style="background-color: #F8F8FF; padding: 5px; border-radius: 5px; text-align: center;">'
+                        f'{dia}</div>'
+                    )
+    
+    partes.append('</div>')
+    return ''.join(partes)
+
+def mostrar_calendario_desktop(ano, mes, treinos_do_mes):
+    """Calendário tradicional para desktop/tablet"""
+    st.write(f"**📆 {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][mes-1]} {ano}**")
+    
+    # Bloco HTML reutilizado enquanto treinos/jogos/campeonato não mudarem
+    hoje = date.today()
+    html_calendario = obter_render_cache().obter(
+        'calendario_desktop',
+        lambda: _html_calendario_desktop(ano, mes, treinos_do_mes, hoje),
+        parametros=(ano, mes, hoje.isoformat()),
+        versoes=versoes_colecoes('treinos', 'jogos', 'campeonato')
+    )
+    st.markdown(html_calendario, unsafe_allow_html=True)
+    
+    # Legenda
+    st.write("---")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("🟢 **Com Treino**")
+    with col2:
+        st.markdown("🟡 **Hoje**")
+    with col3:
+        st.markdown("⚪ **Futuro**")
+    with col4:
+        st.markdown("⚫ **Passado**")
+
+def _html_calendario_mobile(ano, mes, treinos_do_mes, hoje):
+    """Calendário mobile em HTML: um título e uma grelha de 2 colunas por semana"""
+    partes = []
+    for semana_idx, semana in enumerate(calendar.monthcalendar(ano, mes)):
+        partes.append(f'<p><strong>📅 Semana {semana_idx + 1}</strong></p>')
+        partes.append('<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0 10px; margin-bottom: 1em;">')
+        for dia in semana:
+            if dia != 0:
+                partes.append(_html_dia_mobile(ano, mes, dia, treinos_do_mes, semana, hoje))
+        partes.append('</div>')
+    return ''.join(partes)
+
+def mostrar_calendario_mobile(ano, mes, treinos_do_mes):
+    """Calendário otimizado para mobile"""
+    st.write(f"**📅 {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][mes-1]} {ano}**")
+    
+    # Bloco HTML reutilizado enquanto treinos/jogos/campeonato não mudarem
+    hoje = date.today()
+    html_calendario = obter_render_cache().obter(
+        'calendario_mobile',
+        lambda: _html_calendario_mobile(ano, mes, treinos_do_mes, hoje),
+        parametros=(ano, mes, hoje.isoformat()),
+        versoes=versoes_colecoes('treinos', 'jogos', 'campeonato')
+    )
+    st.markdown(html_calendario, unsafe_allow_html=True)
+    
+    mostrar_gerador_calendario_visual()
+
+def _html_dia_mobile(ano, mes, dia, treinos_do_mes, semana, hoje):
+    """HTML de um dia individual na vista mobile"""
+    data_str = f"{ano}-{mes:02d}-{dia:02d}"
+    
+    # Obter nome do dia da semana
+    dias_semana = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+    dia_semana_idx = semana.index(dia) if dia in semana else 0
+    nome_dia = dias_semana[dia_semana_idx] if dia_semana_idx < len(dias_semana) else ""
+    
+    data_atual = date(ano, mes, dia)
+    
+    if data_str in treinos_do_mes:
+        # Dia com treino ou jogo
+        treino = treinos_do_mes[data_str]
+        eh_jogo = treino.get('eh_jogo', False)
+        
+        # Cores e ícones diferentes para treinos vs jogos
+        if eh_jogo:
+            cor_fundo = "#FFD700" if data_atual != hoje else "#FFA500"  # Dourado para jogos
+            icone = "🏆"
+            borda_cor = "#FFB000"
+        else:
+            cor_fundo = "#90EE90" if data_atual != hoje else "#FFD700"  # Verde para treinos
+            icone = "🏃"
+            borda_cor = "#4CAF50"
+        
+        return (
+            f'<div style="background-color: {cor_fundo}; padding: 10px; border-radius: 10px; margin: 5px 0; text-align: center; border: 2px solid {borda_cor};">'
+            f'<h4>{nome_dia} - {dia}</h4>'
+            f'<p><strong>{icone} {treino.get("hora", "TBD")}</strong></p>'
+            f'<p>{treino.get("nome", treino.get("tipo", "Treino"))}</p>'
+            f'<small>📍 {treino.get("local", "TBD")}</small></div>'
+        )
+    
+    # Dia sem treino
+    if data_atual == hoje:
+        return (
+            '<div style="background-color: #FFE4B5; padding: 10px; border-radius: 10px; margin: 5px 0; text-align: center; border: 2px solid #FFA500;">'
+            f'<h4>{nome_dia} - {dia}</h4><p><strong>HOJE</strong></p><small>📝 Sem treino</small></div>'
+        )
+    if data_atual < hoje:
+        return (
+            '<div style="background-color: #F0F0F0; padding: 8px; border-radius: 8px; margin: 5px 0; text-align: center; color: #888;">'
+            f'<h5>{nome_dia} - {dia}</h5><small>Passado</small></div>'
+        )
+    return (
+        '<div style="background-color: #F8F8FF; padding: 8px; border-radius: 8px; margin: 5px 0; text-align: center; border: 1px dashed #CCC;">'
+        f'<h5>{nome_dia} - {dia}</h5><small>📝 Livre</small></div>'
+    )
+
+def mostrar_dia_mobile(ano, mes, dia, treinos_do_mes, semana):
+    """Mostra um dia individual na vista mobile"""
+    st.markdown(_html_dia_mobile(ano, mes, dia, treinos_do_mes, semana, date.today()), unsafe_allow_html=True)
+
+def mostrar_gerador_calendario_visual():
+    """Gerador do calendário visual premium (HTML igual ao do email)"""
+    # ========== BOTÃO CALENDÁRIO VISUAL ==========
+    st.markdown("---")
+    st.subheader("🎨 Gerar Calendário Visual Profissional")
+    st.info("✨ Gera um calendário com design IDÊNTICO ao email - formato profissional com cores e gradientes!")
+    
+    # Seletor de mês e ano para Calendário Visual Premium
+    col_ano, col_mes = st.columns(2)
+    with col_ano:
+        ano_visual = st.selectbox("Ano:", range(2024, 2027), index=1, key="ano_visual_mobile_fix")
+    with col_mes:
+        meses_nomes = [
+            "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+            "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+        ]
+        mes_visual = st.selectbox("Mês:", range(1, 13), 
+                                 format_func=lambda x: meses_nomes[x-1], 
+                                 index=date.today().month - 1,
+                                 key="mes_visual_premium")
+    
+    col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+    with col_btn2:
+        if st.button("🎯 Gerar Calendário Visual Premium", type="primary", use_container_width=True, key="calendario_visual_premium"):
+            try:
+                with st.spinner("🔄 Gerando calendário VISUAL IDÊNTICO ao email..."):
+                    # Carregar todos os dados para o calendário
+                    dados_completos = carregar_dados()
+                    plano_adaptado = {
+                        'treinos': dados_completos.get('treinos', {}),
+                        'jogos': dados_completos.get('jogos', []),
+                        'tipo': 'mensal',
+                        'ano': ano_visual,
+                        'mes': mes_visual
+                    }
+                    nome_arquivo = criar_calendario_pdf_mensal(plano_adaptado)
+                    
+                    if nome_arquivo and nome_arquivo.endswith('.html'):
+                        st.success("✅ Calendário HTML gerado com FORMATO IDÊNTICO ao email!")
+                        
+                        # Ler o arquivo HTML gerado
+                        with open(nome_arquivo, 'r', encoding='utf-8') as html_file:
+                            html_data = html_file.read()
+                        
+                        # Botão de download HTML
+                        st.download_button(
+                            label="💾 Baixar HTML (Para Converter em PDF)",
+                            data=html_data,
+                            file_name=nome_arquivo,
+                            mime="text/html",
+                            use_container_width=True
+                        )
+                        
+                        # Instruções para converter para PDF
+                        st.info("📋 **INSTRUÇÕES para PDF:**")
+                        st.info("1. 📥 Baixe o arquivo HTML acima")
+                        st.info("2. 🌐 Abra o arquivo no navegador")
+                        st.info("3. 🖨️ Pressione Ctrl+P (Imprimir)")
+                        st.info("4. 📄 Escolha 'Salvar como PDF'")
+                        st.info("5. ⚙️ Configure: Paisagem + Sem margens + Gráficos de fundo")
+                        st.info("6. ✅ PDF será IDÊNTICO ao email!")
+                        
+                        # Mostrar prévia
+                        st.markdown("### 👁️ Prévia do Calendário:")
+                        st.components.v1.html(html_data, height=600, scrolling=True)
+                        
+                    else:
+                        st.error("❌ Erro ao gerar calendário visual")
+            except Exception as e:
+                st.error(f"❌ Erro ao gerar calendário: {str(e)}")
+
+def mostrar_calendario_semanal_treinos(dados):
+    """Mostra calendário semanal de treinos"""
+    st.subheader("📆 Calendário Semanal de Treinos")
+    
+    # Linha com opções
+    col1, col2, col3 = st.columns([2, 2, 1])
+    
+    with col1:
+        # Opção para vista mobile
+        view_mobile = st.checkbox("📱 Vista Mobile (recomendada para smartphones)", value=False, key="semanal_mobile")
+    
+    with col2:
+        # Seleção da data base
+        data_base = st.date_input("Selecione uma data da semana:", value=date.today())
+    
+    with col3:
+        # Botão para gerar PDF
+        if st.button("📄 Gerar PDF", type="primary", use_container_width=True, key="pdf_semanal"):
+            pedir_pdf(f"Calendário semana {data_base.strftime('%d/%m')}", 'gerar_pdf_calendario_semanal', data_base, dados)
+    
+    # Calcular início e fim da semana (segunda a domingo)
+    dias_desde_segunda = data_base.weekday()
+    inicio_semana = data_base - timedelta(days=dias_desde_segunda)
+    fim_semana = inicio_semana + timedelta(days=6)
+    
+    st.write(f"**📅 Semana de {inicio_semana.strftime('%d/%m/%Y')} a {fim_semana.strftime('%d/%m/%Y')}**")
+    
+    # Obter treinos da semana
+    treinos = dados.get('treinos', {})
+    treinos_da_semana = {}
+    
+    for i in range(7):
+        data_atual = inicio_semana + timedelta(days=i)
+        data_str = data_atual.strftime('%Y-%m-%d')
+        if data_str in treinos:
+            treinos_da_semana[data_str] = treinos[data_str]
+    
+    # Navegação entre semanas
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("⬅️ Semana Anterior"):
+            nova_data = data_base - timedelta(days=7)
+            st.session_state['data_semana'] = nova_data
+            st.rerun()
+    
+    with col2:
+        st.write("")  # Espaço
+    
+    with col3:
+        if st.button("Próxima Semana ➡️"):
+            nova_data = data_base + timedelta(days=7)
+            st.session_state['data_semana'] = nova_data
+            st.rerun()
+            st.rerun()
+    
+    if view_mobile:
+        # Vista mobile otimizada
+        mostrar_semana_mobile(inicio_semana, treinos_da_semana)
+    else:
+        # Vista desktop tradicional
+        mostrar_semana_desktop(inicio_semana, treinos_da_semana)
+    
+    # Resumo da semana
+    st.write("---")
+    total_treinos = len(treinos_da_semana)
+    if total_treinos > 0:
+        total_duracao = sum(int(treino.get('duracao', 0)) for treino in treinos_da_semana.values())
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("🏃 Treinos na Semana", total_treinos)
+        with col2:
+            st.metric("⏱️ Tempo Total", f"{total_duracao} min")
+        with col3:
+            if total_treinos > 0:
+                media = total_duracao // total_treinos
+                st.metric("📊 Duração Média", f"{media} min")
+    else:
+        st.info("📝 Nenhum treino programado para esta semana")
+
+def mostrar_semana_desktop(inicio_semana, treinos_da_semana):
+    """Vista semanal para desktop"""
+    dias_semana = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+    
+    for i in range(7):
+        data_atual = inicio_semana + timedelta(days=i)
+        data_str = data_atual.strftime('%Y-%m-%d')
+        data_formatada = data_atual.strftime('%d/%m')
+        
+        # Verificar se é hoje
+        eh_hoje = data_atual == date.today()
+        eh_passado = data_atual < date.today()
+        
+        with st.container():
+            if eh_hoje:
+                st.markdown(f"### 🔆 {dias_semana[i]} - {data_formatada} (Hoje)")
+            elif eh_passado:
+                st.markdown(f"### ⚫ {dias_semana[i]} - {data_formatada}")
+            else:
+                st.markdown(f"### 📅 {dias_semana[i]} - {data_formatada}")
+            
+            if data_str in treinos_da_semana:
+                treino = treinos_da_semana[data_str]
+                
+                with st.container():
+                    if eh_hoje:
+                        st.markdown(f"""
+                        <div style="background-color: #FFD700; padding: 10px; border-radius: 10px; border-left: 5px solid #FFA500;">
+                            <h4>🏃 {treino.get('nome', treino.get('tipo', 'Treino'))}</h4>
+                            <p><strong>🕐 Hora:</strong> {treino.get('hora', 'TBD')}
+                            <p><strong>📍 Local:</strong> {treino.get('local', 'TBD')}
+                            <p><strong>⏱️ Duração:</strong> {treino.get('duracao', 'TBD')} min
+                        
+                        """, unsafe_allow_html=True)
+                    else:
+                        st.markdown(f"""
+                        <div style="background-color: #E6FFE6; padding: 10px; border-radius: 10px; border-left: 5px solid #4CAF50;">
+                            <h4>🏃 {treino.get('nome', treino.get('tipo', 'Treino'))}</h4>
+                            <p><strong>🕐 Hora:</strong> {treino.get('hora', 'TBD')}
+                            <p><strong>📍 Local:</strong> {treino.get('local', 'TBD')}
+                            <p><strong>⏱️ Duração:</strong> {treino.get('duracao', 'TBD')} min
+                        
+                        """, unsafe_allow_html=True)
+                    
+                    # Detalhes expandíveis
+                    with st.expander("Ver detalhes do treino"):
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.write(f"**🎯 Tipo:** {treino.get('tipo', 'TBD')}")
+                            st.write(f"**📊 Nível:** {treino.get('nivel', 'TBD')}")
+                            st.write(f"**👥 Categoria:** {treino.get('categoria', 'TBD')}")
+                        with col2:
+                            if treino.get('objetivos'):
+                                st.write("**🎯 Objetivos:**")
+                                for obj in treino['objetivos']:
+                                    st.write(f"• {obj}")
+                        
+                        if treino.get('exercicios'):
+                            st.write("**💪 Exercícios:**")
+                            for i, exercicio in enumerate(treino['exercicios'], 1):
+                                st.write(f"{i}. **{exercicio.get('nome', 'Sem nome')}** ({exercicio.get('duracao', 0)} min)")
+                                if exercicio.get('descricao'):
+                                    st.write(f"   {exercicio['descricao']}")
+            else:
+                if eh_passado:
+                    st.markdown("""
+                    <div style="background-color: #F5F5F5; padding: 10px; border-radius: 10px; color: #888;">
+                        <p>📝 Nenhum treino realizado
+                    
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown("""
+                    <div style="background-color: #F8F8FF; padding: 10px; border-radius: 10px; border: 2px dashed #DDD;">
+                        <p>📝 Nenhum treino programado
+                    
+                    """, unsafe_allow_html=True)
+            
+            st.write("")  # Espaço entre dias
+
+def mostrar_semana_mobile(inicio_semana, treinos_da_semana):
+    """Vista semanal otimizada para mobile"""
+    dias_semana_curto = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+    dias_semana_longo = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+    
+    # Dividir em blocos de 2 dias para não sobrecarregar a tela
+    for bloco in range(0, 7, 2):
+        col1, col2 = st.columns(2)
+        
+        # Primeiro dia do bloco
+        if bloco < 7:
+            i = bloco
+            data_atual = inicio_semana + timedelta(days=i)
+            data_str = data_atual.strftime('%Y-%m-%d')
+            
+            with col1:
+                mostrar_dia_semanal_mobile(data_atual, data_str, dias_semana_curto[i], treinos_da_semana)
+        
+        # Segundo dia do bloco
+        if bloco + 1 < 7:
+            i = bloco + 1
+            data_atual = inicio_semana + timedelta(days=i)
+            data_str = data_atual.strftime('%Y-%m-%d')
+            
+            with col2:
+                mostrar_dia_semanal_mobile(data_atual, data_str, dias_semana_curto[i], treinos_da_semana)
+        
+        st.write("")  # Espaço entre blocos
+
+def mostrar_dia_semanal_mobile(data_atual, data_str, nome_dia, treinos_da_semana):
+    """Mostra um dia individual na vista semanal mobile"""
+    data_formatada = data_atual.strftime('%d/%m')
+    eh_hoje = data_atual == date.today()
+    eh_passado = data_atual < date.today()
+    
+    if data_str in treinos_da_semana:
+        treino = treinos_da_semana[data_str]
+        
+        if eh_hoje:
+            cor_fundo = "#FFD700"
+            cor_borda = "#FFA500"
+            emoji = "🔆"
+        else:
+            cor_fundo = "#E6FFE6"
+            cor_borda = "#4CAF50"
+            emoji = "🏃"
+        
+        st.markdown(f"""
+        <div style="background-color: {cor_fundo}; padding: 15px; border-radius: 15px; margin: 10px 0; text-align: center; border: 3px solid {cor_borda}; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">
+            <h3>{emoji} {nome_dia}</h3>
+            <h4>{data_formatada}</h4>
+            <hr style="margin: 10px 0;">
+            <p><strong>🏃 {treino.get('nome', treino.get('tipo', 'Treino'))}</strong>
+            <p><strong>🕐 {treino.get('hora', 'TBD')}</strong>
+            <p><strong>📍 {treino.get('local', 'TBD')}</strong>
+            <p><strong>⏱️ {treino.get('duracao', 'TBD')} min</strong>
+        
+        """, unsafe_allow_html=True)
+        
+        # Detalhes expandíveis
+        with st.expander(f"Ver detalhes - {nome_dia}"):
+            st.write(f"**🎯 Tipo:** {treino.get('tipo', 'TBD')}")
+            st.write(f"**📊 Nível:** {treino.get('nivel', 'TBD')}")
+            st.write(f"**👥 Categoria:** {treino.get('categoria', 'TBD')}")
+            
+            if treino.get('objetivos'):
+                st.write("**🎯 Objetivos:**")
+                for obj in treino['objetivos']:
+                    st.write(f"• {obj}")
+            
+            if treino.get('exercicios'):
+                st.write("**💪 Exercícios:**")
+                for i, exercicio in enumerate(treino['exercicios'], 1):
+                    st.write(f"{i}. {exercicio.get('nome', 'Sem nome')} ({exercicio.get('duracao', 0)} min)")
+    
+    else:
+        # Dia sem treino
+        if eh_hoje:
+            st.markdown(f"""
+            <div style="background-color: #FFF8DC; padding: 15px; border-radius: 15px; margin: 10px 0; text-align: center; border: 2px dashed #DAA520;">
+                <h4>🔆 {nome_dia}</h4>
+                <h5>{data_formatada}</h5>
+                <p><strong>HOJE</strong>
+                <p>📝 Sem treino
+            
+            """, unsafe_allow_html=True)
+        elif eh_passado:
+            st.markdown(f"""
+            <div style="background-color: #F5F5F5; padding: 12px; border-radius: 12px; margin: 10px 0; text-align: center; border: 1px solid #DDD; color: #888;">
+                <h5>{nome_dia}</h5>
+                <h6>{data_formatada}</h6>
+                <p>📝 Sem treino
+            
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div style="background-color: #F8F8FF; padding: 12px; border-radius: 12px; margin: 10px 0; text-align: center; border: 2px dashed #DDD;">
+                <h5>📅 {nome_dia}</h5>
+                <h6>{data_formatada}</h6>
+                <p>📝 Livre
+            
+            """, unsafe_allow_html=True)
+
+def importar_treinos_pdf(dados):
+    """Funcionalidade para importar treinos a partir de PDFs"""
+    st.subheader("📄 Importar Treinos de PDF")
+    
+    # Verificar se a pasta de PDFs existe
+    pdf_folder = "Treinos PDF"
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**📁 PDFs Locais (da pasta 'Treinos PDF'):**")
+        
+        if os.path.exists(pdf_folder):
+            st.success(f"✅ Pasta '{pdf_folder}' encontrada")
+            
+            # Listar PDFs existentes
+            pdf_files = glob_module.glob(os.path.join(pdf_folder, "*.pdf"))
+            
+            if pdf_files:
+                st.write(f"**📋 {len(pdf_files)} PDF(s) encontrado(s):**")
+                
+                for pdf_file in pdf_files:
+                    filename = os.path.basename(pdf_file)
+                    
+                    with st.expander(f"📄 {filename}"):
+                        st.write(f"**Arquivo:** {filename}")
+                        
+                        # Formulário para criar treino baseado no PDF
+                        with st.form(f"form_pdf_{filename}"):
+                            nome_base = filename.replace('.pdf', '').replace('_', ' ').title()
+                            
+                            col_form1, col_form2 = st.columns(2)
+                            
+                            with col_form1:
+                                nome_treino = st.text_input("Nome do Treino", value=nome_base)
+                                tipo_treino = st.selectbox("Tipo de Treino", [
+                                    "Técnico", "Físico", "Tático", "Técnico-Físico", "Técnico-Tático", "Físico-Tático", "Completo"
+                                ], index=6)
+                                duracao = st.number_input("Duração (minutos)", min_value=30, max_value=180, value=90)
+                            
+                            with col_form2:
+                                categoria = st.selectbox("Categoria", [
+                                    "Sénior", "Sub-23", "Sub-19", "Sub-17", "Sub-15", "Juvenis", "Iniciados"
+                                ])
+                                nivel = st.selectbox("Nível", [
+                                    "Iniciante", "Intermédio", "Avançado", "Profissional"
+                                ], index=1)
+                            
+                            # Data e hora
+                            col_data, col_hora = st.columns(2)
+                            
+                            with col_data:
+                                data_treino = st.date_input("Data do Treino", value=date.today())
+                            
+                            with col_hora:
+                                hora_treino = st.time_input("Hora do Treino", value=datetime.strptime("19:15", "%H:%M").time())
+                            
+                            local_treino = st.text_input("Local do Treino", value="Campo Municipal")
+                            
+                            # Objetivos
+                            st.write("**🎯 Objetivos do Treino:**")
+                            objetivos_text = st.text_area("Objetivos (um por linha)", 
+                                placeholder="Exemplo:\nMelhorar técnica individual\nDesenvolver resistência\nTreinar finalizações")
+                            
+                            # Observações
+                            observacoes = st.text_area("Observações", 
+                                placeholder="Observações adicionais sobre o treino...")
+                            
+                            submitted = st.form_submit_button("📥 Importar de PDF", type="primary")
+                            
+                            if submitted:
+                                if nome_treino:
+                                    objetivos_lista = []
+                                    if objetivos_text:
+                                        objetivos_lista = [obj.strip() for obj in objetivos_text.split('\n') if obj.strip()]
+                                    
+                                    data_treino_str = str(data_treino)
+                                    
+                                    novo_treino = {
+                                        "nome": nome_treino,
+                                        "tipo": tipo_treino,
+                                        "duracao": duracao,
+                                        "categoria": categoria,
+                                        "nivel": nivel,
+                                        "objetivos": objetivos_lista,
+                                        "observacoes": observacoes,
+                                        "hora": hora_treino.strftime("%H:%M"),
+                                        "local": local_treino,
+                                        "origem_pdf": {
+                                            "arquivo": filename,
+                                            "importado_em": datetime.now().isoformat(),
+                                            "caminho": pdf_file
+                                        },
+                                        "exercicios": [],
+                                        "participantes": [],
+                                        "data_criacao": datetime.now().isoformat()
+                                    }
+                                    
+                                    dados['treinos'][data_treino_str] = novo_treino
+                                    
+                                    if salvar_dados(dados):
+                                        st.success(f"✅ Treino '{nome_treino}' importado de PDF com sucesso!")
+                                        st.rerun()
+                                    else:
+                                        st.error("❌ Erro ao salvar treino importado")
+                                else:
+                                    st.error("❌ Nome do treino é obrigatório")
+                        
+                        # Botão para ver PDF
+                        if st.button(f"👁️ Ver PDF", key=f"view_{filename}"):
+                            try:
+                                if os.name == 'nt':  # Windows
+                                    os.startfile(pdf_file)
+                                else:  # Linux/Mac
+                                    import subprocess
+                                    subprocess.call(['xdg-open', pdf_file])
+                                st.success("📄 PDF aberto!")
+                            except Exception as e:
+                                st.error(f"❌ Erro ao abrir PDF: {e}")
+            else:
+                st.info("📄 Nenhum PDF encontrado na pasta 'Treinos PDF'")
+        else:
+            st.warning(f"⚠️ Pasta '{pdf_folder}' não encontrada")
+            st.info("💡 **Para usar esta funcionalidade:**")
+            st.info("1. Crie uma pasta chamada 'Treinos PDF' no mesmo diretório desta aplicação")
+            st.info("2. Coloque seus PDFs de treinos nesta pasta")
+            st.info("3. Volte aqui para importá-los")
+    
+    with col2:
+        st.write("**📤 Upload Manual de PDF:**")
+        
+        uploaded_pdf = st.file_uploader(
+            "Escolha um arquivo PDF",
+            type=['pdf'],
+            help="Carregue um PDF de treino para importar"
+        )
+        
+        if uploaded_pdf is not None:
+            st.success(f"✅ PDF carregado: {uploaded_pdf.name}")
+            
+            # Formulário para upload manual
+            with st.form("upload_pdf_form"):
+                st.write("**📋 Criar Treino a partir do PDF carregado:**")
+                
+                nome_base = uploaded_pdf.name.replace('.pdf', '').replace('_', ' ').title()
+                
+                nome_treino = st.text_input("Nome do Treino", value=nome_base)
+                
+                col_upload1, col_upload2 = st.columns(2)
+                
+                with col_upload1:
+                    tipo_treino = st.selectbox("Tipo", [
+                        "Técnico", "Físico", "Tático", "Técnico-Físico", "Técnico-Tático", "Físico-Tático", "Completo"
+                    ])
+                    duracao = st.number_input("Duração (min)", min_value=30, max_value=180, value=90)
+                
+                with col_upload2:
+                    categoria = st.selectbox("Categoria", [
+                        "Sénior", "Sub-23", "Sub-19", "Sub-17", "Sub-15", "Juvenis", "Iniciados"
+                    ])
+                    nivel = st.selectbox("Nível", ["Iniciante", "Intermédio", "Avançado", "Profissional"], index=1)
+                
+                col_data_up, col_hora_up = st.columns(2)
+                
+                with col_data_up:
+                    data_treino = st.date_input("Data", value=date.today())
+                
+                with col_hora_up:
+                    hora_treino = st.time_input("Hora", value=datetime.strptime("19:15", "%H:%M").time())
+                
+                local_treino = st.text_input("Local", value="Campo Municipal")
+                objetivos_text = st.text_area("Objetivos (um por linha)")
+                observacoes = st.text_area("Observações")
+                
+                submitted_upload = st.form_submit_button("📥 Importar PDF Carregado", type="primary")
+                
+                if submitted_upload:
+                    if nome_treino:
+                        objetivos_lista = []
+                        if objetivos_text:
+                            objetivos_lista = [obj.strip() for obj in objetivos_text.split('\n') if obj.strip()]
+                        
+                        data_treino_str = str(data_treino)
+                        
+                        novo_treino = {
+                            "nome": nome_treino,
+                            "tipo": tipo_treino,
+                            "duracao": duracao,
+                            "categoria": categoria,
+                            "nivel": nivel,
+                            "objetivos": objetivos_lista,
+                            "observacoes": observacoes,
+                            "hora": hora_treino.strftime("%H:%M"),
+                            "local": local_treino,
+                            "origem_pdf": {
+                                "arquivo": uploaded_pdf.name,
+                                "importado_em": datetime.now().isoformat(),
+                                "tipo": "upload_manual"
+                            },
+                            "exercicios": [],
+                            "participantes": [],
+                            "data_criacao": datetime.now().isoformat()
+                        }
+                        
+                        dados['treinos'][data_treino_str] = novo_treino
+                        
+                        if salvar_dados(dados):
+                            st.success(f"✅ Treino '{nome_treino}' importado do PDF carregado com sucesso!")
+                            st.rerun()
+                        else:
+                            st.error("❌ Erro ao salvar treino importado")
+                    else:
+                        st.error("❌ Nome do treino é obrigatório")
+
+def gestao_planos_treino(dados):
+    """Gestão de planos de treino semanais e mensais com funcionalidade de envio por email"""
+    st.subheader("📋 Planos de Treino")
+    
+    plano_tab1, plano_tab2, plano_tab3, plano_tab4 = st.tabs(["📆 Plano Semanal", "🗓️ Plano Mensal", "📧 Enviar Planos", "📄 Gerar PDF"])
+    
+    with plano_tab1:
+        criar_plano_semanal(dados)
+    
+    with plano_tab2:
+        criar_plano_mensal(dados)
+    
+    with plano_tab3:
+        enviar_planos_email(dados)
+    
+    with plano_tab4:
+        gerar_pdf_planos_visuais(dados)
+
+def criar_plano_semanal(dados):
+    """Cria plano de treino semanal"""
+    st.subheader("📆 Plano de Treino Semanal")
+    
+    # Seleção da semana
+    col1, col2 = st.columns(2)
+    with col1:
+        data_inicio = st.date_input("Data de início da semana (Segunda-feira):", value=date.today())
+    
+    with col2:
+        nome_plano = st.text_input("Nome do Plano:", value=f"Plano Semanal - {data_inicio.strftime('%d/%m/%Y')}")
+    
+    # Calcular a semana completa
+    dias_desde_segunda = data_inicio.weekday()
+    inicio_semana = data_inicio - timedelta(days=dias_desde_segunda)
+    
+    st.write(f"**📅 Semana de {inicio_semana.strftime('%d/%m/%Y')} a {(inicio_semana + timedelta(days=6)).strftime('%d/%m/%Y')}**")
+    
+    # Obter treinos da semana
+    treinos = dados.get('treinos', {})
+    treinos_da_semana = {}
+    
+    for i in range(7):
+        data_atual = inicio_semana + timedelta(days=i)
+        data_str = data_atual.strftime('%Y-%m-%d')
+        if data_str in treinos:
+            treinos_da_semana[data_str] = treinos[data_str]
+    
+    # Mostrar resumo da semana
+    if treinos_da_semana:
+        st.success(f"✅ {len(treinos_da_semana)} treino(s) encontrado(s) nesta semana")
+        
+        dias_semana = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+        
+        for i in range(7):
+            data_atual = inicio_semana + timedelta(days=i)
+            data_str = data_atual.strftime('%Y-%m-%d')
+            data_formatada = data_atual.strftime('%d/%m')
+            
+            with st.expander(f"📅 {dias_semana[i]} - {data_formatada}"):
+                if data_str in treinos_da_semana:
+                    treino = treinos_da_semana[data_str]
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**🏃 Nome:** {treino.get('nome', 'Treino')}")
+                        st.write(f"**🎯 Tipo:** {treino.get('tipo', 'TBD')}")
+                        st.write(f"**🕐 Hora:** {treino.get('hora', 'TBD')}")
+                        st.write(f"**📍 Local:** {treino.get('local', 'TBD')}")
+                    
+                    with col2:
+                        st.write(f"**⏱️ Duração:** {treino.get('duracao', 'TBD')} min")
+                        st.write(f"**📊 Nível:** {treino.get('nivel', 'TBD')}")
+                        st.write(f"**👥 Categoria:** {treino.get('categoria', 'TBD')}")
+                    
+                    if treino.get('objetivos'):
+                        st.write("**🎯 Objetivos:**")
+                        for obj in treino['objetivos']:
+                            st.write(f"• {obj}")
+                else:
+                    st.info("📝 Nenhum treino agendado para este dia")
+        
+        # Estatísticas da semana
+        total_duracao = sum(int(treino.get('duracao', 0)) for treino in treinos_da_semana.values())
+        
+        col_stats1, col_stats2, col_stats3 = st.columns(3)
+        with col_stats1:
+            st.metric("🏃 Total de Treinos", len(treinos_da_semana))
+        with col_stats2:
+            st.metric("⏱️ Tempo Total", f"{total_duracao} min")
+        with col_stats3:
+            if len(treinos_da_semana) > 0:
+                media = total_duracao // len(treinos_da_semana)
+                st.metric("📊 Duração Média", f"{media} min")
+        
+        # Botão para gerar plano
+        if st.button("📋 Gerar Plano Semanal", type="primary"):
+            plano_semanal = {
+                "id": str(uuid.uuid4()),
+                "nome": nome_plano,
+                "tipo": "semanal",
+                "data_inicio": str(inicio_semana),
+                "data_fim": str(inicio_semana + timedelta(days=6)),
+                "treinos": treinos_da_semana,
+                "estatisticas": {
+                    "total_treinos": len(treinos_da_semana),
+                    "total_duracao": total_duracao,
+                    "duracao_media": total_duracao // len(treinos_da_semana) if len(treinos_da_semana) > 0 else 0
+                },
+                "criado_em": datetime.now().isoformat()
+            }
+            
+            # Salvar plano
+            if 'planos_treino' not in dados:
+                dados['planos_treino'] = []
+            
+            dados['planos_treino'].append(plano_semanal)
+            
+            if salvar_dados(dados):
+                st.success("✅ Plano semanal criado com sucesso!")
+                st.balloons()
+            else:
+                st.error("❌ Erro ao salvar plano semanal")
+    else:
+        st.warning("⚠️ Nenhum treino encontrado nesta semana")
+
+def criar_plano_mensal(dados):
+    """Cria plano de treino mensal"""
+    st.error("🔧 DEBUG: Função criar_plano_mensal foi chamada!")
+    st.error("🔧 ESTA MENSAGEM DEVE APARECER SE VOCÊ ESTÁ NO LOCAL CERTO!")
+    st.subheader("🗓️ Plano de Treino Mensal")
+    
+    # DEBUG: Verificar dados recebidos
+    st.error("🔧 DEBUG: Função criar_plano_mensal chamada!")
+    st.error(f"🔧 DEBUG: Tipo de dados: {type(dados)}")
+    if isinstance(dados, dict):
+        st.error(f"🔧 DEBUG: Chaves disponíveis: {list(dados.keys())}")
+        if 'jogos' in dados:
+            st.error(f"🔧 DEBUG: {len(dados['jogos'])} jogos na seção principal")
+        if 'campeonato' in dados:
+            campeonato = dados['campeonato']
+            if 'jornadas' in campeonato:
+                st.error(f"🔧 DEBUG: {len(campeonato['jornadas'])} jornadas no campeonato")
+    
+    # Seleção do mês
+    col1, col2 = st.columns(2)
+    with col1:
+        ano = st.selectbox("Ano:", range(2024, 2027), index=1)  # Default 2025
+    with col2:
+        mes = st.selectbox("Mês:", range(1, 13), index=date.today().month - 1,
+                          format_func=lambda x: [
+                              "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                              "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+                          ][x-1])
+    
+    nome_mes = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"][mes-1]
+    
+    nome_plano = st.text_input("Nome do Plano:", value=f"Plano Mensal - {nome_mes} {ano}")
+    
+    # Obter treinos do mês
+    treinos = dados.get('treinos', {})
+    treinos_do_mes = {}
+    
+    for data, treino in treinos.items():
+        try:
+            data_obj = datetime.strptime(data, '%Y-%m-%d').date()
+            if data_obj.year == ano and data_obj.month == mes:
+                treinos_do_mes[data] = treino
+        except:
+            continue
+    
+    # Obter jogos do mês (seção 'jogos' principal)
+    jogos_principais = dados.get('jogos', [])
+    for jogo in jogos_principais:
+        data_jogo = jogo.get('data')
+        if data_jogo:
+            try:
+                data_obj = datetime.strptime(data_jogo, '%Y-%m-%d').date()
+                if data_obj.year == ano and data_obj.month == mes:
+                    # Adicionar jogo como atividade
+                    adversario = jogo.get('adversario', 'Adversário')
+                    local_jogo = jogo.get('local', 'Local TBD')
+                    tipo_jogo = jogo.get('tipo', 'Jogo')
+                    
+                    treinos_do_mes[data_jogo] = {
+                        'nome': f"🏆 JOGO - Fc Pinheirense vs {adversario}",
+                        'tipo': tipo_jogo,
+                        'hora': jogo.get('hora', '16:00'),
+                        'local': local_jogo,
+                        'duracao': 90,
+                        'nivel': 'Competição',
+                        'objetivos': [f"Jogo {tipo_jogo.lower()} contra {adversario}"],
+                        'adversario': adversario,
+                        'eh_jogo': True
+                    }
+            except:
+                continue
+    
+    # Obter jogos do campeonato (jornadas)
+    campeonato = dados.get('campeonato', {})
+    jornadas = campeonato.get('jornadas', [])
+    
+    st.info(f"🔍 DEBUG: Encontradas {len(jornadas)} jornadas no campeonato")
+    
+    for jornada in jornadas:
+        jogos_jornada = jornada.get('jogos', [])
+        st.info(f"🔍 Jornada {jornada.get('numero', 'N/A')}: {len(jogos_jornada)} jogos")
+        
+        for jogo in jogos_jornada:
+            casa = jogo.get('casa', '')
+            fora = jogo.get('fora', '')
+            data_jogo = jogo.get('data', '')
+            
+            # Verificar se o FC Pinheirense está a jogar
+            if (casa == 'Fc Pinheirense' or fora == 'Fc Pinheirense'):
+                st.success(f"✅ JOGO ENCONTRADO: {casa} vs {fora} em {data_jogo}")
+                try:
+                    if data_jogo:
+                        data_obj = datetime.strptime(data_jogo, '%Y-%m-%d').date()
+                        if data_obj.year == ano and data_obj.month == mes:
+                            st.success(f"🎯 JOGO ADICIONADO AO PLANO: {data_jogo}")
+                            # Adicionar jogo do campeonato
+                            adversario = fora if casa == 'Fc Pinheirense' else casa
+                            local_jogo = "Casa" if casa == 'Fc Pinheirense' else "Fora"
+                            
+                            treinos_do_mes[data_jogo] = {
+                                'nome': f"🏆 CAMPEONATO - Fc Pinheirense vs {adversario}",
+                                'tipo': 'Campeonato',
+                                'hora': '16:00',
+                                'local': f"{local_jogo} - Jornada {jornada.get('numero', 'N/A')}",
+                                'duracao': 90,
+                                'nivel': 'Competição',
+                                'objetivos': [f"Jogo do campeonato contra {adversario}"],
+                                'adversario': adversario,
+                                'jornada': jornada.get('numero'),
+                                'eh_jogo': True
+                            }
+                except:
+                    continue
+    
+    if treinos_do_mes:
+        # Contar treinos e jogos separadamente
+        jogos = sum(1 for t in treinos_do_mes.values() if t.get('eh_jogo', False))
+        treinos_reais = len(treinos_do_mes) - jogos
+        
+        if treinos_reais > 0 and jogos > 0:
+            st.success(f"✅ {treinos_reais} treino(s) e {jogos} jogo(s) encontrados em {nome_mes} {ano}")
+        elif treinos_reais > 0:
+            st.success(f"✅ {treinos_reais} treino(s) encontrado(s) em {nome_mes} {ano}")
+        elif jogos > 0:
+            st.success(f"✅ {jogos} jogo(s) encontrado(s) em {nome_mes} {ano}")
+        
+        # Agrupar treinos por semana
+        semanas = {}
+        for data_str, treino in treinos_do_mes.items():
+            data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+            # Calcular número da semana no mês
+            primeiro_dia = date(ano, mes, 1)
+            dias_desde_inicio = (data_obj - primeiro_dia).days
+            semana_num = (dias_desde_inicio // 7) + 1
+            
+            if semana_num not in semanas:
+                semanas[semana_num] = {}
+            semanas[semana_num][data_str] = treino
+        
+        # Mostrar treinos por semana
+        for semana_num in sorted(semanas.keys()):
+            with st.expander(f"📅 Semana {semana_num} de {nome_mes}"):
+                treinos_semana = semanas[semana_num]
+                
+                for data_str in sorted(treinos_semana.keys()):
+                    treino = treinos_semana[data_str]
+                    data_formatada = datetime.strptime(data_str, '%Y-%m-%d').strftime('%d/%m/%Y')
+                    
+                    st.write(f"**🏃 {data_formatada} - {treino.get('nome', 'Treino')}**")
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"• Tipo: {treino.get('tipo', 'TBD')}")
+                        st.write(f"• Hora: {treino.get('hora', 'TBD')}")
+                    
+                    with col2:
+                        st.write(f"• Duração: {treino.get('duracao', 'TBD')} min")
+                        st.write(f"• Local: {treino.get('local', 'TBD')}")
+        
+        # Estatísticas do mês
+        total_duracao = sum(int(treino.get('duracao', 0)) for treino in treinos_do_mes.values())
+        tipos_treino = {}
+        
+        for treino in treinos_do_mes.values():
+            tipo = treino.get('tipo', 'TBD')
+            tipos_treino[tipo] = tipos_treino.get(tipo, 0) + 1
+        
+        col_stats1, col_stats2, col_stats3 = st.columns(3)
+        with col_stats1:
+            st.metric("🏃 Total de Treinos", len(treinos_do_mes))
+        with col_stats2:
+            st.metric("⏱️ Tempo Total", f"{total_duracao} min")
+        with col_stats3:
+            if len(treinos_do_mes) > 0:
+                media = total_duracao // len(treinos_do_mes)
+                st.metric("📊 Duração Média", f"{media} min")
+        
+        # Distribuição por tipo
+        if tipos_treino:
+            st.write("**📊 Distribuição por Tipo de Treino:**")
+            for tipo, quantidade in tipos_treino.items():
+                st.write(f"• {tipo}: {quantidade} treino(s)")
+        
+        # Botão para gerar plano
+        if st.button("📋 Gerar Plano Mensal", type="primary"):
+            plano_mensal = {
+                "id": str(uuid.uuid4()),
+                "nome": nome_plano,
+                "tipo": "mensal",
+                "ano": ano,
+                "mes": mes,
+                "nome_mes": nome_mes,
+                "treinos": treinos_do_mes,
+                "semanas": semanas,
+                "estatisticas": {
+                    "total_treinos": len(treinos_do_mes),
+                    "total_duracao": total_duracao,
+                    "duracao_media": total_duracao // len(treinos_do_mes) if len(treinos_do_mes) > 0 else 0,
+                    "tipos_treino": tipos_treino
+                },
+                "criado_em": datetime.now().isoformat()
+            }
+            
+            # Salvar plano
+            if 'planos_treino' not in dados:
+                dados['planos_treino'] = []
+            
+            dados['planos_treino'].append(plano_mensal)
+            
+            if salvar_dados(dados):
+                st.success("✅ Plano mensal criado com sucesso!")
+                st.balloons()
+            else:
+                st.error("❌ Erro ao salvar plano mensal")
+    else:
+        st.warning(f"⚠️ Nenhum treino encontrado em {nome_mes} {ano}")
+
+def enviar_planos_email(dados):
+    """Enviar planos de treino por email"""
+    st.subheader("📧 Enviar Planos de Treino por Email")
+    
+    # Verificar se há planos criados
+    planos = dados.get('planos_treino', [])
+    
+    if not planos:
+        st.warning("⚠️ Nenhum plano de treino criado ainda")
+        st.info("💡 Crie planos semanais ou mensais nas abas anteriores antes de enviar por email")
+        return
+    
+    st.success(f"✅ {len(planos)} plano(s) de treino disponível(eis)")
+    
+    # Selecionar plano para enviar
+    opcoes_planos = []
+    for plano in planos:
+        if plano.get('tipo') == 'semanal':
+            inicio = plano.get('data_inicio', '')
+            fim = plano.get('data_fim', '')
+            opcoes_planos.append(f"📆 {plano.get('nome', 'Plano Semanal')} ({inicio} a {fim})")
+        else:  # mensal
+            nome_mes = plano.get('nome_mes', '')
+            ano = plano.get('ano', '')
+            opcoes_planos.append(f"🗓️ {plano.get('nome', 'Plano Mensal')} ({nome_mes} {ano})")
+    
+    plano_selecionado_idx = st.selectbox("Selecione o plano para enviar:", range(len(opcoes_planos)), 
+                                       format_func=lambda x: opcoes_planos[x])
+    plano_selecionado = planos[plano_selecionado_idx]
+    
+    # Mostrar detalhes do plano selecionado
+    with st.expander("📋 Detalhes do Plano Selecionado"):
+        if plano_selecionado.get('tipo') == 'semanal':
+            st.write(f"**📆 Tipo:** Plano Semanal")
+            st.write(f"**📅 Período:** {plano_selecionado.get('data_inicio')} a {plano_selecionado.get('data_fim')}")
+        else:
+            st.write(f"**🗓️ Tipo:** Plano Mensal")
+            st.write(f"**📅 Período:** {plano_selecionado.get('nome_mes')} {plano_selecionado.get('ano')}")
+        
+        stats = plano_selecionado.get('estatisticas', {})
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("🏃 Total Treinos", stats.get('total_treinos', 0))
+        with col2:
+            st.metric("⏱️ Tempo Total", f"{stats.get('total_duracao', 0)} min")
+        with col3:
+            st.metric("📊 Duração Média", f"{stats.get('duracao_media', 0)} min")
+    
+    # Opções de destinatários
+    jogadores_dados = dados.get('jogadores', [])
+    opcoes_destinatarios = ["🎯 Todos os jogadores", "👥 Jogadores específicos", "⚽ Jogadores com email"]
+    
+    opcao_envio = st.radio("Para quem enviar:", opcoes_destinatarios)
+    
+    emails_destinatarios = []
+    
+    if opcao_envio == "🎯 Todos os jogadores":
+        for jogador in jogadores_dados:
+            if jogador.get('email'):
+                emails_destinatarios.append({
+                    'nome': jogador.get('nome'),
+                    'email': jogador.get('email')
+                })
+    
+    elif opcao_envio == "👥 Jogadores específicos":
+        nomes_jogadores = [j.get('nome') for j in jogadores_dados if j.get('email')]
+        if nomes_jogadores:
+            jogadores_selecionados = st.multiselect("Selecione os jogadores:", nomes_jogadores)
+            for nome in jogadores_selecionados:
+                for jogador in jogadores_dados:
+                    if jogador.get('nome') == nome and jogador.get('email'):
+                        emails_destinatarios.append({
+                            'nome': jogador.get('nome'),
+                            'email': jogador.get('email')
+                        })
+        else:
+            st.warning("⚠️ Nenhum jogador tem email cadastrado")
+    
+    elif opcao_envio == "⚽ Jogadores com email":
+        for jogador in jogadores_dados:
+            if jogador.get('email'):
+                emails_destinatarios.append({
+                    'nome': jogador.get('nome'),
+                    'email': jogador.get('email')
+                })
+    
+    # Mostrar destinatários
+    if emails_destinatarios:
+        st.write(f"**📧 Destinatários ({len(emails_destinatarios)}):**")
+        for jogador in emails_destinatarios:
+            st.write(f"• {jogador['nome']} ({jogador['email']})")
+        
+        # Botão de envio
+        if st.button("📧 Enviar Plano de Treino", type="primary"):
+            try:
+                if not verificar_sistema_email():
+                    return
+                
+                html_plano = gerar_email_plano_treino(plano_selecionado)
+                
+                if plano_selecionado.get('tipo') == 'semanal':
+                    assunto = f"📆 PLANO SEMANAL - {plano_selecionado.get('nome', 'Plano de Treino')}"
+                else:
+                    assunto = f"🗓️ PLANO MENSAL - {plano_selecionado.get('nome', 'Plano de Treino')}"
+                
+                sucessos = 0
+                erros = 0
+                
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                for i, jogador in enumerate(emails_destinatarios):
+                    status_text.text(f"Enviando para {jogador['nome']}...")
+                    
+                    sucesso, mensagem = email_system.enviar_email(
+                        jogador['email'],
+                        assunto,
+                        html_plano,
+                        jogador['nome']
+                    )
+                    
+                    if sucesso:
+                        sucessos += 1
+                    else:
+                        erros += 1
+                    
+                    progress_bar.progress((i + 1) / len(emails_destinatarios))
+                
+                status_text.empty()
+                progress_bar.empty()
+                
+                if sucessos > 0:
+                    st.success(f"✅ {sucessos} planos enviados com sucesso!")
+                if erros > 0:
+                    st.error(f"❌ {erros} emails falharam")
+                    
+            except Exception as e:
+                st.error(f"❌ Erro ao enviar emails: {e}")
+    else:
+        st.error("❌ Nenhum destinatário com email válido")
+
+def gerar_pdf_planos_treino(dados):
+    """Gera PDF dos planos de treino criados"""
+    st.subheader("📄 Gerar PDF dos Planos de Treino")
+    
+    planos_treino = dados.get('planos_treino', [])
+    
+    if not planos_treino:
+        st.warning("⚠️ Nenhum plano de treino criado ainda")
+        st.info("💡 Crie planos de treino nas abas 'Plano Semanal' ou 'Plano Mensal' primeiro")
+        return
+    
+    # Selecionar plano para gerar PDF
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        opcoes_planos = {}
+        for plano in planos_treino:
+            tipo_emoji = "📆" if plano.get('tipo') == 'semanal' else "🗓️"
+            label = f"{tipo_emoji} {plano.get('nome', 'Plano sem nome')} - {plano.get('tipo', 'Tipo desconhecido').title()}"
+            opcoes_planos[label] = plano
+        
+        plano_selecionado_label = st.selectbox(
+            "Escolha o plano para gerar PDF:",
+            list(opcoes_planos.keys())
+        )
+        
+        plano_selecionado = opcoes_planos[plano_selecionado_label]
+    
+    with col2:
+        incluir_estatisticas = st.checkbox("📊 Incluir Estatísticas", value=True)
+        incluir_detalhes = st.checkbox("🔍 Incluir Detalhes dos Exercícios", value=True)
+    
+    # Visualizar plano selecionado
+    with st.expander("👁️ Visualizar Plano Selecionado"):
+        if plano_selecionado.get('tipo') == 'semanal':
+            mostrar_preview_plano_semanal(plano_selecionado)
+        else:
+            mostrar_preview_plano_mensal(plano_selecionado)
+    
+    # Botão para gerar PDF
+    col_botao1, col_botao2, col_botao3 = st.columns(3)
+    
+    with col_botao1:
+        if st.button("📄 Gerar PDF", type="primary", use_container_width=True):
+            nome_arquivo = f"Plano_Treino_{plano_selecionado.get('nome', 'Plano').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            pedir_pdf(
+                f"Plano {plano_selecionado.get('nome', '')}", 'criar_pdf_plano_treino',
+                plano_selecionado, incluir_estatisticas, incluir_detalhes, nome_ficheiro=nome_arquivo
+            )
+    
+    with col_botao2:
+        # Botão para gerar PDF Calendário 
+        if st.button("🗓️ PDF Calendário", type="secondary", use_container_width=True):
+            try:
+                with st.spinner("🔄 Gerando calendário VISUAL IDÊNTICO ao email..."):
+                    # Carregar todos os dados para o calendário
+                    dados = carregar_dados()
+                    plano_adaptado = {
+                        'treinos': dados.get('treinos', {}),
+                        'jogos': dados.get('jogos', []),
+                        'tipo': 'mensal'
+                    }
+                    nome_arquivo = criar_calendario_pdf_mensal(plano_adaptado)
+                    
+                    if nome_arquivo and nome_arquivo.endswith('.html'):
+                        st.success("✅ Calendário HTML gerado com FORMATO IDÊNTICO ao email!")
+                        
+                        # Ler o arquivo HTML gerado
+                        with open(nome_arquivo, 'r', encoding='utf-8') as html_file:
+                            html_data = html_file.read()
+                        
+                        # Botão de download HTML
+                        st.download_button(
+                            label="💾 Baixar HTML (Para Converter em PDF)",
+                            data=html_data,
+                            file_name=nome_arquivo,
+                            mime="text/html",
+                            use_container_width=True
+                        )
+                        
+                        # Instruções para converter para PDF
+                        st.info("📋 **INSTRUÇÕES para PDF:**")
+                        st.info("1. 📥 Baixe o arquivo HTML acima")
+                        st.info("2. 🌐 Abra o arquivo no navegador")
+                        st.info("3. 🖨️ Pressione Ctrl+P (Imprimir)")
+                        st.info("4. 📄 Escolha 'Salvar como PDF'")
+                        st.info("5. ⚙️ Configure: Paisagem + Sem margens + Gráficos de fundo")
+                        st.info("6. ✅ PDF será IDÊNTICO ao email!")
+                        
+                        # Mostrar prévia
+                        st.markdown("### 👁️ Prévia do Calendário:")
+                        st.components.v1.html(html_data, height=600, scrolling=True)
+                    else:
+                        st.error("❌ Erro ao gerar PDF de calendário")
+            except Exception as e:
+                st.error(f"❌ Erro ao gerar calendário: {str(e)}")
+    
+    with col_botao3:
+        if st.button("🗑️ Eliminar Plano", type="secondary", use_container_width=True):
+            if st.session_state.get('confirmar_eliminacao'):
+                # Remover plano
+                dados['planos_treino'] = [p for p in dados['planos_treino'] if p.get('id') != plano_selecionado.get('id')]
+                if salvar_dados(dados):
+                    st.success("✅ Plano eliminado com sucesso!")
+                    st.rerun()
+                else:
+                    st.error("❌ Erro ao eliminar plano")
+                st.session_state.confirmar_eliminacao = False
+            else:
+                st.session_state.confirmar_eliminacao = True
+                st.warning("⚠️ Clique novamente para confirmar a eliminação")
+
+def mostrar_preview_plano_semanal(plano):
+    """Mostra preview do plano semanal"""
+    st.write(f"**📆 {plano.get('nome', 'Plano Semanal')}**")
+    st.write(f"**📅 Período:** {plano.get('data_inicio')} a {plano.get('data_fim')}")
+    
+    treinos = plano.get('treinos', {})
+    if treinos:
+        st.write(f"**🏃 Total de Treinos:** {len(treinos)}")
+        
+        dias_semana = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+        
+        for data_str in sorted(treinos.keys()):
+            try:
+                data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+                dia_semana = dias_semana[data_obj.weekday()]
+                data_formatada = data_obj.strftime('%d/%m')
+                
+                treino = treinos[data_str]
+                st.write(f"• **{dia_semana} ({data_formatada}):** {treino.get('nome', 'Treino')} - {treino.get('tipo', 'TBD')}")
+            except:
+                continue
+    
+    # Estatísticas
+    stats = plano.get('estatisticas', {})
+    if stats:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("🏃 Treinos", stats.get('total_treinos', 0))
+        with col2:
+            st.metric("⏱️ Tempo Total", f"{stats.get('total_duracao', 0)} min")
+        with col3:
+            st.metric("📊 Duração Média", f"{stats.get('duracao_media', 0)} min")
+
+def mostrar_preview_plano_mensal(plano):
+    """Mostra preview do plano mensal"""
+    st.write(f"**🗓️ {plano.get('nome', 'Plano Mensal')}**")
+    
+    treinos = plano.get('treinos', {})
+    stats = plano.get('estatisticas', {})
+    
+    if treinos:
+        st.write(f"**🏃 Total de Treinos:** {len(treinos)}")
+        
+        # Agrupar por semana
+        semanas = {}
+        for data_str in treinos.keys():
+            try:
+                data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+                semana_num = ((data_obj.day - 1) // 7) + 1
+                if semana_num not in semanas:
+                    semanas[semana_num] = 0
+                semanas[semana_num] += 1
+            except:
+                continue
+        
+        for semana_num in sorted(semanas.keys()):
+            st.write(f"• **Semana {semana_num}:** {semanas[semana_num]} treino(s)")
+    
+    # Estatísticas
+    if stats:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("🏃 Treinos", stats.get('total_treinos', 0))
+        with col2:
+            st.metric("⏱️ Tempo Total", f"{stats.get('total_duracao', 0)} min")
+        with col3:
+            st.metric("📊 Duração Média", f"{stats.get('duracao_media', 0)} min")
+
+def _semanas_plano(treinos):
+    """{semana do mês (1-5): {data: treino}} dos treinos com data válida"""
+    semanas = {}
+    for data_str, treino in treinos.items():
+        try:
+            data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            continue
+        semanas.setdefault(((data_obj.day - 1) // 7) + 1, {})[data_str] = treino
+    return semanas
+
+def _grupos_plano(plano):
+    """[(nome da secção, {data: treino})]: uma secção por sessão nos planos semanais, por semana nos mensais"""
+    semanas = _semanas_plano(plano.get('treinos', {}))
+    if plano.get('tipo') == 'semanal':
+        treinos = {data_str: treino for semana in semanas.values() for data_str, treino in semana.items()}
+        return [(f"sessao_{data_str}", {data_str: treinos[data_str]}) for data_str in sorted(treinos)]
+    return [(f"semana_{semana_num}", semanas[semana_num]) for semana_num in sorted(semanas)]
+
+def _estilos_plano_treino():
+    """Estilos do PDF do plano de treino: título, secção e texto normal"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=12,
+        spaceBefore=20,
+        textColor=colors.darkgreen
+    )
+    
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        spaceBefore=3
+    )
+    
+    return title_style, heading_style, normal_style
+
+def _capa_plano_treino(plano, incluir_estatisticas, gerado_em):
+    """Secção de capa: título, informações gerais, estatísticas e rodapé com a data de geração"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    from reportlab.lib.enums import TA_CENTER
+    
+    title_style, heading_style, normal_style = _estilos_plano_treino()
+    story = []
+    
+    # Título
+    tipo_emoji = "📆" if plano.get('tipo') == 'semanal' else "🗓️"
+    titulo = f"{tipo_emoji} {plano.get('nome', 'Plano de Treino')}"
+    story.append(Paragraph(titulo, title_style))
+    story.append(Spacer(1, 12))
+    
+    # Informações básicas
+    story.append(Paragraph("ℹ️ INFORMAÇÕES GERAIS", heading_style))
+    
+    info_data = [
+        ["Tipo:", plano.get('tipo', 'Desconhecido').title()],
+        ["Criado em:", datetime.fromisoformat(plano.get('criado_em', datetime.now().isoformat())).strftime('%d/%m/%Y às %H:%M')]
+    ]
+    
+    if plano.get('tipo') == 'semanal':
+        info_data.extend([
+            ["Data de Início:", plano.get('data_inicio', 'N/A')],
+            ["Data de Fim:", plano.get('data_fim', 'N/A')]
+        ])
+    
+    info_table = Table(info_data, colWidths=[4*cm, 12*cm])
+    info_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]))
+    
+    story.append(info_table)
+    story.append(Spacer(1, 20))
+    
+    # Estatísticas (se solicitadas)
+    if incluir_estatisticas and plano.get('estatisticas'):
+        story.append(Paragraph("📊 ESTATÍSTICAS", heading_style))
+        
+        stats = plano.get('estatisticas', {})
+        stats_data = [
+            ["Total de Treinos:", str(stats.get('total_treinos', 0))],
+            ["Tempo Total:", f"{stats.get('total_duracao', 0)} minutos"],
+            ["Duração Média:", f"{stats.get('duracao_media', 0)} minutos"]
+        ]
+        
+        stats_table = Table(stats_data, colWidths=[4*cm, 12*cm])
+        stats_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        
+        story.append(stats_table)
+        story.append(Spacer(1, 20))
+    
+    # Rodapé
+    story.append(Spacer(1, 30))
+    story.append(Paragraph("─" * 50, normal_style))
+    rodape = f"Documento gerado em {gerado_em} - FC Pinheirense 2025"
+    story.append(Paragraph(rodape, ParagraphStyle('Rodape', parent=normal_style, alignment=TA_CENTER, fontSize=8)))
+    return story
+
+def _treinos_plano_treino(treinos, semanal, incluir_detalhes, titulo):
+    """Secção de treinos: uma sessão (plano semanal) ou uma semana (plano mensal), com o título na primeira"""
+    from reportlab.platypus import Paragraph
+    
+    _, heading_style, normal_style = _estilos_plano_treino()
+    story = [Paragraph(titulo, heading_style)] if titulo else []
+    if semanal:
+        return adicionar_treinos_semanais_pdf(story, treinos, incluir_detalhes, normal_style)
+    return adicionar_treinos_mensais_pdf(story, treinos, incluir_detalhes, normal_style)
+
+@medido('pdf')
+def criar_pdf_plano_treino(plano, incluir_estatisticas=True, incluir_detalhes=True):
+    """Cria PDF do plano de treino a partir de secções em cache (capa e uma por semana ou sessão):
+    alterar um treino só volta a desenhar a secção onde ele está"""
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+        from reportlab.lib.units import cm
+        
+        def criar_documento(saida):
+            return SimpleDocTemplate(
+                saida,
+                pagesize=A4,
+                rightMargin=2*cm,
+                leftMargin=2*cm,
+                topMargin=2*cm,
+                bottomMargin=2*cm
+            )
+        
+        # Capa só com os campos que mostra (a data de geração muda a capa uma vez por dia)
+        capa = {campo: plano[campo] for campo in ('nome', 'tipo', 'criado_em', 'data_inicio', 'data_fim', 'estatisticas') if campo in plano}
+        secoes = [SecaoPDF('capa', _capa_plano_treino, (capa, incluir_estatisticas, datetime.now().strftime('%d/%m/%Y')))]
+        
+        # Treinos
+        semanal = plano.get('tipo') == 'semanal'
+        for ordem, (nome, treinos) in enumerate(_grupos_plano(plano)):
+            titulo = "🏃 TREINOS PROGRAMADOS" if ordem == 0 else None
+            secoes.append(SecaoPDF(nome, _treinos_plano_treino, (treinos, semanal, incluir_detalhes, titulo)))
+        
+        pdf_bytes, _ = compor_pdf('criar_pdf_plano_treino', secoes, criar_documento)
+        return BytesIO(pdf_bytes)
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao criar PDF: {str(e)}")
+        return None
+
+def adicionar_treinos_semanais_pdf(story, treinos, incluir_detalhes, normal_style):
+    """Adiciona treinos semanais ao PDF"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    
+    dias_semana = ["Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira", "Sexta-feira", "Sábado", "Domingo"]
+    
+    for data_str in sorted(treinos.keys()):
+        try:
+            data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
+            dia_semana = dias_semana[data_obj.weekday()]
+            data_formatada = data_obj.strftime('%d/%m/%Y')
+            
+            treino = treinos[data_str]
+            
+            # Cabeçalho do treino
+            titulo_treino = f"📅 {dia_semana} - {data_formatada}"
+            story.append(Paragraph(titulo_treino, ParagraphStyle('TreinoTitulo', parent=normal_style, fontSize=12, textColor=colors.darkblue, spaceBefore=15)))
+            
+            # Informações básicas do treino
+            treino_data = [
+                ["Nome:", treino.get('nome', 'Treino')],
+                ["Tipo:", treino.get('tipo', 'TBD')],
+                ["Hora:", treino.get('hora', 'TBD')],
+                ["Local:", treino.get('local', 'TBD')],
+                ["Duração:", f"{treino.get('duracao', 'TBD')} minutos"],
+                ["Nível:", treino.get('nivel', 'TBD')],
+                ["Categoria:", treino.get('categoria', 'TBD')]
+            ]
+            
+            treino_table = Table(treino_data, colWidths=[3*cm, 13*cm])
+            treino_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.lightgreen),
+                ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ]))
+            
+            story.append(treino_table)
+            
+            # Objetivos
+            if treino.get('objetivos') and incluir_detalhes:
+                story.append(Paragraph("🎯 Objetivos:", ParagraphStyle('ObjetivosTitulo', parent=normal_style, fontSize=10, textColor=colors.darkgreen, spaceBefore=10)))
+                for obj in treino['objetivos']:
+                    story.append(Paragraph(f"• {obj}", normal_style))
+            
+            # Exercícios
+            if treino.get('exercicios') and incluir_detalhes:
+                story.append(Paragraph("💪 Exercícios:", ParagraphStyle('ExerciciosTitulo', parent=normal_style, fontSize=10, textColor=colors.darkgreen, spaceBefore=10)))
+                for exercicio in treino['exercicios']:
+                    exerc_text = f"• {exercicio.get('nome', 'Exercício')} - {exercicio.get('duracao', 'N/A')} min"
+                    if exercicio.get('descricao'):
+                        exerc_text += f" ({exercicio['descricao']})"
+                    story.append(Paragraph(exerc_text, normal_style))
+            
+            story.append(Spacer(1, 15))
+            
+        except Exception as e:
+            continue
+    
+    return story
+
+def adicionar_treinos_mensais_pdf(story, treinos, incluir_detalhes, normal_style):
+    """Adiciona treinos mensais ao PDF"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph, Spacer
+    
+    # Agrupar por semana
+    semanas = _semanas_plano(treinos)
+    
+    for semana_num in sorted(semanas.keys()):
+        story.append(Paragraph(f"📅 SEMANA {semana_num}", ParagraphStyle('SemanaTitulo', parent=normal_style, fontSize=12, textColor=colors.darkblue, spaceBefore=20)))
+        
+        treinos_semana = semanas[semana_num]
+        
+        for data_str in sorted(treinos_semana.keys()):
+            treino = treinos_semana[data_str]
+            data_formatada = datetime.strptime(data_str, '%Y-%m-%d').strftime('%d/%m/%Y')
+            
+            # Informações do treino
+            treino_info = f"🏃 {data_formatada} - {treino.get('nome', 'Treino')} ({treino.get('tipo', 'TBD')})"
+            if treino.get('hora'):
+                treino_info += f" às {treino['hora']}"
+            if treino.get('duracao'):
+                treino_info += f" - {treino['duracao']} min"
+            
+            story.append(Paragraph(treino_info, normal_style))
+            
+            if incluir_detalhes and treino.get('objetivos'):
+                obj_text = "  🎯 " + ", ".join(treino['objetivos'])
+                story.append(Paragraph(obj_text, ParagraphStyle('ObjetivosInline', parent=normal_style, fontSize=9, leftIndent=20)))
+        
+        story.append(Spacer(1, 10))
+    
+    return story
+
+@medido('pdf')
+def gerar_pdf_calendario_mensal(ano, mes, dados):
+    """Gera PDF do calendário mensal de treinos; devolve (pdf_bytes, nome_ficheiro)"""
+    try:
+        # Grelha do mês (em cache por versão dos treinos do mês), desenhada com o tema de listagem mensal
+        grelha = grelha_mensal(IndiceDatas(dados.get('treinos', {})), ano, mes)
+        pdf_bytes = pdf_calendario(grelha, 'lista_mensal')
+        
+        nome_arquivo = f"Calendario_Mensal_{NOMES_MESES[mes-1]}_{ano}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        return pdf_bytes, nome_arquivo
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF do calendário mensal: {str(e)}")
+        return None, None
+
+@medido('pdf')
+def gerar_pdf_calendario_semanal(data_base, dados):
+    """Gera PDF do calendário semanal de treinos; devolve (pdf_bytes, nome_ficheiro)"""
+    try:
+        # Semana (segunda a domingo) da data base, desenhada com o tema de listagem semanal
+        inicio_semana = data_base - timedelta(days=data_base.weekday())
+        grelha = grelha_semanal(IndiceDatas(dados.get('treinos', {})), inicio_semana)
+        pdf_bytes = pdf_calendario(grelha, 'lista_semanal')
+        
+        nome_arquivo = f"Calendario_Semanal_{inicio_semana.strftime('%d%m%Y')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        return pdf_bytes, nome_arquivo
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF do calendário semanal: {str(e)}")
+        return None, None
+
+@medido('pdf')
+def gerar_pdf_calendario_anual(ano, dados, em_ficheiro=False):
+    """Gera PDF com os doze meses do ano (um mês por página); devolve (pdf, nome_ficheiro)"""
+    try:
+        # Meses desenhados à medida que o documento avança; com `em_ficheiro` o PDF fica num ficheiro temporário
+        indice = IndiceDatas(dados.get('treinos', {}))
+        nome_arquivo = f"Calendario_Anual_{ano}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        if em_ficheiro:
+            pdf = pdf_em_ficheiro(lambda caminho: documento_calendario(caminho, 'lista_mensal'), flowables_ano(indice, ano))
+            return pdf, nome_arquivo
+        
+        buffer = BytesIO()
+        documento_calendario(buffer, 'lista_mensal').build(list(flowables_ano(indice, ano)))
+        return buffer.getvalue(), nome_arquivo
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF do calendário anual: {str(e)}")
+        return None, None
+
+def gerar_pdf_planos_visuais(dados):
+    """Gera PDF dos planos de treino em formato de calendário visual"""
+    st.subheader("📄 Gerar Calendário Visual em PDF")
+    st.info("💡 Gera um calendário tradicional com todos os dias do mês/semana, mostrando treinos e jogos em cada dia - perfeito para afixar!")
+    
+    planos_treino = dados.get('planos_treino', [])
+    
+    if not planos_treino:
+        st.warning("⚠️ Nenhum plano de treino criado ainda")
+        st.info("💡 Crie planos de treino nas abas 'Plano Semanal' ou 'Plano Mensal' primeiro")
+        return
+    
+    # Selecionar plano para gerar PDF
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        opcoes_planos = {}
+        for plano in planos_treino:
+            tipo_emoji = "📆" if plano.get('tipo') == 'semanal' else "🗓️"
+            label = f"{tipo_emoji} {plano.get('nome', 'Plano sem nome')} - {plano.get('tipo', 'Tipo desconhecido').title()}"
+            opcoes_planos[label] = plano
+        
+        plano_selecionado_label = st.selectbox(
+            "Escolha o plano para gerar calendário PDF:",
+            list(opcoes_planos.keys())
+        )
+        
+        plano_selecionado = opcoes_planos[plano_selecionado_label]
+    
+    with col2:
+        include_games = st.checkbox("🏆 Incluir Jogos", value=True, help="Incluir jogos programados no calendário")
+    
+    # Configurações do calendário
+    with st.expander("⚙️ Configurações do Calendário"):
+        col_config1, col_config2 = st.columns(2)
+        
+        with col_config1:
+            show_weekend_different = st.checkbox("🎨 Destacar Fins de Semana", value=True)
+            show_time = st.checkbox("🕐 Mostrar Horários", value=True)
+        
+        with col_config2:
+            compact_mode = st.checkbox("📝 Modo Compacto", value=False, help="Menos detalhes, mais dias por página")
+            large_font = st.checkbox("🔍 Fonte Grande", value=False, help="Para melhor legibilidade")
+        
+        tema = st.selectbox("🖌️ Tema", list(TEMAS_PLANO), format_func=TEMAS_PLANO.get)
+    
+    # Preview do calendário selecionado
+    with st.expander("👁️ Preview do Calendário"):
+        mostrar_preview_calendario_visual(plano_selecionado, dados, include_games)
+    
+    # Botão para gerar PDF
+    if st.button("📅 Gerar Calendário PDF", type="primary", use_container_width=True):
+        tipo = plano_selecionado.get('tipo', 'plano')
+        nome_limpo = plano_selecionado.get('nome', 'Calendario').replace(' ', '_')
+        nome_arquivo = f"Calendario_{tipo.title()}_{nome_limpo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        pedir_pdf(
+            f"Calendário {plano_selecionado.get('nome', '')}", 'criar_calendario_pdf',
+            plano_selecionado, dados, include_games, show_weekend_different, show_time, compact_mode, large_font,
+            tema=tema, nome_ficheiro=nome_arquivo
+        )
+
+def mostrar_preview_calendario_visual(plano, dados, include_games):
+    """Mostra preview do calendário visual"""
+    if plano.get('tipo') == 'semanal':
+        st.write("**📆 Preview do Calendário Semanal:**")
+        
+        # Simular uma semana
+        inicio_semana = datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').date()
+        
+        # Criar uma tabela simples para preview
+        dias_semana = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+        
+        # Cabeçalho
+        cols = st.columns(7)
+        for i, dia in enumerate(dias_semana):
+            with cols[i]:
+                st.write(f"**{dia}**")
+        
+        # Dias com conteúdo
+        cols = st.columns(7)
+        treinos_semana = plano.get('treinos', {})
+        
+        for i in range(7):
+            data_atual = inicio_semana + timedelta(days=i)
+            data_str = data_atual.strftime('%Y-%m-%d')
+            
+            with cols[i]:
+                st.write(f"**{data_atual.day}**")
+                
+                if data_str in treinos_semana:
+                    treino = treinos_semana[data_str]
+                    st.write(f"🏃 {treino.get('nome', 'Treino')[:10]}...")
+                    if treino.get('hora'):
+                        st.write(f"🕐 {treino.get('hora')}")
+                
+                # Verificar jogos
+                if include_games:
+                    jogos = dados.get('jogos', [])
+                    for jogo in jogos:
+                        if jogo.get('data') == data_str:
+                            st.write(f"🏆 vs {jogo.get('adversario', 'Time')[:8]}...")
+                            break
+                
+                if data_str not in treinos_semana and not any(j.get('data') == data_str for j in dados.get('jogos', [])):
+                    st.write("📝 ---")
+    
+    else:
+        st.write("**🗓️ Preview do Calendário Mensal:**")
+        st.info("Será gerado um calendário tradicional com grade de todos os dias do mês, mostrando treinos e jogos em cada data correspondente.")
+
+@medido('pdf')
+def criar_calendario_pdf(plano, dados, include_games, show_weekend_different, show_time, compact_mode, large_font,
+                         tema='profissional'):
+    """Cria PDF do calendário visual do plano (semanal ou mensal) numa página, com um tema do motor de calendários"""
+    try:
+        jogos = dados.get('jogos', []) if include_games else []
+        grelha = grelha_do_plano(plano, IndiceDatas(plano.get('treinos', {}), jogos))
+        
+        opcoes = {
+            'destacar_fim_de_semana': show_weekend_different,
+            'mostrar_hora': show_time,
+            'compacto': compact_mode,
+            'fonte_grande': large_font,
+        }
+        return BytesIO(pdf_calendario(grelha, tema, opcoes, plano=plano.get('nome')))
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao criar calendário PDF profissional: {str(e)}")
+        return None
+
+def criar_calendario_mensal_pdf_bonito(story, plano, dados, include_games, show_weekend_different, show_time, compact_mode, *estilos):
+    """Acrescenta à story o calendário mensal do plano com o tema 'bonito' (os estilos do tema substituem `estilos`)"""
+    jogos = dados.get('jogos', []) if include_games else []
+    grelha = grelha_mensal(IndiceDatas(plano.get('treinos', {}), jogos), *mes_do_plano(plano))
+    opcoes = {'destacar_fim_de_semana': show_weekend_different, 'mostrar_hora': show_time, 'compacto': compact_mode}
+    story.extend(flowables_calendario(grelha, 'bonito', opcoes, plano=plano.get('nome')))
+    return story
+
+def _estilos_plano_visual(semanal):
+    """Estilos do PDF visual do plano (azul nos semanais, laranja nos mensais)"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    cor_plano = colors.darkblue if semanal else colors.Color(1, 0.34, 0.13)  # #FF5722
+    
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        textColor=colors.white,
+        backColor=cor_plano
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=15,
+        alignment=TA_CENTER,
+        textColor=colors.white,
+        backColor=cor_plano
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=10,
+        spaceBefore=15,
+        textColor=cor_plano
+    )
+    
+    treino_style = ParagraphStyle(
+        'TreinoStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        backColor=colors.Color(0.91, 0.96, 0.91),  # #e8f5e8
+        leftIndent=10,
+        borderPadding=8
+    )
+    
+    sem_treino_style = ParagraphStyle(
+        'SemTreinoStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        backColor=colors.Color(1, 0.95, 0.8),  # #fff3cd
+        leftIndent=10,
+        borderPadding=8
+    )
+    
+    return title_style, subtitle_style, heading_style, treino_style, sem_treino_style
+
+def _capa_plano_visual(plano, total_treinos, gerado_em):
+    """Secção de capa do PDF visual: cabeçalho colorido, nome, informações gerais e rodapé com a data de geração"""
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    
+    title_style, subtitle_style, heading_style, _, _ = _estilos_plano_visual(plano.get('tipo') == 'semanal')
+    story = []
+    
+    # Cabeçalho com fundo colorido
+    if plano.get('tipo') == 'semanal':
+        story.append(Paragraph("📆 PLANO SEMANAL DE TREINOS", title_style))
+    else:
+        story.append(Paragraph("🗓️ PLANO MENSAL DE TREINOS", title_style))
+    
+    story.append(Paragraph("F.C. PINHEIRENSE", subtitle_style))
+    story.append(Spacer(1, 20))
+    
+    # Nome do plano
+    story.append(Paragraph(f"📋 {plano.get('nome', 'Plano de Treino')}", heading_style))
+    
+    # Informações gerais em caixa
+    if plano.get('tipo') == 'semanal':
+        inicio = datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').strftime('%d/%m/%Y')
+        fim = datetime.strptime(plano.get('data_fim'), '%Y-%m-%d').strftime('%d/%m/%Y')
+        
+        info_data = [
+            [f"📅 Período: {inicio} a {fim}"],
+            [f"🏃 Total de Treinos: {plano.get('estatisticas', {}).get('total_treinos', 0)}"],
+            [f"⏱️ Tempo Total: {plano.get('estatisticas', {}).get('total_duracao', 0)} minutos"],
+            [f"📊 Duração Média: {plano.get('estatisticas', {}).get('duracao_media', 0)} minutos por treino"]
+        ]
+    else:
+        info_data = [
+            [f"🗓️ Mês: {plano.get('nome_mes', '')} {plano.get('ano', '')}"],
+            [f"🏃 Total de Treinos: {total_treinos}"],
+            [f"📅 Gerado em: {gerado_em}"]
+        ]
+    
+    info_table = Table(info_data, colWidths=[16*cm])
+    info_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.96, 0.96, 0.96)),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    
+    story.append(info_table)
+    
+    # Rodapé
+    story.append(Spacer(1, 30))
+    
+    footer_data = [
+        ["F.C. PINHEIRENSE - Plano gerado automaticamente pelo App Treinador"],
+        [f"Data de geração: {gerado_em}"]
+    ]
+    
+    footer_table = Table(footer_data, colWidths=[16*cm])
+    footer_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.4, 0.4, 0.4)),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    
+    story.append(footer_table)
+    return story
+
+def _treinos_plano_visual(plano, semanal, titulo):
+    """Secção de treinos do PDF visual: a semana inteira (plano semanal) ou uma semana do mês (plano mensal)"""
+    _, _, heading_style, treino_style, sem_treino_style = _estilos_plano_visual(semanal)
+    if semanal:
+        return adicionar_treinos_semanais_visual_pdf([], plano, treino_style, sem_treino_style, heading_style)
+    return adicionar_treinos_mensais_visual_pdf([], plano, treino_style, heading_style, titulo=titulo)
+
+def _jogos_plano_visual(periodo, jogos, semanal):
+    """Secção de jogos do PDF visual (jogos já filtrados para o período do plano)"""
+    _, _, heading_style, treino_style, _ = _estilos_plano_visual(semanal)
+    return adicionar_jogos_plano_pdf([], periodo, {'jogos': jogos}, heading_style, treino_style)
+
+@medido('pdf')
+def criar_pdf_plano_visual(plano, include_games, dados):
+    """Cria PDF do plano visual (formato similar ao email) a partir de secções em cache
+    (capa, treinos por semana e jogos): alterar um treino só volta a desenhar a semana onde ele está"""
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+        from reportlab.lib.units import cm
+        
+        def criar_documento(saida):
+            return SimpleDocTemplate(
+                saida,
+                pagesize=A4,
+                rightMargin=1.5*cm,
+                leftMargin=1.5*cm,
+                topMargin=1.5*cm,
+                bottomMargin=1.5*cm
+            )
+        
+        semanal = plano.get('tipo') == 'semanal'
+        treinos = plano.get('treinos', {})
+        periodo = {campo: plano[campo] for campo in ('tipo', 'data_inicio', 'data_fim', 'ano', 'mes') if campo in plano}
+        capa = {campo: plano[campo] for campo in ('nome', 'nome_mes', 'estatisticas') if campo in plano}
+        capa.update(periodo)
+        secoes = [SecaoPDF('capa', _capa_plano_visual, (capa, len(treinos), datetime.now().strftime('%d/%m/%Y')))]
+        
+        # Treinos: a semana do plano semanal numa secção, cada semana do plano mensal na sua
+        if semanal:
+            semana = {'data_inicio': plano.get('data_inicio'), 'treinos': treinos}
+            secoes.append(SecaoPDF('semana', _treinos_plano_visual, (semana, True, None)))
+        else:
+            for ordem, (nome, treinos_semana) in enumerate(_grupos_plano(plano)):
+                titulo = "🗓️ Treinos do Mês" if ordem == 0 else None
+                secoes.append(SecaoPDF(nome, _treinos_plano_visual, ({'treinos': treinos_semana}, False, titulo)))
+        
+        # Incluir jogos se solicitado
+        jogos_periodo = jogos_do_plano(plano, dados.get('jogos', [])) if include_games else []
+        if jogos_periodo:
+            secoes.append(SecaoPDF('jogos', _jogos_plano_visual, (periodo, jogos_periodo, semanal)))
+        
+        pdf_bytes, _ = compor_pdf('criar_pdf_plano_visual', secoes, criar_documento)
+        return BytesIO(pdf_bytes)
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao criar PDF visual: {str(e)}")
+        return None
+
+def adicionar_treinos_semanais_visual_pdf(story, plano, treino_style, sem_treino_style, heading_style):
+    """Adiciona treinos semanais ao PDF no formato visual do email"""
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    
+    story.append(Paragraph("📅 Treinos da Semana", heading_style))
+    
+    dias_semana = ["Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira", "Sexta-feira", "Sábado", "Domingo"]
+    inicio_semana = datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').date()
+    treinos_semana = plano.get('treinos', {})
+    
+    for i in range(7):
+        data_atual = inicio_semana + timedelta(days=i)
+        data_str = data_atual.strftime('%Y-%m-%d')
+        data_formatada = data_atual.strftime('%d/%m')
+        
+        if data_str in treinos_semana:
+            treino = treinos_semana[data_str]
+            
+            # Criar tabela para cada treino (simulando as caixas do email)
+            treino_data = [
+                [f"🏃 {dias_semana[i]} - {data_formatada}"],
+                [f"Nome: {treino.get('nome', 'Treino')}"],
+                [f"Tipo: {treino.get('tipo', 'TBD')}"],
+                [f"Hora: {treino.get('hora', 'TBD')}"],
+                [f"Local: {treino.get('local', 'TBD')}"],
+                [f"Duração: {treino.get('duracao', 'TBD')} minutos"]
+            ]
+            
+            if treino.get('objetivos'):
+                treino_data.append([f"Objetivos:"])
+                for obj in treino.get('objetivos', []):
+                    treino_data.append([f"• {obj}"])
+            
+            treino_table = Table(treino_data, colWidths=[16*cm])
+            treino_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.91, 0.96, 0.91)),  # #e8f5e8
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),  # Título em bold
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('TOPPADDING', (0, 0), (-1, -1), 6),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('LEFTPADDING', (0, 0), (-1, -1), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.4, 0.8, 0.4)),  # Verde
+            ]))
+            
+            story.append(treino_table)
+        else:
+            # Sem treino
+            sem_treino_data = [
+                [f"📝 {dias_semana[i]} - {data_formatada}"],
+                ["Sem treino agendado"]
+            ]
+            
+            sem_treino_table = Table(sem_treino_data, colWidths=[16*cm])
+            sem_treino_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), colors.Color(1, 0.95, 0.8)),  # #fff3cd
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('TOPPADDING', (0, 0), (-1, -1), 6),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('LEFTPADDING', (0, 0), (-1, -1), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.Color(1, 0.7, 0.0)),  # Amarelo
+            ]))
+            
+            story.append(sem_treino_table)
+        
+        story.append(Spacer(1, 8))
+    
+    return story
+
+def adicionar_treinos_mensais_visual_pdf(story, plano, treino_style, heading_style, titulo="🗓️ Treinos do Mês"):
+    """Adiciona treinos mensais ao PDF no formato visual do email"""
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    
+    if titulo:
+        story.append(Paragraph(titulo, heading_style))
+    
+    treinos = plano.get('treinos', {})
+    
+    # Agrupar por semana
+    semanas = _semanas_plano(treinos)
+    
+    for semana_num in sorted(semanas.keys()):
+        # Cabeçalho da semana
+        semana_data = [[f"📅 SEMANA {semana_num}"]]
+        semana_table = Table(semana_data, colWidths=[16*cm])
+        semana_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.Color(1, 0.95, 0.88)),  # #fff3e0
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 12),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(1, 0.34, 0.13)),  # Laranja
+        ]))
+        
+        story.append(semana_table)
+        
+        treinos_semana = semanas[semana_num]
+        
+        for data_str in sorted(treinos_semana.keys()):
+            treino = treinos_semana[data_str]
+            data_formatada = datetime.strptime(data_str, '%Y-%m-%d').strftime('%d/%m/%Y')
+            
+            treino_item_data = [
+                [f"🏃 {data_formatada} - {treino.get('nome', 'Treino')}"],
+                [f"Tipo: {treino.get('tipo', 'TBD')} | Hora: {treino.get('hora', 'TBD')} | Duração: {treino.get('duracao', 'TBD')} min"]
+            ]
+            
+            if treino.get('objetivos'):
+                treino_item_data.append([f"Objetivos: {', '.join(treino.get('objetivos', []))}"])
+            
+            treino_item_table = Table(treino_item_data, colWidths=[16*cm])
+            treino_item_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.91, 0.96, 0.91)),  # #e8f5e8
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('TOPPADDING', (0, 0), (-1, -1), 4),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+                ('LEFTPADDING', (0, 0), (-1, -1), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.4, 0.8, 0.4)),
+            ]))
+            
+            story.append(treino_item_table)
+            story.append(Spacer(1, 4))
+        
+        story.append(Spacer(1, 10))
+    
+    return story
+
+def jogos_do_plano(plano, jogos):
+    """Jogos de `jogos` no período do plano (semana de data_inicio a data_fim, ou mês/ano do plano)"""
+    jogos_periodo = []
+    
+    if plano.get('tipo') == 'semanal':
+        inicio = datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').date()
+        fim = datetime.strptime(plano.get('data_fim'), '%Y-%m-%d').date()
+        
+        for jogo in jogos:
+            try:
+                data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+                if inicio <= data_jogo <= fim:
+                    jogos_periodo.append(jogo)
+            except:
+                continue
+    else:
+        # Plano mensal - buscar jogos do mês
+        try:
+            ano = plano.get('ano', datetime.now().year)
+            mes = plano.get('mes', datetime.now().month)
+            
+            for jogo in jogos:
+                try:
+                    data_jogo = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').date()
+                    if data_jogo.year == ano and data_jogo.month == mes:
+                        jogos_periodo.append(jogo)
+                except:
+                    continue
+        except:
+            pass
+    
+    return jogos_periodo
+
+def adicionar_jogos_plano_pdf(story, plano, dados, heading_style, treino_style):
+    """Adiciona jogos programados ao PDF do plano"""
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import cm
+    
+    # Obter jogos do período do plano
+    jogos_periodo = jogos_do_plano(plano, dados.get('jogos', []))
+    
+    if jogos_periodo:
+        story.append(Spacer(1, 15))
+        story.append(Paragraph("🏆 Jogos Programados", heading_style))
+        
+        for jogo in sorted(jogos_periodo, key=lambda x: x.get('data', '')):
+            try:
+                data_formatada = datetime.strptime(jogo.get('data', ''), '%Y-%m-%d').strftime('%d/%m/%Y')
+                
+                jogo_data = [
+                    [f"🏆 {data_formatada} - {jogo.get('adversario', 'Adversário')}"],
+                    [f"Tipo: {jogo.get('tipo', 'TBD')} | Hora: {jogo.get('hora', 'TBD')} | Local: {jogo.get('local', 'TBD')}"]
+                ]
+                
+                jogo_table = Table(jogo_data, colWidths=[16*cm])
+                jogo_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.95, 0.95, 1)),  # Azul claro
+                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                    ('TOPPADDING', (0, 0), (-1, -1), 6),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.blue),
+                ]))
+                
+                story.append(jogo_table)
+                story.append(Spacer(1, 6))
+            except:
+                continue
+    
+    return story
+
+def gerar_email_plano_treino(plano):
+    """Gera HTML para email de plano de treino"""
+    if plano.get('tipo') == 'semanal':
+        return gerar_email_plano_semanal(plano)
+    else:
+        return gerar_email_plano_mensal(plano)
+
+def gerar_email_plano_semanal(plano):
+    """Gera HTML para plano semanal no formato de calendário visual"""
+    inicio = datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').date()
+    fim = datetime.strptime(plano.get('data_fim'), '%Y-%m-%d').date()
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <style>
+            body {{ 
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+                margin: 0; 
+                padding: 20px; 
+                background-color: #f8f9fa;
+            }}
+            .container {{
+                max-width: 900px;
+                margin: 0 auto;
+                background-color: white;
+                border-radius: 12px;
+                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            .header {{ 
+                background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
+                color: white; 
+                padding: 25px; 
+                text-align: center; 
+            }}
+            .header h1 {{
+                margin: 0;
+                font-size: 28px;
+                font-weight: bold;
+            }}
+            .header h2 {{
+                margin: 5px 0 0 0;
+                font-size: 16px;
+                opacity: 0.9;
+            }}
+            .calendario {{
+                padding: 20px;
+            }}
+            .semana-titulo {{
+                text-align: center;
+                font-size: 20px;
+                font-weight: bold;
+                color: #1e3a8a;
+                margin-bottom: 20px;
+            }}
+            .calendario-grid {{
+                width: 100%;
+                border-collapse: collapse;
+                border: 2px solid #1e3a8a;
+            }}
+            .dia-semana {{
+                background-color: #1e3a8a;
+                color: white;
+                padding: 15px 8px;
+                text-align: center;
+                font-weight: bold;
+                font-size: 14px;
+            }}
+            .dia-celula {{
+                border: 1px solid #ddd;
+                height: 150px;
+                width: 14.28%;
+                vertical-align: top;
+                padding: 12px;
+                position: relative;
+            }}
+            .dia-numero {{
+                font-weight: bold;
+                font-size: 18px;
+                color: #1e3a8a;
+                margin-bottom: 8px;
+                text-align: center;
+            }}
+            .fim-semana {{
+                background-color: #f0f8ff;
+            }}
+            .treino-info {{
+                background-color: #dbeafe;
+                color: #1e3a8a;
+                padding: 8px;
+                border-radius: 6px;
+                margin-bottom: 4px;
+                line-height: 1.3;
+                font-size: 11px;
+            }}
+            .treino-nome {{
+                font-weight: bold;
+                font-size: 12px;
+                margin-bottom: 4px;
+            }}
+            .treino-detalhes {{
+                font-size: 10px;
+                color: #666;
+                margin: 2px 0;
+            }}
+            .sem-treino {{
+                color: #999;
+                font-style: italic;
+                text-align: center;
+                padding-top: 40px;
+                font-size: 12px;
+            }}
+            .footer {{ 
+                background-color: #1e3a8a; 
+                color: white; 
+                padding: 15px; 
+                text-align: center; 
+                font-size: 12px; 
+            }}
+            .legenda {{
+                background-color: #f8f9fa;
+                padding: 15px;
+                margin: 20px;
+                border-radius: 8px;
+                text-align: center;
+                font-size: 12px;
+                color: #666;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>⚽ FUTEBOL CLUBE PINHEIRENSE</h1>
+                <h2>CALENDÁRIO SEMANAL DE TREINOS</h2>
+            
+            
+            <div class="calendario">
+                <div class="semana-titulo">  {inicio.strftime('%d/%m/%Y')} a {fim.strftime('%d/%m/%Y')}
+                
+                <table class="calendario-grid">
+                    <tr>
+                        <th class="dia-semana">SEGUNDA</th>
+                        <th class="dia-semana">TERÇA</th>
+                        <th class="dia-semana">QUARTA</th>
+                        <th class="dia-semana">QUINTA</th>
+                        <th class="dia-semana">SEXTA</th>
+                        <th class="dia-semana">SÁBADO</th>
+                        <th class="dia-semana">DOMINGO</th>
+                    </tr>
+                    <tr>
+    """
+    
+    # Gerar células dos dias da semana
+    treinos_semana = plano.get('treinos', {})
+    dias_semana_nomes = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+    
+    for i in range(7):
+        data_atual = inicio + timedelta(days=i)
+        data_str = data_atual.strftime('%Y-%m-%d')
+        is_weekend = i >= 5  # Sábado e Domingo
+        
+        css_classes = "dia-celula"
+        if is_weekend:
+            css_classes += " fim-semana"
+        
+        html += f'<td class="{css_classes}">'
+        html += f'<div class="dia-numero">{data_atual.day}'
+        
+        # Verificar se há treino neste dia
+        if data_str in treinos_semana:
+            treino = treinos_semana[data_str]
+            
+            html += '<div class="treino-info">'
+            html += f'<div class="treino-nome">🏃 {treino.get("nome", "Treino")}'
+            
+            if treino.get('horario'):
+                html += f'<div class="treino-detalhes">🕐 {treino["horario"]}'
+            
+            if treino.get('tipo'):
+                html += f'<div class="treino-detalhes">⚽ {treino["tipo"]}'
+            
+            if treino.get('local'):
+                html += f'<div class="treino-detalhes">📍 {treino["local"]}'
+            
+            if treino.get('duracao'):
+                html += f'<div class="treino-detalhes">⏱️ {treino["duracao"]} min'
+            
+            html += ''
+        else:
+            html += '<div class="sem-treino">🔄 Descanso'
+        
+        html += '</td>'
+    
+    html += f"""
+                    </tr>
+                </table>
+            
+            
+            <div class="legenda">
+                <strong>Plano:</strong> {plano.get('nome', 'Calendário Semanal')} | 
+                <strong>Total de Treinos:</strong> {plano.get('estatisticas', {}).get('total_treinos', 0)} | 
+                🏃 Treino | 📍 Local | 🕐 Horário | ⏱️ Duração | 🔄 Descanso
+            
+            
+            <div class="footer">
+                <p>F.C. PINHEIRENSE - Enviado automaticamente pelo App Treinador
+                <p>📅 Data de envio: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
+            
+        
+    </body>
+    </html>
+    """
+    
+    return html
+
+def gerar_email_plano_mensal(plano):
+    """Gera HTML do calendário mensal - Versão Simples e Funcional"""
+    import calendar
+    from datetime import datetime, date
+    
+    # Garantir que a semana comece na segunda-feira (0 = segunda-feira)
+    calendar.setfirstweekday(0)
+    
+    # Obter dados do mês
+    treinos = plano.get('treinos', {})
+    if treinos:
+        primeira_data = min(treinos.keys())
+        data_ref = datetime.strptime(primeira_data, '%Y-%m-%d').date()
+        mes = data_ref.month
+        ano_num = data_ref.year
+    else:
+        hoje = date.today()
+        mes = hoje.month
+        ano_num = hoje.year
+    
+    # Obter jogos do sistema
+    dados = carregar_dados()
+    jogos_mes = []
+    for jogo in dados.get('jogos', []):
+        if jogo.get('data'):
+            try:
+                data_jogo = datetime.strptime(jogo['data'], '%Y-%m-%d').date()
+                if data_jogo.month == mes and data_jogo.year == ano_num:
+                    jogos_mes.append(jogo)
+            except:
+                continue
+    
+    # Obter calendário do mês
+    cal = calendar.monthcalendar(ano_num, mes)
+    nomes_meses = ["", "JANEIRO", "FEVEREIRO", "MARÇO", "ABRIL", "MAIO", "JUNHO",
+                   "JULHO", "AGOSTO", "SETEMBRO", "OUTUBRO", "NOVEMBRO", "DEZEMBRO"]
+    
+    # Contar treinos e jogos
+    total_treinos = len(treinos)
+    total_jogos = len(jogos_mes)
+    hoje = date.today()
+    
+    # HTML simples e funcional - OTIMIZADO PARA A4 HORIZONTAL
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Calendário F.C. Pinheirense - {nomes_meses[mes]} {ano_num}</title>
+    <style>
+        @page {{
+            size: A4 landscape;
+            margin: 15mm;
+        }}
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 10px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            font-size: 12px;
+        }}
+        .container {{
+            max-width: 100%;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 15px 30px rgba(0,0,0,0.15);
+            overflow: hidden;
+        }}
+        .header {{
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 20px;
+            text-align: center;
+        }}
+        .titulo {{
+            font-size: 1.8em;
+            font-weight: bold;
+            margin-bottom: 8px;
+        }}
+        .subtitulo {{
+            font-size: 1em;
+            opacity: 0.9;
+        }}
+        .mes-ano {{
+            font-size: 1.5em;
+            margin: 15px 0;
+            background: rgba(255,255,255,0.2);
+            padding: 10px 20px;
+            border-radius: 20px;
+            display: inline-block;
+        }}
+        .stats {{
+            display: flex;
+            justify-content: center;
+            gap: 25px;
+            margin: 15px 0;
+        }}
+        .stat-item {{
+            background: rgba(255,255,255,0.2);
+            padding: 10px 20px;
+            border-radius: 12px;
+        }}
+        .stat-number {{
+            font-size: 1.5em;
+            font-weight: bold;
+            display: block;
+        }}
+        .calendario {{
+            padding: 20px;
+        }}
+        .legenda {{
+            display: flex;
+            justify-content: center;
+            gap: 30px;
+            margin-bottom: 20px;
+            padding: 15px;
+            background: #f8f9fa;
+            border-radius: 8px;
+        }}
+        .legenda-item {{
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            font-weight: bold;
+            font-size: 0.9em;
+        }}
+        .cor-treino {{
+            width: 16px;
+            height: 16px;
+            background: #28a745;
+            border-radius: 3px;
+        }}
+        .cor-jogo {{
+            width: 16px;
+            height: 16px;
+            background: #dc3545;
+            border-radius: 3px;
+        }}
+        .grid-calendario {{
+            display: grid;
+            grid-template-columns: repeat(7, 1fr);
+            gap: 3px;
+            background: #f8f9fa;
+            padding: 8px;
+            border-radius: 8px;
+        }}
+        .dia-header {{
+            background: #343a40;
+            color: white;
+            padding: 10px 8px;
+            text-align: center;
+            font-weight: bold;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }}
+        .dia {{
+            background: white;
+            min-height: 70px;
+            padding: 6px;
+            border-radius: 4px;
+            border: 1px solid #dee2e6;
+        }}
+        .dia-numero {{
+            font-weight: bold;
+            font-size: 0.95em;
+            color: #495057;
+            margin-bottom: 4px;
+        }}
+        .evento {{
+            font-size: 0.7em;
+            padding: 1px 4px;
+            margin: 1px 0;
+            border-radius: 2px;
+            color: white;
+            line-height: 1.2;
+        }}
+        .treino {{
+            background: #28a745;
+        }}
+        .jogo {{
+            background: #dc3545;
+        }}
+        .footer {{
+            background: #343a40;
+            color: white;
+            padding: 15px;
+            text-align: center;
+            font-size: 0.9em;
+        }}
+        @media print {{
+            body {{ 
+                background: white !important;
+                padding: 0 !important;
+                font-size: 11px !important;
+            }}
+            .container {{ 
+                box-shadow: none !important;
+                border-radius: 0 !important;
+                max-width: 100% !important;
+            }}
+            .header {{
+                padding: 15px !important;
+            }}
+            .titulo {{
+                font-size: 1.6em !important;
+            }}
+            .mes-ano {{
+                font-size: 1.3em !important;
+            }}
+            .calendario {{
+                padding: 15px !important;
+            }}
+            .dia {{
+                min-height: 65px !important;
+            }}
+            .grid-calendario {{
+                gap: 2px !important;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <div class="titulo">⚽ F.C. PINHEIRENSE</div>
+            margin: 20px 0;
+        }}
+        .stat-item {{
+            background: rgba(255,255,255,0.2);
+            padding: 15px 25px;
+            border-radius: 15px;
+        }}
+        .stat-number {{
+            font-size: 2em;
+            font-weight: bold;
+            display: block;
+        }}
+        .calendario {{
+            padding: 30px;
+        }}
+        .legenda {{
+            display: flex;
+            justify-content: center;
+            gap: 40px;
+            margin-bottom: 30px;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 10px;
+        }}
+        .legenda-item {{
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            font-weight: bold;
+        }}
+        .cor-treino {{
+            width: 20px;
+            height: 20px;
+            background: #28a745;
+            border-radius: 4px;
+        }}
+        .cor-jogo {{
+            width: 20px;
+            height: 20px;
+            background: #dc3545;
+            border-radius: 4px;
+        }}
+        .grid-calendario {{
+            display: grid;
+            grid-template-columns: repeat(7, 1fr);
+            gap: 5px;
+            background: #f8f9fa;
+            padding: 10px;
+            border-radius: 10px;
+        }}
+        .dia-header {{
+            background: #343a40;
+            color: white;
+            padding: 15px 10px;
+            text-align: center;
+            font-weight: bold;
+            border-radius: 5px;
+        }}
+        .dia {{
+            background: white;
+            min-height: 100px;
+            padding: 8px;
+            border-radius: 5px;
+            border: 1px solid #dee2e6;
+        }}
+        .dia-numero {{
+            font-weight: bold;
+            font-size: 1.1em;
+            color: #495057;
+            margin-bottom: 5px;
+        }}
+        .evento {{
+            font-size: 0.8em;
+            padding: 2px 5px;
+            margin: 1px 0;
+            border-radius: 3px;
+            color: white;
+        }}
+        .treino {{
+            background: #28a745;
+        }}
+        .jogo {{
+            background: #dc3545;
+        }}
+        .footer {{
+            background: #343a40;
+            color: white;
+            padding: 20px;
+            text-align: center;
+        }}
+        @media print {{
+            body {{ background: white !important; }}
+            .container {{ box-shadow: none !important; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <div class="titulo">⚽ F.C. PINHEIRENSE</div>
+            <div class="subtitulo">Calendário Mensal de Treinos e Jogos</div>
+            <div class="mes-ano">{nomes_meses[mes]} {ano_num}</div>
+            <div class="stats">
+                <div class="stat-item">
+                    <span class="stat-number">{total_treinos}</span>
+                    <span>Treinos</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-number">{total_jogos}</span>
+                    <span>Jogos</span>
+                </div>
+            </div>
+        </div>
+        
+        <div class="calendario">
+            <div class="legenda">
+                <div class="legenda-item">
+                    <div class="cor-treino"></div>
+                    <span>Treinos</span>
+                </div>
+                <div class="legenda-item">
+                    <div class="cor-jogo"></div>
+                    <span>Jogos</span>
+                </div>
+            </div>
+            
+            <div class="grid-calendario">
+                <div class="dia-header">DOM</div>
+                <div class="dia-header">SEG</div>
+                <div class="dia-header">TER</div>
+                <div class="dia-header">QUA</div>
+                <div class="dia-header">QUI</div>
+                <div class="dia-header">SEX</div>
+                <div class="dia-header">SÁB</div>"""
+
+    # Gerar dias do calendário
+    for semana in cal:
+        for dia in semana:
+            if dia == 0:
+                html += '<div class="dia" style="opacity: 0.3;"></div>'
+            else:
+                data_atual = date(ano_num, mes, dia)
+                data_str = data_atual.strftime('%Y-%m-%d')
+                
+                html += f'<div class="dia"><div class="dia-numero">{dia}</div>'
+                
+                # Adicionar treinos
+                if data_str in treinos:
+                    treino = treinos[data_str]
+                    nome = treino.get('nome', 'Treino')[:15]
+                    if len(treino.get('nome', '')) > 15:
+                        nome += "..."
+                    html += f'<div class="evento treino">🏃 {nome}</div>'
+                
+                # Adicionar jogos
+                for jogo in jogos_mes:
+                    if jogo.get('data') == data_str:
+                        adversario = jogo.get('adversario', 'TBD')[:12]
+                        if len(jogo.get('adversario', '')) > 12:
+                            adversario += "..."
+                        html += f'<div class="evento jogo">⚽ vs {adversario}</div>'
+                
+                html += '</div>'
+    
+    html += f"""
+            </div>
+        </div>
+        
+        <div class="footer">
+            <strong>⚽ F.C. PINHEIRENSE</strong><br>
+            Calendário gerado em {hoje.strftime('%d/%m/%Y')}<br>
+            Sistema de Gestão de Treinos
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html
+
+@medido('pdf')
+def criar_calendario_pdf_mensal(plano, nome_arquivo=None):
+    """Cria PDF usando HTML-to-PDF com formato EXATO do email"""
+    try:
+        st.info("🔄 Gerando PDF com formato VISUAL IDÊNTICO ao email...")
+        
+        # Gerar HTML EXATO do email
+        html_content = gerar_email_plano_mensal(plano)
+        
+        # Nome do arquivo
+        if not nome_arquivo:
+            # Usar ano/mês do plano se disponível, senão usar data atual
+            if 'ano' in plano and 'mes' in plano:
+                ano = plano['ano']
+                mes = plano['mes']
+            else:
+                hoje = date.today()
+                mes = hoje.month
+                ano = hoje.year
+                
+                # Tentar obter mês do plano (fallback)
+                treinos = plano.get('treinos', {})
+                if treinos:
+                    primeira_data = min(treinos.keys())
+                    data_ref = datetime.strptime(primeira_data, '%Y-%m-%d').date()
+                    mes = data_ref.month
+                    ano = data_ref.year
+            
+            nomes_meses = ["", "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+                          "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"]
+            nome_arquivo = f"calendario_{nomes_meses[mes]}_{ano}.pdf"
+        
+        # CSS otimizado para PDF
+        css_for_pdf = """
+        <style>
+        @page {
+            size: A4 landscape;
+            margin: 0.3cm;
+        }
+        body {
+            transform: scale(0.7);
+            transform-origin: 0 0;
+            font-family: Arial, sans-serif;
+        }
+        .container {
+            width: 100%;
+            max-width: none;
+        }
+        .header {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        .calendario-grid {
+            display: grid !important;
+            grid-template-columns: repeat(7, 1fr) !important;
+        }
+        .stat-item {
+            background: linear-gradient(135deg, #667eea, #764ba2) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        .dia-header {
+            background: linear-gradient(135deg, #1e3c72, #2a5298) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        .treino-item {
+            background: linear-gradient(135deg, #e3f2fd, #bbdefb) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        .jogo-item {
+            background: linear-gradient(135deg, #fff3e0, #ffcc02) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        .dia-hoje {
+            background: linear-gradient(135deg, #fff9c4, #fff59d) !important;
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+        </style>
+        """
+        
+        # Adicionar CSS ao HTML
+        html_with_css = html_content.replace('</head>', css_for_pdf + '</head>')
+        
+        # Método 1: Tentar usar biblioteca do próprio Python
+        try:
+            import webbrowser
+            import tempfile
+            import os
+            import time
+            
+            # Criar arquivo HTML temporário
+            temp_html = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8')
+            temp_html.write(html_with_css)
+            temp_html.close()
+            
+            st.info("💡 HTML criado. Use Ctrl+P no navegador para salvar como PDF com formato idêntico!")
+            st.info(f"📁 Arquivo HTML: {temp_html.name}")
+            
+            # Abrir no navegador para impressão manual
+            webbrowser.open(f'file:///{temp_html.name}')
+            
+            # Copiar para pasta atual com nome amigável
+            html_final = nome_arquivo.replace('.pdf', '_PARA_IMPRIMIR.html')
+            import shutil
+            shutil.copy2(temp_html.name, html_final)
+            
+            st.success(f"✅ HTML criado: {html_final}")
+            st.info("📋 INSTRUÇÕES:")
+            st.info("1. Arquivo HTML aberto no navegador")
+            st.info("2. Pressione Ctrl+P (Imprimir)")
+            st.info("3. Escolha 'Salvar como PDF'")
+            st.info("4. Configure: Paisagem, Sem margens, Gráficos de fundo")
+            st.info("5. O PDF será IDÊNTICO ao email!")
+            
+            return html_final
+            
+        except Exception as e:
+            st.error(f"❌ Erro ao criar HTML: {str(e)}")
+            return None
+        
+    except Exception as e:
+        st.error(f"❌ Erro geral: {str(e)}")
+        return None
+        return None
+
+def criar_calendario_pdf_mensal_fallback(plano, nome_arquivo=None):
+    """Gera PDF usando HTML-to-PDF com o formato EXATO do email"""
+    try:
+        # Gerar o HTML EXATO igual ao email
+        html_content = gerar_email_plano_mensal(plano)
+        
+        # Nome do arquivo
+        if not nome_arquivo:
+            hoje = date.today()
+            mes = hoje.month
+            ano = hoje.year
+            
+            # Tentar obter mês do plano
+            treinos = plano.get('treinos', {})
+            if treinos:
+                primeira_data = min(treinos.keys())
+                data_ref = datetime.strptime(primeira_data, '%Y-%m-%d').date()
+                mes = data_ref.month
+                ano = data_ref.year
+            
+            nomes_meses = ["", "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+                          "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"]
+            nome_arquivo = f"calendario_{nomes_meses[mes]}_{ano}.pdf"
+        
+        # Salvar HTML temporariamente
+        html_temp = nome_arquivo.replace('.pdf', '_temp.html')
+        with open(html_temp, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        st.info("🔄 Gerando PDF com formato IDÊNTICO ao email...")
+        
+        # Método 1: Tentar com chrome/chromium via selenium
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            import base64
+            
+            chrome_options = Options()
+            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.get(f'file:///{html_temp}')
+            
+            # Configurar impressão em PDF
+            print_options = {
+                'landscape': True,
+                'displayHeaderFooter': False,
+                'printBackground': True,
+                'preferCSSPageSize': True,
+            }
+            
+            pdf_data = driver.execute_cdp_cmd('Page.printToPDF', print_options)
+            driver.quit()
+            
+            # Salvar PDF
+            with open(nome_arquivo, 'wb') as f:
+                f.write(base64.b64decode(pdf_data['data']))
+            
+            # Limpar arquivo temporário
+            import os
+            os.remove(html_temp)
+            
+            st.success("✅ PDF gerado com Chrome - formato IDÊNTICO ao email!")
+            return nome_arquivo
+            
+        except Exception as selenium_error:
+            st.warning(f"Chrome não disponível: {selenium_error}")
+            
+            # Método 2: Usar pdfkit se disponível
+            try:
+                import pdfkit
+                
+                options = {
+                    'page-size': 'A4',
+                    'orientation': 'Landscape',
+                    'margin-top': '0.5cm',
+                    'margin-right': '0.5cm',
+                    'margin-bottom': '0.5cm',
+                    'margin-left': '0.5cm',
+                    'encoding': "UTF-8",
+                    'no-outline': None,
+                    'enable-local-file-access': None,
+                    'print-media-type': None,
+                    'javascript-delay': 1000
+                }
+                
+                pdfkit.from_file(html_temp, nome_arquivo, options=options)
+                
+                # Limpar arquivo temporário
+                import os
+                os.remove(html_temp)
+                
+                st.success("✅ PDF gerado com pdfkit - formato visual do email!")
+                return nome_arquivo
+                
+            except Exception as pdfkit_error:
+                st.warning(f"pdfkit não disponível: {pdfkit_error}")
+                
+                # Método 3: Simular o visual com ReportLab
+                import os
+                os.remove(html_temp)
+                
+                st.info("🔄 Criando PDF com ReportLab - formato aproximado...")
+                return criar_calendario_reportlab_visual(plano, nome_arquivo)
+    
+    except Exception as e:
+        st.error(f"❌ Erro ao gerar PDF: {str(e)}")
+        return None
+
+def criar_calendario_reportlab_visual(plano, nome_arquivo):
+    """Cria PDF com ReportLab imitando o visual do email (tema 'email' do motor de calendários)"""
+    try:
+        # Jogos do sistema no mês do plano; as semanas são completadas com os dias dos meses vizinhos
+        dados = carregar_dados()
+        indice = IndiceDatas(plano.get('treinos', {}), dados.get('jogos', []))
+        grelha = grelha_mensal(indice, *mes_do_plano(plano))
+        
+        pdf_calendario(grelha, 'email', plano=plano.get('nome'), destino=nome_arquivo)
+        st.success("✅ PDF gerado com ReportLab - formato similar ao email!")
+        return nome_arquivo
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao criar PDF com ReportLab: {str(e)}")
+        return None
+
+def gestao_treinos():
+    """Gestão simples de treinos"""
+    dados = carregar_dados()
+    
+    st.title("🏃 Gestão de Treinos")
+    
+    # ========== BOTÃO CALENDÁRIO VISUAL SEMPRE VISÍVEL ==========
+    st.markdown("---")
+    st.markdown("### 🎨 Calendário Visual Profissional")
+    st.info("✨ **NOVO!** Gere um calendário com design IDÊNTICO ao email - formato profissional com cores e gradientes!")
+    
+    col_btn_principal = st.columns([1, 2, 1])
+    with col_btn_principal[1]:
+        if st.button("🎯 GERAR CALENDÁRIO VISUAL PREMIUM", type="primary", use_container_width=True, key="calendario_visual_principal"):
+            try:
+                with st.spinner("🔄 Gerando calendário VISUAL IDÊNTICO ao email..."):
+                    # Carregar todos os dados para o calendário
+                    dados_completos = carregar_dados()
+                    plano_adaptado = {
+                        'treinos': dados_completos.get('treinos', {}),
+                        'jogos': dados_completos.get('jogos', []),
+                        'tipo': 'mensal'
+                    }
+                    nome_arquivo = criar_calendario_pdf_mensal(plano_adaptado)
+                    
+                    if nome_arquivo and nome_arquivo.endswith('.html'):
+                        st.success("✅ Calendário HTML gerado com FORMATO IDÊNTICO ao email!")
+                        
+                        # Ler o arquivo HTML gerado
+                        with open(nome_arquivo, 'r', encoding='utf-8') as html_file:
+                            html_data = html_file.read()
+                        
+                        # Botão de download HTML
+                        st.download_button(
+                            label="💾 Baixar HTML (Para Converter em PDF)",
+                            data=html_data,
+                            file_name=nome_arquivo,
+                            mime="text/html",
+                            use_container_width=True
+                        )
+                        
+                        # Instruções para converter para PDF
+                        st.info("📋 **INSTRUÇÕES para PDF:**")
+                        st.info("1. 📥 Baixe o arquivo HTML acima")
+                        st.info("2. 🌐 Abra o arquivo no navegador")
+                        st.info("3. 🖨️ Pressione Ctrl+P (Imprimir)")
+                        st.info("4. 📄 Escolha 'Salvar como PDF'")
+                        st.info("5. ⚙️ Configure: Paisagem + Sem margens + Gráficos de fundo")
+                        st.info("6. ✅ PDF será IDÊNTICO ao email!")
+                        
+                        # Mostrar prévia
+                        st.markdown("### 👁️ Prévia do Calendário:")
+                        st.components.v1.html(html_data, height=600, scrolling=True)
+                        
+                    else:
+                        st.error("❌ Erro ao gerar calendário visual")
+            except Exception as e:
+                st.error(f"❌ Erro ao gerar calendário: {str(e)}")
+    
+    st.markdown("---")
+    
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📋 Lista de Treinos", "📅 Calendário Mensal", "📆 Calendário Semanal", "➕ Novo Treino", "📄 Importar PDF", "📋 Planos de Treino"])
+    
+    with tab1:
+        treinos = dados.get('treinos', {})
+        
+        if treinos:
+            st.subheader(f"📊 {len(treinos)} treino(s) criado(s)")
+            
+            for treino_id, treino in treinos.items():
+                # Adicionar indicador de PDF no título do expander
+                titulo_expander = f"🏃 {treino.get('nome', treino_id)} - {treino.get('tipo', 'N/A')}"
+                if treino.get('origem_pdf'):
+                    titulo_expander += " 📄 (PDF importado)"
+                
+                with st.expander(titulo_expander):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Duração:** {treino.get('duracao', 'N/A')} minutos")
+                        st.write(f"**Categoria:** {treino.get('categoria', 'N/A')}")
+                        st.write(f"**Nível:** {treino.get('nivel', 'N/A')}")
+                        if treino.get('data_criacao'):
+                            st.write(f"**Criado em:** {treino['data_criacao'][:10]}")
+                        
+                        # Mostrar informação sobre PDF importado
+                        if treino.get('origem_pdf'):
+                            origem_pdf = treino['origem_pdf']
+                            st.write(f"**📄 PDF Original:** {origem_pdf.get('arquivo', 'N/A')}")
+                            if origem_pdf.get('importado_em'):
+                                import_date = origem_pdf['importado_em'][:10]
+                                st.write(f"**📅 Importado em:** {import_date}")
+                    
+                    with col2:
+                        if treino.get('objetivos'):
+                            st.write("**Objetivos:**")
+                            for obj in treino['objetivos']:
+                                st.write(f"• {obj}")
+                    
+                    if treino.get('exercicios'):
+                        st.write("**Exercícios:**")
+                        for i, exercicio in enumerate(treino['exercicios'], 1):
+                            st.write(f"{i}. **{exercicio.get('nome', 'Sem nome')}** ({exercicio.get('duracao', 0)} min)")
+                            if exercicio.get('descricao'):
+                                st.write(f"   {exercicio['descricao']}")
+                    
+                    # Botões de ação
+                    if treino.get('origem_pdf'):
+                        # Se treino tem PDF associado, mostrar 4 colunas
+                        col_edit_treino, col_delete_treino, col_exercicios, col_view_pdf = st.columns(4)
+                    else:
+                        # Se não tem PDF, mostrar 3 colunas normais
+                        col_edit_treino, col_delete_treino, col_exercicios = st.columns(3)
+                    
+                    with col_edit_treino:
+                        if st.button(f"✏️ Editar", key=f"edit_treino_{treino_id}"):
+                            st.session_state[f"editing_treino_{treino_id}"] = True
+                            st.rerun()
+                    
+                    with col_delete_treino:
+                        if st.button(f"🗑️ Remover", key=f"delete_treino_{treino_id}"):
+                            del dados['treinos'][treino_id]
+                            if salvar_dados(dados):
+                                st.success(f"✅ Treino removido!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Erro ao remover treino")
+                    
+                    with col_exercicios:
+                        if st.button(f"🏃 Exercícios", key=f"exerc_treino_{treino_id}"):
+                            st.session_state.managing_exerc = treino_id
+                            st.rerun()
+                    
+                    # Botão para ver PDF (se existir)
+                    if treino.get('origem_pdf'):
+                        with col_view_pdf:
+                            if st.button(f"👁️ Ver PDF", key=f"view_pdf_{treino_id}"):
+                                origem_pdf = treino['origem_pdf']
+                                arquivo_pdf = origem_pdf.get('arquivo', '')
+                                caminho_pdf = origem_pdf.get('caminho', '')
+                                
+                                # Tentar encontrar o arquivo PDF
+                                pdf_encontrado = False
+                                
+                                # Primeiro tentar o caminho completo salvo
+                                if caminho_pdf and os.path.exists(caminho_pdf):
+                                    try:
+                                        if os.name == 'nt':  # Windows
+                                            os.startfile(caminho_pdf)
+                                        else:  # Linux/Mac
+                                            import subprocess
+                                            subprocess.call(['xdg-open', caminho_pdf])
+                                        st.success(f"📄 PDF aberto: {arquivo_pdf}")
+                                        pdf_encontrado = True
+                                    except Exception as e:
+                                        st.error(f"❌ Erro ao abrir PDF do caminho salvo: {e}")
+                                
+                                # Se não encontrou, tentar na pasta 'Treinos PDF'
+                                if not pdf_encontrado and arquivo_pdf:
+                                    pdf_folder = "Treinos PDF"
+                                    caminho_pasta = os.path.join(pdf_folder, arquivo_pdf)
+                                    
+                                    if os.path.exists(caminho_pasta):
+                                        try:
+                                            if os.name == 'nt':  # Windows
+                                                os.startfile(caminho_pasta)
+                                            else:  # Linux/Mac
+                                                import subprocess
+                                                subprocess.call(['xdg-open', caminho_pasta])
+                                            st.success(f"📄 PDF aberto: {arquivo_pdf}")
+                                            pdf_encontrado = True
+                                        except Exception as e:
+                                            st.error(f"❌ Erro ao abrir PDF: {e}")
+                                
+                                if not pdf_encontrado:
+                                    st.error(f"❌ PDF não encontrado: {arquivo_pdf}")
+                                    st.info("💡 Verifique se o arquivo ainda existe na pasta 'Treinos PDF' ou no local original.")
+                    
+                    # Formulário de edição (se ativado)
+                    if st.session_state.get(f"editing_treino_{treino_id}", False):
+                        st.write("---")
+                        st.write("**✏️ Editando Treino:**")
+                        
+                        with st.form(f"edit_treino_{treino_id}"):
+                            # Campos de data e hora
+                            edit_col1, edit_col2 = st.columns(2)
+                            
+                            with edit_col1:
+                                # Campo para editar data
+                                try:
+                                    data_atual = datetime.strptime(treino_id, '%Y-%m-%d').date() if treino_id else date.today()
+                                except:
+                                    data_atual = date.today()
+                                nova_data_treino = st.date_input("Data do Treino", value=data_atual)
+                                
+                                # Campo para editar hora
+                                hora_atual = converter_hora_jogo(treino.get('hora', '18:00'))
+                                nova_hora_treino = st.time_input("Hora do Treino", value=hora_atual)
+                                
+                                novo_local = st.text_input("Local", value=treino.get('local', ''))
+                            
+                            with edit_col2:
+                                novo_nome = st.text_input("Nome do Treino", value=treino.get('nome', ''))
+                                novo_tipo = st.selectbox("Tipo de Treino", [
+                                    "Técnico", "Tático", "Físico", "Técnico-Tático", "Técnico-Físico", "Completo"
+                                ], index=["Técnico", "Tático", "Físico", "Técnico-Tático", "Técnico-Físico", "Completo"].index(treino.get('tipo', 'Técnico')) if treino.get('tipo') in ["Técnico", "Tático", "Físico", "Técnico-Tático", "Técnico-Físico", "Completo"] else 0)
+                                nova_duracao = st.number_input("Duração (minutos)", value=treino.get('duracao', 90), min_value=30, max_value=180)
+                            
+                            nova_categoria = st.selectbox("Categoria", ["Sénior", "Juniores A", "Juvenis", "Iniciados"], 
+                                index=["Sénior", "Juniores A", "Juvenis", "Iniciados"].index(treino.get('categoria', 'Sénior')) if treino.get('categoria') in ["Sénior", "Juniores A", "Juvenis", "Iniciados"] else 0)
+                            novo_nivel = st.selectbox("Nível", ["Iniciante", "Intermédio", "Avançado"],
+                                index=["Iniciante", "Intermédio", "Avançado"].index(treino.get('nivel', 'Intermédio')) if treino.get('nivel') in ["Iniciante", "Intermédio", "Avançado"] else 1)
+                            
+                            objetivos_atuais = '\n'.join(treino.get('objetivos', []))
+                            novos_objetivos_texto = st.text_area("Objetivos (um por linha)", value=objetivos_atuais)
+                            
+                            novas_observacoes = st.text_area("Observações", value=treino.get('observacoes', ''))
+                            
+                            col_save_treino, col_cancel_treino = st.columns(2)
+                            
+                            with col_save_treino:
+                                save_treino = st.form_submit_button("💾 Salvar Alterações")
+                            
+                            with col_cancel_treino:
+                                cancel_treino = st.form_submit_button("❌ Cancelar")
+                            
+                            if save_treino:
+                                novos_objetivos = [obj.strip() for obj in novos_objetivos_texto.split('\n') if obj.strip()]
+                                nova_data_str = str(nova_data_treino)
+                                
+                                # Dados atualizados do treino
+                                treino_atualizado = {
+                                    'nome': novo_nome,
+                                    'tipo': novo_tipo,
+                                    'duracao': nova_duracao,
+                                    'categoria': nova_categoria,
+                                    'nivel': novo_nivel,
+                                    'objetivos': novos_objetivos,
+                                    'observacoes': novas_observacoes,
+                                    'hora': str(nova_hora_treino),
+                                    'local': novo_local,
+                                    'exercicios': treino.get('exercicios', []),
+                                    'participantes': treino.get('participantes', [])
+                                }
+                                
+                                # Se a data mudou, remover da data antiga e adicionar na nova
+                                if nova_data_str != treino_id:
+                                    # Remover da data antiga
+                                    del dados['treinos'][treino_id]
+                                    # Adicionar na nova data
+                                    dados['treinos'][nova_data_str] = treino_atualizado
+                                else:
+                                    # Atualizar na mesma data
+                                    dados['treinos'][treino_id].update(treino_atualizado)
+                                
+                                if salvar_dados(dados):
+                                    st.success("✅ Treino atualizado com sucesso!")
+                                    del st.session_state[f"editing_treino_{treino_id}"]
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao salvar alterações")
+                            
+                            if cancel_treino:
+                                del st.session_state[f"editing_treino_{treino_id}"]
+                                st.rerun()
+        else:
+            st.info("📝 Nenhum treino criado ainda")
+    
+    with tab2:
+        mostrar_calendario_mensal_treinos(dados)
+    
+    with tab3:
+        mostrar_calendario_semanal_treinos(dados)
+    
+    with tab4:
+        st.subheader("➕ Criar Novo Treino")
+        
+        with st.form("novo_treino"):
+            # Campos de data e localização
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                data_treino = st.date_input("Data do Treino*", value=date.today())
+                hora_treino = st.time_input("Hora do Treino*", value=datetime.strptime("18:00", "%H:%M").time())
+                local_treino = st.text_input("Local*", placeholder="Ex: Campo Municipal")
+            
+            with col2:
+                nome = st.text_input("Nome do Treino", placeholder="Ex: Treino Técnico-Tático")
+                tipo = st.selectbox("Tipo de Treino*", [
+                    "Técnico", "Tático", "Físico", "Técnico-Tático", "Técnico-Físico", "Completo"
+                ])
+                duracao = st.number_input("Duração (minutos)*", min_value=30, max_value=180, value=90)
+            
+            categoria = st.selectbox("Categoria", ["Sénior", "Juniores A", "Juvenis", "Iniciados"])
+            nivel = st.selectbox("Nível", ["Iniciante", "Intermédio", "Avançado"])
+            
+            objetivos_texto = st.text_area("Objetivos (um por linha)", 
+                placeholder="Melhorar passe\nTrabalhar finalização\nDesenvolver resistência")
+            
+            observacoes = st.text_area("Observações", placeholder="Notas importantes sobre o treino...")
+            
+            submitted = st.form_submit_button("💾 Criar Treino")
+            
+            if submitted:
+                if data_treino and hora_treino and local_treino and tipo and duracao:
+                    objetivos = [obj.strip() for obj in objetivos_texto.split('\n') if obj.strip()]
+                    data_treino_str = str(data_treino)
+                    
+                    novo_treino = {
+                        "nome": nome or f"Treino {tipo}",
+                        "tipo": tipo,
+                        "duracao": duracao,
+                        "data_criacao": datetime.now().isoformat(),
+                        "categoria": categoria,
+                        "nivel": nivel,
+                        "objetivos": objetivos,
+                        "observacoes": observacoes,
+                        "exercicios": [],
+                        "hora": str(hora_treino),
+                        "local": local_treino,
+                        "participantes": []
+                    }
+                    
+                    # Usar a data como chave (formato usado no JSON)
+                    dados['treinos'][data_treino_str] = novo_treino
+                    
+                    if salvar_dados(dados):
+                        st.success("✅ Treino criado com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao salvar treino")
+                else:
+                    st.error("❌ Preencha todos os campos obrigatórios (*)")
+    
+    with tab5:
+        # Importar treinos de PDF
+        importar_treinos_pdf(dados)
+    
+    with tab6:
+        # Planos de treino semanais e mensais
+        gestao_planos_treino(dados)
+    
+    # Verificar se está gerenciando exercícios de algum treino
+    if hasattr(st.session_state, 'managing_exerc') and st.session_state.managing_exerc:
+        gerenciar_exercicios_treino(st.session_state.managing_exerc, dados)
+
+def gerenciar_exercicios_treino(treino_id, dados):
+    """Interface completa para gestão de exercícios com vídeos"""
+    treino = dados.get('treinos', {}).get(treino_id, {})
+    
+    if not treino:
+        st.error("❌ Treino não encontrado!")
+        if st.button("🔙 Voltar"):
+            del st.session_state.managing_exerc
+            st.rerun()
+        return
+    
+    st.title(f"🏃 Exercícios - {treino.get('nome', 'Treino')}")
+    st.write(f"📅 Data: {treino_id} | ⏱️ Duração: {treino.get('duracao', 'N/A')} min")
+    
+    # Tabs para gestão de exercícios
+    tab1, tab2, tab3 = st.tabs(["📋 Lista de Exercícios", "➕ Novo Exercício", "🎥 Gestão de Vídeos"])
+    
+    with tab1:
+        exercicios = treino.get('exercicios', [])
+        
+        if exercicios:
+            st.subheader(f"📊 {len(exercicios)} exercício(s) no treino")
+            
+            # Contar exercícios com vídeo
+            exercicios_com_video = sum(1 for ex in exercicios if 
+                ex.get('video_url') or ex.get('video_file') or ex.get('video'))
+            
+            # Mostrar estatísticas visuais
+            col_stats1, col_stats2, col_stats3 = st.columns(3)
+            with col_stats1:
+                st.metric("🎥 Com Vídeo", exercicios_com_video)
+            with col_stats2:
+                st.metric("📝 Sem Vídeo", len(exercicios) - exercicios_com_video)
+            with col_stats3:
+                duracao_total = sum(ex.get('duracao', 0) for ex in exercicios)
+                st.metric("⏱️ Duração Total", f"{duracao_total} min")
+            
+            if exercicios_com_video > 0:
+                st.success(f"✅ {exercicios_com_video} exercício(s) com vídeo - clique em '▶️ Ver Vídeo' para visualização rápida!")
+            else:
+                st.info("💡 Nenhum exercício tem vídeo associado ainda")
+            
+            st.write("---")
+            st.write("💡 **Legenda:** 🎥 = Com vídeo | 📝 = Sem vídeo | ▶️ = Visualização rápida")
+            
+            for i, exercicio in enumerate(exercicios):
+                # Ícone para indicar se tem vídeo
+                tem_video = bool(
+                    exercicio.get('video_url') or 
+                    exercicio.get('video_file') or 
+                    exercicio.get('video')
+                )
+                icone_video = "🎥" if tem_video else "📝"
+                
+                with st.expander(f"{icone_video} {exercicio.get('nome', f'Exercício {i+1}')} - {exercicio.get('duracao', 0)} min"):
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.write(f"**Duração:** {exercicio.get('duracao', 0)} minutos")
+                        st.write(f"**Tipo:** {exercicio.get('tipo', 'N/A')}")
+                        st.write(f"**Intensidade:** {exercicio.get('intensidade', 'N/A')}")
+                        
+                        if exercicio.get('descricao'):
+                            st.write(f"**Descrição:** {exercicio['descricao']}")
+                        
+                        if exercicio.get('material'):
+                            st.write(f"**Material:** {exercicio['material']}")
+                    
+                    with col2:
+                        # Botão de visualização rápida de vídeo se disponível
+                        if tem_video:
+                            if st.button(f"▶️ Ver Vídeo", key=f"play_video_{i}", type="primary"):
+                                st.session_state[f"show_video_{i}"] = True
+                                st.rerun()
+                        
+                        # Botões de ação originais
+                        if st.button(f"✏️ Editar", key=f"edit_exerc_{i}"):
+                            st.session_state[f"editing_exerc_{i}"] = True
+                            st.rerun()
+                        
+                        if st.button(f"🗑️ Remover", key=f"del_exerc_{i}"):
+                            exercicios.pop(i)
+                            dados['treinos'][treino_id]['exercicios'] = exercicios
+                            if salvar_dados(dados):
+                                st.success("✅ Exercício removido!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Erro ao remover exercício")
+                        
+                        if st.button(f"⬆️ Subir", key=f"up_exerc_{i}", disabled=(i == 0)):
+                            exercicios[i], exercicios[i-1] = exercicios[i-1], exercicios[i]
+                            dados['treinos'][treino_id]['exercicios'] = exercicios
+                            if salvar_dados(dados):
+                                st.rerun()
+                        
+                        if st.button(f"⬇️ Descer", key=f"down_exerc_{i}", disabled=(i == len(exercicios)-1)):
+                            exercicios[i], exercicios[i+1] = exercicios[i+1], exercicios[i]
+                            dados['treinos'][treino_id]['exercicios'] = exercicios
+                            if salvar_dados(dados):
+                                st.rerun()
+                    
+                    # Visualização rápida de vídeo
+                    if st.session_state.get(f"show_video_{i}", False):
+                        st.write("---")
+                        col_video_header, col_video_close = st.columns([4, 1])
+                        
+                        with col_video_header:
+                            st.write("**🎥 Vídeo Demonstrativo:**")
+                        
+                        with col_video_close:
+                            if st.button("❌ Fechar", key=f"close_video_{i}"):
+                                st.session_state[f"show_video_{i}"] = False
+                                st.rerun()
+                        
+                        # Mostrar vídeo (compatibilidade com formatos antigos e novos)
+                        video_url = exercicio.get('video_url', '')
+                        video_file = exercicio.get('video_file', '')
+                        video_antigo = exercicio.get('video', '')  # Formato antigo
+                        
+                        if video_url:
+                            if 'youtube.com' in video_url or 'youtu.be' in video_url:
+                                st.video(video_url)
+                                st.success("✅ Vídeo do YouTube carregado")
+                            elif 'vimeo.com' in video_url:
+                                st.video(video_url)
+                                st.success("✅ Vídeo do Vimeo carregado")
+                            else:
+                                st.video(video_url)
+                                st.success("✅ Vídeo carregado")
+                        
+                        elif video_file:
+                            video_path = f"Videos/{video_file}"
+                            if os.path.exists(video_path):
+                                st.video(video_path)
+                                st.success(f"✅ Vídeo local carregado: {video_file}")
+                            else:
+                                st.warning(f"⚠️ Arquivo de vídeo não encontrado: {video_path}")
+                                st.info("💡 O arquivo pode ter sido movido ou removido")
+                        
+                        elif video_antigo:  # Compatibilidade com formato antigo
+                            video_path = f"Videos/{video_antigo}"
+                            if os.path.exists(video_path):
+                                st.video(video_path)
+                                st.success(f"✅ Vídeo local carregado: {video_antigo}")
+                            else:
+                                st.warning(f"⚠️ Arquivo de vídeo não encontrado: {video_path}")
+                                st.info(f"💡 Arquivo esperado: {video_antigo}")
+                    
+                    # Formulário de edição (se ativado)
+                    if st.session_state.get(f"editing_exerc_{i}", False):
+                        st.write("---")
+                        st.write("**✏️ Editando Exercício:**")
+                        
+                        with st.form(f"edit_exerc_form_{i}"):
+                            edit_nome = st.text_input("Nome do Exercício", value=exercicio.get('nome', ''))
+                            edit_tipo = st.selectbox("Tipo", [
+                                "Aquecimento", "Técnico", "Tático", "Físico", "Finalização", "Condicionamento"
+                            ], index=max(0, ["Aquecimento", "Técnico", "Tático", "Físico", "Finalização", "Condicionamento"].index(exercicio.get('tipo', 'Técnico')) if exercicio.get('tipo') in ["Aquecimento", "Técnico", "Tático", "Físico", "Finalização", "Condicionamento"] else 0))
+                            
+                            col_edit1, col_edit2 = st.columns(2)
+                            with col_edit1:
+                                edit_duracao = st.number_input("Duração (min)", value=exercicio.get('duracao', 10), min_value=1, max_value=60)
+                                edit_intensidade = st.selectbox("Intensidade", ["Baixa", "Média", "Alta"], 
+                                    index=max(0, ["Baixa", "Média", "Alta"].index(exercicio.get('intensidade', 'Média')) if exercicio.get('intensidade') in ["Baixa", "Média", "Alta"] else 1))
+                            
+                            with col_edit2:
+                                edit_participantes = st.number_input("Nº Participantes", value=exercicio.get('participantes', 11), min_value=1, max_value=30)
+                                edit_espaco = st.selectbox("Espaço", ["Campo inteiro", "Meio campo", "Área", "1/3 do campo"], 
+                                    index=max(0, ["Campo inteiro", "Meio campo", "Área", "1/3 do campo"].index(exercicio.get('espaco', 'Campo inteiro')) if exercicio.get('espaco') in ["Campo inteiro", "Meio campo", "Área", "1/3 do campo"] else 0))
+                            
+                            edit_descricao = st.text_area("Descrição", value=exercicio.get('descricao', ''))
+                            edit_material = st.text_input("Material necessário", value=exercicio.get('material', ''))
+                            
+                            # Seção de vídeo (interface simplificada para adjuntos)
+                            st.write("### 🎥 Vídeo Demonstrativo")
+                            
+                            # Detectar vídeo atual (novo ou antigo formato)
+                            video_atual_url = exercicio.get('video_url', '')
+                            video_atual_file = exercicio.get('video_file', '') or exercicio.get('video', '')  # Compatibilidade
+                            
+                            st.write("💡 **3 formas de adicionar/alterar vídeo:**")
+                            
+                            video_edit_tabs = st.tabs(["📤 Upload Arquivo", "🔗 Link YouTube", "🔗 Link Vimeo"])
+                            
+                            edit_video_url = ""
+                            edit_video_file = ""
+                            
+                            with video_edit_tabs[0]:  # Upload de arquivo
+                                st.write("**📤 Enviar novo arquivo:**")
+                                uploaded_file_edit = st.file_uploader(
+                                    "Escolher arquivo de vídeo", 
+                                    type=['mp4', 'avi', 'mov', 'mkv'],
+                                    help="Formatos suportados: MP4, AVI, MOV, MKV (máx. 200MB)",
+                                    key=f"upload_edit_{i}"
+                                )
+                                
+                                if uploaded_file_edit is not None:
+                                    # Salvar arquivo enviado
+                                    video_path = f"Videos/{uploaded_file_edit.name}"
+                                    with open(video_path, "wb") as f:
+                                        f.write(uploaded_file_edit.getbuffer())
+                                    st.success(f"✅ Vídeo '{uploaded_file_edit.name}' carregado!")
+                                    edit_video_file = uploaded_file_edit.name
+                                    
+                                    # Mostrar prévia
+                                    try:
+                                        st.video(video_path)
+                                        st.success("✅ Prévia carregada!")
+                                    except:
+                                        st.warning("⚠️ Erro ao carregar prévia")
+                                
+                                else:
+                                    st.write("---")
+                                    st.write("**📁 Ou selecionar vídeo existente:**")
+                                    
+                                    # Listar arquivos de vídeo disponíveis
+                                    videos_disponiveis = []
+                                    if os.path.exists("Videos"):
+                                        for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
+                                            videos_disponiveis.extend(glob_module.glob(f"Videos/{ext}"))
+                                        videos_disponiveis = [os.path.basename(v) for v in videos_disponiveis]
+                                    
+                                    if videos_disponiveis:
+                                        current_index = 0
+                                        if video_atual_file and video_atual_file in videos_disponiveis:
+                                            current_index = videos_disponiveis.index(video_atual_file) + 1
+                                        edit_video_file = st.selectbox("Selecionar arquivo:", [""] + videos_disponiveis, index=current_index)
+                                        
+                                        if edit_video_file:
+                                            video_path = f"Videos/{edit_video_file}"
+                                            try:
+                                                st.video(video_path)
+                                                st.success("✅ Prévia carregada!")
+                                            except:
+                                                st.warning("⚠️ Erro ao carregar vídeo")
+                                    else:
+                                        st.info("ℹ️ Nenhum arquivo de vídeo encontrado na pasta 'Videos/'")
+                                        if video_atual_file:
+                                            st.warning(f"⚠️ Vídeo atual: {video_atual_file} (não encontrado)")
+                                            edit_video_file = video_atual_file  # Manter o nome mesmo se não encontrado
+                            
+                            with video_edit_tabs[1]:  # YouTube
+                                st.write("**🔗 Link do YouTube:**")
+                                current_yt = video_atual_url if 'youtube' in video_atual_url else ''
+                                edit_video_url_yt = st.text_input(
+                                    "Cole o link aqui:", 
+                                    value=current_yt,
+                                    placeholder="https://www.youtube.com/watch?v=...",
+                                    key=f"youtube_edit_{i}"
+                                )
+                                
+                                if edit_video_url_yt and edit_video_url_yt.strip():
+                                    edit_video_url = edit_video_url_yt.strip()
+                                    try:
+                                        st.video(edit_video_url)
+                                        st.success("✅ Vídeo do YouTube carregado!")
+                                    except:
+                                        st.warning("⚠️ Verifique se o link está correto")
+                                elif current_yt:
+                                    st.write(f"**📺 Vídeo atual:** {current_yt[:50]}...")
+                                    try:
+                                        st.video(current_yt)
+                                    except:
+                                        st.warning("⚠️ Erro ao carregar vídeo atual")
+                            
+                            with video_edit_tabs[2]:  # Vimeo
+                                st.write("**🔗 Link do Vimeo:**")
+                                current_vm = video_atual_url if 'vimeo' in video_atual_url else ''
+                                edit_video_url_vm = st.text_input(
+                                    "Cole o link aqui:", 
+                                    value=current_vm,
+                                    placeholder="https://vimeo.com/...",
+                                    key=f"vimeo_edit_{i}"
+                                )
+                                
+                                if edit_video_url_vm and edit_video_url_vm.strip():
+                                    edit_video_url = edit_video_url_vm.strip()
+                                    try:
+                                        st.video(edit_video_url)
+                                        st.success("✅ Vídeo do Vimeo carregado!")
+                                    except:
+                                        st.warning("⚠️ Verifique se o link está correto")
+                                elif current_vm:
+                                    st.write(f"**📺 Vídeo atual:** {current_vm[:50]}...")
+                                    try:
+                                        st.video(current_vm)
+                                    except:
+                                        st.warning("⚠️ Erro ao carregar vídeo atual")
+                            
+                            # Botões do formulário
+                            col_save, col_cancel = st.columns(2)
+                            with col_save:
+                                save_edit = st.form_submit_button("💾 Salvar")
+                            with col_cancel:
+                                cancel_edit = st.form_submit_button("❌ Cancelar")
+                            
+                            if save_edit:
+                                exercicio_editado = {
+                                    'nome': edit_nome,
+                                    'tipo': edit_tipo,
+                                    'duracao': edit_duracao,
+                                    'intensidade': edit_intensidade,
+                                    'participantes': edit_participantes,
+                                    'espaco': edit_espaco,
+                                    'descricao': edit_descricao,
+                                    'material': edit_material,
+                                    'video_url': edit_video_url,
+                                    'video_file': edit_video_file
+                                }
+                                
+                                exercicios[i] = exercicio_editado
+                                dados['treinos'][treino_id]['exercicios'] = exercicios
+                                
+                                if salvar_dados(dados):
+                                    st.success("✅ Exercício atualizado!")
+                                    del st.session_state[f"editing_exerc_{i}"]
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Erro ao salvar exercício")
+                            
+                            if cancel_edit:
+                                del st.session_state[f"editing_exerc_{i}"]
+                                st.rerun()
+        else:
+            st.info("📝 Nenhum exercício adicionado ainda")
+    
+    with tab2:
+        st.subheader("➕ Adicionar Novo Exercício")
+        
+        # Instrução simples para adjuntos
+        with st.expander("💡 Instruções Rápidas", expanded=False):
+            st.write("**🎯 Para adicionar um exercício com vídeo:**")
+            st.write("1. ✏️ Preencha o nome e descrição do exercício")
+            st.write("2. 🎥 Escolha uma das 3 opções de vídeo:")
+            st.write("   • **📤 Upload Arquivo:** Arraste o vídeo do seu computador")
+            st.write("   • **🔗 YouTube:** Cole o link do vídeo")
+            st.write("   • **🔗 Vimeo:** Cole o link do vídeo")
+            st.write("3. 💾 Clique em 'Adicionar Exercício'")
+            st.success("✅ O vídeo ficará associado ao exercício permanentemente!")
+        
+        with st.form("novo_exercicio"):
+            nome_exercicio = st.text_input("Nome do Exercício*", placeholder="Ex: Passe em triangulo")
+            tipo_exercicio = st.selectbox("Tipo*", [
+                "Aquecimento", "Técnico", "Tático", "Físico", "Finalização", "Condicionamento"
+            ])
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                duracao_exercicio = st.number_input("Duração (minutos)*", min_value=1, max_value=60, value=10)
+                intensidade_exercicio = st.selectbox("Intensidade*", ["Baixa", "Média", "Alta"], index=1)
+            
+            with col2:
+                participantes_exercicio = st.number_input("Nº Participantes*", min_value=1, max_value=30, value=11)
+                espaco_exercicio = st.selectbox("Espaço necessário*", [
+                    "Campo inteiro", "Meio campo", "Área", "1/3 do campo"
+                ])
+            
+            descricao_exercicio = st.text_area("Descrição do exercício*", 
+                placeholder="Descreva como executar o exercício...")
+            
+            material_exercicio = st.text_input("Material necessário", 
+                placeholder="Ex: 6 cones, 1 bola por dupla")
+            
+            # Seção de vídeo (simplificada para adjuntos)
+            st.write("### 🎥 Vídeo Demonstrativo (Opcional)")
+            st.write("💡 **3 formas de adicionar vídeo ao exercício:**")
+            
+            video_tabs = st.tabs(["📤 Upload Arquivo", "🔗 Link YouTube", "🔗 Link Vimeo"])
+            
+            video_url = ""
+            video_file = ""
+            
+            with video_tabs[0]:  # Upload de arquivo
+                st.write("**📤 Enviar arquivo do seu computador:**")
+                uploaded_file = st.file_uploader(
+                    "Escolher arquivo de vídeo", 
+                    type=['mp4', 'avi', 'mov', 'mkv'],
+                    help="Arraste o arquivo aqui ou clique para procurar (máx. 200MB)",
+                    key="upload_novo_exercicio"
+                )
+                
+                if uploaded_file is not None:
+                    # Salvar arquivo
+                    if not os.path.exists("Videos"):
+                        os.makedirs("Videos")
+                    
+                    video_path = f"Videos/{uploaded_file.name}"
+                    with open(video_path, "wb") as f:
+                        f.write(uploaded_file.getbuffer())
+                    
+                    video_file = uploaded_file.name
+                    st.success(f"✅ Vídeo '{uploaded_file.name}' carregado!")
+                    
+                    # Mostrar prévia
+                    try:
+                        st.video(video_path)
+                        st.success("✅ Prévia do vídeo pronta!")
+                    except:
+                        st.warning("⚠️ Erro ao mostrar prévia")
+                
+                # Mostrar vídeos existentes como opção alternativa
+                if os.path.exists("Videos"):
+                    videos_disponiveis = []
+                    for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
+                        videos_disponiveis.extend(glob_module.glob(f"Videos/{ext}"))
+                    videos_disponiveis = [os.path.basename(v) for v in videos_disponiveis]
+                    
+                    if videos_disponiveis:
+                        st.write("---")
+                        st.write("**📺 Ou escolher vídeo já carregado:**")
+                        video_existente = st.selectbox(
+                            "Vídeos disponíveis:", 
+                            ["(Nenhum)"] + videos_disponiveis,
+                            key="select_video_existente"
+                        )
+                        
+                        if video_existente != "(Nenhum)":
+                            video_file = video_existente
+                            video_path = f"Videos/{video_existente}"
+                            try:
+                                st.video(video_path)
+                                st.success(f"✅ Vídeo '{video_existente}' selecionado!")
+                            except:
+                                st.warning("⚠️ Erro ao carregar vídeo")
+            
+            with video_tabs[1]:  # YouTube
+                st.write("**🔗 Link do YouTube:**")
+                video_url_yt = st.text_input(
+                    "Cole o link aqui:", 
+                    placeholder="https://www.youtube.com/watch?v=...",
+                    key="youtube_url_novo"
+                )
+                
+                if video_url_yt and video_url_yt.strip():
+                    video_url = video_url_yt.strip()
+                    try:
+                        st.video(video_url)
+                        st.success("✅ Vídeo do YouTube carregado!")
+                    except:
+                        st.warning("⚠️ Verifique se o link está correto")
+            
+            with video_tabs[2]:  # Vimeo
+                st.write("**🔗 Link do Vimeo:**")
+                video_url_vm = st.text_input(
+                    "Cole o link aqui:", 
+                    placeholder="https://vimeo.com/...",
+                    key="vimeo_url_novo"
+                )
+                
+                if video_url_vm and video_url_vm.strip():
+                    video_url = video_url_vm.strip()
+                    try:
+                        st.video(video_url)
+                        st.success("✅ Vídeo do Vimeo carregado!")
+                    except:
+                        st.warning("⚠️ Verifique se o link está correto")
+            
+            submitted_exercicio = st.form_submit_button("💾 Adicionar Exercício")
+            
+            if submitted_exercicio:
+                if nome_exercicio and tipo_exercicio and duracao_exercicio and descricao_exercicio:
+                    novo_exercicio = {
+                        'nome': nome_exercicio,
+                        'tipo': tipo_exercicio,
+                        'duracao': duracao_exercicio,
+                        'intensidade': intensidade_exercicio,
+                        'participantes': participantes_exercicio,
+                        'espaco': espaco_exercicio,
+                        'descricao': descricao_exercicio,
+                        'material': material_exercicio,
+                        'video_url': video_url,
+                        'video_file': video_file
+                    }
+                    
+                    if 'exercicios' not in dados['treinos'][treino_id]:
+                        dados['treinos'][treino_id]['exercicios'] = []
+                    
+                    dados['treinos'][treino_id]['exercicios'].append(novo_exercicio)
+                    
+                    if salvar_dados(dados):
+                        st.success("✅ Exercício adicionado com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao salvar exercício")
+                else:
+                    st.error("❌ Preencha todos os campos obrigatórios (*)")
+    
+    with tab3:
+        st.subheader("🎥 Gestão de Vídeos")
+        
+        # Upload múltiplo de vídeos
+        st.write("### 📤 Upload de Vídeos")
+        uploaded_files = st.file_uploader(
+            "Carregar vários vídeos de uma vez", 
+            type=['mp4', 'avi', 'mov', 'mkv'],
+            accept_multiple_files=True,
+            help="Selecione múltiplos arquivos de vídeo para carregar (máx. 200MB cada)"
+        )
+        
+        if uploaded_files:
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            for i, uploaded_file in enumerate(uploaded_files):
+                status_text.text(f"Carregando {uploaded_file.name}...")
+                
+                # Salvar arquivo
+                video_path = f"Videos/{uploaded_file.name}"
+                with open(video_path, "wb") as f:
+                    f.write(uploaded_file.getbuffer())
+                
+                progress_bar.progress((i + 1) / len(uploaded_files))
+            
+            status_text.empty()
+            progress_bar.empty()
+            st.success(f"✅ {len(uploaded_files)} vídeo(s) carregado(s) com sucesso!")
+            st.rerun()
+        
+        # Lista de vídeos existentes
+        st.write("### 📁 Vídeos Disponíveis")
+        
+        if os.path.exists("Videos"):
+            videos_disponiveis = []
+            for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
+                videos_disponiveis.extend(glob_module.glob(f"Videos/{ext}"))
+            videos_disponiveis = [os.path.basename(v) for v in videos_disponiveis]
+            
+            if videos_disponiveis:
+                st.write(f"📊 **{len(videos_disponiveis)} vídeo(s) disponível(eis):**")
+                
+                for video in videos_disponiveis:
+                    with st.expander(f"🎥 {video}"):
+                        col1, col2 = st.columns([3, 1])
+                        
+                        with col1:
+                            video_path = f"Videos/{video}"
+                            
+                            # Informações do arquivo
+                            try:
+                                file_size = os.path.getsize(video_path)
+                                size_mb = file_size / (1024 * 1024)
+                                st.write(f"**Tamanho:** {size_mb:.1f} MB")
+                            except:
+                                st.write("**Tamanho:** Não disponível")
+                            
+                            # Prévia do vídeo
+                            try:
+                                st.video(video_path)
+                            except:
+                                st.warning("⚠️ Erro ao carregar vídeo")
+                        
+                        with col2:
+                            st.write("**Ações:**")
+                            
+                            # Botão para remover vídeo
+                            if st.button(f"🗑️ Remover", key=f"del_video_{video}"):
+                                try:
+                                    os.remove(video_path)
+                                    st.success(f"✅ Vídeo '{video}' removido!")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"❌ Erro ao remover: {e}")
+                            
+                            # Botão para renomear
+                            if st.button(f"✏️ Renomear", key=f"rename_video_{video}"):
+                                st.session_state[f"renaming_{video}"] = True
+                                st.rerun()
+                        
+                        # Formulário de renomeação
+                        if st.session_state.get(f"renaming_{video}", False):
+                            with st.form(f"rename_form_{video}"):
+                                nome_atual = os.path.splitext(video)[0]
+                                extensao = os.path.splitext(video)[1]
+                                
+                                novo_nome = st.text_input("Novo nome (sem extensão):", value=nome_atual)
+                                
+                                col_save, col_cancel = st.columns(2)
+                                with col_save:
+                                    save_rename = st.form_submit_button("💾 Salvar")
+                                with col_cancel:
+                                    cancel_rename = st.form_submit_button("❌ Cancelar")
+                                
+                                if save_rename and novo_nome:
+                                    try:
+                                        novo_path = f"Videos/{novo_nome}{extensao}"
+                                        os.rename(video_path, novo_path)
+                                        st.success(f"✅ Vídeo renomeado para '{novo_nome}{extensao}'!")
+                                        del st.session_state[f"renaming_{video}"]
+                                        st.rerun()
+                                    except Exception as e:
+                                        st.error(f"❌ Erro ao renomear: {e}")
+                                
+                                if cancel_rename:
+                                    del st.session_state[f"renaming_{video}"]
+                                    st.rerun()
+            else:
+                st.info("📁 Nenhum vídeo encontrado")
+                st.write("💡 **Como adicionar vídeos:**")
+                st.write("1. Use o upload acima para carregar arquivos")
+                st.write("2. Ou copie arquivos diretamente para a pasta 'Videos/'")
+        else:
+            st.info("📁 Pasta 'Videos' não existe. Será criada automaticamente ao carregar o primeiro vídeo.")
+    
+    # Botão para voltar
+    st.write("---")
+    
+    # Informações úteis
+    with st.expander("💡 Dicas sobre Vídeos"):
+        st.write("**📋 Formatos Suportados:**")
+        st.write("• MP4 (recomendado)")
+        st.write("• AVI")
+        st.write("• MOV") 
+        st.write("• MKV")
+        
+        st.write("**📏 Recomendações:**")
+        st.write("• Tamanho máximo: 200MB por arquivo")
+        st.write("• Resolução: 720p ou 1080p")
+        st.write("• Duração: 30 segundos a 5 minutos")
+        st.write("• Use nomes descritivos (ex: 'passe_triangulo.mp4')")
+        
+        st.write("**🔗 Alternativas:**")
+        st.write("• YouTube: Cole o link direto do vídeo")
+        st.write("• Vimeo: Cole o link direto do vídeo")
+        st.write("• Upload local: Use a tab 'Gestão de Vídeos'")
+    
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        if st.button("🔙 Voltar aos Treinos", type="primary"):
+            del st.session_state.managing_exerc
+            st.rerun()
+
+ESTADOS_PRESENCA = ['presente', 'justificado', 'ausente', 'pendente']
+
+def editor_presencas(presencas, jogadores, chave):
+    """Grelha editável (jogador × estado) num único widget; devolve as presenças por nome"""
+    presencas = normalizar_presencas(presencas, jogadores)
+    nomes = sorted(j['nome'] for j in jogadores if j.get('nome'))
+    
+    tabela = pd.DataFrame({
+        'Jogador': nomes,
+        'Estado': [presencas.get(nome) if presencas.get(nome) in ESTADOS_PRESENCA else 'ausente' for nome in nomes],
+    })
+    editada = st.data_editor(
+        tabela,
+        key=chave,
+        hide_index=True,
+        use_container_width=True,
+        disabled=['Jogador'],
+        column_config={
+            'Jogador': st.column_config.TextColumn("👤 Jogador"),
+            'Estado': st.column_config.SelectboxColumn("Estado", options=ESTADOS_PRESENCA, required=True),
+        },
+    )
+    
+    atualizadas = dict(presencas)
+    atualizadas.update(zip(editada['Jogador'], editada['Estado']))
+    return atualizadas
+
+def mostrar_resumo_presencas(presencas, total_jogadores):
+    """Métricas de presentes, justificados e ausentes de uma sessão"""
+    estados = list(presencas.values())
+    presentes = estados.count('presente')
+    justificados = estados.count('justificado')
+    ausentes = estados.count('ausente')
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("👥 Total", total_jogadores)
+    with col2:
+        st.metric("✓ Presentes", presentes, delta=f"{presentes}/{total_jogadores}")
+    with col3:
+        st.metric("! Justificados", justificados, delta=f"{justificados}/{total_jogadores}")
+    with col4:
+        st.metric("✗ Ausentes", ausentes, delta=f"{ausentes}/{total_jogadores}")
+
+def lista_presencas():
+    """Gestão de lista de presenças para treinos e jogos"""
+    dados = carregar_dados()
+    
+    st.title("📋 Lista de Presenças")
+    st.markdown("Controle de presenças em treinos e jogos da equipa.")
+    
+    jogadores = dados.get('jogadores', [])
+    if not jogadores:
+        st.warning("⚠️ Nenhum jogador cadastrado.")
+        return
+    
+    # Abas para treinos, jogos e análise
+    tab1, tab2, tab3 = st.tabs(["🏃 Treinos", "⚽ Jogos", "📈 Análise"])
+    
+    with tab1:
+        st.markdown("### 🏃 Presenças em Treinos")
+        
+        # Obter lista de treinos
+        treinos_dict = dados.get('treinos', {})
+        
+        # Criar lista de treinos ordenados por data (mais recentes primeiro)
+        treinos_list = []
+        for data_str, treino_info in treinos_dict.items():
+            try:
+                datetime.strptime(data_str, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                continue
+            if isinstance(treino_info, dict):
+                treinos_list.append((data_str, treino_info))
+        
+        treinos_list.sort(key=lambda x: x[0], reverse=True)
+        
+        if not treinos_list:
+            st.info("ℹ️ Nenhum treino cadastrado.")
+        else:
+            # Selectbox para escolher treino
+            opcoes_treinos = [f"{data} - {info.get('titulo', 'Treino sem título')}" for data, info in treinos_list]
+            treino_selecionado_idx = st.selectbox("Escolha um treino:", range(len(opcoes_treinos)), format_func=lambda i: opcoes_treinos[i])
+            
+            data_treino, info_treino = treinos_list[treino_selecionado_idx]
+            chave_editor = f"editor_presencas_treino_{data_treino}"
+            
+            st.markdown(f"#### 📅 {data_treino}")
+            st.markdown(f"**Título:** {info_treino.get('titulo', 'N/A')}")
+            st.markdown(f"**Hora:** {info_treino.get('hora', 'N/A')}")
+            st.markdown(f"**Local:** {info_treino.get('local', 'N/A')}")
+            
+            st.markdown("---")
+            st.markdown("### 👥 Marcar Presenças")
+            
+            # Edição em lote
+            col_lote1, col_lote2 = st.columns(2)
+            
+            with col_lote1:
+                marcar_presentes = st.button("✅ Marcar todos presentes", use_container_width=True)
+            
+            with col_lote2:
+                copiar_anterior = st.button("📋 Copiar da última sessão", use_container_width=True)
+            
+            if marcar_presentes or copiar_anterior:
+                if marcar_presentes:
+                    novas_presencas = marcar_todos(
+                        normalizar_presencas(info_treino.get('presencas'), jogadores),
+                        [j['nome'] for j in jogadores if j.get('nome')]
+                    )
+                else:
+                    novas_presencas = normalizar_presencas(copiar_sessao_anterior(treinos_dict, data_treino), jogadores)
+                
+                if not novas_presencas:
+                    st.warning("⚠️ Nenhuma sessão anterior com presenças registadas.")
+                else:
+                    info_treino['presencas'] = novas_presencas
+                    if salvar_dados(dados):
+                        # Descartar edições pendentes da grelha antiga
+                        st.session_state.pop(chave_editor, None)
+                        st.success("✅ Presenças atualizadas!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao guardar presenças.")
+            
+            # Formulário para marcar presenças
+            with st.form("form_presencas_treino"):
+                presencas_atualizadas = editor_presencas(info_treino.get('presencas'), jogadores, chave_editor)
+                
+                submit_btn = st.form_submit_button("💾 Guardar Presenças", use_container_width=True, type="primary")
+                
+                if submit_btn:
+                    info_treino['presencas'] = presencas_atualizadas
+                    
+                    if salvar_dados(dados):
+                        st.success("✅ Presenças guardadas com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao guardar presenças.")
+            
+            # Estatísticas rápidas
+            st.markdown("---")
+            st.markdown("### 📊 Resumo")
+            mostrar_resumo_presencas(presencas_atualizadas, len(jogadores))
+            
+            # === EXPORTAR PARA PDF ===
+            st.markdown("---")
+            st.markdown("### 📄 Exportar")
+            
+            if st.button("📥 Exportar para PDF", use_container_width=True, type="primary", help="Gerar folha de presença em PDF (com assiduidade)"):
+                pedir_pdf("Folha de Presenças", 'gerar_pdf_folha_presenca_profissional', dados)
+    
+    with tab2:
+        st.markdown("### ⚽ Presenças em Jogos")
+        
+        # Lista de jogos
+        jogos = dados.get('jogos', [])
+        
+        if not jogos:
+            st.info("ℹ️ Nenhum jogo cadastrado.")
+        else:
+            # Ordenar jogos por data
+            jogos_sorted = sorted(jogos, key=lambda x: x.get('data', ''), reverse=True)
+            
+            opcoes_jogos = [f"{j.get('data', 'Data N/A')} - {j.get('adversario', 'Adversário N/A')}" for j in jogos_sorted]
+            jogo_selecionado_idx = st.selectbox("Escolha um jogo:", range(len(opcoes_jogos)), format_func=lambda i: opcoes_jogos[i], key="select_jogo_presencas")
+            
+            # O jogo selecionado é o próprio dicionário da lista de dados
+            jogo_selecionado = jogos_sorted[jogo_selecionado_idx]
+            
+            st.markdown(f"#### ⚽ {jogo_selecionado.get('adversario', 'Jogo')}")
+            st.markdown(f"**Data:** {jogo_selecionado.get('data', 'N/A')}")
+            st.markdown(f"**Hora:** {jogo_selecionado.get('hora', 'N/A')}")
+            st.markdown(f"**Local:** {jogo_selecionado.get('local', 'N/A')}")
+            
+            st.markdown("---")
+            st.markdown("### 👥 Marcar Presenças")
+            
+            with st.form("form_presencas_jogo"):
+                presencas_atualizadas = editor_presencas(
+                    jogo_selecionado.get('presencas'), jogadores,
+                    f"editor_presencas_jogo_{jogo_selecionado.get('data')}_{jogo_selecionado.get('adversario')}"
+                )
+                
+                submit_btn = st.form_submit_button("💾 Guardar Presenças", use_container_width=True, type="primary")
+                
+                if submit_btn:
+                    jogo_selecionado['presencas'] = presencas_atualizadas
+                    
+                    if salvar_dados(dados):
+                        st.success("✅ Presenças guardadas com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro ao guardar presenças.")
+            
+            st.markdown("---")
+            st.markdown("### 📊 Resumo")
+            mostrar_resumo_presencas(presencas_atualizadas, len(jogadores))
+    
+    with tab3:
+        st.markdown("### 📈 Assiduidade nos Treinos")
+        
+        matriz = obter_matriz_presencas()
+        if not matriz.datas:
+            st.info("ℹ️ Sem treinos com presenças registadas.")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        
+        taxa_equipa = matriz.taxa_equipa()
+        disponibilidade = matriz.disponibilidade_equipa()
+        
+        with col1:
+            st.metric("🏃 Sessões", len(matriz.datas))
+        with col2:
+            st.metric("✅ Assiduidade", f"{taxa_equipa:.0f}%" if taxa_equipa is not None else "-")
+        with col3:
+            st.metric("📈 Disponibilidade (4 sem.)", f"{disponibilidade:.0f}%" if disponibilidade is not None else "-")
+        
+        st.markdown("#### 👥 Por Jogador")
+        st.dataframe(
+            matriz.resumo().sort_values('Taxa %', ascending=False),
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        st.markdown("#### 📉 Disponibilidade Móvel (4 semanas)")
+        st.line_chart(matriz.serie_disponibilidade())
+        
+        with st.expander("🗓️ Matriz Jogadores × Sessões"):
+            st.dataframe(matriz.tabela(), use_container_width=True)
+
+def mostrar_submenu_treinos_planos():
+    """Submenu reorganizado para Treinos & Planos"""
+    st.markdown("### 💪 Treinos & Planos")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("💪 Treinos", use_container_width=True, help="Gerir treinos individuais"):
+            st.session_state.pagina_atual = "treinos"
+            st.rerun()
+    
+    with col2:
+        if st.button("🎯 Esquemas Táticos", use_container_width=True, help="Criar esquemas táticos"):
+            st.session_state.pagina_atual = "esquemas_taticos"
+            st.rerun()
+    
+    with col3:
+        if st.button("📋 Planos de Treinos", use_container_width=True, help="Planos mensais e semanais"):
+            st.session_state.pagina_atual = "planos_treinos"
+            st.rerun()
+    
+    # Segunda linha para planos específicos
+    col4, col5, col6 = st.columns(3)
+    
+    with col4:
+        if st.button("📅 Plano Mensal", use_container_width=True, help="Calendário mensal de treinos"):
+            st.session_state.pagina_atual = "plano_mensal"
+            st.rerun()
+    
+    with col5:
+        if st.button("📊 Plano Semanal", use_container_width=True, help="Calendário semanal de treinos"):
+            st.session_state.pagina_atual = "plano_semanal"
+            st.rerun()
+    
+    with col6:
+        if st.button("📋 Presenças", use_container_width=True, help="Presenças e assiduidade nos treinos"):
+            st.session_state.pagina_atual = "presencas"
+            st.rerun()
+
+def planos_treinos_treinador():
+    """Página de Planos de Treinos para Treinadores - Acesso Direto aos Calendários"""
+    st.title("  Planos de Treinos")
+    
+    dados = carregar_dados()
+    jogadores = dados.get('jogadores', [])
+    
+    if not jogadores:
+        st.warning("⚠️ Nenhum jogador cadastrado ainda.")
+        return
+    
+    # Seleção de jogador (sempre visível no topo)
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        nomes_jogadores = [j.get('nome', 'Sem nome') for j in jogadores]
+        jogador_selecionado = st.selectbox(
+            "👤 Selecione o jogador para ver seus planos:",
+            nomes_jogadores,
+            key="plano_treinador_jogador"
+        )
+    
+    with col2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🔄 Atualizar", use_container_width=True):
+            st.rerun()
+    
+    if jogador_selecionado:
+        # Encontrar o jogador selecionado
+        jogador_obj = None
+        for j in jogadores:
+            if j.get('nome') == jogador_selecionado:
+                jogador_obj = j
+                break
+        
+        if jogador_obj:
+            st.session_state['jogador_id'] = jogador_obj.get('id')
+            st.session_state['jogador_nome'] = jogador_obj.get('nome')
+            
+            # Mostrar informações do jogador
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #1976d2, #42a5f5);
+                color: white;
+                padding: 15px;
+                border-radius: 10px;
+                margin-bottom: 20px;
+                text-align: center;
+            ">
+                <h3 style="margin: 0;">⚽ {jogador_obj.get('nome')}</h3>
+                <p style="margin: 5px 0 0 0; opacity: 0.9;">Planos de Treinos</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Abas para visualização
+            tab1, tab2 = st.tabs(["📅 Calendário Mensal", "📊 Calendário Semanal"])
+            
+            with tab1:
+                st.markdown("### 📅 Plano Mensal de Treinos")
+                plano_treinos_mensal_jogador()
+            
+            with tab2:
+                st.markdown("### 📊 Plano Semanal de Treinos")
+                plano_treinos_semanal_jogador()
@@ -0,0 +1,208 @@
+"""
+Matriz de Presenças (jogadores × sessões)
+Códigos numéricos numa matriz NumPy com taxas, sequências e disponibilidade móvel vetorizadas
+"""
+
+from datetime import datetime, date, timedelta
+
+from lazy_imports import modulo_lazy
+
+np = modulo_lazy('numpy')  # importado no primeiro cálculo, não no arranque da app
+
+# Códigos da matriz (SEM_REGISTO inclui estados como 'pendente')
+SEM_REGISTO = -1
+AUSENTE = 0
+JUSTIFICADO = 1
+PRESENTE = 2
+
+CODIGOS = {'ausente': AUSENTE, 'justificado': JUSTIFICADO, 'presente': PRESENTE}
+SIMBOLOS = {SEM_REGISTO: '', AUSENTE: '✗', JUSTIFICADO: '!', PRESENTE: '✓'}
+
+
+def _data_valida(texto):
+    try:
+        return datetime.strptime(str(texto)[:10], '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def mapa_chaves_jogadores(jogadores):
+    """Mapa de chaves aceites (nome, nome sem espaços extra, id) para o nome do jogador"""
+    chaves = {}
+    for jogador in jogadores:
+        if not jogador.get('nome'):
+            continue
+        chaves[jogador['nome']] = jogador['nome']
+        chaves[jogador['nome'].strip()] = jogador['nome']
+        if jogador.get('id'):
+            chaves[str(jogador['id'])] = jogador['nome']
+    return chaves
+
+
+def normalizar_presencas(presencas, jogadores):
+    """Presenças com chaves pelo nome do jogador (converte registos antigos por id)"""
+    chaves = mapa_chaves_jogadores(jogadores)
+    normalizadas = {}
+    for chave, estado in (presencas or {}).items():
+        nome = chaves.get(chave) or chaves.get(str(chave).strip())
+        normalizadas[nome or chave] = estado
+    return normalizadas
+
+
+class MatrizPresencas:
+    """Presenças em treinos como matriz int8 (linhas: jogadores, colunas: sessões por data)"""
+
+    def __init__(self, nomes, datas, matriz):
+        self.nomes = list(nomes)
+        self.datas = list(datas)
+        self.matriz = matriz
+        self._linhas = {nome: i for i, nome in enumerate(self.nomes)}
+
+    @classmethod
+    def from_dados(cls, dados):
+        """Constrói a matriz a partir de `treinos[data]['presencas']` (chaves por nome ou id)"""
+        jogadores = [j for j in dados.get('jogadores', []) if j.get('nome')]
+        nomes = [j['nome'] for j in jogadores]
+        chaves = mapa_chaves_jogadores(jogadores)
+
+        sessoes = sorted(
+            (data, treino) for data, treino in dados.get('treinos', {}).items()
+            if isinstance(treino, dict) and _data_valida(data)
+        )
+        datas = [_data_valida(data) for data, _ in sessoes]
+
+        matriz = np.full((len(nomes), len(sessoes)), SEM_REGISTO, dtype=np.int8)
+        linhas = {nome: i for i, nome in enumerate(nomes)}
+        for coluna, (_, treino) in enumerate(sessoes):
+            for chave, estado in (treino.get('presencas') or {}).items():
+                nome = chaves.get(chave) or chaves.get(str(chave).strip())
+                codigo = CODIGOS.get(estado)
+                if nome is not None and codigo is not None:
+                    matriz[linhas[nome], coluna] = codigo
+
+        return cls(nomes, datas, matriz)
+
+    # === MÉTRICAS VETORIZADAS ===
+    def contagens(self):
+        """Array (jogadores × 3) com presenças, justificadas e faltas"""
+        return np.stack([
+            (self.matriz == PRESENTE).sum(axis=1),
+            (self.matriz == JUSTIFICADO).sum(axis=1),
+            (self.matriz == AUSENTE).sum(axis=1),
+        ], axis=1)
+
+    @staticmethod
+    def _taxas(matriz):
+        registados = (matriz != SEM_REGISTO).sum(axis=1)
+        presentes = (matriz == PRESENTE).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(registados > 0, presentes * 100.0 / registados, np.nan)
+
+    def taxas(self):
+        """Taxa de presença (%) por jogador sobre as sessões com registo (NaN sem registos)"""
+        return self._taxas(self.matriz)
+
+    def sequencias(self):
+        """Presenças consecutivas mais recentes por jogador (sessões sem registo são ignoradas)"""
+        if not self.datas:
+            return np.zeros(len(self.nomes), dtype=int)
+
+        invertida = self.matriz[:, ::-1]
+        quebra = (invertida != SEM_REGISTO) & (invertida != PRESENTE)
+        presentes_acumulados = np.cumsum(invertida == PRESENTE, axis=1)
+
+        # Índice da primeira quebra (ou fim da linha) e presenças antes dela
+        fim = np.where(quebra.any(axis=1), quebra.argmax(axis=1), invertida.shape[1])
+        linhas = np.arange(len(self.nomes))
+        return np.where(fim > 0, presentes_acumulados[linhas, np.maximum(fim - 1, 0)], 0)
+
+    def disponibilidade(self, semanas=4, hoje=None):
+        """Taxa de presença (%) por jogador nas sessões das últimas `semanas` semanas"""
+        hoje = hoje or date.today()
+        inicio = hoje - timedelta(weeks=semanas)
+        colunas = np.array([inicio < data <= hoje for data in self.datas], dtype=bool)
+        if not colunas.any():
+            return np.full(len(self.nomes), np.nan)
+        return self._taxas(self.matriz[:, colunas])
+
+    def serie_disponibilidade(self, semanas=4):
+        """Série temporal da taxa de presença da equipa numa janela móvel de `semanas` semanas"""
+        import pandas as pd
+
+        if not self.datas:
+            return pd.Series(dtype=float)
+
+        registados = pd.Series((self.matriz != SEM_REGISTO).sum(axis=0), index=pd.to_datetime(self.datas))
+        presentes = pd.Series((self.matriz == PRESENTE).sum(axis=0), index=pd.to_datetime(self.datas))
+        janela = f"{semanas * 7}D"
+        serie = presentes.rolling(janela).sum() * 100.0 / registados.rolling(janela).sum()
+        return serie.where(registados.rolling(janela).sum() > 0)
+
+    # === VISTAS ===
+    def taxa(self, nome):
+        """Taxa de presença (%) de um jogador, ou None sem registos"""
+        linha = self._linhas.get(nome)
+        if linha is None:
+            return None
+        valor = self.taxas()[linha]
+        return None if np.isnan(valor) else float(valor)
+
+    def taxa_equipa(self):
+        """Taxa de presença (%) global, ou None sem registos"""
+        registados = int((self.matriz != SEM_REGISTO).sum())
+        return (int((self.matriz == PRESENTE).sum()) * 100.0 / registados) if registados else None
+
+    def disponibilidade_equipa(self, semanas=4, hoje=None):
+        """Taxa de presença (%) da equipa nas últimas `semanas` semanas, ou None sem registos"""
+        hoje = hoje or date.today()
+        inicio = hoje - timedelta(weeks=semanas)
+        janela = self.matriz[:, [i for i, data in enumerate(self.datas) if inicio < data <= hoje]]
+        registados = int((janela != SEM_REGISTO).sum())
+        return (int((janela == PRESENTE).sum()) * 100.0 / registados) if registados else None
+
+    def resumo(self, hoje=None):
+        """DataFrame com contagens, taxa, sequência e disponibilidade a 4 semanas por jogador"""
+        import pandas as pd
+
+        contagens = self.contagens()
+        return pd.DataFrame({
+            'Jogador': self.nomes,
+            '✓ Presenças': contagens[:, 0],
+            '! Justificadas': contagens[:, 1],
+            '✗ Faltas': contagens[:, 2],
+            'Taxa %': np.round(self.taxas(), 1),
+            '🔥 Sequência': self.sequencias(),
+            'Disp. 4 sem. %': np.round(self.disponibilidade(hoje=hoje), 1),
+        })
+
+    def tabela(self):
+        """DataFrame jogadores × sessões com símbolos (✓ ! ✗)"""
+        import pandas as pd
+
+        simbolos = np.vectorize(SIMBOLOS.get, otypes=[object])(self.matriz) if self.matriz.size else self.matriz
+        return pd.DataFrame(
+            simbolos,
+            index=self.nomes,
+            columns=[data.strftime('%d/%m') for data in self.datas]
+        )
+
+
+# === EDIÇÃO EM LOTE ===
+def marcar_todos(presencas, nomes, estado='presente'):
+    """Devolve uma cópia de `presencas` com todos os jogadores no estado indicado"""
+    atualizadas = dict(presencas or {})
+    for nome in nomes:
+        atualizadas[nome] = estado
+    return atualizadas
+
+
+def copiar_sessao_anterior(treinos, data_sessao):
+    """Presenças da sessão anterior com registos (dicionário vazio se não existir)"""
+    anteriores = sorted(
+        data for data, treino in treinos.items()
+        if data < data_sessao and isinstance(treino, dict) and treino.get('presencas')
+        and _data_valida(data)
+    )
+    if not anteriores:
+        return {}
+    return dict(treinos[anteriores[-1]]['presencas'])
@@ -0,0 +1,290 @@
+"""
+Restauro de Backups em Streaming
+Lê o backup coleção a coleção, valida esquema e checksum e troca o ficheiro de dados de forma atómica
+"""
+
+import os
+import json
+import codecs
+import hashlib
+
+from persistence_pipeline import membro_indentado
+
+# Tipo esperado para cada coleção conhecida (as restantes aceitam qualquer JSON)
+ESQUEMA_COLECOES = {
+    'jogadores': list,
+    'jogos': list,
+    'treinos': dict,
+    'taticas': list,
+    'exercicios': dict,
+    'treinadores': list,
+    'planos_treino': list,
+    'esquemas_taticos': list,
+    'campeonato': dict,
+    'taca': dict,
+    'fichas_campeonato': dict,
+}
+
+# Coleções que têm de existir depois do restauro
+COLECOES_OBRIGATORIAS = ['jogadores', 'jogos', 'treinos', 'taticas', 'exercicios']
+
+# Chave do invólucro usado por backup_automatico/criar_backup_manual
+CHAVE_DADOS = 'dados'
+CHAVE_CHECKSUMS = 'checksums'
+
+# Metadados conhecidos dos invólucros de backup (não são coleções)
+CHAVES_METADADOS = {
+    'data_backup', 'tipo_backup', 'versao_app', 'usuario', 'timestamp',
+    'source', 'metadata', 'hash', CHAVE_CHECKSUMS,
+}
+
+TAMANHO_BLOCO = 64 * 1024
+
+
+class ErroRestauro(Exception):
+    """Erro de validação ou leitura durante o restauro"""
+
+
+def checksum_colecao(valor):
+    """Checksum (SHA-256 do JSON compacto) de uma coleção, igual ao do pipeline de persistência"""
+    compacto = json.dumps(valor, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(compacto.encode('utf-8')).hexdigest()
+
+
+def validar_colecao(nome, valor):
+    """Valida o tipo e a forma básica de uma coleção; lança ErroRestauro se inválida"""
+    tipo = ESQUEMA_COLECOES.get(nome)
+    if tipo is None:
+        return
+
+    if not isinstance(valor, tipo):
+        raise ErroRestauro(f"Coleção '{nome}' devia ser {tipo.__name__}, encontrado {type(valor).__name__}")
+
+    if nome in ('jogadores', 'jogos', 'treinadores'):
+        for i, item in enumerate(valor):
+            if not isinstance(item, dict):
+                raise ErroRestauro(f"Coleção '{nome}': item {i} não é um objeto")
+        if nome == 'jogadores':
+            for i, jogador in enumerate(valor):
+                if 'nome' not in jogador:
+                    raise ErroRestauro(f"Coleção 'jogadores': item {i} sem 'nome'")
+    elif nome == 'treinos':
+        for data_treino, treino in valor.items():
+            if not isinstance(treino, dict):
+                raise ErroRestauro(f"Coleção 'treinos': treino '{data_treino}' não é um objeto")
+
+
+class LeitorJSONIncremental:
+    """Lê um objeto JSON de topo membro a membro sem carregar o ficheiro inteiro"""
+
+    def __init__(self, fonte, tamanho_bloco=TAMANHO_BLOCO):
+        self.fonte = fonte
+        self.tamanho_bloco = tamanho_bloco
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_lidos = 0
+
+    def _ler_mais(self, minimo=None):
+        """Acrescenta pelo menos `minimo` bytes ao buffer (False quando chega ao fim)"""
+        if self.eof:
+            return False
+        pedido = max(self.tamanho_bloco, minimo or 0)
+        bloco = self.fonte.read(pedido)
+        if not bloco:
+            self.eof = True
+            self.buffer += self.utf8.decode(b"", final=True)
+            return False
+        if isinstance(bloco, str):
+            bloco = bloco.encode('utf-8')
+        self.bytes_lidos += len(bloco)
+        # Descartar o que já foi consumido para manter o buffer pequeno
+        self.buffer = self.buffer[self.pos:] + self.utf8.decode(bloco)
+        self.pos = 0
+        return True
+
+    def _saltar_espacos(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._ler_mais():
+                return
+
+    def _espreitar(self):
+        self._saltar_espacos()
+        if self.pos >= len(self.buffer):
+            raise ErroRestauro("Fim inesperado do ficheiro")
+        return self.buffer[self.pos]
+
+    def _esperar(self, caractere):
+        if self._espreitar() != caractere:
+            raise ErroRestauro(f"JSON inválido: esperado '{caractere}' na posição {self.bytes_lidos}")
+        self.pos += 1
+
+    def _ler_valor(self):
+        """Descodifica o próximo valor, lendo mais blocos até estar completo"""
+        self._saltar_espacos()
+        while True:
+            try:
+                valor, fim = self.decoder.raw_decode(self.buffer, self.pos)
+                # Um número no fim do buffer pode estar truncado
+                if fim == len(self.buffer) and not self.eof and not isinstance(valor, (dict, list, str)):
+                    raise json.JSONDecodeError("valor possivelmente truncado", self.buffer, fim)
+                self.pos = fim
+                return valor
+            except json.JSONDecodeError as e:
+                # Crescimento geométrico evita re-decodificações quadráticas
+                if not self._ler_mais(minimo=len(self.buffer) - self.pos):
+                    raise ErroRestauro(f"JSON inválido: {e.msg}")
+
+    def membros(self, descer_em=None, profundidade=0):
+        """Gera (chave, valor, profundidade) do objeto de topo, descendo no objeto `descer_em`"""
+        self._esperar('{')
+        if self._espreitar() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            chave = self._ler_valor()
+            if not isinstance(chave, str):
+                raise ErroRestauro("JSON inválido: chave de objeto não é texto")
+            self._esperar(':')
+
+            if descer_em is not None and chave == descer_em and self._espreitar() == '{':
+                for membro in self.membros(profundidade=profundidade + 1):
+                    yield membro
+            else:
+                yield chave, self._ler_valor(), profundidade
+
+            separador = self._espreitar()
+            self.pos += 1
+            if separador == '}':
+                return
+            if separador != ',':
+                raise ErroRestauro(f"JSON inválido: separador '{separador}' inesperado")
+
+
+def _tamanho_fonte(fonte):
+    """Tamanho total da fonte (para a barra de progresso), ou None se desconhecido"""
+    try:
+        atual = fonte.tell()
+        total = fonte.seek(0, os.SEEK_END)
+        fonte.seek(atual)
+        return total or None
+    except Exception:
+        return getattr(fonte, 'size', None)
+
+
+def _iterar_backup(fonte):
+    """Gera (leitor, chave, valor, e_metadado) para backups com ou sem invólucro 'dados'"""
+    leitor = LeitorJSONIncremental(fonte)
+    for chave, valor, profundidade in leitor.membros(descer_em=CHAVE_DADOS):
+        e_metadado = profundidade == 0 and chave in CHAVES_METADADOS
+        yield leitor, chave, valor, e_metadado
+
+
+def resumir_backup(fonte, amostra=3):
+    """Resumo leve (metadados, contagens e amostras) de um backup lido em streaming"""
+    fonte.seek(0)
+    metadados = {}
+    contagens = {}
+    amostras = {}
+
+    for _, chave, valor, e_metadado in _iterar_backup(fonte):
+        if e_metadado:
+            if chave != CHAVE_CHECKSUMS:
+                metadados[chave] = valor
+            continue
+        contagens[chave] = len(valor) if isinstance(valor, (dict, list)) else 1
+        if chave == 'jogadores' and isinstance(valor, list):
+            amostras['jogadores'] = [j.get('nome', 'N/A') for j in valor[:amostra] if isinstance(j, dict)]
+        elif chave == 'treinos' and isinstance(valor, dict):
+            amostras['treinos'] = [t.get('nome', 'N/A') for t in list(valor.values())[:amostra] if isinstance(t, dict)]
+
+    fonte.seek(0)
+    return {'metadados': metadados, 'contagens': contagens, 'amostras': amostras}
+
+
+def restaurar_backup_streaming(fonte, destino, progresso=None):
+    """Restaura um backup para `destino` via ficheiro de staging trocado atomicamente
+
+    Devolve (True, relatorio) em caso de sucesso ou (False, mensagem) em caso de erro.
+    `progresso(fracao, mensagem)` é chamado após cada coleção.
+    """
+    staging = f"{destino}.staging"
+    total = _tamanho_fonte(fonte)
+    try:
+        fonte.seek(0)
+    except Exception:
+        pass
+
+    relatorio = {'colecoes': {}, 'checksums_verificados': 0, 'bytes': 0}
+    checksums = {}
+    calculados = {}  # verificados no fim: os checksums podem vir antes ou depois das coleções
+
+    try:
+        dir_path = os.path.dirname(destino)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        with open(staging, 'w', encoding='utf-8') as saida:
+            # Mesmo formato indentado que o pipeline grava no ficheiro de dados
+            saida.write('{')
+            primeira = True
+            escritas = set()
+
+            for leitor, chave, valor, e_metadado in _iterar_backup(fonte):
+                # Metadados do invólucro (data_backup, tipo_backup, checksums...)
+                if e_metadado:
+                    if chave == CHAVE_CHECKSUMS and isinstance(valor, dict):
+                        checksums = valor
+                    continue
+
+                validar_colecao(chave, valor)
+                calculados[chave] = checksum_colecao(valor)
+
+                saida.write('\n' if primeira else ',\n')
+                saida.write(membro_indentado(chave, valor))
+                primeira = False
+                escritas.add(chave)
+                relatorio['colecoes'][chave] = len(valor) if isinstance(valor, (dict, list)) else 1
+
+                if progresso:
+                    fracao = min(leitor.bytes_lidos / total, 1.0) if total else 0.0
+                    progresso(fracao, f"Coleção '{chave}' validada")
+
+            for chave, esperado in checksums.items():
+                if chave in calculados:
+                    if calculados[chave] != esperado:
+                        raise ErroRestauro(f"Checksum inválido na coleção '{chave}'")
+                    relatorio['checksums_verificados'] += 1
+
+            # Garantir estrutura mínima
+            for chave in COLECOES_OBRIGATORIAS:
+                if chave not in escritas:
+                    vazio = {} if ESQUEMA_COLECOES[chave] is dict else []
+                    saida.write('\n' if primeira else ',\n')
+                    saida.write(membro_indentado(chave, vazio))
+                    primeira = False
+                    relatorio['colecoes'][chave] = 0
+
+            saida.write('}' if primeira else '\n}')
+            saida.flush()
+            os.fsync(saida.fileno())
+
+        relatorio['bytes'] = os.path.getsize(staging)
+        os.replace(staging, destino)
+
+        if progresso:
+            progresso(1.0, "Restauro concluído")
+        return True, relatorio
+
+    except (ErroRestauro, UnicodeDecodeError, OSError) as e:
+        if os.path.exists(staging):
+            try:
+                os.remove(staging)
+            except OSError:
+                pass
+        return False, str(e)
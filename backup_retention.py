@@ -0,0 +1,235 @@
+"""
+Política de Retenção de Backups (avô-pai-filho)
+Mantém snapshots horários, diários, semanais e por jornada dentro de um orçamento de bytes
+"""
+
+import os
+import re
+import glob
+from datetime import datetime, timedelta
+
+# Padrões de ficheiros de snapshot conhecidos pela app
+PADROES_SNAPSHOT = [
+    "backup_automatico_*.json",
+    os.path.join("data", "backups", "backup_*.json"),
+]
+
+# Ficheiros únicos (reescritos a cada gravação) que contam para o orçamento. O emergency_backup.json
+# nunca entra na retenção: é a última cópia boa justamente quando as gravações falham há dias
+FICHEIROS_UNICOS = [
+    "session_checkpoint.json",  # formato antigo (ficheiro partilhado)
+]
+
+_REGEX_TIMESTAMP = re.compile(r"(\d{8}_\d{6})")
+
+
+def _ler_int_env(nome, padrao):
+    """Lê um inteiro de uma variável de ambiente com fallback seguro"""
+    try:
+        return int(os.environ.get(nome, padrao))
+    except (TypeError, ValueError):
+        return padrao
+
+
+def extrair_datas_jogos(dados):
+    """Devolve o conjunto de datas (YYYY-MM-DD) de todos os jogos e jornadas"""
+    datas = set()
+    if not dados:
+        return datas
+
+    for jogo in dados.get('jogos', []):
+        if jogo.get('data'):
+            datas.add(str(jogo['data'])[:10])
+
+    for jornada in dados.get('campeonato', {}).get('jornadas', []):
+        if jornada.get('data'):
+            datas.add(str(jornada['data'])[:10])
+        for jogo in jornada.get('jogos', []):
+            if jogo.get('data'):
+                datas.add(str(jogo['data'])[:10])
+
+    for jogo in dados.get('taca', {}).get('jogos', []):
+        if isinstance(jogo, dict) and jogo.get('data'):
+            datas.add(str(jogo['data'])[:10])
+
+    return datas
+
+
+class BackupRetentionPolicy:
+    """Motor de retenção GFS com catálogo de snapshots e limpeza num único passo"""
+
+    def __init__(self, horarios=24, diarios=14, semanais=8, jornadas=10,
+                 orcamento_bytes=50 * 1024 * 1024, max_idade_unicos_dias=7):
+        self.horarios = horarios
+        self.diarios = diarios
+        self.semanais = semanais
+        self.jornadas = jornadas
+        self.orcamento_bytes = orcamento_bytes
+        self.max_idade_unicos_dias = max_idade_unicos_dias
+
+    @classmethod
+    def from_env(cls):
+        """Cria a política a partir das variáveis de ambiente BACKUP_RETENCAO_*"""
+        return cls(
+            horarios=_ler_int_env('BACKUP_RETENCAO_HORARIOS', 24),
+            diarios=_ler_int_env('BACKUP_RETENCAO_DIARIOS', 14),
+            semanais=_ler_int_env('BACKUP_RETENCAO_SEMANAIS', 8),
+            jornadas=_ler_int_env('BACKUP_RETENCAO_JORNADAS', 10),
+            orcamento_bytes=_ler_int_env('BACKUP_RETENCAO_ORCAMENTO_MB', 50) * 1024 * 1024,
+            max_idade_unicos_dias=_ler_int_env('BACKUP_RETENCAO_UNICOS_DIAS', 7),
+        )
+
+    # === CATÁLOGO ===
+    @staticmethod
+    def catalogar(pastas=None):
+        """Lista todos os snapshots conhecidos com timestamp, tamanho e tipo"""
+        pastas = pastas or ["."]
+        catalogo = []
+        vistos = set()
+
+        for pasta in pastas:
+            for padrao in PADROES_SNAPSHOT:
+                for caminho in glob.glob(os.path.join(pasta, padrao)):
+                    caminho_real = os.path.normpath(caminho)
+                    if caminho_real in vistos:
+                        continue
+                    vistos.add(caminho_real)
+                    try:
+                        stat = os.stat(caminho_real)
+                    except OSError:
+                        continue
+
+                    # Preferir o timestamp do nome (sobrevive a cópias/restauros)
+                    match = _REGEX_TIMESTAMP.search(os.path.basename(caminho_real))
+                    timestamp = None
+                    if match:
+                        try:
+                            timestamp = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S')
+                        except ValueError:
+                            timestamp = None
+                    if timestamp is None:
+                        timestamp = datetime.fromtimestamp(stat.st_mtime)
+
+                    catalogo.append({
+                        'caminho': caminho_real,
+                        'timestamp': timestamp,
+                        'tamanho': stat.st_size,
+                        'tipo': 'snapshot',
+                    })
+
+            for nome in FICHEIROS_UNICOS:
+                caminho_real = os.path.normpath(os.path.join(pasta, nome))
+                if caminho_real in vistos or not os.path.exists(caminho_real):
+                    continue
+                vistos.add(caminho_real)
+                try:
+                    stat = os.stat(caminho_real)
+                except OSError:
+                    continue
+                catalogo.append({
+                    'caminho': caminho_real,
+                    'timestamp': datetime.fromtimestamp(stat.st_mtime),
+                    'tamanho': stat.st_size,
+                    'tipo': 'unico',
+                })
+
+        catalogo.sort(key=lambda entrada: entrada['timestamp'], reverse=True)
+        return catalogo
+
+    # === PLANEAMENTO ===
+    @staticmethod
+    def _manter_por_balde(snapshots, chave, limite):
+        """Mantém o snapshot mais recente de cada balde, até `limite` baldes"""
+        mantidos = set()
+        baldes = set()
+        if limite <= 0:
+            return mantidos
+
+        for entrada in snapshots:  # já ordenados do mais recente para o mais antigo
+            balde = chave(entrada['timestamp'])
+            if balde is None or balde in baldes:
+                continue
+            baldes.add(balde)
+            mantidos.add(entrada['caminho'])
+            if len(baldes) >= limite:
+                break
+        return mantidos
+
+    def planear(self, catalogo, datas_jogos=None, agora=None):
+        """Calcula o que manter e o que remover sem tocar no disco"""
+        agora = agora or datetime.now()
+        datas_jogos = datas_jogos or set()
+
+        snapshots = [e for e in catalogo if e['tipo'] == 'snapshot']
+        unicos = [e for e in catalogo if e['tipo'] == 'unico']
+
+        horarios = self._manter_por_balde(snapshots, lambda ts: ts.strftime('%Y%m%d%H'), self.horarios)
+        diarios = self._manter_por_balde(snapshots, lambda ts: ts.date(), self.diarios)
+        semanais = self._manter_por_balde(snapshots, lambda ts: ts.isocalendar()[:2], self.semanais)
+        jornadas = self._manter_por_balde(
+            snapshots,
+            lambda ts: ts.strftime('%Y-%m-%d') if ts.strftime('%Y-%m-%d') in datas_jogos else None,
+            self.jornadas
+        )
+
+        manter = horarios | diarios | semanais | jornadas
+        if snapshots:
+            manter.add(snapshots[0]['caminho'])  # nunca remover o mais recente
+
+        remover = [e for e in snapshots if e['caminho'] not in manter]
+
+        # Ficheiros únicos: removidos apenas quando obsoletos
+        limite_unicos = agora - timedelta(days=self.max_idade_unicos_dias)
+        remover.extend(e for e in unicos if e['timestamp'] < limite_unicos)
+
+        # Orçamento de bytes: cortar dos mais antigos, jornadas por último
+        removidos = {e['caminho'] for e in remover}
+        total = sum(e['tamanho'] for e in catalogo if e['caminho'] not in removidos)
+        if total > self.orcamento_bytes:
+            candidatos = [e for e in snapshots if e['caminho'] in manter and e is not snapshots[0]]
+            candidatos.sort(key=lambda e: (e['caminho'] in jornadas, e['timestamp']))
+            for entrada in candidatos:
+                if total <= self.orcamento_bytes:
+                    break
+                remover.append(entrada)
+                removidos.add(entrada['caminho'])
+                total -= entrada['tamanho']
+
+        return {
+            'manter': [e for e in catalogo if e['caminho'] not in removidos],
+            'remover': remover,
+            'total_bytes': total,
+        }
+
+    # === EXECUÇÃO ===
+    def aplicar(self, pastas=None, datas_jogos=None, agora=None):
+        """Cataloga, planeia e remove os excedentes num único passo"""
+        catalogo = self.catalogar(pastas)
+        plano = self.planear(catalogo, datas_jogos=datas_jogos, agora=agora)
+
+        removidos = 0
+        bytes_libertados = 0
+        for entrada in plano['remover']:
+            try:
+                os.remove(entrada['caminho'])
+                removidos += 1
+                bytes_libertados += entrada['tamanho']
+            except OSError:
+                pass
+
+        return {
+            'mantidos': len(plano['manter']),
+            'removidos': removidos,
+            'bytes_libertados': bytes_libertados,
+            'total_bytes': plano['total_bytes'],
+        }
+
+
+def aplicar_retencao(pastas=None, dados=None):
+    """Aplica a política de retenção configurada às pastas indicadas"""
+    try:
+        politica = BackupRetentionPolicy.from_env()
+        return politica.aplicar(pastas=pastas, datas_jogos=extrair_datas_jogos(dados))
+    except Exception as e:
+        print(f"Aviso: Erro ao aplicar retenção de backups: {e}")
+        return None
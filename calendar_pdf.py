@@ -0,0 +1,705 @@
+"""
+Motor de Calendários em PDF
+Treinos e jogos indexados por data, modelo de grelha mensal/semanal (em cache por mês e versão dos dados)
+e um único desenho em reportlab para todas as variantes, escolhidas por tema
+"""
+
+import json
+import hashlib
+import calendar
+from io import BytesIO
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from render_cache import RenderCache
+from pdf_resources import recursos_pdf, FONTES
+
+NOMES_MESES = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+               "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"]
+DIAS_SEMANA = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+DIAS_CURTOS = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+
+OPCOES_PADRAO = {
+    'destacar_fim_de_semana': True,
+    'mostrar_hora': True,
+    'compacto': False,
+    'fonte_grande': False,
+}
+
+# Um dia da grelha: `no_periodo` é falso para os dias dos meses vizinhos que completam as semanas
+DiaCalendario = namedtuple('DiaCalendario', 'data no_periodo fim_de_semana treinos jogos')
+# Grelha pronta a desenhar (partilhada pela cache: não deve ser alterada)
+GrelhaCalendario = namedtuple(
+    'GrelhaCalendario', 'tipo ano mes inicio fim semanas total_treinos total_jogos duracao_total'
+)
+
+# Grelhas por (tipo, período) e versão dos registos do(s) mês(es) que cobrem
+cache_grelhas = RenderCache(max_entradas=64)
+
+
+# === ÍNDICE DE DATAS ===
+def _data(valor):
+    """date de 'AAAA-MM-DD' (None se inválida)"""
+    try:
+        return datetime.strptime(str(valor)[:10], '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+class IndiceDatas:
+    """Treinos ({data: treino}) e jogos ([{'data': ...}]) agrupados por mês e dia numa só passagem"""
+
+    def __init__(self, treinos=None, jogos=()):
+        self._meses = {}
+        self._versoes = {}
+        for data_str, treino in (treinos or {}).items():
+            self._registar(data_str, 0, treino)
+        for jogo in jogos or ():
+            if isinstance(jogo, dict):
+                self._registar(jogo.get('data'), 1, jogo)
+
+    def _registar(self, data_str, posicao, registo):
+        data = _data(data_str)
+        if data is None:
+            return
+        dias = self._meses.setdefault((data.year, data.month), {})
+        dias.setdefault(data.isoformat(), ([], []))[posicao].append(registo)
+
+    def do_dia(self, data):
+        """(treinos, jogos) de uma date"""
+        treinos, jogos = self._meses.get((data.year, data.month), {}).get(data.isoformat(), ((), ()))
+        return tuple(treinos), tuple(jogos)
+
+    def versao_mes(self, ano, mes):
+        """Checksum dos registos do mês: muda quando um treino ou jogo do mês muda"""
+        if (ano, mes) not in self._versoes:
+            conteudo = json.dumps(self._meses.get((ano, mes), {}), sort_keys=True, default=str)
+            self._versoes[(ano, mes)] = hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+        return self._versoes[(ano, mes)]
+
+
+def mes_do_plano(plano):
+    """(ano, mês) de um plano: campos do plano, senão a data do primeiro treino, senão o mês atual"""
+    if plano.get('ano') and plano.get('mes'):
+        return int(plano['ano']), int(plano['mes'])
+    datas = [d for d in map(_data, plano.get('treinos', {})) if d]
+    referencia = min(datas) if datas else date.today()
+    return referencia.year, referencia.month
+
+
+# === MODELO DA GRELHA ===
+def _minutos(treino):
+    try:
+        return int(treino.get('duracao', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _construir_grelha(tipo, semanas_datas, periodo, indice):
+    inicio, fim = periodo
+    semanas = []
+    total_treinos = total_jogos = duracao = 0
+    for datas in semanas_datas:
+        semana = []
+        for data in datas:
+            no_periodo = inicio <= data <= fim
+            treinos, jogos = indice.do_dia(data) if no_periodo else ((), ())
+            total_treinos += len(treinos)
+            total_jogos += len(jogos)
+            duracao += sum(_minutos(t) for t in treinos)
+            semana.append(DiaCalendario(data, no_periodo, data.weekday() >= 5, treinos, jogos))
+        semanas.append(tuple(semana))
+    return GrelhaCalendario(tipo, inicio.year, inicio.month, inicio, fim, tuple(semanas),
+                            total_treinos, total_jogos, duracao)
+
+
+def grelha_mensal(indice, ano, mes):
+    """Semanas completas (segunda a domingo) do mês com os treinos/jogos de cada dia"""
+    def construir():
+        inicio = date(ano, mes, 1)
+        fim = date(ano, mes, calendar.monthrange(ano, mes)[1])
+        semanas = calendar.Calendar(firstweekday=0).monthdatescalendar(ano, mes)
+        return _construir_grelha('mensal', semanas, (inicio, fim), indice)
+
+    return cache_grelhas.obter(
+        'mensal', construir, parametros=(ano, mes), versoes=(indice.versao_mes(ano, mes),)
+    )
+
+
+def grelha_semanal(indice, inicio):
+    """Sete dias a partir de `inicio` (alinhar à segunda-feira antes, se for o caso)"""
+    if isinstance(inicio, datetime):
+        inicio = inicio.date()
+    fim = inicio + timedelta(days=6)
+    meses = sorted({(inicio.year, inicio.month), (fim.year, fim.month)})
+
+    def construir():
+        return _construir_grelha('semanal', [[inicio + timedelta(days=i) for i in range(7)]], (inicio, fim), indice)
+
+    return cache_grelhas.obter(
+        'semanal', construir, parametros=(inicio.isoformat(),),
+        versoes=tuple(indice.versao_mes(ano, mes) for ano, mes in meses)
+    )
+
+
+def grelha_do_plano(plano, indice):
+    """Grelha de um plano de treino: semanal a partir de `data_inicio` ou do mês do plano"""
+    if plano.get('tipo') == 'semanal':
+        return grelha_semanal(indice, datetime.strptime(plano.get('data_inicio'), '%Y-%m-%d').date())
+    return grelha_mensal(indice, *mes_do_plano(plano))
+
+
+# === TEMAS ===
+# Cada variante de calendário é um tema: página, secções pela ordem do documento e parâmetros de cada secção.
+# Cabeçalho: 'titulo' (parágrafos), 'logo' (logótipo ao lado da 1ª linha) ou 'faixas' (barras de cor).
+# Grelha: 'marcas' (número do dia + 🏃), 'linhas' (um dia por linha) ou 'celulas' (conteúdo do dia em cada célula).
+_ESTILOS_LISTA = {
+    'titulo': {'parent': 'Heading1', 'fontSize': 20, 'spaceAfter': 30, 'alignment': 1, 'textColor': 'darkblue'},
+    'secao': {'parent': 'Heading2', 'fontSize': 14, 'spaceAfter': 12, 'spaceBefore': 20, 'textColor': 'darkgreen'},
+}
+_CAMPOS_DETALHE = (('Nome', 'nome', 'Treino'), ('Tipo', 'tipo', 'TBD'), ('Hora', 'hora', 'TBD'),
+                   ('Local', 'local', 'TBD'), ('Duração', 'duracao', 'TBD'), ('Nível', 'nivel', 'TBD'))
+
+TEMAS = {
+    # Listagem mensal para arquivo: resumo, grelha de marcas e ficha de cada treino
+    'lista_mensal': {
+        'pagina': 'retrato', 'margens': (2, 2, 2, 2),
+        'secoes': ('cabecalho', 'resumo', 'grelha', 'detalhes', 'rodape'),
+        'estilos': _ESTILOS_LISTA,
+        'cabecalho': {'modo': 'titulo', 'linhas': (("📅 CALENDÁRIO DE TREINOS - {MES} {ano}", 'titulo'),)},
+        'resumo': {'modo': 'tabela', 'titulo': "ℹ️ INFORMAÇÕES GERAIS"},
+        'grelha': {'modo': 'marcas', 'titulo': "📅 CALENDÁRIO VISUAL"},
+        'detalhes': {'titulo': "🏃 TREINOS DO MÊS", 'campos': _CAMPOS_DETALHE, 'exercicios': False},
+        'rodape': {'modo': 'linha', 'texto': "Calendário gerado em {gerado} - FC Pinheirense 2025"},
+    },
+    # Listagem semanal: um dia por linha e ficha de cada treino com exercícios
+    'lista_semanal': {
+        'pagina': 'retrato', 'margens': (2, 2, 2, 2),
+        'secoes': ('cabecalho', 'resumo', 'grelha', 'detalhes', 'rodape'),
+        'estilos': _ESTILOS_LISTA,
+        'cabecalho': {'modo': 'titulo', 'linhas': (("📆 CALENDÁRIO SEMANAL DE TREINOS", 'titulo'),)},
+        'resumo': {'modo': 'tabela', 'titulo': "ℹ️ INFORMAÇÕES DA SEMANA"},
+        'grelha': {'modo': 'linhas', 'titulo': "📅 RESUMO DA SEMANA"},
+        'detalhes': {'titulo': "🏃 DETALHES DOS TREINOS",
+                     'campos': _CAMPOS_DETALHE + (('Categoria', 'categoria', 'TBD'),), 'exercicios': True},
+        'rodape': {'modo': 'linha', 'texto': "Calendário gerado em {gerado} - FC Pinheirense 2025"},
+    },
+    # Calendário para afixar (A4 paisagem numa página), cores do clube e logótipo
+    'profissional': {
+        'pagina': 'paisagem', 'margens': (1, 1, 0.5, 0.5),
+        'secoes': ('cabecalho', 'grelha', 'rodape'),
+        'estilos': {
+            'titulo': {'parent': 'Heading1', 'fontSize': 24, 'spaceAfter': 8, 'alignment': 1,
+                       'textColor': '#1a472a', 'fontName': FONTES['negrito']},
+            'subtitulo': {'fontSize': 16, 'spaceAfter': 5, 'alignment': 1, 'textColor': '#2d5016',
+                          'fontName': FONTES['negrito']},
+            'info': {'fontSize': 12, 'spaceAfter': 15, 'alignment': 1, 'textColor': '#2c2c2c'},
+        },
+        'cabecalho': {'modo': 'logo', 'linhas': (
+            ("⚽ FUTEBOL CLUBE PINHEIRENSE<br/>CALENDÁRIO DE TREINOS", 'titulo'),
+            ("{periodo}", 'subtitulo'),
+            ("<b>Plano:</b> {plano}", 'info'),
+        )},
+        'grelha': {
+            'modo': 'celulas', 'largura': 27, 'altura_semanal': 7, 'altura_mensal': 12.5,
+            'cor': '#1a472a', 'cor_treino': '#2d5016', 'cor_jogo': '#4a7c59', 'fundo_fim_de_semana': '#f8f8ff',
+            'numero': 16, 'texto': 9, 'abreviar': 12, 'detalhe_semanal': True, 'descanso': True,
+        },
+        'rodape': {'modo': 'texto', 'texto': "📅 Documento gerado em {gerado} | 🏆 Época 2025/2026"},
+    },
+    # Calendário mensal com células altas, fichas curtas dos treinos e legenda
+    'bonito': {
+        'pagina': 'paisagem', 'margens': (1, 1, 0.5, 0.5),
+        'secoes': ('cabecalho', 'grelha', 'legenda', 'rodape'),
+        'estilos': {
+            'titulo': {'parent': 'Heading1', 'fontSize': 22, 'spaceAfter': 6, 'alignment': 1,
+                       'textColor': '#1f4e79', 'fontName': FONTES['negrito']},
+            'subtitulo': {'fontSize': 14, 'spaceAfter': 6, 'alignment': 1, 'textColor': '#1f4e79',
+                          'fontName': FONTES['negrito']},
+        },
+        'cabecalho': {'modo': 'titulo', 'linhas': (
+            ("⚽ FUTEBOL CLUBE PINHEIRENSE", 'titulo'),
+            ("CALENDÁRIO DE TREINOS", 'subtitulo'),
+            ("{periodo}", 'subtitulo'),
+            ("<b>Plano:</b> {plano}", 'subtitulo'),
+        )},
+        'grelha': {
+            'modo': 'celulas', 'largura': 27, 'altura_semanal': 7, 'altura_mensal': 12,
+            'cor': '#1f4e79', 'cor_treino': '#1f4e79', 'cor_jogo': '#c55a11', 'fundo_fim_de_semana': '#fff5f5',
+            'numero': 12, 'texto': 8, 'abreviar': 15, 'dias_longos': True,
+            'detalhe_semanal': True, 'detalhe_mensal': True,
+        },
+        'rodape': {'modo': 'texto', 'texto': "📅 Calendário gerado em {gerado}"},
+    },
+    # Visual do email do plano mensal: faixas azuis, estatísticas e semanas completas com os dias vizinhos
+    'email': {
+        'pagina': 'paisagem', 'margens': (0.5, 0.5, 0.5, 0.5),
+        'secoes': ('cabecalho', 'resumo', 'grelha', 'rodape'),
+        'cabecalho': {'modo': 'faixas', 'largura': 25, 'linhas': (
+            ("⚽ FUTEBOL CLUBE PINHEIRENSE", '#1e3c72', 24),
+            ("CALENDÁRIO {tipo} - {MES} {ano}", '#2a5298', 18),
+        )},
+        'resumo': {'modo': 'faixa', 'largura': 25, 'cor': '#667eea'},
+        'grelha': {
+            'modo': 'celulas', 'largura': 24.5, 'altura_semanal': 6, 'altura_linha': 2.1, 'altura_compacta': 1.8,
+            'cor': '#1e3c72', 'cor_treino': '#1565c0', 'cor_jogo': '#ef6c00', 'fundo_fim_de_semana': '#f8f9fa',
+            'linhas_grelha': '#e9ecef', 'numero': 14, 'texto': 8, 'abreviar': 12,
+            'completar': True, 'hoje': '#fff9c4',
+        },
+        'rodape': {'modo': 'faixa', 'largura': 25, 'cor': '#1e3c72',
+                   'texto': "Calendário gerado automaticamente em {gerado} | Otimizado para visualização"},
+    },
+}
+
+# Temas oferecidos no calendário visual dos planos de treino
+TEMAS_PLANO = {
+    'profissional': "🏆 Profissional (cores do clube)",
+    'bonito': "🎨 Células grandes com legenda",
+    'email': "📧 Igual ao email",
+}
+
+
+# === DESENHO ===
+def _abreviar(texto, limite):
+    texto = str(texto)
+    return texto if len(texto) <= limite else texto[:limite - 2] + ".."
+
+
+def _hora(registo):
+    return registo.get('horario') or registo.get('hora') or ''
+
+
+def _contexto(grelha, plano):
+    mes = NOMES_MESES[grelha.mes - 1]
+    inicio, fim = grelha.inicio.strftime('%d/%m/%Y'), grelha.fim.strftime('%d/%m/%Y')
+    semanal = grelha.tipo == 'semanal'
+    return {
+        'mes': mes, 'MES': mes.upper(), 'ano': grelha.ano, 'inicio': inicio, 'fim': fim,
+        'tipo': 'SEMANAL' if semanal else 'MENSAL',
+        'periodo': f"📅 SEMANA: {inicio} a {fim}" if semanal else f"🗓️ {mes.upper()} {grelha.ano}",
+        'plano': plano or 'Calendário de Treinos',
+        'gerado': datetime.now().strftime('%d/%m/%Y às %H:%M'),
+    }
+
+
+class _Desenho:
+    """Flowables de uma grelha segundo um tema (um objeto por documento)"""
+
+    def __init__(self, grelha, tema, opcoes, plano):
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+
+        self.grelha = grelha
+        self.tema = TEMAS[tema]
+        self.opcoes = {**OPCOES_PADRAO, **(opcoes or {})}
+        self.contexto = _contexto(grelha, plano)
+        self.cor = colors.toColor
+        self.colors = colors
+
+        base = recursos_pdf().estilos
+        self.estilos = {
+            'secao': ParagraphStyle('CalSecao', parent=base['Heading2'], fontSize=14, spaceAfter=12, spaceBefore=20,
+                                    textColor=colors.darkgreen),
+            'normal': ParagraphStyle('CalNormal', parent=base['Normal'], fontSize=10, spaceAfter=6, spaceBefore=3),
+        }
+        for nome, definicao in self.tema.get('estilos', {}).items():
+            definicao = dict(definicao)
+            parent = base[definicao.pop('parent', 'Normal')]
+            if 'textColor' in definicao:
+                definicao['textColor'] = colors.toColor(definicao['textColor'])
+            self.estilos[nome] = ParagraphStyle(f'Cal_{nome}', parent=parent, **definicao)
+
+    def flowables(self):
+        story = []
+        for secao in self.tema['secoes']:
+            story.extend(getattr(self, f'_{secao}')())
+        return story
+
+    def _estilo_tabela(self, *comandos):
+        from reportlab.platypus import TableStyle
+        return TableStyle(list(comandos))
+
+    # --- Cabeçalho ---
+    def _cabecalho(self):
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Paragraph, Spacer, Table
+
+        definicao = self.tema['cabecalho']
+        linhas = [(texto.format(**self.contexto), *resto) for texto, *resto in definicao['linhas']]
+        story = []
+
+        if definicao['modo'] == 'faixas':
+            for texto, fundo, tamanho in linhas:
+                faixa = Table([[texto]], colWidths=[definicao['largura'] * cm])
+                faixa.setStyle(self._estilo_tabela(
+                    ('BACKGROUND', (0, 0), (-1, -1), self.cor(fundo)),
+                    ('TEXTCOLOR', (0, 0), (-1, -1), self.colors.white),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                    ('FONTNAME', (0, 0), (-1, -1), FONTES['negrito']),
+                    ('FONTSIZE', (0, 0), (-1, -1), tamanho),
+                    ('TOPPADDING', (0, 0), (-1, -1), tamanho * 0.7),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), tamanho * 0.7),
+                ))
+                story.append(faixa)
+            story.append(Spacer(1, 15))
+            return story
+
+        recursos = recursos_pdf()
+        if definicao['modo'] == 'logo' and recursos.logo_bytes:
+            texto, estilo = linhas.pop(0)
+            cabecalho = Table([[recursos.logo(3 * cm), Paragraph(texto, self.estilos[estilo])]],
+                              colWidths=[4 * cm, 23 * cm])
+            cabecalho.setStyle(self._estilo_tabela(
+                ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                ('TOPPADDING', (0, 0), (-1, -1), 0),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+            ))
+            story.extend([cabecalho, Spacer(1, 10)])
+
+        for texto, estilo in linhas:
+            story.append(Paragraph(texto, self.estilos[estilo]))
+        story.append(Spacer(1, 15 if definicao['modo'] == 'logo' else 20))
+        return story
+
+    # --- Resumo ---
+    def _resumo(self):
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Paragraph, Spacer, Table
+
+        definicao = self.tema['resumo']
+        grelha = self.grelha
+
+        if definicao['modo'] == 'faixa':
+            faixa = Table([[f"📊 TREINOS: {grelha.total_treinos}", f"⚽ JOGOS: {grelha.total_jogos}"]],
+                          colWidths=[definicao['largura'] / 2 * cm] * 2)
+            faixa.setStyle(self._estilo_tabela(
+                ('BACKGROUND', (0, 0), (-1, -1), self.cor(definicao['cor'])),
+                ('TEXTCOLOR', (0, 0), (-1, -1), self.colors.white),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('FONTNAME', (0, 0), (-1, -1), FONTES['negrito']),
+                ('FONTSIZE', (0, 0), (-1, -1), 16),
+                ('TOPPADDING', (0, 0), (-1, -1), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+                ('GRID', (0, 0), (-1, -1), 2, self.colors.white),
+            ))
+            return [faixa, Spacer(1, 20)]
+
+        contexto = self.contexto
+        if grelha.tipo == 'semanal':
+            linhas = [["Período:", f"{contexto['inicio']} a {contexto['fim']}"]]
+        else:
+            linhas = [["Mês:", f"{contexto['mes']} {grelha.ano}"]]
+        linhas.append(["Total de Treinos:", str(grelha.total_treinos)])
+        if grelha.total_jogos:
+            linhas.append(["Total de Jogos:", str(grelha.total_jogos)])
+        linhas.append(["Gerado em:", contexto['gerado']])
+        if grelha.total_treinos:
+            linhas.append(["Tempo Total de Treinos:", f"{grelha.duracao_total} minutos"])
+            linhas.append(["Duração Média:", f"{grelha.duracao_total // grelha.total_treinos} minutos"])
+
+        tabela = Table(linhas, colWidths=[4 * cm, 12 * cm])
+        tabela.setStyle(self._estilo_tabela(
+            ('BACKGROUND', (0, 0), (0, -1), self.colors.lightgrey),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), FONTES['normal']),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, self.colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ))
+        return [Paragraph(definicao['titulo'], self.estilos['secao']), tabela, Spacer(1, 20)]
+
+    # --- Grelha ---
+    def _grelha(self):
+        from reportlab.platypus import Paragraph, Spacer
+
+        definicao = self.tema['grelha']
+        tabela = getattr(self, f"_grelha_{definicao['modo']}")(definicao)
+        story = [Paragraph(definicao['titulo'], self.estilos['secao'])] if definicao.get('titulo') else []
+        return story + [tabela, Spacer(1, 20 if definicao.get('titulo') else 10)]
+
+    def _grelha_marcas(self, definicao):
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Table
+
+        colors = self.colors
+        linhas = [[DIAS_CURTOS[dia.data.weekday()] for dia in self.grelha.semanas[0]]]
+        destaques = []
+        for i, semana in enumerate(self.grelha.semanas, 1):
+            linha = []
+            for j, dia in enumerate(semana):
+                if not dia.no_periodo:
+                    linha.append("")
+                elif dia.treinos:
+                    linha.append(f"{dia.data.day}\n🏃")
+                    destaques += [('BACKGROUND', (j, i), (j, i), colors.lightgreen),
+                                  ('TEXTCOLOR', (j, i), (j, i), colors.darkgreen),
+                                  ('FONTNAME', (j, i), (j, i), FONTES['negrito'])]
+                else:
+                    linha.append(str(dia.data.day))
+            linhas.append(linha)
+
+        tabela = Table(linhas, colWidths=[2.5 * cm] * 7)
+        tabela.setStyle(self._estilo_tabela(
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), FONTES['negrito']),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 1), (-1, -1), FONTES['normal']),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+            *destaques
+        ))
+        return tabela
+
+    def _grelha_linhas(self, definicao):
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Table
+
+        colors = self.colors
+        linhas = [["Dia", "Data", "Treino", "Hora", "Duração"]]
+        destaques = []
+        for dia in (d for semana in self.grelha.semanas for d in semana if d.no_periodo):
+            if dia.treinos:
+                treino = dia.treinos[0]
+                linhas.append([DIAS_SEMANA[dia.data.weekday()], dia.data.strftime('%d/%m'),
+                               treino.get('nome', treino.get('tipo', 'Treino')), _hora(treino) or 'TBD',
+                               f"{treino.get('duracao', 'TBD')} min"])
+                destaques.append(('BACKGROUND', (0, len(linhas) - 1), (-1, len(linhas) - 1), colors.lightgreen))
+            else:
+                linhas.append([DIAS_SEMANA[dia.data.weekday()], dia.data.strftime('%d/%m'), "Sem treino", "-", "-"])
+
+        tabela = Table(linhas, colWidths=[3 * cm, 2 * cm, 5 * cm, 3 * cm, 3 * cm], repeatRows=1)
+        tabela.setStyle(self._estilo_tabela(
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), FONTES['negrito']),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 1), (-1, -1), FONTES['normal']),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+            *destaques
+        ))
+        return tabela
+
+    def _texto_celula(self, dia, definicao, detalhe, tamanho):
+        """Markup do dia: número, treinos e jogos (com hora/tipo/local conforme opções e tema)"""
+        opcoes = self.opcoes
+        limite = definicao['abreviar']
+        cor_numero = definicao['cor']
+        if dia.fim_de_semana and opcoes['destacar_fim_de_semana']:
+            cor_numero = 'red'
+        if not dia.no_periodo:
+            cor_numero = '#adb5bd'
+
+        partes = [f"<font color='{cor_numero}' size='{definicao['numero'] + tamanho - definicao['texto']}'>"
+                  f"<b>{dia.data.day}</b></font>"]
+        eventos = ([('🏃', treino.get('nome', 'Treino'), treino, definicao['cor_treino']) for treino in dia.treinos]
+                   + [('⚽', f"vs {jogo.get('adversario', 'TBD')}", jogo, definicao['cor_jogo']) for jogo in dia.jogos])
+        for icone, nome, registo, cor in eventos:
+            linha = f"<font color='{cor}' size='{tamanho}'><b>{icone} {_abreviar(nome, limite)}</b></font>"
+            if opcoes['mostrar_hora'] and _hora(registo):
+                linha += f"<br/><font size='{tamanho - 1}'>🕐 {_hora(registo)}</font>"
+            partes.append(linha)
+            if detalhe:
+                if icone == '🏃' and registo.get('tipo'):
+                    partes.append(f"<font size='{tamanho - 1}'>⚽ {_abreviar(registo['tipo'], limite)}</font>")
+                if registo.get('local'):
+                    partes.append(f"<font size='{tamanho - 1}'>📍 {_abreviar(registo['local'], limite)}</font>")
+
+        if not eventos and dia.no_periodo and definicao.get('descanso'):
+            partes.append(f"<font color='grey' size='{tamanho}'>🔄 Descanso</font>")
+        return "<br/>".join(partes)
+
+    def _grelha_celulas(self, definicao):
+        from reportlab.lib.units import cm
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph, Table
+
+        colors = self.colors
+        opcoes = self.opcoes
+        grelha = self.grelha
+        semanal = grelha.tipo == 'semanal'
+        cor = self.cor(definicao['cor'])
+        tamanho = definicao['texto'] + (2 if opcoes['fonte_grande'] else 0)
+        detalhe = definicao.get('detalhe_semanal' if semanal else 'detalhe_mensal') and not opcoes['compacto']
+        completar = definicao.get('completar')
+
+        estilo_dia = ParagraphStyle('CalDia', alignment=1, textColor=colors.white, fontName=FONTES['negrito'],
+                                    fontSize=11 if semanal else 12)
+        estilo_celula = ParagraphStyle('CalCelula', alignment=1, fontSize=tamanho, leading=tamanho + 3)
+        nomes = DIAS_SEMANA if semanal or definicao.get('dias_longos') else DIAS_CURTOS
+
+        linhas = [[Paragraph(nomes[dia.data.weekday()].upper(), estilo_dia) for dia in grelha.semanas[0]]]
+        for semana in grelha.semanas:
+            linhas.append([
+                Paragraph(self._texto_celula(dia, definicao, detalhe, tamanho), estilo_celula)
+                if dia.no_periodo or completar else Paragraph("", estilo_celula)
+                for dia in semana
+            ])
+
+        if semanal:
+            altura = definicao['altura_semanal'] * cm
+        elif definicao.get('altura_mensal'):
+            altura = definicao['altura_mensal'] * cm / len(grelha.semanas)
+        else:
+            altura = definicao['altura_compacta' if opcoes['compacto'] else 'altura_linha'] * cm
+
+        tabela = Table(linhas, colWidths=[definicao['largura'] * cm / 7] * 7,
+                       rowHeights=[1.2 * cm if semanal else 1 * cm] + [altura] * len(grelha.semanas))
+        comandos = [
+            ('BACKGROUND', (0, 0), (-1, 0), cor),
+            ('GRID', (0, 0), (-1, -1), 1.5 if semanal else 1, self.cor(definicao.get('linhas_grelha', definicao['cor']))),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+            ('VALIGN', (0, 1), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8 if semanal else 4),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8 if semanal else 4),
+            ('TOPPADDING', (0, 1), (-1, -1), 12 if semanal else 6),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8 if semanal else 4),
+        ]
+        hoje = date.today()
+        for linha, semana in enumerate(grelha.semanas, 1):
+            for coluna, dia in enumerate(semana):
+                if dia.fim_de_semana and opcoes['destacar_fim_de_semana']:
+                    comandos.append(('BACKGROUND', (coluna, linha), (coluna, linha),
+                                     self.cor(definicao['fundo_fim_de_semana'])))
+                if definicao.get('hoje') and dia.data == hoje:
+                    comandos += [('BACKGROUND', (coluna, linha), (coluna, linha), self.cor(definicao['hoje'])),
+                                 ('BOX', (coluna, linha), (coluna, linha), 3, cor)]
+        tabela.setStyle(self._estilo_tabela(*comandos))
+        return tabela
+
+    # --- Fichas dos treinos ---
+    def _detalhes(self):
+        from reportlab.lib.units import cm
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph, Spacer, Table
+
+        definicao = self.tema['detalhes']
+        colors = self.colors
+        normal = self.estilos['normal']
+        dias = [d for semana in self.grelha.semanas for d in semana if d.no_periodo and d.treinos]
+        if not dias:
+            periodo = (f"a semana de {self.contexto['inicio']} a {self.contexto['fim']}"
+                       if self.grelha.tipo == 'semanal' else f"{self.contexto['mes']} {self.grelha.ano}")
+            return [Paragraph("ℹ️ NENHUM TREINO PROGRAMADO", self.estilos['secao']),
+                    Paragraph(f"Não há treinos programados para {periodo}.", normal)]
+
+        estilo_dia = ParagraphStyle('CalTreino', parent=normal, fontSize=12, textColor=colors.darkblue, spaceBefore=15)
+        estilo_lista = ParagraphStyle('CalLista', parent=normal, fontSize=10, textColor=colors.darkgreen, spaceBefore=10)
+        story = [Paragraph(definicao['titulo'], self.estilos['secao'])]
+        for dia in dias:
+            for treino in dia.treinos:
+                story.append(Paragraph(
+                    f"📅 {DIAS_SEMANA[dia.data.weekday()]} - {dia.data.strftime('%d/%m/%Y')}", estilo_dia
+                ))
+                linhas = [[f"{rotulo}:", str(treino.get(chave, padrao))] for rotulo, chave, padrao in definicao['campos']]
+                for linha in linhas:
+                    if linha[0] == "Duração:":
+                        linha[1] += " minutos"
+                tabela = Table(linhas, colWidths=[3 * cm, 13 * cm])
+                tabela.setStyle(self._estilo_tabela(
+                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgreen),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, -1), FONTES['normal']),
+                    ('FONTSIZE', (0, 0), (-1, -1), 9),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ))
+                story.append(tabela)
+
+                if treino.get('objetivos'):
+                    story.append(Paragraph("🎯 Objetivos:", estilo_lista))
+                    story.extend(Paragraph(f"• {obj}", normal) for obj in treino['objetivos'])
+                if definicao['exercicios'] and treino.get('exercicios'):
+                    story.append(Paragraph("💪 Exercícios:", estilo_lista))
+                    for exercicio in treino['exercicios']:
+                        texto = f"• {exercicio.get('nome', 'Exercício')} - {exercicio.get('duracao', 'N/A')} min"
+                        if exercicio.get('descricao'):
+                            texto += f" ({exercicio['descricao']})"
+                        story.append(Paragraph(texto, normal))
+                story.append(Spacer(1, 15))
+        return story
+
+    # --- Legenda e rodapé ---
+    def _legenda(self):
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph
+
+        estilo = ParagraphStyle('CalLegenda', fontSize=10, alignment=1, textColor=self.colors.grey)
+        return [Paragraph("🏃 Treino | ⚽ Jogo | 📍 Local", estilo)]
+
+    def _rodape(self):
+        from reportlab.lib.units import cm
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph, Spacer, Table
+
+        definicao = self.tema['rodape']
+        texto = definicao['texto'].format(**self.contexto)
+        if definicao['modo'] == 'faixa':
+            faixa = Table([[texto]], colWidths=[definicao['largura'] * cm])
+            faixa.setStyle(self._estilo_tabela(
+                ('BACKGROUND', (0, 0), (-1, -1), self.cor(definicao['cor'])),
+                ('TEXTCOLOR', (0, 0), (-1, -1), self.colors.white),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, -1), FONTES['normal']),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('TOPPADDING', (0, 0), (-1, -1), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ))
+            return [Spacer(1, 15), faixa]
+
+        estilo = ParagraphStyle('CalRodape', parent=self.estilos['normal'], alignment=1, fontSize=8,
+                                textColor=self.colors.black if definicao['modo'] == 'linha' else self.colors.grey)
+        story = [Spacer(1, 30 if definicao['modo'] == 'linha' else 10)]
+        if definicao['modo'] == 'linha':
+            story.append(Paragraph("─" * 50, self.estilos['normal']))
+        story.append(Paragraph(texto, estilo))
+        return story
+
+
+def flowables_calendario(grelha, tema, opcoes=None, plano=None):
+    """Flowables de uma grelha desenhada com um tema de TEMAS"""
+    return _Desenho(grelha, tema, opcoes, plano).flowables()
+
+
+def documento_calendario(saida, tema):
+    """SimpleDocTemplate com a página e as margens de um tema de TEMAS"""
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate
+
+    definicao = TEMAS[tema]
+    esquerda, direita, topo, base = (m * cm for m in definicao['margens'])
+    return SimpleDocTemplate(
+        saida, pagesize=landscape(A4) if definicao['pagina'] == 'paisagem' else A4,
+        leftMargin=esquerda, rightMargin=direita, topMargin=topo, bottomMargin=base
+    )
+
+
+def pdf_calendario(grelha, tema, opcoes=None, plano=None, destino=None):
+    """PDF de uma grelha com um tema; escreve em `destino` (caminho/ficheiro) ou devolve os bytes"""
+    saida = destino or BytesIO()
+    documento_calendario(saida, tema).build(flowables_calendario(grelha, tema, opcoes, plano))
+    return None if destino else saida.getvalue()
+
+
+def flowables_ano(indice, ano, tema='lista_mensal'):
+    """Gerador com os doze meses do ano (um mês por página); cada mês só é desenhado quando é consumido"""
+    from reportlab.platypus import PageBreak
+
+    for mes in range(1, 13):
+        if mes > 1:
+            yield PageBreak()
+        yield from flowables_calendario(grelha_mensal(indice, ano, mes), tema)
@@ -0,0 +1,175 @@
+"""
+Tabela Colunar do Campeonato (jogadores × jogos)
+Extração única de todas as fichas do campeonato em colunas NumPy; os relatórios são vistas sobre a tabela
+"""
+
+from lazy_imports import modulo_lazy
+
+np = modulo_lazy('numpy')  # importado no primeiro cálculo, não no arranque da app
+
+EQUIPAS_CLUBE = ('Fc Pinheirense', 'FC Pinheirense')
+
+# Mapeamento de abreviaturas das equipas (cabeçalhos dos relatórios)
+ABREVIATURAS_EQUIPAS = {
+    'N.E.G.E': 'Nege',
+    'Gd Gafanha': 'Gafanha',
+    'Fidec': 'Fidec',
+    'Cucujaes': 'Cucujaes',
+    'Ccr Válega': 'Valega',
+    'Gd Beira-Vouga': 'B.Vouga',
+    'Bonsucesso': 'Bonsucesso',
+    'Santiais': 'Santiais',
+    'Rocas': 'Rocas',
+    'Requeixo': 'Requeixo',
+    'S.V.Pereira': 'S.V.Pereira',
+    'Futebol Clube Ovarense': 'Ovarense',
+    'Eixo': 'Eixo',
+    'Avanca': 'Avanca'
+}
+
+
+def abreviar_equipa(nome_equipa):
+    """Retorna a abreviatura da equipa ou os primeiros 10 caracteres do nome"""
+    nome_equipa = nome_equipa or ''
+    return ABREVIATURAS_EQUIPAS.get(nome_equipa, nome_equipa[:10])
+
+
+def _numero(valor):
+    try:
+        return float(valor or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def minutos_jogados(stats):
+    """Minutos de jogo de uma ficha, deduzidos do estado quando `tempo_jogo` não está preenchido"""
+    tempo_jogo = _numero(stats.get('tempo_jogo'))
+    if tempo_jogo:
+        return tempo_jogo
+
+    status = stats.get('tempo_jogo_status', '')
+    if status == 'Substituído' and stats.get('minuto_saida'):
+        return _numero(stats.get('minuto_saida'))
+    if status == 'Entrou no jogo' and stats.get('minuto_entrada'):
+        return 90 - _numero(stats.get('minuto_entrada'))
+    return 0.0
+
+
+def _formatar_cartoes(amarelos, vermelhos):
+    """Formato "1A 1V" (vazio sem cartões)"""
+    partes = []
+    if amarelos > 0:
+        partes.append(f"{int(amarelos)}A")
+    if vermelhos > 0:
+        partes.append(f"{int(vermelhos)}V")
+    return " ".join(partes)
+
+
+class TabelaCampeonato:
+    """Estatísticas do clube no campeonato: uma linha por atleta, uma coluna por jogo com ficha"""
+
+    COLUNAS = ('minutos', 'golos', 'amarelos', 'vermelhos')
+
+    def __init__(self, jogos, atletas, colunas):
+        self.jogos = jogos
+        self.atletas = atletas
+        self.colunas = colunas
+
+    @classmethod
+    def from_dados(cls, dados):
+        """Percorre as jornadas uma única vez e preenche todas as colunas"""
+        jogos = []
+        atletas = {}
+        celulas = []  # (linha, coluna, minutos, golos, amarelos, vermelhos)
+
+        for jornada in dados.get('campeonato', {}).get('jornadas', []):
+            for jogo in jornada.get('jogos', []):
+                casa, fora = jogo.get('casa'), jogo.get('fora')
+                if casa not in EQUIPAS_CLUBE and fora not in EQUIPAS_CLUBE:
+                    continue
+
+                # Primeira ficha do jogo (ficha_jogo_0, ficha_jogo_1, etc)
+                ficha = next((jogo[chave] for chave in jogo if chave.startswith('ficha_jogo_')), None)
+                if not ficha:
+                    continue
+
+                adversario = fora if casa in EQUIPAS_CLUBE else casa
+                coluna = len(jogos)
+                jogos.append({
+                    'label': abreviar_equipa(adversario),
+                    'adversario': adversario,
+                    'data': jogo.get('data', ''),
+                    'jornada': jornada.get('numero', 0),
+                })
+
+                for nome_atleta, stats in ficha.get('jogadores_estatisticas', {}).items():
+                    if not isinstance(stats, dict):
+                        continue
+                    linha = atletas.setdefault(nome_atleta, len(atletas))
+                    celulas.append((
+                        linha, coluna,
+                        minutos_jogados(stats),
+                        _numero(stats.get('golos')),
+                        _numero(stats.get('cartao_amarelo')),
+                        _numero(stats.get('cartao_vermelho')),
+                    ))
+
+        forma = (len(atletas), len(jogos))
+        colunas = {nome: np.zeros(forma) for nome in cls.COLUNAS}
+        if celulas:
+            valores = np.array(celulas)
+            linhas, indices = valores[:, 0].astype(int), valores[:, 1].astype(int)
+            for posicao, nome in enumerate(cls.COLUNAS, start=2):
+                colunas[nome][linhas, indices] = valores[:, posicao]
+
+        return cls(jogos, list(atletas), colunas)
+
+    # === VISTAS ===
+    def cabecalho(self):
+        """Cabeçalho dos relatórios: ATLETA, TOTAL e um rótulo por jogo"""
+        return ['ATLETA', 'TOTAL'] + [jogo['label'] for jogo in self.jogos]
+
+    def totais(self, coluna):
+        """Total por atleta de uma coluna"""
+        return self.colunas[coluna].sum(axis=1)
+
+    def _ordem(self, pontuacao, filtro=None):
+        """Índices dos atletas por pontuação decrescente (empates mantêm a ordem de aparição)"""
+        indices = np.argsort(-pontuacao, kind='stable')
+        if filtro is not None:
+            indices = indices[filtro[indices]]
+        return indices
+
+    def linhas_numericas(self, coluna, apenas_com_valor=False):
+        """Linhas [atleta, total, por jogo...] com '-' onde o valor é zero"""
+        valores = self.colunas[coluna]
+        totais = valores.sum(axis=1)
+        linhas = []
+        for i in self._ordem(totais, totais > 0 if apenas_com_valor else None):
+            linhas.append(
+                [self.atletas[i], str(int(totais[i]))]
+                + [str(int(valor)) if valor > 0 else '-' for valor in valores[i]]
+            )
+        return linhas
+
+    def linhas_minutos(self):
+        """Todos os atletas com ficha, por total de minutos"""
+        return self.linhas_numericas('minutos')
+
+    def linhas_golos(self):
+        """Atletas com golos, por total de golos"""
+        return self.linhas_numericas('golos', apenas_com_valor=True)
+
+    def linhas_cartoes(self):
+        """Atletas com cartões (amarelo = 1 ponto, vermelho = 3), no formato "1A 1V" """
+        amarelos, vermelhos = self.colunas['amarelos'], self.colunas['vermelhos']
+        total_amarelos, total_vermelhos = amarelos.sum(axis=1), vermelhos.sum(axis=1)
+        pontos = total_amarelos + 3 * total_vermelhos
+
+        linhas = []
+        for i in self._ordem(pontos, pontos > 0):
+            linhas.append(
+                [self.atletas[i], _formatar_cartoes(total_amarelos[i], total_vermelhos[i])]
+                + [_formatar_cartoes(a, v) or '-' for a, v in zip(amarelos[i], vermelhos[i])]
+            )
+        return linhas
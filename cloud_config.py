@@ -3,6 +3,7 @@
 
 import os
 import sys
+import importlib.util
 
 # === DETECTAR AMBIENTE ===
 def detect_environment():
@@ -34,24 +35,26 @@ def safe_import(module_name, fallback=None):
 
 # === VERIFICAR DEPENDÊNCIAS ===
 def check_dependencies():
-    """Verifica se todas as dependências estão instaladas"""
-    required_modules = [
-        'streamlit',
-        'pandas', 
-        'pillow',
-        'fpdf2',
-        'python-dotenv',
-        'bcrypt',
-        'dropbox',
-        'requests'
-    ]
+    """Verifica se todas as dependências estão instaladas (sem as importar)"""
+    # Nome do pacote -> nome do módulo importável
+    required_modules = {
+        'streamlit': 'streamlit',
+        'pandas': 'pandas',
+        'pillow': 'PIL',
+        'fpdf2': 'fpdf',
+        'python-dotenv': 'dotenv',
+        'bcrypt': 'bcrypt',
+        'dropbox': 'dropbox',
+        'requests': 'requests'
+    }
     
     missing = []
-    for module in required_modules:
+    for package, module in required_modules.items():
         try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+            if importlib.util.find_spec(module) is None:
+                missing.append(package)
+        except (ImportError, ValueError):
+            missing.append(package)
     
     return missing
 
@@ -0,0 +1,86 @@
+"""
+Cache de Ficheiros de Dados por Versão
+Chave (caminho, mtime_ns, tamanho, versão do store): um stat por validação, sem TTL e sem cópias por acesso.
+Só o objeto analisado fica em memória; quem edita recebe uma cópia feita a partir dele, uma vez por versão
+"""
+
+import os
+import json
+import threading
+
+from perf_metrics import medir
+
+
+def _copiar(valor):
+    """Cópia profunda de uma estrutura JSON (dicts, listas e escalares imutáveis)"""
+    if isinstance(valor, dict):
+        return {chave: _copiar(item) for chave, item in valor.items()}
+    if isinstance(valor, list):
+        return [_copiar(item) for item in valor]
+    return valor
+
+
+class CacheFicheiroJSON:
+    """Cache partilhado pelo processo de ficheiros JSON, invalidado por assinatura do ficheiro"""
+
+    def __init__(self):
+        self._entradas = {}
+        self._lock = threading.Lock()
+        self.versao_store = 0
+        self.hits = 0
+        self.misses = 0
+
+    def chave(self, caminho):
+        """Chave de versão atual do ficheiro (um único stat); None se não existir"""
+        try:
+            stat = os.stat(caminho)
+        except OSError:
+            return None
+        return (caminho, stat.st_mtime_ns, stat.st_size, self.versao_store)
+
+    def _entrada(self, caminho, chave):
+        """Entrada (objeto analisado) para a chave, lendo o ficheiro apenas quando a versão muda"""
+        with self._lock:
+            entrada = self._entradas.get(caminho)
+            if entrada and entrada['chave'] == chave:
+                self.hits += 1
+                return entrada
+
+        with open(caminho, 'r', encoding='utf-8-sig') as f:
+            texto = f.read()
+        with medir('json', 'decode') as medicao:
+            medicao['bytes'] = len(texto)
+            entrada = {'chave': chave, 'dados': json.loads(texto)}
+
+        with self._lock:
+            self.misses += 1
+            self._entradas[caminho] = entrada
+        return entrada
+
+    def obter(self, caminho, chave=None):
+        """Devolve (dados partilhados, chave); o objeto é partilhado entre sessões e não deve ser alterado"""
+        chave = chave or self.chave(caminho)
+        if chave is None:
+            return None, None
+        return self._entrada(caminho, chave)['dados'], chave
+
+    def obter_copia(self, caminho, chave=None):
+        """Devolve (cópia privada e editável, chave): o único caminho para quem altera os dados, copiado do
+        objeto partilhado sem reler nem voltar a analisar o ficheiro"""
+        chave = chave or self.chave(caminho)
+        if chave is None:
+            return None, None
+        dados = self._entrada(caminho, chave)['dados']
+        with medir('json', 'copia') as medicao:
+            medicao['bytes'] = chave[2]
+            return _copiar(dados), chave
+
+    def invalidar(self):
+        """Invalida todas as entradas (ex.: após restauro ou limpeza manual de cache)"""
+        with self._lock:
+            self.versao_store += 1
+            self._entradas.clear()
+
+    def estatisticas(self):
+        """Contadores de hits/misses do cache"""
+        return {'hits': self.hits, 'misses': self.misses, 'versao_store': self.versao_store}
@@ -1,12 +1,33 @@
 # === DATA MANAGER SIMPLIFICADO ===
 import os
 import json
-from datetime import datetime
+from backup_restore import restaurar_backup_streaming
+from persistence_pipeline import PersistencePipeline, SinkFicheiroDados, SinkMetadados, SinkSnapshotLocal
 
 class DataManager:
     """Gerenciador de dados simplificado e eficiente"""
     
     DATA_FILE = "data/dados_treino.json"
+    BACKUP_DIR = "data/backups"
+    
+    _pipeline = None
+    
+    @staticmethod
+    def pipeline():
+        """Pipeline de persistência partilhado (ficheiro principal + snapshots simples)"""
+        if DataManager._pipeline is None:
+            DataManager._pipeline = PersistencePipeline([
+                SinkFicheiroDados(DataManager.DATA_FILE),
+                SinkMetadados(DataManager.DATA_FILE),
+                SinkSnapshotLocal(
+                    pasta=DataManager.BACKUP_DIR,
+                    prefixo="backup_simples_",
+                    tipo="simples",
+                    intervalo=None,  # apenas quando pedido explicitamente
+                    pasta_retencao="."
+                ),
+            ])
+        return DataManager._pipeline
     
     @staticmethod
     def _get_default_data():
@@ -53,39 +74,14 @@ class DataManager:
     
     @staticmethod
     def save_data(data):
-        """Salva dados no arquivo JSON"""
+        """Salva dados no arquivo JSON (escrita atómica via pipeline)"""
         try:
             DataManager.ensure_data_dir()
-            
-            # Backup do arquivo atual antes de salvar
-            if os.path.exists(DataManager.DATA_FILE):
-                backup_name = f"{DataManager.DATA_FILE}.backup"
-                try:
-                    with open(DataManager.DATA_FILE, 'r') as original:
-                        with open(backup_name, 'w') as backup:
-                            backup.write(original.read())
-                except:
-                    pass  # Se não conseguir fazer backup, continua
-            
-            # Salvar novos dados
-            with open(DataManager.DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
+            DataManager.pipeline().publicar(data, apenas=['ficheiro', 'metadados'])
             return True
             
         except Exception as e:
             print(f"Erro ao salvar dados: {str(e)}")
-            
-            # Tentar restaurar backup se salvamento falhar
-            backup_name = f"{DataManager.DATA_FILE}.backup"
-            if os.path.exists(backup_name):
-                try:
-                    with open(backup_name, 'r') as backup:
-                        with open(DataManager.DATA_FILE, 'w') as original:
-                            original.write(backup.read())
-                except:
-                    pass
-            
             return False
     
     @staticmethod
@@ -93,26 +89,12 @@ class DataManager:
         """Cria backup simples dos dados"""
         try:
             data = DataManager.load_data()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            # Criar diretório de backup
-            backup_dir = "data/backups"
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # Salvar backup
-            backup_file = f"{backup_dir}/backup_simples_{timestamp}.json"
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
             
-            # Manter apenas os 10 backups mais recentes
-            backup_files = [f for f in os.listdir(backup_dir) if f.startswith('backup_') and f.endswith('.json')]
-            if len(backup_files) > 10:
-                backup_files.sort()
-                for old_backup in backup_files[:-10]:
-                    try:
-                        os.remove(os.path.join(backup_dir, old_backup))
-                    except:
-                        pass
+            # Snapshot via pipeline (inclui checksums e política de retenção)
+            _, resultados = DataManager.pipeline().publicar(data, apenas=['snapshot'], forcar=True)
+            sucesso, info = resultados.get('snapshot', (False, None))
+            if not sucesso:
+                raise Exception(info)
             
             return True
             
@@ -120,6 +102,19 @@ class DataManager:
             print(f"Erro ao criar backup: {str(e)}")
             return False
     
+    @staticmethod
+    def latest_backup():
+        """Devolve o caminho do backup simples mais recente (ou None)"""
+        if not os.path.isdir(DataManager.BACKUP_DIR):
+            return None
+        backups = sorted(
+            f for f in os.listdir(DataManager.BACKUP_DIR)
+            if f.startswith('backup_') and f.endswith('.json')
+        )
+        if not backups:
+            return None
+        return os.path.join(DataManager.BACKUP_DIR, backups[-1])
+    
     @staticmethod
     def restore_from_backup(backup_file):
         """Restaura dados de um arquivo de backup"""
@@ -127,10 +122,14 @@ class DataManager:
             if not os.path.exists(backup_file):
                 return False
             
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Leitura em streaming com validação por coleção e troca atómica
+            DataManager.ensure_data_dir()
+            with open(backup_file, 'rb') as f:
+                sucesso, resultado = restaurar_backup_streaming(f, DataManager.DATA_FILE)
             
-            return DataManager.save_data(data)
+            if not sucesso:
+                print(f"Erro ao restaurar backup: {resultado}")
+            return sucesso
             
         except Exception as e:
             print(f"Erro ao restaurar backup: {str(e)}")
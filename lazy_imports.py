@@ -0,0 +1,129 @@
+"""
+Importações Preguiçosas e Perfil de Arranque
+Proxies de módulos pesados (importados no primeiro acesso) e relatório `-X importtime` com orçamento
+"""
+
+import sys
+import time
+import threading
+import importlib
+import importlib.util
+import subprocess
+
+# Orçamento de importação da app (ms), medido acima do próprio streamlit
+ORCAMENTO_IMPORTACAO_MS = 400
+
+_tempos = {}
+_lock = threading.Lock()
+
+
+class ModuloLazy:
+    """Proxy de um módulo: a importação real só acontece no primeiro acesso a um atributo"""
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def _carregar(self):
+        if self._modulo is None:
+            with _lock:
+                if self._modulo is None:
+                    inicio = time.perf_counter()
+                    modulo = importlib.import_module(self._nome)
+                    _tempos[self._nome] = (time.perf_counter() - inicio) * 1000
+                    self._modulo = modulo
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self._carregar(), atributo)
+
+    def __repr__(self):
+        estado = "carregado" if self._modulo is not None else "por carregar"
+        return f"<ModuloLazy {self._nome} ({estado})>"
+
+
+def modulo_lazy(nome):
+    """Devolve o módulo se já estiver importado, senão um proxy que o importa quando for usado"""
+    return sys.modules.get(nome) or ModuloLazy(nome)
+
+
+def modulo_disponivel(nome):
+    """Verifica se um módulo está instalado sem o importar"""
+    try:
+        return importlib.util.find_spec(nome) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def tempos_carregamento():
+    """Tempo (ms) que cada proxy demorou a importar o seu módulo, nesta execução"""
+    with _lock:
+        return dict(_tempos)
+
+
+# === PERFIL DE IMPORTAÇÃO ===
+def analisar_importtime(texto):
+    """Converte a saída de `-X importtime` em linhas {modulo, nivel, proprio_ms, acumulado_ms}"""
+    linhas = []
+    for linha in texto.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        try:
+            proprio, acumulado, modulo = linha[len('import time:'):].split('|', 2)
+            linhas.append({
+                'modulo': modulo.strip(),
+                'nivel': (len(modulo) - len(modulo.lstrip()) - 1) // 2,
+                'proprio_ms': int(proprio) / 1000,
+                'acumulado_ms': int(acumulado) / 1000,
+            })
+        except ValueError:
+            continue
+    return linhas
+
+
+def perfil_importacao(modulo='app_treinador', base='streamlit', python=None):
+    """Importa `modulo` num processo novo com `-X importtime` (descontando `base`, já carregado no servidor)"""
+    python = python or sys.executable
+    codigo = f"import {base}; import {modulo}" if base else f"import {modulo}"
+    resultado = subprocess.run(
+        [python, '-X', 'importtime', '-c', codigo],
+        capture_output=True, text=True, timeout=300
+    )
+    linhas = analisar_importtime(resultado.stderr)
+
+    # Apenas o que o módulo importa para além da base
+    if base:
+        base_linhas = analisar_importtime(subprocess.run(
+            [python, '-X', 'importtime', '-c', f"import {base}"],
+            capture_output=True, text=True, timeout=300
+        ).stderr)
+        ja_importados = {linha['modulo'] for linha in base_linhas}
+        linhas = [linha for linha in linhas if linha['modulo'] not in ja_importados]
+    return linhas
+
+
+def tabela_perfil(linhas, top=25):
+    """Dependências diretas do módulo ordenadas pelo tempo acumulado: [(modulo, acumulado_ms, proprio_ms)]"""
+    if not linhas:
+        return []
+    raiz = linhas[-1]  # `-X importtime` escreve o módulo importado depois dos seus filhos
+    diretas = [linha for linha in linhas if linha['nivel'] == raiz['nivel'] + 1]
+    diretas.sort(key=lambda linha: linha['acumulado_ms'], reverse=True)
+    return [(linha['modulo'], linha['acumulado_ms'], linha['proprio_ms']) for linha in diretas[:top]]
+
+
+def total_importacao(linhas):
+    """Tempo total (ms) da importação raiz"""
+    return linhas[-1]['acumulado_ms'] if linhas else 0.0
+
+
+if __name__ == "__main__":
+    modulo = sys.argv[1] if len(sys.argv) > 1 else 'app_treinador'
+    linhas = perfil_importacao(modulo)
+    total = total_importacao(linhas)
+
+    print(f"{'MÓDULO':<45} {'ACUMULADO (ms)':>15} {'PRÓPRIO (ms)':>13}")
+    for nome, acumulado, proprio in tabela_perfil(linhas):
+        print(f"{nome:<45} {acumulado:>15.1f} {proprio:>13.1f}")
+    print(f"\nTotal {modulo}: {total:.1f} ms (orçamento {ORCAMENTO_IMPORTACAO_MS} ms)")
+    sys.exit(0 if total <= ORCAMENTO_IMPORTACAO_MS else 1)
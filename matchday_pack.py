@@ -0,0 +1,100 @@
+"""
+Pacote do Dia de Jogo
+Documentos de um jogo (convocatória, lista completa, folha de presença, campo tático, classificação) gerados
+num só pedido a partir dos registos extraídos uma vez, para o serviço de PDFs juntar num zip
+"""
+
+import re
+
+from championship_table import EQUIPAS_CLUBE
+
+COMPETICAO_CAMPEONATO = 'CAMPEONATO DISTRITAL - 2ª DIVISÃO ZONA CENTRO'
+
+# chave -> (rótulo, gerador da app); a ordem é a ordem dos ficheiros no zip
+DOCUMENTOS_PACOTE = {
+    'convocatoria': ("📋 Convocatória", 'gerar_pdf_convocatoria'),
+    'lista_completa': ("📝 Lista completa para assinatura", 'gerar_pdf_convocatoria_completa'),
+    'folha_presenca': ("✍️ Folha de presença", 'gerar_pdf_folha_presenca_profissional'),
+    'campo_tatico': ("🎯 Campo tático A4", 'gerar_pdf_campo_a4'),
+    'tabela': ("🏆 Tabela classificativa", 'gerar_pdf_tabela_classificativa'),
+}
+
+
+def jogos_da_equipa(dados):
+    """Jogos da lista principal + jogos da equipa no calendário do campeonato (formatados como jogos)"""
+    jogos = list(dados.get('jogos', []))
+
+    for jornada in dados.get('campeonato', {}).get('jornadas', []):
+        for jogo in jornada.get('jogos', []):
+            casa = jogo.get('casa', '')
+            fora = jogo.get('fora', '')
+            if casa not in EQUIPAS_CLUBE and fora not in EQUIPAS_CLUBE:
+                continue
+
+            # Determinar adversário e local
+            em_casa = casa in EQUIPAS_CLUBE
+            jogos.append({
+                'data': jogo.get('data', ''),
+                'adversario': fora if em_casa else casa,
+                'local': "Pinheiro" if em_casa else casa,
+                'tipo': 'Campeonato',
+                'competicao': COMPETICAO_CAMPEONATO,
+                'jornada': jornada.get('numero', ''),
+                'convocados': [],
+                'hora': '16:00:00'  # Hora padrão para jogos de campeonato
+            })
+    return jogos
+
+
+def extrair_dados_pacote(dados, jogo):
+    """Registos lidos pelos documentos do pacote, extraídos uma vez e partilhados por todos os geradores"""
+    esquema = None
+    if jogo.get('esquema_tatico_id'):
+        esquema = next(
+            (e for e in dados.get('esquemas_taticos', []) if e.get('id') == jogo['esquema_tatico_id']), None
+        )
+    return {
+        'jogadores': dados.get('jogadores', []),
+        'treinos': dados.get('treinos', {}),
+        'campeonato': dados.get('campeonato', {}),
+        'jogo': jogo,
+        'esquema': esquema,
+    }
+
+
+def documentos_indisponiveis(dados_pacote):
+    """{chave: motivo} dos documentos que não podem ser gerados para este jogo"""
+    motivos = {}
+    if not dados_pacote['jogo'].get('convocados'):
+        motivos['convocatoria'] = "jogo sem convocados"
+    if not dados_pacote['jogadores']:
+        motivos['lista_completa'] = motivos['folha_presenca'] = "nenhum atleta registado"
+    if dados_pacote['esquema'] is None:
+        motivos['campo_tatico'] = "jogo sem esquema tático"
+    if not dados_pacote['campeonato'].get('equipas'):
+        motivos['tabela'] = "sem dados do campeonato"
+    return motivos
+
+
+def documentos_pacote(chaves, dados_pacote):
+    """[(rótulo, gerador, args, kwargs)] dos documentos escolhidos, todos sobre os mesmos registos extraídos"""
+    jogo = dados_pacote['jogo']
+    esquema = dados_pacote['esquema'] or {}
+    argumentos = {
+        'convocatoria': (dados_pacote, jogo),
+        'lista_completa': (dados_pacote, jogo),
+        'folha_presenca': (dados_pacote,),
+        'campo_tatico': (esquema, f"{esquema.get('nome', 'Esquema')} - {esquema.get('formacao', '')}"),
+        'tabela': (dados_pacote['campeonato'],),
+    }
+    return [
+        (rotulo, gerador, argumentos[chave], {})
+        for chave, (rotulo, gerador) in DOCUMENTOS_PACOTE.items() if chave in chaves
+    ]
+
+
+def nome_ficheiro_pacote(jogo):
+    """Nome do zip: Pacote_Jogo_<data>_<adversário>.zip"""
+    adversario = re.sub(r'[^\w-]+', '_', jogo.get('adversario', 'jogo')).strip('_')
+    data = re.sub(r'[^\d-]+', '', str(jogo.get('data', '')))
+    return f"Pacote_Jogo_{data}_{adversario}.zip"
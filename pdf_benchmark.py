@@ -0,0 +1,370 @@
+"""
+Benchmark e Regressões dos PDFs
+Épocas sintéticas (N jogadores × E épocas de treinos, jogos e fichas) construídas a partir da forma do APP_FINAL.json;
+cada gerador corre fora do Streamlit num processo novo, com tempo, pico de RSS e tamanho comparados com uma baseline
+
+Uso:
+    python pdf_benchmark.py                       # mede e compara com pdf_benchmark_baseline.json (se existir)
+    python pdf_benchmark.py --guardar-baseline    # mede e grava a baseline
+    python pdf_benchmark.py --jogadores 27 --epocas 1,3 --geradores gerar_pdf_lista_jogadores --limiar 0.15
+"""
+
+import io
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+import statistics
+import contextlib
+import multiprocessing
+from datetime import date, datetime
+from concurrent.futures import ProcessPoolExecutor
+
+FICHEIRO_BASE = 'APP_FINAL.json'
+FICHEIRO_BASELINE = 'pdf_benchmark_baseline.json'
+JOGADORES = (27, 60, 150)
+EPOCAS = (1, 3, 5)
+LIMIAR_REGRESSAO = 0.20  # +20% de tempo ou de memória extra face à baseline
+MINIMO_MS = 20           # abaixo disto as diferenças de tempo são ruído
+
+
+# === ÉPOCAS SINTÉTICAS ===
+def _recuar_anos(data_str, anos):
+    """'AAAA-MM-DD' recuado `anos` anos (29/02 passa a 28/02); texto inválido fica igual"""
+    try:
+        data = datetime.strptime(str(data_str)[:10], '%Y-%m-%d').date()
+    except ValueError:
+        return data_str
+    try:
+        return data.replace(year=data.year - anos).isoformat()
+    except ValueError:
+        return data.replace(year=data.year - anos, day=28).isoformat()
+
+
+def _plantel(jogadores_base, n):
+    """N jogadores com a forma dos reais: os primeiros são os reais, os restantes cópias com nome/número novos"""
+    plantel = []
+    for i in range(n):
+        modelo = jogadores_base[i % len(jogadores_base)]
+        if i < len(jogadores_base):
+            plantel.append(modelo)
+            continue
+        jogador = dict(modelo)
+        jogador.update({
+            'id': f"sintetico-{i}",
+            'nome': f"{modelo.get('nome', 'Jogador').strip()} {i // len(jogadores_base) + 1}",
+            'login': f"{modelo.get('login', 'jogador')}{i}",
+            'nr_camisola': i + 1,
+        })
+        plantel.append(jogador)
+    return plantel
+
+
+class _Nomes:
+    """Troca listas/dicionários de nomes dos jogadores reais por nomes do plantel sintético, na mesma proporção"""
+
+    def __init__(self, plantel, n_base):
+        self.nomes = [j.get('nome', '') for j in plantel]
+        self.escala = len(plantel) / max(1, n_base)
+
+    def lista(self, nomes, deslocamento=0):
+        quantos = min(len(self.nomes), round(len(nomes) * self.escala))
+        return [self.nomes[(deslocamento + k) % len(self.nomes)] for k in range(quantos)]
+
+    def mapa(self, valores_por_nome, deslocamento=0):
+        valores = list(valores_por_nome.values())
+        if not valores:
+            return {}
+        return {nome: valores[k % len(valores)] for k, nome in enumerate(self.lista(valores, deslocamento))}
+
+
+def _treinos(treinos_base, epocas, nomes):
+    treinos = {}
+    for epoca in range(epocas):
+        for data_str, treino in treinos_base.items():
+            novo = dict(treino)
+            for campo in ('participantes', 'convocados'):
+                if isinstance(treino.get(campo), list):
+                    novo[campo] = nomes.lista(treino[campo])
+            if isinstance(treino.get('presencas'), dict):
+                novo['presencas'] = nomes.mapa(treino['presencas'])
+            treinos[_recuar_anos(data_str, epoca)] = novo
+    return treinos
+
+
+def _jogos(jogos_base, epocas, nomes):
+    jogos = []
+    for epoca in range(epocas):
+        for jogo in jogos_base:
+            novo = dict(jogo)
+            novo['data'] = _recuar_anos(jogo.get('data', ''), epoca)
+            if isinstance(jogo.get('convocados'), list):
+                novo['convocados'] = nomes.lista(jogo['convocados'])
+            jogos.append(novo)
+    return jogos
+
+
+def _campeonato(campeonato_base, epocas, nomes):
+    """Jornadas repetidas por época (datas recuadas, números seguidos); fichas com jogadores do plantel em rotação"""
+    campeonato = dict(campeonato_base)
+    jornadas_base = campeonato_base.get('jornadas', [])
+    jornadas = []
+    for epoca in range(epocas):
+        for jornada in jornadas_base:
+            nova = dict(jornada)
+            nova['numero'] = (jornada.get('numero') or 0) + epoca * len(jornadas_base)
+            nova['data'] = _recuar_anos(jornada.get('data', ''), epoca)
+            nova['jogos'] = []
+            for jogo in jornada.get('jogos', []):
+                novo = dict(jogo)
+                novo['data'] = _recuar_anos(jogo.get('data', ''), epoca)
+                for chave, ficha in jogo.items():
+                    if chave.startswith('ficha_jogo') and isinstance(ficha, dict):
+                        ficha = dict(ficha)
+                        estatisticas = ficha.get('jogadores_estatisticas') or {}
+                        # Rodar os atletas de jornada para jornada para que o plantel inteiro apareça nos relatórios
+                        ficha['jogadores_estatisticas'] = dict(zip(
+                            nomes.lista(list(estatisticas), deslocamento=nova['numero'] * len(estatisticas)),
+                            estatisticas.values()
+                        ))
+                        novo[chave] = ficha
+                nova['jogos'].append(novo)
+            jornadas.append(nova)
+    campeonato['jornadas'] = jornadas
+    return campeonato
+
+
+def dados_sinteticos(base, n_jogadores, epocas):
+    """Dados com a forma de `base`: `n_jogadores` atletas e `epocas` épocas de treinos, jogos e fichas"""
+    jogadores_base = [j for j in base.get('jogadores', []) if isinstance(j, dict)]
+    plantel = _plantel(jogadores_base, n_jogadores)
+    nomes = _Nomes(plantel, len(jogadores_base))
+
+    dados = dict(base)
+    dados.update({
+        'jogadores': plantel,
+        'treinos': _treinos(base.get('treinos', {}), epocas, nomes),
+        'jogos': _jogos(base.get('jogos', []), epocas, nomes),
+        'campeonato': _campeonato(base.get('campeonato', {}), epocas, nomes),
+    })
+    return copy.deepcopy(dados)
+
+
+# === GERADORES ===
+def _jogo_convocado(dados):
+    return next((j for j in dados['jogos'] if j.get('convocados')), dados['jogos'][0])
+
+
+def _plano_todas_epocas(dados):
+    """Plano "mensal" com todos os treinos (o documento cresce com o número de épocas)"""
+    return {'id': 'benchmark', 'nome': 'Plano de benchmark', 'tipo': 'mensal', 'treinos': dados['treinos']}
+
+
+def _primeiro_treino(dados):
+    return datetime.strptime(min(dados['treinos']), '%Y-%m-%d').date()
+
+
+def _esquema(dados):
+    esquema = (dados.get('esquemas_taticos') or [{'nome': 'Esquema', 'formacao': '4-4-2', 'posicoes': {}}])[0]
+    return esquema, f"{esquema.get('nome', 'Esquema')} - {esquema.get('formacao', '')}"
+
+
+# Gerador da app -> argumentos a partir dos dados sintéticos
+GERADORES = {
+    'gerar_pdf_lista_jogadores': lambda d: (d,),
+    'gerar_pdf_folha_presenca_profissional': lambda d: (d,),
+    'gerar_pdf_convocatoria': lambda d: (d, _jogo_convocado(d)),
+    'gerar_pdf_convocatoria_completa': lambda d: (d, _jogo_convocado(d)),
+    'gerar_pdf_tabela_classificativa': lambda d: (d['campeonato'],),
+    'gerar_relatorio_minutos_campeonato_pdf': lambda d: (d,),
+    'gerar_relatorio_golos_campeonato_pdf': lambda d: (d,),
+    'gerar_relatorio_cartoes_campeonato_pdf': lambda d: (d,),
+    'criar_pdf_plano_treino': lambda d: (_plano_todas_epocas(d),),
+    'criar_pdf_plano_visual': lambda d: (_plano_todas_epocas(d), True, d),
+    'criar_calendario_pdf': lambda d: (_plano_todas_epocas(d), d, True, True, True, False, False),
+    'gerar_pdf_calendario_mensal': lambda d: (_primeiro_treino(d).year, _primeiro_treino(d).month, d),
+    'gerar_pdf_calendario_semanal': lambda d: (_primeiro_treino(d), d),
+    'gerar_pdf_calendario_anual': lambda d: (_primeiro_treino(d).year, d),
+    'gerar_pdf_campo_a4': _esquema,
+}
+
+# Geradores com modo em ficheiro (PDFEmFicheiro): medidos com em_ficheiro=True quando se pede --em-ficheiro
+EM_FICHEIRO = {
+    'gerar_relatorio_minutos_campeonato_pdf',
+    'gerar_relatorio_golos_campeonato_pdf',
+    'gerar_relatorio_cartoes_campeonato_pdf',
+    'gerar_pdf_calendario_anual',
+}
+
+
+# === MEDIÇÃO (processo novo por gerador) ===
+def _pico_rss_mb():
+    """Pico de RSS do processo em MB (None onde `resource` não existe, ex.: Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def _medir(caminho_base, n_jogadores, epocas, gerador, repeticoes, em_ficheiro=False):
+    """Corre um gerador `repeticoes` vezes sobre os dados sintéticos; o PDF não passa pela cache em disco"""
+    import shutil
+    import inspect
+    import tempfile
+
+    # Avisos do Streamlit em modo "bare" e mensagens da app não interessam à medição
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        from app_pages import funcao_partilhada
+        with open(caminho_base, 'r', encoding='utf-8') as f:
+            dados = dados_sinteticos(json.load(f), n_jogadores, epocas)
+        args = GERADORES[gerador](dados)
+        kwargs = {'em_ficheiro': True} if em_ficheiro and gerador in EM_FICHEIRO else {}
+        funcao = inspect.unwrap(funcao_partilhada(gerador))  # sem @pdf_em_cache nem @medido
+        # Cache de PDFs própria e vazia em cada repetição: as secções em cache (planos) também são desenhadas
+        from pdf_cache import cache_pdf
+        cache_pdf.pasta = tempfile.mkdtemp(prefix='benchmark_cache_pdf_')
+
+        rss_antes = _pico_rss_mb()
+        tempos = []
+        resultado = None
+        for _ in range(repeticoes):
+            cache_pdf.limpar()
+            inicio = time.perf_counter()
+            resultado = funcao(*args, **kwargs)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        rss_depois = _pico_rss_mb()
+        shutil.rmtree(cache_pdf.pasta, ignore_errors=True)
+
+    if isinstance(resultado, tuple):
+        resultado = resultado[0]
+    if isinstance(resultado, io.BytesIO):
+        resultado = resultado.getvalue()
+    if not resultado:
+        # Os geradores mostram o erro com st.error e devolvem None; fora do Streamlit isso perde-se
+        raise RuntimeError("o gerador não devolveu PDF")
+    tamanho = len(resultado)
+    if hasattr(resultado, 'remover'):
+        resultado.remover()  # PDFEmFicheiro: apagar o temporário
+    return {
+        'ms': round(statistics.median(tempos), 1),
+        'ms_min': round(min(tempos), 1),
+        'pico_rss_mb': None if rss_depois is None else round(rss_depois, 1),
+        'rss_extra_mb': None if rss_depois is None else round(rss_depois - rss_antes, 1),
+        'bytes': tamanho,
+    }
+
+
+def medir(caminho_base=FICHEIRO_BASE, jogadores=JOGADORES, epocas=EPOCAS, geradores=tuple(GERADORES), repeticoes=3,
+          em_ficheiro=False):
+    """{'<jogadores>j_<épocas>e/<gerador>': medição}; cada medição corre num processo novo (spawn) e isolado.
+    Com `em_ficheiro` os geradores de EM_FICHEIRO escrevem em disco e a chave leva o sufixo '+ficheiro'"""
+    resultados = {}
+    contexto = multiprocessing.get_context('spawn')
+    for n in jogadores:
+        for e in epocas:
+            for gerador in geradores:
+                chave = f"{n}j_{e}e/{gerador}" + ('+ficheiro' if em_ficheiro and gerador in EM_FICHEIRO else '')
+                with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as executor:
+                    try:
+                        resultados[chave] = executor.submit(
+                            _medir, os.path.abspath(caminho_base), n, e, gerador, repeticoes, em_ficheiro
+                        ).result()
+                    except Exception as erro:
+                        resultados[chave] = {'erro': f"{type(erro).__name__}: {erro}"}
+                print(f"{chave:<60} {_formatar(resultados[chave])}", flush=True)
+    return resultados
+
+
+# === BASELINE ===
+def _formatar(medicao):
+    if 'erro' in medicao:
+        return f"ERRO {medicao['erro']}"
+    rss = '—' if medicao['rss_extra_mb'] is None else f"+{medicao['rss_extra_mb']:.1f} MB"
+    return f"{medicao['ms']:9.1f} ms  {rss:>10}  {medicao['bytes'] / 1024:8.1f} KB"
+
+
+def comparar(resultados, baseline, limiar=LIMIAR_REGRESSAO):
+    """[(chave, métrica, baseline, atual, variação)] das medições que pioraram mais do que `limiar`"""
+    regressoes = []
+    for chave, atual in resultados.items():
+        anterior = baseline.get(chave)
+        if not anterior or 'erro' in anterior:
+            continue
+        if 'erro' in atual:
+            regressoes.append((chave, 'erro', None, atual['erro'], None))
+            continue
+        for metrica, minimo in (('ms', MINIMO_MS), ('rss_extra_mb', 1.0)):
+            antes, agora = anterior.get(metrica), atual.get(metrica)
+            if antes is None or agora is None or max(antes, agora) < minimo:
+                continue
+            variacao = (agora - antes) / max(antes, minimo)
+            if variacao > limiar:
+                regressoes.append((chave, metrica, antes, agora, variacao))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos geradores de PDF sobre épocas sintéticas")
+    parser.add_argument('--base', default=FICHEIRO_BASE, help="ficheiro de dados usado como forma (APP_FINAL.json)")
+    parser.add_argument('--jogadores', default=','.join(map(str, JOGADORES)))
+    parser.add_argument('--epocas', default=','.join(map(str, EPOCAS)))
+    parser.add_argument('--geradores', default=','.join(GERADORES))
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--em-ficheiro', action='store_true', help="geradores com modo em ficheiro escrevem em disco")
+    parser.add_argument('--baseline', default=FICHEIRO_BASELINE)
+    parser.add_argument('--guardar-baseline', action='store_true', help="grava as medições como nova baseline")
+    parser.add_argument('--limiar', type=float, default=LIMIAR_REGRESSAO, help="regressão a partir de +limiar (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    geradores = [g for g in args.geradores.split(',') if g]
+    desconhecidos = [g for g in geradores if g not in GERADORES]
+    if desconhecidos:
+        parser.error(f"geradores desconhecidos: {', '.join(desconhecidos)}")
+
+    resultados = medir(
+        args.base,
+        [int(n) for n in args.jogadores.split(',')],
+        [int(e) for e in args.epocas.split(',')],
+        geradores,
+        args.repeticoes,
+        args.em_ficheiro,
+    )
+
+    if args.guardar_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f).get('medicoes', {})
+        baseline.update(resultados)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'gerado_em': datetime.now().isoformat(timespec='seconds'), 'medicoes': baseline},
+                      f, indent=2, ensure_ascii=False, sort_keys=True)
+        print(f"Baseline gravada em {args.baseline} ({len(resultados)} medição(ões))")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Sem baseline em {args.baseline}: use --guardar-baseline para a criar")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get('medicoes', {})
+    regressoes = comparar(resultados, baseline, args.limiar)
+    if not regressoes:
+        print(f"✅ Sem regressões acima de {args.limiar:.0%} face a {args.baseline}")
+        return 0
+
+    print(f"❌ {len(regressoes)} regressão(ões) acima de {args.limiar:.0%}:")
+    for chave, metrica, antes, agora, variacao in regressoes:
+        if metrica == 'erro':
+            print(f"  {chave}: passou a falhar ({agora})")
+        else:
+            print(f"  {chave}: {metrica} {antes} → {agora} (+{variacao:.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
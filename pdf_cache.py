@@ -0,0 +1,211 @@
+"""
+Cache de PDFs em Disco (LRU)
+Documentos gerados guardados por (gerador, hash dos registos que lê); invalidação automática quando os dados mudam
+"""
+
+import os
+import sys
+import json
+import time
+import marshal
+import hashlib
+import threading
+import functools
+import importlib.util
+from datetime import date
+
+from persistence_pipeline import escrever_atomico
+from pdf_resources import CAMINHO_LOGO
+
+PASTA_CACHE_PDF = ".cache_pdf"
+MAX_BYTES_CACHE_PDF = 64 * 1024 * 1024
+MAX_ENTRADAS_CACHE_PDF = 200
+
+# Código e recursos partilhados pelos geradores: um deploy que altere qualquer um invalida os PDFs em cache
+MODULOS_PDF = (
+    'app_core', 'pdf_resources', 'pdf_stream', 'pdf_sections', 'calendar_pdf', 'pitch_render',
+    'championship_table', 'attendance_matrix', 'photo_cache',
+)
+RECURSOS_PDF = (CAMINHO_LOGO,)
+
+
+def hash_entradas(*entradas):
+    """SHA-256 estável (chaves ordenadas) dos registos lidos por um gerador"""
+    texto = json.dumps(entradas, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _hash_conteudo(caminho, mtime_ns, tamanho):
+    with open(caminho, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _hash_ficheiro(caminho):
+    """Hash do conteúdo do ficheiro, relido só quando o mtime/tamanho mudam ('' se não existir)"""
+    try:
+        stat = os.stat(caminho)
+        return _hash_conteudo(caminho, stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError):
+        return ''
+
+
+def _ficheiro_modulo(nome):
+    """Caminho do ficheiro de um módulo, sem o importar"""
+    modulo = sys.modules.get(nome)
+    if modulo is not None:
+        return getattr(modulo, '__file__', None)
+    try:
+        spec = importlib.util.find_spec(nome)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec else None
+
+
+def versao_codigo(funcao):
+    """Hash do código da função, do ficheiro do seu módulo (auxiliares que chama), dos módulos de PDF
+    partilhados e do logótipo: alterar qualquer um invalida os PDFs antigos"""
+    sha = hashlib.sha256(marshal.dumps(funcao.__code__))
+    ficheiros = [_ficheiro_modulo(funcao.__module__)]
+    ficheiros += [_ficheiro_modulo(nome) for nome in MODULOS_PDF]
+    ficheiros += RECURSOS_PDF
+    for caminho in ficheiros:
+        sha.update(_hash_ficheiro(caminho).encode('utf-8'))
+    return sha.hexdigest()[:16]
+
+
+class CachePDF:
+    """LRU em disco: `<chave>.pdf` + `<chave>.json` (nome do ficheiro); o mtime do PDF marca o último acesso"""
+
+    def __init__(self, pasta=PASTA_CACHE_PDF, max_bytes=MAX_BYTES_CACHE_PDF, max_entradas=MAX_ENTRADAS_CACHE_PDF):
+        self.pasta = pasta
+        self.max_bytes = max_bytes
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.remocoes = 0
+
+    @staticmethod
+    def chave(gerador, hash_dados):
+        return hashlib.sha256(f"{gerador}:{hash_dados}".encode('utf-8')).hexdigest()
+
+    def _caminhos(self, chave):
+        base = os.path.join(self.pasta, chave)
+        return base + '.pdf', base + '.json'
+
+    def obter(self, chave):
+        """(pdf_bytes, nome_ficheiro) em cache, ou None"""
+        caminho_pdf, caminho_meta = self._caminhos(chave)
+        try:
+            with open(caminho_meta, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(caminho_pdf, 'rb') as f:
+                pdf_bytes = f.read()
+            os.utime(caminho_pdf)  # LRU: último acesso
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return pdf_bytes, meta.get('nome')
+
+    def guardar(self, chave, pdf_bytes, nome_ficheiro, gerador=''):
+        """Guarda o documento e remove os menos usados recentemente acima dos limites"""
+        caminho_pdf, caminho_meta = self._caminhos(chave)
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            temporario = f"{caminho_pdf}.tmp"
+            with open(temporario, 'wb') as f:
+                f.write(pdf_bytes)
+            os.replace(temporario, caminho_pdf)
+            escrever_atomico(caminho_meta, json.dumps({
+                'nome': nome_ficheiro, 'gerador': gerador, 'criado_em': time.time()
+            }, ensure_ascii=False))
+        except OSError as e:
+            print(f"Aviso: não foi possível guardar PDF em cache: {e}")
+            return
+        self._aplicar_limites()
+
+    def _entradas(self):
+        """[(mtime, tamanho, chave)] dos PDFs em cache, do menos para o mais recente"""
+        entradas = []
+        try:
+            nomes = os.listdir(self.pasta)
+        except OSError:
+            return entradas
+        for nome in nomes:
+            if not nome.endswith('.pdf'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.pasta, nome))
+            except OSError:
+                continue
+            entradas.append((stat.st_mtime_ns, stat.st_size, nome[:-len('.pdf')]))
+        entradas.sort()
+        return entradas
+
+    def _aplicar_limites(self):
+        with self._lock:
+            entradas = self._entradas()
+            total = sum(tamanho for _, tamanho, _ in entradas)
+            while entradas and (len(entradas) > self.max_entradas or total > self.max_bytes):
+                _, tamanho, chave = entradas.pop(0)
+                for caminho in self._caminhos(chave):
+                    try:
+                        os.remove(caminho)
+                    except OSError:
+                        pass
+                total -= tamanho
+                self.remocoes += 1
+
+    def limpar(self):
+        """Remove todos os PDFs em cache"""
+        with self._lock:
+            for _, _, chave in self._entradas():
+                for caminho in self._caminhos(chave):
+                    try:
+                        os.remove(caminho)
+                    except OSError:
+                        pass
+
+    def estatisticas(self):
+        """Contadores de hits/misses/remoções, entradas e bytes em disco"""
+        entradas = self._entradas()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'remocoes': self.remocoes,
+            'entradas': len(entradas),
+            'bytes': sum(tamanho for _, tamanho, _ in entradas),
+        }
+
+
+# Cache do processo (partilhado por todas as sessões)
+cache_pdf = CachePDF()
+
+
+def pdf_em_cache(entradas, diario=False):
+    """Decorador de geradores que devolvem (pdf_bytes, nome): `entradas(*args)` devolve os registos que o PDF lê.
+    `diario`: o documento mostra a data de geração (no corpo ou no nome), por isso a chave inclui o dia de hoje"""
+    def decorador(funcao):
+        gerador = f"{funcao.__name__}:{versao_codigo(funcao)}"
+
+        @functools.wraps(funcao)
+        def gerar(*args, **kwargs):
+            registos = entradas(*args, **kwargs)
+            if diario:
+                registos = (*registos, date.today().isoformat())
+            chave = cache_pdf.chave(gerador, hash_entradas(*registos))
+            em_cache = cache_pdf.obter(chave)
+            if em_cache is not None:
+                return em_cache
+
+            pdf_bytes, nome_ficheiro = funcao(*args, **kwargs)
+            if pdf_bytes:
+                cache_pdf.guardar(chave, pdf_bytes, nome_ficheiro, gerador=funcao.__name__)
+            return pdf_bytes, nome_ficheiro
+        return gerar
+    return decorador
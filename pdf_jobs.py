@@ -0,0 +1,268 @@
+"""
+Serviço de PDFs em Segundo Plano
+Geradores de PDF executados num ProcessPoolExecutor; tabela de jobs com estado, duração e resultado para download,
+e pacotes de vários documentos gerados em paralelo e juntos num zip
+"""
+
+import os
+import io
+import time
+import uuid
+import zipfile
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from perf_metrics import metricas
+from pdf_stream import PDFEmFicheiro, MAX_IDADE_PDF_TEMP, limpar_temporarios, remover_pdf
+
+MODULO_APP = 'app_core'
+MAX_JOBS = 200  # jobs terminados mantidos na tabela (os mais antigos saem primeiro)
+MAX_IDADE_JOB = timedelta(seconds=MAX_IDADE_PDF_TEMP)  # jobs terminados há mais tempo saem da tabela
+WORKERS_PDF = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+EM_FILA = 'em fila'
+A_GERAR = 'a gerar'
+CONCLUIDO = 'concluido'
+ERRO = 'erro'
+
+
+# === EXECUÇÃO NO WORKER ===
+def _preparar_worker():
+    """Importa o núcleo da app uma vez por processo (as páginas com os geradores carregam no primeiro job)"""
+    import importlib
+    importlib.import_module(MODULO_APP)
+
+
+def _executar_gerador(nome_funcao, args, kwargs):
+    """Chama o gerador registado em app_pages e normaliza o resultado para (pdf_bytes, nome_ficheiro)"""
+    from app_pages import funcao_partilhada
+    gerador = funcao_partilhada(nome_funcao)
+
+    inicio = time.perf_counter()
+    resultado = gerador(*args, **kwargs)
+    ms = (time.perf_counter() - inicio) * 1000
+
+    nome_ficheiro = None
+    if isinstance(resultado, tuple):
+        resultado, nome_ficheiro = resultado
+    if isinstance(resultado, io.BytesIO):
+        resultado = resultado.getvalue()
+    return resultado, nome_ficheiro, ms
+
+
+# === SERVIÇO ===
+class ServicoPDF:
+    """Fila de geração de PDFs: submeter, consultar o estado e obter o resultado de cada job"""
+
+    def __init__(self, workers=WORKERS_PDF):
+        self.workers = workers
+        self._executor = None
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _obter_executor(self):
+        if self._executor is None:
+            # spawn: o processo do servidor tem threads (fork não é seguro)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_preparar_worker,
+            )
+        return self._executor
+
+    def _novo_job(self, nome_funcao, rotulo, nome_ficheiro, dono):
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'funcao': nome_funcao,
+            'rotulo': rotulo or nome_funcao,
+            'dono': dono,
+            'estado': EM_FILA,
+            'submetido_em': datetime.now(),
+            'concluido_em': None,
+            'ms': None,
+            'nome_ficheiro': nome_ficheiro,
+            'pdf': None,  # conteúdo do ficheiro (o zip, nos pacotes), ou PDFEmFicheiro nos documentos longos
+            'erro': None,
+            'progresso': None,
+            '_futuros': [],
+        }
+        with self._lock:
+            self._jobs[job['id']] = job
+            self._limitar()
+            em_uso = {outro['pdf'].caminho for outro in self._jobs.values() if isinstance(outro['pdf'], PDFEmFicheiro)}
+        # Temporários órfãos (reinícios, jobs perdidos); os dos jobs na tabela nunca são apagados
+        limpar_temporarios(manter=em_uso)
+        return job
+
+    def _enviar(self, nome_funcao, args, kwargs, ao_terminar):
+        """Submete ao pool; se o pool não estiver disponível, gera no próprio processo. Devolve o futuro (ou None)"""
+        kwargs = kwargs or {}
+        try:
+            futuro = self._obter_executor().submit(_executar_gerador, nome_funcao, args, kwargs)
+        except Exception as e:
+            # Pool indisponível (ex.: processos bloqueados no alojamento): gerar no próprio processo
+            print(f"Aviso: pool de PDFs indisponível, a gerar em linha: {e}")
+            self._executor = None
+            try:
+                resultado = _executar_gerador(nome_funcao, args, kwargs)
+            except Exception as erro:
+                resultado = erro
+            ao_terminar(resultado)
+            return None
+
+        def terminar(f):
+            try:
+                resultado = f.result()
+            except BaseException as erro:  # inclui CancelledError
+                resultado = erro
+            ao_terminar(resultado)
+
+        futuro.add_done_callback(terminar)
+        return futuro
+
+    def submeter(self, nome_funcao, args=(), kwargs=None, rotulo=None, nome_ficheiro=None, dono=None):
+        """Coloca o gerador `nome_funcao` da app na fila; devolve o id do job"""
+        job = self._novo_job(nome_funcao, rotulo, nome_ficheiro, dono)
+        futuro = self._enviar(nome_funcao, args, kwargs, lambda resultado: self._ao_terminar(job, resultado))
+        if futuro is not None:
+            job['_futuros'].append(futuro)
+        return job['id']
+
+    def submeter_pacote(self, documentos, rotulo, nome_ficheiro, dono=None):
+        """Gera `documentos` [(rótulo, nome_funcao, args, kwargs)] em paralelo no pool e junta-os num zip
+        à medida que terminam; devolve o id do job (concluído quando o último documento chega)"""
+        job = self._novo_job('pacote', rotulo, nome_ficheiro, dono)
+        buffer = io.BytesIO()
+        job['progresso'] = (0, len(documentos))
+        job['_pacote'] = {
+            'buffer': buffer,
+            'zip': zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED),  # PDF/PNG já vêm comprimidos
+            'inicio': time.perf_counter(),
+            'ficheiros': 0,
+            'falhas': [],
+        }
+        if not documentos:
+            self._fechar_pacote(job)
+            return job['id']
+
+        for ordem, (rotulo_documento, nome_funcao, args, kwargs) in enumerate(documentos, start=1):
+            futuro = self._enviar(
+                nome_funcao, args, kwargs,
+                lambda resultado, ordem=ordem, rotulo_documento=rotulo_documento, nome_funcao=nome_funcao:
+                    self._juntar_ao_pacote(job, ordem, rotulo_documento, nome_funcao, resultado)
+            )
+            if futuro is not None:
+                job['_futuros'].append(futuro)
+        return job['id']
+
+    def _ao_terminar(self, job, resultado):
+        if isinstance(resultado, BaseException):
+            self._falhar(job, resultado)
+        else:
+            self._concluir(job, resultado)
+
+    def _concluir(self, job, resultado):
+        pdf_bytes, nome_ficheiro, ms = resultado
+        with self._lock:
+            job['ms'] = ms
+            job['concluido_em'] = datetime.now()
+            if pdf_bytes:
+                job['pdf'] = pdf_bytes
+                job['nome_ficheiro'] = job['nome_ficheiro'] or nome_ficheiro or f"{job['funcao']}.pdf"
+                job['estado'] = CONCLUIDO
+            else:
+                job['erro'] = "Sem dados para gerar o documento"
+                job['estado'] = ERRO
+        metricas.registar('pdf_job', job['funcao'], ms, len(pdf_bytes) if pdf_bytes else None)
+
+    def _juntar_ao_pacote(self, job, ordem, rotulo_documento, nome_funcao, resultado):
+        """Escreve no zip um documento do pacote (numerado pela ordem pedida); o último fecha o pacote"""
+        pacote = job['_pacote']
+        with self._lock:
+            if isinstance(resultado, BaseException):
+                pacote['falhas'].append(f"{rotulo_documento}: {str(resultado) or resultado.__class__.__name__}")
+            elif not resultado[0]:
+                pacote['falhas'].append(f"{rotulo_documento}: sem dados para gerar o documento")
+            else:
+                conteudo, nome_documento, _ = resultado
+                nome_no_zip = f"{ordem:02d}_{nome_documento or nome_funcao + '.pdf'}"
+                if isinstance(conteudo, PDFEmFicheiro):
+                    # Copiado do disco para o zip por blocos; o temporário deixa de ser preciso
+                    pacote['zip'].write(conteudo.caminho, nome_no_zip)
+                    conteudo.remover()
+                else:
+                    pacote['zip'].writestr(nome_no_zip, conteudo)
+                pacote['ficheiros'] += 1
+            feitos, total = job['progresso']
+            job['progresso'] = (feitos + 1, total)
+            ultimo = feitos + 1 == total
+        if not isinstance(resultado, BaseException):
+            conteudo, _, ms = resultado
+            metricas.registar('pdf_job', nome_funcao, ms, len(conteudo) if conteudo else None)
+        if ultimo:
+            self._fechar_pacote(job)
+
+    def _fechar_pacote(self, job):
+        pacote = job.pop('_pacote')
+        pacote['zip'].close()
+        ms = (time.perf_counter() - pacote['inicio']) * 1000
+        with self._lock:
+            job['ms'] = ms
+            job['concluido_em'] = datetime.now()
+            job['erro'] = "; ".join(pacote['falhas']) or None
+            if pacote['ficheiros']:
+                job['pdf'] = pacote['buffer'].getvalue()
+                job['estado'] = CONCLUIDO
+            else:
+                job['erro'] = job['erro'] or "Nenhum documento selecionado"
+                job['estado'] = ERRO
+        metricas.registar('pdf_job', 'pacote', ms, len(job['pdf']) if job['pdf'] else None)
+
+    def _falhar(self, job, erro):
+        with self._lock:
+            job['erro'] = str(erro) or erro.__class__.__name__
+            job['concluido_em'] = datetime.now()
+            job['estado'] = ERRO
+
+    def _limitar(self):
+        """Retira os jobs terminados há mais de MAX_IDADE_JOB e os mais antigos acima de MAX_JOBS (com os ficheiros)"""
+        limite = datetime.now() - MAX_IDADE_JOB
+        terminados = [job_id for job_id, job in self._jobs.items() if job['estado'] in (CONCLUIDO, ERRO)]
+        excesso = set(terminados[:max(0, len(self._jobs) - MAX_JOBS)])
+        for job_id in terminados:
+            if job_id in excesso or self._jobs[job_id]['concluido_em'] < limite:
+                remover_pdf(self._jobs.pop(job_id)['pdf'])
+
+    def estado(self, job_id):
+        """Cópia pública do job (sem o futuro), com 'a gerar' quando o worker já o executa"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            publico = {chave: valor for chave, valor in job.items() if not chave.startswith('_')}
+        if publico['estado'] == EM_FILA and any(futuro.running() for futuro in job['_futuros']):
+            publico['estado'] = A_GERAR
+        return publico
+
+    def jobs(self, dono=None):
+        """Jobs (mais recentes primeiro), opcionalmente só os de um utilizador"""
+        with self._lock:
+            ids = [job_id for job_id, job in self._jobs.items() if dono is None or job['dono'] == dono]
+        return [self.estado(job_id) for job_id in reversed(ids)]
+
+    def remover(self, job_id):
+        """Retira um job da tabela (cancelando o que ainda estiver em fila)"""
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job:
+            for futuro in job['_futuros']:
+                futuro.cancel()
+            remover_pdf(job['pdf'])
+
+    def encerrar(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
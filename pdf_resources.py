@@ -0,0 +1,186 @@
+"""
+Recursos Partilhados dos PDFs
+Estilos nomeados, cores, fontes e logótipo pré-escalado construídos uma vez por processo, e o cabeçalho do clube
+"""
+
+import os
+import time
+import threading
+from io import BytesIO
+
+CAMINHO_LOGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fotos', 'logo pinheirense.jpg')
+NOME_CLUBE = "FUTEBOL CLUBE PINHEIRENSE"
+EPOCA = "ÉPOCA 25/26"
+
+# Lado máximo (px) do logótipo embebido: ~250 dpi no maior tamanho usado (25 mm)
+LADO_LOGO_PX = 256
+
+# Família base-14 (sem embutir ficheiros de fontes nos PDFs)
+FONTES = {
+    'normal': 'Helvetica',
+    'negrito': 'Helvetica-Bold',
+    'italico': 'Helvetica-Oblique',
+}
+
+# Sufixo -> (fontSize, spaceAfter) de ClubHeader, DocumentTitle e Competition
+VARIANTES_CABECALHO = {
+    '': ((14, 2), (16, 5), (8, 8)),
+    'Compact': ((12, 3), (14, 5), (7, 8)),
+    'Large': ((16, 5), (18, 8), (9, 10)),
+}
+
+_lock = threading.Lock()
+_recursos = None
+
+
+def _logo_preescalado(caminho, lado=LADO_LOGO_PX):
+    """JPEG do logótipo reduzido a `lado` px (None se não existir ou não puder ser lido)"""
+    if not os.path.exists(caminho):
+        return None
+    try:
+        from PIL import Image as PILImage
+
+        with PILImage.open(caminho) as imagem:
+            imagem = imagem.convert('RGB')
+            imagem.thumbnail((lado, lado))
+            saida = BytesIO()
+            imagem.save(saida, format='JPEG', quality=90)
+            return saida.getvalue()
+    except Exception as e:
+        print(f"Aviso: logótipo não pôde ser pré-escalado: {e}")
+        try:
+            with open(caminho, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+class RecursosPDF:
+    """Estilos, cores, fontes e logótipo partilhados por todos os geradores (não devem ser alterados)"""
+
+    def __init__(self, caminho_logo=CAMINHO_LOGO):
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+
+        self.cores = {
+            'azul_clube': colors.Color(0.1, 0.3, 0.7),
+            'azul_claro': colors.Color(0.3, 0.5, 0.8),
+            'cinza_escuro': colors.Color(0.2, 0.2, 0.2),
+        }
+        self.fontes = dict(FONTES)
+
+        # Folha base + estilos nomeados comuns aos documentos do clube, em três tamanhos
+        self.estilos = getSampleStyleSheet()
+        for sufixo, (clube, titulo, competicao) in VARIANTES_CABECALHO.items():
+            self.estilos.add(ParagraphStyle(
+                f'ClubHeader{sufixo}', parent=self.estilos['Heading1'], fontSize=clube[0], spaceAfter=clube[1],
+                alignment=TA_CENTER, textColor=self.cores['azul_clube'], fontName=FONTES['negrito']
+            ))
+            self.estilos.add(ParagraphStyle(
+                f'DocumentTitle{sufixo}', parent=self.estilos['Heading1'], fontSize=titulo[0], spaceAfter=titulo[1],
+                alignment=TA_CENTER, textColor=self.cores['azul_clube'], fontName=FONTES['negrito']
+            ))
+            self.estilos.add(ParagraphStyle(
+                f'Competition{sufixo}', parent=self.estilos['Normal'], fontSize=competicao[0], spaceAfter=competicao[1],
+                alignment=TA_CENTER, textColor=self.cores['azul_claro'], fontName=FONTES['italico']
+            ))
+        self.estilos.add(ParagraphStyle(
+            'ReportTitle', parent=self.estilos['Heading1'], fontSize=14, spaceAfter=3,
+            alignment=TA_CENTER, textColor=self.cores['azul_clube'], fontName=FONTES['negrito']
+        ))
+
+        self.logo_bytes = _logo_preescalado(caminho_logo)
+
+    # === CABEÇALHO ===
+    def logo(self, tamanho):
+        """Flowable do logótipo (JPEG pré-escalado embebido sem nova descodificação)"""
+        from reportlab.platypus import Image as RLImage
+
+        return RLImage(BytesIO(self.logo_bytes), width=tamanho, height=tamanho)
+
+    def cabecalho_clube(self, texto=None, tamanho_logo=None, largura_logo=None, largura_texto=None, tamanho_fonte=12,
+                        espaco=5, texto_alternativo=NOME_CLUBE, estilo_alternativo='ClubHeader', espaco_alternativo=3):
+        """Flowables do cabeçalho: logótipo | texto | logótipo; sem logótipo, apenas o texto alternativo (se houver)"""
+        from reportlab.lib.units import mm
+        from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+
+        texto = texto or f"{NOME_CLUBE}\n{EPOCA}"
+        tamanho_logo = tamanho_logo or 20 * mm
+        largura_logo = largura_logo or tamanho_logo + 5 * mm
+        largura_texto = largura_texto or 120 * mm
+
+        if self.logo_bytes:
+            try:
+                tabela = Table(
+                    [[self.logo(tamanho_logo), texto, self.logo(tamanho_logo)]],
+                    colWidths=[largura_logo, largura_texto, largura_logo]
+                )
+                tabela.setStyle(TableStyle([
+                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                    ('FONTNAME', (1, 0), (1, 0), FONTES['negrito']),
+                    ('FONTSIZE', (1, 0), (1, 0), tamanho_fonte),
+                    ('TEXTCOLOR', (1, 0), (1, 0), self.cores['azul_clube']),
+                ]))
+                return [tabela, Spacer(1, espaco)]
+            except Exception as e:
+                print(f"Aviso: cabeçalho com logótipo falhou: {e}")
+
+        if not texto_alternativo:
+            return []
+        return [Paragraph(texto_alternativo, self.estilos[estilo_alternativo]), Spacer(1, espaco_alternativo)]
+
+
+def recursos_pdf():
+    """Registo de recursos do processo, construído no primeiro PDF"""
+    global _recursos
+    if _recursos is None:
+        with _lock:
+            if _recursos is None:
+                _recursos = RecursosPDF()
+    return _recursos
+
+
+# === BENCHMARK ===
+def medir_preparacao(repeticoes=50, caminho_logo=CAMINHO_LOGO):
+    """Custo médio (ms) de preparar estilos + cabeçalho de um documento: por documento vs registo partilhado"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Table, Image as RLImage
+
+    def construir(story):
+        SimpleDocTemplate(BytesIO(), pagesize=A4).build(story)
+
+    def por_documento():
+        estilos = getSampleStyleSheet()
+        for nome in ('ClubHeader', 'DocumentTitle', 'Competition'):
+            ParagraphStyle(nome, parent=estilos['Heading1'], fontSize=14)
+        story = []
+        if os.path.exists(caminho_logo):
+            story.append(Table([[RLImage(caminho_logo, width=20 * mm, height=20 * mm), f"{NOME_CLUBE}\n{EPOCA}",
+                                 RLImage(caminho_logo, width=20 * mm, height=20 * mm)]]))
+        construir(story or [Table([[NOME_CLUBE]])])
+
+    recursos = RecursosPDF(caminho_logo)
+
+    def partilhado():
+        construir(recursos.cabecalho_clube())
+
+    resultados = {}
+    for nome, funcao in (('por_documento', por_documento), ('partilhado', partilhado)):
+        funcao()  # aquecimento (importações do reportlab)
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        resultados[nome] = (time.perf_counter() - inicio) * 1000 / repeticoes
+    return resultados
+
+
+if __name__ == "__main__":
+    import sys
+
+    caminho = sys.argv[1] if len(sys.argv) > 1 else CAMINHO_LOGO
+    for nome, ms in medir_preparacao(caminho_logo=caminho).items():
+        print(f"{nome:<15} {ms:8.2f} ms/documento")
@@ -0,0 +1,146 @@
+"""
+PDFs Compostos por Secções
+Documentos montados a partir de secções desenhadas à parte (capa, semanas, sessões, jogos), cada uma guardada na
+cache de PDFs pelos registos que lê: ao alterar um treino só a secção onde ele está volta a ser desenhada, e as
+páginas das restantes são reaproveitadas e juntadas num único PDF
+"""
+
+import re
+from io import BytesIO
+from collections import namedtuple
+
+from pdf_cache import cache_pdf, hash_entradas, versao_codigo
+
+# Secção de um documento: `construir(*entradas)` devolve os flowables (a secção começa numa página nova);
+# as entradas são registos simples (sem objetos do reportlab) e identificam o conteúdo na cache
+SecaoPDF = namedtuple('SecaoPDF', 'nome construir entradas')
+
+_REFERENCIA = re.compile(rb'(\d+) 0 R\b')
+_INICIO_STREAM = re.compile(rb'>>\s*stream\r?\n')
+_ENTRADA_XREF = re.compile(rb'(\d{10}) (\d{5}) ([nf])')
+
+
+# === JUNÇÃO DE PDFs ===
+def _objetos(pdf):
+    """({número: corpo}, trailer) de um PDF com tabela xref clássica e sem object streams (como os do reportlab)"""
+    posicao = pdf.rfind(b'startxref')
+    if posicao < 0:
+        raise ValueError("PDF sem startxref")
+    inicio_xref = int(pdf[posicao + len(b'startxref'):].split()[0])
+    cabecalho = re.match(rb'xref\s+(\d+)\s+(\d+)\s+', pdf[inicio_xref:])
+    if cabecalho is None:
+        raise ValueError("PDF sem tabela xref clássica")
+
+    primeiro, quantos = int(cabecalho.group(1)), int(cabecalho.group(2))
+    entradas = _ENTRADA_XREF.finditer(pdf, inicio_xref + cabecalho.end())
+    posicoes = {}
+    for numero, entrada in zip(range(primeiro, primeiro + quantos), entradas):
+        if entrada.group(3) == b'n':
+            posicoes[numero] = int(entrada.group(1))
+
+    # Cada objeto vai do seu início ao início do seguinte (ou à tabela xref)
+    ordem = sorted(posicoes.items(), key=lambda item: item[1])
+    objetos = {}
+    for indice, (numero, inicio) in enumerate(ordem):
+        fim = ordem[indice + 1][1] if indice + 1 < len(ordem) else inicio_xref
+        bloco = pdf[inicio:fim]
+        abertura = re.match(rb'\s*\d+\s+\d+\s+obj\s*', bloco)
+        objetos[numero] = bloco[abertura.end():bloco.rindex(b'endobj')].rstrip()
+    return objetos, pdf[inicio_xref:posicao]
+
+
+def _referencia(trailer_ou_objeto, chave):
+    encontrado = re.search(rb'/' + chave + rb'\s+(\d+) 0 R', trailer_ou_objeto)
+    return int(encontrado.group(1)) if encontrado else None
+
+
+def _paginas(objetos, numero):
+    """Números das páginas da árvore `numero` (/Pages), pela ordem do documento"""
+    corpo = objetos[numero]
+    if re.search(rb'/Type\s*/Page\b(?!s)', corpo):
+        return [numero]
+    kids = re.search(rb'/Kids\s*\[(.*?)\]', corpo, re.S)
+    paginas = []
+    for filho in _REFERENCIA.finditer(kids.group(1) if kids else b''):
+        paginas.extend(_paginas(objetos, int(filho.group(1))))
+    return paginas
+
+
+def juntar_pdfs(pdfs):
+    """Um PDF com as páginas de `pdfs` (bytes gerados pelo reportlab) pela ordem dada.
+    Catálogo, árvore de páginas e metadados de cada parte são substituídos; o resto é copiado e renumerado"""
+    if len(pdfs) == 1:
+        return pdfs[0]
+
+    CATALOGO, PAGINAS = 1, 2  # números reservados no resultado
+    corpos = [None, None]
+    kids = []
+    for pdf in pdfs:
+        objetos, trailer = _objetos(pdf)
+        raiz = _referencia(trailer, b'Root')
+        arvore = _referencia(objetos[raiz], b'Pages')
+        paginas = _paginas(objetos, arvore)
+        arvores = {numero for numero, corpo in objetos.items() if re.search(rb'/Type\s*/Pages\b', corpo)}
+        descartados = {raiz, _referencia(trailer, b'Info')} | arvores
+
+        mapa = {}
+        for numero in sorted(objetos):
+            if numero not in descartados:
+                corpos.append(None)
+                mapa[numero] = len(corpos)
+
+        def renumerar(referencia):
+            antigo = int(referencia.group(1))
+            if antigo in mapa:
+                return b'%d 0 R' % mapa[antigo]
+            return b'%d 0 R' % PAGINAS if antigo in arvores else b'null'  # /Parent das páginas
+
+        for numero, novo in mapa.items():
+            corpo = objetos[numero]
+            stream = _INICIO_STREAM.search(corpo)
+            dicionario, resto = (corpo[:stream.start() + 2], corpo[stream.start() + 2:]) if stream else (corpo, b'')
+            # Só o dicionário tem referências; o conteúdo dos streams é copiado tal como está
+            corpos[novo - 1] = _REFERENCIA.sub(renumerar, dicionario) + resto
+        kids.extend(mapa[numero] for numero in paginas)
+
+    corpos[CATALOGO - 1] = b'<<\n/Pages %d 0 R /Type /Catalog\n>>' % PAGINAS
+    corpos[PAGINAS - 1] = b'<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>' % (
+        len(kids), b' '.join(b'%d 0 R' % numero for numero in kids)
+    )
+
+    saida = BytesIO()
+    saida.write(pdfs[0].split(b'\n', 1)[0] + b'\n%\x93\x8c\x8b\x9e\n')
+    posicoes = []
+    for numero, corpo in enumerate(corpos, start=1):
+        posicoes.append(saida.tell())
+        saida.write(b'%d 0 obj\n' % numero + corpo + b'\nendobj\n')
+    inicio_xref = saida.tell()
+    saida.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(corpos) + 1))
+    for posicao in posicoes:
+        saida.write(b'%010d 00000 n \n' % posicao)
+    saida.write(b'trailer\n<<\n/Root %d 0 R /Size %d\n>>\nstartxref\n%d\n%%%%EOF\n' % (
+        CATALOGO, len(corpos) + 1, inicio_xref
+    ))
+    return saida.getvalue()
+
+
+# === COMPOSIÇÃO COM CACHE POR SECÇÃO ===
+def compor_pdf(gerador, secoes, criar_documento, cache=cache_pdf):
+    """PDF com as `secoes` pela ordem dada: cada secção vem da cache ou é desenhada (e guardada) à parte com
+    `criar_documento(saida)` (página e margens); devolve (pdf_bytes, nomes das secções desenhadas)"""
+    partes = []
+    desenhadas = []
+    for secao in secoes:
+        versao = f"{gerador}/{secao.nome}:{versao_codigo(secao.construir)}"
+        chave = cache.chave(versao, hash_entradas(*secao.entradas))
+        em_cache = cache.obter(chave)
+        if em_cache is not None:
+            partes.append(em_cache[0])
+            continue
+
+        buffer = BytesIO()
+        criar_documento(buffer).build(list(secao.construir(*secao.entradas)))
+        partes.append(buffer.getvalue())
+        cache.guardar(chave, partes[-1], None, gerador=f"{gerador}/{secao.nome}")
+        desenhadas.append(secao.nome)
+    return juntar_pdfs(partes), desenhadas
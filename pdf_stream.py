@@ -0,0 +1,155 @@
+"""
+PDFs Longos em Ficheiro (memória limitada)
+Documentos que crescem com as épocas escritos diretamente num ficheiro temporário: a story é consumida por lotes
+de um iterador e as tabelas longas chegam já divididas em blocos do tamanho de uma página; o resultado viaja entre
+processos como caminho e só é lido (por blocos) quando é descarregado ou juntado a um zip
+"""
+
+import os
+import time
+import tempfile
+import itertools
+
+PASTA_PDF_TEMP = os.path.join(tempfile.gettempdir(), 'app_treinador_pdfs')
+MAX_IDADE_PDF_TEMP = 6 * 3600  # segundos; jobs terminados e ficheiros órfãos mais antigos são apagados
+TAMANHO_BLOCO = 256 * 1024
+LOTE_FLOWABLES = 50
+
+
+class PDFEmFicheiro:
+    """PDF gerado em disco; `len()` é o tamanho em bytes e o conteúdo só é lido quando pedido"""
+
+    def __init__(self, caminho, tamanho=None):
+        self.caminho = caminho
+        self.tamanho = os.path.getsize(caminho) if tamanho is None else tamanho
+
+    def __len__(self):
+        return self.tamanho
+
+    def __bool__(self):
+        return self.tamanho > 0
+
+    def __repr__(self):
+        return f"PDFEmFicheiro({self.caminho!r}, {self.tamanho} bytes)"
+
+    def blocos(self, tamanho=TAMANHO_BLOCO):
+        """Conteúdo em blocos de `tamanho` bytes"""
+        with open(self.caminho, 'rb') as f:
+            while True:
+                bloco = f.read(tamanho)
+                if not bloco:
+                    return
+                yield bloco
+
+    def ler(self):
+        with open(self.caminho, 'rb') as f:
+            return f.read()
+
+    def remover(self):
+        try:
+            os.remove(self.caminho)
+        except OSError:
+            pass
+
+
+def remover_pdf(pdf):
+    """Apaga o ficheiro temporário de um resultado em disco (bytes não precisam de nada)"""
+    if isinstance(pdf, PDFEmFicheiro):
+        pdf.remover()
+
+
+class _StoryPorLotes(list):
+    """Lista que o reportlab consome pela frente, reabastecida do iterador `lote` a `lote` flowables:
+    só os flowables do lote atual (e as páginas já comprimidas) ficam em memória"""
+
+    def __init__(self, flowables, lote):
+        super().__init__()
+        self._iterador = iter(flowables)
+        self._lote = lote
+        self._reabastecer()
+
+    def _reabastecer(self):
+        if self._iterador is not None and list.__len__(self) < self._lote:
+            tamanho = list.__len__(self)
+            self.extend(itertools.islice(self._iterador, self._lote))
+            if list.__len__(self) == tamanho:
+                self._iterador = None  # esgotado
+
+    def __len__(self):
+        # O ciclo do build pergunta o tamanho antes de cada flowable: altura certa para ir buscar o lote seguinte
+        self._reabastecer()
+        return list.__len__(self)
+
+
+def limpar_temporarios(idade_maxima=MAX_IDADE_PDF_TEMP, manter=()):
+    """Apaga PDFs temporários com mais de `idade_maxima` segundos (reinícios, jobs perdidos), exceto os
+    caminhos em `manter` (os dos jobs ainda na tabela do serviço)"""
+    limite = time.time() - idade_maxima
+    try:
+        nomes = os.listdir(PASTA_PDF_TEMP)
+    except OSError:
+        return
+    for nome in nomes:
+        caminho = os.path.join(PASTA_PDF_TEMP, nome)
+        if caminho in manter:
+            continue
+        try:
+            if os.stat(caminho).st_mtime < limite:
+                os.remove(caminho)
+        except OSError:
+            pass
+
+
+def pdf_em_ficheiro(criar_documento, flowables, lote=LOTE_FLOWABLES):
+    """Constrói `criar_documento(caminho)` (ex.: SimpleDocTemplate) num ficheiro temporário, consumindo
+    `flowables` (iterador) por lotes; devolve o PDFEmFicheiro"""
+    os.makedirs(PASTA_PDF_TEMP, exist_ok=True)
+    descritor, caminho = tempfile.mkstemp(suffix='.pdf', dir=PASTA_PDF_TEMP)
+    os.close(descritor)
+    try:
+        criar_documento(caminho).build(_StoryPorLotes(flowables, lote))
+    except BaseException:
+        os.remove(caminho)
+        raise
+    return PDFEmFicheiro(caminho)
+
+
+def altura_flowables(flowables, largura, altura):
+    """Altura ocupada por `flowables` empilhados numa moldura `largura` × `altura` (com espaços antes/depois)"""
+    total = 0
+    for flowable in flowables:
+        total += flowable.getSpaceBefore() + flowable.wrap(largura, altura)[1] + flowable.getSpaceAfter()
+    return total
+
+
+def dividir_tabela(cabecalho, linhas, larguras, estilo, altura_pagina, altura_primeira=None):
+    """Tabelas com o cabeçalho repetido e as linhas que cabem em cada página (linhas de altura uniforme):
+    a primeira ocupa `altura_primeira` (o que sobra na página atual), as seguintes `altura_pagina`.
+    Gerador: cada bloco só é criado quando o documento lá chega"""
+    from reportlab.platypus import Table
+
+    def tabela(dados):
+        bloco = Table(dados, colWidths=larguras)
+        bloco.setStyle(estilo)
+        return bloco
+
+    if not linhas:
+        yield tabela([cabecalho])
+        return
+
+    largura = sum(larguras)
+    altura_cabecalho = tabela([cabecalho]).wrap(largura, altura_pagina)[1]
+    altura_linha = tabela([cabecalho, linhas[0]]).wrap(largura, altura_pagina)[1] - altura_cabecalho
+
+    def capacidade(altura):
+        return max(0, int((altura - altura_cabecalho) // altura_linha))
+
+    por_pagina = max(1, capacidade(altura_pagina))
+    inicio = 0
+    # Sem espaço para o cabeçalho e uma linha na página atual, o primeiro bloco já é de página inteira
+    quantas = capacidade(altura_primeira) if altura_primeira is not None else por_pagina
+    quantas = quantas or por_pagina
+    while inicio < len(linhas):
+        yield tabela([cabecalho] + linhas[inicio:inicio + quantas])
+        inicio += quantas
+        quantas = por_pagina
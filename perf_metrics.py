@@ -0,0 +1,195 @@
+"""
+Métricas de Desempenho por Rerun
+Amostras (tempo, bytes) num buffer circular com percentis, exportação JSONL e captura cProfile de um rerun
+"""
+
+import io
+import os
+import json
+import time
+import pstats
+import cProfile
+import tempfile
+import threading
+import functools
+import statistics
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+MAX_AMOSTRAS = 5000
+FICHEIRO_METRICAS = "APP_FINAL.perf.jsonl"
+MAX_BYTES_METRICAS = 5 * 1024 * 1024  # acima disto o ficheiro passa a `<ficheiro>.1` (no máximo ~2x em disco)
+EXPORTAR_A_CADA = 100  # amostras pendentes que disparam a exportação
+EXPORTAR_INTERVALO = 60  # segundos
+
+
+def _percentis(valores, percentis):
+    """Percentis com interpolação linear (como numpy.percentile), sem importar numpy"""
+    if len(valores) == 1:
+        return [valores[0]] * len(percentis)
+    cortes = statistics.quantiles(valores, n=100, method='inclusive')
+    return [cortes[p - 1] if 0 < p < 100 else (min(valores) if p == 0 else max(valores)) for p in percentis]
+
+
+class MetricasDesempenho:
+    """Buffer circular de amostras {categoria, nome, ms, bytes, ts} partilhado pelo processo"""
+
+    def __init__(self, max_amostras=MAX_AMOSTRAS, ficheiro=FICHEIRO_METRICAS, max_bytes=MAX_BYTES_METRICAS):
+        self.ficheiro = ficheiro
+        self.max_bytes = max_bytes
+        self._amostras = deque(maxlen=max_amostras)
+        self._pendentes = []
+        self._ultima_exportacao = time.monotonic()
+        self._lock = threading.Lock()
+
+    def registar(self, categoria, nome, ms, bytes=None):
+        """Regista uma amostra e exporta o lote pendente quando é grande ou antigo"""
+        amostra = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'categoria': categoria,
+            'nome': nome,
+            'ms': round(ms, 3),
+        }
+        if bytes is not None:
+            amostra['bytes'] = int(bytes)
+
+        with self._lock:
+            self._amostras.append(amostra)
+            self._pendentes.append(amostra)
+            exportar = (
+                len(self._pendentes) >= EXPORTAR_A_CADA
+                or time.monotonic() - self._ultima_exportacao >= EXPORTAR_INTERVALO
+            )
+        if exportar:
+            self.exportar()
+        return amostra
+
+    @contextmanager
+    def medir(self, categoria, nome):
+        """Mede o bloco (também quando termina por exceção, ex.: st.rerun); `medicao['bytes']` é opcional"""
+        medicao = {'bytes': None}
+        inicio = time.perf_counter()
+        try:
+            yield medicao
+        finally:
+            self.registar(categoria, nome, (time.perf_counter() - inicio) * 1000, medicao['bytes'])
+
+    def medido(self, categoria, nome=None):
+        """Decorador que mede cada chamada da função"""
+        def decorador(funcao):
+            rotulo = nome or funcao.__name__
+
+            @functools.wraps(funcao)
+            def medir_chamada(*args, **kwargs):
+                with self.medir(categoria, rotulo):
+                    return funcao(*args, **kwargs)
+            return medir_chamada
+        return decorador
+
+    def amostras(self, categoria=None):
+        """Cópia das amostras em memória (opcionalmente de uma categoria)"""
+        with self._lock:
+            amostras = list(self._amostras)
+        if categoria is None:
+            return amostras
+        return [amostra for amostra in amostras if amostra['categoria'] == categoria]
+
+    def resumo(self, categoria=None):
+        """Estatísticas por (categoria, nome): n, p50, p95, p99, máximo, total e bytes médios"""
+        grupos = {}
+        for amostra in self.amostras(categoria):
+            grupos.setdefault((amostra['categoria'], amostra['nome']), []).append(amostra)
+
+        linhas = []
+        for (cat, nome), amostras in grupos.items():
+            tempos = [amostra['ms'] for amostra in amostras]
+            p50, p95, p99 = _percentis(tempos, (50, 95, 99))
+            tamanhos = [amostra['bytes'] for amostra in amostras if 'bytes' in amostra]
+            linhas.append({
+                'categoria': cat,
+                'nome': nome,
+                'n': len(amostras),
+                'p50_ms': round(float(p50), 1),
+                'p95_ms': round(float(p95), 1),
+                'p99_ms': round(float(p99), 1),
+                'max_ms': round(float(max(tempos)), 1),
+                'total_ms': round(float(sum(tempos)), 1),
+                'bytes_medio': int(statistics.fmean(tamanhos)) if tamanhos else None,
+            })
+        linhas.sort(key=lambda linha: linha['p95_ms'], reverse=True)
+        return linhas
+
+    def exportar(self):
+        """Acrescenta as amostras pendentes ao ficheiro JSONL; devolve quantas foram escritas"""
+        with self._lock:
+            pendentes, self._pendentes = self._pendentes, []
+            self._ultima_exportacao = time.monotonic()
+        if not pendentes or not self.ficheiro:
+            return 0
+        self._rodar()
+        try:
+            with open(self.ficheiro, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(amostra, ensure_ascii=False) + '\n' for amostra in pendentes))
+        except OSError as e:
+            print(f"Aviso: não foi possível exportar métricas: {e}")
+            return 0
+        return len(pendentes)
+
+    def _rodar(self):
+        """Passa o ficheiro a `<ficheiro>.1` quando atinge `max_bytes` (o `.1` anterior é descartado)"""
+        try:
+            if os.path.getsize(self.ficheiro) >= self.max_bytes:
+                os.replace(self.ficheiro, f"{self.ficheiro}.1")
+        except OSError:
+            pass  # Ainda sem ficheiro (ou rodado por outro processo)
+
+    def limpar(self):
+        """Descarta as amostras em memória (o ficheiro JSONL mantém-se)"""
+        with self._lock:
+            self._amostras.clear()
+            self._pendentes.clear()
+
+
+# Registo do processo (usado pelos módulos e pela app)
+metricas = MetricasDesempenho()
+
+
+def medir(categoria, nome):
+    """Atalho para `metricas.medir`"""
+    return metricas.medir(categoria, nome)
+
+
+def medido(categoria, nome=None):
+    """Atalho para `metricas.medido`"""
+    return metricas.medido(categoria, nome)
+
+
+# === CAPTURA CPROFILE ===
+@contextmanager
+def perfilar():
+    """Perfila o bloco com cProfile; à saída (mesmo por exceção) preenche `captura['prof']` e `captura['texto']`"""
+    perfil = cProfile.Profile()
+    captura = {}
+    perfil.enable()
+    try:
+        yield captura
+    finally:
+        perfil.disable()
+        captura['prof'], captura['texto'] = exportar_perfil(perfil)
+
+
+def exportar_perfil(perfil, top=30):
+    """Ficheiro .prof (formato pstats) e as `top` funções por tempo acumulado"""
+    descritor, caminho = tempfile.mkstemp(suffix='.prof')
+    os.close(descritor)
+    try:
+        perfil.dump_stats(caminho)
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+    finally:
+        os.remove(caminho)
+
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).sort_stats('cumulative').print_stats(top)
+    return conteudo, saida.getvalue()
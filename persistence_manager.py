@@ -5,11 +5,16 @@ Garante que os dados e fotos persistam mesmo com resets do Streamlit Cloud
 
 import os
 import time
-import json
 import uuid
+import hashlib
+import threading
 import streamlit as st
 from data_manager import DataManager
-from datetime import datetime, timedelta
+from persistence_pipeline import assinatura_ficheiro, escrever_metadados, ler_metadados
+
+# Resultados de validação memorizados por ficheiro: {caminho: {'assinatura', 'versao', 'resultado'}}
+_cache_integridade = {}
+_lock_integridade = threading.Lock()
 
 class PersistenceManager:
     """Gerencia a persistência robusta de dados"""
@@ -22,9 +27,61 @@ class PersistenceManager:
             st.session_state.last_data_backup = 0
             st.session_state.data_validation_count = 0
             
+    @staticmethod
+    def _hash_ficheiro(caminho):
+        """SHA-256 do conteúdo do ficheiro (versão usada quando o sidecar não corresponde ao ficheiro)"""
+        sha = hashlib.sha256()
+        with open(caminho, 'rb') as f:
+            for bloco in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(bloco)
+        return sha.hexdigest()
+    
     @staticmethod
     def validate_data_integrity():
-        """Valida a integridade dos dados carregados"""
+        """Valida a integridade dos dados, apenas quando o ficheiro mudou (mtime/tamanho/hash)"""
+        caminho = DataManager.DATA_FILE
+        assinatura = assinatura_ficheiro(caminho)
+        
+        with _lock_integridade:
+            memo = _cache_integridade.get(caminho)
+            
+            # 1) mtime e tamanho iguais: reutilizar resultado sem ler o ficheiro
+            if memo and assinatura and memo['assinatura'] == assinatura:
+                return memo['resultado']
+        
+        # 2) Versão do conteúdo: a do sidecar quando corresponde ao ficheiro (gravado pelo pipeline),
+        #    senão o hash do ficheiro, calculado uma única vez
+        versao = None
+        if assinatura:
+            metadados = ler_metadados(caminho)
+            versao = metadados.get('versao') if metadados else None
+            if versao is None:
+                try:
+                    versao = PersistenceManager._hash_ficheiro(caminho)
+                except OSError:
+                    versao = None
+        
+        with _lock_integridade:
+            # Ficheiro tocado mas conteúdo igual: mesma versão, mesmo resultado
+            if memo and versao and memo['versao'] == versao:
+                memo['assinatura'] = assinatura
+                return memo['resultado']
+        
+        # 3) Nova versão: validação completa
+        resultado = PersistenceManager._validar_integridade_completa(versao)
+        
+        with _lock_integridade:
+            _cache_integridade[caminho] = {
+                'assinatura': assinatura,
+                'versao': versao,
+                'resultado': resultado,
+            }
+        return resultado
+    
+    @staticmethod
+    def _validar_integridade_completa(versao=None):
+        """Carrega e verifica os dados (atualiza o sidecar de metadados se estiver obsoleto);
+        `versao` é o hash já calculado do ficheiro, reutilizado no sidecar"""
         try:
             data = DataManager.load_data()
             
@@ -47,6 +104,10 @@ class PersistenceManager:
             
             if needs_save:
                 DataManager.save_data(data)
+            elif ler_metadados(DataManager.DATA_FILE) is None and os.path.exists(DataManager.DATA_FILE):
+                escrever_metadados(
+                    DataManager.DATA_FILE, data, versao or PersistenceManager._hash_ficheiro(DataManager.DATA_FILE)
+                )
             
             return True
             
@@ -62,12 +123,8 @@ class PersistenceManager:
         # Backup a cada 30 minutos
         if (current_time - st.session_state.get('last_data_backup', 0)) > 1800:
             try:
-                from APP_FINAL import create_backup_with_auto_retry, is_streamlit_cloud
-                
-                if is_streamlit_cloud():
-                    success = create_backup_with_auto_retry(dropbox_only=True)
-                else:
-                    success = create_backup_with_auto_retry()
+                # Snapshot através do pipeline único de persistência
+                success = DataManager.create_simple_backup()
                 
                 if success:
                     st.session_state.last_data_backup = current_time
@@ -80,22 +137,13 @@ class PersistenceManager:
     def emergency_data_recovery():
         """Recuperação de emergência dos dados"""
         try:
-            from APP_FINAL import auto_restore_from_backup, is_streamlit_cloud
-            
             st.warning("🚨 Iniciando recuperação de emergência...")
             
-            if is_streamlit_cloud():
-                # No cloud, tentar restaurar do Dropbox
-                auto_restore_from_backup()
-            else:
-                # Localmente, verificar backups
-                backup_dir = "data/backups"
-                if os.path.exists(backup_dir):
-                    backup_files = [f for f in os.listdir(backup_dir) if f.endswith('.zip')]
-                    if backup_files:
-                        latest_backup = max(backup_files, key=lambda x: os.path.getctime(os.path.join(backup_dir, x)))
-                        st.info(f"📁 Backup local encontrado: {latest_backup}")
-                        # Implementar restauração local se necessário
+            # Restaurar o snapshot local mais recente (validado e com troca atómica)
+            latest_backup = DataManager.latest_backup()
+            if latest_backup:
+                st.info(f"📁 Backup local encontrado: {os.path.basename(latest_backup)}")
+                DataManager.restore_from_backup(latest_backup)
             
             # Revalidar após recuperação
             if PersistenceManager.validate_data_integrity():
@@ -109,56 +157,6 @@ class PersistenceManager:
             st.error(f"❌ Erro na recuperação de emergência: {str(e)}")
             return False
     
-    @staticmethod
-    def create_session_checkpoint():
-        """Cria checkpoint da sessão atual"""
-        try:
-            checkpoint_data = {
-                'timestamp': datetime.now().isoformat(),
-                'session_state': {
-                    'autenticado': st.session_state.get('autenticado', False),
-                    'tipo_usuario': st.session_state.get('tipo_usuario'),
-                    'user': st.session_state.get('user'),
-                    'jogador_info': st.session_state.get('jogador_info')
-                },
-                'data_integrity': PersistenceManager.validate_data_integrity()
-            }
-            
-            # Salvar checkpoint em arquivo temporário
-            checkpoint_file = "session_checkpoint.json"
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
-            
-            return True
-            
-        except Exception as e:
-            return False
-    
-    @staticmethod
-    def restore_session_checkpoint():
-        """Restaura checkpoint da sessão"""
-        try:
-            checkpoint_file = "session_checkpoint.json"
-            if os.path.exists(checkpoint_file):
-                with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                    checkpoint_data = json.load(f)
-                
-                # Verificar se checkpoint é recente (últimas 2 horas)
-                checkpoint_time = datetime.fromisoformat(checkpoint_data['timestamp'])
-                if datetime.now() - checkpoint_time < timedelta(hours=2):
-                    
-                    session_data = checkpoint_data.get('session_state', {})
-                    for key, value in session_data.items():
-                        if value is not None:
-                            st.session_state[key] = value
-                    
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            return False
-    
     @staticmethod
     def run_persistence_checks():
         """Executa todas as verificações de persistência"""
@@ -177,9 +175,6 @@ class PersistenceManager:
             # Agendar backup automático
             PersistenceManager.schedule_auto_backup()
             
-            # Criar checkpoint da sessão
-            PersistenceManager.create_session_checkpoint()
-            
             # Incrementar contador de validações
             st.session_state.data_validation_count = st.session_state.get('data_validation_count', 0) + 1
             
@@ -196,10 +191,14 @@ class PersistenceManager:
             st.sidebar.markdown("---")
             st.sidebar.subheader("🔒 Sistema de Persistência")
             
-            # Status geral
-            data = DataManager.load_data()
-            if data and data.get('jogadores'):
-                st.sidebar.success(f"✅ Sistema Ativo ({len(data['jogadores'])} jogadores)")
+            # Status geral a partir do sidecar de metadados (sem carregar os dados)
+            metadados = ler_metadados(DataManager.DATA_FILE)
+            if metadados is None and PersistenceManager.validate_data_integrity():
+                metadados = ler_metadados(DataManager.DATA_FILE)
+            
+            total_jogadores = (metadados or {}).get('contagens', {}).get('jogadores', 0)
+            if total_jogadores:
+                st.sidebar.success(f"✅ Sistema Ativo ({total_jogadores} jogadores)")
             else:
                 st.sidebar.error("❌ Dados não encontrados")
             
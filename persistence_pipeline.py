@@ -0,0 +1,331 @@
+"""
+Pipeline Único de Persistência
+Serializa os dados uma única vez por versão e distribui o resultado por sinks (ficheiro, snapshot, emergência, nuvem)
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+
+from backup_retention import aplicar_retencao
+from perf_metrics import medir
+
+
+def escrever_atomico(caminho, conteudo):
+    """Escreve texto num ficheiro temporário e troca-o atomicamente pelo destino"""
+    dir_path = os.path.dirname(caminho)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+    temporario = f"{caminho}.tmp"
+    with open(temporario, 'w', encoding='utf-8') as f:
+        f.write(conteudo)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+
+
+def checksum_colecao(valor):
+    """SHA-256 da serialização compacta de uma coleção (o mesmo que `DadosSerializados.checksums`)"""
+    return hashlib.sha256(
+        json.dumps(valor, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+
+
+def membro_indentado(chave, valor):
+    """Membro `"chave": valor` tal como json.dumps(dados, indent=2) o escreve no documento completo"""
+    texto = json.dumps(valor, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+    return f'  {json.dumps(chave, ensure_ascii=False)}: {texto}'
+
+
+def documento_indentado(membros):
+    """Documento indentado (formato do ficheiro de dados versionado no git) a partir dos seus membros"""
+    membros = list(membros)
+    return '{\n' + ',\n'.join(membros) + '\n}' if membros else '{}'
+
+
+class DadosSerializados:
+    """Resultado de uma única serialização: JSON por coleção, documento completo, versão e checksums"""
+
+    def __init__(self, dados):
+        self.dados = dados
+        self.pecas = {
+            chave: json.dumps(valor, ensure_ascii=False, separators=(',', ':'))
+            for chave, valor in dados.items()
+        }
+        self.checksums = {
+            chave: hashlib.sha256(peca.encode('utf-8')).hexdigest()
+            for chave, peca in self.pecas.items()
+        }
+        self.conteudo = '{' + ','.join(
+            f"{json.dumps(chave, ensure_ascii=False)}:{peca}" for chave, peca in self.pecas.items()
+        ) + '}'
+        self.versao = hashlib.sha256(self.conteudo.encode('utf-8')).hexdigest()
+        self.tamanho = len(self.conteudo.encode('utf-8'))
+
+    def envolver(self, metadados):
+        """Documento de backup {metadados..., checksums, dados} sem voltar a codificar os dados"""
+        cabecalho = ''.join(
+            f"{json.dumps(chave, ensure_ascii=False)}:{json.dumps(valor, ensure_ascii=False)},"
+            for chave, valor in metadados.items()
+        )
+        return (
+            '{' + cabecalho
+            + f'"checksums":{json.dumps(self.checksums)},'
+            + f'"dados":{self.conteudo}' + '}'
+        )
+
+
+def serializar_dados(dados):
+    """Serializa os dados uma única vez para todos os sinks"""
+    with medir('json', 'encode') as medicao:
+        serializados = DadosSerializados(dados)
+        medicao['bytes'] = serializados.tamanho
+    return serializados
+
+
+# === METADADOS (SIDECAR) ===
+def caminho_metadados(caminho_dados):
+    """Caminho do sidecar de metadados associado a um ficheiro de dados"""
+    return os.path.splitext(caminho_dados)[0] + ".meta.json"
+
+
+def assinatura_ficheiro(caminho):
+    """(mtime_ns, tamanho) de um ficheiro, ou None se não existir"""
+    try:
+        stat = os.stat(caminho)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def escrever_metadados(caminho_dados, dados, versao, checksums=None):
+    """Grava o sidecar com versão, assinatura do ficheiro, contagens e checksums por coleção"""
+    assinatura = assinatura_ficheiro(caminho_dados)
+    metadados = {
+        'versao': versao,
+        'assinatura': list(assinatura) if assinatura else None,
+        'atualizado_em': datetime.now().isoformat(),
+        'contagens': {
+            chave: len(valor) if isinstance(valor, (dict, list)) else 1
+            for chave, valor in dados.items()
+        },
+        'checksums': checksums or {},
+    }
+    escrever_atomico(caminho_metadados(caminho_dados), json.dumps(metadados, ensure_ascii=False))
+    return metadados
+
+
+def ler_metadados(caminho_dados):
+    """Lê o sidecar se corresponder ao ficheiro de dados atual (None se ausente ou obsoleto)"""
+    try:
+        with open(caminho_metadados(caminho_dados), 'r', encoding='utf-8') as f:
+            metadados = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    assinatura = assinatura_ficheiro(caminho_dados)
+    if not assinatura or metadados.get('assinatura') != list(assinatura):
+        return None
+    return metadados
+
+
+# === SINKS ===
+class Sink:
+    """Destino de persistência alimentado pela serialização partilhada"""
+
+    nome = "base"
+    obrigatorio = False
+
+    def __init__(self, intervalo=0):
+        # intervalo=None: o sink só corre quando forçado explicitamente
+        self.intervalo = intervalo
+        self.ultima_execucao = 0
+        self.ultima_versao = None
+        self.ultimo_resultado = None
+        self.ultimo_erro = None
+
+    def pendente(self, versao, agora):
+        """Indica se este sink deve receber a versão atual"""
+        if self.intervalo is None or versao == self.ultima_versao:
+            return False
+        return agora - self.ultima_execucao >= self.intervalo
+
+    def escrever(self, serializados):
+        raise NotImplementedError
+
+
+class SinkFicheiroDados(Sink):
+    """Ficheiro principal de dados (escrita atómica a cada nova versão), indentado como sempre esteve no git:
+    só as coleções cujo checksum mudou voltam a ser indentadas"""
+
+    nome = "ficheiro"
+    obrigatorio = True
+
+    def __init__(self, caminho):
+        super().__init__(intervalo=0)
+        self.caminho = caminho
+        self.assinatura = None
+        self._membros = {}  # {coleção: (checksum, membro indentado)}
+
+    def pendente(self, versao, agora):
+        # Reescrever também se o ficheiro foi alterado por fora (ex.: restauro)
+        return versao != self.ultima_versao or assinatura_ficheiro(self.caminho) != self.assinatura
+
+    def escrever(self, serializados):
+        membros = {}
+        for chave, valor in serializados.dados.items():
+            checksum = serializados.checksums[chave]
+            anterior = self._membros.get(chave)
+            membros[chave] = anterior if anterior and anterior[0] == checksum else (checksum, membro_indentado(chave, valor))
+        self._membros = membros
+        escrever_atomico(self.caminho, documento_indentado(membro for _, membro in membros.values()))
+        self.assinatura = assinatura_ficheiro(self.caminho)
+        return self.caminho
+
+
+class SinkMetadados(Sink):
+    """Sidecar com contagens e versão, mantido a cada gravação (registar depois do ficheiro)"""
+
+    nome = "metadados"
+
+    def __init__(self, caminho_dados):
+        super().__init__(intervalo=0)
+        self.caminho_dados = caminho_dados
+
+    def pendente(self, versao, agora):
+        return versao != self.ultima_versao or ler_metadados(self.caminho_dados) is None
+
+    def escrever(self, serializados):
+        escrever_metadados(self.caminho_dados, serializados.dados, serializados.versao, serializados.checksums)
+        return caminho_metadados(self.caminho_dados)
+
+
+class SinkSnapshotLocal(Sink):
+    """Snapshots locais com timestamp, seguidos da política de retenção"""
+
+    nome = "snapshot"
+
+    def __init__(self, pasta=".", prefixo="backup_automatico_", tipo="automatico", intervalo=600,
+                 pasta_retencao=None):
+        super().__init__(intervalo=intervalo)
+        self.pasta = pasta or "."
+        self.prefixo = prefixo
+        self.tipo = tipo
+        self.pasta_retencao = pasta_retencao or self.pasta
+
+    def escrever(self, serializados):
+        agora = datetime.now()
+        nome_ficheiro = f"{self.prefixo}{agora.strftime('%Y%m%d_%H%M%S')}.json"
+        caminho = os.path.join(self.pasta, nome_ficheiro)
+        escrever_atomico(caminho, serializados.envolver({
+            "data_backup": agora.isoformat(),
+            "tipo_backup": self.tipo,
+            "versao_app": "1.0",
+        }))
+
+        # Retenção GFS sobre todos os snapshots conhecidos
+        aplicar_retencao(pastas=[self.pasta_retencao], dados=serializados.dados)
+        return nome_ficheiro
+
+
+class SinkEmergencia(Sink):
+    """Ficheiro único de emergência contra hibernação"""
+
+    nome = "emergencia"
+
+    def __init__(self, caminho="emergency_backup.json", intervalo=300):
+        super().__init__(intervalo=intervalo)
+        self.caminho = caminho
+
+    def escrever(self, serializados):
+        escrever_atomico(self.caminho, serializados.envolver({
+            "timestamp": datetime.now().isoformat(),
+            "source": "pipeline",
+        }))
+        return self.caminho
+
+
+class SinkNuvem(Sink):
+    """Backup remoto; `enviar(conteudo)` devolve (sucesso, mensagem)"""
+
+    nome = "nuvem"
+
+    def __init__(self, enviar, intervalo=1800):
+        super().__init__(intervalo=intervalo)
+        self.enviar = enviar
+
+    def escrever(self, serializados):
+        conteudo = serializados.envolver({
+            "timestamp": datetime.now().isoformat(),
+            "hash": serializados.versao,
+        })
+        sucesso, mensagem = self.enviar(conteudo)
+        if not sucesso:
+            raise RuntimeError(mensagem)
+        return mensagem
+
+
+# === PIPELINE ===
+class PersistencePipeline:
+    """Distribui cada versão dos dados pelos sinks registados a partir de uma única serialização"""
+
+    def __init__(self, sinks=None):
+        self.sinks = {}
+        self._lock = threading.Lock()
+        for sink in sinks or []:
+            self.registar(sink)
+
+    def registar(self, sink):
+        """Regista (ou substitui) um sink pelo seu nome"""
+        self.sinks[sink.nome] = sink
+        return sink
+
+    def estado(self):
+        """Estado de cada sink (última execução, versão e erro)"""
+        return {
+            nome: {
+                'ultima_execucao': sink.ultima_execucao,
+                'ultima_versao': sink.ultima_versao,
+                'ultimo_resultado': sink.ultimo_resultado,
+                'ultimo_erro': sink.ultimo_erro,
+            }
+            for nome, sink in self.sinks.items()
+        }
+
+    def publicar(self, dados, apenas=None, forcar=False):
+        """Serializa `dados` uma vez e envia para os sinks pendentes
+
+        Devolve (serializados, resultados) onde resultados = {nome: (sucesso, info)}.
+        Erros em sinks obrigatórios são propagados; os restantes ficam registados.
+        """
+        serializados = serializar_dados(dados)
+        resultados = {}
+
+        with self._lock:
+            agora = time.time()
+            for nome, sink in self.sinks.items():
+                if apenas is not None and nome not in apenas:
+                    continue
+                if not forcar and not sink.pendente(serializados.versao, agora):
+                    continue
+
+                try:
+                    info = sink.escrever(serializados)
+                    sink.ultima_execucao = agora
+                    sink.ultima_versao = serializados.versao
+                    sink.ultimo_resultado = info
+                    sink.ultimo_erro = None
+                    resultados[nome] = (True, info)
+                except Exception as e:
+                    # Evitar repetir um sink falhado a cada gravação
+                    sink.ultima_execucao = agora
+                    sink.ultimo_erro = str(e)
+                    resultados[nome] = (False, str(e))
+                    if sink.obrigatorio:
+                        raise
+
+        return serializados, resultados
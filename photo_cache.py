@@ -0,0 +1,249 @@
+"""
+Cache de Fotos dos Jogadores
+Fotos (data URL base64 ou caminho) descodificadas uma vez e guardadas em variantes redimensionadas por hash da foto:
+LRU em memória limitada em bytes, com cópia em disco partilhada pelos processos e pelos reinícios seguintes
+"""
+
+import os
+import time
+import base64
+import hashlib
+import threading
+from io import BytesIO
+from collections import OrderedDict
+
+PASTA_CACHE_FOTOS = ".cache_fotos"
+MAX_BYTES_MEMORIA_FOTOS = 16 * 1024 * 1024
+MAX_BYTES_DISCO_FOTOS = 64 * 1024 * 1024
+
+# Variante -> lado máximo (px); as fotos não são ampliadas acima do original
+VARIANTES = {
+    'miniatura': 240,   # listas e cartões do plantel (até ~120 px no ecrã, 2x para ecrãs de alta densidade)
+    'perfil': 480,      # ficha/perfil do jogador
+    'impressao': 1200,  # PDFs (~300 dpi a 10 cm)
+}
+
+
+def variante_para_largura(largura):
+    """Menor variante que cobre `largura` px no ecrã a 2x"""
+    for nome, lado in sorted(VARIANTES.items(), key=lambda item: item[1]):
+        if largura * 2 <= lado:
+            return nome
+    return 'impressao'
+
+
+def _identidade(foto):
+    """Texto que identifica o conteúdo da foto: o próprio data URL, ou caminho + mtime + tamanho"""
+    if foto.startswith('data:image'):
+        return foto
+    stat = os.stat(foto)
+    return f"{os.path.abspath(foto)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _bytes_originais(foto):
+    """Bytes do ficheiro de imagem (JPEG/PNG/...) de um data URL ou de um caminho"""
+    if foto.startswith('data:image'):
+        _, _, conteudo = foto.partition(',')
+        return base64.b64decode(conteudo)
+    with open(foto, 'rb') as f:
+        return f.read()
+
+
+def _redimensionar(original, lado):
+    """JPEG/PNG com o lado maior <= `lado`; o original é reutilizado se já couber e for JPEG/PNG"""
+    from PIL import Image
+
+    with Image.open(BytesIO(original)) as imagem:
+        if max(imagem.size) <= lado and imagem.format in ('JPEG', 'PNG'):
+            return original
+
+        transparente = imagem.mode in ('RGBA', 'LA') or 'transparency' in imagem.info
+        imagem = imagem.convert('RGBA' if transparente else 'RGB')
+        imagem.thumbnail((lado, lado), Image.Resampling.LANCZOS)
+        saida = BytesIO()
+        if transparente:
+            imagem.save(saida, format='PNG', optimize=True)
+        else:
+            imagem.save(saida, format='JPEG', quality=85)
+        return saida.getvalue()
+
+
+class CacheFotos:
+    """Variantes por (hash da foto, variante): memória LRU limitada em bytes + `<chave>.img` em disco (mtime = acesso)"""
+
+    def __init__(self, pasta=PASTA_CACHE_FOTOS, max_bytes_memoria=MAX_BYTES_MEMORIA_FOTOS,
+                 max_bytes_disco=MAX_BYTES_DISCO_FOTOS):
+        self.pasta = pasta
+        self.max_bytes_memoria = max_bytes_memoria
+        self.max_bytes_disco = max_bytes_disco
+        self._memoria = OrderedDict()
+        self._bytes_memoria = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.hits_disco = 0
+        self.misses = 0
+
+    @staticmethod
+    def chave(foto, variante):
+        return hashlib.sha256(f"{variante}:{_identidade(foto)}".encode('utf-8')).hexdigest()
+
+    def _caminho(self, chave):
+        return os.path.join(self.pasta, chave + '.img')
+
+    def obter(self, foto, variante='miniatura'):
+        """Bytes da variante pedida (JPEG/PNG), ou None se `foto` não for um data URL nem um ficheiro existente"""
+        if not foto or not (foto.startswith('data:image') or os.path.exists(foto)):
+            return None
+        chave = self.chave(foto, variante)
+
+        with self._lock:
+            if chave in self._memoria:
+                self._memoria.move_to_end(chave)
+                self.hits += 1
+                return self._memoria[chave]
+
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, 'rb') as f:
+                imagem = f.read()
+            os.utime(caminho)  # LRU: último acesso
+            contador = 'hits_disco'
+        except OSError:
+            imagem = _redimensionar(_bytes_originais(foto), VARIANTES[variante])
+            self._guardar_disco(caminho, imagem)
+            contador = 'misses'
+
+        with self._lock:
+            setattr(self, contador, getattr(self, contador) + 1)
+            self._guardar_memoria(chave, imagem)
+        return imagem
+
+    def imagem_pdf(self, foto, largura, altura=None):
+        """Flowable reportlab da variante de impressão, ajustado proporcionalmente a largura × altura (None sem foto)"""
+        from reportlab.platypus import Image as RLImage
+
+        imagem = self.obter(foto, 'impressao')
+        if imagem is None:
+            return None
+        return RLImage(BytesIO(imagem), width=largura, height=altura or largura, kind='proportional')
+
+    def _guardar_memoria(self, chave, imagem):
+        if chave in self._memoria:
+            return
+        self._memoria[chave] = imagem
+        self._bytes_memoria += len(imagem)
+        while self._bytes_memoria > self.max_bytes_memoria and len(self._memoria) > 1:
+            _, removida = self._memoria.popitem(last=False)
+            self._bytes_memoria -= len(removida)
+
+    def _guardar_disco(self, caminho, imagem):
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            temporario = f"{caminho}.{os.getpid()}.tmp"
+            with open(temporario, 'wb') as f:
+                f.write(imagem)
+            os.replace(temporario, caminho)
+        except OSError as e:
+            print(f"Aviso: não foi possível guardar foto em cache: {e}")
+            return
+        self._aplicar_limite_disco()
+
+    def _entradas_disco(self):
+        """[(mtime, tamanho, caminho)] das variantes em disco, da menos para a mais recente"""
+        entradas = []
+        try:
+            nomes = os.listdir(self.pasta)
+        except OSError:
+            return entradas
+        for nome in nomes:
+            if not nome.endswith('.img'):
+                continue
+            caminho = os.path.join(self.pasta, nome)
+            try:
+                stat = os.stat(caminho)
+            except OSError:
+                continue
+            entradas.append((stat.st_mtime_ns, stat.st_size, caminho))
+        entradas.sort()
+        return entradas
+
+    def _aplicar_limite_disco(self):
+        entradas = self._entradas_disco()
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        while entradas and total > self.max_bytes_disco:
+            _, tamanho, caminho = entradas.pop(0)
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+            total -= tamanho
+
+    def limpar(self):
+        """Remove as variantes em memória e em disco"""
+        with self._lock:
+            self._memoria.clear()
+            self._bytes_memoria = 0
+        for _, _, caminho in self._entradas_disco():
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+    def estatisticas(self):
+        """Contadores (memória, disco, misses), variantes em memória e bytes em memória/disco"""
+        entradas = self._entradas_disco()
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'hits_disco': self.hits_disco,
+                'misses': self.misses,
+                'entradas': len(self._memoria),
+                'bytes_memoria': self._bytes_memoria,
+                'bytes_disco': sum(tamanho for _, tamanho, _ in entradas),
+            }
+
+
+# Cache do processo (partilhado por todas as sessões)
+cache_fotos = CacheFotos()
+
+
+# === BENCHMARK ===
+def medir_fotos(fotos, largura=100, repeticoes=20):
+    """Custo médio (ms) de preparar as fotos de um plantel: descodificar + redimensionar vs cache em memória"""
+    import shutil
+    import tempfile
+    from PIL import Image
+
+    def sem_cache():
+        for foto in fotos:
+            with Image.open(BytesIO(_bytes_originais(foto))) as imagem:
+                imagem.convert('RGB').thumbnail((largura * 2, largura * 2))
+
+    cache = CacheFotos(pasta=tempfile.mkdtemp(prefix='cache_fotos_'))
+    variante = variante_para_largura(largura)
+
+    def com_cache():
+        for foto in fotos:
+            cache.obter(foto, variante)
+
+    resultados = {}
+    for nome, funcao in (('sem_cache', sem_cache), ('com_cache', com_cache)):
+        funcao()  # aquecimento (importações e primeira geração das variantes)
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        resultados[nome] = (time.perf_counter() - inicio) * 1000 / repeticoes
+    shutil.rmtree(cache.pasta, ignore_errors=True)
+    return resultados
+
+
+if __name__ == "__main__":
+    import sys
+    import json
+
+    with open(sys.argv[1] if len(sys.argv) > 1 else 'APP_FINAL.json', 'r', encoding='utf-8') as f:
+        jogadores = json.load(f).get('jogadores', [])
+    fotos = [j['foto'] for j in jogadores if j.get('foto') and str(j['foto']).startswith('data:image')]
+    print(f"{len(fotos)} foto(s)")
+    for nome, ms in medir_fotos(fotos).items():
+        print(f"{nome:<10} {ms:8.2f} ms/plantel")
@@ -0,0 +1,338 @@
+"""
+Desenho do Campo Tático para Impressão
+Campo descrito por primitivas (retângulos, linhas, círculos, texto) e desenhado em raster (PIL), SVG ou PDF vetorial;
+a camada estática do campo em raster é desenhada uma vez por tamanho/tema e só os jogadores são compostos por esquema
+"""
+
+import functools
+from io import BytesIO
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+# A4 a 300 DPI (px); as medidas do desenho são definidas para este tamanho e escaladas para os outros
+TAMANHO_A4 = (3508, 2480)
+
+TEMAS = {
+    'relvado': {'fundo': '#2E8B57', 'linhas': 'white', 'jogador': '#1f77b4', 'texto_vazio': '#333333'},
+    'impressao': {'fundo': 'white', 'linhas': '#222222', 'jogador': '#1f77b4', 'texto_vazio': '#333333'},  # poupa tinta
+}
+
+# Posições por formação (coordenadas em percentagem do campo)
+POSICOES_FORMACOES = {
+    "4-4-2": [
+        {"x": 50, "y": 85, "nome": "GR"},      # Guarda-Redes
+        {"x": 20, "y": 70, "nome": "DE"},      # Defesa Esquerdo
+        {"x": 40, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 60, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 80, "y": 70, "nome": "DD"},      # Defesa Direito
+        {"x": 20, "y": 45, "nome": "ME"},      # Meio-Campo Esquerdo
+        {"x": 40, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 60, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 80, "y": 45, "nome": "MD"},      # Meio-Campo Direito
+        {"x": 35, "y": 20, "nome": "PL"},      # Ponta de Lança
+        {"x": 65, "y": 20, "nome": "PL"}       # Ponta de Lança
+    ],
+    "4-3-3": [
+        {"x": 50, "y": 85, "nome": "GR"},      # Guarda-Redes
+        {"x": 20, "y": 70, "nome": "DE"},      # Defesa Esquerdo
+        {"x": 40, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 60, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 80, "y": 70, "nome": "DD"},      # Defesa Direito
+        {"x": 30, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 50, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 70, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 15, "y": 20, "nome": "EE"},      # Extremo Esquerdo
+        {"x": 50, "y": 20, "nome": "PL"},      # Ponta de Lança
+        {"x": 85, "y": 20, "nome": "ED"}       # Extremo Direito
+    ],
+    "3-5-2": [
+        {"x": 50, "y": 85, "nome": "GR"},      # Guarda-Redes
+        {"x": 30, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 50, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 70, "y": 70, "nome": "DC"},      # Defesa Central
+        {"x": 15, "y": 45, "nome": "AE"},      # Ala Esquerdo
+        {"x": 35, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 50, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 65, "y": 45, "nome": "MC"},      # Meio-Campo Central
+        {"x": 85, "y": 45, "nome": "AD"},      # Ala Direito
+        {"x": 40, "y": 20, "nome": "PL"},      # Ponta de Lança
+        {"x": 60, "y": 20, "nome": "PL"}       # Ponta de Lança
+    ]
+}
+
+# Tamanhos de letra (px a 300 DPI)
+LETRA_TITULO, LETRA_GRANDE, LETRA_MEDIA, LETRA_PEQUENA = 72, 48, 36, 28
+
+
+# === PRIMITIVAS ===
+# ('retangulo', (x0, y0, x1, y1), contorno, preenchimento, espessura)
+# ('linha', (x0, y0, x1, y1), cor, espessura)
+# ('circulo', (cx, cy, raio), contorno, preenchimento, espessura, tracejado)
+# ('texto', (x, y), texto, cor, tamanho, âncora PIL: 'mm' centro, 'rm' direita, 'la' canto superior esquerdo)
+
+def _primitivas_base(largura, altura, tema):
+    """Camada estática: relvado, linhas, áreas, balizas e legenda (igual para todos os esquemas)"""
+    cores = TEMAS[tema]
+    linhas = cores['linhas']
+    e = largura / TAMANHO_A4[0]
+
+    margem_x, margem_y = 300 * e, 300 * e
+    campo_largura = largura - 2 * margem_x
+    campo_altura = altura - 2 * margem_y
+    meio_y = margem_y + campo_altura // 2
+
+    area_largura, area_altura = campo_largura * 0.5, campo_altura * 0.15
+    area_x = margem_x + (campo_largura - area_largura) // 2
+    pequena_largura, pequena_altura = campo_largura * 0.25, campo_altura * 0.07
+    pequena_x = margem_x + (campo_largura - pequena_largura) // 2
+    baliza_largura = campo_largura * 0.06
+    baliza_x = margem_x + (campo_largura - baliza_largura) // 2
+    legenda_y = altura - 180 * e
+
+    return [
+        ('retangulo', (0, 0, largura, altura), None, cores['fundo'], 0),
+        ('retangulo', (margem_x, margem_y, largura - margem_x, altura - margem_y), linhas, None, 8 * e),
+        ('linha', (margem_x, meio_y, largura - margem_x, meio_y), linhas, 6 * e),
+        ('circulo', (largura // 2, meio_y, 200 * e), linhas, None, 6 * e, False),
+        # Áreas grandes e pequenas
+        ('retangulo', (area_x, margem_y, area_x + area_largura, margem_y + area_altura), linhas, None, 6 * e),
+        ('retangulo', (area_x, altura - margem_y - area_altura, area_x + area_largura, altura - margem_y), linhas, None, 6 * e),
+        ('retangulo', (pequena_x, margem_y, pequena_x + pequena_largura, margem_y + pequena_altura), linhas, None, 6 * e),
+        ('retangulo', (pequena_x, altura - margem_y - pequena_altura, pequena_x + pequena_largura, altura - margem_y),
+         linhas, None, 6 * e),
+        # Balizas
+        ('retangulo', (baliza_x, margem_y - 18 * e, baliza_x + baliza_largura, margem_y), None, linhas, 0),
+        ('retangulo', (baliza_x, altura - margem_y, baliza_x + baliza_largura, altura - margem_y + 18 * e), None, linhas, 0),
+        ('texto', (largura // 2, margem_y - 120 * e), "🥅 BALIZA ADVERSÁRIA", linhas, LETRA_MEDIA * e, 'mm'),
+        ('texto', (largura // 2, altura - margem_y + 80 * e), "🥅 NOSSA BALIZA", linhas, LETRA_MEDIA * e, 'mm'),
+        # Legenda
+        ('texto', (margem_x, legenda_y), "🔵 Jogador Definido", linhas, LETRA_MEDIA * e, 'la'),
+        ('texto', (margem_x + 600 * e, legenda_y), "⚪ Posição Livre", linhas, LETRA_MEDIA * e, 'la'),
+    ]
+
+
+def _texto_jogador(jogador):
+    """Número da camisola ou, sem número, as iniciais"""
+    if jogador.get('nr_camisola'):
+        return str(jogador['nr_camisola'])
+    palavras = jogador.get('nome', 'Sem Nome').split()
+    if len(palavras) >= 2:
+        return f"{palavras[0][0]}{palavras[1][0]}"
+    return jogador.get('nome', 'Sem Nome')[:2].upper()
+
+
+def _primitivas_esquema(esquema, nome_esquema, largura, altura, tema):
+    """Camada do esquema: título, formação, jogadores/posições livres e rodapé"""
+    cores = TEMAS[tema]
+    linhas = cores['linhas']
+    e = largura / TAMANHO_A4[0]
+
+    margem_x, margem_y = 300 * e, 300 * e
+    campo_largura = largura - 2 * margem_x
+    campo_altura = altura - 2 * margem_y
+    raio = 60 * e
+
+    formacao = esquema.get('formacao', '4-4-2')
+    primitivas = [
+        ('texto', (largura // 2, 80 * e), nome_esquema, linhas, LETRA_TITULO * e, 'mm'),
+        ('texto', (largura // 2, 180 * e), f"Formação: {esquema.get('formacao', 'N/A')}", linhas, LETRA_GRANDE * e, 'mm'),
+    ]
+
+    esquema_jogadores = esquema.get('jogadores', {})
+    for i, pos in enumerate(POSICOES_FORMACOES.get(formacao, POSICOES_FORMACOES['4-4-2'])):
+        x = margem_x + (pos['x'] / 100) * campo_largura
+        y = margem_y + (pos['y'] / 100) * campo_altura
+
+        jogador = esquema_jogadores.get(str(i))
+        if jogador:
+            # Jogador atribuído: círculo sólido com número/iniciais e nome por baixo
+            nome = jogador.get('nome', 'Sem Nome')
+            if len(nome) > 15:
+                nome = nome[:12] + "..."
+            primitivas += [
+                ('circulo', (x, y, raio), linhas, cores['jogador'], 8 * e, False),
+                ('texto', (x, y + 100 * e), nome, linhas, LETRA_PEQUENA * e, 'mm'),
+                ('texto', (x, y), _texto_jogador(jogador), 'white', LETRA_PEQUENA * e, 'mm'),
+            ]
+        else:
+            # Posição livre: círculo tracejado com a sigla da posição
+            primitivas += [
+                ('circulo', (x, y, raio), linhas, None, 6 * e, True),
+                ('texto', (x, y), pos['nome'], cores['texto_vazio'], LETRA_PEQUENA * e, 'mm'),
+            ]
+
+    # Rodapé: data e observações
+    primitivas.append(('texto', (largura - margem_x, altura - 180 * e),
+                       f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M')}", linhas, LETRA_PEQUENA * e, 'rm'))
+    if esquema.get('observacoes'):
+        observacoes = esquema['observacoes']
+        if len(observacoes) > 80:
+            observacoes = observacoes[:77] + "..."
+        primitivas.append(('texto', (largura // 2, altura - 100 * e), f"Observações: {observacoes}",
+                           linhas, LETRA_PEQUENA * e, 'mm'))
+    return primitivas
+
+
+# === RASTER (PIL) ===
+@functools.lru_cache(maxsize=16)
+def _fonte(tamanho):
+    """Arial no tamanho pedido; sem Arial, a fonte por omissão do PIL (None se nem essa existir)"""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("arial.ttf", tamanho)
+    except Exception:
+        try:
+            return ImageFont.load_default()
+        except Exception:
+            return None
+
+
+def _desenhar_raster(draw, primitivas):
+    for primitiva in primitivas:
+        tipo = primitiva[0]
+        if tipo == 'retangulo':
+            _, caixa, contorno, preenchimento, espessura = primitiva
+            draw.rectangle(caixa, outline=contorno, fill=preenchimento, width=round(espessura) or 1)
+        elif tipo == 'linha':
+            _, pontos, cor, espessura = primitiva
+            draw.line(pontos, fill=cor, width=round(espessura))
+        elif tipo == 'circulo':
+            _, (cx, cy, raio), contorno, preenchimento, espessura, tracejado = primitiva
+            caixa = [cx - raio, cy - raio, cx + raio, cy + raio]
+            if tracejado:
+                for angulo in range(0, 360, 30):
+                    draw.arc(caixa, angulo, angulo + 15, fill=contorno, width=round(espessura))
+            else:
+                draw.ellipse(caixa, outline=contorno, fill=preenchimento, width=round(espessura))
+        elif tipo == 'texto':
+            _, posicao, texto, cor, tamanho, ancora = primitiva
+            fonte = _fonte(round(tamanho))
+            if fonte:
+                draw.text(posicao, texto, fill=cor, font=fonte, anchor=ancora)
+
+
+@functools.lru_cache(maxsize=4)
+def camada_base(tamanho=TAMANHO_A4, tema='relvado'):
+    """Imagem do campo sem jogadores, desenhada uma vez por (tamanho, tema); não deve ser alterada"""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', tamanho, TEMAS[tema]['fundo'])
+    _desenhar_raster(ImageDraw.Draw(img), _primitivas_base(*tamanho, tema))
+    return img
+
+
+def campo_raster(esquema, nome_esquema="Esquema Tático", tamanho=TAMANHO_A4, tema='relvado'):
+    """Imagem do esquema: cópia da camada base em cache + jogadores, título e rodapé"""
+    from PIL import ImageDraw
+
+    img = camada_base(tuple(tamanho), tema).copy()
+    _desenhar_raster(ImageDraw.Draw(img), _primitivas_esquema(esquema, nome_esquema, *tamanho, tema))
+    return img
+
+
+# === VETORIAL (SVG / PDF) ===
+def campo_svg(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """SVG do esquema no tamanho A4 (coordenadas em px a 300 DPI, escalável sem perdas)"""
+    largura, altura = TAMANHO_A4
+    elementos = []
+    for primitiva in _primitivas_base(largura, altura, tema) + _primitivas_esquema(esquema, nome_esquema, largura, altura, tema):
+        tipo = primitiva[0]
+        if tipo == 'retangulo':
+            _, (x0, y0, x1, y1), contorno, preenchimento, espessura = primitiva
+            elementos.append(
+                f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" '
+                f'fill="{preenchimento or "none"}" stroke="{contorno or "none"}" stroke-width="{espessura:.1f}"/>'
+            )
+        elif tipo == 'linha':
+            _, (x0, y0, x1, y1), cor, espessura = primitiva
+            elementos.append(f'<line x1="{x0:.1f}" y1="{y0:.1f}" x2="{x1:.1f}" y2="{y1:.1f}" '
+                             f'stroke="{cor}" stroke-width="{espessura:.1f}"/>')
+        elif tipo == 'circulo':
+            _, (cx, cy, raio), contorno, preenchimento, espessura, tracejado = primitiva
+            tracos = f' stroke-dasharray="{raio * 0.2618:.1f}"' if tracejado else ''  # 12 traços de 15°
+            elementos.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{raio:.1f}" fill="{preenchimento or "none"}" '
+                             f'stroke="{contorno}" stroke-width="{espessura:.1f}"{tracos}/>')
+        elif tipo == 'texto':
+            _, (x, y), texto, cor, tamanho, ancora = primitiva
+            alinhamento = {'m': 'middle', 'r': 'end', 'l': 'start'}[ancora[0]]
+            base = 'hanging' if ancora[1] == 'a' else 'central'
+            elementos.append(f'<text x="{x:.1f}" y="{y:.1f}" fill="{cor}" font-size="{tamanho:.1f}" '
+                             f'font-family="Arial, Helvetica, sans-serif" text-anchor="{alinhamento}" '
+                             f'dominant-baseline="{base}">{escape(texto)}</text>')
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="297mm" height="210mm" viewBox="0 0 {largura} {altura}">'
+        + ''.join(elementos) + '</svg>'
+    )
+
+
+def _texto_pdf(texto):
+    """As fontes base-14 não têm emoji: manter só os carateres Latin-1"""
+    return texto.encode('latin-1', 'ignore').decode('latin-1').strip()
+
+
+def campo_pdf(esquema, nome_esquema="Esquema Tático", tema='relvado'):
+    """PDF vetorial A4 (paisagem) do esquema: poucos KB e nítido em qualquer impressora"""
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.colors import toColor
+    from reportlab.pdfgen import canvas
+
+    largura, altura = TAMANHO_A4
+    pagina_largura, pagina_altura = landscape(A4)
+    escala = pagina_largura / largura  # 72 / 300
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(pagina_largura, pagina_altura))
+    c.setTitle(nome_esquema)
+    # Coordenadas em px com origem no canto superior esquerdo, como no raster
+    c.translate(0, pagina_altura)
+    c.scale(escala, -escala)
+
+    for primitiva in _primitivas_base(largura, altura, tema) + _primitivas_esquema(esquema, nome_esquema, largura, altura, tema):
+        tipo = primitiva[0]
+        if tipo == 'retangulo':
+            _, (x0, y0, x1, y1), contorno, preenchimento, espessura = primitiva
+            if preenchimento:
+                c.setFillColor(toColor(preenchimento))
+            if contorno:
+                c.setStrokeColor(toColor(contorno))
+                c.setLineWidth(espessura)
+            c.rect(x0, y0, x1 - x0, y1 - y0, stroke=1 if contorno else 0, fill=1 if preenchimento else 0)
+        elif tipo == 'linha':
+            _, (x0, y0, x1, y1), cor, espessura = primitiva
+            c.setStrokeColor(toColor(cor))
+            c.setLineWidth(espessura)
+            c.line(x0, y0, x1, y1)
+        elif tipo == 'circulo':
+            _, (cx, cy, raio), contorno, preenchimento, espessura, tracejado = primitiva
+            c.setStrokeColor(toColor(contorno))
+            c.setLineWidth(espessura)
+            if preenchimento:
+                c.setFillColor(toColor(preenchimento))
+            if tracejado:
+                c.setDash(raio * 0.2618)
+            c.circle(cx, cy, raio, stroke=1, fill=1 if preenchimento else 0)
+            c.setDash()
+        elif tipo == 'texto':
+            _, (x, y), texto, cor, tamanho, ancora = primitiva
+            texto = _texto_pdf(texto)
+            if not texto:
+                continue
+            # Texto com o eixo y invertido de novo (senão fica espelhado)
+            c.saveState()
+            c.translate(x, y)
+            c.scale(1, -1)
+            c.setFillColor(toColor(cor))
+            c.setFont('Helvetica-Bold', tamanho)
+            base = -tamanho * 0.8 if ancora[1] == 'a' else -tamanho * 0.35
+            if ancora[0] == 'm':
+                c.drawCentredString(0, base, texto)
+            elif ancora[0] == 'r':
+                c.drawRightString(0, base, texto)
+            else:
+                c.drawString(0, base, texto)
+            c.restoreState()
+
+    c.showPage()
+    c.save()
+    return buffer.getvalue()
@@ -0,0 +1,76 @@
+"""
+Cache de Renderização por Versão
+Memoiza blocos HTML/markdown e tabelas calculadas por (secção, parâmetros, versões das coleções), com LRU
+"""
+
+import threading
+from collections import OrderedDict
+
+MAX_ENTRADAS = 256
+
+
+class RenderCache:
+    """Cache LRU partilhado pelo processo com contadores de hits/misses por secção"""
+
+    def __init__(self, max_entradas=MAX_ENTRADAS):
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.remocoes = 0
+        self._por_secao = {}
+
+    @staticmethod
+    def chave(secao, parametros=(), versoes=()):
+        """Chave (secção, parâmetros, versões); parâmetros e versões têm de ser hashable"""
+        return (secao, tuple(parametros), tuple(versoes))
+
+    def _contar(self, secao, indice):
+        contadores = self._por_secao.setdefault(secao, [0, 0])
+        contadores[indice] += 1
+
+    def obter(self, secao, construir, parametros=(), versoes=()):
+        """Devolve o bloco em cache ou constrói-o com `construir()`; o resultado não deve ser alterado"""
+        chave = self.chave(secao, parametros, versoes)
+        with self._lock:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self.hits += 1
+                self._contar(secao, 0)
+                return self._entradas[chave]
+
+        valor = construir()
+
+        with self._lock:
+            self.misses += 1
+            self._contar(secao, 1)
+            self._entradas[chave] = valor
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.remocoes += 1
+        return valor
+
+    def invalidar(self, secao=None):
+        """Remove todas as entradas (ou apenas as de uma secção)"""
+        with self._lock:
+            if secao is None:
+                self._entradas.clear()
+                return
+            for chave in [c for c in self._entradas if c[0] == secao]:
+                del self._entradas[chave]
+
+    def estatisticas(self):
+        """Contadores globais e por secção ({secao: {'hits', 'misses'}})"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'remocoes': self.remocoes,
+                'entradas': len(self._entradas),
+                'por_secao': {
+                    secao: {'hits': hits, 'misses': misses}
+                    for secao, (hits, misses) in self._por_secao.items()
+                },
+            }
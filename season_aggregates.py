@@ -0,0 +1,188 @@
+"""
+Agregados da Época (Vistas Materializadas)
+Contagens e totais calculados uma vez por versão dos dados, gravados num sidecar e lidos em O(1) pelos dashboards
+"""
+
+import os
+import json
+from bisect import bisect_left
+
+from persistence_pipeline import Sink, escrever_atomico
+from attendance_matrix import MatrizPresencas
+from championship_table import EQUIPAS_CLUBE
+
+# Coleções de que os agregados dependem (as suas versões invalidam o sidecar)
+COLECOES_FONTE = ('jogadores', 'jogos', 'treinos', 'campeonato')
+
+# Linhas compactas: listas com a ordem destas colunas
+COLUNAS_JOGO = ('data', 'hora', 'adversario', 'local', 'tipo')
+COLUNAS_JOGADOR = ('convocados', 'jogos', 'titular', 'suplente', 'minutos',
+                   'golos', 'assistencias', 'amarelos', 'vermelhos')
+COLUNAS_ASSIDUIDADE = ('presente', 'justificado', 'ausente')
+
+
+def caminho_agregados(caminho_dados):
+    """Caminho do sidecar de agregados associado a um ficheiro de dados"""
+    return os.path.splitext(caminho_dados)[0] + ".agregados.json"
+
+
+def _iterar_fichas(dados):
+    """Gera as fichas de jogo dos jogos e das jornadas do campeonato"""
+    jogos = list(dados.get('jogos', []))
+    for jornada in dados.get('campeonato', {}).get('jornadas', []):
+        jogos.extend(jornada.get('jogos', []))
+
+    for jogo in jogos:
+        if not isinstance(jogo, dict):
+            continue
+        for chave, ficha in jogo.items():
+            if chave.startswith('ficha_jogo') and isinstance(ficha, dict):
+                yield ficha
+
+
+def calcular_agregados(dados):
+    """Calcula todas as vistas num único passo sobre as coleções"""
+    # Jogos ordenados por data (próximos jogos por pesquisa binária)
+    linhas_jogos = sorted(
+        [[str(jogo.get(coluna) or '') for coluna in COLUNAS_JOGO]
+         for jogo in dados.get('jogos', []) if len(str(jogo.get('data') or '')) >= 10],
+        key=lambda linha: linha[0]
+    )
+
+    # Por jogador: convocatórias, presenças em jogo, minutos, golos e cartões
+    jogadores = {}
+
+    def linha(nome):
+        if nome not in jogadores:
+            jogadores[nome] = [0] * len(COLUNAS_JOGADOR)
+        return jogadores[nome]
+
+    for jogador in dados.get('jogadores', []):
+        if jogador.get('nome'):
+            linha(jogador['nome'])
+
+    for jogo in dados.get('jogos', []):
+        for nome in jogo.get('convocados', []):
+            linha(nome)[0] += 1
+
+    for ficha in _iterar_fichas(dados):
+        for nome, stats in ficha.get('jogadores_estatisticas', {}).items():
+            if not isinstance(stats, dict):
+                continue
+            minutos = stats.get('tempo_jogo') or 0
+            titular = bool(stats.get('titular'))
+            if not (titular or minutos):
+                continue
+            valores = linha(nome)
+            valores[1] += 1
+            valores[2 if titular else 3] += 1
+            valores[4] += minutos
+            valores[5] += stats.get('golos') or 0
+            valores[6] += stats.get('assistencias') or 0
+            valores[7] += stats.get('cartao_amarelo') or 0
+            valores[8] += stats.get('cartao_vermelho') or 0
+
+    # Assiduidade nos treinos (contagens vetorizadas da matriz de presenças)
+    matriz = MatrizPresencas.from_dados(dados)
+    assiduidade = {
+        nome: contagens.tolist()
+        for nome, contagens in zip(matriz.nomes, matriz.contagens())
+        if contagens.any()
+    }
+
+    # Registo da equipa no campeonato
+    registo = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0,
+               'golos_marcados': 0, 'golos_sofridos': 0}
+    for jornada in dados.get('campeonato', {}).get('jornadas', []):
+        for jogo in jornada.get('jogos', []):
+            casa, fora = jogo.get('resultado_casa'), jogo.get('resultado_fora')
+            clube_em_casa = jogo.get('casa') in EQUIPAS_CLUBE
+            if casa is None or fora is None or not (clube_em_casa or jogo.get('fora') in EQUIPAS_CLUBE):
+                continue
+            try:
+                casa, fora = int(casa), int(fora)
+            except (TypeError, ValueError):
+                continue
+            marcados, sofridos = (casa, fora) if clube_em_casa else (fora, casa)
+            registo['jogos'] += 1
+            registo['golos_marcados'] += marcados
+            registo['golos_sofridos'] += sofridos
+            if marcados > sofridos:
+                registo['vitorias'] += 1
+            elif marcados == sofridos:
+                registo['empates'] += 1
+            else:
+                registo['derrotas'] += 1
+
+    return {
+        'contagens': {
+            'jogadores': len(dados.get('jogadores', [])),
+            'treinos': len(dados.get('treinos', {})),
+            'jogos': len(dados.get('jogos', [])),
+        },
+        'jogos': linhas_jogos,
+        'jogadores': jogadores,
+        'assiduidade': assiduidade,
+        'registo': registo,
+    }
+
+
+# === LEITURA ===
+def proximos_jogos(agregados, hoje):
+    """Jogos com data >= hoje (YYYY-MM-DD), como dicionários"""
+    linhas = agregados.get('jogos', [])
+    # [hoje] ordena antes de qualquer linha com data >= hoje
+    inicio = bisect_left(linhas, [hoje])
+    return [dict(zip(COLUNAS_JOGO, linha)) for linha in linhas[inicio:]]
+
+
+def estatisticas_jogador(agregados, nome):
+    """Totais de um jogador (zeros se não existir)"""
+    valores = agregados.get('jogadores', {}).get(nome) or [0] * len(COLUNAS_JOGADOR)
+    return dict(zip(COLUNAS_JOGADOR, valores))
+
+
+def taxa_assiduidade(agregados, nome=None):
+    """Percentagem de presenças de um jogador (ou da equipa), ou None sem registos"""
+    if nome is not None:
+        linhas = [agregados.get('assiduidade', {}).get(nome)]
+    else:
+        linhas = agregados.get('assiduidade', {}).values()
+
+    presentes = total = 0
+    for contagens in linhas:
+        if contagens:
+            presentes += contagens[0]
+            total += sum(contagens)
+    return (presentes / total) * 100 if total else None
+
+
+# === ESCRITA ===
+class SinkAgregados(Sink):
+    """Recalcula as vistas quando muda alguma coleção de origem (registar depois do ficheiro)"""
+
+    nome = "agregados"
+
+    def __init__(self, caminho_dados):
+        super().__init__(intervalo=0)
+        self.caminho_dados = caminho_dados
+        self.versoes = None
+
+    def _versoes(self, serializados):
+        return {colecao: serializados.checksums.get(colecao) for colecao in COLECOES_FONTE}
+
+    def pendente(self, versao, agora):
+        # As versões por coleção são verificadas em escrever(); aqui só a versão global
+        return versao != self.ultima_versao or not os.path.exists(caminho_agregados(self.caminho_dados))
+
+    def escrever(self, serializados):
+        versoes = self._versoes(serializados)
+        caminho = caminho_agregados(self.caminho_dados)
+        if versoes == self.versoes and os.path.exists(caminho):
+            return caminho  # Alterações noutras coleções: vistas continuam válidas
+
+        agregados = calcular_agregados(serializados.dados)
+        agregados['versoes'] = versoes
+        escrever_atomico(caminho, json.dumps(agregados, ensure_ascii=False, separators=(',', ':')))
+        self.versoes = versoes
+        return caminho